@@ -1,3397 +0,0 @@
-
-
- 
-
- ؐ
-
- ؑ
-
- ؒ
-
- ؓ
-
- ؔ
-
- ً
-
- ٌ
-
- ٍ
-
- َ	
-
- ُ
-
-
- ِ
-
- ّ
-	
- َّ
-
- ْ
-
- ٓ
-
- ٔ
-
- ٘
-
- ٰ
-
- ۖ
-
- ۚ
-
- ‌
-
-!
-
-"
-
-#
-
-$
-
-%
-
-&
-
-'
-
-(
-
-)
-
-*
-
-+ 
-
-,!
-
--"
-
-.#
-
-.‌$
-
-/%
-
-0&
-
-0ْ'
-
-1(
-
-2)
-
-3*
-
-4+
-
-5,
-
-6-
-
-7.
-
-8/
-
-90
-
-:1
-
-;2
-
-<3
-
-=4
-
->5
-
-?6
-
-@7
-
-A8
-
-B9
-
-C:
-
-D;
-
-E<
-
-F=
-
-G>
-
-H?
-
-I@
-
-JA
-
-KB
-
-LC
-
-MD
-
-NE
-
-OF
-
-O̟G
-
-PH
-
-QI
-
-RJ
-
-SK
-
-TL
-
-UM
-
-VN
-
-WO
-
-XP
-
-YQ
-
-ZR
-
-[S
-
-\T
-
-]U
-
-^V
-
-_W
-
-`X
-
-aY
-
-a̸Z
-
-b[
-
-c\
-
-d]
-
-e^
-
-e̟_
-
-e̱`
-
-fa
-
-gb
-
-hc
-
-id
-
-i̇e
-
-i̟f
-
-jg
-
-kh
-
-li
-
-mj
-
-m̃k
-
-nl
-
-om
-
-o̟n
-
-po
-
-qp
-
-rq
-
-sr
-
-s̟s
-
-tt
-
-t̃u
-
-uv
-
-u̟w
-
-u̸x
-
-vy
-
-wz
-
-x{
-
-y|
-
-z}
-
-{~
-
-|
-
-}
-
-~
-
- 
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˚
-
-˜
-
-˝
-
-΄
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-χ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-У
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ц
-
-ч
-
-ш
-
-ъ
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ե
-
-ի
-
-լ
-
-կ
-
-ն
-
-ո
-
-վ
-
-տ
-
-ր
-
-־
-
-׳
-
-״
-
-؀
-
-؁
-
-؂
-
-،
-	
-،ً
-
-؍
-
-؎
-
-؏
-
-ؐ
-
-ؑ
-
-ؒ
-
-ؓ
-
-ؔ
-
-؛
-
-؟
-
-ء
-	
-ءً
-	
-ءٌ
-	
-ءٍ
-	
-ءَ
-	
-ءُ
-	
-ءِ
-
-آ
-	
-آً
-	
-آَ
-	
-آّ
-
-أ
-	
-أً
-	
-أٌ
-	
-أَ
-	
-أُ
-	
-أِ
-	
-أْ
-
-ؤ
-	
-ؤً
-	
-ؤٌ
-	
-ؤَ
-	
-ؤُ
-	
-ؤِ
-	
-ؤْ
-
-إ
-	
-إٍ
-	
-إِ
-
-ئ
-	
-ئً
-	
-ئٍ
-	
-ئَ
-	
-ئُ
-	
-ئِ
-	
-ئْ
-
-ا
-	
-اً
-
-اًً
-
-اًَ
-
-اًُ
-
-اًّ
-	
-اٌ
-	
-اٍ
-	
-اَ
-
-اََ
-
-اَّ
-	
-اُ
-	
-اِ
-	
-اّ
-	
-اْ
-	
-آ
-	
-أ
-	
-اٗ
-	
-اٰ
-	
-اۤ
-
-
-ا‌
-
-ب
-	
-بؒ
-	
-بؓ
-	
-بؔ
-	
-بً
-
-بًّ
-	
-بٌ
-	
-بٍ
-	
-بَ
-
-بَّ
-	
-بُ
-
-بُّ
-	
-بِ
-
-بِّ
-	
-بّ
-
-بًّ
-
-بٌّ
-
-بٍّ
-
-بَّ
-
-بُّ
-
-بِّ
-	
-بْ
-	
-بٰ
-
-ة
-	
-ةً
-	
-ةٌ
-	
-ةٍ
-	
-ةَ
-	
-ةُ
-	
-ةِ
-	
-ةْ
-
-ت
-	
-تً
-	
-تٌ
-	
-تٍ
-	
-تَ
-
-تَّ
-	
-تُ
-
-تُّ
-	
-تِ
-
-تِّ
-	
-تّ
-
-تَّ
-
-تُّ
-
-تِّ
-	
-تْ
-	
-تٰ
-
-ث
-	
-ثً
-	
-ثٌ
-	
-ثٍ
-	
-ثَ
-
-ثَّ
-	
-ثُ
-
-ثُّ
-	
-ثِ
-
-ثِّ
-	
-ثّ
-
-ثًّ
-
-ثَّ
-
-ثُّ
-
-ثِّ
-	
-ثْ
-
-ج
-	
-جً
-	
-جٌ
-	
-جٍ
-	
-جَ
-
-جَّ
-	
-جُ
-
-جُّ
-	
-جِ
-
-جِّ
-	
-جّ
-
-جًّ
-
-جٍّ
-
-جَّ
-
-جُّ
-
-جِّ
-	
-جْ
-
-ح
-	
-حً
-	
-حٌ
-	
-حٍ
-	
-حَ
-
-حَّ
-	
-حُ
-	
-حِ
-	
-حّ
-
-حَّ
-
-حِّ
-	
-حْ
-	
-حٰ
-
-خ
-	
-خً
-	
-خٌ
-	
-خٍ
-	
-خَ
-
-خَّ
-	
-خُ
-	
-خِ
-	
-خّ
-
-خَّ
-
-خِّ
-	
-خْ
-
-د
-	
-دؐ
-	
-دؒ
-	
-دؓ
-	
-دؔ
-	
-دً
-
-دًّ
-	
-دٌ
-	
-دٍ
-
-دٍّ
-	
-دَ
-
-دَّ
-	
-دُ
-
-دُّ
-	
-دِ
-
-دِّ
-	
-دّ
-
-دًّ
-
-دٌّ
-
-دٍّ
-
-دَّ
-
-دُّ
-
-دِّ
-	
-دْ
-	
-دٔ
-
-ذ
-	
-ذً
-	
-ذٌ
-	
-ذٍ
-	
-ذَ
-
-ذَّ
-	
-ذُ
-
-ذُّ
-	
-ذِ
-
-ذِّ
-	
-ذّ
-
-ذَّ
-
-ذُّ
-
-ذِّ
-	
-ذْ
-	
-ذٰ
-
-ر
-	
-رؒ
-	
-رؓ
-	
-رؔ
-	
-رً
-
-رًّ
-	
-رٌ
-	
-رٍ
-
-رٍّ
-	
-رَ
-
-رَّ
-	
-رُ
-
-رُّ
-	
-رِ
-
-رِّ
-	
-رّ
-
-رًّ
-
-رٌّ
-
-رٍّ
-
-رَّ
-
-رُّ
-
-رِّ
-	
-رْ
-	
-رٔ
-	
-رٰ
-
-ز
-	
-زً
-	
-زٌ
-	
-زٍ
-	
-زَ
-
-زَّ
-	
-زُ
-
-زُّ
-	
-زِ
-
-زِّ
-	
-زّ
-
-زًّ
-
-زَّ
-
-زُّ
-
-زِّ
-	
-زْ
-
-س
-	
-سؓ
-	
-سً
-	
-سٌ
-	
-سٍ
-	
-سَ
-
-سَّ
-	
-سُ
-
-سُّ
-	
-سِ
-
-سِّ
-	
-سّ
-
-سًّ
-
-سَّ
-
-سُّ
-
-سِّ
-	
-سْ
-	
-سٔ
-	
-سٰ
-
-ش
-	
-شً
-	
-شٌ
-	
-شٍ
-	
-شَ
-
-شَّ
-	
-شُ
-
-شُّ
-	
-شِ
-
-شِّ
-	
-شّ
-
-شَّ
-
-شُّ
-
-شِّ
-	
-شْ
-
-
-ش‌
-
-ص
-	
-صً
-	
-صٌ
-	
-صٍ
-	
-صَ
-
-صَّ
-	
-صُ
-
-صُّ
-	
-صِ
-
-صِّ
-	
-صّ
-
-صَّ
-
-صُّ
-
-صِّ
-	
-صْ
-	
-صٰ
-
-ض
-	
-ضً
-	
-ضٌ
-	
-ضٍ
-	
-ضَ
-
-ضَّ
-	
-ضُ
-
-ضُّ
-	
-ضِ
-
-ضِّ
-	
-ضّ
-
-ضَّ
-
-ضُّ
-
-ضِّ
-	
-ضْ
-	
-ضٰ
-
-ط
-	
-طً
-	
-طٌ
-	
-طٍ
-	
-طَ
-
-طَّ
-	
-طُ
-
-طُّ
-	
-طِ
-
-طِّ
-	
-طّ
-
-طَّ
-
-طُّ
-
-طِّ
-	
-طْ
-	
-طٰ
-
-ظ
-	
-ظً
-	
-ظٌ
-	
-ظٍ
-	
-ظَ
-
-ظَّ
-	
-ظُ
-	
-ظِ
-
-ظِّ
-	
-ظّ
-
-ظًّ
-
-ظٍّ
-
-ظَّ
-
-ظُّ
-
-ظِّ
-	
-ظْ
-
-ع
-	
-عً
-	
-عٌ
-	
-عٍ
-	
-عَ
-
-عَّ
-	
-عُ
-	
-عِ
-	
-عّ
-
-عًّ
-
-عَّ
-
-عُّ
-
-عِّ
-	
-عْ
-	
-عٰ
-
-غ
-	
-غً
-	
-غٌ
-	
-غٍ
-	
-غَ
-	
-غُ
-	
-غِ
-	
-غّ
-	
-غْ
-
-ؽ
-
-ـ
-	
-ـً
-	
-ـَ
-
-ـَّ
-	
-ـُ
-	
-ـِ
-
-ـِّ
-	
-ـّ
-	
-ـْ
-
-ف
-	
-فؒ
-	
-فؔ
-	
-فً
-	
-فٌ
-	
-فٍ
-	
-فَ
-
-فَّ
-	
-فُ
-
-فُّ
-	
-فِ
-
-فِّ
-	
-فّ
-
-فًّ
-
-فٍّ
-
-فَّ
-
-فُّ
-
-فِّ
-	
-فْ
-	
-فٰ
-
-ق
-	
-قؓ
-	
-قً
-
-قًّ
-	
-قٌ
-	
-قٍ
-	
-قَ
-
-قَّ
-	
-قُ
-
-قُّ
-	
-قِ
-
-قِّ
-	
-قّ
-
-قًّ
-
-قٌّ
-
-قٍّ
-
-قَّ
-
-قُّ
-
-قِّ
-	
-قْ
-
-ك
-	
-كً
-	
-كٌ
-	
-كٍ
-
-كٍّ
-	
-كَ
-
-كَّ
-	
-كُ
-
-كُّ
-	
-كِ
-
-كِّ
-	
-كّ
-
-كًّ
-
-كٌّ
-
-كٍّ
-
-كَّ
-
-كُّ
-
-كِّ
-	
-كْ
-
-ل
-	
-لؒ
-	
-لً
-	
-لٌ
-
-لٌّ
-	
-لٍ
-
-لٍّ
-	
-لَ
-
-لَّ
-	
-لُ
-
-لُّ
-	
-لِ
-
-لِّ
-	
-لّ
-
-لًّ
-
-لٌّ
-
-لٍّ
-
-لَّ
-
-لُّ
-
-لِّ
-
-لّٰ
-	
-لْ
-
-لِْ
-	
-لٔ
-	
-لٰ
-	
-لۡ
-
-م
-	
-مؑ
-	
-مؒ
-	
-مً
-
-مًّ
-	
-مٌ
-	
-مٍ
-	
-مَ
-
-مَّ
-	
-مُ
-
-مُّ
-	
-مِ
-
-مِّ
-	
-مّ
-
-مًّ
-
-مٌّ
-
-مٍّ
-
-مَّ
-
-مُّ
-
-مِّ
-	
-مْ
-	
-مٔ
-	
-مٰ
-	
-مۡ
-
-ن
-	
-نؑ
-	
-نؒ
-	
-نؓ
-	
-نً
-	
-نٌ
-	
-نٍ
-	
-نَ
-
-نَّ
-	
-نُ
-
-نُّ
-	
-نِ
-
-نِّ
-	
-نّ
-
-نًّ
-
-نٌّ
-
-نَّ
-
-نُّ
-
-نِّ
-	
-نْ
-	
-نٰ
-	
-نۡ
-
-ه
-	
-هً
-	
-هٌ
-	
-هٍ
-	
-هَ
-
-هَّ
-	
-هُ
-	
-هِ
-
-هِّ
-	
-هّ
-
-هَّ
-
-هُّ
-
-هِّ
-	
-هْ
-	
-هٓ
-	
-هٔ
-
-
-ه‌
-
-و
-	
-وً
-
-وًّ
-	
-وٌ
-	
-وٍ
-	
-وَ
-
-وَّ
-	
-وُ
-
-وُّ
-	
-وِ
-
-وِّ
-	
-وّ
-
-وًّ
-
-وٌّ
-
-وٍّ
-
-وَّ
-
-وُّ
-
-وِّ
-	
-وْ
-	
-ؤ
-	
-وٕ
-	
-وٰ
-	
-وۡ
-
-ى
-	
-ىً
-	
-ىَ
-	
-ىّ
-	
-ىٰ
-
-ي
-	
-يً
-
-يًّ
-	
-يٌ
-
-يٌّ
-	
-يٍ
-
-يٍّ
-	
-يَ
-
-يَّ
-	
-يُ
-
-يُّ
-	
-يِ
-
-يِّ
-	
-يّ
-
-يًّ
-
-يٌّ
-
-يٍّ
-
-يَّ
-
-يُّ
-
-يِّ
-	
-يْ
-	
-يٰ
-
-ً
-
-ٌ
-
-ٍ
-
-َ
-
-ُ
-
-ِ
-
-ّ
-
-ْ
-
-ٓ
-
-ٔ
-
-٠
-
-١
-
-٢
-
-٣
-
-٤
-
-٥
-
-٦
-
-٧
-
-٨
-
-٩
-
-٪
-
-٫
-
-٬
-
-٭
-
-ٰ
-
-ٱ
-
-ٴ
-
-ٹ
-	
-ٹِ
-	
-ٹّ
-	
-ٹْ
-
-ٺ
-
-ٻ
-
-ټ
-
-پ
-	
-پؐ
-	
-پؒ
-	
-پؓ
-	
-پَ
-	
-پُ
-	
-پِ
-	
-پّ
-	
-پْ
-
-
-پ‌
-
-ٿ
-
-ځ
-
-ڄ
-
-څ
-
-چ
-	
-چَ
-	
-چُ
-	
-چِ
-	
-چّ
-
-ڈ
-	
-ڈِ
-	
-ڈّ
-	
-ڈٰ
-
-ډ
-
-
-ډ‌
-
-ڌ
-
-ڏ
-
-ڑ
-
-ړ
-
-ږ
-
-ژ
-	
-ژِ
-
-ڙ
-
-ښ
-
-ڛ
-
-ڜ
-
-ڠ
-
-ڤ
-
-ڧ
-
-ک
-	
-کؒ
-	
-کؓ
-	
-کَ
-	
-کُ
-	
-کِ
-	
-کّ
-	
-کْ
-	
-کٰ
-
-
-ک‌
-
-ڪ
-
-ګ
-
-گ
-	
-گَ
-	
-گُ
-	
-گِ
-	
-گْ
-
-ڳ
-
-ڵ	
-
-ڷ	
-
-ں	
-
-ڻ	
-
-ڼ	
-
-ھ	
-	
-ھَ	
-	
-ھُ	
-	
-ھِ	
-	
-ھّ	
-	
-ھْ	
-	
-ھٰ	
-
-ۀ	
-
-ہ	
-	
-ہؒ	
-	
-ہؓ	
-	
-ہؔ	
-	
-ہً	
-	
-ہَ	
-	
-ہُ	
-	
-ہِ	
-	
-ہّ	
-	
-ہْ	
-	
-ۂ	
-	
-ہٖ	
-	
-ہٗ	
-	
-ہٰ	
-
-ۂ	
-	
-ۂِ	
-
-ۃ	
-	
-ۃؓ	
-	
-ۃً	
-	
-ۃٌ	
-	
-ۃٍ	
-	
-ۃَ	
-	
-ۃُ	
-	
-ۃِ	
-
-ۅ	
-
-ۆ	
-
-ۈ	
-
-ۉ	
-
-ی	
-	
-یؐ	
-	
-یؑ	
-	
-یؒ	
-	
-یؓ	
-	
-یَ	
-
-یَّ	
-	
-یُ	
-
-یُّ	
-	
-یِ	
-
-یِّ	
-	
-یّ	
-	
-یْ	
-
-یْْ	
-	
-یٔ	
-	
-یٰ	
-	
-یۡ	
-
-ۍ	
-
-ێ	
-
-ې	
-
-ے	
-	
-ےَ	
-	
-ےّ	
-	
-ۓ	
-	
-ےٰ	
-
-ۓ	
-
-۔	
-
-ە	
-	
-ۀ	
-
-ۗ	
-
-ۘ	
-
-ۙ	
-
-ۚ	
-
-ۛ	
-
-ۜ	
-
-۞	
-
-۩	
-
-۰	
-
-۱	
-
-۲	
-
-۳	
-
-۴	
-
-۵	
-
-۶	
-
-۷	
-
-۸	
-
-۹	
-
-۽	
-
-۾	
-
-܂	
-
-आ	
-
-क	
-
-के	
-
-ण	
-
-त	
-
-न	
-
-य	
-
-र	
-
-ल	
-
-व	
-
-स	
-
-ह	
-
-ा	
-
-ि	
-
-ी	
-
-०	
-
-স	
-
-া	
-
-ে	
-
-০	
-
-க	
-
-க்	
-
-த	
-
-த்	
-
-ப	
-
-ரு	
-
-ர்	
-
-வ	
-
-ா	
-
-ெ	
-
-ே	
-
-ை	
-
-ం	
-
-ు	
-
-ാ	
-
-ി	
-
-་	
-
-།
-
-
-።
-
-
-៰
-
-
-ᵒ
-
-
-ḍ
-
-
-Ḥ
-
-
-ḥ
-
-
-Ṁ
-
-
-ṁ
-
-
-Ṇ
-
-
-ṇ
-
-
-Ṛ
-
-
-ṛ
-
-
-Ṣ
-
-
-ṣ
-
-
-Ṭ
-
-
-ṭ
-
-
-ẞ
-
-
-Ạ
-
-
-ạ
-
-
-Ả
-
-
-ả
-
-
-Ấ
-
-
-ấ
-
-
-Ầ
-
-
-ầ
-
-
-Ẩ
-
-
-ẩ
-
-
-Ẫ
-
-
-ẫ
-
-
-Ậ
-
-
-ậ
-
-
-Ắ
-
-
-ắ
-
-
-Ằ
-
-
-ằ
-
-
-Ẳ
-
-
-ẳ
-
-
-Ẵ
-
-
-ẵ
-
-
-Ặ
-
-
-ặ
-
-
-Ẹ
-
-
-ẹ
-
-
-Ẻ
-
-
-ẻ
-
-
-Ẽ
-
-
-ẽ
-
-
-Ế
-
-
-ế
-
-
-Ề
-
-
-ề
-
-
-Ể
-
-
-ể
-
-
-Ễ
-
-
-ễ
-
-
-Ệ
-
-
-ệ
-
-
-Ỉ
-
-
-ỉ
-
-
-Ị
-
-
-ị
-
-
-Ọ
-
-
-ọ
-
-
-Ỏ
-
-
-ỏ
-
-
-Ố
-
-
-ố
-
-
-Ồ
-
-
-ồ
-
-
-Ổ
-
-
-ổ
-
-
-Ỗ
-
-
-ỗ
-
-
-Ộ
-
-
-ộ
-
-
-Ớ
-
-
-ớ
-
-
-Ờ
-
-
-ờ
-
-
-Ở
-
-
-ở
-
-
-Ỡ
-
-
-ỡ
-
-
-Ợ
-
-
-ợ
-
-
-Ụ
-
-
-ụ
-
-
-Ủ
-
-
-ủ
-
-
-Ứ
-
-
-ứ
-
-
-Ừ
-
-
-ừ
-
-
-Ử
-
-
-ử
-
-
-Ữ
-
-
-ữ
-
-
-Ự
-
-
-ự
-
-
-Ỳ
-
-
-ỳ
-
-
-ỵ
-
-
-Ỷ
-
-
-ỷ
-
-
-Ỹ
-
-
-ỹ
-
-
-‍
-
-
-‎
-
-
-‐
-
-
-‑
-
-
-‒
-
-
-–
-
-
-—
-
-
-―
-
-
-‖
-
-
-‘
-
-
-’
-
-
-‚
-
-
-“
-
-
-”
-
-
-„
-
-
-†
-
-
-‡
-
-
-•
-
-
-‣
-
-
-․
-
-
-…
-
-
-‧
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-‿
-
-⁄
-
-⁰
-
-⁹
-
-₁
-
-₂
-
-₤
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-℅
-
-№
-
-℗
-
-™
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↳
-
-↺
-
-⇒
-
-⇓
-
-∂
-
-∆
-
-∇
-
-∈
-
-∑
-
-−
-
-∗
-
-∙
-
-√
-
-∞
-
-∧
-
-∩
-
-∪
-
-≈
-
-≠
-
-≡
-
-≤
-
-≥
-
-≫
-
-⊆
-
-⋅
-
-⋆
-
-⌁
-
-⌊
-
-⌋
-
-⏭
-
-Ⓐ
-
-Ⓒ
-
-Ⓡ
-
-ⓐ
-
-─
-
-│
-
-└
-
-▄
-
-█
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▾
-
-◄
-
-◆
-
-◇
-
-◈
-
-◉
-
-◊
-
-○
-
-●
-
-☀
-
-★
-
-☆
-
-☎
-
-☐
-
-☛
-
-☞
-
-☹
-
-☺
-
-♂
-
-♠
-
-♡
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-⚫
-
-✅
-
-✈
-
-✉
-
-✓
-
-✔
-
-✗
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➔
-
-➖
-
-➜
-
-➡
-
-➤
-
-⟫
-
-⠀
-
-⠃
-
-⠇
-
-⠊
-
-⠗
-
-⠡
-
-⠷
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-》
-
-「
-
-【
-
-】
-
-〖
-
-〗
-
-・
-
-ꞌ
-
-ﬁ
-
-ﭘ
-
-ﭙ
-
-ﭧ
-
-ﭩ
-
-ﮈ
-
-ﮐ
-
-ﮑ
-
-ﮔ
-
-ﮞ
-
-ﮟ
-
-ﮨ
-
-ﮭ
-
-ﮯ
-
-ﯥ
-
-ﯧ
-
-ﯽ
-
-ﯾ
-
-ﯿ
-
-﴾
-
-﴿
-
-ﷲ
-
-
-ﷲَ
-
-
-ﷲُ
-
-
-ﷲِ
-
-ﷺ
-
-ﷻ
-
-﷼
-
-ﺅ
-
-ﺉ
-
-ﺋ
-
-ﺍ
-
-ﺎ
-
-ﺑ
-
-ﺗ
-
-ﺘ
-
-ﺟ
-
-ﺧ
-
-ﺩ
-
-ﺭ
-
-ﺮ
-
-ﺯ
-
-ﺳ
-
-ﺴ
-
-ﺷ
-
-ﻟ
-
-ﻠ
-
-ﻣ
-
-ﻤ
-
-ﻧ
-
-ﻨ
-
-ﻩ
-
-ﻪ
-
-ﻭ
-
-ﻮ
-
-ﻻ
-
-！
-
-（
-
-）
-
-，
-
-／
-
-：
-
-～
-
-￡
-
-￥
-
-�
-	
-😊
\ No newline at end of file
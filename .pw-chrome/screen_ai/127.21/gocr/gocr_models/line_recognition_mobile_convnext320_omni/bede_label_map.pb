@@ -1,10274 +0,0 @@
-
-
- 
-
- ँ
-
- ं
-
- ़
-
- ु
-
- ू
-
- ृ
-
- ॆ
-
- े
-
- ै	
-
- ॊ
-
-
- ्
-
- ्म
-
- ्य
-
-
- ्यु
-
-
- ्यै
-
- ्र
-
- ॓
-
- ঁ
-
- ়
-
- ু
-
- ূ
-
- ্
-
- ্য
-
- ‌
-
-!
-
-"
-
-"ं
-
-"़
-
-#
-
-$
-
-%
-
-& 
-
-'!
-
-'ँ"
-
-'ं#
-
-'़$
-
-'ু%
-
-(&
-
-(ु'
-
-(্(
-
-))
-
-)ृ*
-
-)े+
-
-)्,
-	
-)्A-
-	
-)्E.
-	
-)्O/
-
-)‌0
-
-*1
-
-+2
-
-,3
-
--4
-
--ं5
-
-.6
-
-/7
-
-08
-
-19
-
-1्ऱ:
-
-2;
-
-3<
-
-4=
-
-5>
-
-6?
-
-7@
-
-8A
-
-9B
-
-:C
-
-:‌D
-
-;E
-
-<F
-
-=G
-
->H
-
-?I
-
-?ंJ
-
-@K
-
-AL
-
-BM
-
-CN
-
-DO
-
-EP
-
-FQ
-
-GR
-
-HS
-
-IT
-
-JU
-
-KV
-
-LW
-
-MX
-
-MेY
-
-NZ
-
-O[
-
-O̟\
-
-P]
-
-Q^
-
-R_
-
-S`
-
-Ta
-
-Ub
-
-Vc
-
-Wd
-
-Xe
-
-Yf
-
-Zg
-
-[h
-
-\i
-
-]j
-
-]़k
-
-^l
-
-_m
-
-`n
-
-ao
-
-a̸p
-
-bq
-
-cr
-
-ds
-
-et
-
-e̟u
-
-e̱v
-
-fw
-
-gx
-
-hy
-
-iz
-
-i̇{
-
-i̟|
-
-j}
-
-k~
-
-l
-
-m
-
-m̃
-	
-mे
-
-n
-
-o
-
-o̟
-
-p
-
-q
-
-r
-
-s
-
-s̟
-
-t
-
-t̃
-
-u
-
-u̟
-
-u̸
-
-v
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-
- 
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-­
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˚
-
-˜
-
-˝
-
-˞
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-ا
-
-ل
-
-ँ
-
-ं
-
-ंं
-
-ः
-
-अ
-
-अँ
-
-अं
-
-अ़
-
-अॅ
-
-	अॅं
-
-अ॑
-
-अ॒
-
-	अ॒॒
-
-आ
-
-आँ
-
-आं
-
-आ़
-
-आॅ
-
-	आें
-
-	आ्य
-
-आ॑
-
-आ॒
-
-इ
-
-इँ
-
-इं
-
-इे
-
-इ॑
-
-इ॒
-
-ई
-
-ईँ
-
-ईं
-
-ईे
-
-ई॑
-
-ई॒
-
-उ
-
-उँ
-
-उं
-
-उ॑
-
-उ॒
-
-ऊ
-
-ऊँ
-
-ऊं
-
-ऊ॒
-
-ऋ
-
-ऋं
-
-ऋ॑
-
-ऋ॒
-
-ऌ
-
-ऍ
-
-ऍं
-
-ऎ
-
-ए
-
-एँ
-
-एं
-
-ए़
-
-एॅ
-
-एै
-
-	ए्ह
-
-ए॑
-
-ए॒
-
-ऐ
-
-ऐँ
-
-ऐं
-
-ऐ॒
-
-ऑ
-
-ऑं
-
-ऑ़
-
-ऒ
-
-ओ
-
-ओँ
-
-ओं
-
-ओ़
-
-औ
-
-औँ
-
-औं
-
-क
-
-कँ
-
-कं
-
-	कं॑
-
-	कं॒
-
-	कः॑
-
-क़
-
-	क़ु
-
-	क़ू
-
-	क़े
-
-	क़ै
-
-	क़्
-
-	का॑
-
-	का॒
-
-कि
-
-कि्र
-
-	कि॒
-
-	की॒
-
-कु
-
-	कुँ
-
-	कुं
-
-	कु़
-
-	कु॑
-
-	कु॒
-
-कू
-
-	कूँ
-
-	कूं
-
-	कू़
-
-	कू॑
-
-	कू॒
-
-कृ
-
-	कृं
-
-	कृ॑
-
-	कृ॒
-
-कॄ
-
-कॅ
-
-	कॅं
-
-कॆ
-
-के
-
-	केँ
-
-	कें
-
-	के़
-
-	के॑
-
-	के॒
-
-कै
-
-	कैं
-
-कॊ
-
-	को॑
-
-	को॒
-
-क्
-
-	क्र
-
-क्रं
-
-क्रा॑
-
-क्रि॑
-
-क्रि॒
-
-क्री॑
-
-क्री॒
-
-क्रु
-
-क्रू
-
-क्रू॒
-
-क्रृ
-
-क्रॅ
-
-क्रे
-
-क्रें
-
-क्रै
-
-क्रैं
-
-क्रॊ
-
-क्र्
-
-क्र॑
-
-क्र॒
-
-	क्ष
-
-क्षं
-
-क्षि॑
-
-क्षि॒
-
-क्षी॒
-
-क्षु
-
-क्षुं
-
-क्षु॑
-
-क्षु॒
-
-क्षू
-
-क्षूं
-
-क्षृ
-
-क्षॆ
-
-क्षे
-
-क्षै
-
-क्षॊ
-
-क्षो॒
-
-क्ष्
-
-क्ष्र
-
-क्ष॑
-
-क्ष॒
-
-क्षॢ
-
-क॑
-
-क॒
-
-कॢ
-
-ख
-
-खँ
-
-खं
-
-ख़
-
-ख़़ु
-
-	ख़ु
-
-	ख़ू
-
-	ख़े
-
-	ख़ै
-
-	ख़्
-
-खा्य
-
-	खा॑
-
-	खा॒
-
-खि
-
-	खि़
-
-खि्द
-
-खु
-
-	खुँ
-
-	खुं
-
-	खु़
-
-खू
-
-	खूँ
-
-	खूं
-
-	खू़
-
-खृ
-
-खॅ
-
-खॆ
-
-खे
-
-	खेँ
-
-	खें
-
-खै
-
-	खैँ
-
-	खैं
-
-खॊ
-
-ख्
-
-	ख्र
-
-ख्रु
-
-ख्रे
-
-ख्र्
-
-ख॑
-
-ख॒
-
-खॢ
-
-ग
-
-गँ
-
-गं
-
-ग़
-
-	ग़ु
-
-	ग़ै
-
-	ग़्
-
-	गा॑
-
-	गा॒
-
-गि्र
-
-	गि॒
-
-	गी॒
-
-गु
-
-	गुँ
-
-	गुं
-
-	गु॑
-
-	गु॒
-
-गू
-
-	गूँ
-
-	गूं
-
-गृ
-
-	गृ॑
-
-	गृ॒
-
-गॄ
-
-गॅ
-
-गॆ
-
-गे
-
-	गेँ
-
-	गें
-
-	गे॒
-
-गै
-
-	गैँ
-
-	गैं
-
-	गै़
-
-गॊ
-
-	गो॑
-
-	गो॒
-
-ग्
-
-	ग्र
-
-ग्रँ
-
-ग्रं
-
-ग्रा॒
-
-ग्री॒
-
-ग्रु
-
-ग्रू
-
-ग्रॅ
-
-ग्रॆ
-
-ग्रे
-
-ग्रें
-
-ग्रे॑
-
-ग्रे॒
-
-ग्रै
-
-ग्रैं
-
-ग्र्
-
-ग्र॑
-
-ग्र॒
-
-ग॑
-
-ग॒
-
-गॢ
-
-घ
-
-घँ
-
-घं
-
-	घा॑
-
-	घा॒
-
-घु
-
-	घुँ
-
-	घुं
-
-घू
-
-	घूँ
-
-	घूं
-
-घृ
-
-	घृ॒
-
-घॅ
-
-घे
-
-	घें
-
-घै
-
-घो्ने
-
-	घो॒
-
-घ्
-
-	घ्र
-
-घ्रं
-
-घ्री
-
-घ्रु
-
-घ्रे
-
-घ्रै
-
-घ्र्
-
-घ॒
-
-घॢ
-
-ङ
-
-ङं
-
-ङु
-
-ङू
-
-ङृ
-
-ङॅ
-
-ङे
-
-	ङें
-
-ङै
-
-ङ्
-
-	ङ्क
-
-ङ्कं
-
-ङ्का॒
-
-ङ्कु
-
-ङ्कू
-
-ङ्कृ
-
-ङ्कृ॑
-
-ङ्कृ॒
-
-ङ्के
-
-ङ्कै
-
-ङ्क्
-
-ङ्क्र
-
-ङ्क्रु
-
-ङ्क्ष
-
-ङ्क्षं
-
-ङ्क्षु
-
-ङ्क्षे
-
-ङ्क्ष्
-
-ङ्क॑
-
-ङ्क॒
-
-ङ्कॢ
-
-	ङ्ख
-
-ङ्खं
-
-ङ्खु
-
-ङ्खे
-
-ङ्खै
-
-ङ्ख्
-
-	ङ्ग
-
-ङ्गं
-
-ङ्गा॑
-
-ङ्गि॑
-
-ङ्गु
-
-ङ्गू
-
-ङ्गृ
-
-ङ्गे
-
-ङ्गै
-
-ङ्ग्
-
-ङ्ग्र
-
-ङ्ग्रा॒
-
-ङ्ग्रे
-
-ङ्ग॑
-
-ङ्ग॒
-
-	ङ्घ
-
-ङ्घं
-
-ङ्घृ॒
-
-ङ्घे
-
-ङ्घै
-
-ङ्घ्
-
-ङ्घ्र
-
-	ङ्र
-
-ङ्रे
-
-ङॢ
-
-च
-
-चँ
-
-चं
-
-	चं॑
-
-	चं॒
-
-	चः॑
-
-च़
-
-	चा॑
-
-	चा॒
-
-	चि॑
-
-	चि॒
-
-	ची॑
-
-	ची॒
-
-चु
-
-	चुँ
-
-	चुं
-
-चू
-
-	चूँ
-
-	चूं
-
-चृ
-
-चॅ
-
-	चॅं
-
-चॆ
-
-	चॆं
-
-चे
-
-	चें
-
-	चे॑
-
-	चे॒
-
-चै
-
-	चैं
-
-	चै॒
-
-चॊ
-
-	चो॑
-
-	चो॒
-
-च्
-
-	च्र
-
-च्र्
-
-च॑
-
-च॒
-
-चॢ
-
-छ
-
-छँ
-
-छं
-
-	छा॑
-
-	छा॒
-
-	छि॑
-
-	छि॒
-
-छु
-
-	छु॒
-
-छू
-
-	छूं
-
-छृ
-
-	छृं
-
-छॄ
-
-छॅ
-
-छॆ
-
-छे
-
-	छेँ
-
-	छें
-
-	छे॑
-
-छै
-
-	छैं
-
-छो्ड़े
-
-छौं्
-
-छ्
-
-	छ्र
-
-छ्रं
-
-छ्रु
-
-छ्रू
-
-छ्रे
-
-छ॑
-
-छ॒
-
-छॢ
-
-ज
-
-जँ
-
-जं
-
-	जं॑
-
-	जः॑
-
-ज़
-
-	ज़ं
-
-	ज़़
-
-	ज़ु
-
-	ज़ू
-
-	ज़े
-
-ज़ें
-
-	ज़ै
-
-ज़ैं
-
-	ज़्
-
-ज़्र
-
-	जा़
-
-	जा॑
-
-	जा॒
-
-	जि़
-
-	जि॑
-
-	जि॒
-
-	जी़
-
-	जी॑
-
-	जी॒
-
-जु
-
-	जुँ
-
-	जुं
-
-	जु़
-
-	जु॑
-
-	जु॒
-
-जू
-
-	जूँ
-
-	जूं
-
-जृ
-
-	जृं
-
-जॄ
-
-जॅ
-
-जॆ
-
-जे
-
-	जें
-
-	जे़
-
-	जे॑
-
-	जे॒
-
-जै
-
-	जैं
-
-	जै॒
-
-जॊ
-
-	जो़
-
-जो्प
-
-	जो॑
-
-	जो॒
-
-ज्
-
-	ज्ञ
-
-ज्ञं
-
-ज्ञा॑
-
-ज्ञा॒
-
-ज्ञु
-
-ज्ञू
-
-ज्ञृ
-
-ज्ञे
-
-ज्ञै
-
-ज्ञॊ
-
-ज्ञ्
-
-ज्ञ॒
-
-ज्ञॢ
-
-	ज्र
-
-ज्रं
-
-ज्रे
-
-ज्रे॑
-
-ज्रै
-
-ज्रो॒
-
-ज्र्
-
-ज्र॑
-
-ज॑
-
-ज॒
-
-जॢ
-
-झ
-
-झँ
-
-झं
-
-झ़
-
-झु
-
-	झुं
-
-झू
-
-झृ
-
-झॅ
-
-झे
-
-	झें
-
-झै
-
-	झैँ
-
-	झैं
-
-झ्
-
-	झ्र
-
-झॢ
-
-ञ
-
-ञं
-
-ञु
-
-ञू
-
-ञृ
-
-ञॅ
-
-ञे
-
-ञै
-
-ञ्
-
-	ञ्ज
-
-ञ्जं
-
-ञ्जा॒
-
-ञ्जी॒
-
-ञ्जु
-
-ञ्जु॑
-
-ञ्जु॒
-
-ञ्जू
-
-ञ्जे
-
-ञ्जै
-
-ञ्ज्
-
-ञ्ज्ञ
-
-ञ्ज्ञं
-
-ञ्ज॑
-
-ञ्ज॒
-
-ञॢ
-
-ट
-
-टँ
-
-टं
-
-	टा॑
-
-	टा॒
-
-टि्र
-
-	टि॑
-
-	टि॒
-
-टु
-
-	टुँ
-
-	टुं
-
-	टु॑
-
-टू
-
-	टूं
-
-टृ
-
-टॄ
-
-टॅ
-
-	टॅं
-
-टॆ
-
-टे
-
-	टें
-
-टे्र
-
-टै
-
-	टैं
-
-टॊ
-
-टो्म
-
-	टो॒
-
-ट्
-
-	ट्ट
-
-ट्टं
-
-ट्टु
-
-ट्टू
-
-ट्टे
-
-ट्टै
-
-ट्ट्
-
-	ट्ठ
-
-ट्ठं
-
-ट्ठू
-
-ट्ठे
-
-	ट्र
-
-ट्रं
-
-ट्रु
-
-ट्रू
-
-ट्रॅ
-
-ट्रे
-
-ट्रें
-
-ट्रै
-
-ट्रैं
-
-ट्र्
-
-ट्र॒
-
-ट॑
-
-ट॒
-
-टॢ
-
-ठ
-
-ठँ
-
-ठं
-
-	ठा॒
-
-ठु
-
-	ठुँ
-
-	ठुं
-
-ठू
-
-	ठूं
-
-ठृ
-
-ठॆ
-
-ठे
-
-	ठें
-
-ठै
-
-ठ्
-
-	ठ्ठ
-
-ठ्ठे
-
-ठ्ठ्
-
-	ठ्र
-
-ठ॑
-
-ठ॒
-
-ठॢ
-
-ड
-
-डँ
-
-डं
-
-ड़
-
-	ड़ं
-
-	ड़ु
-
-	ड़ू
-
-	ड़े
-
-ड़ें
-
-	ड़ै
-
-	ड़्
-
-	डा़
-
-	डाॅ
-
-	डा॑
-
-	डा॒
-
-	डि़
-
-डि्र
-
-	डि॒
-
-	डी़
-
-डु
-
-	डुँ
-
-	डुं
-
-डू
-
-	डूं
-
-डृ
-
-डॅ
-
-डॆ
-
-डे
-
-	डें
-
-	डे़
-
-डै
-
-	डैं
-
-डॊ
-
-डौंँ
-
-डौंं
-
-ड्
-
-	ड्र
-
-ड्रं
-
-ड्रु	
-
-ड्रू	
-
-ड्रॅ	
-
-ड्रे	
-
-ड्रै	
-
-ड्र्	
-
-ड॑	
-
-ड॒	
-
-डॢ	
-
-ढ	
-
-ढँ	
-
-ढं	
-
-ढ़	
-
-	ढ़ं	
-
-	ढ़ॆ	
-
-	ढ़े	
-
-ढ़ें	
-
-	ढ़्	
-
-	ढा़	
-
-	ढि़	
-
-ढु	
-
-	ढुँ	
-
-	ढुं	
-
-ढू	
-
-	ढूँ	
-
-	ढूं	
-
-ढृ	
-
-ढॆ	
-
-ढे	
-
-	ढें	
-
-	ढे़	
-
-ढै	
-
-	ढो॑	
-
-ढ्	
-
-	ढ्र	
-
-ढ्रं	
-
-ढ्रे	
-
-ढॢ	
-
-ण	
-
-णँ	
-
-णं	
-
-	णं॒	
-
-	णः॑	
-
-	ण़्	
-
-णां॒	
-
-	णा॑	
-
-	णा॒	
-
-	णि॑	
-
-	णि॒	
-
-	णी॑	
-
-	णी॒	
-
-णु	
-
-	णुं	
-
-णुः॑	
-
-	णु॑	
-
-	णु॒	
-
-णू	
-
-	णूं	
-
-णृ	
-
-णॅ	
-
-णॆ	
-
-	णॆं	
-
-णे	
-
-	णें	
-
-	णे॑	
-
-	णे॒	
-
-णै	
-
-	णै॒	
-
-णॊ	
-
-णोः॒	
-
-	णो॑	
-
-	णो॒	
-
-ण्	
-
-	ण्र	
-
-ण॑	
-
-ण॒	
-
-ण॓	
-
-णॢ	
-
-त	
-
-तँ	
-
-तं	
-
-	तंं	
-
-	तं॑	
-
-	तं॒	
-
-तः	
-
-	तः॑	
-
-	तः॒	
-
-त़	
-
-तां॒	
-
-ताः॑	
-
-ता्द	
-
-	ता॑	
-
-	ता॒	
-
-ता॒॒	
-
-	ता॔	
-
-ति	
-
-तिं॒	
-
-तिः॑	
-
-तिः॒	
-
-	ति॑	
-
-	ति॒	
-
-	ति॔	
-
-ती्ह	
-
-ती्हुँं	
-
-	ती॑	
-
-	ती॒	
-
-तु	
-
-	तुं	
-
-तुः॑	
-
-	तु॑	
-
-	तु॒	
-
-तू	
-
-	तूं	
-
-	तू॑	
-
-	तू॒	
-
-तृ	
-
-	तृ॑	
-
-	तृ॒	
-
-तॄ	
-
-	तॄं	
-
-तॅ	
-
-तॆ	
-
-ते	
-
-	तेँ	
-
-	तें	
-
-	ते॑	
-
-	ते॒	
-
-तै	
-
-	तैं
-
-
-	तै॒
-
-
-तॊ
-
-
-	तो॑
-
-
-	तो॒
-
-
-	तौ॒
-
-
-त्
-
-
-	त्र
-
-
-त्रँ
-
-
-त्रं
-
-
-त्रं॑
-
-
-त्रं॒
-
-
-त्रा
-
-
-त्रा॑
-
-
-त्रा॒
-
-
-त्रि॑
-
-
-त्रि॒
-
-
-त्रि॒॒
-
-
-त्री॑
-
-
-त्रु
-
-
-त्रुं
-
-
-त्रू
-
-
-त्रूं
-
-
-त्रृ
-
-
-त्रॆ
-
-
-त्रे
-
-
-त्रें
-
-
-त्रे॑
-
-
-त्रे॒
-
-
-त्रै
-
-
-त्रै॒
-
-
-त्रॊ
-
-
-त्रो॑
-
-
-त्र्
-
-
-त्र्र
-
-
-त्र॑
-
-
-त्र॒
-
-
-त॑
-
-
-त॒
-
-
-	त॒॒
-
-
-तॢ
-
-
-थ
-
-
-थँ
-
-
-थं
-
-
-थ़
-
-
-	था॑
-
-
-	था॒
-
-
-थि
-
-
-	थि॑
-
-
-	थि॒
-
-
-थु
-
-
-	थुं
-
-
-	थु॒
-
-
-थू
-
-
-थृ
-
-
-थॅ
-
-
-थॆ
-
-
-थे
-
-
-	थेँ
-
-
-	थें
-
-
-	थे॑
-
-
-	थे॒
-
-
-थै
-
-
-	थैं
-
-
-	थै॒
-
-
-थॊ
-
-
-	थो॑
-
-
-	थो॒
-
-
-थ्
-
-
-	थ्र
-
-
-थ्रु
-
-
-थ्रू
-
-
-थ्रे
-
-
-थ्रै
-
-
-थ्र्
-
-
-थ॑
-
-
-थ॒
-
-
-थॢ
-
-
-द
-
-
-दँ
-
-
-दं
-
-
-	दं॑
-
-
-	दः॑
-
-
-द़
-
-
-	दा॑
-
-
-	दा॒
-
-
-दा॒॒
-
-
-	दिे
-
-
-दि्र
-
-
-	दि॑
-
-
-	दि॒
-
-
-	दी॑
-
-
-	दी॒
-
-
-दु
-
-
-	दुं
-
-
-	दु॑
-
-
-	दु॒
-
-
-दू
-
-
-	दूँ
-
-
-	दूं
-
-
-	दू॒
-
-
-दृ
-
-
-	दृं
-
-
-	दृ॑
-
-
-	दृ॒
-
-
-दॄ
-
-
-दॅ
-
-
-दॆ
-
-
-दे
-
-
-	दें
-
-
-दे्द
-
-
-दे्दै
-
-
-	दे॑
-
-
-	दे॒
-
-
-दै
-
-
-	दैँ
-
-
-	दैं
-
-
-	दै॒
-
-
-दॊ
-
-
-	दो॑
-
-
-	दो॒
-
-
-द्
-
-
-	द्घ
-
-
-द्घु
-
-
-द्घृ
-
-
-	द्द
-
-
-द्दं
-
-
-द्दु
-
-
-द्दू
-
-द्दृ
-
-द्दॆ
-
-द्दे
-
-द्दे॒
-
-द्दै
-
-द्द्
-
-द्द्र
-
-द्द्रु
-
-द्द॑
-
-	द्ध
-
-द्धं
-
-द्धा॒
-
-द्धु
-
-द्धुं
-
-द्धू
-
-द्धृ
-
-द्धे
-
-द्धे॒
-
-द्धै
-
-द्ध्
-
-द्ध्र
-
-द्ध्रु
-
-द्ध्रु॒
-
-द्ध॑
-
-द्ध॒
-
-	द्ब
-
-द्बं
-
-द्बु
-
-द्बृ
-
-द्ब्र
-
-द्ब्रा॑
-
-द्ब्रू
-
-द्ब॒
-
-	द्भ
-
-द्भि॑
-
-द्भि॒
-
-द्भु
-
-द्भू
-
-द्भृ
-
-द्भे
-
-द्भै
-
-द्भ्
-
-द्भ्र
-
-द्भ्रु
-
-द्भ्रू
-
-द्भ॑
-
-	द्म
-
-द्मं
-
-द्मे
-
-द्मै
-
-द्म्
-
-	द्य
-
-द्यं
-
-द्या॑
-
-द्या॒
-
-द्यु
-
-द्यु॒
-
-द्यू
-
-द्यॆ
-
-द्ये
-
-द्ये॑
-
-द्ये॒
-
-द्यै
-
-द्यॊ
-
-द्य्
-
-द्य॑
-
-द्य॒
-
-	द्र
-
-द्रं
-
-द्रं॑
-
-द्रं॒
-
-द्रः॑
-
-द्रा॑
-
-द्रा॒
-
-द्रि॑
-
-द्रि॒
-
-द्रु
-
-द्रु॒
-
-द्रू
-
-द्रू॒
-
-द्रृ
-
-द्रॆ
-
-द्रे
-
-द्रे॑
-
-द्रे॒
-
-द्रै
-
-द्रॊ
-
-द्रो॑
-
-द्रो॒
-
-द्र्
-
-द्र॑
-
-द्र॒
-
-	द्व
-
-द्वं
-
-द्वा॑
-
-द्वा॒
-
-द्वि॑
-
-द्वि॒
-
-द्वी॒
-
-द्वु
-
-द्वृ
-
-द्वॆ
-
-द्वे
-
-द्वै
-
-द्वै॑
-
-द्व्
-
-द्व्र
-
-द्व॑
-
-द्व॒
-
-द॑
-
-द॒
-
-दॢ
-
-ध
-
-धँ
-
-धं
-
-	धः॑
-
-धा
-
-	धा॑
-
-	धा॒
-
-	धि॑
-
-	धि॒
-
-	धी॑
-
-	धी॒
-
-धु
-
-	धुँ
-
-	धुं
-
-धु्र
-
-	धु॑
-
-	धु॒
-
-धू
-
-	धूँ
-
-	धूं
-
-धृ
-
-	धृ॑
-
-	धृ॒
-
-धॄ
-
-धॆ
-
-धे
-
-	धें
-
-	धे॑
-
-	धे॒
-
-धै
-
-	धैँ
-
-	धैं
-
-धॊ
-
-	धो॑
-
-	धो॒
-
-ध्
-
-	ध्र
-
-ध्रं
-
-ध्रु
-
-ध्रु॒
-
-ध्रे
-
-ध्रै
-
-ध्र्
-
-ध॑
-
-ध॒
-
-धॢ
-
-न
-
-नँ
-
-नं
-
-	नंं
-
-	नं॑
-
-	नं॒
-
-	नः॑
-
-	नः॒
-
-नां॑
-
-नां॒
-
-	नाः
-
-	ना॑
-
-	ना॒
-
-ना॒॒
-
-नि
-
-निः॑
-
-	नि॑
-
-	नि॒
-
-	नी॑
-
-	नी॒
-
-नु
-
-	नुं
-
-	नु॑
-
-	नु॒
-
-नू
-
-	नूँ
-
-	नूं
-
-	नू॑
-
-	नू॒
-
-नृ
-
-	नृ॑
-
-	नृ॒
-
-नॄ
-
-नॅ
-
-नॆ
-
-ने
-
-	नेँ
-
-	नें
-
-	ने॑
-
-	ने॒
-
-नै
-
-	नैं
-
-	नै॒
-
-नॊ
-
-	नो॑
-
-	नो॒
-
-	नौ॑
-
-	नौ॒
-
-न्
-
-	न्र
-
-न्रु
-
-न्रू
-
-न्रे
-
-न्र्
-
-न॑
-
-न॒
-
-	न॒॒
-
-नॢ
-
-ऩ
-
-प
-
-पँ
-
-पं
-
-	पः॑
-
-प़
-
-	पाॅ
-
-	पा॑
-
-	पा॒
-
-पा॒॒
-
-पि्र
-
-	पि॑
-
-	पि॒
-
-	पी॑
-
-	पी॒
-
-पु
-
-	पुँ
-
-	पुं
-
-	पु॑
-
-	पु॒
-
-पू
-
-	पूँ
-
-	पूं
-
-	पू॑
-
-	पू॒
-
-पृ
-
-	पृ॑
-
-	पृ॒
-
-पॄ
-
-पॅ
-
-	पॅं
-
-पॆ
-
-पे
-
-	पें
-
-पे्र
-
-	पे॑
-
-	पे॒
-
-पै
-
-	पैँ
-
-	पैं
-
-	पै॑
-
-	पै॒
-
-पॊ
-
-	पो॑
-
-	पो॒
-
-	पौ॑
-
-	पौ॒
-
-प्
-
-	प्र
-
-प्रं
-
-प्रा॑
-
-प्रा॒
-
-प्रि॑
-
-प्रि॒
-
-प्री॑
-
-प्री॒
-
-प्रु
-
-प्रू
-
-प्रॅ
-
-प्रॆ
-
-प्रे
-
-प्रें
-
-प्रै
-
-प्रॊ
-
-प्र्
-
-प्र्र
-
-प्र॑
-
-प्र॒
-
-प॑
-
-प॒
-
-पॢ
-
-फ
-
-फँ
-
-फं
-
-फ़
-
-	फ़ं
-
-	फ़ु
-
-	फ़ू
-
-	फ़ॅ
-
-	फ़े
-
-फ़ें
-
-	फ़ै
-
-	फ़्
-
-फ़्र
-
-फ़्रं
-
-फ़्रे
-
-फ़्रें
-
-फ़्रै
-
-फ़्रैं
-
-फि्ट
-
-फु
-
-	फुं
-
-फू
-
-	फूँ
-
-	फूं
-
-फृ
-
-फॅ
-
-फे
-
-	फें
-
-	फे़
-
-फै
-
-	फैँ
-
-	फैं
-
-फॊ
-
-फ्
-
-	फ्र
-
-फ्रँ
-
-फ्रं
-
-फ्रु
-
-फ्रू
-
-फ्रॅ
-
-फ्रॅं
-
-फ्रे
-
-फ्रें
-
-फ्रै
-
-फ्रैं
-
-फ्र्
-
-फॢ
-
-ब
-
-बँ
-
-बं
-
-ब़
-
-	बा॑
-
-	बा॒
-
-बि्र
-
-	बि॑
-
-बु
-
-	बुँ
-
-	बुं
-
-	बु॒
-
-बू
-
-	बूँ
-
-	बूं
-
-बृ
-
-	बृं
-
-	बृ॑
-
-	बृ॒
-
-बॄ
-
-बॅ
-
-	बॅं
-
-बॆ
-
-बे
-
-	बेँ
-
-	बें
-
-बे्र
-
-बै
-
-	बैँ
-
-	बैं
-
-बॊ
-
-ब्
-
-	ब्र
-
-ब्रँ
-
-ब्रं
-
-ब्रा॑
-
-ब्रा॒
-
-ब्रु
-
-ब्रू
-
-ब्रू॒
-
-ब्रॅ
-
-ब्रॅं
-
-ब्रे
-
-ब्रें
-
-ब्रै
-
-ब्रैं
-
-ब्र्
-
-ब्र॑
-
-ब्र॒
-
-ब॑
-
-ब॒
-
-बॢ
-
-भ
-
-भँ
-
-भं
-
-	भा॑
-
-	भा॒
-
-भिः॑
-
-भिः॒
-
-	भि॑
-
-	भि॒
-
-	भी॒
-
-भु
-
-	भुँ
-
-	भुं
-
-	भु॑
-
-	भु॒
-
-भू
-
-	भूँ
-
-	भूं
-
-	भू॑
-
-	भू॒
-
-भृ
-
-	भृं
-
-	भृ॑
-
-	भृ॒
-
-भॄ
-
-भॅ
-
-भॆ
-
-भे
-
-	भें
-
-	भे॑
-
-	भे॒
-
-भै
-
-	भैँ
-
-	भैं
-
-भॊ
-
-	भो॑
-
-	भो॒
-
-भ्
-
-	भ्र
-
-भ्रं
-
-भ्रु
-
-भ्रू
-
-भ्रे
-
-भ्रै
-
-भ्र्
-
-भ॑
-
-भ॒
-
-भॢ
-
-म
-
-मँ
-
-मं
-
-	मंे
-
-	मं॑
-
-	मं॒
-
-	मः॑
-
-	मः॒
-
-म़
-
-माः॑
-
-	माॅ
-
-	मा॑
-
-	मा॒
-
-मा॒॒
-
-	मि॑
-
-	मि॒
-
-मी
-
-	मी॑
-
-	मी॒
-
-मु
-
-	मुँ
-
-	मुं
-
-	मु़
-
-	मुॅ
-
-	मु॑
-
-	मु॒
-
-मू
-
-	मूँ
-
-	मूं
-
-	मू॑
-
-	मू॒
-
-मृ
-
-	मृ॑
-
-	मृ॒
-
-मॄ
-
-मॅ
-
-	मॅं
-
-मॆ
-
-मे
-
-	मेँ
-
-	में
-
-मेें
-
-	मे॑
-
-	मे॒
-
-मै
-
-	मैं
-
-	मै॑
-
-	मै॒
-
-मॊ
-
-	मो॑
-
-	मो॒
-
-म्
-
-	म्र
-
-म्रं
-
-म्रा॑
-
-म्रु
-
-म्रे
-
-म्रै
-
-म्र्
-
-म॑
-
-म॒
-
-	म॒॒
-
-मॢ
-
-य
-
-यँ
-
-	यँ॑
-
-	यँ॒
-
-यं
-
-	यं॑
-
-	यं॒
-
-	यः॑
-
-	यः॒
-
-य़
-
-	य़ु
-
-	य़ू
-
-	य़े
-
-यां॑
-
-यां॒
-
-याः॑
-
-	याॅ
-
-	या॑
-
-	या॒
-
-या॒॒
-
-यि
-
-	यि॑
-
-	यि॒
-
-	यी॑
-
-	यी॒
-
-यु
-
-	युँ
-
-	युं
-
-युः॑
-
-	यु॑
-
-	यु॒
-
-यू
-
-	यूँ
-
-	यूं
-
-	यू॑
-
-	यू॒
-
-यृ
-
-	यृ॑
-
-	यृ॒
-
-यॄ
-
-यॅ
-
-यॆ
-
-ये
-
-	येँ
-
-	यें
-
-	ये॑
-
-	ये॒
-
-यै
-
-	यैं
-
-	यै॑
-
-	यै॒
-
-यॊ
-
-योः॑
-
-	यो॑
-
-	यो॒
-
-	यौ॑
-
-य्
-
-	य्र
-
-य्र्
-
-य॑
-
-य॒
-
-	य॒॒
-
-यॢ
-
-र
-
-रँ
-
-रं
-
-	रं॑
-
-	रं॒
-
-	रः॑
-
-	रः॒
-
-रा
-
-	राँ
-
-	रां
-
-	रा॑
-
-	रा॒
-
-रिः॑
-
-	रि॑
-
-	रि॒
-
-रि॒॒
-
-री
-
-	रीं
-
-	री॑
-
-	री॒
-
-रु
-
-	रुँ
-
-	रुं
-
-	रु़
-
-	रुे
-
-	रु॑
-
-	रु॒
-
-रू
-
-	रूँ
-
-	रूं
-
-	रू॑
-
-	रू॒
-
-रृ
-
-रॄ
-
-रॅ
-
-	रॅं
-
-रॆ
-
-रे
-
-	रेँ
-
-	रें
-
-	रे॑
-
-	रे॒
-
-रै
-
-	रैं
-
-	रै॒
-
-रॉ
-
-	रॉं
-
-रॊ
-
-रो
-
-	रों
-
-	रो॑
-
-	रो॒
-
-रौ
-
-	रौँ
-
-	रौं
-
-	रौ॒
-
-र्
-
-	र्ं
-
-	र्अ
-
-	र्इ
-
-र्इं
-
-	र्उ
-
-	र्ऋ
-
-	र्ए
-
-	र्क
-
-र्कं
-
-र्क़
-
-र्का
-
-र्कां
-
-र्की
-
-र्कीं
-
-र्कु
-
-र्कू
-
-र्कृ
-
-र्के
-
-र्कें
-
-र्कै
-
-र्को
-
-र्कों
-
-र्कौ
-
-र्क्
-
-र्क्क
-
-र्क्ट
-
-र्क्य
-
-र्क्यं
-
-र्क्या
-
-र्क्यु
-
-र्क्यू
-
-र्क्यो
-
-र्क्र
-
-र्क्ले
-
-र्क्वे
-
-र्क्ष
-
-र्क्षं
-
-र्क्षा
-
-र्क्षी
-
-र्क्षे
-
-र्क्ष्य
-
-र्क्ष्यं
-
-र्क्ष्या
-
-र्क्ष्यो
-
-र्क्स
-
-	र्ख
-
-र्खं
-
-र्ख़
-
-र्खा
-
-र्खी
-
-र्खु
-
-र्खे
-
-र्खो
-
-र्खों
-
-र्खौ
-
-र्ख्या
-
-र्ख्यौ
-
-	र्ग
-
-र्गं
-
-र्ग़
-
-र्गा
-
-र्गां
-
-र्गी
-
-र्गीं
-
-र्गु
-
-र्गुं
-
-र्गू
-
-र्गृ
-
-र्गृ॒
-
-र्गॆ
-
-र्गे
-
-र्गै
-
-र्गो
-
-र्गों
-
-र्गौ
-
-र्ग्
-
-र्ग्य
-
-र्ग्यं
-
-र्ग्यः॑
-
-र्ग्या
-
-र्ग्यु
-
-र्ग्यू
-
-र्ग्यो
-
-र्ग्र
-
-र्ग्रा
-
-र्ग्वा
-
-र्ग॑
-
-	र्घ
-
-र्घं
-
-र्घा
-
-र्घां
-
-र्घी
-
-र्घु
-
-र्घृ
-
-र्घे
-
-र्घै
-
-र्घो
-
-र्घौ
-
-र्घ्न
-
-र्घ्य
-
-र्घ्यं
-
-र्घ्या
-
-र्घ्ये
-
-र्ङ्ग
-
-र्ङ्गं
-
-र्ङ्गा
-
-	र्च
-
-र्चं
-
-र्चा
-
-र्चां
-
-र्ची
-
-र्चु
-
-र्चू
-
-र्चे
-
-र्चें
-
-र्चै
-
-र्चो
-
-र्चों
-
-र्चो॒
-
-र्चौ
-
-र्च्
-
-र्च्च
-
-र्च्चा
-
-र्च्च्य
-
-र्च्छ
-
-र्च्छा
-
-र्च्छां
-
-र्च्छ॑
-
-र्च्य
-
-र्च्या
-
-र्च्यू
-
-र्च॑
-
-र्च॒
-
-	र्छ
-
-र्छं
-
-र्छा
-
-र्छु
-
-र्छे
-
-र्छौ
-
-र्छौं
-
-	र्ज
-
-र्जं
-
-र्जं॑
-
-र्ज़
-
-र्ज़ा
-
-र्ज़ी
-
-र्ज़े
-
-र्ज़ों
-
-र्जा
-
-र्जां
-
-र्जी
-
-र्जु
-
-र्जु॑
-
-र्जु॒
-
-र्जू
-
-र्जे
-
-र्जें
-
-र्जै
-
-र्जो
-
-र्जों
-
-र्ज्
-
-र्ज्ज
-
-र्ज्जु
-
-र्ज्ञा
-
-र्ज्ञे
-
-र्ज्ड
-
-र्ज्य
-
-र्ज्यं
-
-र्ज्या
-
-र्ज्ये
-
-र्ज्यो
-
-र्ज्व
-
-र्ज्वा
-
-र्ज॑
-
-र्ज॒
-
-	र्झ
-
-र्झा
-
-	र्ञ
-
-	र्ट
-
-र्टं
-
-र्टा
-
-र्टी
-
-र्टु
-
-र्टू
-
-र्टे
-
-र्टें
-
-र्टो
-
-र्टों
-
-र्ट्
-
-र्ट्ज
-
-र्ट्ज़
-
-र्ट्झ
-
-र्ट्र
-
-र्ट्रा
-
-र्ट्रे
-
-र्ट्स
-
-र्ट्स्
-
-	र्ठ
-
-	र्ड
-
-र्डं
-
-र्डा
-
-र्डी
-
-र्डीं
-
-र्डु
-
-र्डे
-
-र्डो
-
-र्डों
-
-र्ड्
-
-र्ड्यू
-
-र्ड्री
-
-र्ड्स
-
-र्ड्स्
-
-र्ड्स्व
-
-	र्ढ
-
-र्ढा
-
-र्ढे
-
-र्ढ्य
-
-र्ढ्या
-
-	र्ण
-
-र्णं
-
-र्णा
-
-र्णां
-
-र्णा॒
-
-र्णी
-
-र्णीं
-
-र्णु
-
-र्णू
-
-र्णॆ
-
-र्णे
-
-र्णै
-
-र्णो
-
-र्णों
-
-र्णौ
-
-र्ण्
-
-र्ण्य
-
-र्ण्यं
-
-र्ण्या
-
-र्ण्यां
-
-र्ण्ये
-
-र्ण्यो
-
-र्ण॑
-
-र्ण॒
-
-	र्त
-
-र्तं
-
-र्ता
-
-र्तां
-
-र्ताी
-
-र्ति॒
-
-र्ती
-
-र्तीं
-
-र्तु
-
-र्तुं
-
-र्तू
-
-र्तृ
-
-र्तॄ
-
-र्ते
-
-र्तें
-
-र्तै
-
-र्तो
-
-र्तों
-
-र्तौ
-
-र्त्
-
-र्त्त
-
-र्त्तं
-
-र्त्ता
-
-र्त्तां
-
-र्त्ती
-
-र्त्तु
-
-र्त्तुं
-
-र्त्तृ
-
-र्त्ते
-
-र्त्तो
-
-र्त्त्य
-
-र्त्त्या
-
-र्त्म
-
-र्त्मा
-
-र्त्मे
-
-र्त्य
-
-र्त्यं
-
-र्त्या
-
-र्त्यां
-
-र्त्ये
-
-र्त्यै
-
-र्त्यो
-
-र्त्र
-
-र्त्रा
-
-र्त्री
-
-र्त्रे
-
-र्त्रो
-
-र्त्र्
-
-र्त्र॑
-
-र्त्व
-
-र्त्वा
-
-र्त्स
-#
-र्त्स्न्ये
-
-र्त्स्य
-
-र्त॒
-
-	र्थ
-
-र्थँ
-
-र्थं
-
-र्था
-
-र्थां
-
-र्थि॑
-
-र्थी
-
-र्थीं
-
-र्थु
-
-र्थॆ
-
-र्थे
-
-र्थें
-
-र्थै
-
-र्थो
-
-र्थों
-
-र्थौ
-
-र्थ्
-
-र्थ्य
-
-र्थ्यं
-
-र्थ्या
-
-र्थ्यां
-
-र्थ्ये
-
-र्थ्यो
-
-र्थ्रो
-
-र्थ्व्य
-
-र्थ्स
-
-	र्द
-
-र्दं
-
-र्दा
-
-र्दी
-
-र्दु
-
-र्दू
-
-र्दृ
-
-र्दॆ
-
-र्दे
-
-र्दे॒
-
-र्दै
-
-र्दो
-
-र्दों
-
-र्दौ
-
-र्द्द
-
-र्द्दे
-
-र्द्ध
-
-र्द्धं
-
-र्द्धा
-
-र्द्धां
-
-र्द्धे
-
-र्द्ध्व
-
-र्द्ध्वं
-
-र्द्य
-
-र्द्या
-
-र्द्यु
-
-र्द्यू
-
-र्द्यो
-
-र्द्यौ
-
-र्द्य्
-
-र्द्र
-
-र्द्रं
-
-र्द्रा
-
-र्द्रां
-
-र्द्री
-
-र्द्रु
-
-र्द्रे
-
-र्द्रै
-
-र्द्रो
-
-र्द्रौ
-
-र्द्व
-
-र्द्वा
-
-र्द्वी
-
-र्द्वे
-
-र्द्वै
-
-र्द॑
-
-र्द॒
-
-	र्ध
-
-र्धं
-
-र्धा
-
-र्धां
-
-र्धी
-
-र्धु
-
-र्धू
-
-र्धृ
-
-र्धे
-
-र्धै
-
-र्धो
-
-र्धौ
-
-र्ध्द
-
-र्ध्न
-
-र्ध्ना
-
-र्ध्नु
-
-र्ध्नो
-
-र्ध्न्य
-
-र्ध्म
-
-र्ध्य
-
-र्ध्यं
-
-र्ध्या
-
-र्ध्ये
-
-र्ध्र
-
-र्ध्रु
-
-र्ध्व
-
-र्ध्वं
-
-र्ध्वा
-
-र्ध्वां
-
-र्ध्वीं
-
-र्ध्वे
-
-र्ध्वो
-
-र्ध॑
-
-र्ध॒
-
-	र्न
-
-र्नं
-
-र्ना
-
-र्नां
-
-र्नी
-
-र्नु
-
-र्नू
-
-र्नृ
-
-र्ने
-
-र्नै
-
-र्नॉ
-
-र्नो
-
-र्नौ
-
-र्न्
-
-र्न्ट
-
-र्न्त
-
-र्न्थे
-
-र्न्द
-
-र्न्न
-
-र्न्ना
-
-र्न्य
-
-र्न्या
-
-र्न्यू
-
-र्न्स
-
-र्न्स्ट
-
-	र्प
-
-र्पं
-
-र्पा
-
-र्पां
-
-र्पी
-
-र्पीं
-
-र्पु
-
-र्पू
-
-र्पे
-
-र्पें
-
-र्पै
-
-र्पो
-
-र्पों
-
-र्प्प
-
-र्प्य
-
-र्प्या
-
-र्प्र
-
-र्प्रा
-
-र्प्स
-
-र्प॑
-
-	र्फ
-
-र्फं
-
-र्फ़
-
-र्फ़ी
-
-र्फा
-
-र्फी
-
-र्फु
-
-र्फे
-
-र्फो
-
-र्फ्
-
-र्फ्यू
-
-र्फ्स
-
-	र्ब
-
-र्बं
-
-र्बा
-
-र्बां
-
-र्बा॒
-
-र्बी
-
-र्बु
-
-र्बू
-
-र्बृ
-
-र्बे
-
-र्बै
-
-र्बो
-
-र्ब्या
-
-र्ब्यु
-
-र्ब्र
-
-र्ब्रा
-
-र्ब्रू
-
-र्ब्स
-
-	र्भ
-
-र्भं
-
-र्भा
-
-र्भां
-
-र्भी
-
-र्भु
-
-र्भू
-
-र्भृ
-
-र्भे
-
-र्भै
-
-र्भो
-
-र्भों
-
-र्भौ
-
-र्भ्य
-
-र्भ्या
-
-र्भ्यां
-
-र्भ्यो
-
-र्भ्र
-
-र्भ्रा
-
-र्भ॑
-
-र्भ॒
-
-	र्म
-
-र्मं
-
-र्मा
-
-र्मां
-
-र्मा॑
-
-र्मा॒
-
-र्मि॒
-
-र्मी
-
-र्मीं
-
-र्मु
-
-र्मू
-
-र्मृ
-
-र्मॅ
-
-र्मॆ
-
-र्मे
-
-र्में
-
-र्मै
-
-र्मो
-
-र्मों
-
-र्मौ
-
-र्म्
-
-र्म्ड
-
-र्म्प
-
-र्म्म
-
-र्म्मा
-
-र्म्मु
-
-र्म्मे
-
-र्म्मो
-
-र्म्य
-
-र्म्यं
-
-र्म्या
-
-र्म्यु
-
-र्म्यू
-
-र्म्ये
-
-र्म्ले
-
-र्म्स
-
-र्म॑
-
-र्म॒
-
-	र्य
-
-र्यं
-
-र्यं॑
-
-र्यः॑
-
-र्या
-
-र्यां
-
-र्या॑
-
-र्या॒
-
-र्यी
-
-र्यु
-
-र्युं
-
-र्यू
-
-र्यू॑
-
-र्यॆ
-
-र्ये
-
-र्यें
-
-र्ये॑
-
-र्यै
-
-र्यॊ
-
-र्यो
-
-र्यों
-
-र्यो॑
-
-र्यो॒
-
-र्यौ
-
-र्यौँ
-
-र्यौं
-
-र्य्
-
-र्य्य
-
-र्य्यं
-
-र्य्या
-
-र्य्यां
-
-र्य्यु
-
-र्य्ये
-
-र्य्यै
-
-र्य्यो
-
-र्य॑
-
-र्य॒
-
-	र्र
-
-र्रा
-
-र्रां
-
-र्री
-
-र्रु
-
-र्रू
-
-र्रे
-
-र्रो
-
-र्रों
-
-र्र्
-
-र्र्या
-
-	र्ल
-
-र्लं
-
-र्ला
-
-र्लां
-
-र्ली
-
-र्लु
-
-र्लू
-
-र्ले
-
-र्लें
-
-र्लै
-
-र्लो
-
-र्लो॒
-
-र्लौ
-
-र्ल्
-
-र्ल्ट
-
-र्ल्ड
-
-र्ल्ड्
-
-र्ल्ड्स
-
-र्ल्या
-
-र्ल्ल
-
-र्ल्लो
-
-र्ल्स
-
-र्ल्स्
-
-	र्व
-
-र्वँ
-
-र्वं
-
-र्वं॑
-
-र्वा
-
-र्वाँ
-
-र्वां
-
-र्वा॑
-
-र्वा॒
-
-र्वि॒
-
-र्वी
-
-र्वीं
-
-र्वी॒
-
-र्वु
-
-र्वृ
-
-र्वॆ
-
-र्वे
-
-र्वें
-
-र्वे॑
-
-र्वे॒
-
-र्वै
-
-र्वै॑
-
-र्वॊ
-
-र्वो
-
-र्वों
-
-र्वो॒
-
-र्वौ
-
-र्व्
-
-र्व्य
-
-र्व्यं
-
-र्व्या
-
-र्व्यां
-
-र्व्यु
-
-र्व्यू
-
-र्व्ये
-
-र्व्यो
-
-र्व्र
-
-र्व्व
-
-र्व्वं
-
-र्व्वा
-
-र्व्वां
-
-र्व्वी
-
-र्व्वे
-
-र्व्वै
-
-र्व्वो
-
-र्व्ह
-
-र्व्हा
-
-र्व्हे
-
-र्व॑
-
-र्व॒
-
-	र्श
-
-र्शं
-
-र्शा
-
-र्शां
-
-र्शी
-
-र्शु
-
-र्शे
-
-र्शै
-
-र्शो
-
-र्शों
-
-र्शौ
-
-र्श्च
-
-र्श्य
-
-र्श्यं
-
-र्श्या
-
-र्श्र्व
-
-र्श्व
-
-र्श्वं
-
-र्श्वा
-
-र्श्वी
-
-र्श्वे
-
-र्श्वो
-
-र्श्वों
-
-	र्ष
-
-र्षं
-
-र्षा
-
-र्षां
-
-र्षी
-
-र्षीं
-
-र्षु
-
-र्षू
-
-र्षॆ
-
-र्षे
-
-र्षै
-
-र्षो
-
-र्षों
-
-र्षौ
-
-र्षौं
-
-र्ष्
-
-र्ष्ट
-
-र्ष्टा
-
-र्ष्ण
-
-र्ष्णं
-
-र्ष्णा
-
-र्ष्णे
-
-र्ष्म
-
-र्ष्मा
-
-र्ष्य
-
-र्ष्या
-
-र्ष्व
-
-	र्स
-
-र्सं
-
-र्सा
-
-र्सी
-
-र्सु
-
-र्से
-
-र्सै
-
-र्सो
-
-र्सों
-
-र्सौ
-
-र्स्
-
-र्स्क
-
-र्स्की
-
-र्स्ट
-
-र्स्टे
-
-र्स्था
-
-र्स्य
-
-र्स्या
-
-र्स्व
-
-र्स्वा
-
-	र्ह
-
-र्हं
-
-र्हा
-
-र्हां
-
-र्ही
-
-र्हीं
-
-र्हु
-
-र्हृ
-
-र्हे
-
-र्है
-
-र्हैं
-
-र्हो
-
-र्हौ
-
-र्ह्
-
-र्ह्य
-
-र्ह्या
-
-र्ह्ये
-
-र्ह्र
-
-र्ह्रा
-
-	र्ऽ
-
-	र्ा
-
-	र्ी
-
-	र्ु
-
-	र्ू
-
-	र्े
-
-र््ऋ॑
-
-र््ऋ॒
-
-र््यो
-
-र््श
-
-र््ष
-
-र््ह
-
-र््ह॑
-
-	र्ॐ
-
-	र्॒
-
-	र्‌
-
-र॑
-
-र॒
-
-	र॒॒
-
-रॢ
-
-ऱ
-
-ऱा
-
-ऱी
-
-ऱु
-
-ऱू
-
-ऱृ
-
-ऱे
-
-ऱो
-
-ऱ्ऋ॑
-
-ऱ्ठ्J
-
-	ऱ्थ
-
-ऱ्थ्
-
-ऱ्ध्
-
-	ऱ्प
-
-	ऱ्य
-
-ऱ्या
-
-ऱ्यां
-
-	ऱ्ष
-
-ऱ्षा
-
-ऱ्षि॑
-
-ऱ्ष॑
-
-ऱ्ष॒
-
-	ऱ्ह
-
-ऱ्हा
-
-ऱ्हि॑
-
-ऱ्हि॒
-
-ऱ्हे
-
-ऱ्हो
-
-ऱ्ह॑
-
-ल
-
-लँ
-
-लं
-
-	लं॑
-
-	लं॒
-
-ल़
-
-	लाॅ
-
-ला्य
-
-	ला॑
-
-	ला॒
-
-	लिे
-
-	लि॒
-
-लु
-
-	लुँ
-
-	लुं
-
-	लु॒
-
-लू
-
-	लूँ
-
-	लूं
-
-लृ
-
-लॄ
-
-लॅ
-
-	लॅं
-
-लॆ
-
-	लॆं
-
-ले
-
-	लेँ
-
-	लें
-
-	ले़
-
-	ले॑
-
-लै
-
-	लैँ
-
-	लैं
-
-लॊ
-
-लोँ॒
-
-	लो॑
-
-	लो॒
-
-ल्
-
-	ल्र
-
-ल्र्
-
-ल॑
-
-ल॒
-
-लॢ
-
-ळ
-
-ळं
-
-ळु
-
-	ळुं
-
-ळू
-
-	ळूं
-
-ळृ
-
-ळॅ
-
-ळॆ
-
-ळे
-
-	ळें
-
-ळै
-
-ळ्
-
-ळॢ
-
-ऴ
-
-ऴु
-
-ऴे
-
-ऴ्
-
-व
-
-वँ
-
-	वँ॑
-
-	वँ॒
-
-वं
-
-	वं॑
-
-	वं॒
-
-	वः॑
-
-	वः॒
-
-व़
-
-वाँ॑
-
-वाँ॒
-
-	वा॑
-
-	वा॒
-
-वि
-
-विँ॑
-
-विँ॒
-
-	वि॑
-
-	वि॒
-
-वि॒॒
-
-वीँ॒
-
-	वी॑
-
-	वी॒
-
-वु
-
-	वुं
-
-	वु॒
-
-वू
-
-	वूं
-
-वृ
-
-	वृँ
-
-	वृं
-
-	वृ॑
-
-	वृ॒
-
-वॄ
-
-वॅ
-
-वॆ
-
-वे
-
-	वेँ
-
-	वें
-
-	वे॑
-
-	वे॒
-
-वै
-
-	वैँ
-
-	वैं
-
-	वै॑
-
-	वै॒
-
-वॊ
-
-	वो॑
-
-	वो॒
-
-व्
-
-	व्र
-
-व्रं
-
-व्रु
-
-व्रू
-
-व्रे
-
-व्रै
-
-व्र्
-
-व्र॒
-
-व॑
-
-व॒
-
-	व॒॒
-
-श
-
-शँ
-
-शं
-
-	शं॒
-
-	शः॑
-
-	शः॒
-
-	श़्
-
-	शा॑
-
-	शा॒
-
-	शि॑
-
-	शि॒
-
-	शी॑
-
-	शी॒
-
-शु
-
-	शुं
-
-	शु॑
-
-	शु॒
-
-शू
-
-	शूं
-
-	शू॒
-
-शृ
-
-	शृं
-
-	शृ॑
-
-	शृ॒
-
-शॄ
-
-शॅ
-
-शॆ
-
-शे
-
-	शें
-
-	शे॑
-
-	शे॒
-
-शै
-
-	शैँ
-
-	शैं
-
-शॊ
-
-	शो॑
-
-	शो॒
-
-श्
-
-	श्र
-
-श्रं
-
-श्रा॑
-
-श्रि॒
-
-श्रु
-
-श्रुं
-
-श्रु॒
-
-श्रू
-
-श्रूं
-
-श्रृ
-
-श्रृं
-
-श्रॆ
-
-श्रे
-
-श्रै
-
-श्र्
-
-श्र॑
-
-श्र॒
-
-श॑
-
-श॒
-
-	श॒॒
-
-शॢ
-
-ष
-
-षँ
-
-षं
-
-	षं॑
-
-	षं॒
-
-	षः॑
-
-	षः॒
-
-ष़
-
-	ष़ु
-
-षां॑
-
-षां॒
-
-	षा॑
-
-	षा॒
-
-षा॒॒
-
-	षि॑
-
-	षि॒
-
-	षी॑
-
-	षी॒
-
-षु
-
-	षुं
-
-	षु॑
-
-	षु॒
-
-षू
-
-	षू॒
-
-षृ
-
-षॅ
-
-षॆ
-
-षे
-
-	षें
-
-	षे॑
-
-	षे॒
-
-षै
-
-षॊ
-
-	षो॑
-
-	षो॒
-
-ष्
-
-	ष्र
-
-ष्र्
-
-ष॑
-
-ष॒
-
-	ष॒॒
-
-षॢ
-
-स
-
-सँ
-
-सं
-
-	संं
-
-	सं॑
-
-	सं॒
-
-	सः॑
-
-	सः॒
-
-स़
-
-	स़ु
-
-	स़्
-
-सां॒
-
-साः॑
-
-सा्र
-
-	सा॑
-
-	सा॒
-
-	सि॑
-
-	सि॒
-
-सि॒॒
-
-	सी॑
-
-	सी॒
-
-सु
-
-	सुँ
-
-	सुं
-
-	सु॑
-
-	सु॒
-
-सू
-
-	सूँ
-
-	सूं
-
-	सू॑
-
-	सू॒
-
-सृ
-
-	सृं
-
-	सृ॑
-
-	सृ॒
-
-सॄ
-
-सॅ
-
-सॆ
-
-	सॆं
-
-से
-
-	सें
-
-	से॑
-
-	से॒
-
-सै
-
-	सैँ
-
-	सैं
-
-	सै॒
-
-सॊ
-
-	सो॑
-
-	सो॒
-
-	सौ॑
-
-	सौ॒
-
-स्
-
-	स्र
-
-स्रं
-
-स्रा॒
-
-स्रु
-
-स्रु॒
-
-स्रे
-
-स्रै
-
-स्र्
-
-स्र॑
-
-स्र॒
-
-स॑
-
-स॒
-
-	स॒॒
-
-सॢ
-
-ह
-
-हँ
-
-	हँु
-
-हं
-
-	हः॑
-
-	हाॅ
-
-	हा॑
-
-	हा॒
-
-	हि॑
-
-	हि॒
-
-	ही॒
-
-हु
-
-	हुँ
-
-	हुं
-
-	हुॅ
-
-	हु॑
-
-	हु॒
-
-हू
-
-	हूँ
-
-	हूं
-
-	हू॑
-
-	हू॒
-
-हृ
-
-	हृ॑
-
-	हृ॒
-
-हॄ
-
-हॅ
-
-	हॅू
-
-हॆ
-
-हे
-
-	हेँ
-
-	हें
-
-	हे॑
-
-	हे॒
-
-है
-
-	हैँ
-
-	हैं
-
-	है॒
-
-हॊ
-
-हो्द
-
-	हो॑
-
-	हो॒
-
-ह्
-
-	ह्ण
-
-ह्णं
-
-ह्णा॒
-
-ह्णी॒
-
-ह्णू
-
-ह्णे
-
-ह्ण्
-
-	ह्न
-
-ह्नं
-
-ह्नु
-
-ह्नू
-
-ह्ने
-
-ह्नै
-
-ह्न्
-
-	ह्म
-
-ह्मं
-
-ह्मे
-
-ह्मै
-
-ह्म्
-
-ह्म॑
-
-ह्म॒
-
-	ह्य
-
-ह्यं
-
-ह्या॑
-
-ह्यु
-
-ह्युं
-
-ह्यू
-
-ह्यृ
-
-ह्ये
-
-ह्ये॑
-
-ह्यै
-
-ह्य्
-
-ह्य॑
-
-ह्य॒
-
-	ह्र
-
-ह्रं
-
-ह्रि॒
-
-ह्रु
-
-ह्रू
-
-ह्रूं
-
-ह्रृ
-
-ह्रे
-
-ह्रै
-
-ह्र्
-
-	ह्ल
-
-ह्ले
-
-ह्ल्
-
-	ह्व
-
-ह्वं
-
-ह्वा॑
-
-ह्वृ
-
-ह्वे
-
-ह्वै
-
-ह्व्
-
-ह्व॑
-
-ह॑
-
-ह॒
-
-हॢ
-
-ऺ
-
-़
-
-ऽ
-
-ऽं
-
-ा
-
-ाँ
-
-ां
-
-ि
-
-ी
-
-ीँ
-
-ीं
-
-ु
-
-ू
-
-ृ
-
-ॄ
-
-ॅ
-
-ॆ
-
-े
-
-ै
-
-ॉ
-
-ॉँ
-
-ॉं
-
-ॊ
-
-ो
-
-ोँ
-
-ों
-
-ौ
-
-ौँ
-
-ौं
-
-्
-
-्द
-
-्य
-
-्र
-
-्व
-
-ॐ
-
-॑
-
-॒
-
-॓
-
-क़
-
-ख़
-
-ग़
-
-ज़
-
-ड़
-
-ड़े
-
-ढ़
-
-फ़
-
-य़
-
-ॠ
-
-ॡ
-
-ॣ
-
-।
-
-॥
-
-०
-
-१
-
-२
-
-३
-
-४
-
-५
-
-६
-
-७
-
-८
-
-९
-
-॰
-
-॰़
-
-॰ु
-
-ॲ
-
-ঁ
-
-ং
-
-ংঃ
-
-ঃ
-
-ঃঃ
-
-অ
-
-অঁ
-
-	অ্য
-
-অ‌
-
-আ
-
-আঁ
-
-	আ্য
-
-ই
-
-ইঁ
-
-ই্
-
-ঈ
-
-উ
-
-উঁ
-
-উ্ত্‍
-
-	উ্য
-
-ঊ
-
-ঋ
-
-ঌ
-
-এ
-
-এঁ
-
-	এ্য
-
-এ‌
-
-ঐ
-
-ও
-
-ওঁ
-
-	ও্য
-
-ঔ
-
-ঔঁ
-
-ক
-
-কঁ
-
-কু
-
-	কুঁ
-
-কূ
-
-কৃ
-
-কৃ্ত
-
-কৄ
-
-ক্
-
-	ক্ক
-
-ক্কু
-
-ক্ক্বু
-
-ক্ক্র
-
-	ক্খ
-
-	ক্চ
-
-	ক্জ
-
-	ক্ট
-
-ক্টু
-
-ক্ট্র
-
-ক্ট্স
-
-ক্ট্ৰ
-
-	ক্ড
-
-	ক্ত
-
-ক্তু
-
-ক্তৃ
-
-ক্ত্ব
-
-ক্ত্র
-
-ক্ত্র্র
-
-ক্ত্ৰ
-
-	ক্থ
-
-	ক্ন
-
-	ক্ফ
-
-	ক্ব
-
-ক্বু
-
-ক্ব্র
-
-	ক্ভ
-
-	ক্ম
-
-ক্মু
-
-ক্ম্র
-
-ক্য্র
-
-	ক্র
-
-ক্রু
-
-ক্রূ
-
-ক্রৃ
-
-ক্র্য
-
-ক্র্র
-
-	ক্ল
-
-ক্লু
-
-ক্ল্
-
-ক্ল্র
-
-	ক্ষ
-
-ক্ষু
-
-ক্ষূ
-
-ক্ষ্
-
-ক্ষ্ণ
-
-ক্ষ্ণ্র
-
-ক্ষ্ন
-
-ক্ষ্ব
-
-ক্ষ্বু
-
-ক্ষ্ব্র
-
-ক্ষ্ম
-
-ক্ষ্ম্র
-
-ক্ষ্য্র
-
-ক্ষ্র
-
-	ক্স
-
-ক্সু
-
-ক্স্
-
-ক্স্ট
-
-ক্স্র
-
-	ক্ৰ
-
-ক্ৰু
-
-ক্ৰূ
-
-ক্ৰ্য
-
-	ক্‌
-
-কৢ
-
-ক‌
-
-খ
-
-খঁ
-
-	খঁু
-
-খ়
-
-	খ়্
-
-খু
-
-	খুঁ
-
-খু্ব
-
-খূ
-
-খৃ
-
-খ্
-
-	খ্ট
-
-	খ্ত
-
-	খ্ম
-
-খ্য্র
-
-	খ্র
-
-খ্র্র
-
-	খ্ল
-
-	খ্স
-
-	খ্ৰ
-
-খ্ৰু
-
-	খ্‌
-
-গ
-
-গঁ
-
-গ়
-
-গু
-
-	গুঁ
-
-গূ
-
-গৃ
-
-গৄ
-
-গ্
-
-	গ্গ
-
-	গ্জ
-
-	গ্ঞ
-
-	গ্ণ
-
-গ্ণ্র
-
-	গ্ধ
-
-গ্ধু
-
-গ্ধ্র
-
-	গ্ন
-
-গ্নু
-
-গ্ন্য্র
-
-গ্ন্র
-
-	গ্ব
-
-গ্ব্র
-
-	গ্ম
-
-গ্ম্র
-
-গ্য্র
-
-	গ্র
-
-গ্রঁ
-
-গ্রু
-
-গ্র্য
-
-গ্র্র
-
-	গ্ল
-
-গ্লু
-
-গ্ল্
-
-গ্ল্র
-
-	গ্স
-
-	গ্ৰ
-
-গ্ৰু
-
-গ্ৰ্য
-
-গ্ৰ্হ
-
-	গ্‌
-
-গ‌
-
-ঘ
-
-ঘঁ
-
-ঘু
-
-	ঘুঁ
-
-ঘূ
-
-ঘৃ
-
-	ঘ্ট
-
-	ঘ্ন
-
-ঘ্ন্র
-
-ঘ্য্র
-
-	ঘ্র
-
-ঘ্র্র
-
-	ঘ্ৰ
-
-ঙ
-
-ঙু
-
-ঙ্
-
-	ঙ্ক
-
-ঙ্কু
-
-ঙ্কৃ
-
-ঙ্ক্ত
-
-ঙ্ক্য্র
-
-ঙ্ক্র
-
-ঙ্ক্ষ
-
-ঙ্ক্ষু
-
-ঙ্ক্ষ্র
-
-	ঙ্খ
-
-ঙ্খ্র
-
-	ঙ্গ
-
-ঙ্গঁ
-
-ঙ্গু
-
-ঙ্গ্য্র
-
-ঙ্গ্র
-
-ঙ্ঘ্য্র
-
-ঙ্ঘ্র
-
-ঙ্ঘ্র্র
-
-	ঙ্ম
-
-ঙ্মু
-
-ঙ্ম্র
-
-	ঙ্‌
-
-চ
-
-চঁ
-
-চু
-
-	চুঁ
-
-চূ
-
-	চূঁ
-
-চৃ
-
-চ্
-
-	চ্আ
-
-	চ্ক
-
-	চ্চ
-
-চ্চু
-
-চ্চ্র
-
-	চ্ছ
-
-চ্ছু
-
-চ্ছৃ
-
-চ্ছ্ব
-
-চ্ছ্বু
-
-চ্ছ্ব্র
-
-চ্ছ্র
-
-চ্ছ্রু
-
-চ্ছ্র্র
-
-চ্ছ্ৰ
-
-চ্ছ্‌
-
-	চ্ঞ
-
-চ্ঞু
-
-চ্ঞ্র
-
-চ্য্র
-
-	চ্র
-
-	চ্‌
-
-ছ
-
-ছঁ
-
-ছু
-
-	ছুঁ
-
-ছূ
-
-ছ্
-
-	ছ্ত
-
-	ছ্র
-
-	ছ্ল
-
-	ছ্‌
-
-জ
-
-জঁ
-
-জ়
-
-	জ়্
-
-জু
-
-	জুঁ
-
-জূ
-
-জ্
-
-	জ্গ
-
-	জ্জ
-
-জ্জু
-
-জ্জ্ব
-
-জ্জ্ব্র
-
-জ্জ্র
-
-	জ্ঝ
-
-জ্ঝ্র
-
-	জ্ঞ
-
-জ্ঞু
-
-জ্ঞ্র
-
-	জ্ড
-
-	জ্ন
-
-	জ্ব
-
-জ্বু
-
-জ্ব্র
-
-	জ্ম
-
-জ্য়
-
-জ্য্র
-
-	জ্র
-
-জ্রু
-
-জ্র্র
-
-	জ্ৰ
-
-	জ্‌
-
-ঝ
-
-ঝঁ
-
-ঝ়
-
-ঝু
-
-	ঝুঁ
-
-	ঝ্র
-
-ঞ
-
-ঞঁ
-
-ঞু
-
-ঞ্
-
-	ঞ্চ
-
-ঞ্চু
-
-ঞ্চ্র
-
-	ঞ্ছ
-
-ঞ্ছু
-
-ঞ্ছ্র
-
-	ঞ্জ
-
-ঞ্জু
-
-ঞ্জ্র
-
-	ঞ্ঝ
-
-ঞ্ঝু
-
-ঞ্ঝ্র
-
-ট
-
-টঁ
-
-টু
-
-টূ
-
-টৃ
-
-ট্
-
-	ট্ও
-
-	ট্চ
-
-ট্চ্
-
-	ট্ছ
-
-	ট্জ
-
-ট্জ্র
-
-	ট্ট
-
-ট্টু
-
-ট্ট্র
-
-	ট্ঠ
-
-	ট্ব
-
-ট্ব্র
-
-	ট্ম
-
-ট্ম্র
-
-ট্য্র
-
-	ট্র
-
-ট্রু
-
-ট্র্য
-
-ট্র্র
-
-	ট্ল
-
-	ট্স
-
-ট্স্
-
-ট্স্ক
-
-	ট্ৰ
-
-ট্ৰু
-
-	ট্‌
-
-ঠ
-
-ঠু
-
-	ঠ্র
-
-ড
-
-ডঁ
-
-ড়
-
-	ড়ঁ
-
-	ড়ু
-
-	ড়ূ
-
-ড়্গ
-
-ড়্র
-
-ডু
-
-ড্
-
-	ড্ড
-
-ড্ডু
-
-ড্ড্র
-
-	ড্থ
-
-	ড্ব
-
-	ড্ম
-
-ড্য্র
-
-	ড্র
-
-ড্রু
-
-ড্রূ
-
-ড্র্র
-
-	ড্ল
-
-	ড্স
-
-	ড্ৰ
-
-	ড্‌
-
-ঢ
-
-ঢঁ
-
-ঢ়
-
-	ঢ়ু
-
-ঢ়্র
-
-ঢু
-
-	ঢুঁ
-
-ঢ্য্র
-
-	ঢ্র
-
-ঢ্র্র
-
-ণ
-
-ণু
-
-ণূ
-
-ণ্
-
-	ণ্চ
-
-	ণ্ট
-
-ণ্টু
-
-ণ্ট্র
-
-ণ্ট্ৰ
-
-ণ্ট্‌
-
-	ণ্ঠ
-
-ণ্ঠু
-
-ণ্ঠ্র
-
-	ণ্ড
-
-ণ্ডু
-
-ণ্ডূ
-
-ণ্ড্য্র
-
-ণ্ড্র
-
-ণ্ড্রু
-
-ণ্ড্র্র
-
-ণ্ড্ৰ
-
-ণ্ড্ৰু
-
-	ণ্ঢ
-
-ণ্ঢ্র
-
-	ণ্ণ
-
-	ণ্ত
-
-ণ্ত্র
-
-	ণ্থ
-
-	ণ্ন
-
-ণ্ন্র
-
-	ণ্ব
-
-ণ্ব্র
-
-	ণ্ম
-
-ণ্ম্র
-
-ণ্য্র
-
-	ণ্র
-
-	ণ্স
-
-	ণ্‌
-
-ত
-
-তঁ
-
-তু
-
-	তুঁ
-
-তু্ল
-
-তূ
-
-তৃ
-
-তৄ
-
-ত্
-
-	ত্ক
-
-ত্কৃ
-
-ত্ক্ষ
-
-	ত্খ
-
-ত্গু
-
-	ত্চ
-
-	ত্জ
-
-	ত্ত
-
-ত্তু
-
-ত্তূ
-
-ত্ত্ব
-
-ত্ত্ব্র
-
-ত্ত্র
-
-	ত্থ
-
-ত্থু
-
-ত্থ্র
-
-	ত্ধ
-
-	ত্ন
-
-ত্নু
-
-ত্ন্র
-
-	ত্প
-
-ত্পু
-
-	ত্ব
-
-ত্ব্ব
-
-	ত্ম
-
-ত্মৃ
-
-ত্ম্য্র
-
-ত্ম্র
-
-ত্য়
-
-ত্য্র
-
-	ত্র
-
-ত্রু
-
-ত্রূ
-
-ত্রৃ
-
-ত্র্
-
-ত্র্য
-
-ত্র্র
-
-	ত্ল
-
-	ত্স
-
-ত্সু
-
-ত্সৃ
-
-ত্স্
-
-ত্স্ন
-
-	ত্ৰ
-
-ত্ৰু
-
-ত্ৰূ
-
-ত্ৰ্য
-
-ত্ৰ্ৰ
-
-	ত্‌
-
-	ত্‍
-
-থ
-
-থঁ
-
-থ়
-
-থু
-
-থূ
-
-থ্
-
-	থ্থ
-
-	থ্ন
-
-	থ্ব
-
-থ্ব্র
-
-থ্য্র
-
-	থ্র
-
-থ্রু
-
-থ্র্র
-
-	থ্ল
-
-	থ্ৰ
-
-থ্ৰু
-
-	থ্‌
-
-দ
-
-দঁ
-
-দ়
-
-দু
-
-দূ
-
-দৃ
-
-দৄ
-
-দ্
-
-	দ্গ
-
-দ্গু
-
-দ্গ্র
-
-দ্ঘ্র
-
-দ্দ্ব
-
-দ্দ্ব্র
-
-দ্দ্র
-
-	দ্ধ
-
-দ্ধু
-
-দ্ধৃ
-
-দ্ধ্র
-
-	দ্ন
-
-	দ্ব
-
-দ্বু
-
-দ্বৃ
-
-দ্ব্র
-
-	দ্ভ
-
-দ্ভু
-
-দ্ভূ
-
-দ্ভৃ
-
-দ্ভ্র
-
-	দ্ম
-
-দ্ম্র
-
-দ্য়
-
-দ্য্র
-
-	দ্র
-
-দ্রু
-
-দ্রূ
-
-দ্র্য
-
-দ্র্র
-
-	দ্স
-
-	দ্ৰ
-
-দ্ৰু
-
-দ্ৰূ
-
-দ্ৰ্য
-
-	দ্ৱ
-
-	দ্‌
-
-দ‌
-
-দ‌্য
-
-ধ
-
-ধঁ
-
-ধু
-
-	ধুঁ
-
-ধূ
-
-	ধূঁ
-
-ধৃ
-
-ধৄ
-
-	ধ্ধ
-
-	ধ্ন
-
-ধ্ন্র
-
-	ধ্ব
-
-ধ্ব্র
-
-	ধ্ম
-
-ধ্ম্র
-
-ধ্য্র
-
-	ধ্র
-
-ধ্রু
-
-ধ্র্র
-
-	ধ্ৰ
-
-ধ্ৰু
-
-ধ্ৰূ
-
-ন
-
-নঁ
-
-নু
-
-নু্য
-
-নু্ষ্ঠ
-
-নু্হ
-
-নূ
-
-নৃ
-
-ন্
-
-	ন্ক
-
-	ন্খ
-
-ন্গু
-
-	ন্চ
-
-	ন্জ
-
-ন্জু
-
-	ন্ট
-
-ন্টু
-
-ন্ট্
-
-ন্ট্র
-
-ন্ট্স
-
-ন্ট্ৰ
-
-	ন্ঠ
-
-ন্ঠু
-
-ন্ঠ্র
-
-	ন্ড
-
-ন্ডু
-
-ন্ড্
-
-ন্ড্র
-
-ন্ড্রু
-
-ন্ড্ল
-
-ন্ড্স
-
-ন্ড্ৰ
-
-	ন্ত
-
-ন্তু
-
-ন্তূ
-
-ন্তৃ
-
-ন্ত্
-
-ন্ত্ত
-
-ন্ত্তু
-
-ন্ত্ব
-
-ন্ত্ব্র
-
-ন্ত্য্র
-
-ন্ত্র
-
-ন্ত্রু
-
-ন্ত্র্য
-
-ন্ত্র্র
-
-ন্ত্ৰ
-
-	ন্থ
-
-ন্থু
-
-ন্থ্র
-
-ন্দ্ব
-
-ন্দ্ব্ব
-
-ন্দ্ব্র
-
-ন্দ্য্র
-
-ন্দ্র
-
-ন্দ্র্
-
-ন্দ্র্র
-
-	ন্ধ
-
-ন্ধু
-
-ন্ধ্য্র
-
-ন্ধ্র
-
-ন্ধ্র্র
-
-ন্ধ্ৰ
-
-	ন্ন
-
-ন্নু
-
-ন্ন্র
-
-	ন্প
-
-	ন্ফ
-
-	ন্ব
-
-ন্বু
-
-ন্বৃ
-
-ন্ব্র
-
-	ন্ম
-
-ন্মু
-
-ন্মূ
-
-ন্ম্র
-
-ন্য়
-
-ন্য্র
-
-	ন্র
-
-	ন্ল
-
-ন্শ্ট
-
-ন্ষ্ট
-
-	ন্স
-
-ন্সু
-
-ন্স্
-
-ন্স্ক
-
-ন্স্ট
-
-ন্স্র
-
-ন্স্ল
-
-	ন্ৎ
-
-	ন্‌
-
-প
-
-পঁ
-
-পু
-
-	পুঁ
-
-পু্ত্ৰ
-
-পু্র
-
-পূ
-
-	পূঁ
-
-পূ্ব
-
-পৃ
-
-পৄ
-
-প্
-
-	প্ট
-
-প্টু
-
-প্ট্র
-
-	প্ত
-
-প্তু
-
-প্ত্র
-
-	প্থ
-
-	প্ন
-
-প্নু
-
-প্ন্র
-
-	প্প
-
-প্পু
-
-প্প্র
-
-	প্ফ
-
-	প্ব
-
-প্য্র
-
-	প্র
-
-প্রু
-
-প্র্য
-
-প্র্র
-
-	প্ল
-
-প্লু
-
-প্ল্র
-
-	প্স
-
-প্সু
-
-প্স্
-
-প্স্র
-
-	প্ৎ
-
-	প্ৰ
-
-প্ৰু
-
-প্ৰ্ত
-
-প্ৰ্য়
-
-প্ৰ্স
-
-	প্‌
-
-ফ
-
-ফঁ
-
-ফ়
-
-ফু
-
-	ফুঁ
-
-ফূ
-
-ফৃ
-
-ফ্
-
-ফ্ক্ব
-
-	ফ্ট
-
-	ফ্ত
-
-	ফ্ফ
-
-	ফ্র
-
-ফ্রঁ
-
-ফ্রু
-
-ফ্র্য
-
-ফ্র্র
-
-	ফ্ল
-
-ফ্লু
-
-ফ্ল্র
-
-	ফ্স
-
-	ফ্ৰ
-
-	ফ্‌
-
-ব
-
-বঁ
-
-বু
-
-	বুঁ
-
-বূ
-
-বৃ
-
-বৄ
-
-বে
-
-ব্
-
-	ব্জ
-
-ব্জ্র
-
-ব্দ্ধ
-
-ব্দ্র
-
-	ব্ধ
-
-ব্ধ্র
-
-	ব্ন
-
-	ব্ব
-
-ব্বু
-
-ব্ব্র
-
-ব্য়
-
-ব্য্ক্ত
-
-ব্য্র
-
-	ব্র
-
-ব্রু
-
-ব্রূ
-
-ব্রৃ
-
-ব্র্য
-
-ব্র্র
-
-	ব্ল
-
-ব্লঁ
-
-ব্লু
-
-ব্ল্
-
-ব্ল্র
-
-	ব্স
-
-	ব্ৰ
-
-ব্ৰু
-
-ব্ৰ্য
-
-ব্ৰ্হ্ম
-
-	ব্ৱ
-
-	ব্‌
-
-ব‌
-
-ভ
-
-ভঁ
-
-ভ়
-
-	ভ়্
-
-ভু
-
-	ভুঁ
-
-ভূ
-
-	ভূঁ
-
-ভৃ
-
-ভ্
-
-	ভ্চ
-
-	ভ্ন
-
-ভ্য্র
-
-	ভ্র
-
-ভ্রু
-
-ভ্রূ
-
-ভ্রৃ
-
-ভ্র্
-
-ভ্র্র
-
-	ভ্ল
-
-	ভ্স
-
-ভ্স্ক
-
-	ভ্ৰ
-
-ভ্ৰু
-
-ভ্ৰূ
-
-	ভ্‌
-
-ম
-
-মঁ
-
-মু
-
-মূ
-
-মূ্হ
-
-মৃ
-
-মৄ
-
-ম্
-
-	ম্ক
-
-ম্গ্ৰ
-
-	ম্চ
-
-	ম্ছ
-
-	ম্ড
-
-	ম্ত
-
-	ম্থ
-
-ম্থ্র
-
-	ম্ন
-
-ম্নু
-
-ম্ন্র
-
-	ম্প
-
-ম্পু
-
-ম্পূ
-
-ম্পৃ
-
-ম্প্র
-
-ম্প্রু
-
-ম্প্র্র
-
-ম্প্ল
-
-ম্প্স
-
-ম্প্ৰ
-
-	ম্ফ 
-
-ম্ফু 
-
-ম্ফ্র 
-
-	ম্ব 
-
-ম্বু 
-
-ম্বূ 
-
-ম্বৃ 
-
-ম্ব্র 
-
-ম্ব্ল 
-
-ম্ব্ৰ 
-
-	ম্ভ 
-
-ম্ভু 
-
-ম্ভূ 
-
-ম্ভৃ 
-
-ম্ভ্র 
-
-ম্ভ্রু 
-
-ম্ভ্র্র 
-
-ম্ভ্ৰ 
-
-	ম্ম 
-
-ম্মু 
-
-ম্মূ 
-
-ম্মৃ 
-
-ম্ম্র 
-
-ম্য্র 
-
-	ম্র 
-
-ম্র্র 
-
-	ম্ল 
-
-ম্ল্র 
-
-	ম্স 
-
-ম্স্ক 
-
-	ম্ৰ 
-
-	ম্‌ 
-
-ম‌ 
-
-য 
-
-যঁ 
-
-য় 
-
-	য়ঁ 
-
-	য়ু 
-
-	য়ূ 
-
-	য়ৃ 
-
-	য়্ 
-
-য়্ক 
-
-য়্ণ 
-
-য়্ত 
-
-য়্ন 
-
-য়্ম 
-
-য়্য় 
-
-য়্র 
-
-যু 
-
-	যুঁ 
-
-যু্ক্ত 
-
-যু্দ্ধ 
-
-যূ 
-
-যৃ 
-
-য্ 
-
-য্য্র 
-
-	য্র 
-
-র 
-
-রঁ 
-
-র় 
-
-রু 
-
-রূ 
-
-রৃ 
-
-র্ 
-
-	র্ক 
-
-র্কু 
-
-র্ক্ত 
-
-র্ক্য 
-
-র্ক্যু 
-
-র্ক্য্র 
-
-র্ক্র 
-
-র্ক্ল 
-
-র্ক্স 
-
-	র্খ 
-
-র্খু 
-
-র্খ্য 
-
-র্খ্যু 
-
-র্খ্য্র 
-
-র্খ্র 
-
-	র্গ 
-
-র্গু 
-
-র্গ্য 
-
-র্গ্যু 
-
-র্গ্য্র 
-
-র্গ্র 
-
-	র্ঘ 
-
-র্ঘু 
-
-র্ঘ্য 
-
-র্ঘ্যু 
-
-র্ঘ্য্র 
-
-র্ঘ্র 
-
-	র্ঙ 
-
-র্ঙ্য 
-
-	র্চ 
-
-র্চু 
-
-র্চ্চ 
-
-র্চ্য 
-
-র্চ্যু 
-
-র্চ্য্র 
-
-র্চ্র 
-
-	র্ছ 
-
-র্ছ্য 
-
-র্ছ্য্র 
-
-র্ছ্র 
-
-	র্জ 
-
-র্জু 
-
-র্জ্জ 
-
-র্জ্ঞ 
-
-র্জ্য 
-
-র্জ্য্র 
-
-র্জ্র 
-
-	র্ঝ 
-
-র্ঝ্য 
-
-র্ঝ্য্র 
-
-র্ঝ্র 
-
-	র্ঞ 
-
-র্ঞ্য 
-
-	র্ট 
-
-র্টু 
-
-র্ট্ 
-
-র্ট্ছ 
-
-র্ট্য 
-
-র্ট্য্র 
-
-র্ট্র 
-
-র্ট্স 
-
-	র্ঠ 
-
-র্ঠ্য 
-
-র্ঠ্য্র 
-
-র্ঠ্র!
-
-	র্ড!
-
-র্ড়!
-
-র্ড়্য!
-
-র্ড্য!
-
-র্ড্য্র!
-
-	র্ঢ!
-
-র্ঢ়!
-
-র্ঢ়্য!
-
-র্ঢ্য!
-
-র্ঢ্য্র!
-
-	র্ণ!
-
-র্ণ্য!
-
-র্ণ্য্র!
-
-র্ণ্র!
-
-	র্ত!
-
-র্তু!
-
-র্তৃ!
-
-র্ত্ত!
-
-র্ত্য!
-
-র্ত্য্র!
-
-র্ত্র!
-
-র্ত্র্!
-
-	র্থ!
-
-র্থু!
-
-র্থ্য!
-
-র্থ্য্র!
-
-র্থ্র!
-
-	র্দ!
-
-র্দু!
-
-র্দূ!
-
-র্দৃ!
-
-র্দ্দ!
-
-র্দ্ধ!
-
-র্দ্ব!
-
-র্দ্য!
-
-র্দ্য্র!
-
-র্দ্র!
-
-	র্ধ!
-
-র্ধ্ব!
-
-র্ধ্য!
-
-র্ধ্য্র!
-
-র্ধ্র!
-
-	র্ন!
-
-র্নু!
-
-র্ন্ড!
-
-র্ন্ত!
-
-র্ন্য!
-
-র্ন্য্র!
-
-র্ন্র!
-
-র্ন্স!
-
-	র্প!
-
-র্পু!
-
-র্পূ!
-
-র্প্য!
-
-র্প্য্র!
-
-র্প্র!
-
-	র্ফ!
-
-র্ফু!
-
-র্ফ্য!
-
-র্ফ্যু!
-
-র্ফ্য্র!
-
-র্ফ্র!
-
-	র্ব!
-
-র্বু!
-
-র্বৃ!
-
-র্ব্ব!
-
-র্ব্য!
-
-র্ব্য্র!
-
-র্ব্র!
-
-	র্ভ!
-
-র্ভু!
-
-র্ভূ!
-
-র্ভ্য!
-
-র্ভ্যু!
-
-র্ভ্য্র!
-
-র্ভ্র!
-
-	র্ম!
-
-র্মু!
-
-র্মূ!
-
-র্ম্প!
-
-র্ম্ম!
-
-র্ম্য!
-
-র্ম্য্র!
-
-র্ম্র!
-
-	র্য!
-
-র্য়!
-
-র্য়্য!
-
-র্যু!
-
-র্য্য!
-
-র্য্যু!
-
-র্য্য্র!
-
-র্য্র!
-
-	র্র!
-
-	র্ল!
-
-র্লু!
-
-র্ল্ড!
-
-র্ল্য!
-
-র্ল্য্র!
-
-র্ল্র!
-
-	র্শ!
-
-র্শু!
-
-র্শ্ব!
-
-র্শ্য!
-
-র্শ্যু!
-
-র্শ্য্র!
-
-র্শ্র!
-
-	র্ষ!
-
-র্ষু!
-
-র্ষ্ট!
-
-র্ষ্য!
-
-র্ষ্য্র!
-
-র্ষ্র!
-
-	র্স!
-
-র্সু!
-
-র্সূ!
-
-র্স্!
-
-র্স্ক!
-
-র্স্ট!
-
-র্স্য!
-
-র্স্য্র!
-
-র্স্র!
-
-	র্হ!
-
-র্হ্য!
-
-র্হ্য্র!
-
-র্হ্র!
-
-	র্ৎ!
-
-ল!
-
-লঁ"
-
-লু"
-
-লূ"
-
-লৃ"
-
-ল্"
-
-	ল্ক"
-
-ল্ক্র"
-
-	ল্খ"
-
-	ল্গ"
-
-ল্গু"
-
-ল্গ্র"
-
-	ল্ছ"
-
-	ল্জ"
-
-	ল্ট"
-
-ল্টু"
-
-ল্ট্"
-
-ল্ট্চু"
-
-ল্ট্র"
-
-	ল্ড"
-
-ল্ডু"
-
-ল্ড্র"
-
-ল্ড্স"
-
-	ল্ত"
-
-	ল্থ"
-
-ল্দ্স"
-
-	ল্ধ"
-
-ল্ধ্র"
-
-	ল্প"
-
-ল্পু"
-
-ল্প্র"
-
-	ল্ফ"
-
-ল্ফ্"
-
-	ল্ব"
-
-ল্বু"
-
-ল্ব্র"
-
-	ল্ভ"
-
-ল্ভু"
-
-ল্ভ্র"
-
-	ল্ম"
-
-ল্মু"
-
-ল্ম্"
-
-ল্ম্র"
-
-ল্ম্স"
-
-ল্য়"
-
-ল্য্র"
-
-	ল্র"
-
-	ল্ল"
-
-ল্লু"
-
-ল্ল্র"
-
-	ল্স"
-
-ল্স্"
-
-ল্স্ট"
-
-ল্স্ত"
-
-	ল্ৎ"
-
-	ল্‌"
-
-ল‌"
-
-শ"
-
-শঁ"
-
-শু"
-
-	শুঁ"
-
-শূ"
-
-শৃ"
-
-শ্"
-
-	শ্ক"
-
-	শ্চ"
-
-শ্চু"
-
-শ্চূ"
-
-শ্চৃ"
-
-শ্চ্র"
-
-	শ্ছ"
-
-	শ্ট"
-
-	শ্ঠ"
-
-	শ্ত"
-
-শ্তু"
-
-শ্ত্র"
-
-	শ্ন"
-
-শ্নু"
-
-শ্নূ"
-
-শ্ন্র"
-
-	শ্প"
-
-	শ্ব"
-
-শ্বু"
-
-শ্ব্ব"
-
-শ্ব্র"
-
-	শ্ম"
-
-শ্মু"
-
-শ্মৃ"
-
-শ্ম্র"
-
-শ্য্র"
-
-	শ্র"
-
-শ্রু"
-
-শ্রূ"
-
-শ্র্য"
-
-শ্র্র"
-
-	শ্ল"
-
-শ্লু"
-
-শ্ল্র"
-
-	শ্ৎ"
-
-	শ্ৰ"
-
-শ্ৰু"
-
-শ্ৰূ"
-
-	শ্ৱ"
-
-শ‌"
-
-ষ"
-
-ষু"
-
-ষূ"
-
-ষ্"
-
-	ষ্ক"
-
-ষ্কু"
-
-ষ্কৃ"
-
-ষ্ক্র"
-
-ষ্ক্র্র"
-
-ষ্ক্ৰ"
-
-	ষ্খ"
-
-	ষ্ঞ"
-
-	ষ্ট"
-
-ষ্টু"
-
-ষ্ট্"
-
-ষ্ট্ব"
-
-ষ্ট্য্র"
-
-ষ্ট্র"
-
-ষ্ট্ৰ"
-
-ষ্ট্ৰু"
-
-	ষ্ঠ"
-
-ষ্ঠু"
-
-ষ্ঠ্য্র"
-
-	ষ্ণ"
-
-ষ্ণু"
-
-	ষ্প#
-
-ষ্পু#
-
-ষ্পৃ#
-
-ষ্প্র#
-
-ষ্প্ৰ#
-
-	ষ্ফ#
-
-ষ্ফু#
-
-ষ্ফূ#
-
-ষ্ফ্র#
-
-	ষ্ব#
-
-ষ্বু#
-
-	ষ্ম#
-
-	ষ্র#
-
-স#
-
-সঁ#
-
-সু#
-
-	সুঁ#
-
-সু্গ্ৰ#
-
-সু্য#
-
-সূ#
-
-	সূঁ#
-
-সৃ#
-
-সৄ#
-
-স্#
-
-	স্আ#
-
-	স্ক#
-
-স্কু#
-
-স্কূ#
-
-স্কৃ#
-
-স্ক্র#
-
-স্ক্রু#
-
-স্ক্রৃ#
-
-স্ক্র্য#
-
-স্ক্ল#
-
-স্ক্ৰ#
-
-স্ক্ৰু#
-
-	স্খ#
-
-	স্চ#
-
-	স্জ#
-
-	স্ট#
-
-স্টু#
-
-স্ট্#
-
-স্ট্র#
-
-স্ট্রু#
-
-স্ট্র্য#
-
-স্ট্র্র#
-
-স্ট্ল#
-
-স্ট্স#
-
-স্ট্ৰ#
-
-	স্ঠ#
-
-	স্ড#
-
-	স্ত#
-
-স্তু#
-
-স্তূ#
-
-স্তৃ#
-
-স্ত্#
-
-স্ত্ত#
-
-স্ত্তু#
-
-স্ত্ব#
-
-স্ত্য্র#
-
-স্ত্র#
-
-স্ত্ৰ#
-
-	স্থ#
-
-স্থু#
-
-স্থূ#
-
-স্থ্য্র#
-
-স্থ্র#
-
-	স্ন#
-
-স্নু#
-
-স্ন্র#
-
-	স্প#
-
-স্পু#
-
-স্পূ#
-
-স্পৃ#
-
-স্প্র#
-
-স্প্ল#
-
-স্প্ৰ#
-
-	স্ফ#
-
-স্ফু#
-
-স্ফূ#
-
-স্ফ্র#
-
-	স্ব#
-
-স্বু#
-
-স্বৃ#
-
-	স্ভ#
-
-	স্ম#
-
-স্মু#
-
-স্মূ#
-
-স্মৃ#
-
-স্য্র#
-
-	স্র#
-
-স্রু#
-
-স্রৃ#
-
-	স্ল#
-
-স্লু#
-
-	স্স#
-
-স্সু#
-
-স্স্প্রু#
-
-	স্ৰ#
-
-স্ৰু#
-
-	স্ৱ#
-
-	স্‌#
-
-স‌#
-
-হ#
-
-হঁ#
-
-হু#
-
-	হুঁ#
-
-হূ#
-
-হৃ#
-
-হৄ#
-
-হ্#
-
-	হ্ক#
-
-	হ্গ#
-
-	হ্ণ#
-
-	হ্ত#
-
-	হ্ন#
-
-হ্নু#
-
-	হ্ব#
-
-হ্বু#
-
-	হ্ম#
-
-হ্মু#
-
-হ্য়#
-
-হ্য্র#
-
-	হ্র#
-
-হ্রু#
-
-	হ্ল#
-
-	হ্ৰ#
-
-	হ্‌#
-
-হ‌$
-
-়$
-
-ঽ$
-
-া$
-
-াঁ$
-
-াা$
-
-াি$
-
-াে$
-
-া্$
-
-	া্ম$
-
-া্য়$
-
-	া্র$
-
-	া্ৰ$
-
-া‌$
-
-ি$
-
-ী$
-
-ীঁ$
-
-ী্$
-
-ী্য়া$
-
-ু$
-
-ূ$
-
-ৃ$
-
-ৄ$
-
-ে$
-
-ৈ$
-
-ো$
-
-ৌ$
-
-্$
-
-্য$
-
-	্যঁ$
-
-	্যু$
-
-	্যূ$
-
-	্যৃ$
-
-	্য্$
-
-	্য‌$
-
-ৎ$
-
-ৗ$
-
-ৗঁ$
-
-ড়$
-
-ঢ়$
-
-য়$
-
-ৠ$
-
-ৡ$
-
-ৢ$
-
-ৣ$
-
-০$
-
-১$
-
-২$
-
-৩$
-
-৪$
-
-৫$
-
-৬$
-
-৭$
-
-৮$
-
-৯$
-
-ৰ$
-
-ৰঁ$
-
-ৰু$
-
-ৰূ$
-
-ৰৃ$
-
-ৰে$
-
-ৰ্$
-
-	ৰ্ক$
-
-ৰ্কু$
-
-ৰ্ক্স$
-
-	ৰ্খ$
-
-	ৰ্গ$
-
-ৰ্গু$
-
-	ৰ্ঘ$
-
-	ৰ্চ$
-
-ৰ্চ্চ$
-
-ৰ্চ্ছ$
-
-	ৰ্ছ$
-
-	ৰ্জ$
-
-ৰ্জু$
-
-ৰ্জ্জ$
-
-ৰ্জ্জু$
-
-ৰ্জ্ঞ$
-
-	ৰ্ঝ$
-
-	ৰ্ট$
-
-ৰ্টু$
-
-ৰ্ট্ছ$
-
-ৰ্ট্ৰ$
-
-ৰ্ট্‌$
-
-	ৰ্ড$
-
-ৰ্ডু$
-
-	ৰ্ণ$
-
-ৰ্ণ্ট$
-
-	ৰ্ত$
-
-ৰ্তু$
-
-ৰ্তৃ$
-
-ৰ্ত্ত$
-
-ৰ্ত্তু$
-
-ৰ্ত্তৃ$
-
-ৰ্ত্তৄ$
-
-ৰ্ত্ম$
-
-	ৰ্থ$
-
-ৰ্থু$
-
-	ৰ্দ$
-
-ৰ্দু$
-
-ৰ্দৃ$
-
-ৰ্দ্$
-
-ৰ্দ্ধ$
-
-ৰ্দ্ব$
-
-ৰ্দ্ৰ$
-
-	ৰ্ধ$
-
-ৰ্ধ্ব$
-
-	ৰ্ন$
-
-ৰ্নু$
-
-ৰ্ন্ত$
-
-	ৰ্প$
-
-ৰ্পু$
-
-ৰ্পূ$
-
-ৰ্প্প$
-
-	ৰ্ফ$
-
-ৰ্ফু$
-
-	ৰ্ব$
-
-ৰ্বৃ$
-
-ৰ্ব্ব$
-
-ৰ্ব্বু$
-
-	ৰ্ভ$
-
-ৰ্ভু$
-
-ৰ্ভূ$
-
-	ৰ্ম$
-
-ৰ্মু$
-
-ৰ্মূ$
-
-ৰ্ম্প$
-
-ৰ্ম্পূ$
-
-ৰ্ম্ম%
-
-ৰ্ম্মু%
-
-ৰ্ম্মূ%
-
-ৰ্ম্ম্%
-
-	ৰ্য%
-
-ৰ্য়%
-
-ৰ্যু%
-
-ৰ্য্য়%
-
-	ৰ্ল%
-
-ৰ্ল্ড%
-
-ৰ্ল্ল%
-
-	ৰ্শ%
-
-ৰ্শু%
-
-ৰ্শ্ব%
-
-	ৰ্ষ%
-
-ৰ্ষ্ট%
-
-	ৰ্স%
-
-	ৰ্হ%
-
-ৰ্হু%
-
-	ৰ্ৎ%
-
-	ৰ্ৰ%
-
-	ৰ্ৱ%
-
-	ৰ্‌%
-
-ৰ‌%
-
-ৰ‌্য%
-
-ৱ%
-
-ৱঁ%
-
-ৱু%
-
-ৱ্%
-
-	ৱ্ন%
-
-	ৱ্য%
-
-	ৱ্ল%
-
-	ৱ্শ%
-
-	ৱ্স%
-
-ৱ্স্থ%
-
-	ৱ্হ%
-
-৲%
-
-৳%
-
-৴%
-
-৵%
-
-৶%
-
-৷%
-
-৸%
-
-৹%
-
-৺%
-
-৻%
-
-க%
-
-ப%
-
-ா%
-
-ാ%
-
-ി%
-
-་%
-
-៰%
-
-ᵒ%
-
-ḍ%
-
-Ḥ%
-
-ḥ%
-
-Ṁ%
-
-ṁ%
-
-Ṇ%
-
-ṇ%
-
-Ṛ%
-
-ṛ%
-
-Ṣ%
-
-ṣ%
-
-Ṭ%
-
-ṭ%
-
-ẞ%
-
-Ạ%
-
-ạ%
-
-Ả%
-
-ả%
-
-Ấ%
-
-ấ%
-
-Ầ%
-
-ầ%
-
-Ẩ%
-
-ẩ%
-
-Ẫ%
-
-ẫ%
-
-Ậ%
-
-ậ%
-
-Ắ%
-
-ắ%
-
-Ằ%
-
-ằ%
-
-Ẳ%
-
-ẳ%
-
-Ẵ%
-
-ẵ%
-
-Ặ%
-
-ặ%
-
-Ẹ%
-
-ẹ%
-
-Ẻ%
-
-ẻ%
-
-Ẽ%
-
-ẽ%
-
-Ế%
-
-ế%
-
-Ề%
-
-ề%
-
-Ể%
-
-ể%
-
-Ễ%
-
-ễ%
-
-Ệ%
-
-ệ%
-
-Ỉ%
-
-ỉ%
-
-Ị%
-
-ị%
-
-Ọ%
-
-ọ%
-
-Ỏ%
-
-ỏ%
-
-Ố%
-
-ố%
-
-Ồ%
-
-ồ%
-
-Ổ%
-
-ổ%
-
-Ỗ%
-
-ỗ%
-
-Ộ%
-
-ộ%
-
-Ớ%
-
-ớ%
-
-Ờ&
-
-ờ&
-
-Ở&
-
-ở&
-
-Ỡ&
-
-ỡ&
-
-Ợ&
-
-ợ&
-
-Ụ&
-
-ụ&
-
-Ủ&
-
-ủ&
-
-Ứ&
-
-ứ&
-
-Ừ&
-
-ừ&
-
-Ử&
-
-ử&
-
-Ữ&
-
-ữ&
-
-Ự&
-
-ự&
-
-Ỳ&
-
-ỳ&
-
-ỵ&
-
-Ỷ&
-
-ỷ&
-
-Ỹ&
-
-ỹ&
-
-‌&
-
-‍&
-
-	‍্য&
-
-‍‌&
-
-‐&
-
-‑&
-
-‒&
-
-–&
-
-—&
-
-―&
-
-‘&
-
-’&
-
-‚&
-
-“&
-
-”&
-
-„&
-
-†&
-
-‡&
-
-•&
-
-‣&
-
-․&
-
-…&
-
-‰&
-
-′&
-
-″&
-
-‹&
-
-›&
-
-⁄&
-
-⁰&
-
-⁹&
-
-₁&
-
-₂&
-
-₤&
-
-₪&
-
-₫&
-
-€&
-
-₹&
-
-₺&
-
-℃&
-
-№&
-
-℗&
-
-™&
-
-←&
-
-↑&
-
-→&
-
-↓&
-
-↔&
-
-↳&
-
-⇒&
-
-⇓&
-
-⇔&
-
-∀&
-
-∂&
-
-∃&
-
-∇&
-
-∈&
-
-−&
-
-∙&
-
-√&
-
-∝&
-
-∞&
-
-∧&
-
-∨&
-
-∩&
-
-∪&
-
-∫&
-
-≈&
-
-≠&
-
-≡&
-
-≤&
-
-≥&
-
-≪&
-
-≫&
-
-⊂&
-
-⊃&
-
-⊆&
-
-⊇&
-
-⊕&
-
-⊗&
-
-⊢&
-
-⊥&
-
-⊧&
-
-⋅&
-
-⋆&
-
-⌁&
-
-⏭&
-
-Ⓒ&
-
-Ⓡ&
-
-─&
-
-│&
-
-■&
-
-□&
-
-▪&
-
-▬&
-
-▲&
-
-▴&
-
-▶&
-
-▷&
-
-▸&
-
-►'
-
-▼'
-
-▾'
-
-◄'
-
-◅'
-
-◆'
-
-◇'
-
-◊'
-
-○'
-
-◌'
-
-●'
-
-☀'
-
-★'
-
-☆'
-
-☎'
-
-☐'
-
-☛'
-
-☞'
-
-☹'
-
-☺'
-
-☼'
-
-♂'
-
-♚'
-
-♛'
-
-♠'
-
-♡'
-
-♣'
-
-♥'
-
-♦'
-
-♪'
-
-♫'
-
-♬'
-
-♭'
-
-⚫'
-
-✅'
-
-✈'
-
-✉'
-
-✓'
-
-✔'
-
-✡'
-
-✦'
-
-✨'
-
-✩'
-
-✪'
-
-✯'
-
-✰'
-
-✶'
-
-✿'
-
-❀'
-
-❖'
-
-❗'
-
-❘'
-
-❜'
-
-❝'
-
-❞'
-
-❤'
-
-➖'
-
-➜'
-
-➡'
-
-➤'
-
-⟨'
-
-⟩'
-
-⟫'
-
-⠀'
-
-⭑'
-
-Ɑ'
-
-、'
-
-。'
-
-》'
-
-【'
-
-】'
-
-・'
-
-ꞌ'
-
-ﬁ'
-
-，'
-
-：'
-
-￡'
-
-￥'
-
-�''
\ No newline at end of file
@@ -1,19375 +0,0 @@
-
-
- 
-
- ँ
-
- ं
-
- ़
-
- ु
-
- ू
-
- ृ
-
- ॆ
-
- े
-
- ै	
-
- ॊ
-
-
- ्
-
- ्म
-
- ्य
-
-
- ्यु
-
-
- ्यै
-
- ्र
-
- ॓
-
- ঁ
-
- ়
-
- ু
-
- ূ
-
- ্
-
- ্য
-
- ਂ
-
- ਃ
-
- ਼
-
- ਾ
-
- ਾਂ
-
- ਿ
-
- ਿਾ
-
- ਿੀ
-
- ਿੇ 
-
- ਿੋ!
-
- ਿੱ"
-
- ੀ#
-
- ੁ$
-
- ੂ%
-
- ੇ&
-
- ੈ'
-
- ੋ(
-
- ੰ)
-
- ੱ*
-
- ં+
-
- ઃ,
-
- ઃઃ-
-
-
- ઃઃઃ.
-
- ઃઃઃઃ/
-
- ઃઃઃઃઃ0
-
- ઃઃઃઃઃઃ1
-
- ઃઃઃઃઃઃઃ2
-
- ઃઃઃઃઃઃઃઃ3
- 
- ઃઃઃઃઃઃઃઃઃ4
-#
- ઃઃઃઃઃઃઃઃઃઃ5
-&
-" ઃઃઃઃઃઃઃઃઃઃઃ6
-)
-% ઃઃઃઃઃઃઃઃઃઃઃઃ7
-,
-( ઃઃઃઃઃઃઃઃઃઃઃઃઃ8
-/
-+ ઃઃઃઃઃઃઃઃઃઃઃઃઃઃ9
-2
-. ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ:
-5
-1 ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ;
-8
-4 ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ<
-;
-7 ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ=
->
-: ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ>
-D
-@ ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ?
-
- ઼@
-
- િA
-
- િઃB
-
-
- િઃઃC
-
- િઃઃઃD
-
- િઃઃઃઃE
-
- િઃઃઃઃઃF
-
- િઃઃઃઃઃઃG
- 
- િઃઃઃઃઃઃઃઃH
-#
- િઃઃઃઃઃઃઃઃઃI
-&
-" િઃઃઃઃઃઃઃઃઃઃJ
-)
-% િઃઃઃઃઃઃઃઃઃઃઃK
-,
-( િઃઃઃઃઃઃઃઃઃઃઃઃL
-2
-. િઃઃઃઃઃઃઃઃઃઃઃઃઃઃM
-
- િિN
-
- ુO
-
- ુંP
-
- ૂQ
-
- ેR
-
- ્S
-
- ૢT
-
- ‌U
-
-!V
-
-"W
-
-"ंX
-
-"़Y
-
-#Z
-
-$[
-
-%\
-
-%ે]
-
-&^
-
-'_
-
-'ँ`
-
-'ंa
-
-'़b
-
-'ুc
-
-(d
-
-(ुe
-
-(্f
-
-(ઃg
-
-(ઃઃh
-
-
-(ઃઃઃi
-
-(ઃઃઃઃj
-
-(ઃઃઃઃઃk
-
-(ઃઃઃઃઃઃl
-
-)m
-
-)ृn
-
-)ेo
-
-)्p
-	
-)्Aq
-	
-)्Er
-	
-)्Os
-
-)ઃt
-
-)ઃઃu
-
-
-)ઃઃઃv
-
-)ઃઃઃઃw
-
-)ઃઃઃઃઃઃx
-
-)‌y
-
-*z
-
-+{
-
-+ઃ|
-
-+ઃઃ}
-
-+ઃઃઃઃ~
-
-,
-
-
-,ઃઃઃ
-
-,ઃઃઃઃ
-
-,ઃઃઃઃઃ
-
-,ઃઃઃઃઃઃ
-
--
-	
--ं
-	
--ઃ
-	
--િ
-
-.
-	
-.ે
-
-/
-
-0
-
-1
-
-1्ऱ
-
-2
-
-3
-	
-3ુ
-
-4
-
-5
-	
-5ે
-
-6
-
-7
-
-8
-
-9
-
-:
-	
-:੍
-	
-:‌
-
-;
-	
-;਼
-
-<
-
-=
-
->
-	
->ૂ
-
-?
-	
-?ं
-
-@
-
-A
-	
-A્
-
-A્છ
-
-A્ઠ
-
-A્ત
-
-A્ય
-
-A્ર
-
-B
-
-C
-	
-Cે
-
-D
-
-E
-
-E̟
-
-F
-	
-Fઃ
-	
-F્
-
-G
-	
-Gે
-	
-G્
-
-G્છ
-
-G્ઠ
-
-G્ર
-
-G્વ
-
-H
-	
-Hં
-	
-H્
-
-I
-
-J
-
-K
-
-L
-
-M
-	
-Mे
-	
-Mં
-
-N
-
-O
-
-O̟
-
-P
-
-Q
-
-R
-	
-Rં
-	
-Rૂ
-
-S
-	
-S્
-
-T
-	
-Tે
-
-U
-
-V
-
-W
-
-X
-
-Y
-
-Z
-
-[
-
-
-[ઃઃઃ
-	
-[ે
-
-\
-
-\\
-
-]
-	
-]़
-	
-]ઃ
-
-]ઃઃ
-
-
-]ઃઃઃ
-
-]ઃઃઃઃ
-
-^
-
-_
-	
-_ં
-
-`
-
-a
-
-à
-
-á
-
-ã
-
-ả
-
-ạ
-
-a̸
-
-b
-
-c
-
-c̈
-
-d
-
-ḍ
-
-e
-
-è
-
-é
-
-ẽ
-
-e̟
-
-ẹ
-
-e̱
-
-f
-
-g
-
-h
-
-ḥ
-
-i
-
-ì
-
-í
-
-ĩ
-
-i̇
-
-i̟
-
-ị
-
-j
-
-k
-
-l
-
-m
-
-m̃
-	
-mे
-
-n
-
-ǹ
-
-o
-
-ò
-
-ó
-
-ỏ
-
-o̟
-
-ọ
-
-p
-
-p̃
-
-q
-
-r
-
-ṛ
-
-s
-
-s̟
-
-ṣ
-
-t
-
-t̃
-
-ṭ
-
-u
-
-ù
-
-ú
-
-ũ
-
-ủ
-
-u̟
-
-ụ
-
-u̸
-
-v
-
-v̄
-
-v̈
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-	
-~્
-
- 
-	
- ̃
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-­
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-	
-ầ
-	
-ấ
-	
-ậ
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-	
-ề
-	
-ế
-	
-ễ
-	
-ể
-	
-ệ
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-	
-ồ
-	
-ố
-	
-ỗ
-	
-ổ
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-	
-ắ
-	
-ặ
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ŗ
-
-ŗ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɣ
-
-Ɩ
-
-Ơ
-
-ơ
-	
-ờ
-	
-ớ
-	
-ợ
-
-ƭ
-
-Ư
-
-ư
-	
-ừ
-	
-ứ
-	
-ữ
-	
-ử
-	
-ự
-
-ƴ
-
-ǎ
-
-ǐ
-
-ǝ
-
-Ǧ
-
-ǧ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-ȳ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̀
-	
-ɔ́
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-	
-ə́
-
-ɛ
-	
-ɛ̀
-	
-ɛ̃
-	
-ɛ̈
-
-ɣ
-
-ɧ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʒ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˙
-
-˚
-
-˜
-
-˝
-
-˞
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-،
-
-؛
-
-؟
-
-ا
-
-ل
-
-۔
-
-ँ
-
-ं
-
-ंं
-
-ः
-
-अ
-
-अँ
-
-अं
-
-अ़
-
-अॅ
-
-	अॅं
-
-अ॑
-
-अ॒
-
-	अ॒॒
-
-आ
-
-आँ
-
-आं
-
-आ़
-
-आॅ
-
-	आें
-
-	आ्य
-
-आ॑
-
-आ॒
-
-इ
-
-इँ
-
-इं
-
-इे
-
-इ॑
-
-इ॒
-
-ई
-
-ईँ
-
-ईं
-
-ईे
-
-ई॑
-
-ई॒
-
-उ
-
-उँ
-
-उं
-
-उ॑
-
-उ॒
-
-ऊ
-
-ऊँ
-
-ऊं
-
-ऊ॒
-
-ऋ
-
-ऋं
-
-ऋ॑
-
-ऋ॒
-
-ऌ
-
-ऍ
-
-ऍं
-
-ऎ
-
-ए
-
-एँ
-
-एं
-
-ए़
-
-एॅ
-
-एै
-
-	ए्ह
-
-ए॑
-
-ए॒
-
-ऐ
-
-ऐँ
-
-ऐं
-
-ऐ॒
-
-ऑ
-
-ऑं
-
-ऑ़
-
-ऒ
-
-ओ
-
-ओँ
-
-ओं
-
-ओ़
-
-औ
-
-औँ
-
-औं
-
-क
-
-कँ
-
-कं
-
-	कं॑
-
-	कं॒
-
-	कः॑
-
-क़
-
-	क़ु
-
-	क़ू
-
-	क़े
-
-	क़ै
-
-	क़्
-
-	का॑
-
-	का॒
-
-कि
-
-कि्र
-
-	कि॒
-
-	की॒
-
-कु
-
-	कुँ
-
-	कुं
-
-	कु़
-
-	कु॑
-
-	कु॒
-
-कू
-
-	कूँ
-
-	कूं
-
-	कू़
-
-	कू॑
-
-	कू॒
-
-कृ
-
-	कृं
-
-	कृ॑
-
-	कृ॒
-
-कॄ
-
-कॅ
-
-	कॅं
-
-कॆ
-
-के
-
-	केँ
-
-	कें
-
-	के़
-
-	के॑
-
-	के॒
-
-कै
-
-	कैं
-
-कॊ
-
-	को॑
-
-	को॒
-
-क्
-
-	क्र
-
-क्रं
-
-क्रा॑
-
-क्रि॑
-
-क्रि॒
-
-क्री॑
-
-क्री॒
-
-क्रु
-
-क्रू
-
-क्रू॒
-
-क्रृ
-
-क्रॅ
-
-क्रे
-
-क्रें
-
-क्रै
-
-क्रैं
-
-क्रॊ
-
-क्र्
-
-क्र॑
-
-क्र॒
-
-	क्ष
-
-क्षं
-
-क्षि॑
-
-क्षि॒
-
-क्षी॒
-
-क्षु
-
-क्षुं
-
-क्षु॑
-
-क्षु॒
-
-क्षू
-
-क्षूं
-
-क्षृ
-
-क्षॆ
-
-क्षे
-
-क्षै
-
-क्षॊ
-
-क्षो॒
-
-क्ष्
-
-क्ष्र
-
-क्ष॑
-
-क्ष॒
-
-क्षॢ
-
-क॑
-
-क॒
-
-कॢ
-
-ख
-
-खँ
-
-खं
-
-ख़
-
-ख़़ु
-
-	ख़ु
-
-	ख़ू
-
-	ख़े
-
-	ख़ै
-
-	ख़्
-
-खा्य
-
-	खा॑
-
-	खा॒
-
-खि
-
-	खि़
-
-खि्द
-
-खु
-
-	खुँ
-
-	खुं
-
-	खु़
-
-खू
-
-	खूँ
-
-	खूं
-
-	खू़
-
-खृ
-
-खॅ
-
-खॆ
-
-खे
-
-	खेँ
-
-	खें
-
-खै
-
-	खैँ
-
-	खैं
-
-खॊ
-
-ख्
-
-	ख्र
-
-ख्रु
-
-ख्रे
-
-ख्र्
-
-ख॑
-
-ख॒
-
-खॢ
-
-ग
-
-गँ
-
-गं
-
-ग़
-
-	ग़ु
-
-	ग़ै
-
-	ग़्
-
-	गा॑
-
-	गा॒
-
-गि्र
-
-	गि॒
-
-	गी॒
-
-गु
-
-	गुँ
-
-	गुं
-
-	गु॑
-
-	गु॒
-
-गू
-
-	गूँ
-
-	गूं
-
-गृ
-
-	गृ॑
-
-	गृ॒
-
-गॄ
-
-गॅ
-
-गॆ
-
-गे
-
-	गेँ
-
-	गें
-
-	गे॒
-
-गै
-
-	गैँ
-
-	गैं
-
-	गै़
-
-गॊ
-
-	गो॑
-
-	गो॒
-
-ग्
-
-	ग्र
-
-ग्रँ
-
-ग्रं
-
-ग्रा॒
-
-ग्री॒
-
-ग्रु
-
-ग्रू
-
-ग्रॅ
-
-ग्रॆ
-
-ग्रे
-
-ग्रें
-
-ग्रे॑
-
-ग्रे॒
-
-ग्रै
-
-ग्रैं
-
-ग्र्
-
-ग्र॑
-
-ग्र॒
-
-ग॑
-
-ग॒
-
-गॢ
-
-घ
-
-घँ
-
-घं
-
-	घा॑
-
-	घा॒
-
-घु
-
-	घुँ
-
-	घुं
-
-घू
-
-	घूँ
-
-	घूं
-
-घृ
-
-	घृ॒
-
-घॅ
-
-घे
-
-	घें
-
-घै
-
-घो्ने
-
-	घो॒
-
-घ्
-
-	घ्र
-
-घ्रं
-
-घ्री
-
-घ्रु
-
-घ्रे
-
-घ्रै
-
-घ्र्
-
-घ॒
-
-घॢ
-
-ङ
-
-ङं
-
-ङु
-
-ङू
-
-ङृ
-
-ङॅ
-
-ङे
-
-	ङें
-
-ङै
-
-ङ्
-
-	ङ्क
-
-ङ्कं
-
-ङ्का॒
-
-ङ्कु
-
-ङ्कू
-
-ङ्कृ
-
-ङ्कृ॑
-
-ङ्कृ॒
-
-ङ्के
-
-ङ्कै
-
-ङ्क्
-
-ङ्क्र
-
-ङ्क्रु
-
-ङ्क्ष
-
-ङ्क्षं
-
-ङ्क्षु
-
-ङ्क्षे
-
-ङ्क्ष्
-
-ङ्क॑
-
-ङ्क॒
-
-ङ्कॢ
-
-	ङ्ख
-
-ङ्खं
-
-ङ्खु
-
-ङ्खे
-
-ङ्खै
-
-ङ्ख्
-
-	ङ्ग
-
-ङ्गं
-
-ङ्गा॑
-
-ङ्गि॑
-
-ङ्गु
-
-ङ्गू
-
-ङ्गृ
-
-ङ्गे
-
-ङ्गै
-
-ङ्ग्
-
-ङ्ग्र
-
-ङ्ग्रा॒
-
-ङ्ग्रे
-
-ङ्ग॑
-
-ङ्ग॒
-
-	ङ्घ
-
-ङ्घं
-
-ङ्घृ॒
-
-ङ्घे
-
-ङ्घै
-
-ङ्घ्
-
-ङ्घ्र
-
-	ङ्र
-
-ङ्रे
-
-ङॢ
-
-च
-
-चँ
-
-चं
-
-	चं॑
-
-	चं॒
-
-	चः॑
-
-च़
-
-	चा॑
-
-	चा॒
-
-	चि॑
-
-	चि॒
-
-	ची॑
-
-	ची॒
-
-चु
-
-	चुँ
-
-	चुं
-
-चू
-
-	चूँ
-
-	चूं
-
-चृ
-
-चॅ
-
-	चॅं
-
-चॆ
-
-	चॆं
-
-चे
-
-	चें
-
-	चे॑
-
-	चे॒
-
-चै
-
-	चैं
-
-	चै॒
-
-चॊ
-
-	चो॑
-
-	चो॒
-
-च्
-
-	च्र
-
-च्र्
-
-च॑
-
-च॒
-
-चॢ
-
-छ
-
-छँ
-
-छं
-
-	छा॑
-
-	छा॒
-
-	छि॑
-
-	छि॒
-
-छु
-
-	छु॒
-
-छू
-
-	छूं
-
-छृ
-
-	छृं
-
-छॄ
-
-छॅ
-
-छॆ
-
-छे
-
-	छेँ
-
-	छें
-
-	छे॑
-
-छै
-
-	छैं
-
-छो्ड़े
-
-छौं्
-
-छ्
-
-	छ्र
-
-छ्रं
-
-छ्रु
-
-छ्रू
-
-छ्रे
-
-छ॑
-
-छ॒
-
-छॢ
-
-ज
-
-जँ
-
-जं
-
-	जं॑
-
-	जः॑
-
-ज़
-
-	ज़ं
-
-	ज़़
-
-	ज़ु
-
-	ज़ू
-
-	ज़े
-
-ज़ें
-
-	ज़ै
-
-ज़ैं
-
-	ज़्
-
-ज़्र
-
-	जा़
-
-	जा॑
-
-	जा॒
-
-	जि़
-
-	जि॑
-
-	जि॒
-
-	जी़
-
-	जी॑
-
-	जी॒
-
-जु
-
-	जुँ
-
-	जुं
-
-	जु़
-
-	जु॑
-
-	जु॒
-
-जू
-
-	जूँ
-
-	जूं
-
-जृ
-
-	जृं
-
-जॄ	
-
-जॅ	
-
-जॆ	
-
-जे	
-
-	जें	
-
-	जे़	
-
-	जे॑	
-
-	जे॒	
-
-जै	
-
-	जैं	
-
-	जै॒	
-
-जॊ	
-
-	जो़	
-
-जो्प	
-
-	जो॑	
-
-	जो॒	
-
-ज्	
-
-	ज्ञ	
-
-ज्ञं	
-
-ज्ञा॑	
-
-ज्ञा॒	
-
-ज्ञु	
-
-ज्ञू	
-
-ज्ञृ	
-
-ज्ञे	
-
-ज्ञै	
-
-ज्ञॊ	
-
-ज्ञ्	
-
-ज्ञ॒	
-
-ज्ञॢ	
-
-	ज्र	
-
-ज्रं	
-
-ज्रे	
-
-ज्रे॑	
-
-ज्रै	
-
-ज्रो॒	
-
-ज्र्	
-
-ज्र॑	
-
-ज॑	
-
-ज॒	
-
-जॢ	
-
-झ	
-
-झँ	
-
-झं	
-
-झ़	
-
-झु	
-
-	झुं	
-
-झू	
-
-झृ	
-
-झॅ	
-
-झे	
-
-	झें	
-
-झै	
-
-	झैँ	
-
-	झैं	
-
-झ्	
-
-	झ्र	
-
-झॢ	
-
-ञ	
-
-ञं	
-
-ञु	
-
-ञू	
-
-ञृ	
-
-ञॅ	
-
-ञे	
-
-ञै	
-
-ञ्	
-
-	ञ्ज	
-
-ञ्जं	
-
-ञ्जा॒	
-
-ञ्जी॒	
-
-ञ्जु	
-
-ञ्जु॑	
-
-ञ्जु॒	
-
-ञ्जू	
-
-ञ्जे	
-
-ञ्जै	
-
-ञ्ज्	
-
-ञ्ज्ञ	
-
-ञ्ज्ञं	
-
-ञ्ज॑	
-
-ञ्ज॒	
-
-ञॢ	
-
-ट	
-
-टँ	
-
-टं	
-
-	टा॑	
-
-	टा॒	
-
-टि्र	
-
-	टि॑	
-
-	टि॒	
-
-टु	
-
-	टुँ	
-
-	टुं	
-
-	टु॑	
-
-टू	
-
-	टूं	
-
-टृ	
-
-टॄ	
-
-टॅ	
-
-	टॅं	
-
-टॆ	
-
-टे	
-
-	टें	
-
-टे्र	
-
-टै	
-
-	टैं	
-
-टॊ	
-
-टो्म	
-
-	टो॒	
-
-ट्	
-
-	ट्ट	
-
-ट्टं	
-
-ट्टु	
-
-ट्टू	
-
-ट्टे	
-
-ट्टै	
-
-ट्ट्	
-
-	ट्ठ	
-
-ट्ठं	
-
-ट्ठू	
-
-ट्ठे	
-
-	ट्र	
-
-ट्रं	
-
-ट्रु	
-
-ट्रू	
-
-ट्रॅ	
-
-ट्रे	
-
-ट्रें
-
-
-ट्रै
-
-
-ट्रैं
-
-
-ट्र्
-
-
-ट्र॒
-
-
-ट॑
-
-
-ट॒
-
-
-टॢ
-
-
-ठ
-
-
-ठँ
-
-
-ठं
-
-
-	ठा॒
-
-
-ठु
-
-
-	ठुँ
-
-
-	ठुं
-
-
-ठू
-
-
-	ठूं
-
-
-ठृ
-
-
-ठॆ
-
-
-ठे
-
-
-	ठें
-
-
-ठै
-
-
-ठ्
-
-
-	ठ्ठ
-
-
-ठ्ठे
-
-
-ठ्ठ्
-
-
-	ठ्र
-
-
-ठ॑
-
-
-ठ॒
-
-
-ठॢ
-
-
-ड
-
-
-डँ
-
-
-डं
-
-
-ड़
-
-
-	ड़ं
-
-
-	ड़ु
-
-
-	ड़ू
-
-
-	ड़े
-
-
-ड़ें
-
-
-	ड़ै
-
-
-	ड़्
-
-
-	डा़
-
-
-	डाॅ
-
-
-	डा॑
-
-
-	डा॒
-
-
-	डि़
-
-
-डि्र
-
-
-	डि॒
-
-
-	डी़
-
-
-डु
-
-
-	डुँ
-
-
-	डुं
-
-
-डू
-
-
-	डूं
-
-
-डृ
-
-
-डॅ
-
-
-डॆ
-
-
-डे
-
-
-	डें
-
-
-	डे़
-
-
-डै
-
-
-	डैं
-
-
-डॊ
-
-
-डौंँ
-
-
-डौंं
-
-
-ड्
-
-
-	ड्र
-
-
-ड्रं
-
-
-ड्रु
-
-
-ड्रू
-
-
-ड्रॅ
-
-
-ड्रे
-
-
-ड्रै
-
-
-ड्र्
-
-
-ड॑
-
-
-ड॒
-
-
-डॢ
-
-
-ढ
-
-
-ढँ
-
-
-ढं
-
-
-ढ़
-
-
-	ढ़ं
-
-
-	ढ़ॆ
-
-
-	ढ़े
-
-
-ढ़ें
-
-
-	ढ़्
-
-
-	ढा़
-
-
-	ढि़
-
-
-ढु
-
-
-	ढुँ
-
-
-	ढुं
-
-
-ढू
-
-
-	ढूँ
-
-
-	ढूं
-
-
-ढृ
-
-
-ढॆ
-
-
-ढे
-
-
-	ढें
-
-
-	ढे़
-
-
-ढै
-
-
-	ढो॑
-
-
-ढ्
-
-
-	ढ्र
-
-
-ढ्रं
-
-
-ढ्रे
-
-
-ढॢ
-
-
-ण
-
-
-णँ
-
-
-णं
-
-
-	णं॒
-
-
-	णः॑
-
-
-	ण़्
-
-
-णां॒
-
-
-	णा॑
-
-
-	णा॒
-
-
-	णि॑
-
-
-	णि॒
-
-
-	णी॑
-
-
-	णी॒
-
-
-णु
-
-
-	णुं
-
-
-णुः॑
-
-
-	णु॑
-
-
-	णु॒
-
-
-णू
-
-
-	णूं
-
-
-णृ
-
-
-णॅ
-
-
-णॆ
-
-	णॆं
-
-णे
-
-	णें
-
-	णे॑
-
-	णे॒
-
-णै
-
-	णै॒
-
-णॊ
-
-णोः॒
-
-	णो॑
-
-	णो॒
-
-ण्
-
-	ण्र
-
-ण॑
-
-ण॒
-
-ण॓
-
-णॢ
-
-त
-
-तँ
-
-तं
-
-	तंं
-
-	तं॑
-
-	तं॒
-
-तः
-
-	तः॑
-
-	तः॒
-
-त़
-
-तां॒
-
-ताः॑
-
-ता्द
-
-	ता॑
-
-	ता॒
-
-ता॒॒
-
-	ता॔
-
-ति
-
-तिं॒
-
-तिः॑
-
-तिः॒
-
-	ति॑
-
-	ति॒
-
-	ति॔
-
-ती्ह
-
-ती्हुँं
-
-	ती॑
-
-	ती॒
-
-तु
-
-	तुं
-
-तुः॑
-
-	तु॑
-
-	तु॒
-
-तू
-
-	तूं
-
-	तू॑
-
-	तू॒
-
-तृ
-
-	तृ॑
-
-	तृ॒
-
-तॄ
-
-	तॄं
-
-तॅ
-
-तॆ
-
-ते
-
-	तेँ
-
-	तें
-
-	ते॑
-
-	ते॒
-
-तै
-
-	तैं
-
-	तै॒
-
-तॊ
-
-	तो॑
-
-	तो॒
-
-	तौ॒
-
-त्
-
-	त्र
-
-त्रँ
-
-त्रं
-
-त्रं॑
-
-त्रं॒
-
-त्रा
-
-त्रा॑
-
-त्रा॒
-
-त्रि॑
-
-त्रि॒
-
-त्रि॒॒
-
-त्री॑
-
-त्रु
-
-त्रुं
-
-त्रू
-
-त्रूं
-
-त्रृ
-
-त्रॆ
-
-त्रे
-
-त्रें
-
-त्रे॑
-
-त्रे॒
-
-त्रै
-
-त्रै॒
-
-त्रॊ
-
-त्रो॑
-
-त्र्
-
-त्र्र
-
-त्र॑
-
-त्र॒
-
-त॑
-
-त॒
-
-	त॒॒
-
-तॢ
-
-थ
-
-थँ
-
-थं
-
-थ़
-
-	था॑
-
-	था॒
-
-थि
-
-	थि॑
-
-	थि॒
-
-थु
-
-	थुं
-
-	थु॒
-
-थू
-
-थृ
-
-थॅ
-
-थॆ
-
-थे
-
-	थेँ
-
-	थें
-
-	थे॑
-
-	थे॒
-
-थै
-
-	थैं
-
-	थै॒
-
-थॊ
-
-	थो॑
-
-	थो॒
-
-थ्
-
-	थ्र
-
-थ्रु
-
-थ्रू
-
-थ्रे
-
-थ्रै
-
-थ्र्
-
-थ॑
-
-थ॒
-
-थॢ
-
-द
-
-दँ
-
-दं
-
-	दं॑
-
-	दः॑
-
-द़
-
-	दा॑
-
-	दा॒
-
-दा॒॒
-
-	दिे
-
-दि्र
-
-	दि॑
-
-	दि॒
-
-	दी॑
-
-	दी॒
-
-दु
-
-	दुं
-
-	दु॑
-
-	दु॒
-
-दू
-
-	दूँ
-
-	दूं
-
-	दू॒
-
-दृ
-
-	दृं
-
-	दृ॑
-
-	दृ॒
-
-दॄ
-
-दॅ
-
-दॆ
-
-दे
-
-	दें
-
-दे्द
-
-दे्दै
-
-	दे॑
-
-	दे॒
-
-दै
-
-	दैँ
-
-	दैं
-
-	दै॒
-
-दॊ
-
-	दो॑
-
-	दो॒
-
-द्
-
-	द्घ
-
-द्घु
-
-द्घृ
-
-	द्द
-
-द्दं
-
-द्दु
-
-द्दू
-
-द्दृ
-
-द्दॆ
-
-द्दे
-
-द्दे॒
-
-द्दै
-
-द्द्
-
-द्द्र
-
-द्द्रु
-
-द्द॑
-
-	द्ध
-
-द्धं
-
-द्धा॒
-
-द्धु
-
-द्धुं
-
-द्धू
-
-द्धृ
-
-द्धे
-
-द्धे॒
-
-द्धै
-
-द्ध्
-
-द्ध्र
-
-द्ध्रु
-
-द्ध्रु॒
-
-द्ध॑
-
-द्ध॒
-
-	द्ब
-
-द्बं
-
-द्बु
-
-द्बृ
-
-द्ब्र
-
-द्ब्रा॑
-
-द्ब्रू
-
-द्ब॒
-
-	द्भ
-
-द्भि॑
-
-द्भि॒
-
-द्भु
-
-द्भू
-
-द्भृ
-
-द्भे
-
-द्भै
-
-द्भ्
-
-द्भ्र
-
-द्भ्रु
-
-द्भ्रू
-
-द्भ॑
-
-	द्म
-
-द्मं
-
-द्मे
-
-द्मै
-
-द्म्
-
-	द्य
-
-द्यं
-
-द्या॑
-
-द्या॒
-
-द्यु
-
-द्यु॒
-
-द्यू
-
-द्यॆ
-
-द्ये
-
-द्ये॑
-
-द्ये॒
-
-द्यै
-
-द्यॊ
-
-द्य्
-
-द्य॑
-
-द्य॒
-
-	द्र
-
-द्रं
-
-द्रं॑
-
-द्रं॒
-
-द्रः॑
-
-द्रा॑
-
-द्रा॒
-
-द्रि॑
-
-द्रि॒
-
-द्रु
-
-द्रु॒
-
-द्रू
-
-द्रू॒
-
-द्रृ
-
-द्रॆ
-
-द्रे
-
-द्रे॑
-
-द्रे॒
-
-द्रै
-
-द्रॊ
-
-द्रो॑
-
-द्रो॒
-
-द्र्
-
-द्र॑
-
-द्र॒
-
-	द्व
-
-द्वं
-
-द्वा॑
-
-द्वा॒
-
-द्वि॑
-
-द्वि॒
-
-द्वी॒
-
-द्वु
-
-द्वृ
-
-द्वॆ
-
-द्वे
-
-द्वै
-
-द्वै॑
-
-द्व्
-
-द्व्र
-
-द्व॑
-
-द्व॒
-
-द॑
-
-द॒
-
-दॢ
-
-ध
-
-धँ
-
-धं
-
-	धः॑
-
-धा
-
-	धा॑
-
-	धा॒
-
-	धि॑
-
-	धि॒
-
-	धी॑
-
-	धी॒
-
-धु
-
-	धुँ
-
-	धुं
-
-धु्र
-
-	धु॑
-
-	धु॒
-
-धू
-
-	धूँ
-
-	धूं
-
-धृ
-
-	धृ॑
-
-	धृ॒
-
-धॄ
-
-धॆ
-
-धे
-
-	धें
-
-	धे॑
-
-	धे॒
-
-धै
-
-	धैँ
-
-	धैं
-
-धॊ
-
-	धो॑
-
-	धो॒
-
-ध्
-
-	ध्र
-
-ध्रं
-
-ध्रु
-
-ध्रु॒
-
-ध्रे
-
-ध्रै
-
-ध्र्
-
-ध॑
-
-ध॒
-
-धॢ
-
-न
-
-नँ
-
-नं
-
-	नंं
-
-	नं॑
-
-	नं॒
-
-	नः॑
-
-	नः॒
-
-नां॑
-
-नां॒
-
-	नाः
-
-	ना॑
-
-	ना॒
-
-ना॒॒
-
-नि
-
-निः॑
-
-	नि॑
-
-	नि॒
-
-	नी॑
-
-	नी॒
-
-नु
-
-	नुं
-
-	नु॑
-
-	नु॒
-
-नू
-
-	नूँ
-
-	नूं
-
-	नू॑
-
-	नू॒
-
-नृ
-
-	नृ॑
-
-	नृ॒
-
-नॄ
-
-नॅ
-
-नॆ
-
-ने
-
-	नेँ
-
-	नें
-
-	ने॑
-
-	ने॒
-
-नै
-
-	नैं
-
-	नै॒
-
-नॊ
-
-	नो॑
-
-	नो॒
-
-	नौ॑
-
-	नौ॒
-
-न्
-
-	न्र
-
-न्रु
-
-न्रू
-
-न्रे
-
-न्र्
-
-न॑
-
-न॒
-
-	न॒॒
-
-नॢ
-
-ऩ
-
-प
-
-पँ
-
-पं
-
-	पः॑
-
-प़
-
-	पाॅ
-
-	पा॑
-
-	पा॒
-
-पा॒॒
-
-पि्र
-
-	पि॑
-
-	पि॒
-
-	पी॑
-
-	पी॒
-
-पु
-
-	पुँ
-
-	पुं
-
-	पु॑
-
-	पु॒
-
-पू
-
-	पूँ
-
-	पूं
-
-	पू॑
-
-	पू॒
-
-पृ
-
-	पृ॑
-
-	पृ॒
-
-पॄ
-
-पॅ
-
-	पॅं
-
-पॆ
-
-पे
-
-	पें
-
-पे्र
-
-	पे॑
-
-	पे॒
-
-पै
-
-	पैँ
-
-	पैं
-
-	पै॑
-
-	पै॒
-
-पॊ
-
-	पो॑
-
-	पो॒
-
-	पौ॑
-
-	पौ॒
-
-प्
-
-	प्र
-
-प्रं
-
-प्रा॑
-
-प्रा॒
-
-प्रि॑
-
-प्रि॒
-
-प्री॑
-
-प्री॒
-
-प्रु
-
-प्रू
-
-प्रॅ
-
-प्रॆ
-
-प्रे
-
-प्रें
-
-प्रै
-
-प्रॊ
-
-प्र्
-
-प्र्र
-
-प्र॑
-
-प्र॒
-
-प॑
-
-प॒
-
-पॢ
-
-फ
-
-फँ
-
-फं
-
-फ़
-
-	फ़ं
-
-	फ़ु
-
-	फ़ू
-
-	फ़ॅ
-
-	फ़े
-
-फ़ें
-
-	फ़ै
-
-	फ़्
-
-फ़्र
-
-फ़्रं
-
-फ़्रे
-
-फ़्रें
-
-फ़्रै
-
-फ़्रैं
-
-फि्ट
-
-फु
-
-	फुं
-
-फू
-
-	फूँ
-
-	फूं
-
-फृ
-
-फॅ
-
-फे
-
-	फें
-
-	फे़
-
-फै
-
-	फैँ
-
-	फैं
-
-फॊ
-
-फ्
-
-	फ्र
-
-फ्रँ
-
-फ्रं
-
-फ्रु
-
-फ्रू
-
-फ्रॅ
-
-फ्रॅं
-
-फ्रे
-
-फ्रें
-
-फ्रै
-
-फ्रैं
-
-फ्र्
-
-फॢ
-
-ब
-
-बँ
-
-बं
-
-ब़
-
-	बा॑
-
-	बा॒
-
-बि्र
-
-	बि॑
-
-बु
-
-	बुँ
-
-	बुं
-
-	बु॒
-
-बू
-
-	बूँ
-
-	बूं
-
-बृ
-
-	बृं
-
-	बृ॑
-
-	बृ॒
-
-बॄ
-
-बॅ
-
-	बॅं
-
-बॆ
-
-बे
-
-	बेँ
-
-	बें
-
-बे्र
-
-बै
-
-	बैँ
-
-	बैं
-
-बॊ
-
-ब्
-
-	ब्र
-
-ब्रँ
-
-ब्रं
-
-ब्रा॑
-
-ब्रा॒
-
-ब्रु
-
-ब्रू
-
-ब्रू॒
-
-ब्रॅ
-
-ब्रॅं
-
-ब्रे
-
-ब्रें
-
-ब्रै
-
-ब्रैं
-
-ब्र्
-
-ब्र॑
-
-ब्र॒
-
-ब॑
-
-ब॒
-
-बॢ
-
-भ
-
-भँ
-
-भं
-
-	भा॑
-
-	भा॒
-
-भिः॑
-
-भिः॒
-
-	भि॑
-
-	भि॒
-
-	भी॒
-
-भु
-
-	भुँ
-
-	भुं
-
-	भु॑
-
-	भु॒
-
-भू
-
-	भूँ
-
-	भूं
-
-	भू॑
-
-	भू॒
-
-भृ
-
-	भृं
-
-	भृ॑
-
-	भृ॒
-
-भॄ
-
-भॅ
-
-भॆ
-
-भे
-
-	भें
-
-	भे॑
-
-	भे॒
-
-भै
-
-	भैँ
-
-	भैं
-
-भॊ
-
-	भो॑
-
-	भो॒
-
-भ्
-
-	भ्र
-
-भ्रं
-
-भ्रु
-
-भ्रू
-
-भ्रे
-
-भ्रै
-
-भ्र्
-
-भ॑
-
-भ॒
-
-भॢ
-
-म
-
-मँ
-
-मं
-
-	मंे
-
-	मं॑
-
-	मं॒
-
-	मः॑
-
-	मः॒
-
-म़
-
-माः॑
-
-	माॅ
-
-	मा॑
-
-	मा॒
-
-मा॒॒
-
-	मि॑
-
-	मि॒
-
-मी
-
-	मी॑
-
-	मी॒
-
-मु
-
-	मुँ
-
-	मुं
-
-	मु़
-
-	मुॅ
-
-	मु॑
-
-	मु॒
-
-मू
-
-	मूँ
-
-	मूं
-
-	मू॑
-
-	मू॒
-
-मृ
-
-	मृ॑
-
-	मृ॒
-
-मॄ
-
-मॅ
-
-	मॅं
-
-मॆ
-
-मे
-
-	मेँ
-
-	में
-
-मेें
-
-	मे॑
-
-	मे॒
-
-मै
-
-	मैं
-
-	मै॑
-
-	मै॒
-
-मॊ
-
-	मो॑
-
-	मो॒
-
-म्
-
-	म्र
-
-म्रं
-
-म्रा॑
-
-म्रु
-
-म्रे
-
-म्रै
-
-म्र्
-
-म॑
-
-म॒
-
-	म॒॒
-
-मॢ
-
-य
-
-यँ
-
-	यँ॑
-
-	यँ॒
-
-यं
-
-	यं॑
-
-	यं॒
-
-	यः॑
-
-	यः॒
-
-य़
-
-	य़ु
-
-	य़ू
-
-	य़े
-
-यां॑
-
-यां॒
-
-याः॑
-
-	याॅ
-
-	या॑
-
-	या॒
-
-या॒॒
-
-यि
-
-	यि॑
-
-	यि॒
-
-	यी॑
-
-	यी॒
-
-यु
-
-	युँ
-
-	युं
-
-युः॑
-
-	यु॑
-
-	यु॒
-
-यू
-
-	यूँ
-
-	यूं
-
-	यू॑
-
-	यू॒
-
-यृ
-
-	यृ॑
-
-	यृ॒
-
-यॄ
-
-यॅ
-
-यॆ
-
-ये
-
-	येँ
-
-	यें
-
-	ये॑
-
-	ये॒
-
-यै
-
-	यैं
-
-	यै॑
-
-	यै॒
-
-यॊ
-
-योः॑
-
-	यो॑
-
-	यो॒
-
-	यौ॑
-
-य्
-
-	य्र
-
-य्र्
-
-य॑
-
-य॒
-
-	य॒॒
-
-यॢ
-
-र
-
-रँ
-
-रं
-
-	रं॑
-
-	रं॒
-
-	रः॑
-
-	रः॒
-
-रा
-
-	राँ
-
-	रां
-
-	रा॑
-
-	रा॒
-
-रिः॑
-
-	रि॑
-
-	रि॒
-
-रि॒॒
-
-री
-
-	रीं
-
-	री॑
-
-	री॒
-
-रु
-
-	रुँ
-
-	रुं
-
-	रु़
-
-	रुे
-
-	रु॑
-
-	रु॒
-
-रू
-
-	रूँ
-
-	रूं
-
-	रू॑
-
-	रू॒
-
-रृ
-
-रॄ
-
-रॅ
-
-	रॅं
-
-रॆ
-
-रे
-
-	रेँ
-
-	रें
-
-	रे॑
-
-	रे॒
-
-रै
-
-	रैं
-
-	रै॒
-
-रॉ
-
-	रॉं
-
-रॊ
-
-रो
-
-	रों
-
-	रो॑
-
-	रो॒
-
-रौ
-
-	रौँ
-
-	रौं
-
-	रौ॒
-
-र्
-
-	र्ं
-
-	र्अ
-
-	र्इ
-
-र्इं
-
-	र्उ
-
-	र्ऋ
-
-	र्ए
-
-	र्क
-
-र्कं
-
-र्क़
-
-र्का
-
-र्कां
-
-र्की
-
-र्कीं
-
-र्कु
-
-र्कू
-
-र्कृ
-
-र्के
-
-र्कें
-
-र्कै
-
-र्को
-
-र्कों
-
-र्कौ
-
-र्क्
-
-र्क्क
-
-र्क्ट
-
-र्क्य
-
-र्क्यं
-
-र्क्या
-
-र्क्यु
-
-र्क्यू
-
-र्क्यो
-
-र्क्र
-
-र्क्ले
-
-र्क्वे
-
-र्क्ष
-
-र्क्षं
-
-र्क्षा
-
-र्क्षी
-
-र्क्षे
-
-र्क्ष्य
-
-र्क्ष्यं
-
-र्क्ष्या
-
-र्क्ष्यो
-
-र्क्स
-
-	र्ख
-
-र्खं
-
-र्ख़
-
-र्खा
-
-र्खी
-
-र्खु
-
-र्खे
-
-र्खो
-
-र्खों
-
-र्खौ
-
-र्ख्या
-
-र्ख्यौ
-
-	र्ग
-
-र्गं
-
-र्ग़
-
-र्गा
-
-र्गां
-
-र्गी
-
-र्गीं
-
-र्गु
-
-र्गुं
-
-र्गू
-
-र्गृ
-
-र्गृ॒
-
-र्गॆ
-
-र्गे
-
-र्गै
-
-र्गो
-
-र्गों
-
-र्गौ
-
-र्ग्
-
-र्ग्य
-
-र्ग्यं
-
-र्ग्यः॑
-
-र्ग्या
-
-र्ग्यु
-
-र्ग्यू
-
-र्ग्यो
-
-र्ग्र
-
-र्ग्रा
-
-र्ग्वा
-
-र्ग॑
-
-	र्घ
-
-र्घं
-
-र्घा
-
-र्घां
-
-र्घी
-
-र्घु
-
-र्घृ
-
-र्घे
-
-र्घै
-
-र्घो
-
-र्घौ
-
-र्घ्न
-
-र्घ्य
-
-र्घ्यं
-
-र्घ्या
-
-र्घ्ये
-
-र्ङ्ग
-
-र्ङ्गं
-
-र्ङ्गा
-
-	र्च
-
-र्चं
-
-र्चा
-
-र्चां
-
-र्ची
-
-र्चु
-
-र्चू
-
-र्चे
-
-र्चें
-
-र्चै
-
-र्चो
-
-र्चों
-
-र्चो॒
-
-र्चौ
-
-र्च्
-
-र्च्च
-
-र्च्चा
-
-र्च्च्य
-
-र्च्छ
-
-र्च्छा
-
-र्च्छां
-
-र्च्छ॑
-
-र्च्य
-
-र्च्या
-
-र्च्यू
-
-र्च॑
-
-र्च॒
-
-	र्छ
-
-र्छं
-
-र्छा
-
-र्छु
-
-र्छे
-
-र्छौ
-
-र्छौं
-
-	र्ज
-
-र्जं
-
-र्जं॑
-
-र्ज़
-
-र्ज़ा
-
-र्ज़ी
-
-र्ज़े
-
-र्ज़ों
-
-र्जा
-
-र्जां
-
-र्जी
-
-र्जु
-
-र्जु॑
-
-र्जु॒
-
-र्जू
-
-र्जे
-
-र्जें
-
-र्जै
-
-र्जो
-
-र्जों
-
-र्ज्
-
-र्ज्ज
-
-र्ज्जु
-
-र्ज्ञा
-
-र्ज्ञे
-
-र्ज्ड
-
-र्ज्य
-
-र्ज्यं
-
-र्ज्या
-
-र्ज्ये
-
-र्ज्यो
-
-र्ज्व
-
-र्ज्वा
-
-र्ज॑
-
-र्ज॒
-
-	र्झ
-
-र्झा
-
-	र्ञ
-
-	र्ट
-
-र्टं
-
-र्टा
-
-र्टी
-
-र्टु
-
-र्टू
-
-र्टे
-
-र्टें
-
-र्टो
-
-र्टों
-
-र्ट्
-
-र्ट्ज
-
-र्ट्ज़
-
-र्ट्झ
-
-र्ट्र
-
-र्ट्रा
-
-र्ट्रे
-
-र्ट्स
-
-र्ट्स्
-
-	र्ठ
-
-	र्ड
-
-र्डं
-
-र्डा
-
-र्डी
-
-र्डीं
-
-र्डु
-
-र्डे
-
-र्डो
-
-र्डों
-
-र्ड्
-
-र्ड्यू
-
-र्ड्री
-
-र्ड्स
-
-र्ड्स्
-
-र्ड्स्व
-
-	र्ढ
-
-र्ढा
-
-र्ढे
-
-र्ढ्य
-
-र्ढ्या
-
-	र्ण
-
-र्णं
-
-र्णा
-
-र्णां
-
-र्णा॒
-
-र्णी
-
-र्णीं
-
-र्णु
-
-र्णू
-
-र्णॆ
-
-र्णे
-
-र्णै
-
-र्णो
-
-र्णों
-
-र्णौ
-
-र्ण्
-
-र्ण्य
-
-र्ण्यं
-
-र्ण्या
-
-र्ण्यां
-
-र्ण्ये
-
-र्ण्यो
-
-र्ण॑
-
-र्ण॒
-
-	र्त
-
-र्तं
-
-र्ता
-
-र्तां
-
-र्ताी
-
-र्ति॒
-
-र्ती
-
-र्तीं
-
-र्तु
-
-र्तुं
-
-र्तू
-
-र्तृ
-
-र्तॄ
-
-र्ते
-
-र्तें
-
-र्तै
-
-र्तो
-
-र्तों
-
-र्तौ
-
-र्त्
-
-र्त्त
-
-र्त्तं
-
-र्त्ता
-
-र्त्तां
-
-र्त्ती
-
-र्त्तु
-
-र्त्तुं
-
-र्त्तृ
-
-र्त्ते
-
-र्त्तो
-
-र्त्त्य
-
-र्त्त्या
-
-र्त्म
-
-र्त्मा
-
-र्त्मे
-
-र्त्य
-
-र्त्यं
-
-र्त्या
-
-र्त्यां
-
-र्त्ये
-
-र्त्यै
-
-र्त्यो
-
-र्त्र
-
-र्त्रा
-
-र्त्री
-
-र्त्रे
-
-र्त्रो
-
-र्त्र्
-
-र्त्र॑
-
-र्त्व
-
-र्त्वा
-
-र्त्स
-#
-र्त्स्न्ये
-
-र्त्स्य
-
-र्त॒
-
-	र्थ
-
-र्थँ
-
-र्थं
-
-र्था
-
-र्थां
-
-र्थि॑
-
-र्थी
-
-र्थीं
-
-र्थु
-
-र्थॆ
-
-र्थे
-
-र्थें
-
-र्थै
-
-र्थो
-
-र्थों
-
-र्थौ
-
-र्थ्
-
-र्थ्य
-
-र्थ्यं
-
-र्थ्या
-
-र्थ्यां
-
-र्थ्ये
-
-र्थ्यो
-
-र्थ्रो
-
-र्थ्व्य
-
-र्थ्स
-
-	र्द
-
-र्दं
-
-र्दा
-
-र्दी
-
-र्दु
-
-र्दू
-
-र्दृ
-
-र्दॆ
-
-र्दे
-
-र्दे॒
-
-र्दै
-
-र्दो
-
-र्दों
-
-र्दौ
-
-र्द्द
-
-र्द्दे
-
-र्द्ध
-
-र्द्धं
-
-र्द्धा
-
-र्द्धां
-
-र्द्धे
-
-र्द्ध्व
-
-र्द्ध्वं
-
-र्द्य
-
-र्द्या
-
-र्द्यु
-
-र्द्यू
-
-र्द्यो
-
-र्द्यौ
-
-र्द्य्
-
-र्द्र
-
-र्द्रं
-
-र्द्रा
-
-र्द्रां
-
-र्द्री
-
-र्द्रु
-
-र्द्रे
-
-र्द्रै
-
-र्द्रो
-
-र्द्रौ
-
-र्द्व
-
-र्द्वा
-
-र्द्वी
-
-र्द्वे
-
-र्द्वै
-
-र्द॑
-
-र्द॒
-
-	र्ध
-
-र्धं
-
-र्धा
-
-र्धां
-
-र्धी
-
-र्धु
-
-र्धू
-
-र्धृ
-
-र्धे
-
-र्धै
-
-र्धो
-
-र्धौ
-
-र्ध्द
-
-र्ध्न
-
-र्ध्ना
-
-र्ध्नु
-
-र्ध्नो
-
-र्ध्न्य
-
-र्ध्म
-
-र्ध्य
-
-र्ध्यं
-
-र्ध्या
-
-र्ध्ये
-
-र्ध्र
-
-र्ध्रु
-
-र्ध्व
-
-र्ध्वं
-
-र्ध्वा
-
-र्ध्वां
-
-र्ध्वीं
-
-र्ध्वे
-
-र्ध्वो
-
-र्ध॑
-
-र्ध॒
-
-	र्न
-
-र्नं
-
-र्ना
-
-र्नां
-
-र्नी
-
-र्नु
-
-र्नू
-
-र्नृ
-
-र्ने
-
-र्नै
-
-र्नॉ
-
-र्नो
-
-र्नौ
-
-र्न्
-
-र्न्ट
-
-र्न्त
-
-र्न्थे
-
-र्न्द
-
-र्न्न
-
-र्न्ना
-
-र्न्य
-
-र्न्या
-
-र्न्यू
-
-र्न्स
-
-र्न्स्ट
-
-	र्प
-
-र्पं
-
-र्पा
-
-र्पां
-
-र्पी
-
-र्पीं
-
-र्पु
-
-र्पू
-
-र्पे
-
-र्पें
-
-र्पै
-
-र्पो
-
-र्पों
-
-र्प्प
-
-र्प्य
-
-र्प्या
-
-र्प्र
-
-र्प्रा
-
-र्प्स
-
-र्प॑
-
-	र्फ
-
-र्फं
-
-र्फ़
-
-र्फ़ी
-
-र्फा
-
-र्फी
-
-र्फु
-
-र्फे
-
-र्फो
-
-र्फ्
-
-र्फ्यू
-
-र्फ्स
-
-	र्ब
-
-र्बं
-
-र्बा
-
-र्बां
-
-र्बा॒
-
-र्बी
-
-र्बु
-
-र्बू
-
-र्बृ
-
-र्बे
-
-र्बै
-
-र्बो
-
-र्ब्या
-
-र्ब्यु
-
-र्ब्र
-
-र्ब्रा
-
-र्ब्रू
-
-र्ब्स
-
-	र्भ
-
-र्भं
-
-र्भा
-
-र्भां
-
-र्भी
-
-र्भु
-
-र्भू
-
-र्भृ
-
-र्भे
-
-र्भै
-
-र्भो
-
-र्भों
-
-र्भौ
-
-र्भ्य
-
-र्भ्या
-
-र्भ्यां
-
-र्भ्यो
-
-र्भ्र
-
-र्भ्रा
-
-र्भ॑
-
-र्भ॒
-
-	र्म
-
-र्मं
-
-र्मा
-
-र्मां
-
-र्मा॑
-
-र्मा॒
-
-र्मि॒
-
-र्मी
-
-र्मीं
-
-र्मु
-
-र्मू
-
-र्मृ
-
-र्मॅ
-
-र्मॆ
-
-र्मे
-
-र्में
-
-र्मै
-
-र्मो
-
-र्मों
-
-र्मौ
-
-र्म्
-
-र्म्ड
-
-र्म्प
-
-र्म्म
-
-र्म्मा
-
-र्म्मु
-
-र्म्मे
-
-र्म्मो
-
-र्म्य
-
-र्म्यं
-
-र्म्या
-
-र्म्यु
-
-र्म्यू
-
-र्म्ये
-
-र्म्ले
-
-र्म्स
-
-र्म॑
-
-र्म॒
-
-	र्य
-
-र्यं
-
-र्यं॑
-
-र्यः॑
-
-र्या
-
-र्यां
-
-र्या॑
-
-र्या॒
-
-र्यी
-
-र्यु
-
-र्युं
-
-र्यू
-
-र्यू॑
-
-र्यॆ
-
-र्ये
-
-र्यें
-
-र्ये॑
-
-र्यै
-
-र्यॊ
-
-र्यो
-
-र्यों
-
-र्यो॑
-
-र्यो॒
-
-र्यौ
-
-र्यौँ
-
-र्यौं
-
-र्य्
-
-र्य्य
-
-र्य्यं
-
-र्य्या
-
-र्य्यां
-
-र्य्यु
-
-र्य्ये
-
-र्य्यै
-
-र्य्यो
-
-र्य॑
-
-र्य॒
-
-	र्र
-
-र्रा
-
-र्रां
-
-र्री
-
-र्रु
-
-र्रू
-
-र्रे
-
-र्रो
-
-र्रों
-
-र्र्
-
-र्र्या
-
-	र्ल
-
-र्लं
-
-र्ला
-
-र्लां
-
-र्ली
-
-र्लु
-
-र्लू
-
-र्ले
-
-र्लें
-
-र्लै
-
-र्लो
-
-र्लो॒
-
-र्लौ
-
-र्ल्
-
-र्ल्ट
-
-र्ल्ड
-
-र्ल्ड्
-
-र्ल्ड्स
-
-र्ल्या
-
-र्ल्ल
-
-र्ल्लो
-
-र्ल्स
-
-र्ल्स्
-
-	र्व
-
-र्वँ
-
-र्वं
-
-र्वं॑
-
-र्वा
-
-र्वाँ
-
-र्वां
-
-र्वा॑
-
-र्वा॒
-
-र्वि॒
-
-र्वी
-
-र्वीं
-
-र्वी॒
-
-र्वु
-
-र्वृ
-
-र्वॆ
-
-र्वे
-
-र्वें
-
-र्वे॑
-
-र्वे॒
-
-र्वै
-
-र्वै॑
-
-र्वॊ
-
-र्वो
-
-र्वों
-
-र्वो॒
-
-र्वौ
-
-र्व्
-
-र्व्य
-
-र्व्यं
-
-र्व्या
-
-र्व्यां
-
-र्व्यु
-
-र्व्यू
-
-र्व्ये
-
-र्व्यो
-
-र्व्र
-
-र्व्व
-
-र्व्वं
-
-र्व्वा
-
-र्व्वां
-
-र्व्वी
-
-र्व्वे
-
-र्व्वै
-
-र्व्वो
-
-र्व्ह
-
-र्व्हा
-
-र्व्हे
-
-र्व॑
-
-र्व॒
-
-	र्श
-
-र्शं
-
-र्शा
-
-र्शां
-
-र्शी
-
-र्शु
-
-र्शे
-
-र्शै
-
-र्शो
-
-र्शों
-
-र्शौ
-
-र्श्च
-
-र्श्य
-
-र्श्यं
-
-र्श्या
-
-र्श्र्व
-
-र्श्व
-
-र्श्वं
-
-र्श्वा
-
-र्श्वी
-
-र्श्वे
-
-र्श्वो
-
-र्श्वों
-
-	र्ष
-
-र्षं
-
-र्षा
-
-र्षां
-
-र्षी
-
-र्षीं
-
-र्षु
-
-र्षू
-
-र्षॆ
-
-र्षे
-
-र्षै
-
-र्षो
-
-र्षों
-
-र्षौ
-
-र्षौं
-
-र्ष्
-
-र्ष्ट
-
-र्ष्टा
-
-र्ष्ण
-
-र्ष्णं
-
-र्ष्णा
-
-र्ष्णे
-
-र्ष्म
-
-र्ष्मा
-
-र्ष्य
-
-र्ष्या
-
-र्ष्व
-
-	र्स
-
-र्सं
-
-र्सा
-
-र्सी
-
-र्सु
-
-र्से
-
-र्सै
-
-र्सो
-
-र्सों
-
-र्सौ
-
-र्स्
-
-र्स्क
-
-र्स्की
-
-र्स्ट
-
-र्स्टे
-
-र्स्था
-
-र्स्य
-
-र्स्या
-
-र्स्व
-
-र्स्वा
-
-	र्ह
-
-र्हं
-
-र्हा
-
-र्हां
-
-र्ही
-
-र्हीं
-
-र्हु
-
-र्हृ
-
-र्हे
-
-र्है
-
-र्हैं
-
-र्हो
-
-र्हौ
-
-र्ह्
-
-र्ह्य
-
-र्ह्या
-
-र्ह्ये
-
-र्ह्र
-
-र्ह्रा
-
-	र्ऽ
-
-	र्ा
-
-	र्ी
-
-	र्ु
-
-	र्ू
-
-	र्े
-
-र््ऋ॑
-
-र््ऋ॒
-
-र््यो
-
-र््श
-
-र््ष
-
-र््ह
-
-र््ह॑
-
-	र्ॐ
-
-	र्॒
-
-	र्‌
-
-र॑
-
-र॒
-
-	र॒॒
-
-रॢ
-
-ऱ
-
-ऱा
-
-ऱी
-
-ऱु
-
-ऱू
-
-ऱृ
-
-ऱे
-
-ऱो
-
-ऱ्ऋ॑
-
-ऱ्ठ्J
-
-	ऱ्थ
-
-ऱ्थ्
-
-ऱ्ध्
-
-	ऱ्प
-
-	ऱ्य
-
-ऱ्या
-
-ऱ्यां
-
-	ऱ्ष
-
-ऱ्षा
-
-ऱ्षि॑
-
-ऱ्ष॑
-
-ऱ्ष॒
-
-	ऱ्ह
-
-ऱ्हा
-
-ऱ्हि॑
-
-ऱ्हि॒
-
-ऱ्हे
-
-ऱ्हो
-
-ऱ्ह॑
-
-ल
-
-लँ
-
-लं
-
-	लं॑
-
-	लं॒
-
-ल़
-
-	लाॅ
-
-ला्य
-
-	ला॑
-
-	ला॒
-
-	लिे
-
-	लि॒
-
-लु
-
-	लुँ
-
-	लुं
-
-	लु॒
-
-लू
-
-	लूँ
-
-	लूं
-
-लृ
-
-लॄ
-
-लॅ
-
-	लॅं
-
-लॆ
-
-	लॆं
-
-ले
-
-	लेँ
-
-	लें
-
-	ले़
-
-	ले॑
-
-लै
-
-	लैँ
-
-	लैं
-
-लॊ
-
-लोँ॒
-
-	लो॑
-
-	लो॒
-
-ल्
-
-	ल्र
-
-ल्र्
-
-ल॑
-
-ल॒
-
-लॢ
-
-ळ
-
-ळं
-
-ळु
-
-	ळुं
-
-ळू
-
-	ळूं
-
-ळृ
-
-ळॅ
-
-ळॆ
-
-ळे
-
-	ळें
-
-ळै
-
-ळ्
-
-ळॢ
-
-ऴ
-
-ऴु
-
-ऴे
-
-ऴ्
-
-व
-
-वँ
-
-	वँ॑
-
-	वँ॒
-
-वं
-
-	वं॑
-
-	वं॒
-
-	वः॑
-
-	वः॒
-
-व़
-
-वाँ॑
-
-वाँ॒
-
-	वा॑
-
-	वा॒
-
-वि
-
-विँ॑
-
-विँ॒
-
-	वि॑
-
-	वि॒
-
-वि॒॒
-
-वीँ॒
-
-	वी॑
-
-	वी॒
-
-वु
-
-	वुं
-
-	वु॒
-
-वू
-
-	वूं
-
-वृ
-
-	वृँ
-
-	वृं
-
-	वृ॑
-
-	वृ॒
-
-वॄ
-
-वॅ
-
-वॆ
-
-वे
-
-	वेँ
-
-	वें
-
-	वे॑
-
-	वे॒
-
-वै
-
-	वैँ
-
-	वैं
-
-	वै॑
-
-	वै॒
-
-वॊ
-
-	वो॑
-
-	वो॒
-
-व्
-
-	व्र
-
-व्रं
-
-व्रु
-
-व्रू
-
-व्रे
-
-व्रै
-
-व्र्
-
-व्र॒
-
-व॑
-
-व॒
-
-	व॒॒
-
-श
-
-शँ
-
-शं
-
-	शं॒
-
-	शः॑
-
-	शः॒
-
-	श़्
-
-	शा॑
-
-	शा॒
-
-	शि॑
-
-	शि॒
-
-	शी॑
-
-	शी॒
-
-शु
-
-	शुं
-
-	शु॑
-
-	शु॒
-
-शू
-
-	शूं
-
-	शू॒
-
-शृ
-
-	शृं
-
-	शृ॑
-
-	शृ॒
-
-शॄ
-
-शॅ
-
-शॆ
-
-शे
-
-	शें
-
-	शे॑
-
-	शे॒
-
-शै
-
-	शैँ
-
-	शैं
-
-शॊ
-
-	शो॑
-
-	शो॒
-
-श्
-
-	श्र
-
-श्रं
-
-श्रा॑
-
-श्रि॒
-
-श्रु
-
-श्रुं
-
-श्रु॒
-
-श्रू
-
-श्रूं
-
-श्रृ
-
-श्रृं
-
-श्रॆ
-
-श्रे
-
-श्रै
-
-श्र्
-
-श्र॑
-
-श्र॒
-
-श॑
-
-श॒
-
-	श॒॒
-
-शॢ
-
-ष
-
-षँ
-
-षं
-
-	षं॑
-
-	षं॒
-
-	षः॑
-
-	षः॒
-
-ष़
-
-	ष़ु
-
-षां॑
-
-षां॒
-
-	षा॑
-
-	षा॒
-
-षा॒॒
-
-	षि॑
-
-	षि॒
-
-	षी॑
-
-	षी॒
-
-षु
-
-	षुं
-
-	षु॑
-
-	षु॒
-
-षू
-
-	षू॒
-
-षृ
-
-षॅ
-
-षॆ
-
-षे
-
-	षें
-
-	षे॑
-
-	षे॒
-
-षै
-
-षॊ
-
-	षो॑
-
-	षो॒
-
-ष्
-
-	ष्र
-
-ष्र्
-
-ष॑
-
-ष॒
-
-	ष॒॒
-
-षॢ
-
-स
-
-सँ
-
-सं
-
-	संं
-
-	सं॑
-
-	सं॒
-
-	सः॑
-
-	सः॒
-
-स़
-
-	स़ु
-
-	स़्
-
-सां॒
-
-साः॑
-
-सा्र
-
-	सा॑
-
-	सा॒
-
-	सि॑
-
-	सि॒
-
-सि॒॒
-
-	सी॑
-
-	सी॒
-
-सु
-
-	सुँ
-
-	सुं
-
-	सु॑
-
-	सु॒
-
-सू
-
-	सूँ
-
-	सूं
-
-	सू॑
-
-	सू॒
-
-सृ
-
-	सृं
-
-	सृ॑
-
-	सृ॒
-
-सॄ
-
-सॅ
-
-सॆ
-
-	सॆं
-
-से
-
-	सें
-
-	से॑
-
-	से॒
-
-सै
-
-	सैँ
-
-	सैं
-
-	सै॒
-
-सॊ
-
-	सो॑
-
-	सो॒
-
-	सौ॑
-
-	सौ॒
-
-स्
-
-	स्र
-
-स्रं
-
-स्रा॒
-
-स्रु
-
-स्रु॒
-
-स्रे
-
-स्रै
-
-स्र्
-
-स्र॑
-
-स्र॒
-
-स॑
-
-स॒
-
-	स॒॒
-
-सॢ
-
-ह
-
-हँ
-
-	हँु
-
-हं
-
-	हः॑
-
-	हाॅ
-
-	हा॑
-
-	हा॒
-
-	हि॑
-
-	हि॒
-
-	ही॒
-
-हु
-
-	हुँ
-
-	हुं
-
-	हुॅ
-
-	हु॑
-
-	हु॒
-
-हू
-
-	हूँ
-
-	हूं
-
-	हू॑
-
-	हू॒
-
-हृ
-
-	हृ॑
-
-	हृ॒
-
-हॄ
-
-हॅ
-
-	हॅू
-
-हॆ
-
-हे
-
-	हेँ
-
-	हें
-
-	हे॑
-
-	हे॒
-
-है
-
-	हैँ
-
-	हैं
-
-	है॒
-
-हॊ
-
-हो्द
-
-	हो॑
-
-	हो॒
-
-ह्
-
-	ह्ण
-
-ह्णं
-
-ह्णा॒
-
-ह्णी॒
-
-ह्णू
-
-ह्णे
-
-ह्ण्
-
-	ह्न
-
-ह्नं
-
-ह्नु
-
-ह्नू
-
-ह्ने
-
-ह्नै
-
-ह्न्
-
-	ह्म
-
-ह्मं
-
-ह्मे
-
-ह्मै
-
-ह्म्
-
-ह्म॑
-
-ह्म॒
-
-	ह्य
-
-ह्यं
-
-ह्या॑
-
-ह्यु
-
-ह्युं
-
-ह्यू
-
-ह्यृ
-
-ह्ये
-
-ह्ये॑
-
-ह्यै
-
-ह्य्
-
-ह्य॑
-
-ह्य॒
-
-	ह्र
-
-ह्रं
-
-ह्रि॒
-
-ह्रु
-
-ह्रू
-
-ह्रूं
-
-ह्रृ
-
-ह्रे
-
-ह्रै
-
-ह्र्
-
-	ह्ल
-
-ह्ले
-
-ह्ल्
-
-	ह्व
-
-ह्वं
-
-ह्वा॑
-
-ह्वृ
-
-ह्वे
-
-ह्वै
-
-ह्व्
-
-ह्व॑
-
-ह॑
-
-ह॒
-
-हॢ
-
-ऺ
-
-़
-
-ऽ
-
-ऽं
-
-ा
-
-ाँ
-
-ां
-
-ि
-
-ी
-
-ीँ
-
-ीं
-
-ु
-
-ू
-
-ृ
-
-ॄ
-
-ॅ
-
-ॆ
-
-े
-
-ै
-
-ॉ
-
-ॉँ
-
-ॉं
-
-ॊ
-
-ो
-
-ोँ
-
-ों
-
-ौ
-
-ौँ
-
-ौं
-
-्
-
-्द
-
-्य
-
-्र
-
-्व
-
-ॐ
-
-॑
-
-॒
-
-॓
-
-क़
-
-ख़
-
-ग़
-
-ज़
-
-ड़
-
-ड़े
-
-ढ़
-
-फ़
-
-य़
-
-ॠ
-
-ॡ
-
-ॣ
-
-।
-
-॥
-
-०
-
-१
-
-२
-
-३
-
-४
-
-५
-
-६
-
-७
-
-८
-
-९
-
-॰
-
-॰़
-
-॰ु
-
-ॲ
-
-ঁ
-
-ং
-
-ংঃ
-
-ঃ
-
-ঃঃ
-
-অ
-
-অঁ
-
-	অ্য
-
-অ‌
-
-আ
-
-আঁ
-
-	আ্য
-
-ই
-
-ইঁ
-
-ই্
-
-ঈ
-
-উ
-
-উঁ
-
-উ্ত্‍
-
-	উ্য
-
-ঊ
-
-ঋ
-
-ঌ
-
-এ
-
-এঁ
-
-	এ্য
-
-এ‌
-
-ঐ
-
-ও
-
-ওঁ
-
-	ও্য
-
-ঔ
-
-ঔঁ
-
-ক
-
-কঁ
-
-কু
-
-	কুঁ
-
-কূ
-
-কৃ
-
-কৃ্ত
-
-কৄ
-
-ক্
-
-	ক্ক
-
-ক্কু
-
-ক্ক্বু
-
-ক্ক্র
-
-	ক্খ
-
-	ক্চ
-
-	ক্জ
-
-	ক্ট
-
-ক্টু
-
-ক্ট্র
-
-ক্ট্স
-
-ক্ট্ৰ
-
-	ক্ড
-
-	ক্ত
-
-ক্তু
-
-ক্তৃ
-
-ক্ত্ব
-
-ক্ত্র
-
-ক্ত্র্র
-
-ক্ত্ৰ
-
-	ক্থ
-
-	ক্ন
-
-	ক্ফ
-
-	ক্ব
-
-ক্বু
-
-ক্ব্র
-
-	ক্ভ
-
-	ক্ম
-
-ক্মু
-
-ক্ম্র
-
-ক্য্র
-
-	ক্র
-
-ক্রু
-
-ক্রূ
-
-ক্রৃ
-
-ক্র্য
-
-ক্র্র
-
-	ক্ল
-
-ক্লু
-
-ক্ল্
-
-ক্ল্র
-
-	ক্ষ
-
-ক্ষু
-
-ক্ষূ
-
-ক্ষ্
-
-ক্ষ্ণ
-
-ক্ষ্ণ্র
-
-ক্ষ্ন
-
-ক্ষ্ব
-
-ক্ষ্বু
-
-ক্ষ্ব্র
-
-ক্ষ্ম
-
-ক্ষ্ম্র
-
-ক্ষ্য্র
-
-ক্ষ্র
-
-	ক্স
-
-ক্সু
-
-ক্স্
-
-ক্স্ট
-
-ক্স্র
-
-	ক্ৰ
-
-ক্ৰু
-
-ক্ৰূ
-
-ক্ৰ্য
-
-	ক্‌
-
-কৢ
-
-ক‌
-
-খ
-
-খঁ
-
-	খঁু
-
-খ়
-
-	খ়্
-
-খু
-
-	খুঁ
-
-খু্ব
-
-খূ
-
-খৃ
-
-খ্
-
-	খ্ট
-
-	খ্ত
-
-	খ্ম
-
-খ্য্র
-
-	খ্র
-
-খ্র্র
-
-	খ্ল
-
-	খ্স
-
-	খ্ৰ
-
-খ্ৰু
-
-	খ্‌
-
-গ
-
-গঁ
-
-গ়
-
-গু
-
-	গুঁ
-
-গূ
-
-গৃ
-
-গৄ
-
-গ্
-
-	গ্গ
-
-	গ্জ
-
-	গ্ঞ
-
-	গ্ণ
-
-গ্ণ্র
-
-	গ্ধ
-
-গ্ধু
-
-গ্ধ্র
-
-	গ্ন
-
-গ্নু
-
-গ্ন্য্র
-
-গ্ন্র
-
-	গ্ব
-
-গ্ব্র
-
-	গ্ম
-
-গ্ম্র
-
-গ্য্র
-
-	গ্র
-
-গ্রঁ
-
-গ্রু
-
-গ্র্য
-
-গ্র্র
-
-	গ্ল
-
-গ্লু
-
-গ্ল্
-
-গ্ল্র
-
-	গ্স
-
-	গ্ৰ
-
-গ্ৰু
-
-গ্ৰ্য
-
-গ্ৰ্হ
-
-	গ্‌
-
-গ‌
-
-ঘ
-
-ঘঁ
-
-ঘু
-
-	ঘুঁ
-
-ঘূ
-
-ঘৃ
-
-	ঘ্ট
-
-	ঘ্ন
-
-ঘ্ন্র
-
-ঘ্য্র
-
-	ঘ্র
-
-ঘ্র্র
-
-	ঘ্ৰ
-
-ঙ
-
-ঙু
-
-ঙ্
-
-	ঙ্ক
-
-ঙ্কু
-
-ঙ্কৃ
-
-ঙ্ক্ত
-
-ঙ্ক্য্র
-
-ঙ্ক্র
-
-ঙ্ক্ষ
-
-ঙ্ক্ষু
-
-ঙ্ক্ষ্র
-
-	ঙ্খ
-
-ঙ্খ্র
-
-	ঙ্গ
-
-ঙ্গঁ
-
-ঙ্গু
-
-ঙ্গ্য্র
-
-ঙ্গ্র
-
-ঙ্ঘ্য্র
-
-ঙ্ঘ্র
-
-ঙ্ঘ্র্র
-
-	ঙ্ম
-
-ঙ্মু
-
-ঙ্ম্র
-
-	ঙ্‌
-
-চ
-
-চঁ
-
-চু
-
-	চুঁ
-
-চূ
-
-	চূঁ
-
-চৃ
-
-চ্
-
-	চ্আ
-
-	চ্ক
-
-	চ্চ
-
-চ্চু
-
-চ্চ্র
-
-	চ্ছ
-
-চ্ছু
-
-চ্ছৃ
-
-চ্ছ্ব
-
-চ্ছ্বু
-
-চ্ছ্ব্র
-
-চ্ছ্র
-
-চ্ছ্রু
-
-চ্ছ্র্র
-
-চ্ছ্ৰ
-
-চ্ছ্‌
-
-	চ্ঞ
-
-চ্ঞু
-
-চ্ঞ্র
-
-চ্য্র
-
-	চ্র
-
-	চ্‌
-
-ছ
-
-ছঁ
-
-ছু
-
-	ছুঁ
-
-ছূ
-
-ছ্
-
-	ছ্ত
-
-	ছ্র
-
-	ছ্ল
-
-	ছ্‌
-
-জ
-
-জঁ
-
-জ়
-
-	জ়্
-
-জু
-
-	জুঁ
-
-জূ
-
-জ্
-
-	জ্গ
-
-	জ্জ
-
-জ্জু
-
-জ্জ্ব
-
-জ্জ্ব্র
-
-জ্জ্র
-
-	জ্ঝ
-
-জ্ঝ্র
-
-	জ্ঞ
-
-জ্ঞু
-
-জ্ঞ্র
-
-	জ্ড
-
-	জ্ন
-
-	জ্ব
-
-জ্বু
-
-জ্ব্র
-
-	জ্ম
-
-জ্য়
-
-জ্য্র
-
-	জ্র
-
-জ্রু
-
-জ্র্র
-
-	জ্ৰ
-
-	জ্‌
-
-ঝ
-
-ঝঁ
-
-ঝ়
-
-ঝু
-
-	ঝুঁ
-
-	ঝ্র
-
-ঞ
-
-ঞঁ
-
-ঞু
-
-ঞ্
-
-	ঞ্চ
-
-ঞ্চু
-
-ঞ্চ্র
-
-	ঞ্ছ
-
-ঞ্ছু
-
-ঞ্ছ্র
-
-	ঞ্জ
-
-ঞ্জু
-
-ঞ্জ্র
-
-	ঞ্ঝ
-
-ঞ্ঝু
-
-ঞ্ঝ্র
-
-ট
-
-টঁ
-
-টু
-
-টূ
-
-টৃ
-
-ট্
-
-	ট্ও
-
-	ট্চ
-
-ট্চ্
-
-	ট্ছ
-
-	ট্জ
-
-ট্জ্র
-
-	ট্ট
-
-ট্টু
-
-ট্ট্র
-
-	ট্ঠ
-
-	ট্ব
-
-ট্ব্র
-
-	ট্ম
-
-ট্ম্র
-
-ট্য্র
-
-	ট্র
-
-ট্রু
-
-ট্র্য
-
-ট্র্র
-
-	ট্ল
-
-	ট্স
-
-ট্স্
-
-ট্স্ক
-
-	ট্ৰ
-
-ট্ৰু
-
-	ট্‌
-
-ঠ
-
-ঠু
-
-	ঠ্র
-
-ড
-
-ডঁ
-
-ড়
-
-	ড়ঁ
-
-	ড়ু
-
-	ড়ূ
-
-ড়্গ
-
-ড়্র
-
-ডু
-
-ড্
-
-	ড্ড
-
-ড্ডু
-
-ড্ড্র
-
-	ড্থ
-
-	ড্ব
-
-	ড্ম
-
-ড্য্র
-
-	ড্র
-
-ড্রু
-
-ড্রূ
-
-ড্র্র
-
-	ড্ল
-
-	ড্স
-
-	ড্ৰ
-
-	ড্‌
-
-ঢ
-
-ঢঁ
-
-ঢ়
-
-	ঢ়ু
-
-ঢ়্র
-
-ঢু
-
-	ঢুঁ
-
-ঢ্য্র
-
-	ঢ্র
-
-ঢ্র্র
-
-ণ
-
-ণু
-
-ণূ
-
-ণ্
-
-	ণ্চ
-
-	ণ্ট
-
-ণ্টু
-
-ণ্ট্র
-
-ণ্ট্ৰ
-
-ণ্ট্‌
-
-	ণ্ঠ
-
-ণ্ঠু
-
-ণ্ঠ্র
-
-	ণ্ড
-
-ণ্ডু
-
-ণ্ডূ
-
-ণ্ড্য্র
-
-ণ্ড্র
-
-ণ্ড্রু
-
-ণ্ড্র্র
-
-ণ্ড্ৰ
-
-ণ্ড্ৰু
-
-	ণ্ঢ
-
-ণ্ঢ্র
-
-	ণ্ণ
-
-	ণ্ত
-
-ণ্ত্র
-
-	ণ্থ
-
-	ণ্ন
-
-ণ্ন্র
-
-	ণ্ব
-
-ণ্ব্র
-
-	ণ্ম
-
-ণ্ম্র
-
-ণ্য্র
-
-	ণ্র
-
-	ণ্স
-
-	ণ্‌
-
-ত
-
-তঁ
-
-তু
-
-	তুঁ
-
-তু্ল
-
-তূ
-
-তৃ
-
-তৄ
-
-ত্
-
-	ত্ক
-
-ত্কৃ
-
-ত্ক্ষ
-
-	ত্খ
-
-ত্গু
-
-	ত্চ
-
-	ত্জ
-
-	ত্ত
-
-ত্তু
-
-ত্তূ
-
-ত্ত্ব
-
-ত্ত্ব্র
-
-ত্ত্র
-
-	ত্থ
-
-ত্থু
-
-ত্থ্র
-
-	ত্ধ
-
-	ত্ন
-
-ত্নু
-
-ত্ন্র
-
-	ত্প
-
-ত্পু
-
-	ত্ব
-
-ত্ব্ব
-
-	ত্ম
-
-ত্মৃ
-
-ত্ম্য্র
-
-ত্ম্র
-
-ত্য়
-
-ত্য্র
-
-	ত্র
-
-ত্রু
-
-ত্রূ
-
-ত্রৃ
-
-ত্র্
-
-ত্র্য
-
-ত্র্র
-
-	ত্ল
-
-	ত্স
-
-ত্সু
-
-ত্সৃ
-
-ত্স্
-
-ত্স্ন
-
-	ত্ৰ
-
-ত্ৰু
-
-ত্ৰূ
-
-ত্ৰ্য
-
-ত্ৰ্ৰ
-
-	ত্‌
-
-	ত্‍
-
-থ
-
-থঁ
-
-থ়
-
-থু
-
-থূ
-
-থ্
-
-	থ্থ
-
-	থ্ন
-
-	থ্ব
-
-থ্ব্র
-
-থ্য্র
-
-	থ্র
-
-থ্রু
-
-থ্র্র
-
-	থ্ল
-
-	থ্ৰ
-
-থ্ৰু
-
-	থ্‌
-
-দ
-
-দঁ
-
-দ়
-
-দু
-
-দূ
-
-দৃ
-
-দৄ
-
-দ্
-
-	দ্গ
-
-দ্গু
-
-দ্গ্র
-
-দ্ঘ্র
-
-দ্দ্ব
-
-দ্দ্ব্র
-
-দ্দ্র
-
-	দ্ধ
-
-দ্ধু
-
-দ্ধৃ
-
-দ্ধ্র
-
-	দ্ন
-
-	দ্ব
-
-দ্বু
-
-দ্বৃ
-
-দ্ব্র
-
-	দ্ভ
-
-দ্ভু
-
-দ্ভূ
-
-দ্ভৃ
-
-দ্ভ্র
-
-	দ্ম
-
-দ্ম্র
-
-দ্য়
-
-দ্য্র
-
-	দ্র
-
-দ্রু
-
-দ্রূ
-
-দ্র্য
-
-দ্র্র
-
-	দ্স
-
-	দ্ৰ
-
-দ্ৰু
-
-দ্ৰূ
-
-দ্ৰ্য
-
-	দ্ৱ
-
-	দ্‌
-
-দ‌
-
-দ‌্য
-
-ধ
-
-ধঁ
-
-ধু
-
-	ধুঁ
-
-ধূ
-
-	ধূঁ
-
-ধৃ
-
-ধৄ
-
-	ধ্ধ
-
-	ধ্ন
-
-ধ্ন্র
-
-	ধ্ব
-
-ধ্ব্র
-
-	ধ্ম
-
-ধ্ম্র
-
-ধ্য্র
-
-	ধ্র
-
-ধ্রু
-
-ধ্র্র
-
-	ধ্ৰ
-
-ধ্ৰু
-
-ধ্ৰূ
-
-ন
-
-নঁ
-
-নু
-
-নু্য
-
-নু্ষ্ঠ
-
-নু্হ
-
-নূ
-
-নৃ
-
-ন্
-
-	ন্ক
-
-	ন্খ
-
-ন্গু
-
-	ন্চ
-
-	ন্জ
-
-ন্জু
-
-	ন্ট
-
-ন্টু
-
-ন্ট্
-
-ন্ট্র
-
-ন্ট্স
-
-ন্ট্ৰ
-
-	ন্ঠ
-
-ন্ঠু
-
-ন্ঠ্র
-
-	ন্ড
-
-ন্ডু
-
-ন্ড্
-
-ন্ড্র
-
-ন্ড্রু
-
-ন্ড্ল
-
-ন্ড্স
-
-ন্ড্ৰ
-
-	ন্ত
-
-ন্তু
-
-ন্তূ
-
-ন্তৃ
-
-ন্ত্
-
-ন্ত্ত
-
-ন্ত্তু
-
-ন্ত্ব
-
-ন্ত্ব্র
-
-ন্ত্য্র
-
-ন্ত্র
-
-ন্ত্রু
-
-ন্ত্র্য
-
-ন্ত্র্র
-
-ন্ত্ৰ
-
-	ন্থ
-
-ন্থু
-
-ন্থ্র
-
-ন্দ্ব
-
-ন্দ্ব্ব
-
-ন্দ্ব্র
-
-ন্দ্য্র
-
-ন্দ্র
-
-ন্দ্র্
-
-ন্দ্র্র
-
-	ন্ধ
-
-ন্ধু
-
-ন্ধ্য্র
-
-ন্ধ্র 
-
-ন্ধ্র্র 
-
-ন্ধ্ৰ 
-
-	ন্ন 
-
-ন্নু 
-
-ন্ন্র 
-
-	ন্প 
-
-	ন্ফ 
-
-	ন্ব 
-
-ন্বু 
-
-ন্বৃ 
-
-ন্ব্র 
-
-	ন্ম 
-
-ন্মু 
-
-ন্মূ 
-
-ন্ম্র 
-
-ন্য় 
-
-ন্য্র 
-
-	ন্র 
-
-	ন্ল 
-
-ন্শ্ট 
-
-ন্ষ্ট 
-
-	ন্স 
-
-ন্সু 
-
-ন্স্ 
-
-ন্স্ক 
-
-ন্স্ট 
-
-ন্স্র 
-
-ন্স্ল 
-
-	ন্ৎ 
-
-	ন্‌ 
-
-প 
-
-পঁ 
-
-পু 
-
-	পুঁ 
-
-পু্ত্ৰ 
-
-পু্র 
-
-পূ 
-
-	পূঁ 
-
-পূ্ব 
-
-পৃ 
-
-পৄ 
-
-প্ 
-
-	প্ট 
-
-প্টু 
-
-প্ট্র 
-
-	প্ত 
-
-প্তু 
-
-প্ত্র 
-
-	প্থ 
-
-	প্ন 
-
-প্নু 
-
-প্ন্র 
-
-	প্প 
-
-প্পু 
-
-প্প্র 
-
-	প্ফ 
-
-	প্ব 
-
-প্য্র 
-
-	প্র 
-
-প্রু 
-
-প্র্য 
-
-প্র্র 
-
-	প্ল 
-
-প্লু 
-
-প্ল্র 
-
-	প্স 
-
-প্সু 
-
-প্স্ 
-
-প্স্র 
-
-	প্ৎ 
-
-	প্ৰ 
-
-প্ৰু 
-
-প্ৰ্ত 
-
-প্ৰ্য় 
-
-প্ৰ্স 
-
-	প্‌ 
-
-ফ 
-
-ফঁ 
-
-ফ় 
-
-ফু 
-
-	ফুঁ 
-
-ফূ 
-
-ফৃ 
-
-ফ্ 
-
-ফ্ক্ব 
-
-	ফ্ট 
-
-	ফ্ত 
-
-	ফ্ফ 
-
-	ফ্র 
-
-ফ্রঁ 
-
-ফ্রু 
-
-ফ্র্য 
-
-ফ্র্র 
-
-	ফ্ল 
-
-ফ্লু 
-
-ফ্ল্র 
-
-	ফ্স 
-
-	ফ্ৰ 
-
-	ফ্‌ 
-
-ব 
-
-বঁ 
-
-বু 
-
-	বুঁ 
-
-বূ 
-
-বৃ 
-
-বৄ 
-
-বে 
-
-ব্ 
-
-	ব্জ 
-
-ব্জ্র 
-
-ব্দ্ধ 
-
-ব্দ্র 
-
-	ব্ধ 
-
-ব্ধ্র 
-
-	ব্ন 
-
-	ব্ব 
-
-ব্বু 
-
-ব্ব্র 
-
-ব্য় 
-
-ব্য্ক্ত 
-
-ব্য্র 
-
-	ব্র 
-
-ব্রু 
-
-ব্রূ 
-
-ব্রৃ 
-
-ব্র্য 
-
-ব্র্র 
-
-	ব্ল!
-
-ব্লঁ!
-
-ব্লু!
-
-ব্ল্!
-
-ব্ল্র!
-
-	ব্স!
-
-	ব্ৰ!
-
-ব্ৰু!
-
-ব্ৰ্য!
-
-ব্ৰ্হ্ম!
-
-	ব্ৱ!
-
-	ব্‌!
-
-ব‌!
-
-ভ!
-
-ভঁ!
-
-ভ়!
-
-	ভ়্!
-
-ভু!
-
-	ভুঁ!
-
-ভূ!
-
-	ভূঁ!
-
-ভৃ!
-
-ভ্!
-
-	ভ্চ!
-
-	ভ্ন!
-
-ভ্য্র!
-
-	ভ্র!
-
-ভ্রু!
-
-ভ্রূ!
-
-ভ্রৃ!
-
-ভ্র্!
-
-ভ্র্র!
-
-	ভ্ল!
-
-	ভ্স!
-
-ভ্স্ক!
-
-	ভ্ৰ!
-
-ভ্ৰু!
-
-ভ্ৰূ!
-
-	ভ্‌!
-
-ম!
-
-মঁ!
-
-মু!
-
-মূ!
-
-মূ্হ!
-
-মৃ!
-
-মৄ!
-
-ম্!
-
-	ম্ক!
-
-ম্গ্ৰ!
-
-	ম্চ!
-
-	ম্ছ!
-
-	ম্ড!
-
-	ম্ত!
-
-	ম্থ!
-
-ম্থ্র!
-
-	ম্ন!
-
-ম্নু!
-
-ম্ন্র!
-
-	ম্প!
-
-ম্পু!
-
-ম্পূ!
-
-ম্পৃ!
-
-ম্প্র!
-
-ম্প্রু!
-
-ম্প্র্র!
-
-ম্প্ল!
-
-ম্প্স!
-
-ম্প্ৰ!
-
-	ম্ফ!
-
-ম্ফু!
-
-ম্ফ্র!
-
-	ম্ব!
-
-ম্বু!
-
-ম্বূ!
-
-ম্বৃ!
-
-ম্ব্র!
-
-ম্ব্ল!
-
-ম্ব্ৰ!
-
-	ম্ভ!
-
-ম্ভু!
-
-ম্ভূ!
-
-ম্ভৃ!
-
-ম্ভ্র!
-
-ম্ভ্রু!
-
-ম্ভ্র্র!
-
-ম্ভ্ৰ!
-
-	ম্ম!
-
-ম্মু!
-
-ম্মূ!
-
-ম্মৃ!
-
-ম্ম্র!
-
-ম্য্র!
-
-	ম্র!
-
-ম্র্র!
-
-	ম্ল!
-
-ম্ল্র!
-
-	ম্স!
-
-ম্স্ক!
-
-	ম্ৰ!
-
-	ম্‌!
-
-ম‌!
-
-য!
-
-যঁ!
-
-য়!
-
-	য়ঁ!
-
-	য়ু!
-
-	য়ূ!
-
-	য়ৃ!
-
-	য়্!
-
-য়্ক!
-
-য়্ণ!
-
-য়্ত!
-
-য়্ন!
-
-য়্ম!
-
-য়্য়!
-
-য়্র!
-
-যু!
-
-	যুঁ!
-
-যু্ক্ত!
-
-যু্দ্ধ!
-
-যূ!
-
-যৃ!
-
-য্!
-
-য্য্র!
-
-	য্র!
-
-র!
-
-রঁ!
-
-র়!
-
-রু"
-
-রূ"
-
-রৃ"
-
-র্"
-
-	র্ক"
-
-র্কু"
-
-র্ক্ত"
-
-র্ক্য"
-
-র্ক্যু"
-
-র্ক্য্র"
-
-র্ক্র"
-
-র্ক্ল"
-
-র্ক্স"
-
-	র্খ"
-
-র্খু"
-
-র্খ্য"
-
-র্খ্যু"
-
-র্খ্য্র"
-
-র্খ্র"
-
-	র্গ"
-
-র্গু"
-
-র্গ্য"
-
-র্গ্যু"
-
-র্গ্য্র"
-
-র্গ্র"
-
-	র্ঘ"
-
-র্ঘু"
-
-র্ঘ্য"
-
-র্ঘ্যু"
-
-র্ঘ্য্র"
-
-র্ঘ্র"
-
-	র্ঙ"
-
-র্ঙ্য"
-
-	র্চ"
-
-র্চু"
-
-র্চ্চ"
-
-র্চ্য"
-
-র্চ্যু"
-
-র্চ্য্র"
-
-র্চ্র"
-
-	র্ছ"
-
-র্ছ্য"
-
-র্ছ্য্র"
-
-র্ছ্র"
-
-	র্জ"
-
-র্জু"
-
-র্জ্জ"
-
-র্জ্ঞ"
-
-র্জ্য"
-
-র্জ্য্র"
-
-র্জ্র"
-
-	র্ঝ"
-
-র্ঝ্য"
-
-র্ঝ্য্র"
-
-র্ঝ্র"
-
-	র্ঞ"
-
-র্ঞ্য"
-
-	র্ট"
-
-র্টু"
-
-র্ট্"
-
-র্ট্ছ"
-
-র্ট্য"
-
-র্ট্য্র"
-
-র্ট্র"
-
-র্ট্স"
-
-	র্ঠ"
-
-র্ঠ্য"
-
-র্ঠ্য্র"
-
-র্ঠ্র"
-
-	র্ড"
-
-র্ড়"
-
-র্ড়্য"
-
-র্ড্য"
-
-র্ড্য্র"
-
-	র্ঢ"
-
-র্ঢ়"
-
-র্ঢ়্য"
-
-র্ঢ্য"
-
-র্ঢ্য্র"
-
-	র্ণ"
-
-র্ণ্য"
-
-র্ণ্য্র"
-
-র্ণ্র"
-
-	র্ত"
-
-র্তু"
-
-র্তৃ"
-
-র্ত্ত"
-
-র্ত্য"
-
-র্ত্য্র"
-
-র্ত্র"
-
-র্ত্র্"
-
-	র্থ"
-
-র্থু"
-
-র্থ্য"
-
-র্থ্য্র"
-
-র্থ্র"
-
-	র্দ"
-
-র্দু"
-
-র্দূ"
-
-র্দৃ"
-
-র্দ্দ"
-
-র্দ্ধ"
-
-র্দ্ব"
-
-র্দ্য"
-
-র্দ্য্র"
-
-র্দ্র"
-
-	র্ধ"
-
-র্ধ্ব"
-
-র্ধ্য"
-
-র্ধ্য্র"
-
-র্ধ্র"
-
-	র্ন"
-
-র্নু"
-
-র্ন্ড"
-
-র্ন্ত"
-
-র্ন্য"
-
-র্ন্য্র"
-
-র্ন্র"
-
-র্ন্স"
-
-	র্প"
-
-র্পু"
-
-র্পূ"
-
-র্প্য"
-
-র্প্য্র"
-
-র্প্র"
-
-	র্ফ"
-
-র্ফু"
-
-র্ফ্য"
-
-র্ফ্যু#
-
-র্ফ্য্র#
-
-র্ফ্র#
-
-	র্ব#
-
-র্বু#
-
-র্বৃ#
-
-র্ব্ব#
-
-র্ব্য#
-
-র্ব্য্র#
-
-র্ব্র#
-
-	র্ভ#
-
-র্ভু#
-
-র্ভূ#
-
-র্ভ্য#
-
-র্ভ্যু#
-
-র্ভ্য্র#
-
-র্ভ্র#
-
-	র্ম#
-
-র্মু#
-
-র্মূ#
-
-র্ম্প#
-
-র্ম্ম#
-
-র্ম্য#
-
-র্ম্য্র#
-
-র্ম্র#
-
-	র্য#
-
-র্য়#
-
-র্য়্য#
-
-র্যু#
-
-র্য্য#
-
-র্য্যু#
-
-র্য্য্র#
-
-র্য্র#
-
-	র্র#
-
-	র্ল#
-
-র্লু#
-
-র্ল্ড#
-
-র্ল্য#
-
-র্ল্য্র#
-
-র্ল্র#
-
-	র্শ#
-
-র্শু#
-
-র্শ্ব#
-
-র্শ্য#
-
-র্শ্যু#
-
-র্শ্য্র#
-
-র্শ্র#
-
-	র্ষ#
-
-র্ষু#
-
-র্ষ্ট#
-
-র্ষ্য#
-
-র্ষ্য্র#
-
-র্ষ্র#
-
-	র্স#
-
-র্সু#
-
-র্সূ#
-
-র্স্#
-
-র্স্ক#
-
-র্স্ট#
-
-র্স্য#
-
-র্স্য্র#
-
-র্স্র#
-
-	র্হ#
-
-র্হ্য#
-
-র্হ্য্র#
-
-র্হ্র#
-
-	র্ৎ#
-
-ল#
-
-লঁ#
-
-লু#
-
-লূ#
-
-লৃ#
-
-ল্#
-
-	ল্ক#
-
-ল্ক্র#
-
-	ল্খ#
-
-	ল্গ#
-
-ল্গু#
-
-ল্গ্র#
-
-	ল্ছ#
-
-	ল্জ#
-
-	ল্ট#
-
-ল্টু#
-
-ল্ট্#
-
-ল্ট্চু#
-
-ল্ট্র#
-
-	ল্ড#
-
-ল্ডু#
-
-ল্ড্র#
-
-ল্ড্স#
-
-	ল্ত#
-
-	ল্থ#
-
-ল্দ্স#
-
-	ল্ধ#
-
-ল্ধ্র#
-
-	ল্প#
-
-ল্পু#
-
-ল্প্র#
-
-	ল্ফ#
-
-ল্ফ্#
-
-	ল্ব#
-
-ল্বু#
-
-ল্ব্র#
-
-	ল্ভ#
-
-ল্ভু#
-
-ল্ভ্র#
-
-	ল্ম#
-
-ল্মু#
-
-ল্ম্#
-
-ল্ম্র#
-
-ল্ম্স#
-
-ল্য়#
-
-ল্য্র#
-
-	ল্র#
-
-	ল্ল#
-
-ল্লু#
-
-ল্ল্র#
-
-	ল্স#
-
-ল্স্#
-
-ল্স্ট#
-
-ল্স্ত#
-
-	ল্ৎ#
-
-	ল্‌#
-
-ল‌#
-
-শ#
-
-শঁ#
-
-শু#
-
-	শুঁ#
-
-শূ$
-
-শৃ$
-
-শ্$
-
-	শ্ক$
-
-	শ্চ$
-
-শ্চু$
-
-শ্চূ$
-
-শ্চৃ$
-
-শ্চ্র$
-
-	শ্ছ$
-
-	শ্ট$
-
-	শ্ঠ$
-
-	শ্ত$
-
-শ্তু$
-
-শ্ত্র$
-
-	শ্ন$
-
-শ্নু$
-
-শ্নূ$
-
-শ্ন্র$
-
-	শ্প$
-
-	শ্ব$
-
-শ্বু$
-
-শ্ব্ব$
-
-শ্ব্র$
-
-	শ্ম$
-
-শ্মু$
-
-শ্মৃ$
-
-শ্ম্র$
-
-শ্য্র$
-
-	শ্র$
-
-শ্রু$
-
-শ্রূ$
-
-শ্র্য$
-
-শ্র্র$
-
-	শ্ল$
-
-শ্লু$
-
-শ্ল্র$
-
-	শ্ৎ$
-
-	শ্ৰ$
-
-শ্ৰু$
-
-শ্ৰূ$
-
-	শ্ৱ$
-
-শ‌$
-
-ষ$
-
-ষু$
-
-ষূ$
-
-ষ্$
-
-	ষ্ক$
-
-ষ্কু$
-
-ষ্কৃ$
-
-ষ্ক্র$
-
-ষ্ক্র্র$
-
-ষ্ক্ৰ$
-
-	ষ্খ$
-
-	ষ্ঞ$
-
-	ষ্ট$
-
-ষ্টু$
-
-ষ্ট্$
-
-ষ্ট্ব$
-
-ষ্ট্য্র$
-
-ষ্ট্র$
-
-ষ্ট্ৰ$
-
-ষ্ট্ৰু$
-
-	ষ্ঠ$
-
-ষ্ঠু$
-
-ষ্ঠ্য্র$
-
-	ষ্ণ$
-
-ষ্ণু$
-
-	ষ্প$
-
-ষ্পু$
-
-ষ্পৃ$
-
-ষ্প্র$
-
-ষ্প্ৰ$
-
-	ষ্ফ$
-
-ষ্ফু$
-
-ষ্ফূ$
-
-ষ্ফ্র$
-
-	ষ্ব$
-
-ষ্বু$
-
-	ষ্ম$
-
-	ষ্র$
-
-স$
-
-সঁ$
-
-সু$
-
-	সুঁ$
-
-সু্গ্ৰ$
-
-সু্য$
-
-সূ$
-
-	সূঁ$
-
-সৃ$
-
-সৄ$
-
-স্$
-
-	স্আ$
-
-	স্ক$
-
-স্কু$
-
-স্কূ$
-
-স্কৃ$
-
-স্ক্র$
-
-স্ক্রু$
-
-স্ক্রৃ$
-
-স্ক্র্য$
-
-স্ক্ল$
-
-স্ক্ৰ$
-
-স্ক্ৰু$
-
-	স্খ$
-
-	স্চ$
-
-	স্জ$
-
-	স্ট$
-
-স্টু$
-
-স্ট্$
-
-স্ট্র$
-
-স্ট্রু$
-
-স্ট্র্য$
-
-স্ট্র্র$
-
-স্ট্ল$
-
-স্ট্স$
-
-স্ট্ৰ$
-
-	স্ঠ$
-
-	স্ড$
-
-	স্ত$
-
-স্তু$
-
-স্তূ$
-
-স্তৃ$
-
-স্ত্$
-
-স্ত্ত$
-
-স্ত্তু$
-
-স্ত্ব$
-
-স্ত্য্র$
-
-স্ত্র%
-
-স্ত্ৰ%
-
-	স্থ%
-
-স্থু%
-
-স্থূ%
-
-স্থ্য্র%
-
-স্থ্র%
-
-	স্ন%
-
-স্নু%
-
-স্ন্র%
-
-	স্প%
-
-স্পু%
-
-স্পূ%
-
-স্পৃ%
-
-স্প্র%
-
-স্প্ল%
-
-স্প্ৰ%
-
-	স্ফ%
-
-স্ফু%
-
-স্ফূ%
-
-স্ফ্র%
-
-	স্ব%
-
-স্বু%
-
-স্বৃ%
-
-	স্ভ%
-
-	স্ম%
-
-স্মু%
-
-স্মূ%
-
-স্মৃ%
-
-স্য্র%
-
-	স্র%
-
-স্রু%
-
-স্রৃ%
-
-	স্ল%
-
-স্লু%
-
-	স্স%
-
-স্সু%
-
-স্স্প্রু%
-
-	স্ৰ%
-
-স্ৰু%
-
-	স্ৱ%
-
-	স্‌%
-
-স‌%
-
-হ%
-
-হঁ%
-
-হু%
-
-	হুঁ%
-
-হূ%
-
-হৃ%
-
-হৄ%
-
-হ্%
-
-	হ্ক%
-
-	হ্গ%
-
-	হ্ণ%
-
-	হ্ত%
-
-	হ্ন%
-
-হ্নু%
-
-	হ্ব%
-
-হ্বু%
-
-	হ্ম%
-
-হ্মু%
-
-হ্য়%
-
-হ্য্র%
-
-	হ্র%
-
-হ্রু%
-
-	হ্ল%
-
-	হ্ৰ%
-
-	হ্‌%
-
-হ‌%
-
-়%
-
-ঽ%
-
-া%
-
-াঁ%
-
-াা%
-
-াি%
-
-াে%
-
-া্%
-
-	া্ম%
-
-া্য়%
-
-	া্র%
-
-	া্ৰ%
-
-া‌%
-
-ি%
-
-ী%
-
-ীঁ%
-
-ী্%
-
-ী্য়া%
-
-ু%
-
-ূ%
-
-ৃ%
-
-ৄ%
-
-ে%
-
-ৈ%
-
-ো%
-
-ৌ%
-
-্%
-
-্য%
-
-	্যঁ%
-
-	্যু%
-
-	্যূ%
-
-	্যৃ%
-
-	্য্%
-
-	্য‌%
-
-ৎ%
-
-ৗ%
-
-ৗঁ%
-
-ড়%
-
-ঢ়%
-
-য়%
-
-ৠ%
-
-ৡ%
-
-ৢ%
-
-ৣ%
-
-০%
-
-১%
-
-২%
-
-৩%
-
-৪%
-
-৫%
-
-৬%
-
-৭%
-
-৮%
-
-৯%
-
-ৰ%
-
-ৰঁ%
-
-ৰু%
-
-ৰূ%
-
-ৰৃ%
-
-ৰে&
-
-ৰ্&
-
-	ৰ্ক&
-
-ৰ্কু&
-
-ৰ্ক্স&
-
-	ৰ্খ&
-
-	ৰ্গ&
-
-ৰ্গু&
-
-	ৰ্ঘ&
-
-	ৰ্চ&
-
-ৰ্চ্চ&
-
-ৰ্চ্ছ&
-
-	ৰ্ছ&
-
-	ৰ্জ&
-
-ৰ্জু&
-
-ৰ্জ্জ&
-
-ৰ্জ্জু&
-
-ৰ্জ্ঞ&
-
-	ৰ্ঝ&
-
-	ৰ্ট&
-
-ৰ্টু&
-
-ৰ্ট্ছ&
-
-ৰ্ট্ৰ&
-
-ৰ্ট্‌&
-
-	ৰ্ড&
-
-ৰ্ডু&
-
-	ৰ্ণ&
-
-ৰ্ণ্ট&
-
-	ৰ্ত&
-
-ৰ্তু&
-
-ৰ্তৃ&
-
-ৰ্ত্ত&
-
-ৰ্ত্তু&
-
-ৰ্ত্তৃ&
-
-ৰ্ত্তৄ&
-
-ৰ্ত্ম&
-
-	ৰ্থ&
-
-ৰ্থু&
-
-	ৰ্দ&
-
-ৰ্দু&
-
-ৰ্দৃ&
-
-ৰ্দ্&
-
-ৰ্দ্ধ&
-
-ৰ্দ্ব&
-
-ৰ্দ্ৰ&
-
-	ৰ্ধ&
-
-ৰ্ধ্ব&
-
-	ৰ্ন&
-
-ৰ্নু&
-
-ৰ্ন্ত&
-
-	ৰ্প&
-
-ৰ্পু&
-
-ৰ্পূ&
-
-ৰ্প্প&
-
-	ৰ্ফ&
-
-ৰ্ফু&
-
-	ৰ্ব&
-
-ৰ্বৃ&
-
-ৰ্ব্ব&
-
-ৰ্ব্বু&
-
-	ৰ্ভ&
-
-ৰ্ভু&
-
-ৰ্ভূ&
-
-	ৰ্ম&
-
-ৰ্মু&
-
-ৰ্মূ&
-
-ৰ্ম্প&
-
-ৰ্ম্পূ&
-
-ৰ্ম্ম&
-
-ৰ্ম্মু&
-
-ৰ্ম্মূ&
-
-ৰ্ম্ম্&
-
-	ৰ্য&
-
-ৰ্য়&
-
-ৰ্যু&
-
-ৰ্য্য়&
-
-	ৰ্ল&
-
-ৰ্ল্ড&
-
-ৰ্ল্ল&
-
-	ৰ্শ&
-
-ৰ্শু&
-
-ৰ্শ্ব&
-
-	ৰ্ষ&
-
-ৰ্ষ্ট&
-
-	ৰ্স&
-
-	ৰ্হ&
-
-ৰ্হু&
-
-	ৰ্ৎ&
-
-	ৰ্ৰ&
-
-	ৰ্ৱ&
-
-	ৰ্‌&
-
-ৰ‌&
-
-ৰ‌্য&
-
-ৱ&
-
-ৱঁ&
-
-ৱু&
-
-ৱ্&
-
-	ৱ্ন&
-
-	ৱ্য&
-
-	ৱ্ল&
-
-	ৱ্শ&
-
-	ৱ্স&
-
-ৱ্স্থ&
-
-	ৱ্হ&
-
-৲&
-
-৳&
-
-৴&
-
-৵&
-
-৶&
-
-৷&
-
-৸&
-
-৹&
-
-৺&
-
-৻&
-
-ਅ&
-
-ਅਂ&
-
-ਅ਼&
-
-ਅਾ&
-
-	ਅਾਂ&
-
-	ਅਾੰ&
-
-ਅਿ&
-
-ਅੁ&
-
-ਅੇ&
-
-ਅੈ&
-
-	ਅੈੱ&
-
-ਅੋ&
-
-ਅੌ&
-
-ਅੰ&
-
-ਅੱ'
-
-ਆ'
-
-ਆਁ'
-
-ਆਂ'
-
-ਆਂ੍ਹ'
-
-ਆਾ'
-
-	ਆਾਂ'
-
-ਆਿ'
-
-	ਆੋਂ'
-
-ਆੰ'
-
-ਆੱ'
-
-ਇ'
-
-ਇਂ'
-
-ਇਿ'
-
-ਇੰ'
-
-ਇੱ'
-
-ਈ'
-
-ਈਂ'
-
-ਉ'
-
-ਉਂ'
-
-	ਉਂਿ'
-
-ਉਿ'
-
-ਉੁ'
-
-	ਉੁਂ'
-
-	ਉੁੂ'
-
-ਉੂ'
-
-ਉੇ'
-
-ਉੋ'
-
-	ਉ੍ਵ'
-
-ਉੰ'
-
-ਉੱ'
-
-ਊ'
-
-ਊਂ'
-
-ਏ'
-
-ਏਂ'
-
-ਏ਼'
-
-ਏਾ'
-
-ਏੇ'
-
-ਏੰ'
-
-ਏੱ'
-
-ਐ'
-
-ਐਂ'
-
-ਐੰ'
-
-ਐੱ'
-
-ਓ'
-
-ਓਂ'
-
-ਓਾ'
-
-ਓੁ'
-
-	ਓੁਂ'
-
-ਓੰ'
-
-ਓੱ'
-
-ਔ'
-
-ਔਂ'
-
-ਕ'
-
-ਕਂ'
-
-ਕ਼'
-
-	ਕ਼ਾ'
-
-	ਕ਼ੀ'
-
-	ਕ਼ੁ'
-
-	ਕ਼ੇ'
-
-ਕਾ'
-
-	ਕਾਂ'
-
-	ਕਾਿ'
-
-	ਕਾੰ'
-
-	ਕਾੱ'
-
-ਕਿ'
-
-	ਕਿਂ'
-
-ਕਿ੍ਰ'
-
-	ਕਿੰ'
-
-	ਕਿੱ'
-
-ਕੀ'
-
-	ਕੀਂ'
-
-ਕੁ'
-
-	ਕੁਂ'
-
-	ਕੁੁ'
-
-	ਕੁੰ'
-
-	ਕੁੱ'
-
-ਕੂ'
-
-	ਕੂੰ'
-
-ਕੇ'
-
-	ਕੇਂ'
-
-	ਕੇੰ'
-
-ਕੈ'
-
-	ਕੈਂ'
-
-	ਕੈੰ'
-
-	ਕੈੱ'
-
-ਕੋ'
-
-	ਕੋਂ'
-
-	ਕੋੁ'
-
-ਕੋ੍ਰ'
-
-	ਕੋੰ'
-
-	ਕੋੱ'
-
-ਕੌ'
-
-	ਕੌਂ'
-
-ਕ੍'
-
-	ਕ੍ਕ'
-
-ਕ੍ਕਂ'
-
-ਕ੍ਕਾ'
-
-ਕ੍ਕੀ'
-
-ਕ੍ਕੁ'
-
-ਕ੍ਕੇ'
-
-ਕ੍ਕੋ'
-
-	ਕ੍ਖ'
-
-ਕ੍ਖਾ'
-
-ਕ੍ਖਿ'
-
-ਕ੍ਖੁ'
-
-ਕ੍ਖੂ'
-
-ਕ੍ਖੇ'
-
-ਕ੍ਖੋ'
-
-	ਕ੍ਟ'
-
-ਕ੍ਟੂ'
-
-	ਕ੍ਤ'
-
-ਕ੍ਤਾ'
-
-ਕ੍ਤਿ'
-
-ਕ੍ਨਾ'
-
-	ਕ੍ਯ'
-
-ਕ੍ਯਾ'
-
-ਕ੍ਯਾਂ'
-
-ਕ੍ਯੂਂ'
-
-ਕ੍ਯੋਂ'
-
-	ਕ੍ਰ'
-
-ਕ੍ਰਾ'
-
-ਕ੍ਰਾਂ'
-
-ਕ੍ਰਿ'
-
-ਕ੍ਰੀ'
-
-ਕ੍ਰੂ'
-
-ਕ੍ਰੇ'
-
-ਕ੍ਰੈ'
-
-ਕ੍ਰੋ(
-
-	ਕ੍ਲ(
-
-ਕ੍ਲਾ(
-
-ਕ੍ਲਿ(
-
-ਕ੍ਲੋ(
-
-	ਕ੍ਵ(
-
-ਕ੍ਵਾ(
-
-	ਕ੍ਸ(
-
-ਕ੍ਸ਼(
-
-ਕ੍ਸ਼ਾ(
-
-ਕ੍ਸ਼ਿ(
-
-ਕ੍ਸ਼ੀ(
-
-ਕ੍ਸ਼ੇ(
-
-ਕ੍ਸ਼੍ਮ(
-
-ਕ੍ਸ਼੍ਮੀ(
-
-ਕ੍ਸ਼੍ਯ(
-
-ਕ੍ਹਾ(
-
-ਕੰ(
-
-ਕੱ(
-
-ਖ(
-
-ਖਂ(
-
-ਖ਼(
-
-	ਖ਼ਾ(
-
-ਖ਼ਾਂ(
-
-	ਖ਼ਿ(
-
-ਖ਼ਿੱ(
-
-	ਖ਼ੀ(
-
-	ਖ਼ੁ(
-
-	ਖ਼ੂ(
-
-	ਖ਼ੇ(
-
-	ਖ਼ੈ(
-
-	ਖ਼ੋ(
-
-	ਖ਼ੌ(
-
-	ਖ਼ੱ(
-
-ਖਾ(
-
-	ਖਾਂ(
-
-ਖਿ(
-
-	ਖਿ਼(
-
-	ਖਿੰ(
-
-	ਖਿੱ(
-
-ਖੀ(
-
-	ਖੀਂ(
-
-ਖੁ(
-
-	ਖੁੀ(
-
-	ਖੁੰ(
-
-	ਖੁੱ(
-
-ਖੂ(
-
-	ਖੂੰ(
-
-ਖੇ(
-
-	ਖੇਂ(
-
-ਖੈ(
-
-ਖੋ(
-
-	ਖੋਂ(
-
-ਖੌ(
-
-	ਖ੍ਖ(
-
-	ਖ੍ਤ(
-
-	ਖ੍ਯ(
-
-ਖ੍ਯਾ(
-
-ਖ੍ਰੀ(
-
-ਖ੍ਵਾ(
-
-ਖੰ(
-
-ਖੱ(
-
-ਗ(
-
-ਗਂ(
-
-ਗ਼(
-
-	ਗ਼ਾ(
-
-ਗ਼ਾਂ(
-
-	ਗ਼ੀ(
-
-	ਗ਼ੁ(
-
-ਗ਼ੁੱ(
-
-	ਗ਼ੇ(
-
-	ਗ਼ੈ(
-
-	ਗ਼ੋ(
-
-	ਗ਼ੌ(
-
-	ਗ਼ੰ(
-
-	ਗ਼ੱ(
-
-ਗਾ(
-
-	ਗਾਂ(
-
-	ਗਾੰ(
-
-ਗਿ(
-
-	ਗਿਂ(
-
-ਗਿ੍ਫ਼(
-
-	ਗਿੰ(
-
-	ਗਿੱ(
-
-ਗੀ(
-
-	ਗੀਂ(
-
-ਗੁ(
-
-	ਗੁਂ(
-
-	ਗੁੰ(
-
-	ਗੁੱ(
-
-ਗੂ(
-
-	ਗੂਂ(
-
-	ਗੂੰ(
-
-ਗੇ(
-
-	ਗੇਂ(
-
-ਗੈ(
-
-	ਗੈਂ(
-
-ਗੋ(
-
-	ਗੋਂ(
-
-	ਗੋੁ(
-
-ਗੌ(
-
-	ਗੌਂ(
-
-ਗ੍(
-
-	ਗ੍ਗ(
-
-ਗ੍ਗਂ(
-
-ਗ੍ਗਾ(
-
-ਗ੍ਗੁ(
-
-ਗ੍ਗੇ(
-
-ਗ੍ਗੋ(
-
-	ਗ੍ਨ(
-
-ਗ੍ਨਿ(
-
-	ਗ੍ਯ(
-
-ਗ੍ਯਾ(
-
-	ਗ੍ਰ(
-
-ਗ੍ਰਾ(
-
-ਗ੍ਰਾਂ(
-
-ਗ੍ਰਿ(
-
-ਗ੍ਰੀ(
-
-ਗ੍ਰੇ(
-
-ਗ੍ਰੈ(
-
-ਗ੍ਰੈਂ(
-
-ਗ੍ਰੋ(
-
-ਗ੍ਰ੍ਰਿ(
-
-ਗ੍ਰੰ(
-
-	ਗ੍ਸ(
-
-ਗ੍ਹਾ(
-
-ਗ੍ਹਾਂ(
-
-ਗੰ(
-
-ਗੰ੍ਰ)
-
-ਗੱ)
-
-ਘ)
-
-ਘਂ)
-
-ਘਾ)
-
-	ਘਾਂ)
-
-ਘਿ)
-
-ਘੀ)
-
-ਘੁ)
-
-	ਘੁੰ)
-
-	ਘੁੱ)
-
-ਘੂ)
-
-	ਘੂੰ)
-
-ਘੇ)
-
-ਘੈ)
-
-	ਘੈਂ)
-
-ਘੋ)
-
-	ਘੋਂ)
-
-ਘੌ)
-
-	ਘ੍ਰ)
-
-ਘ੍ਰਿ)
-
-ਘੰ)
-
-ਘੱ)
-
-ਙ)
-
-ਙਾ)
-
-ਙਿ)
-
-ਙੀ)
-
-ਙੁ)
-
-ਙੂ)
-
-	ਙ੍ਕ)
-
-	ਙ੍ਖ)
-
-ਙ੍ਖਾ)
-
-	ਙ੍ਗ)
-
-ਙ੍ਗਾ)
-
-	ਙ੍ਘ)
-
-ਙੰ)
-
-ਚ)
-
-ਚਂ)
-
-ਚਃ)
-
-ਚਾ)
-
-	ਚਾਂ)
-
-ਚਿ)
-
-	ਚਿਂ)
-
-	ਚਿੰ)
-
-	ਚਿੱ)
-
-ਚੀ)
-
-	ਚੀਂ)
-
-ਚੁ)
-
-	ਚੁੰ)
-
-	ਚੁੱ)
-
-ਚੂ)
-
-	ਚੂੰ)
-
-ਚੇ)
-
-	ਚੇਂ)
-
-	ਚੇੰ)
-
-ਚੈ)
-
-	ਚੈਂ)
-
-	ਚੈੰ)
-
-	ਚੈੱ)
-
-ਚੋ)
-
-	ਚੋਂ)
-
-ਚੌ)
-
-	ਚੌਂ)
-
-ਚ੍)
-
-	ਚ੍ਚ)
-
-ਚ੍ਚਂ)
-
-ਚ੍ਚਾ)
-
-ਚ੍ਚੀ)
-
-ਚ੍ਚੇ)
-
-ਚ੍ਚੋਂ)
-
-	ਚ੍ਛ)
-
-ਚ੍ਛਾ)
-
-ਚ੍ਛਿ)
-
-ਚ੍ਛੀ)
-
-ਚ੍ਛੇ)
-
-ਚ੍ਯਾ)
-
-	ਚ੍ਹ)
-
-ਚੰ)
-
-ਚੱ)
-
-ਛ)
-
-ਛਂ)
-
-ਛਾ)
-
-	ਛਾਂ)
-
-ਛਿ)
-
-	ਛਿੰ)
-
-	ਛਿੱ)
-
-ਛੀ)
-
-	ਛੀਂ)
-
-ਛੁ)
-
-	ਛੁਂ)
-
-	ਛੁੰ)
-
-	ਛੁੱ)
-
-ਛੂ)
-
-	ਛੂੰ)
-
-ਛੇ)
-
-	ਛੇਂ)
-
-ਛੈ)
-
-ਛੋ)
-
-	ਛੋਂ)
-
-ਛੌ)
-
-ਛੰ)
-
-ਛੱ)
-
-ਜ)
-
-ਜਂ)
-
-ਜ਼)
-
-	ਜ਼ਾ)
-
-ਜ਼ਾਂ)
-
-	ਜ਼ਿ)
-
-ਜ਼ਿਂ)
-
-ਜ਼ਿੰ)
-
-ਜ਼ਿੱ)
-
-	ਜ਼ੀ)
-
-	ਜ਼ੁ)
-
-ਜ਼ੁੰ)
-
-	ਜ਼ੂ)
-
-	ਜ਼ੇ)
-
-ਜ਼ੇਂ)
-
-	ਜ਼ੈ)
-
-ਜ਼ੈਂ)
-
-ਜ਼ੈੱ)
-
-	ਜ਼ੋ)
-
-ਜ਼ੋਂ)
-
-	ਜ਼ੌ)
-
-ਜ਼੍ਹ)
-
-	ਜ਼ੰ)
-
-	ਜ਼ੱ)
-
-ਜਾ)
-
-	ਜਾਂ)
-
-	ਜਾ਼*
-
-	ਜਾੰ*
-
-	ਜਾੱ*
-
-ਜਿ*
-
-	ਜਿਂ*
-
-	ਜਿ਼*
-
-ਜਿ਼ੰ*
-
-	ਜਿੰ*
-
-	ਜਿੱ*
-
-ਜੀ*
-
-	ਜੀਂ*
-
-ਜੁ*
-
-	ਜੁ਼*
-
-	ਜੁੰ*
-
-	ਜੁੱ*
-
-ਜੂ*
-
-	ਜੂੰ*
-
-ਜੇ*
-
-	ਜੇਂ*
-
-	ਜੇੰ*
-
-ਜੈ*
-
-	ਜੈਂ*
-
-	ਜੈੱ*
-
-ਜੋ*
-
-	ਜੋਂ*
-
-	ਜੋਿ*
-
-	ਜੋੁ*
-
-ਜੌ*
-
-	ਜੌਂ*
-
-	ਜ੍ਜ*
-
-ਜ੍ਜਾ*
-
-ਜ੍ਜਿ*
-
-ਜ੍ਜੇ*
-
-	ਜ੍ਝ*
-
-ਜ੍ਝਾ*
-
-ਜ੍ਝੇ*
-
-	ਜ੍ਞ*
-
-ਜ੍ਞਾ*
-
-	ਜ੍ਯ*
-
-ਜ੍ਯਾ*
-
-ਜ੍ਯੋ*
-
-	ਜ੍ਰ*
-
-	ਜ੍ਹ*
-
-ਜ੍ਹਾ*
-
-ਜੰ*
-
-ਜੱ*
-
-ਝ*
-
-ਝਂ*
-
-ਝਾ*
-
-	ਝਾਂ*
-
-	ਝਾੰ*
-
-ਝਿ*
-
-	ਝਿੰ*
-
-	ਝਿੱ*
-
-ਝੀ*
-
-	ਝੀਂ*
-
-ਝੁ*
-
-	ਝੁਂ*
-
-	ਝੁੰ*
-
-	ਝੁੱ*
-
-ਝੂ*
-
-	ਝੂੰ*
-
-ਝੇ*
-
-	ਝੇਂ*
-
-ਝੈ*
-
-ਝੋ*
-
-	ਝੋਂ*
-
-ਝੌ*
-
-	ਝੌਂ*
-
-ਝੰ*
-
-ਝੱ*
-
-ਞ*
-
-ਞਾ*
-
-ਞੀ*
-
-ਞੁ*
-
-ਞੇ*
-
-ਞੈ*
-
-ਞੋ*
-
-	ਞ੍ਚ*
-
-ਞ੍ਚਾ*
-
-ਞ੍ਚਿ*
-
-ਞ੍ਚੇ*
-
-	ਞ੍ਜ*
-
-ਞ੍ਜਾ*
-
-	ਞ੍ਞ*
-
-ਞ੍ਞਂ*
-
-ਞ੍ਞਾ*
-
-ਞ੍ਞਿ*
-
-ਞ੍ਞੇ*
-
-ਞ੍ਞੋ*
-
-ਞ੍ਹਿ*
-
-ਟ*
-
-ਟਂ*
-
-ਟਾ*
-
-	ਟਾਂ*
-
-	ਟਾੱ*
-
-ਟਿ*
-
-	ਟਿਂ*
-
-	ਟਿੰ*
-
-	ਟਿੱ*
-
-ਟੀ*
-
-	ਟੀਂ*
-
-	ਟੀਃ*
-
-ਟੁ*
-
-	ਟੁੰ*
-
-	ਟੁੱ*
-
-ਟੂ*
-
-	ਟੂੰ*
-
-ਟੇ*
-
-	ਟੇਂ*
-
-ਟੈ*
-
-	ਟੈਂ*
-
-	ਟੈੱ*
-
-ਟੋ*
-
-	ਟੋਂ*
-
-ਟੌ*
-
-	ਟੌਂ*
-
-	ਟ੍ਟ*
-
-ਟ੍ਟੀ*
-
-	ਟ੍ਠ*
-
-ਟ੍ਠਂ*
-
-ਟ੍ਠਾ*
-
-ਟ੍ਠਿ*
-
-ਟ੍ਠੀ*
-
-ਟ੍ਠੁ*
-
-ਟ੍ਠੇ*
-
-ਟ੍ਠੋ*
-
-	ਟ੍ਰ*
-
-ਟ੍ਰਾ+
-
-ਟ੍ਰਾਂ+
-
-ਟ੍ਰਿ+
-
-ਟ੍ਰੀ+
-
-ਟ੍ਰੇ+
-
-ਟ੍ਰੈ+
-
-ਟ੍ਰੋ+
-
-ਟ੍ਰੌ+
-
-	ਟ੍ਸ+
-
-ਟੰ+
-
-ਟੱ+
-
-ਠ+
-
-ਠਂ+
-
-ਠਾ+
-
-	ਠਾਂ+
-
-ਠਿ+
-
-	ਠਿੰ+
-
-	ਠਿੱ+
-
-ਠੀ+
-
-ਠੁ+
-
-	ਠੁੱ+
-
-ਠੂ+
-
-ਠੇ+
-
-ਠੈ+
-
-ਠੋ+
-
-	ਠੋਂ+
-
-ਠੌ+
-
-	ਠ੍ਯ+
-
-ਠੰ+
-
-ਠੱ+
-
-ਡ+
-
-ਡਂ+
-
-	ਡਂੂ+
-
-ਡ਼+
-
-	ਡ਼ਾ+
-
-	ਡ਼ਿ+
-
-	ਡ਼ੀ+
-
-	ਡ਼ੇ+
-
-	ਡ਼ੋ+
-
-ਡ਼ੋਂ+
-
-ਡ਼੍ਹ+
-
-ਡਾ+
-
-	ਡਾਂ+
-
-	ਡਾ਼+
-
-ਡਿ+
-
-	ਡਿਂ+
-
-	ਡਿੰ+
-
-	ਡਿੱ+
-
-ਡੀ+
-
-	ਡੀਂ+
-
-ਡੁ+
-
-	ਡੁਂ+
-
-	ਡੁੰ+
-
-	ਡੁੱ+
-
-ਡੂ+
-
-	ਡੂੰ+
-
-ਡੇ+
-
-	ਡੇਂ+
-
-ਡੈ+
-
-	ਡੈਂ+
-
-	ਡੈੱ+
-
-ਡੋ+
-
-	ਡੋਂ+
-
-ਡੌ+
-
-	ਡ੍ਢ+
-
-ਡ੍ਨੀ+
-
-ਡ੍ਰਾ+
-
-ਡ੍ਰਿ+
-
-ਡ੍ਰਿੰ+
-
-ਡ੍ਰੀ+
-
-ਡ੍ਰੇ+
-
-ਡ੍ਰੋ+
-
-ਡ੍ਰੌ+
-
-	ਡ੍ਸ+
-
-ਡੰ+
-
-ਡੱ+
-
-ਢ+
-
-ਢਂ+
-
-ਢ਼+
-
-	ਢ਼ਾ+
-
-	ਢ਼ੀ+
-
-	ਢ਼ੇ+
-
-ਢਾ+
-
-	ਢਾਂ+
-
-ਢਿ+
-
-	ਢਿੱ+
-
-ਢੀ+
-
-	ਢੀਂ+
-
-ਢੁ+
-
-	ਢੁੱ+
-
-ਢੂ+
-
-	ਢੂਂ+
-
-	ਢੂੰ+
-
-ਢੇ+
-
-	ਢੇਂ+
-
-ਢੈ+
-
-ਢੋ+
-
-	ਢੋਂ+
-
-ਢੌ+
-
-ਢੰ+
-
-ਢੱ+
-
-ਣ+
-
-ਣਂ+
-
-ਣਾ+
-
-	ਣਾਂ+
-
-ਣਿ+
-
-ਣੀ+
-
-	ਣੀਂ+
-
-ਣੁ+
-
-ਣੂ+
-
-	ਣੂੰ+
-
-ਣੇ+
-
-	ਣੇਂ+
-
-ਣੈ+
-
-ਣੋ+
-
-	ਣੋਂ+
-
-ਣੌ+
-
-	ਣ੍ਡ+
-
-ਣ੍ਡਾ+
-
-ਣ੍ਡਿ+
-
-ਣ੍ਡੇ+
-
-	ਣ੍ਣ+
-
-ਣ੍ਣਾ+
-
-	ਣ੍ਯ+
-
-	ਣ੍ਹ+
-
-ਣੰ+
-
-ਣੱ+
-
-ਤ+
-
-ਤਂ,
-
-ਤਾ,
-
-	ਤਾਂ,
-
-	ਤਾਿ,
-
-	ਤਾੰ,
-
-	ਤਾੱ,
-
-ਤਿ,
-
-	ਤਿਂ,
-
-ਤਿ੍ਰ,
-
-	ਤਿੰ,
-
-	ਤਿੱ,
-
-ਤੀ,
-
-	ਤੀਂ,
-
-	ਤੀੱ,
-
-ਤੁ,
-
-	ਤੁਂ,
-
-	ਤੁੰ,
-
-	ਤੁੱ,
-
-ਤੂ,
-
-	ਤੂਂ,
-
-	ਤੂੰ,
-
-ਤੇ,
-
-	ਤੇਂ,
-
-	ਤੇਿ,
-
-ਤੈ,
-
-	ਤੈਂ,
-
-ਤੋ,
-
-	ਤੋਂ,
-
-	ਤੋ਼,
-
-	ਤੋੁ,
-
-ਤੋ੍ਵ,
-
-	ਤੋੰ,
-
-	ਤੋੱ,
-
-ਤੌ,
-
-	ਤੌਂ,
-
-ਤ੍,
-
-ਤ੍ਕਾ,
-
-	ਤ੍ਤ,
-
-ਤ੍ਤਂ,
-
-ਤ੍ਤਾ,
-
-ਤ੍ਤਿ,
-
-ਤ੍ਤਿਂ,
-
-ਤ੍ਤੀ,
-
-ਤ੍ਤੁ,
-
-ਤ੍ਤੇ,
-
-ਤ੍ਤੋ,
-
-	ਤ੍ਥ,
-
-ਤ੍ਥਂ,
-
-ਤ੍ਥਾ,
-
-ਤ੍ਥਿ,
-
-ਤ੍ਥੀ,
-
-ਤ੍ਥੁ,
-
-ਤ੍ਥੇ,
-
-ਤ੍ਥੋ,
-
-	ਤ੍ਨ,
-
-ਤ੍ਨੀ,
-
-	ਤ੍ਪ,
-
-ਤ੍ਪਾ,
-
-	ਤ੍ਮ,
-
-ਤ੍ਮਾ,
-
-	ਤ੍ਯ,
-
-ਤ੍ਯਾ,
-
-ਤ੍ਯਾਂ,
-
-ਤ੍ਯੁ,
-
-ਤ੍ਯੇ,
-
-ਤ੍ਯੌ,
-
-ਤ੍ਯੰ,
-
-	ਤ੍ਰ,
-
-ਤ੍ਰਾ,
-
-ਤ੍ਰਾਂ,
-
-ਤ੍ਰਿ,
-
-ਤ੍ਰਿੰ,
-
-ਤ੍ਰੀ,
-
-ਤ੍ਰੁ,
-
-ਤ੍ਰੇ,
-
-ਤ੍ਰੈ,
-
-ਤ੍ਰੋ,
-
-ਤ੍ਰੋਂ,
-
-ਤ੍ਰੰ,
-
-	ਤ੍ਵ,
-
-ਤ੍ਵਾ,
-
-	ਤ੍ਸ,
-
-ਤ੍ਸਾ,
-
-ਤ੍ਹਾ,
-
-ਤੰ,
-
-ਤੱ,
-
-ਥ,
-
-ਥਂ,
-
-ਥਾ,
-
-	ਥਾਂ,
-
-	ਥਾਾ,
-
-	ਥਾੰ,
-
-ਥਿ,
-
-	ਥਿੰ,
-
-	ਥਿੱ,
-
-ਥੀ,
-
-	ਥੀਂ,
-
-ਥੁ,
-
-	ਥੁੱ,
-
-ਥੂ,
-
-ਥੇ,
-
-	ਥੇਂ,
-
-ਥੈ,
-
-	ਥੈਂ,
-
-ਥੋ,
-
-	ਥੋਂ,
-
-ਥੌ,
-
-	ਥੌਂ,
-
-ਥ੍ਰੀ,
-
-ਥ੍ਰੋ,
-
-ਥੰ,
-
-ਥੱ,
-
-ਦ,
-
-ਦਂ,
-
-	ਦਂਾ,
-
-	ਦਂੀ,
-
-ਦਾ,
-
-	ਦਾਂ,
-
-	ਦਾੰ,
-
-	ਦਾੱ,
-
-ਦਿ,
-
-	ਦਿਂ,
-
-ਦਿ੍ਸ਼,
-
-	ਦਿੰ,
-
-	ਦਿੱ,
-
-ਦੀ,
-
-	ਦੀਂ,
-
-ਦੁ,
-
-	ਦੁੰ-
-
-	ਦੁੱ-
-
-ਦੂ-
-
-	ਦੂਂ-
-
-	ਦੂੰ-
-
-	ਦੂੱ-
-
-ਦੇ-
-
-	ਦੇਂ-
-
-	ਦੇਿ-
-
-	ਦੇੇ-
-
-ਦੈ-
-
-	ਦੈਂ-
-
-ਦੋ-
-
-	ਦੋਂ-
-
-ਦੌ-
-
-	ਦੌਂ-
-
-ਦ੍-
-
-	ਦ੍ਦ-
-
-ਦ੍ਦਾ-
-
-ਦ੍ਦਿ-
-
-ਦ੍ਦੇ-
-
-ਦ੍ਦੋ-
-
-	ਦ੍ਧ-
-
-ਦ੍ਧਂ-
-
-ਦ੍ਧਾ-
-
-ਦ੍ਧਾਂ-
-
-ਦ੍ਧਿ-
-
-ਦ੍ਧਿਂ-
-
-ਦ੍ਧੋ-
-
-	ਦ੍ਯ-
-
-ਦ੍ਯਾ-
-
-ਦ੍ਯੋ-
-
-	ਦ੍ਰ-
-
-ਦ੍ਰਾ-
-
-ਦ੍ਰਿ-
-
-ਦ੍ਰੀ-
-
-ਦ੍ਰੁ-
-
-ਦ੍ਰੋ-
-
-ਦ੍ਵਾ-
-
-ਦ੍ਵਿ-
-
-	ਦ੍ਹ-
-
-ਦ੍ਹਾ-
-
-ਦ੍ਹਾਂ-
-
-ਦ੍ਹੀ-
-
-ਦ੍ਹੇ-
-
-ਦੰ-
-
-ਦੱ-
-
-ਧ-
-
-ਧਂ-
-
-ਧਾ-
-
-	ਧਾਂ-
-
-ਧਿ-
-
-	ਧਿੰ-
-
-ਧੀ-
-
-	ਧੀਂ-
-
-ਧੁ-
-
-	ਧੁਂ-
-
-	ਧੁੰ-
-
-	ਧੁੱ-
-
-ਧੂ-
-
-	ਧੂੰ-
-
-ਧੇ-
-
-ਧੈ-
-
-ਧੋ-
-
-	ਧੋਂ-
-
-ਧੌ-
-
-	ਧੌਂ-
-
-	ਧ੍ਯ-
-
-ਧ੍ਯਾ-
-
-ਧ੍ਯ੍ਯਾ-
-
-ਧ੍ਯੰ-
-
-	ਧ੍ਰ-
-
-ਧ੍ਰਾ-
-
-ਧ੍ਰਿ-
-
-ਧ੍ਰੁ-
-
-ਧ੍ਰੂ-
-
-ਧ੍ਰੋ-
-
-	ਧ੍ਵ-
-
-ਧੰ-
-
-ਧੱ-
-
-ਨ-
-
-ਨਂ-
-
-ਨ਼-
-
-ਨਾ-
-
-	ਨਾਂ-
-
-ਨਾਂ੍ਹ-
-
-	ਨਾਿ-
-
-	ਨਾ੍-
-
-ਨਾ੍ਹਂ-
-
-	ਨਾੰ-
-
-ਨਿ-
-
-	ਨਿਂ-
-
-	ਨਿੰ-
-
-	ਨਿੱ-
-
-ਨੀ-
-
-	ਨੀਂ-
-
-ਨੁ-
-
-	ਨੁਂ-
-
-ਨੁੂੰ-
-
-	ਨੁੰ-
-
-	ਨੁੱ-
-
-ਨੂ-
-
-	ਨੂਂ-
-
-ਨੂੂੰ-
-
-	ਨੂੰ-
-
-ਨੂੰੂ-
-
-ਨੂੰੰ-
-
-	ਨੂੱ-
-
-ਨੇ-
-
-	ਨੇਂ-
-
-	ਨੇੱ-
-
-ਨੈ-
-
-	ਨੈਂ-
-
-	ਨੈੱ-
-
-ਨੋ-
-
-	ਨੋਂ-
-
-	ਨੋੁ-
-
-ਨੌ-
-
-	ਨੌਂ-
-
-ਨ੍-
-
-	ਨ੍ਟ-
-
-	ਨ੍ਤ-
-
-ਨ੍ਤਂ-
-
-ਨ੍ਤਾ-
-
-ਨ੍ਤਿ-
-
-ਨ੍ਤੀ-
-
-ਨ੍ਤੁ-
-
-ਨ੍ਤੇ-
-
-ਨ੍ਤੋ.
-
-ਨ੍ਤ੍.
-
-ਨ੍ਤ੍ਰ.
-
-	ਨ੍ਦ.
-
-ਨ੍ਦਾ.
-
-ਨ੍ਦਿ.
-
-ਨ੍ਦੀ.
-
-ਨ੍ਦੁ.
-
-ਨ੍ਦੂ.
-
-ਨ੍ਦੋ.
-
-ਨ੍ਦ੍ਰ.
-
-ਨ੍ਦ੍ਰਿ.
-
-	ਨ੍ਧ.
-
-ਨ੍ਧਾ.
-
-ਨ੍ਧਿ.
-
-ਨ੍ਧੇ.
-
-ਨ੍ਧੋ.
-
-	ਨ੍ਨ.
-
-ਨ੍ਨਂ.
-
-ਨ੍ਨਾ.
-
-ਨ੍ਨਿ.
-
-ਨ੍ਨੀ.
-
-ਨ੍ਨੇ.
-
-ਨ੍ਨੋ.
-
-	ਨ੍ਮ.
-
-	ਨ੍ਯ.
-
-ਨ੍ਯਾ.
-
-ਨ੍ਯੂ.
-
-ਨ੍ਰਾ.
-
-ਨ੍ਰਾੰ.
-
-ਨ੍ਰਿ.
-
-	ਨ੍ਵ.
-
-	ਨ੍ਸ.
-
-	ਨ੍ਹ.
-
-ਨ੍ਹਾ.
-
-ਨ੍ਹਾਂ.
-
-ਨ੍ਹਿ.
-
-ਨ੍ਹੀ.
-
-ਨ੍ਹੀਂ.
-
-ਨ੍ਹੂੰ.
-
-ਨ੍ਹੇ.
-
-ਨ੍ਹੇਂ.
-
-ਨ੍ਹੈ.
-
-ਨ੍ਹੋ.
-
-ਨ੍ਹੋਂ.
-
-ਨ੍ਹੋੰ.
-
-ਨੰ.
-
-	ਨੰੂ.
-
-ਨੱ.
-
-ਪ.
-
-ਪਂ.
-
-ਪਾ.
-
-	ਪਾਂ.
-
-	ਪਾਿ.
-
-	ਪਾੰ.
-
-	ਪਾੱ.
-
-ਪਿ.
-
-	ਪਿਂ.
-
-ਪਿ੍ਰੰ.
-
-	ਪਿੰ.
-
-ਪਿੰ੍ਰ.
-
-	ਪਿੱ.
-
-ਪੀ.
-
-	ਪੀਂ.
-
-ਪੀ੍ਰ.
-
-ਪੁ.
-
-	ਪੁੰ.
-
-	ਪੁੱ.
-
-ਪੂ.
-
-	ਪੂਂ.
-
-	ਪੂੰ.
-
-ਪੇ.
-
-	ਪੇਂ.
-
-ਪੇ੍ਰ.
-
-ਪੈ.
-
-	ਪੈਂ.
-
-ਪੈ੍ਰ.
-
-ਪੈ੍ਲ.
-
-	ਪੈੱ.
-
-ਪੋ.
-
-	ਪੋਂ.
-
-ਪੋ੍ਫੈ.
-
-ਪੋ੍ਰ.
-
-	ਪੋੰ.
-
-ਪੌ.
-
-	ਪੌਂ.
-
-ਪ੍.
-
-ਪ੍ਕਾ.
-
-ਪ੍ਚਾ.
-
-	ਪ੍ਤ.
-
-ਪ੍ਤਾ.
-
-ਪ੍ਤਿ.
-
-ਪ੍ਤੀ.
-
-	ਪ੍ਨ.
-
-	ਪ੍ਪ.
-
-ਪ੍ਪਾ.
-
-ਪ੍ਪਿ.
-
-ਪ੍ਪੀ.
-
-ਪ੍ਪੇ.
-
-	ਪ੍ਫ.
-
-	ਪ੍ਯ.
-
-ਪ੍ਯਾ.
-
-	ਪ੍ਰ.
-
-ਪ੍ਰ਼.
-
-ਪ੍ਰਾ.
-
-ਪ੍ਰਾਂ.
-
-ਪ੍ਰਿ.
-
-ਪ੍ਰਿੰ.
-
-ਪ੍ਰੀ.
-
-ਪ੍ਰੁ.
-
-ਪ੍ਰੂ.
-
-ਪ੍ਰੇ.
-
-ਪ੍ਰੈ.
-
-ਪ੍ਰੈਂ.
-
-ਪ੍ਰੈੱ.
-
-ਪ੍ਰੋ.
-
-ਪ੍ਰੌ.
-
-ਪ੍ਰ੍ਰ.
-
-ਪ੍ਰ੍ਸਿੱ.
-
-ਪ੍ਰੰ.
-
-ਪ੍ਰੱ.
-
-ਪ੍ਲੇ.
-
-	ਪ੍ਸ.
-
-	ਪ੍ੀ.
-
-ਪੰ.
-
-ਪੰ੍ਰ.
-
-ਪੱ.
-
-ਫ.
-
-ਫਂ/
-
-ਫ਼/
-
-	ਫ਼ਾ/
-
-ਫ਼ਾਂ/
-
-	ਫ਼ਿ/
-
-	ਫ਼ੀ/
-
-	ਫ਼ੁ/
-
-ਫ਼ੁੱ/
-
-	ਫ਼ੂ/
-
-	ਫ਼ੇ/
-
-	ਫ਼ੈ/
-
-	ਫ਼ੋ/
-
-ਫ਼ੋਂ/
-
-	ਫ਼ੌ/
-
-ਫ਼ੌਂ/
-
-ਫ਼੍ਰਾਂ/
-
-ਫ਼੍ਰੀ/
-
-ਫ਼੍ਰੈ/
-
-ਫ਼੍ਰੈਂ/
-
-	ਫ਼ੰ/
-
-	ਫ਼ੱ/
-
-ਫਾ/
-
-	ਫਾਂ/
-
-ਫਿ/
-
-	ਫਿ਼/
-
-	ਫਿੰ/
-
-	ਫਿੱ/
-
-ਫੀ/
-
-ਫੁ/
-
-	ਫੁੰ/
-
-	ਫੁੱ/
-
-ਫੂ/
-
-ਫੇ/
-
-	ਫੇਂ/
-
-ਫੈ/
-
-	ਫੈਂ/
-
-	ਫੈੱ/
-
-ਫੋ/
-
-	ਫੋਂ/
-
-ਫੌ/
-
-	ਫੌਂ/
-
-	ਫ੍ਤ/
-
-ਫ੍ਤਾ/
-
-ਫ੍ਤੇ/
-
-ਫ੍ਰਾ/
-
-ਫ੍ਰਾਂ/
-
-ਫ੍ਰਿ/
-
-ਫ੍ਰੀ/
-
-ਫ੍ਰੇ/
-
-ਫ੍ਰੇਂ/
-
-ਫ੍ਰੈ/
-
-ਫ੍ਰੈਂ/
-
-ਫੰ/
-
-ਫੱ/
-
-ਬ/
-
-ਬਂ/
-
-ਬ਼/
-
-ਬਾ/
-
-	ਬਾਂ/
-
-	ਬਾੱ/
-
-ਬਿ/
-
-	ਬਿਂ/
-
-	ਬਿੰ/
-
-	ਬਿੱ/
-
-ਬੀ/
-
-	ਬੀਂ/
-
-ਬੁ/
-
-	ਬੁੰ/
-
-	ਬੁੱ/
-
-ਬੂ/
-
-	ਬੂਂ/
-
-	ਬੂੰ/
-
-ਬੇ/
-
-	ਬੇਂ/
-
-ਬੈ/
-
-	ਬੈਂ/
-
-	ਬੈੰ/
-
-	ਬੈੱ/
-
-ਬੋ/
-
-	ਬੋਂ/
-
-ਬੌ/
-
-	ਬੌਂ/
-
-	ਬੌੱ/
-
-ਬ੍/
-
-	ਬ੍ਦ/
-
-ਬ੍ਦੋ/
-
-ਬ੍ਦੋਂ/
-
-	ਬ੍ਧ/
-
-	ਬ੍ਬ/
-
-ਬ੍ਬਂ/
-
-ਬ੍ਬਾ/
-
-ਬ੍ਬਿ/
-
-ਬ੍ਬੇ/
-
-ਬ੍ਬੋ/
-
-	ਬ੍ਭ/
-
-ਬ੍ਭਾ/
-
-	ਬ੍ਯ/
-
-ਬ੍ਯਾ/
-
-	ਬ੍ਰ/
-
-ਬ੍ਰਾ/
-
-ਬ੍ਰਾਂ/
-
-ਬ੍ਰਿ/
-
-ਬ੍ਰੀ/
-
-ਬ੍ਰੇ/
-
-ਬ੍ਰੈ/
-
-ਬ੍ਰੋ/
-
-ਬ੍ਰੌ/
-
-ਬ੍ਰੰ/
-
-ਬ੍ਲਾ/
-
-ਬ੍ਲੋ/
-
-ਬ੍ਲੌ/
-
-	ਬ੍ਹ/
-
-ਬ੍ਹੋ/
-
-ਬੰ/
-
-ਬੱ/
-
-	ਬੱਿ/
-
-ਭ/
-
-ਭਂ/
-
-ਭਾ/
-
-	ਭਾਂ/
-
-ਭਿ/
-
-ਭਿ੍ਰ/
-
-	ਭਿੰ/
-
-	ਭਿੱ/
-
-ਭੀ/
-
-ਭੁ/
-
-	ਭੁੰ/
-
-	ਭੁੱ/
-
-ਭੂ0
-
-	ਭੂੰ0
-
-ਭੇ0
-
-	ਭੇਂ0
-
-ਭੈ0
-
-	ਭੈਂ0
-
-ਭੋ0
-
-	ਭੋਂ0
-
-	ਭੋੁ0
-
-ਭੌ0
-
-	ਭੌਂ0
-
-	ਭ੍ਯ0
-
-	ਭ੍ਰ0
-
-ਭ੍ਰਾ0
-
-ਭ੍ਰਾਂ0
-
-ਭ੍ਰਿ0
-
-ਭ੍ਰੰ0
-
-ਭੰ0
-
-ਭੱ0
-
-ਮ0
-
-ਮਂ0
-
-ਮਃ0
-
-ਮਾ0
-
-	ਮਾਂ0
-
-	ਮਾਿ0
-
-	ਮਾੰ0
-
-	ਮਾੱ0
-
-ਮਿ0
-
-ਮਿ੍ਤ0
-
-ਮਿ੍ਰ0
-
-	ਮਿੰ0
-
-	ਮਿੱ0
-
-ਮੀ0
-
-	ਮੀਂ0
-
-ਮੁ0
-
-	ਮੁਂ0
-
-	ਮੁਿ0
-
-	ਮੁੰ0
-
-	ਮੁੱ0
-
-ਮੂ0
-
-	ਮੂੰ0
-
-ਮੇ0
-
-	ਮੇਂ0
-
-ਮੇ੍ਵ0
-
-	ਮੇੰ0
-
-	ਮੇੱ0
-
-ਮੈ0
-
-	ਮੈਂ0
-
-	ਮੈ਼0
-
-	ਮੈੰ0
-
-	ਮੈੱ0
-
-ਮੋ0
-
-	ਮੋਂ0
-
-	ਮੋੁ0
-
-	ਮੋੱ0
-
-ਮੌ0
-
-	ਮੌਂ0
-
-ਮ੍0
-
-	ਮ੍ਪ0
-
-ਮ੍ਪਾ0
-
-ਮ੍ਪਿ0
-
-ਮ੍ਪ੍ਯੂ0
-
-	ਮ੍ਬ0
-
-ਮ੍ਬਂ0
-
-ਮ੍ਬਾ0
-
-ਮ੍ਬੁ0
-
-ਮ੍ਬੇ0
-
-ਮ੍ਬੋ0
-
-	ਮ੍ਭ0
-
-ਮ੍ਭਾ0
-
-	ਮ੍ਮ0
-
-ਮ੍ਮਂ0
-
-ਮ੍ਮਾ0
-
-ਮ੍ਮੀ0
-
-ਮ੍ਮੁ0
-
-ਮ੍ਮੇ0
-
-ਮ੍ਮੋ0
-
-ਮ੍ਯੁ0
-
-	ਮ੍ਰ0
-
-ਮ੍ਰਾ0
-
-ਮ੍ਰਿ0
-
-ਮ੍ਰਿਾ0
-
-ਮ੍ਰਿੰ0
-
-ਮ੍ਰੀ0
-
-	ਮ੍ਸ0
-
-	ਮ੍ਹ0
-
-ਮ੍ਹਾ0
-
-ਮ੍ਹਾਂ0
-
-ਮ੍ਹਿ0
-
-ਮ੍ਹੀ0
-
-ਮ੍ਹੇ0
-
-ਮ੍ਹੇਂ0
-
-ਮੰ0
-
-ਮੱ0
-
-ਯ0
-
-ਯਂ0
-
-ਯ਼0
-
-ਯਾ0
-
-	ਯਾਂ0
-
-ਯਿ0
-
-	ਯਿਂ0
-
-ਯੀ0
-
-ਯੁ0
-
-	ਯੁਂ0
-
-	ਯੁੰ0
-
-	ਯੁੱ0
-
-ਯੂ0
-
-	ਯੂਂ0
-
-	ਯੂੰ0
-
-ਯੇ0
-
-	ਯੇਂ0
-
-ਯੈ0
-
-ਯੋ0
-
-	ਯੋਂ0
-
-	ਯੋੱ0
-
-ਯੌ0
-
-	ਯ੍ਯ0
-
-ਯ੍ਯਂ0
-
-ਯ੍ਯਾ0
-
-ਯ੍ਯੋ0
-
-ਯੰ0
-
-ਯੱ0
-
-ਰ0
-
-ਰਂ0
-
-ਰਾ0
-
-	ਰਾਂ0
-
-	ਰਾਿ0
-
-ਰਾ੍ਹਂ0
-
-	ਰਾੰ1
-
-	ਰਾੱ1
-
-ਰਿ1
-
-	ਰਿਂ1
-
-	ਰਿਾ1
-
-	ਰਿੰ1
-
-	ਰਿੱ1
-
-ਰੀ1
-
-	ਰੀਂ1
-
-ਰੁ1
-
-	ਰੁਂ1
-
-	ਰੁੰ1
-
-	ਰੁੱ1
-
-ਰੂ1
-
-	ਰੂਂ1
-
-	ਰੂੁ1
-
-	ਰੂੰ1
-
-	ਰੂੱ1
-
-ਰੇ1
-
-	ਰੇਂ1
-
-	ਰੇੱ1
-
-ਰੈ1
-
-	ਰੈਂ1
-
-	ਰੈੱ1
-
-ਰੋ1
-
-	ਰੋਂ1
-
-	ਰੋੱ1
-
-ਰੌ1
-
-	ਰੌਂ1
-
-ਰ੍1
-
-	ਰ੍ਕ1
-
-ਰ੍ਕਾ1
-
-ਰ੍ਕਿ1
-
-	ਰ੍ਖ1
-
-	ਰ੍ਗ1
-
-ਰ੍ਗੀ1
-
-	ਰ੍ਘ1
-
-	ਰ੍ਚ1
-
-ਰ੍ਚਾ1
-
-	ਰ੍ਜ1
-
-ਰ੍ਜਾ1
-
-ਰ੍ਜੀ1
-
-ਰ੍ਜੁ1
-
-	ਰ੍ਟ1
-
-ਰ੍ਟੀ1
-
-	ਰ੍ਡ1
-
-	ਰ੍ਣ1
-
-ਰ੍ਣਾ1
-
-	ਰ੍ਤ1
-
-ਰ੍ਤਾ1
-
-ਰ੍ਤਿ1
-
-ਰ੍ਤੀ1
-
-	ਰ੍ਥ1
-
-ਰ੍ਥਾ1
-
-ਰ੍ਥਿ1
-
-ਰ੍ਥੀ1
-
-	ਰ੍ਦ1
-
-ਰ੍ਦੀ1
-
-ਰ੍ਦੇ1
-
-	ਰ੍ਧ1
-
-ਰ੍ਧਾ1
-
-	ਰ੍ਨ1
-
-	ਰ੍ਪ1
-
-ਰ੍ਪਿ1
-
-ਰ੍ਪੋ1
-
-	ਰ੍ਫ1
-
-ਰ੍ਫ਼1
-
-	ਰ੍ਭ1
-
-ਰ੍ਭਾ1
-
-	ਰ੍ਮ1
-
-ਰ੍ਮਾ1
-
-ਰ੍ਮਿ1
-
-ਰ੍ਮੀ1
-
-	ਰ੍ਯ1
-
-ਰ੍ਯਾ1
-
-ਰ੍ਯਿ1
-
-ਰ੍ਯੋ1
-
-	ਰ੍ਰ1
-
-ਰ੍ਰਾ1
-
-ਰ੍ਰਾਂ1
-
-ਰ੍ਰੰ1
-
-	ਰ੍ਵ1
-
-ਰ੍ਵਾ1
-
-ਰ੍ਵੇ1
-
-	ਰ੍ਸ1
-
-ਰ੍ਸ਼1
-
-ਰ੍ਸ਼ਾ1
-
-ਰ੍ਸ਼ਿ1
-
-ਰ੍ਸ਼ੀ1
-
-ਰ੍ਸ਼ੋਂ1
-
-ਰ੍ਸੀ1
-
-	ਰ੍ਹ1
-
-ਰ੍ਹਾ1
-
-ਰ੍ਹਾਂ1
-
-ਰ੍ਹਿ1
-
-ਰ੍ਹੀ1
-
-ਰ੍ਹੀਂ1
-
-ਰ੍ਹੇ1
-
-ਰ੍ਹੈ1
-
-ਰ੍ਹੋਂ1
-
-	ਰ੍ਾ1
-
-ਰੰ1
-
-ਰੱ1
-
-	ਰੱਿ1
-
-ਲ1
-
-ਲਂ1
-
-ਲਃ1
-
-ਲ਼1
-
-	ਲ਼ਾ1
-
-ਲ਼ਾਂ1
-
-	ਲ਼ਿ1
-
-	ਲ਼ੀ1
-
-	ਲ਼ੇ1
-
-	ਲ਼ੋ1
-
-ਲ਼ੋਂ1
-
-ਲਾ1
-
-	ਲਾਂ1
-
-	ਲਾੰ1
-
-	ਲਾੱ1
-
-ਲਿ1
-
-	ਲਿਂ1
-
-ਲਿ੍ਹ1
-
-	ਲਿੰ1
-
-	ਲਿੱ1
-
-ਲੀ1
-
-	ਲੀਂ1
-
-ਲੁ1
-
-	ਲੁੰ1
-
-	ਲੁੱ2
-
-ਲੂ2
-
-	ਲੂਂ2
-
-	ਲੂੰ2
-
-ਲੇ2
-
-	ਲੇਂ2
-
-	ਲੇੇ2
-
-ਲੇ੍ਹ2
-
-	ਲੇੱ2
-
-ਲੈ2
-
-	ਲੈਂ2
-
-	ਲੈੰ2
-
-	ਲੈੱ2
-
-ਲੋ2
-
-	ਲੋਂ2
-
-	ਲੋੁ2
-
-	ਲੋੰ2
-
-	ਲੋੱ2
-
-ਲੌ2
-
-	ਲੌਂ2
-
-ਲ੍2
-
-	ਲ੍ਕ2
-
-ਲ੍ਕਾ2
-
-ਲ੍ਕਿ2
-
-ਲ੍ਟੀ2
-
-	ਲ੍ਡ2
-
-ਲ੍ਦੀ2
-
-	ਲ੍ਪ2
-
-	ਲ੍ਬ2
-
-	ਲ੍ਮ2
-
-ਲ੍ਮੀ2
-
-ਲ੍ਮੋਂ2
-
-	ਲ੍ਯ2
-
-ਲ੍ਯਾ2
-
-ਲ੍ਯੁ2
-
-	ਲ੍ਲ2
-
-ਲ੍ਲਾ2
-
-ਲ੍ਲੀ2
-
-ਲ੍ਲੇ2
-
-	ਲ੍ਸ2
-
-	ਲ੍ਹ2
-
-ਲ੍ਹਾ2
-
-ਲ੍ਹਾਂ2
-
-ਲ੍ਹਿ2
-
-ਲ੍ਹੀ2
-
-ਲ੍ਹੇ2
-
-ਲ੍ਹੈ2
-
-ਲ੍ਹੋ2
-
-ਲੰ2
-
-ਲੱ2
-
-ਵ2
-
-ਵਂ2
-
-ਵਾ2
-
-	ਵਾਂ2
-
-	ਵਾਿ2
-
-	ਵਾੰ2
-
-	ਵਾੱ2
-
-ਵਿ2
-
-	ਵਿਂ2
-
-	ਵਿੇ2
-
-	ਵਿੰ2
-
-	ਵਿੱ2
-
-ਵੀ2
-
-	ਵੀਂ2
-
-	ਵੀੰ2
-
-ਵੁ2
-
-	ਵੁਂ2
-
-	ਵੁੱ2
-
-ਵੂ2
-
-ਵੇ2
-
-	ਵੇਂ2
-
-	ਵੇੰ2
-
-	ਵੇੱ2
-
-ਵੈ2
-
-	ਵੈਂ2
-
-	ਵੈੱ2
-
-ਵੋ2
-
-	ਵੋਂ2
-
-	ਵੋੱ2
-
-ਵੌ2
-
-	ਵ੍ਯ2
-
-ਵ੍ਯਂ2
-
-ਵ੍ਯਾ2
-
-ਵ੍ਯੁ2
-
-ਵ੍ਯੋ2
-
-	ਵ੍ਰ2
-
-ਵ੍ਰਿ2
-
-ਵ੍ਰੰ2
-
-ਵ੍ਰੱ2
-
-ਵ੍ਹਾ2
-
-ਵ੍ਹਿ2
-
-ਵ੍ਹੀ2
-
-ਵੰ2
-
-ਵੱ2
-
-	ਵੱਿ2
-
-ਸ2
-
-ਸਂ2
-
-ਸ਼2
-
-	ਸ਼ਂ2
-
-	ਸ਼ਾ2
-
-ਸ਼ਾਂ2
-
-ਸ਼ਾੰ2
-
-	ਸ਼ਿ2
-
-ਸ਼ਿੰ2
-
-ਸ਼ਿੱ2
-
-	ਸ਼ੀ2
-
-ਸ਼ੀਂ2
-
-	ਸ਼ੁ2
-
-ਸ਼ੁਂ2
-
-ਸ਼ੁੰ2
-
-ਸ਼ੁੱ2
-
-	ਸ਼ੂ2
-
-	ਸ਼ੇ2
-
-ਸ਼ੇਂ2
-
-ਸ਼ੇ੍ਰ2
-
-	ਸ਼ੈ2
-
-ਸ਼ੈਂ2
-
-ਸ਼ੈੱ2
-
-	ਸ਼ੋ2
-
-ਸ਼ੋਂ2
-
-ਸ਼ੋ੍ਰ2
-
-	ਸ਼ੌ2
-
-ਸ਼ੌਂ2
-
-ਸ਼੍ਕ2
-
-ਸ਼੍ਕਿ2
-
-ਸ਼੍ਚ2
-
-ਸ਼੍ਚਾ2
-
-ਸ਼੍ਚਿ2
-
-ਸ਼੍ਟ3
-
-ਸ਼੍ਟਾ3
-
-ਸ਼੍ਟਿ3
-
-ਸ਼੍ਟੀ3
-
-ਸ਼੍ਟ੍ਰ3
-
-ਸ਼੍ਟ੍ਰੀ3
-
-ਸ਼੍ਠ3
-
-ਸ਼੍ਠਾ3
-
-ਸ਼੍ਣ3
-
-ਸ਼੍ਣੁ3
-
-ਸ਼੍ਤ3
-
-ਸ਼੍ਤੇ3
-
-ਸ਼੍ਤੋਂ3
-
-ਸ਼੍ਨ3
-
-ਸ਼੍ਪ3
-
-ਸ਼੍ਮ3
-
-ਸ਼੍ਯ3
-
-ਸ਼੍ਯਾ3
-
-ਸ਼੍ਰ3
-
-ਸ਼੍ਰਾ3
-
-ਸ਼੍ਰਿ3
-
-ਸ਼੍ਰੀ3
-
-ਸ਼੍ਰੁ3
-
-ਸ਼੍ਰੇ3
-
-ਸ਼੍ਰੋ3
-
-ਸ਼੍ਰੰ3
-
-ਸ਼੍ਲੇ3
-
-ਸ਼੍ਵ3
-
-ਸ਼੍ਵਾ3
-
-ਸ਼੍ਹਿਂ3
-
-	ਸ਼ੰ3
-
-	ਸ਼ੱ3
-
-ਸਾ3
-
-	ਸਾਂ3
-
-	ਸਾਿ3
-
-	ਸਾੰ3
-
-	ਸਾੱ3
-
-ਸਿ3
-
-	ਸਿਂ3
-
-	ਸਿ਼3
-
-	ਸਿੰ3
-
-	ਸਿੱ3
-
-ਸੀ3
-
-	ਸੀਂ3
-
-ਸੀ੍ਰ3
-
-ਸੁ3
-
-	ਸੁਂ3
-
-	ਸੁੰ3
-
-	ਸੁੱ3
-
-ਸੂ3
-
-	ਸੂੰ3
-
-ਸੇ3
-
-	ਸੇਂ3
-
-	ਸੇ਼3
-
-	ਸੇੰ3
-
-ਸੈ3
-
-	ਸੈਂ3
-
-	ਸੈੰ3
-
-	ਸੈੱ3
-
-ਸੋ3
-
-	ਸੋਂ3
-
-	ਸੋ਼3
-
-	ਸੋੁ3
-
-ਸੌ3
-
-	ਸੌਂ3
-
-	ਸੌੰ3
-
-ਸ੍3
-
-	ਸ੍ਕ3
-
-ਸ੍ਕਾ3
-
-ਸ੍ਕੀ3
-
-ਸ੍ਕੁ3
-
-ਸ੍ਕੂ3
-
-	ਸ੍ਚ3
-
-	ਸ੍ਟ3
-
-ਸ੍ਟਾ3
-
-ਸ੍ਟਿ3
-
-ਸ੍ਟੇ3
-
-ਸ੍ਟੇਂ3
-
-ਸ੍ਟ੍ਰੀ3
-
-	ਸ੍ਤ3
-
-ਸ੍ਤਾ3
-
-ਸ੍ਤਿ3
-
-ਸ੍ਤੀ3
-
-ਸ੍ਤੁ3
-
-ਸ੍ਤੇ3
-
-ਸ੍ਤੋ3
-
-ਸ੍ਤੋਂ3
-
-ਸ੍ਤ੍ਰ3
-
-ਸ੍ਤ੍ਰਿ3
-
-ਸ੍ਤ੍ਰੀ3
-
-	ਸ੍ਥ3
-
-ਸ੍ਥਾ3
-
-ਸ੍ਥਿ3
-
-ਸ੍ਥ੍ਯ3
-
-ਸ੍ਨਾ3
-
-ਸ੍ਨੇ3
-
-	ਸ੍ਪ3
-
-ਸ੍ਪੇ3
-
-	ਸ੍ਮ3
-
-ਸ੍ਮਾ3
-
-ਸ੍ਮਿ3
-
-ਸ੍ਮਿਂ3
-
-	ਸ੍ਯ3
-
-ਸ੍ਯਾ3
-
-	ਸ੍ਰ3
-
-ਸ੍ਰਾ3
-
-ਸ੍ਰਿ3
-
-ਸ੍ਰੀ3
-
-ਸ੍ਰੇ3
-
-ਸ੍ਰੋ3
-
-	ਸ੍ਲ3
-
-ਸ੍ਲਾ3
-
-ਸ੍ਲਿ3
-
-	ਸ੍ਵ3
-
-ਸ੍ਵਾ3
-
-ਸ੍ਵਾਂ3
-
-ਸ੍ਵਿ3
-
-ਸ੍ਵੀ3
-
-ਸ੍ਵੈ3
-
-	ਸ੍ਸ3
-
-ਸ੍ਸਂ3
-
-ਸ੍ਸਾ3
-
-ਸ੍ਸਿ3
-
-ਸ੍ਸੀ3
-
-ਸ੍ਸੁ3
-
-ਸ੍ਸੇ3
-
-ਸ੍ਸੋ3
-
-	ਸ੍ੀ3
-
-ਸੰ4
-
-	ਸੰਿ4
-
-	ਸੰੁ4
-
-	ਸੰੰ4
-
-ਸੱ4
-
-ਹ4
-
-ਹਂ4
-
-ਹ਼4
-
-ਹਾ4
-
-	ਹਾਂ4
-
-	ਹਾੰ4
-
-	ਹਾੱ4
-
-ਹਿ4
-
-	ਹਿਂ4
-
-	ਹਿੰ4
-
-	ਹਿੱ4
-
-ਹੀ4
-
-	ਹੀਂ4
-
-	ਹੀ਼4
-
-ਹੀ੍ਵ4
-
-	ਹੀੱ4
-
-ਹੁ4
-
-	ਹੁਂ4
-
-	ਹੁੰ4
-
-	ਹੁੱ4
-
-ਹੂ4
-
-	ਹੂਂ4
-
-	ਹੂੰ4
-
-ਹੇ4
-
-	ਹੇਂ4
-
-	ਹੇੱ4
-
-ਹੈ4
-
-	ਹੈਂ4
-
-ਹੈਾਂ4
-
-	ਹੈਿ4
-
-	ਹੈੇ4
-
-	ਹੈੈ4
-
-	ਹੈੱ4
-
-ਹੋ4
-
-	ਹੋਂ4
-
-	ਹੋਿ4
-
-ਹੌ4
-
-	ਹੌਂ4
-
-ਹ੍4
-
-	ਹ੍ਨ4
-
-	ਹ੍ਮ4
-
-ਹ੍ਮਾ4
-
-ਹ੍ਯਾ4
-
-	ਹ੍ਰ4
-
-ਹ੍ਰਿ4
-
-	ਹ੍ਹ4
-
-ਹੰ4
-
-	ਹੰੁ4
-
-ਹੱ4
-
-ਿ4
-
-ੜ4
-
-ੜਾ4
-
-	ੜਾਂ4
-
-ੜਿ4
-
-	ੜਿੰ4
-
-	ੜਿੱ4
-
-ੜੀ4
-
-	ੜੀਂ4
-
-ੜੁ4
-
-	ੜੁੱ4
-
-ੜੂ4
-
-	ੜੂੰ4
-
-ੜੇ4
-
-	ੜੇਂ4
-
-ੜੈ4
-
-ੜੋ4
-
-	ੜੋਂ4
-
-ੜੌ4
-
-ੜ੍4
-
-	ੜ੍ਰ4
-
-	ੜ੍ਹ4
-
-ੜ੍ਹਾ4
-
-ੜ੍ਹਾਂ4
-
-ੜ੍ਹਿ4
-
-ੜ੍ਹੀ4
-
-ੜ੍ਹੇ4
-
-ੜ੍ਹੋ4
-
-ੜ੍ਹੋਂ4
-
-ੜੰ4
-
-ੜੱ4
-
-੦4
-
-੧4
-
-੨4
-
-੩4
-
-੪4
-
-੫4
-
-੬4
-
-੭4
-
-੮4
-
-੯4
-
-ੰ4
-
-ੲ4
-
-ੲਿ4
-
-ੲੀ4
-
-ੲੇ4
-
-ੲੈ4
-
-ੲੰ4
-
-ੲੱ4
-
-ੳ4
-
-ੳਂ4
-
-	ੳਂੁ4
-
-ੳੁ4
-
-	ੳੁੱ4
-
-ੳੂ4
-
-	ੳੂਂ4
-
-ੳੱ4
-
-ੴ4
-
-ં4
-
-ઃ4
-
-ઃઃ4
-
-	ઃઃઃ4
-
-ઃઃઃઃ4
-
-ઃઃઃઃઃ4
-
-ઃઃઃઃઃઃ4
-
-ઃઃઃઃઃઃઃ4
-
-ઃઃઃઃઃઃઃઃ4
- 
-ઃઃઃઃઃઃઃઃઃ4
-#
-ઃઃઃઃઃઃઃઃઃઃ4
-&
-!ઃઃઃઃઃઃઃઃઃઃઃ4
-)
-$ઃઃઃઃઃઃઃઃઃઃઃઃ4
-,
-'ઃઃઃઃઃઃઃઃઃઃઃઃઃ4
-/
-*ઃઃઃઃઃઃઃઃઃઃઃઃઃઃ4
-2
--ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ4
-5
-0ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
-8
-3ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
-;
-6ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
->
-9ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
-A
-<ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
-D
-?ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
-G
-Bઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ5
-
-અ5
-
-અઁ5
-
-અં5
-
-	અંં5
-
-	અિે5
-
-અુ5
-
-અે5
-
-અ્5
-
-	અ્ઠ5
-
-આ5
-
-આઁ5
-
-આં5
-
-	આિે5
-
-આે5
-
-ઇ5
-
-ઇં5
-
-ઇે5
-
-ઈ5
-
-ઈઁ5
-
-ઈં5
-
-	ઈિે5
-
-ઈે5
-
-ઉ5
-
-ઉઁ5
-
-ઉં5
-
-ઉે5
-
-ઊ5
-
-ઊઁ5
-
-ઊં5
-
-ઊે5
-
-ઋ5
-
-ઍ5
-
-ઍં5
-
-એ5
-
-એઁ5
-
-એં5
-
-એિ5
-
-એે5
-
-	એેે5
-
-ઐ5
-
-ઐં5
-
-ઑ5
-
-ઓ5
-
-ઓં5
-
-ઓે5
-
-ઓૢ5
-
-ઔ5
-
-ઔં5
-
-ક5
-
-કં5
-
-ક઼5
-
-કિ5
-
-	કિે5
-
-કુ5
-
-	કું5
-
-	કુે5
-
-કૂ5
-
-	કૂં5
-
-કૃ5
-
-કૅ5
-
-કે5
-
-	કેં5
-
-	કેે5
-
-કેેે5
-
-કૈ5
-
-	કૈં5
-
-ક્5
-
-	ક્ક5
-
-ક્કં5
-
-ક્કુ5
-
-ક્કું5
-
-ક્કે5
-
-ક્ક્5
-
-ક્ક્ષ5
-
-ક્ક્સ5
-
-	ક્ખ5
-
-ક્ખુ5
-
-ક્ખે5
-
-	ક્ચ5
-
-ક્ચુ5
-
-ક્ચે5
-
-ક્ચ્છ5
-
-ક્ચ્યુ5
-
-	ક્છ5
-
-	ક્જ5
-
-ક્જ઼ે5
-
-	ક્ઝ5
-
-ક્ઝુ5
-
-ક્ઝે5
-
-	ક્ટ5
-
-ક્ટં5
-
-ક્ટુ5
-
-ક્ટે5
-
-ક્ટ્ર5
-
-ક્ટ્રે5
-
-ક્ટ્સ5
-
-	ક્ઠ5
-
-	ક્ડ5
-
-	ક્ત5
-
-ક્તિે5
-
-ક્તું5
-
-ક્તૃ5
-
-ક્તે5
-
-ક્ત્ત5
-
-ક્ત્ય5
-
-ક્ત્યે5
-
-ક્ત્ર5
-
-ક્ત્વ5
-
-	ક્થ5
-
-	ક્દ5
-
-	ક્ન5
-
-ક્ને5
-
-ક્ન્ડ5
-
-	ક્પ5
-
-	ક્બ5
-
-	ક્ભ5
-
-	ક્મ5
-
-ક્મે5
-
-	ક્ય5
-
-ક્યુ5
-
-ક્યું5
-
-ક્યૂ6
-
-ક્યે6
-
-	ક્ર6
-
-ક્રં6
-
-ક્રુ6
-
-ક્રૂ6
-
-ક્રૃ6
-
-ક્રૅ6
-
-ક્રે6
-
-ક્ર્મ6
-
-	ક્લ6
-
-ક્લં6
-
-ક્લુ6
-
-ક્લૂ6
-
-ક્લૅ6
-
-ક્લે6
-
-ક્લ્ક્સ6
-
-ક્લ્પ6
-
-ક્લ્ય6
-
-	ક્ળ6
-
-ક્ળ્ય6
-
-	ક્વ6
-
-ક્વં6
-
-ક્વે6
-
-	ક્શ6
-
-ક્શે6
-
-	ક્ષ6
-
-ક્ષં6
-
-ક્ષુ6
-
-ક્ષે6
-
-ક્ષૈ6
-
-ક્ષ્6
-
-ક્ષ્ચ6
-
-ક્ષ્ટ6
-
-ક્ષ્ટ્ર6
-
-ક્ષ્ણ6
-
-ક્ષ્ણુ6
-
-ક્ષ્પ6
-
-ક્ષ્મ6
-
-ક્ષ્ય6
-
-ક્ષ્યુ6
-
-ક્ષ્યું6
-
-ક્ષ્વ6
-
-	ક્સ6
-
-ક્સં6
-
-ક્સુ6
-
-ક્સે6
-
-ક્સ્ચ6
-
-ક્સ્ચે6
-
-ક્સ્ટ6
-
-ક્સ્ટે6
-
-ક્સ્ટ્ર6
-
-ક્સ્ડ6
-
-ક્સ્થ6
-
-ક્સ્પ6
-
-ક્સ્પે6
-
-ક્સ્પ્લ6
-
-ક્સ્ફ6
-
-ક્સ્યુ6
-
-	ક્હ6
-
-ક્હે6
-
-કૢ6
-
-ખ6
-
-ખં6
-
-ખ઼6
-
-	ખ઼ુ6
-
-ખિ6
-
-	ખિે6
-
-ખિ્ર6
-
-ખુ6
-
-	ખું6
-
-ખૂ6
-
-	ખૂં6
-
-ખે6
-
-	ખેં6
-
-	ખેે6
-
-ખૈ6
-
-ખ્6
-
-	ખ્ખ6
-
-ખ્ખુ6
-
-ખ્ખું6
-
-ખ્ખે6
-
-ખ્ખેં6
-
-	ખ્છ6
-
-	ખ્ટ6
-
-	ખ્ત6
-
-ખ્તુ6
-
-ખ્તે6
-
-ખ્ત્ય6
-
-	ખ્મ6
-
-ખ્મે6
-
-	ખ્ય6
-
-ખ્યુ6
-
-ખ્યું6
-
-ખ્યે6
-
-	ખ્ર6
-
-ખ્રુ6
-
-	ખ્લ6
-
-ખ્લ્લુ6
-
-	ખ્વ6
-
-	ખ્શ6
-
-ખ્શે6
-
-ખ્શ્ર6
-
-	ખ્સ6
-
-ખ્સે6
-
-ગ6
-
-ગં6
-
-	ગંે6
-
-ગ઼6
-
-	ગિે6
-
-ગિ્ન6
-
-ગિ્લ6
-
-ગિ્વ6
-
-ગુ6
-
-	ગું6
-
-ગૂ6
-
-	ગૂં6
-
-ગૃ6
-
-ગૅ6
-
-ગે6
-
-	ગેં6
-
-	ગેે6
-
-ગે્ર6
-
-ગૈ6
-
-ગ્6
-
-	ગ્ગ6
-
-ગ્ગુ6
-
-ગ્ગે6
-
-ગ્ગ્લુ7
-
-	ગ્છ7
-
-	ગ્ઝ7
-
-	ગ્ટ7
-
-	ગ્ડ7
-
-	ગ્ણ7
-
-ગ્ણુ7
-
-	ગ્ત7
-
-	ગ્દ7
-
-	ગ્ધ7
-
-	ગ્ન7
-
-ગ્નુ7
-
-ગ્ને7
-
-ગ્ન્ય7
-
-	ગ્પ7
-
-	ગ્બ7
-
-	ગ્ભ7
-
-	ગ્મ7
-
-ગ્મૂ7
-
-ગ્મે7
-
-	ગ્ય7
-
-ગ્યુ7
-
-ગ્યું7
-
-ગ્યૂ7
-
-ગ્યે7
-
-	ગ્ર7
-
-ગ્રં7
-
-ગ્રંે7
-
-ગ્રુ7
-
-ગ્રૂ7
-
-ગ્રૅ7
-
-ગ્રે7
-
-ગ્રેં7
-
-	ગ્લ7
-
-ગ્લં7
-
-ગ્લુ7
-
-ગ્લૂ7
-
-ગ્લૅ7
-
-ગ્લે7
-
-ગ્લેં7
-
-	ગ્વ7
-
-ગ્વે7
-
-	ગ્સ7
-
-ગ્સે7
-
-ગ્સ્ટ7
-
-ગૢ7
-
-ઘ7
-
-ઘં7
-
-ઘુ7
-
-	ઘું7
-
-ઘૂ7
-
-	ઘૂં7
-
-ઘૃ7
-
-ઘે7
-
-	ઘેં7
-
-	ઘેે7
-
-ઘ્7
-
-	ઘ્ધ7
-
-	ઘ્ન7
-
-ઘ્ને7
-
-	ઘ્ય7
-
-ઘ્યે7
-
-	ઘ્ર7
-
-ઘ્રુ7
-
-	ઘ્વ7
-
-ઙ7
-
-ઙૂ7
-
-ઙે7
-
-	ઙ્ગ7
-
-ચ7
-
-ચં7
-
-ચા7
-
-ચિ7
-
-	ચિે7
-
-ચુ7
-
-	ચું7
-
-ચૂ7
-
-	ચૂં7
-
-ચૅ7
-
-ચે7
-
-	ચેં7
-
-	ચેે7
-
-ચૈ7
-
-ચ્7
-
-	ચ્ચ7
-
-ચ્ચુ7
-
-ચ્ચું7
-
-ચ્ચે7
-
-ચ્ચેં7
-
-ચ્ચેે7
-
-	ચ્છ7
-
-ચ્છં7
-
-ચ્છુ7
-
-ચ્છું7
-
-ચ્છે7
-
-ચ્છ્વ7
-
-	ચ્ટ7
-
-	ચ્ડ7
-
-	ચ્ન7
-
-	ચ્મ7
-
-	ચ્ય7
-
-ચ્યુ7
-
-ચ્યું7
-
-ચ્યૂ7
-
-ચ્યે7
-
-	ચ્લ7
-
-	ચ્વ7
-
-	ચ્સ7
-
-	ચ્હ7
-
-છ7
-
-છં7
-
-છઃ7
-
-	છઃઃ7
-
-છઃઃઃ7
-
-છઃઃઃઃ7
-
-છઃઃઃઃઃ7
-
-છઃઃઃઃઃઃ7
-5
-0છઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ7
-
-	છઃે7
-
-છુ7
-
-	છું7
-
-છૂ7
-
-	છૂં7
-
-છૅ7
-
-છે7
-
-	છેં7
-
-	છેે7
-
-છેેે7
-
-	છેૢ8
-
-છૈ8
-
-છ્8
-
-	છ્છ8
-
-છ્છે8
-
-	છ્ઠ8
-
-	છ્ત8
-
-	છ્ય8
-
-છ્યુ8
-
-છ્યું8
-
-	છ્લ8
-
-છ્લે8
-
-	છ્વ8
-
-	છ્હ8
-
-છ્હે8
-
-જ8
-
-જં8
-
-જ઼8
-
-	જ઼ે8
-
-જ઼્ય8
-
-	જિે8
-
-જી8
-
-	જીં8
-
-જુ8
-
-	જું8
-
-	જુે8
-
-જૂ8
-
-	જૂં8
-
-જૅ8
-
-જે8
-
-	જેં8
-
-	જે઼8
-
-	જેિ8
-
-	જેે8
-
-જેેે8
-
-જૈ8
-
-જ્8
-
-	જ્ક8
-
-	જ્ગ8
-
-જ્ગ્ય8
-
-	જ્છ8
-
-જ્છે8
-
-	જ્જ8
-
-જ્જી8
-
-જ્જુ8
-
-જ્જૂ8
-
-જ્જે8
-
-જ્જૈ8
-
-જ્જ્ઞ8
-
-જ્જ્વ8
-
-	જ્ઝ8
-
-	જ્ઞ8
-
-જ્ઞે8
-
-	જ્ડ8
-
-જ્ણુ8
-
-	જ્ત8
-
-	જ્થ8
-
-	જ્ન8
-
-જ્ન્મ8
-
-	જ્બ8
-
-જ્બુ8
-
-જ્બે8
-
-	જ્મ8
-
-જ્મે8
-
-	જ્ય8
-
-જ્યં8
-
-જ્યુ8
-
-જ્યું8
-
-જ્યૂ8
-
-જ્યે8
-
-જ્ય્8
-
-જ્ય્સ8
-
-	જ્ર8
-
-જ્રે8
-
-	જ્લ8
-
-	જ્વ8
-
-જ્વે8
-
-	જ્સ8
-
-	જ્હ8
-
-ઝ8
-
-ઝં8
-
-ઝ઼8
-
-ઝુ8
-
-	ઝું8
-
-ઝૂ8
-
-	ઝૂં8
-
-ઝૅ8
-
-ઝે8
-
-	ઝેં8
-
-	ઝેે8
-
-ઝૈ8
-
-ઝ્8
-
-	ઝ્ક8
-
-	ઝ્ઝ8
-
-	ઝ્ડ8
-
-	ઝ્ન8
-
-	ઝ્મ8
-
-	ઝ્ય8
-
-ઝ્યુ8
-
-ઝ્યું8
-
-	ઝ્ર8
-
-	ઝ્લ8
-
-ઝ્લે8
-
-	ઝ્વ8
-
-ઝ્વં8
-
-	ઝ્હ8
-
-ઝ્હે8
-
-ઞ8
-
-	ઞ્જ8
-
-	ઞ્લ8
-
-ટ8
-
-ટં8
-
-	ટિે8
-
-ટુ8
-
-	ટું8
-
-ટૂ8
-
-	ટૂં8
-
-ટૅ8
-
-ટે8
-
-	ટેં8
-
-	ટેે8
-
-ટે્ર8
-
-ટૈ8
-
-ટ્8
-
-	ટ્આ8
-
-	ટ્ક8
-
-	ટ્ચ8
-
-	ટ્જ8
-
-ટ્જે9
-
-	ટ્ઝ9
-
-ટ્ઝે9
-
-	ટ્ટ9
-
-ટ્ટુ9
-
-ટ્ટે9
-
-ટ્ટૈ9
-
-ટ્ટ્9
-
-	ટ્ઠ9
-
-ટ્ણુ9
-
-	ટ્ન9
-
-	ટ્પ9
-
-	ટ્ય9
-
-ટ્યુ9
-
-ટ્યું9
-
-ટ્યૂ9
-
-	ટ્ર9
-
-ટ્રં9
-
-ટ્રુ9
-
-ટ્રૂ9
-
-ટ્રૅ9
-
-ટ્રે9
-
-ટ્ર્સ9
-
-	ટ્લ9
-
-ટ્લું9
-
-ટ્લે9
-
-	ટ્વ9
-
-ટ્વે9
-
-	ટ્સ9
-
-ટ્સે9
-
-ટ્સ્ક9
-
-ટ્સ્પ9
-
-ઠ9
-
-ઠં9
-
-ઠુ9
-
-	ઠું9
-
-ઠૂ9
-
-	ઠૂં9
-
-ઠે9
-
-	ઠેં9
-
-	ઠેે9
-
-ઠ્9
-
-	ઠ્ઠ9
-
-ઠ્ઠુ9
-
-ઠ્ઠું9
-
-ઠ્ઠે9
-
-	ઠ્ય9
-
-ઠ્યું9
-
-ડ9
-
-ડં9
-
-ડ઼9
-
-	ડ઼ે9
-
-ડિ9
-
-	ડિ઼9
-
-	ડિે9
-
-ડુ9
-
-	ડું9
-
-ડૂ9
-
-	ડૂં9
-
-ડૅ9
-
-ડે9
-
-	ડેં9
-
-	ડે઼9
-
-	ડેે9
-
-ડૈ9
-
-ડ્9
-
-	ડ્ક9
-
-ડ્ક્ટ9
-
-	ડ્ગ9
-
-	ડ્જ9
-
-ડ્જે9
-
-	ડ્ઝ9
-
-ડ્ઝે9
-
-	ડ્ટ9
-
-ડ્ટે9
-
-	ડ્ડ9
-
-ડ્ડે9
-
-ડ્ડ્રે9
-
-	ડ્ત9
-
-	ડ્થ9
-
-	ડ્ન9
-
-	ડ્મ9
-
-	ડ્ય9
-
-ડ્યુ9
-
-ડ્યું9
-
-ડ્યૂ9
-
-ડ્યે9
-
-	ડ્ર9
-
-ડ્રં9
-
-ડ્રુ9
-
-ડ્રૂ9
-
-ડ્રૅ9
-
-ડ્રે9
-
-	ડ્લ9
-
-	ડ્વ9
-
-ડ્વે9
-
-	ડ્સ9
-
-ડ્સે9
-
-ઢ9
-
-ઢં9
-
-ઢ઼9
-
-ઢુ9
-
-	ઢું9
-
-ઢૂ9
-
-	ઢૂં9
-
-ઢે9
-
-	ઢેં9
-
-	ઢ્ઢ9
-
-	ઢ્ય9
-
-ઢ્યુ9
-
-ઢ્યું9
-
-ણ9
-
-ણં9
-
-	ણિે9
-
-ણુ9
-
-	ણું9
-
-ણુંં9
-
-	ણુુ9
-
-	ણુે9
-
-ણૂ9
-
-	ણૂં9
-
-ણૅ9
-
-ણે9
-
-	ણેં9
-
-	ણેે9
-
-ણૈ9
-
-ણ્9
-
-	ણ્આ9
-
-	ણ્ટ:
-
-	ણ્ઠ:
-
-	ણ્ડ:
-
-ણ્ડુ:
-
-ણ્ડે:
-
-	ણ્ણ:
-
-ણ્ણૂ:
-
-	ણ્મ:
-
-	ણ્ય:
-
-ણ્યુ:
-
-ણ્યું:
-
-ણ્યે:
-
-	ણ્વ:
-
-ણૢ:
-
-ત:
-
-તં:
-
-તા:
-
-તિ:
-
-	તિે:
-
-	તીે:
-
-તુ:
-
-	તુઁ:
-
-	તું:
-
-તૂ:
-
-	તૂં:
-
-તૃ:
-
-તૅ:
-
-તે:
-
-	તેં:
-
-	તેુ:
-
-	તેે:
-
-તેેે:
-
-તૈ:
-
-	તૈં:
-
-	તૈે:
-
-	તોૢ:
-
-ત્:
-
-	ત્આ:
-
-	ત્ક:
-
-ત્કં:
-
-ત્કુ:
-
-ત્કૃ:
-
-ત્કે:
-
-ત્ક્ર:
-
-ત્ક્રુ:
-
-ત્ક્ષ:
-
-	ત્ખ:
-
-	ત્ચ:
-
-	ત્છ:
-
-	ત્જ:
-
-	ત્ઝ:
-
-ત્ઝે:
-
-	ત્ત:
-
-ત્તં:
-
-ત્તુ:
-
-ત્તું:
-
-ત્તૂ:
-
-ત્તે:
-
-ત્ત્ત:
-
-ત્ત્પ:
-
-ત્ત્ર:
-
-ત્ત્વ:
-
-ત્ત્વે:
-
-	ત્થ:
-
-ત્થે:
-
-	ત્ન:
-
-ત્નું:
-
-ત્ને:
-
-	ત્પ:
-
-ત્પં:
-
-ત્પુ:
-
-ત્પૂ:
-
-ત્પ્ર:
-
-ત્પ્રે:
-
-	ત્ફ:
-
-	ત્બ:
-
-ત્બુ:
-
-	ત્ભ:
-
-	ત્મ:
-
-ત્મે:
-
-ત્મ્ય:
-
-	ત્ય:
-
-ત્યં:
-
-ત્યા:
-
-ત્યુ:
-
-ત્યું:
-
-ત્યૂ:
-
-ત્યે:
-
-ત્ય્:
-
-ત્ય્દ:
-
-ત્ય્હ:
-
-	ત્ર:
-
-ત્રં:
-
-ત્રુ:
-
-ત્રું:
-
-ત્રૂ:
-
-ત્રે:
-
-ત્રેં:
-
-ત્રેે:
-
-ત્રૈ:
-
-ત્ર્ન:
-
-ત્ર્ય:
-
-ત્ર્યં:
-
-	ત્લ:
-
-ત્લે:
-
-	ત્વ:
-
-ત્વં:
-
-ત્વે:
-
-	ત્શ:
-
-ત્શે:
-
-	ત્સ:
-
-ત્સં:
-
-ત્સુ:
-
-ત્સૂ:
-
-ત્સે:
-
-ત્સ્ન:
-
-ત્સ્ય:
-
-ત્સ્યે:
-
-ત્સ્વ:
-
-	ત્હ:
-
-ત્હે:
-
-તૢ:
-
-થ:
-
-થં:
-
-થા:
-
-	થાે:
-
-	થીે:
-
-થુ:
-
-	થું;
-
-થૂ;
-
-	થૂં;
-
-થૅ;
-
-થે;
-
-	થેં;
-
-	થેે;
-
-થૈ;
-
-થ્;
-
-	થ્ઈ;
-
-	થ્ત;
-
-	થ્થ;
-
-થ્થુ;
-
-થ્થું;
-
-થ્થૈ;
-
-	થ્ન;
-
-	થ્ય;
-
-થ્યુ;
-
-થ્યૂ;
-
-થ્યે;
-
-	થ્ર;
-
-થ્રુ;
-
-થ્રૂ;
-
-થ્રે;
-
-થ્ર્ય;
-
-	થ્લ;
-
-થ્લે;
-
-	થ્વ;
-
-	થ્સ;
-
-દ;
-
-દં;
-
-	દિે;
-
-દુ;
-
-	દું;
-
-	દુે;
-
-દૂ;
-
-	દૂં;
-
-દૃ;
-
-દૅ;
-
-દે;
-
-	દેં;
-
-	દેે;
-
-	દે્;
-
-દૈ;
-
-દ્;
-
-દ્અં;
-
-	દ્ઉ;
-
-	દ્ક;
-
-	દ્ગ;
-
-દ્ગુ;
-
-દ્ગૃ;
-
-દ્ગ્ર;
-
-	દ્ઘ;
-
-	દ્ત;
-
-	દ્દ;
-
-દ્દં;
-
-દ્દુ;
-
-દ્દે;
-
-	દ્ધ;
-
-દ્ધં;
-
-દ્ધુ;
-
-દ્ધૃ;
-
-દ્ધે;
-
-દ્ધ્;
-
-દ્ધ્વ;
-
-	દ્ન;
-
-દ્નુ;
-
-દ્ને;
-
-	દ્બ;
-
-દ્બુ;
-
-દ્બે;
-
-	દ્ભ;
-
-દ્ભુ;
-
-દ્ભૂ;
-
-	દ્મ;
-
-	દ્ય;
-
-દ્યં;
-
-દ્યુ;
-
-દ્યું;
-
-દ્યૂ;
-
-દ્યે;
-
-	દ્ર;
-
-દ્રં;
-
-દ્રુ;
-
-દ્રૂ;
-
-દ્રે;
-
-દ્ર્મ્સ;
-
-દ્ર્ય;
-
-દ્ર્ષ્ટ;
-
-	દ્લ;
-
-	દ્વ;
-
-દ્વં;
-
-દ્વે;
-
-દ્વૈ;
-
-દ્વ્ર;
-
-	દ્શ;
-
-	દ્સ;
-
-	દ્હ;
-
-ધ;
-
-ધં;
-
-ધિ;
-
-ધુ;
-
-	ધું;
-
-ધુ્મ્ર;
-
-ધુ્ર;
-
-ધૂ;
-
-	ધૂં;
-
-ધૃ;
-
-ધૅ;
-
-ધે;
-
-	ધેં;
-
-	ધેે;
-
-ધૈ;
-
-ધ્;
-
-	ધ્દ;
-
-	ધ્ધ;
-
-ધ્ધે;
-
-	ધ્ન;
-
-ધ્ને;
-
-ધ્ન્ય્વ;
-
-	ધ્મ;
-
-	ધ્ય;
-
-ધ્યુ;
-
-ધ્યું;
-
-ધ્યે;
-
-	ધ્ર;
-
-ધ્રુ;
-
-ધ્રૂ;
-
-ધ્રે<
-
-ધ્ર્વ<
-
-	ધ્વ<
-
-ધ્વં<
-
-ન<
-
-નં<
-
-	નંે<
-
-ના<
-
-નિ<
-
-	નિે<
-
-નિ્દ્ર<
-
-નિ્સ<
-
-નિ્સ્ટ<
-
-	નીે<
-
-નુ<
-
-	નુઁ<
-
-	નું<
-
-	નુે<
-
-	નુ્<
-
-નૂ<
-
-	નૂં<
-
-નૃ<
-
-નૅ<
-
-ને<
-
-	નેં<
-
-	નેે<
-
-નેેે<
-
-નૈ<
-
-	નૈં<
-
-	નૈે<
-
-ન્<
-
-	ન્ક<
-
-ન્કં<
-
-ન્કુ<
-
-ન્કે<
-
-ન્ક્ટ<
-
-ન્ક્ડ<
-
-ન્ક્ય<
-
-ન્ક્યુ<
-
-ન્ક્ર<
-
-ન્ક્વ<
-
-ન્ક્વે<
-
-ન્ક્સ<
-
-	ન્ગ<
-
-ન્ગુ<
-
-ન્ગે<
-
-ન્ગ્ટ<
-
-ન્ગ્યુ<
-
-ન્ગ્ર<
-
-ન્ગ્રે<
-
-ન્ગ્લ<
-
-ન્ગ્વ<
-
-ન્ગ્વે<
-
-ન્ગ્સ્ટ<
-
-	ન્ઘ<
-
-ન્ઘુ<
-
-	ન્ચ<
-
-ન્ચં<
-
-ન્ચુ<
-
-ન્ચૂ<
-
-ન્ચે<
-
-ન્ચ્યુ<
-
-	ન્છ<
-
-ન્છુ<
-
-ન્છે<
-
-	ન્જ<
-
-ન્જં<
-
-ન્જી<
-
-ન્જુ<
-
-ન્જે<
-
-	ન્ઝ<
-
-ન્ઝે<
-
-ન્ઝ્યુ<
-
-	ન્ટ<
-
-ન્ટં<
-
-ન્ટુ<
-
-ન્ટૂ<
-
-ન્ટે<
-
-ન્ટ્યુ<
-
-ન્ટ્ર<
-
-ન્ટ્રે<
-
-ન્ટ્સ<
-
-ન્ટ્સે<
-
-	ન્ડ<
-
-ન્ડં<
-
-ન્ડુ<
-
-ન્ડે<
-
-ન્ડ્ઝ<
-
-ન્ડ્ટ<
-
-ન્ડ્યુ<
-
-ન્ડ્ર<
-
-ન્ડ્રુ<
-
-ન્ડ્રૂ<
-
-ન્ડ્રે<
-
-ન્ડ્ર્યુ<
-
-ન્ડ્સ<
-
-ન્ડ્સે<
-
-	ન્ત<
-
-ન્તુ<
-
-ન્તે<
-
-ન્ત્<
-
-ન્ત્ય<
-
-ન્ત્યે<
-
-ન્ત્ર<
-
-	ન્થ<
-
-ન્થુ<
-
-ન્થે<
-
-ન્થ્ર<
-
-ન્થ્રે<
-
-	ન્દ<
-
-ન્દુ<
-
-ન્દૂ<
-
-ન્દે<
-
-ન્દ્<
-
-ન્દ્ગ<
-
-ન્દ્ર<
-
-ન્દ્રે<
-
-ન્દ્વ<
-
-	ન્ધ<
-
-ન્ધુ<
-
-ન્ધે<
-
-ન્ધ્ય<
-
-ન્ધ્ર<
-
-	ન્ન<
-
-ન્નુ<
-
-ન્નૂ<
-
-ન્ને<
-
-ન્નેં<
-
-ન્નૈ=
-
-ન્ન્મ=
-
-	ન્પ=
-
-	ન્ફ=
-
-ન્ફે=
-
-ન્ફ્યુ=
-
-ન્ફ્યૂ=
-
-ન્ફ્ર=
-
-ન્ફ્રે=
-
-ન્ફ્લુ=
-
-ન્ફ્લે=
-
-	ન્બ=
-
-ન્બુ=
-
-ન્બે=
-
-	ન્ભ=
-
-	ન્મ=
-
-ન્મુ=
-
-ન્મૂ=
-
-ન્મે=
-
-ન્મ્ય=
-
-ન્મ્યું=
-
-ન્મ્ર=
-
-	ન્ય=
-
-ન્યં=
-
-ન્યુ=
-
-ન્યું=
-
-ન્યુે=
-
-ન્યૂ=
-
-ન્યે=
-
-ન્ય્=
-
-	ન્ર=
-
-ન્રુ=
-
-ન્રે=
-
-	ન્લ=
-
-ન્લે=
-
-	ન્વ=
-
-ન્વં=
-
-ન્વે=
-
-	ન્શ=
-
-ન્શુ=
-
-ન્શે=
-
-ન્શ્ય=
-
-ન્શ્યુ=
-
-	ન્સ=
-
-ન્સં=
-
-ન્સુ=
-
-ન્સૂ=
-
-ન્સે=
-
-ન્સ્ક=
-
-ન્સ્ક્ર=
-
-ન્સ્ટ=
-
-ન્સ્ટે=
-
-ન્સ્ટ્ર=
-
-ન્સ્ટ્રુ=
-
-ન્સ્ટ્રે=
-
-ન્સ્ડ=
-
-ન્સ્પ=
-
-ન્સ્પે=
-
-ન્સ્ય=
-
-ન્સ્યુ=
-
-ન્સ્યૂ=
-
-ન્સ્લ=
-
-ન્સ્લે=
-
-	ન્હ=
-
-ન્હુ=
-
-ન્હે=
-
-ન્હેં=
-
-નૢ=
-
-પ=
-
-પં=
-
-પા=
-
-પિ=
-
-	પિિ=
-
-	પિુ=
-
-	પિે=
-
-પિ્ત=
-
-પિ્તે=
-
-પિ્ર=
-
-પિ્રે=
-
-પિ્લ=
-
-પિ્સ=
-
-પુ=
-
-	પું=
-
-પૂ=
-
-	પૂં=
-
-પૃ=
-
-પૅ=
-
-પે=
-
-	પેં=
-
-	પેે=
-
-પે્લ=
-
-પૈ=
-
-	પૈં=
-
-પ્=
-
-	પ્ક=
-
-	પ્ચ=
-
-પ્ચ્યુ=
-
-પ્ચ્યૂ=
-
-	પ્ટ=
-
-પ્ટં=
-
-પ્ટે=
-
-પ્ટેં=
-
-પ્ટ્સ=
-
-	પ્ડ=
-
-	પ્ણ=
-
-	પ્ત=
-
-પ્તે=
-
-પ્ત્ય=
-
-	પ્થ=
-
-પ્થે=
-
-	પ્ન=
-
-પ્નું=
-
-પ્ને=
-
-	પ્પ=
-
-પ્પુ=
-
-પ્પે=
-
-	પ્ફ=
-
-પ્ફુ=
-
-	પ્બ=
-
-	પ્ય=
-
-પ્યં=
-
-પ્યુ=
-
-પ્યું=
-
-પ્યુંં=
-
-પ્યૂ=
-
-પ્યે=
-
-	પ્ર=
-
-પ્રં=
-
-પ્રિ>
-
-પ્રુ>
-
-પ્રૂ>
-
-પ્રે>
-
-પ્રેં>
-
-પ્રેે>
-
-પ્રૈ>
-
-પ્ર્>
-
-પ્ર્ય>
-
-	પ્લ>
-
-પ્લં>
-
-પ્લુ>
-
-પ્લૂ>
-
-પ્લૅ>
-
-પ્લે>
-
-પ્લેં>
-
-પ્લ્યુ>
-
-	પ્વ>
-
-	પ્શ>
-
-	પ્સ>
-
-પ્સુ>
-
-પ્સૂ>
-
-પ્સે>
-
-પ્સ્યુ>
-
-પ્સ્યૂ>
-
-	પ્હ>
-
-પ્હે>
-
-ફ>
-
-ફં>
-
-ફ઼>
-
-	ફ઼ે>
-
-ફ઼્ટ>
-
-ફ઼્ર>
-
-	ફિે>
-
-ફુ>
-
-	ફું>
-
-ફૂ>
-
-	ફૂં>
-
-ફૅ>
-
-ફે>
-
-	ફેં>
-
-	ફેે>
-
-ફૈ>
-
-ફ્>
-
-	ફ્ક>
-
-ફ્ક્ત>
-
-	ફ્ઘ>
-
-ફ્જી>
-
-	ફ્ટ>
-
-ફ્ટં>
-
-ફ્ટે>
-
-ફ્ટ્સ>
-
-	ફ્ત>
-
-ફ્તે>
-
-	ફ્થ>
-
-	ફ્દ>
-
-	ફ્ન>
-
-ફ્ન્સ્ટ>
-
-	ફ્ફ>
-
-ફ્ફે>
-
-	ફ્ય>
-
-ફ્યુ>
-
-ફ્યૂ>
-
-ફ્યે>
-
-	ફ્ર>
-
-ફ્રં>
-
-ફ્રુ>
-
-ફ્રૂ>
-
-ફ્રૅ>
-
-ફ્રે>
-
-ફ્રેં>
-
-	ફ્લ>
-
-ફ્લુ>
-
-ફ્લૂ>
-
-ફ્લૅ>
-
-ફ્લે>
-
-ફ્લેં>
-
-ફ્લ્યુ>
-
-	ફ્ળ>
-
-	ફ્સ>
-
-ફ્હે>
-
-	ફ્ે>
-
-બ>
-
-બઁ>
-
-બં>
-
-બિ>
-
-	બિે>
-
-બિ્ધ>
-
-બિ્ર>
-
-બિ્લ>
-
-બુ>
-
-	બું>
-
-બુ્ર>
-
-બૂ>
-
-	બૂઁ>
-
-	બૂં>
-
-બૃ>
-
-બૅ>
-
-	બૅં>
-
-બે>
-
-	બેં>
-
-	બેે>
-
-બૈ>
-
-	બૈં>
-
-બ્>
-
-	બ્ક>
-
-	બ્જ>
-
-બ્જે>
-
-	બ્ઝ>
-
-	બ્ડ>
-
-બ્ડે>
-
-	બ્ત>
-
-	બ્દ>
-
-બ્દુ>
-
-બ્દે>
-
-	બ્ધ>
-
-	બ્ન>
-
-બ્ને>
-
-	બ્બ>
-
-બ્બુ>
-
-બ્બે>
-
-	બ્ભ>
-
-	બ્મ>
-
-	બ્ય>
-
-બ્યુ>
-
-બ્યું>
-
-બ્યૂ>
-
-	બ્ર>
-
-બ્રિ?
-
-બ્રુ?
-
-બ્રૂ?
-
-બ્રૅ?
-
-બ્રે?
-
-બ્રેં?
-
-બ્ર્ય?
-
-બ્ર્હ્મ?
-
-	બ્લ?
-
-બ્લુ?
-
-બ્લૂ?
-
-બ્લૅ?
-
-બ્લે?
-
-બ્લેં?
-
-બ્લૈ?
-
-બ્લ્ડ?
-
-બ્લ્યુ?
-
-બ્લ્યૂ?
-
-	બ્વ?
-
-બ્વે?
-
-	બ્શ?
-
-	બ્સ?
-
-બ્સે?
-
-બ્સ્ટ?
-
-બ્સ્ટે?
-
-	બ્હ?
-
-બ્હે?
-
-ભ?
-
-ભં?
-
-ભા?
-
-ભિ?
-
-	ભિે?
-
-ભુ?
-
-	ભું?
-
-ભૂ?
-
-	ભૂં?
-
-	ભૂે?
-
-ભૃ?
-
-ભૅ?
-
-ભે?
-
-	ભેં?
-
-	ભેે?
-
-ભૈ?
-
-ભ્?
-
-	ભ્છ?
-
-	ભ્ભ?
-
-	ભ્ય?
-
-ભ્યં?
-
-ભ્યુ?
-
-ભ્યું?
-
-ભ્યે?
-
-	ભ્ર?
-
-ભ્રં?
-
-ભ્રુ?
-
-ભ્રૂ?
-
-મ?
-
-મઁ?
-
-મં?
-
-	મંે?
-
-મઃ?
-
-મઃઃઃ?
-
-મા?
-
-	માં?
-
-માંં?
-
-મિ?
-
-	મિં?
-
-	મિિ?
-
-	મિુ?
-
-	મિે?
-
-મિ્ર?
-
-મુ?
-
-	મું?
-
-	મુઃ?
-
-મુઃઃ?
-
-	મુે?
-
-મૂ?
-
-	મૂં?
-
-મૃ?
-
-મૅ?
-
-મે?
-
-	મેં?
-
-મેંં?
-
-મેંે?
-
-	મેે?
-
-મેેે?
-
-મૈ?
-
-	મૈં?
-
-મ્?
-
-	મ્ક?
-
-	મ્ખ?
-
-	મ્ગ?
-
-મ્ગ્ર?
-
-	મ્ચ?
-
-	મ્છ?
-
-	મ્જ?
-
-	મ્ઝ?
-
-	મ્ટ?
-
-મ્ટે?
-
-	મ્ડ?
-
-મ્ણુ?
-
-	મ્ત?
-
-	મ્થ?
-
-	મ્દ?
-
-	મ્ન?
-
-મ્નું?
-
-મ્ને?
-
-	મ્પ?
-
-મ્પં?
-
-મ્પુ?
-
-મ્પૂ?
-
-મ્પે?
-
-મ્પ્ટ?
-
-મ્પ્ય?
-
-મ્પ્યુ?
-
-મ્પ્યૂ?
-
-મ્પ્ર?
-
-મ્પ્રુ?
-
-મ્પ્રે?
-
-મ્પ્લ?
-
-મ્પ્લે?
-
-મ્પ્સ?
-
-	મ્ફ?
-
-મ્ફે?
-
-મ્ફ્ર?
-
-	મ્બ?
-
-મ્બં?
-
-મ્બુ?
-
-મ્બૂ?
-
-મ્બે@
-
-મ્બ્યુ@
-
-મ્બ્ર@
-
-મ્બ્રે@
-
-મ્બ્લ@
-
-મ્બ્શ@
-
-મ્બ્સ@
-
-	મ્ભ@
-
-મ્ભુ@
-
-મ્ભે@
-
-	મ્મ@
-
-મ્મુ@
-
-મ્મૂ@
-
-મ્મે@
-
-	મ્ય@
-
-મ્યુ@
-
-મ્યું@
-
-મ્યૂ@
-
-મ્યે@
-
-	મ્ર@
-
-મ્રુ@
-
-મ્રૂ@
-
-મ્રે@
-
-	મ્લ@
-
-મ્લે@
-
-	મ્વ@
-
-	મ્શ@
-
-	મ્સ@
-
-મ્સે@
-
-મ્સ્ક@
-
-મ્સ્ટ@
-
-	મ્હ@
-
-મ્હે@
-
-મ્હેં@
-
-ય@
-
-યં@
-
-ય઼@
-
-યુ@
-
-	યું@
-
-	યુે@
-
-યૂ@
-
-	યૂં@
-
-યૅ@
-
-યે@
-
-	યેં@
-
-	યેુ@
-
-	યેે@
-
-યૈ@
-
-ય્@
-
-ય્છે@
-
-	ય્ઝ@
-
-	ય્ત@
-
-	ય્ય@
-
-ય્રે@
-
-	ય્સ@
-
-ર@
-
-રઁ@
-
-રં@
-
-રા@
-
-રિ@
-
-	રિે@
-
-રી@
-
-	રીુ@
-
-	રીે@
-
-	રીૢ@
-
-રુ@
-
-	રું@
-
-રૂ@
-
-	રૂં@
-
-	રૂુ@
-
-	રૂે@
-
-રૃ@
-
-રૅ@
-
-રે@
-
-	રેં@
-
-	રેે@
-
-રેેે@
-
-રૈ@
-
-ર્@
-
-	ર્ં@
-
-	ર્આ@
-
-	ર્એ@
-
-	ર્ક@
-
-ર્કં@
-
-ર્કા@
-
-ર્કી@
-
-ર્કીં@
-
-ર્કુ@
-
-ર્કે@
-
-ર્કો@
-
-ર્કોં@
-
-ર્ક્ટ@
-
-ર્ક્ડ@
-
-ર્ક્યુ@
-
-ર્ક્શ@
-
-ર્ક્ષી@
-
-ર્ક્સ@
-
-	ર્ખ@
-
-ર્ખા@
-
-ર્ખે@
-
-	ર્ગ@
-
-ર્ગં@
-
-ર્ગા@
-
-ર્ગાં@
-
-ર્ગી@
-
-ર્ગુ@
-
-ર્ગે@
-
-ર્ગો@
-
-ર્ગોં@
-
-ર્ગ્યુ@
-
-	ર્ઘ@
-
-ર્ઘા@
-
-	ર્ચ@
-
-ર્ચં@
-
-ર્ચા@
-
-ર્ચી@
-
-ર્ચુ@
-
-ર્ચે@
-
-ર્ચો@
-
-ર્ચ્છ@
-
-ર્ચ્યા@
-
-ર્ચ્યુ@
-
-ર્ચ્યૂ@
-
-	ર્છ@
-
-ર્છા@
-
-	ર્જ@
-
-ર્જં@
-
-ર્જ઼@
-
-ર્જાA
-
-ર્જીA
-
-ર્જીંA
-
-ર્જુA
-
-ર્જૂA
-
-ર્જેA
-
-ર્જેંA
-
-ર્જોA
-
-ર્જ્ડA
-
-ર્જ્યA
-
-ર્જ્યુંA
-
-ર્જ્યોA
-
-	ર્ઝA
-
-ર્ઝાA
-
-ર્ઝીA
-
-ર્ઝેA
-
-ર્ઝોA
-
-	ર્ટA
-
-ર્ટંA
-
-ર્ટાA
-
-ર્ટીA
-
-ર્ટીંA
-
-ર્ટુA
-
-ર્ટૂA
-
-ર્ટેA
-
-ર્ટોA
-
-ર્ટ્ઝA
-
-ર્ટ્યુA
-
-ર્ટ્રાA
-
-ર્ટ્રેA
-
-ર્ટ્સA
-
-ર્ટ્સેA
-
-	ર્ડA
-
-ર્ડંA
-
-ર્ડાA
-
-ર્ડીA
-
-ર્ડીંA
-
-ર્ડુA
-
-ર્ડેA
-
-ર્ડોA
-
-ર્ડ્ઝA
-
-ર્ડ્ઝેA
-
-ર્ડ્સA
-
-ર્ડ્સેA
-
-	ર્ણA
-
-ર્ણંA
-
-ર્ણાA
-
-ર્ણાંA
-
-ર્ણીA
-
-ર્ણુA
-
-ર્ણુંA
-
-ર્ણેA
-
-ર્ણોA
-
-	ર્તA
-
-ર્તંA
-
-ર્તાA
-
-ર્તા્સA
-
-ર્તિેA
-
-ર્તીA
-
-ર્તુA
-
-ર્તુંA
-
-ર્તૃA
-
-ર્તેA
-
-ર્તેંA
-
-ર્તોA
-
-ર્ત્તA
-
-ર્ત્યA
-
-ર્ત્યાA
-
-ર્ત્યેA
-
-	ર્થA
-
-ર્થંA
-
-ર્થાA
-
-ર્થાંA
-
-ર્થીA
-
-ર્થુA
-
-ર્થેA
-
-ર્થોA
-
-ર્થોંA
-
-ર્થ્યA
-
-ર્થ્રોA
-
-	ર્દA
-
-ર્દંA
-
-ર્દાA
-
-ર્દીA
-
-ર્દુA
-
-ર્દુંA
-
-ર્દૂA
-
-ર્દેA
-
-ર્દોA
-
-ર્દોંA
-
-ર્દ્ધA
-
-ર્દ્રA
-
-ર્દ્રાA
-
-ર્દ્વાA
-
-	ર્ધA
-
-ર્ધાA
-
-ર્ધાંA
-
-ર્ધીA
-
-ર્ધુંA
-
-ર્ધેA
-
-ર્ધોA
-
-ર્ધ્યA
-
-ર્ધ્યાA
-
-ર્ધ્વA
-
-	ર્નA
-
-ર્નંA
-
-ર્નાA
-
-ર્નિA
-
-ર્નીA
-
-ર્નીંA
-
-ર્નુA
-
-ર્નુંA
-
-ર્નૂA
-
-ર્નેA
-
-ર્નેંA
-
-ર્નોA
-
-ર્ન્ડA
-
-ર્ન્મેA
-
-ર્ન્સA
-
-ર્ન્સ્ટA
-
-	ર્પA
-
-ર્પાA
-
-ર્પીA
-
-ર્પુA
-
-ર્પૂA
-
-ર્પેA
-
-ર્પેાA
-
-ર્પોA
-
-ર્પ્રB
-
-ર્પ્સB
-
-	ર્ફB
-
-ર્ફંB
-
-ર્ફાB
-
-ર્ફીB
-
-ર્ફીંB
-
-ર્ફેB
-
-ર્ફોB
-
-ર્ફ્યુB
-
-	ર્બB
-
-ર્બંB
-
-ર્બાB
-
-ર્બીB
-
-ર્બુB
-
-ર્બેB
-
-ર્બોB
-
-ર્બ્યુB
-
-ર્બ્સB
-
-ર્બ્સેB
-
-	ર્ભB
-
-ર્ભાB
-
-ર્ભીB
-
-ર્ભીંB
-
-ર્ભુB
-
-ર્ભૂB
-
-ર્ભેB
-
-ર્ભોB
-
-ર્ભ્રાB
-
-	ર્મB
-
-ર્મંB
-
-ર્માB
-
-ર્માંB
-
-ર્મીB
-
-ર્મીંB
-
-ર્મુB
-
-ર્મૂB
-
-ર્મેB
-
-ર્મેંB
-
-ર્મોB
-
-ર્મોંB
-
-ર્મ્ડB
-
-ર્મ્યાB
-
-ર્મ્યુB
-
-ર્મ્યૂB
-
-ર્મ્સB
-
-	ર્યB
-
-ર્યંB
-
-ર્યાB
-
-ર્યાંB
-
-ર્યાેB
-
-ર્યુB
-
-ર્યુંB
-
-ર્યુંંB
-
-ર્યેB
-
-ર્યોB
-
-ર્યોંB
-
-	ર્રB
-
-ર્રાB
-
-ર્રીB
-
-ર્રુB
-
-ર્રેB
-
-ર્રેંB
-
-ર્રોB
-
-	ર્લB
-
-ર્લંB
-
-ર્લાB
-
-ર્લીB
-
-ર્લીંB
-
-ર્લૅB
-
-ર્લેB
-
-ર્લેંB
-
-ર્લોB
-
-ર્લ્ટB
-
-ર્લ્ડB
-
-ર્લ્ડેB
-
-ર્લ્ડ્સB
-
-ર્લ્સB
-
-ર્લ્સેB
-
-	ર્વB
-
-ર્વંB
-
-ર્વાB
-
-ર્વાંB
-
-ર્વીB
-
-ર્વેB
-
-ર્વૈB
-
-ર્વોB
-
-ર્વ્યB
-
-ર્વ્યાB
-
-ર્વ્યુB
-
-ર્વ્યૂB
-
-	ર્શB
-
-ર્શાB
-
-ર્શીB
-
-ર્શેB
-
-ર્શોB
-
-ર્શોંB
-
-ર્શ્વB
-
-	ર્ષB
-
-ર્ષંB
-
-ર્ષાB
-
-ર્ષાંB
-
-ર્ષીB
-
-ર્ષેB
-
-ર્ષોB
-
-ર્ષોંB
-
-ર્ષ્યાB
-
-ર્ષ્હB
-
-	ર્સB
-
-ર્સંB
-
-ર્સાB
-
-ર્સીB
-
-ર્સીંB
-
-ર્સુB
-
-ર્સેB
-
-ર્સોB
-
-ર્સ્B
-
-ર્સ્કB
-
-ર્સ્ટB
-
-ર્સ્ટીB
-
-ર્સ્ટેB
-
-ર્સ્ડB
-
-ર્સ્થાB
-
-ર્સ્પB
-
-ર્સ્વB
-
-	ર્હB
-
-ર્હાB
-
-ર્હીB
-
-ર્હુC
-
-ર્હેC
-
-ર્હોC
-
-	ર્ેC
-
-રૢC
-
-લC
-
-લઁC
-
-લંC
-
-લાC
-
-લિC
-
-	લિેC
-
-લુC
-
-	લુંC
-
-લૂC
-
-	લૂંC
-
-લૅC
-
-	લૅંC
-
-લેC
-
-	લેંC
-
-	લેિC
-
-	લેેC
-
-લેેેC
-
-લૈC
-
-	લૈંC
-
-	લોૢC
-
-લ્C
-
-	લ્કC
-
-લ્કુC
-
-લ્કેC
-
-લ્ક્યC
-
-લ્ક્યુC
-
-લ્ક્લC
-
-લ્ક્સC
-
-	લ્ખC
-
-	લ્ગC
-
-લ્ગુC
-
-લ્ગેC
-
-	લ્ચC
-
-	લ્છC
-
-	લ્જC
-
-લ્જીC
-
-લ્જેC
-
-	લ્ઝC
-
-લ્ઝેC
-
-	લ્ટC
-
-લ્ટંC
-
-લ્ટુC
-
-લ્ટુંC
-
-લ્ટેC
-
-લ્ટ્ઝC
-
-લ્ટ્રC
-
-લ્ટ્રેC
-
-લ્ટ્સC
-
-	લ્ડC
-
-લ્ડંC
-
-લ્ડેC
-
-લ્ડ્રC
-
-લ્ડ્રેC
-
-લ્ડ્સC
-
-	લ્તC
-
-લ્તુC
-
-લ્તેC
-
-	લ્થC
-
-લ્થેC
-
-	લ્દC
-
-લ્દેC
-
-	લ્ધC
-
-	લ્નC
-
-લ્નેC
-
-	લ્પC
-
-લ્પેC
-
-લ્પ્યC
-
-લ્પ્સC
-
-	લ્ફC
-
-લ્ફેC
-
-લ્ફ્યુC
-
-લ્ફ્રC
-
-લ્ફ્રેC
-
-	લ્બC
-
-લ્બુC
-
-લ્બેC
-
-લ્બ્સC
-
-	લ્ભC
-
-	લ્મC
-
-લ્મુC
-
-લ્મેC
-
-લ્મેંC
-
-લ્મ્સC
-
-	લ્યC
-
-લ્યુC
-
-લ્યુંC
-
-લ્યૂC
-
-લ્યેC
-
-	લ્રC
-
-લ્ર્સC
-
-	લ્લC
-
-લ્લંC
-
-લ્લુC
-
-લ્લુંC
-
-લ્લૂC
-
-લ્લેC
-
-લ્લેંC
-
-લ્લ્લC
-
-	લ્વC
-
-લ્વેC
-
-	લ્શC
-
-લ્શેC
-
-લ્શ્યC
-
-	લ્સC
-
-લ્સંC
-
-લ્સેC
-
-લ્સ્કC
-
-લ્સ્ટC
-
-	લ્હC
-
-લ્હુC
-
-લ્હેC
-
-લૢC
-
-ળC
-
-ળંC
-
-ળિC
-
-	ળિેC
-
-ળુC
-
-	ળુંC
-
-ળૂC
-
-ળૅC
-
-ળેC
-
-	ળેંC
-
-	ળેેC
-
-ળ્D
-
-	ળ્યD
-
-ળ્યુD
-
-ળ્યુંD
-
-ળ્યેD
-
-	ળ્વD
-
-વD
-
-વંD
-
-વાD
-
-	વાેD
-
-વિD
-
-	વિેD
-
-વુD
-
-	વુંD
-
-વૂD
-
-વૃD
-
-	વૃંD
-
-વૅD
-
-વેD
-
-	વેંD
-
-	વેઃD
-
-	વેેD
-
-વૈD
-
-	વૈંD
-
-વ્D
-
-	વ્કD
-
-વ્ચેD
-
-	વ્ઝD
-
-	વ્ડD
-
-	વ્તD
-
-	વ્થD
-
-વ્ધુD
-
-	વ્નD
-
-	વ્પD
-
-	વ્યD
-
-વ્યંD
-
-વ્યુD
-
-વ્યુંD
-
-વ્યુંંD
-
-વ્યૂD
-
-વ્યેD
-
-	વ્રD
-
-વ્રુD
-
-વ્રૂD
-
-વ્રૂંD
-
-વ્રેD
-
-વ્ર્યD
-
-	વ્લD
-
-	વ્વD
-
-વ્વુD
-
-વ્વેD
-
-	વ્શD
-
-	વ્સD
-
-વ્સેD
-
-વ્સ્કD
-
-	વ્હD
-
-વ્હેD
-
-શD
-
-શંD
-
-શાD
-
-શિD
-
-	શિેD
-
-શિ્ચD
-
-શિ્મD
-
-શિ્રD
-
-શુD
-
-	શુંD
-
-શૂD
-
-	શૂંD
-
-શૃD
-
-	શૃંD
-
-શૅD
-
-શેD
-
-	શેંD
-
-	શેેD
-
-શૈD
-
-શ્D
-
-	શ્કD
-
-શ્કુD
-
-શ્કેD
-
-	શ્ચD
-
-શ્ચંD
-
-શ્ચેD
-
-	શ્છD
-
-	શ્ટD
-
-	શ્ડD
-
-શ્ણુD
-
-	શ્તD
-
-શ્તુD
-
-શ્તેD
-
-શ્ત્રD
-
-	શ્થD
-
-	શ્દD
-
-	શ્નD
-
-શ્નેD
-
-	શ્પD
-
-	શ્ફD
-
-	શ્બD
-
-શ્બુD
-
-શ્બેD
-
-શ્બ્દD
-
-	શ્ભD
-
-	શ્મD
-
-શ્મેD
-
-	શ્યD
-
-શ્યુD
-
-શ્યુંD
-
-શ્યૂD
-
-શ્યેD
-
-	શ્રD
-
-શ્રંD
-
-શ્રિઃઃઃD
-
-શ્રુD
-
-શ્રુંD
-
-શ્રૂD
-
-શ્રૃD
-
-શ્રૃંD
-
-શ્રેD
-
-શ્ર્D
-
-શ્ર્ચD
-
-શ્ર્નD
-
-શ્ર્યD
-
-શ્ર્લD
-
-શ્ર્લેD
-
-શ્ર્વD
-
-શ્ર્વેD
-
-	શ્લD
-
-શ્લેD
-
-શ્લેંE
-
-	શ્વE
-
-શ્વંE
-
-શ્વેE
-
-શ્વ્નE
-
-શ્વ્લE
-
-શ્વ્લેE
-
-શ્વ્વE
-
-શ્શૂE
-
-ષE
-
-ષઁE
-
-ષંE
-
-ષુE
-
-ષૂE
-
-ષૅE
-
-ષેE
-
-	ષેંE
-
-	ષેેE
-
-ષ્E
-
-	ષ્કE
-
-ષ્કંE
-
-ષ્કુE
-
-ષ્કૃE
-
-ષ્ક્રE
-
-	ષ્ચE
-
-	ષ્ટE
-
-ષ્ટુE
-
-ષ્ટેE
-
-ષ્ટ્યE
-
-ષ્ટ્રE
-
-ષ્ટ્રેE
- 
-ષ્ટ્ર્ધ્વE
-
-	ષ્ઠE
-
-ષ્ઠુE
-
-ષ્ઠેE
-
-	ષ્ડE
-
-	ષ્ણE
-
-ષ્ણંE
-
-ષ્ણુE
-
-ષ્ણુંE
-
-ષ્ણુેE
-
-ષ્ણેE
-
-	ષ્તE
-
-ષ્ત્રE
-
-	ષ્નE
-
-ષ્નુE
-
-	ષ્પE
-
-ષ્પેE
-
-ષ્પ્રE
-
-	ષ્ફE
-
-	ષ્ભE
-
-	ષ્મE
-
-ષ્મેE
-
-	ષ્યE
-
-ષ્યંE
-
-ષ્યેE
-
-	ષ્રE
-
-ષ્ર્યE
-
-ષ્લેE
-
-	ષ્વE
-
-	ષ્હE
-
-સE
-
-સઁE
-
-સંE
-
-	સંેE
-
-સ઼E
-
-સિE
-
-	સિેE
-
-સિ્જE
-
-	સીેE
-
-સુE
-
-	સુંE
-
-સૂE
-
-	સૂંE
-
-સૃE
-
-સૅE
-
-સેE
-
-	સેંE
-
-	સેેE
-
-સૈE
-
-	સૈંE
-
-સ્E
-
-	સ્કE
-
-સ્કંE
-
-સ્કુE
-
-સ્કૂE
-
-સ્કૃE
-
-સ્કેE
-
-સ્ક્યE
-
-સ્ક્યુE
-
-સ્ક્રE
-
-સ્ક્રુE
-
-સ્ક્રૂE
-
-સ્ક્રૃE
-
-સ્ક્રેE
-
-સ્ક્લE
-
-સ્ક્લેE
-
-સ્ક્વE
-
-સ્ક્વૅE
-
-સ્ક્વેE
-
-	સ્ખE
-
-સ્ખેE
-
-સ્ખેંE
-
-	સ્ગE
-
-સ્ગેE
-
-	સ્ચE
-
-સ્ચેE
-
-સ્ચ્યુE
-
-	સ્છE
-
-	સ્જE
-
-સ્જીE
-
-	સ્ઝE
-
-	સ્ટE
-
-સ્ટંE
-
-સ્ટુE
-
-સ્ટૂE
-
-સ્ટૅE
-
-સ્ટેE
-
-સ્ટેંE
-
-સ્ટૈE
-
-સ્ટ્E
-
-સ્ટ્યુE
-
-સ્ટ્રE
-
-સ્ટ્રંE
-
-સ્ટ્રુE
-
-સ્ટ્રૅE
-
-સ્ટ્રેE
-
-સ્ટ્સE
-
-સ્ટ્સેF
-
-	સ્ડF
-
-સ્ડેF
-
-	સ્ણF
-
-સ્ણુF
-
-	સ્તF
-
-સ્તંF
-
-સ્તિF
-
-સ્તુF
-
-સ્તુંF
-
-સ્તૂF
-
-સ્તૃF
-
-સ્તેF
-
-સ્તેંF
-
-સ્તેેF
-
-સ્ત્યF
-
-સ્ત્રF
-
-સ્ત્રીેF
-
-સ્ત્રેF
-
-સ્ત્વF
-
-	સ્થF
-
-સ્થંF
-
-સ્થુF
-
-સ્થૂF
-
-સ્થેF
-
-સ્થેેF
-
-સ્થ્યF
-
-	સ્દF
-
-	સ્નF
-
-સ્નુF
-
-સ્નૂF
-
-સ્નેF
-
-	સ્પF
-
-સ્પંF
-
-સ્પુF
-
-સ્પૂF
-
-સ્પૃF
-
-સ્પૅF
-
-સ્પેF
-
-સ્પેંF
-
-સ્પૈF
-
-સ્પ્તF
-
-સ્પ્રF
-
-સ્પ્રંF
-
-સ્પ્રેF
-
-સ્પ્લF
-
-સ્પ્લેF
-
-	સ્ફF
-
-સ્ફુF
-
-સ્ફૂF
-
-સ્ફેF
-
-	સ્બF
-
-સ્બેF
-
-સ્બ્રF
-
-	સ્ભF
-
-	સ્મF
-
-સ્મુF
-
-સ્મૂF
-
-સ્મૃF
-
-સ્મેF
-
-સ્મેંF
-
-સ્મૈF
-
-સ્મ્છF
-
-સ્મ્રુF
-
-	સ્યF
-
-સ્યંF
-
-સ્યુF
-
-સ્યુંF
-
-સ્યૂF
-
-સ્યેF
-
-	સ્રF
-
-સ્રેF
-
-સ્ર્ટF
-
-	સ્લF
-
-સ્લંF
-
-સ્લુF
-
-સ્લૅF
-
-સ્લેF
-
-	સ્વF
-
-સ્વંF
-
-સ્વઃF
-
-સ્વઃઃF
-
-સ્વઃઃઃF
-
-સ્વઃઃઃઃF
-
-સ્વઃઃઃઃઃF
- 
-સ્વઃઃઃઃઃઃF
-&
-!સ્વઃઃઃઃઃઃઃઃF
-)
-$સ્વઃઃઃઃઃઃઃઃઃF
-
-સ્વૂF
-
-સ્વેF
-
-સ્વૈF
-
-	સ્સF
-
-સ્સુF
-
-સ્સુંF
-
-સ્સૂF
-
-સ્સેF
-
-	સ્હF
-
-સ્હેF
-
-સૢF
-
-હF
-
-હઁF
-
-હંF
-
-હિF
-
-	હિુF
-
-	હિેF
-
-હિ્બF
-
-હિ્લF
-
-	હીંF
-
-હુF
-
-	હુઁF
-
-	હુંF
-
-	હુેF
-
-હૂF
-
-	હૂઁF
-
-	હૂંF
-
-હૃF
-
-હૅF
-
-હેF
-
-	હેંF
-
-	હેુF
-
-	હેેF
-
-હૈF
-
-	હૈંF
-
-	હૈેF
-
-હ્F
-
-	હ્કF
-
-	હ્છF
-
-હ્જેF
-
-	હ્ડG
-
-	હ્તG
-
-હ્તેG
-
-હ્ત્વG
-
-	હ્દG
-
-	હ્નG
-
-હ્નેG
-
-	હ્બG
-
-	હ્ભG
-
-	હ્મG
-
-હ્મંG
-
-હ્મેG
-
-હ્મ્ણુG
-
-	હ્યG
-
-હ્યંG
-
-હ્યુG
-
-હ્યુંG
-
-હ્યુંંG
-
-હ્યૂG
-
-હ્યેG
-
-	હ્રG
-
-હ્રૂંG
-
-હ્રેG
-
-	હ્લG
-
-હ્લેG
-
-	હ્વG
-
-હ્વૃG
-
-	હ્સG
-
-ઽG
-
-ાG
-
-ાઁG
-
-ાંG
-
-િG
-
-િઃG
-
-	િઃઃG
-
-િઃઃઃG
-
-િઃઃઃઃG
-
-િઃઃઃઃઃG
-
-િઃઃઃઃઃઃG
- 
-િઃઃઃઃઃઃઃઃG
-#
-િઃઃઃઃઃઃઃઃઃG
-&
-!િઃઃઃઃઃઃઃઃઃઃG
-)
-$િઃઃઃઃઃઃઃઃઃઃઃG
-,
-'િઃઃઃઃઃઃઃઃઃઃઃઃG
-/
-*િઃઃઃઃઃઃઃઃઃઃઃઃઃG
-2
--િઃઃઃઃઃઃઃઃઃઃઃઃઃઃG
-5
-0િઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃG
-8
-3િઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃG
-;
-6િઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃG
-
-િિG
-
-	િિિG
-
-િિિિG
-
-ીG
-
-ીઁG
-
-ીંG
-
-ુG
-
-ૂG
-
-ેG
-
-ૉG
-
-ૉંG
-
-ોG
-
-ોઁG
-
-ોંG
-
-ૌG
-
-ૌંG
-
-્G
-
-ૐG
-
-ૠG
-
-૦G
-
-૦ાG
-
-૦ૢG
-
-૧G
-
-૧ાG
-
-૧ુG
-
-	૧ુંG
-
-૨G
-
-૨ંG
-
-૨ાG
-
-૨ેG
-
-૩G
-
-૩ઃG
-
-	૩ઃઃG
-
-૩ઃઃઃG
-
-૩ઃઃઃઃG
-
-૩ાG
-
-૪G
-
-૪ંG
-
-૪ાG
-
-૫G
-
-૫ંG
-
-૫ુG
-
-૫ૂG
-
-૫ેG
-
-૬G
-
-૭G
-
-૮G
-
-૮ાG
-
-૯G
-
-૯ેG
-
-૰G
-
-கG
-
-பG
-
-ாG
-
-ാG
-
-ിG
-
-་G
-
-།G
-
-᛬G
-
-៰G
-
-ᵒG
-
-ḌG
-
-ḍG
-
-ḤG
-
-ḥG
-
-ḼG
-
-ṀG
-
-ṁG
-
-ṅG
-
-ṆG
-
-ṇG
-
-ṚG
-
-ṛG
-
-ṢG
-
-ṣG
-
-ṬG
-
-ṭG
-
-ṱG
-
-ẓG
-
-ẞH
-
-ẠH
-
-ạH
-
-ẢH
-
-ảH
-
-ẤH
-
-ấH
-
-ẦH
-
-ầH
-
-ẨH
-
-ẩH
-
-ẪH
-
-ẫH
-
-ẬH
-
-ậH
-
-ẮH
-
-ắH
-
-ẰH
-
-ằH
-
-ẲH
-
-ẳH
-
-ẴH
-
-ẵH
-
-ẶH
-
-ặH
-
-ẸH
-
-ẹH
-
-ẺH
-
-ẻH
-
-ẼH
-
-ẽH
-
-ẾH
-
-ếH
-
-ỀH
-
-ềH
-
-ỂH
-
-ểH
-
-ỄH
-
-ễH
-
-ỆH
-
-ệH
-
-ỈH
-
-ỉH
-
-ỊH
-
-ịH
-
-ỌH
-
-ọH
-
-ỎH
-
-ỏH
-
-ỐH
-
-ốH
-
-ỒH
-
-ồH
-
-ỔH
-
-ổH
-
-ỖH
-
-ỗH
-
-ỘH
-
-ộH
-
-ỚH
-
-ớH
-
-ỜH
-
-ờH
-
-ỞH
-
-ởH
-
-ỠH
-
-ỡH
-
-ỢH
-
-ợH
-
-ỤH
-
-ụH
-
-ỦH
-
-ủH
-
-ỨH
-
-ứH
-
-ỪH
-
-ừH
-
-ỬH
-
-ửH
-
-ỮH
-
-ữH
-
-ỰH
-
-ựH
-
-ỲH
-
-ỳH
-
-ỴH
-
-ỵH
-
-ỶH
-
-ỷH
-
-ỸH
-
-ỹH
-
-‌H
-
-‍H
-
-	‍্যH
-
-‍‌H
-
-‎H
-
-‐H
-
-‑H
-
-‒H
-
-–H
-
-–ઃH
-
-	–ઃઃH
-
-–ઃઃઃH
-
-–ઃઃઃઃH
-
-–ઃઃઃઃઃH
-
-–ેH
-
-—H
-
-—ુH
-
-―H
-
-‖H
-
-‘H
-
-’H
-
-‚H
-
-“H
-
-“ઃH
-
-	“ઃઃH
-
-“ઃઃઃH
-
-“ઃઃઃઃH
-
-“ઃઃઃઃઃH
-
-“ઃઃઃઃઃઃH
-#
-“ઃઃઃઃઃઃઃઃઃH
-
-”H
-
-„H
-
-†H
-
-‡H
-
-•H
-
-‣H
-
-․H
-
-…I
-
-‧I
-
-‰I
-
-′I
-
-″I
-
-‹I
-
-›I
-
-‿I
-
-⁄I
-
-⁰I
-
-⁴I
-
-⁵I
-
-⁹I
-
-₁I
-
-₂I
-
-₃I
-
-₄I
-
-₡I
-
-₤I
-
-₦I
-
-₧I
-
-₨I
-
-₩I
-
-₪I
-
-₫I
-
-€I
-
-₹I
-
-₺I
-
-℃I
-
-№I
-
-℗I
-
-™I
-
-⅓I
-
-ⅠI
-
-ⅡI
-
-ⅢI
-
-ⅥI
-
-ⅩI
-
-←I
-
-↑I
-
-→I
-
-↓I
-
-↔I
-
-↦I
-
-↳I
-
-↺I
-
-⇌I
-
-⇐I
-
-⇒I
-
-⇓I
-
-⇔I
-
-∀I
-
-∂I
-
-∃I
-
-∅I
-
-∆I
-
-∇I
-
-∈I
-
-∉I
-
-∏I
-
-∑I
-
-−I
-
-∘I
-
-∙I
-
-√I
-
-∝I
-
-∞I
-
-∧I
-
-∨I
-
-∩I
-
-∪I
-
-∫I
-
-∴I
-
-∾I
-
-≈I
-
-≠I
-
-≡I
-
-≤I
-
-≥I
-
-≪I
-
-≫I
-
-⊂I
-
-⊃I
-
-⊆I
-
-⊇I
-
-⊕I
-
-⊗I
-
-⊞I
-
-⊢I
-
-⊥I
-
-⊧I
-
-⋅I
-
-⋆I
-
-⌁I
-
-⏭I
-
-⑆I
-
-⑇I
-
-⑈I
-
-⑉I
-
-①I
-
-②I
-
-③I
-
-④I
-
-⑤I
-
-⑥I
-
-⑦I
-
-⑧I
-
-⑨I
-
-⑩I
-
-⑪I
-
-⑫I
-
-⑬I
-
-⑭I
-
-⑮I
-
-⑯I
-
-⑰I
-
-⑱I
-
-⑲I
-
-⑳I
-
-ⒶI
-
-ⒷI
-
-ⒸI
-
-ⓇI
-
-ⓐI
-
-ⓑI
-
-─I
-
-│I
-
-┈I
-
-┌J
-
-└J
-
-├J
-
-┬J
-
-┴J
-
-═J
-
-║J
-
-╚J
-
-╰J
-
-▀J
-
-▂J
-
-▄J
-
-█J
-
-▉J
-
-░J
-
-▒J
-
-▓J
-
-■J
-
-□J
-
-▪J
-
-▬J
-
-▲J
-
-▴J
-
-▶J
-
-▷J
-
-▸J
-
-►J
-
-▼J
-
-▾J
-
-◄J
-
-◅J
-
-◆J
-
-◇J
-
-◈J
-
-◉J
-
-◊J
-
-○J
-
-◌J
-
-◎J
-
-●J
-
-◕J
-
-◦J
-
-☀J
-
-★J
-
-☆J
-
-☉J
-
-☎J
-
-☏J
-
-☐J
-
-☑J
-
-☒J
-
-☛J
-
-☜J
-
-☞J
-
-☢J
-
-☬J
-
-☸J
-
-☹J
-
-☺J
-
-☻J
-
-☼J
-
-♀J
-
-♂J
-
-♒J
-
-♚J
-
-♛J
-
-♠J
-
-♡J
-
-♢J
-
-♣J
-
-♥J
-
-♦J
-
-♪J
-
-♫J
-
-♬J
-
-♭J
-
-♯J
-
-⚜J
-
-⚫J
-
-⛤J
-
-✅J
-
-✈J
-
-✉J
-
-✍J
-
-✎J
-
-✓J
-
-✔J
-
-✗J
-
-✡J
-
-✦J
-
-✨J
-
-✩J
-
-✪J
-
-✯J
-
-✰J
-
-✱J
-
-✶J
-
-✿J
-
-❀J
-
-❁J
-
-❖J
-
-❗J
-
-❘J
-
-❜J
-
-❝J
-
-❞J
-
-❤J
-
-❥J
-
-➔J
-
-➖J
-
-➜J
-
-➝J
-
-➡J
-
-➤J
-
-⟨J
-
-⟩J
-
-⟫J
-
-⠀J
-
-⭑J
-
-ⱭJ
-
-、J
-
-。J
-
-〈J
-
-〉J
-
-《J
-
-》J
-
-「J
-
-」J
-
-『K
-
-』K
-
-【K
-
-】K
-
-〜K
-
-・K
-
-ーK
-
-ꞌK
-
-ﬁK
-
-﴾K
-
-﴿K
-
-，K
-
-：K
-
-｢K
-
-｣K
-
-￡K
-
-￥K
-
-�KK
\ No newline at end of file
@@ -1,2598 +0,0 @@
-
-
- 
-
-!
-
-"
-
-#
-
-$
-
-%
-
-&
-
-'
-
-(
-
-)	
-
-*
-
-
-+
-
-,
-
--
-
-.
-
-/
-
-0
-
-1
-
-2
-
-3
-
-4
-
-5
-
-6
-
-7
-
-8
-
-9
-
-:
-
-;
-
-<
-
-=
-
->
-
-?
-
-@ 
-
-A!
-
-B"
-
-C#
-
-D$
-
-E%
-
-E̟&
-
-F'
-
-G(
-
-H)
-
-I*
-
-J+
-
-K,
-
-L-
-
-M.
-
-N/
-
-O0
-
-O̟1
-
-P2
-
-Q3
-
-R4
-
-S5
-
-T6
-
-U7
-
-V8
-
-W9
-
-X:
-
-Y;
-
-Z<
-
-[=
-
-\>
-
-\\?
-
-]@
-
-^A
-
-_B
-
-`C
-
-aD
-
-àE
-
-áF
-
-ãG
-
-ảH
-
-ạI
-
-a̸J
-
-bK
-
-cL
-
-c̈M
-
-dN
-
-ḍO
-
-eP
-
-èQ
-
-éR
-
-ẽS
-
-e̟T
-
-ẹU
-
-e̱V
-
-fW
-
-gX
-
-hY
-
-ḥZ
-
-i[
-
-ì\
-
-í]
-
-ĩ^
-
-i̇_
-
-i̟`
-
-ịa
-
-jb
-
-kc
-
-ld
-
-me
-
-m̃f
-
-ng
-
-ǹh
-
-oi
-
-òj
-
-ók
-
-ỏl
-
-o̟m
-
-ọn
-
-po
-
-p̃p
-
-qq
-
-rr
-
-ṛs
-
-st
-
-s̟u
-
-ṣv
-
-tw
-
-t̃x
-
-ṭy
-
-uz
-
-ù{
-
-ú|
-
-ũ}
-
-ủ~
-
-u̟
-
-ụ
-
-u̸
-
-v
-
-v̄
-
-v̈
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-
- 
-	
- ̃
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-­
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-	
-ầ
-	
-ấ
-	
-ậ
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-	
-ề
-	
-ế
-	
-ễ
-	
-ể
-	
-ệ
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-	
-ồ
-	
-ố
-	
-ỗ
-	
-ổ
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-	
-ắ
-	
-ặ
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ŗ
-
-ŗ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɣ
-
-Ɩ
-
-Ơ
-
-ơ
-	
-ờ
-	
-ớ
-	
-ợ
-
-Ƨ
-
-ƨ
-
-ƭ
-
-Ư
-
-ư
-	
-ừ
-	
-ứ
-	
-ữ
-	
-ử
-	
-ự
-
-ƴ
-
-ǎ
-
-ǐ
-
-ǔ
-
-ǝ
-
-Ǧ
-
-ǧ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-ȳ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̀
-	
-ɔ́
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-	
-ə́
-
-ɛ
-	
-ɛ̀
-	
-ɛ̃
-	
-ɛ̈
-
-ɣ
-
-ɧ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʌ
-
-ʒ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˙
-
-˚
-
-˜
-
-˝
-
-΄
-
-Α
-
-Ι
-
-Μ
-
-Ο
-
-Σ
-
-Ϊ
-
-ά
-
-έ
-
-ί
-
-α
-
-γ
-
-δ
-
-ε
-
-η
-
-θ
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ξ
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-φ
-
-χ
-
-ϊ
-
-ύ
-
-ϐ
-
-Ѐ
-
-Ё
-
-Ђ
-
-Ѓ
-
-Є
-
-Ѕ
-
-І
-
-Ї
-
-Ј
-	
-Ј̈
-
-Љ
-
-Њ
-
-Ћ
-
-Ќ
-
-Ѝ
-
-Ў
-
-Џ
-
-А
-	
-А́
-	
-А̂
-	
-Ӓ
-
-Б
-
-В
-
-Г
-
-Д
-
-Е
-	
-Е́
-
-Ж
-
-З
-	
-З́
-
-И
-	
-Ѝ
-
-Й
-
-К
-
-Л
-
-М
-
-Н
-
-О
-	
-О́
-	
-О̂
-	
-О̃
-	
-Ӧ
-
-П
-
-Р
-
-С
-	
-С́
-	
-С̧
-
-Т
-
-У
-	
-Ӱ
-
-Ф
-
-Х
-
-Ц
-
-Ч
-
-Ш
-
-Щ
-
-Ъ
-
-Ы
-	
-Ы̇
-
-Ь
-
-Э
-
-Ю
-
-Я
-
-а
-	
-а́
-	
-а̂
-	
-ӓ
-
-б
-
-в
-
-г
-
-д
-
-е
-	
-е́
-
-ж
-
-з
-	
-з́
-
-и
-	
-ѝ
-	
-и́
-
-й
-
-к
-
-л
-	
-л҄
-
-м
-
-н
-
-о
-	
-о́
-	
-о̂
-	
-о̃
-	
-ӧ
-
-п
-
-р
-
-с
-	
-с́
-	
-с̧
-
-т
-
-у
-	
-у́
-	
-ӱ
-
-ф
-
-х
-
-ц
-
-ч
-
-ш
-
-щ
-
-ъ
-
-ы
-	
-ы̆
-
-ь
-
-э
-
-ю
-
-я
-	
-я́
-
-ѐ
-
-ё
-
-ђ
-
-ѓ
-
-є
-
-ѕ
-
-і
-
-ї
-
-ј
-
-љ
-
-њ
-
-ћ
-
-ќ
-
-ѝ
-
-ў
-
-џ
-
-Ѣ
-
-ѣ
-
-ѫ
-
-Ѳ
-
-ѳ
-
-Ѵ
-
-ѵ
-
-Ґ
-
-ґ
-
-Ғ
-
-ғ
-
-ҕ
-
-Җ
-
-җ
-
-Ҙ
-
-ҙ
-
-Қ
-
-қ
-
-Ҝ
-	
-Ҝ̆
-	
-Ҝ̧
-
-ҝ
-	
-ҝ̆
-
-ҟ
-
-Ҡ
-
-ҡ
-
-Ң
-
-ң
-
-ҥ
-
-ҧ
-
-ҩ
-
-Ҫ
-
-ҫ
-
-Ҭ
-
-ҭ
-
-Ү
-
-ү
-
-Ұ
-
-ұ
-
-Ҳ
-
-ҳ
-
-ҵ
-
-Ҷ
-
-ҷ
-
-Ҹ
-	
-Ҹ̧
-
-ҹ
-	
-ҹ̧
-
-Һ
-
-һ
-
-ҽ
-
-ҿ
-
-Ӏ
-
-Ӊ
-
-ӊ
-
-ӎ
-
-ӏ
-
-Ӑ
-
-ӑ
-
-Ӓ
-
-Ӕ
-
-ӕ
-
-Ӗ
-
-ӗ
-
-Ә
-
-ә
-
-Ӝ
-
-ӝ
-
-Ӟ
-
-ӟ
-
-ӡ
-
-Ӣ
-
-ӣ
-
-ӥ
-
-Ӧ
-
-ӧ
-
-Ө
-
-ө
-
-Ӯ
-
-ӯ
-
-Ӱ
-
-ӱ
-
-Ӳ
-
-ӳ
-
-Ӵ
-
-ӵ
-
-ӹ
-
-Ք
-
-ա
-
-բ
-
-դ
-
-ե
-
-է
-
-ը
-
-թ
-
-ի
-
-լ
-
-խ
-
-ծ
-
-կ
-
-հ
-
-յ
-
-ն
-
-շ
-
-ո
-
-պ
-
-վ
-
-տ
-
-ր
-
-ց
-
-ւ
-
-և
-
-ו
-
-י
-
-״
-
-،
-
-؛
-
-؟
-
-أ
-
-ا
-
-ة
-
-ت
-
-خ
-
-ر
-
-س
-
-ض
-
-ع
-
-ف
-
-ل
-
-م
-
-ن
-
-و
-
-ي
-
-٫
-
-अ
-
-आ
-
-ई
-
-उ
-
-ए
-
-औ
-
-क
-
-के
-
-ग
-
-च
-
-चे
-
-ज
-
-	ट्र
-
-ढ
-
-ण
-
-त
-
-थ
-
-थे
-
-द
-
-दु
-
-	द्य
-
-न
-
-ने
-
-प
-
-	प्र
-
-ब
-
-म
-
-	में
-
-म्
-
-य
-
-ये
-
-र
-
-रा
-
-री
-
-ल
-
-ल्
-
-ळ
-
-व
-
-श
-
-श्
-
-ष्
-
-स
-
-सं
-
-स्
-
-ह
-
-हे
-
-ा
-
-ि
-
-ी
-
-ो
-
-ों
-
-।
-
-॥
-
-०
-
-	ক্ল
-
-ড
-
-ন
-
-ব
-
-ভ
-
-য়
-
-র
-
-ল
-
-স
-
-া
-
-ি
-
-ে
-
-০
-
-இ
-
-க
-
-கு
-
-க்
-
-சு
-
-ட
-
-டி
-
-ட்
-
-த
-
-தி
-
-து
-
-த்
-
-நி
-
-ன
-
-ன்
-
-ப
-
-ப்
-
-ம
-
-மு
-
-ம்
-
-யி
-
-ரு
-
-ர்
-
-ற
-
-று
-
-ற்
-
-ல
-
-ல்
-
-ள
-
-ள்
-
-ழி
-
-வ
-
-ா
-
-ெ
-
-ே
-
-ை
-
-ం
-
-ఆ
-
-క
-
-చ
-
-ట
-
-త
-
-ద
-
-న
-
-య
-
-ల
-
-లే
-
-లో
-
-వె
-
-వై
-
-ు
-
-్మ
-
-్య
-
-్ళ
-
-ം
-
-	ക്ക
-
-	ങ്ക
-
-ചെ
-
-	ട്ട
-
-ണ
-
-ത
-
-ദ
-
-ന
-
-ന്നു
-
-പ
-
-പ്പെ
-
-	പ്ര
-
-മ
-
-യ
-
-	യ്യ
-
-ര
-
-വ
-
-ാ
-
-ി
-
-ൻ
-
-ൾ
-
-་
-
-།
-
-᛬
-
-៰
-
-ᵒ
-
-Ḍ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ḽ
-
-Ṁ
-
-ṁ
-
-ṅ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ṱ
-
-ẓ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-Ỵ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-᾽
-
-᾿
-
-‍
-
-‎
-
-‐
-
-‑
-
-‒
-
-–
-
-—
-
-―
-
-‖
-
-‘
-
-’
-
-‚
-
-“
-
-”
-
-„
-
-‟
-
-†
-
-‡
-
-•
-
-‣
-
-…
-
- 
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-‿
-
-⁄
-
-⁰
-
-⁴
-
-⁵
-
-⁹
-
-₁
-
-₂
-
-₃
-
-₄
-
-₤
-
-₦
-
-₧
-
-₩
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-№
-
-℗
-
-™
-
-⅓
-
-Ⅰ
-
-Ⅱ
-
-Ⅲ
-
-Ⅵ
-
-Ⅹ
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↗
-
-↦
-
-↳
-
-↺
-
-⇌
-
-⇐
-
-⇒
-
-⇓
-
-⇔
-
-∀
-
-∂
-
-∃
-
-∅
-
-∆
-
-∇
-
-∈
-
-∉
-
-∏
-
-∑
-
-−
-
-∘
-
-∙
-
-√
-
-∝
-
-∞
-
-∧
-
-∨
-
-∩
-
-∪
-
-∫
-
-∴
-
-≈
-
-≠
-
-≡
-
-≤
-
-≥
-
-≪
-
-≫
-
-⊂
-
-⊃
-
-⊆
-
-⊕
-
-⊛
-
-⊞
-
-⊥
-
-⋅
-
-⋆
-
-⌁
-
-⏭
-
-⑆
-
-⑇
-
-⑈
-
-⑉
-
-①
-
-②
-
-③
-
-④
-
-⑤
-
-⑥
-
-⑦
-
-⑧
-
-⑨
-
-⑩
-
-⑪
-
-⑫
-
-⑬
-
-⑭
-
-⑮
-
-⑯
-
-⑰
-
-⑱
-
-⑲
-
-⑳
-
-Ⓐ
-
-Ⓑ
-
-Ⓒ
-
-Ⓡ
-
-ⓐ
-
-ⓑ
-
-─
-
-│
-
-┈
-
-┌
-
-└
-
-├
-
-┬
-
-┴
-
-═
-
-╰	
-
-▀	
-
-▂	
-
-▄	
-
-█	
-
-▉	
-
-▌	
-
-▐	
-
-░	
-
-▓	
-
-■	
-
-□	
-
-▪	
-
-▬	
-
-▲	
-
-▴	
-
-▶	
-
-▷	
-
-▸	
-
-►	
-
-▼	
-
-▾	
-
-◄	
-
-◆	
-
-◇	
-
-◉	
-
-◊	
-
-○	
-
-◎	
-
-●	
-
-◦	
-
-☀	
-
-★	
-
-☆	
-
-☉	
-
-☎	
-
-☏	
-
-☐	
-
-☑	
-
-☒	
-
-☛	
-
-☜	
-
-☞	
-
-☢	
-
-☸	
-
-☹	
-
-☺	
-
-♀	
-
-♂	
-
-♠	
-
-♡	
-
-♢	
-
-♣	
-
-♥	
-
-♦	
-
-♪	
-
-♫	
-
-♬	
-
-♭	
-
-♯	
-
-⚫	
-
-⛤	
-
-✅	
-
-✈	
-
-✉	
-
-✍	
-
-✎	
-
-✓	
-
-✔	
-
-✗	
-
-✡	
-
-✦	
-
-✨	
-
-✩	
-
-✪	
-
-✯	
-
-✰	
-
-✱	
-
-✶	
-
-✿	
-
-❀	
-
-❖	
-
-❗	
-
-❘	
-
-❜	
-
-❝	
-
-❞	
-
-❤	
-
-➔	
-
-➖	
-
-➜	
-
-➝	
-
-➡	
-
-➤	
-
-⟨	
-
-⟩	
-
-⟪	
-
-⟫	
-
-⠀	
-
-⭑	
-
-Ɑ	
-
-、	
-
-。	
-
-〈	
-
-〉	
-
-《	
-
-》	
-
-「	
-
-」	
-
-『	
-
-』	
-
-【	
-
-】	
-
-〖	
-
-〗	
-
-〜	
-
-・	
-
-ー	
-
-不	
-
-乘	
-
-川	
-
-換	
-
-此	
-
-站	
-
-ꙃ	
-
-ꚋ	
-
-ꞌ	
-
-ﬀ	
-
-ﬁ
-
-
-﴾
-
-
-﴿
-
-
-，
-
-
-：
-
-
-｢
-
-
-｣
-
-
-￡
-
-
-￥
-
-
-�
-
-	
-𐐀
-
-	
-𐐨
-
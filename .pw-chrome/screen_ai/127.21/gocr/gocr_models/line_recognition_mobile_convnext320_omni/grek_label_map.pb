@@ -1,1872 +0,0 @@
-
-
- 
-
-!
-
-"
-
-#
-
-$
-
-%
-
-&
-
-'
-
-(
-
-)	
-
-*
-
-
-+
-
-,
-
--
-
-.
-
-/
-
-0
-
-1
-
-2
-
-3
-
-4
-
-5
-
-6
-
-7
-
-8
-
-9
-
-:
-
-;
-
-<
-
-=
-
->
-
-?
-
-@ 
-
-A!
-
-B"
-
-C#
-
-D$
-
-E%
-
-F&
-
-G'
-
-H(
-
-I)
-
-J*
-
-K+
-
-L,
-
-M-
-
-N.
-
-O/
-
-O̟0
-
-P1
-
-Q2
-
-R3
-
-S4
-
-T5
-
-U6
-
-V7
-
-W8
-
-X9
-
-Y:
-
-Z;
-
-[<
-
-\=
-
-]>
-
-^?
-
-_@
-
-`A
-
-aB
-
-a̸C
-
-bD
-
-cE
-
-dF
-
-eG
-
-e̟H
-
-e̱I
-
-fJ
-
-gK
-
-hL
-
-iM
-
-i̇N
-
-i̟O
-
-jP
-
-kQ
-
-lR
-
-mS
-
-m̃T
-
-nU
-
-oV
-
-o̟W
-
-pX
-
-qY
-
-rZ
-
-s[
-
-s̟\
-
-t]
-
-t̃^
-
-u_
-
-u̟`
-
-u̸a
-
-vb
-
-wc
-
-xd
-
-ye
-
-zf
-
-{g
-
-|h
-
-}i
-
-~j
-
- k
-
-¡l
-
-¢m
-
-£n
-
-¤o
-
-¥p
-
-¦q
-
-§r
-
-¨s
-
-©t
-
-ªu
-
-«v
-
-¬w
-
-®x
-
-¯y
-
-°z
-
-±{
-
-²|
-
-³}
-
-´~
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʹ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˙
-
-˚
-
-˜
-
-˝
-
-͵
-
-΄
-
-Ά
-
-Έ
-
-Ή
-
-Ί
-
-Ό
-
-Ύ
-
-Ώ
-
-ΐ
-
-Α
-	
-Α͂
-
-Β
-
-Γ
-
-Δ
-
-Ε
-
-Ζ
-
-Η
-	
-Η͂
-
-Θ
-
-Ι
-
-Ϊ̀
-
-Ϊ́
-
-Ϊ͂
-	
-Ι͂
-
-Κ
-
-Λ
-
-Μ
-
-Ν
-
-Ξ
-
-Ο
-
-Π
-
-Ρ
-	
-Ρ̓
-
-Σ
-
-Τ
-
-Υ
-
-Ϋ̀
-
-Ϋ́
-	
-Υ̓
-
-Υ̓̀
-
-Υ̓́
-
-Υ̓͂
-	
-Υ͂
-
-Φ
-
-Χ
-
-Ψ
-
-Ω
-	
-Ω͂
-
-Ϊ
-
-Ϋ
-
-ά
-
-έ
-
-ή
-
-ί
-
-ΰ
-
-α
-
-β
-
-γ
-
-δ
-
-ε
-
-ζ
-
-η
-
-θ
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ξ
-
-ο
-
-π
-
-ρ
-
-ς
-
-σ
-
-τ
-
-υ
-
-φ
-
-χ
-
-ψ
-
-ω
-
-ϊ
-
-ϋ
-
-ό
-
-ύ
-
-ώ
-
-ϑ
-
-Ϛ
-
-ϛ
-
-Ϟ
-
-Ϡ
-
-Є
-
-А
-
-В
-
-Г
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-У
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-ا
-
-ل
-
-क
-
-त
-
-य
-
-र
-
-ा
-
-ि
-
-ी
-
-०
-
-০
-
-க
-
-ப
-
-ா
-
-ാ
-
-ി
-
-་
-
-།
-
-៰
-
-ᵒ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ṁ
-
-ṁ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-ἀ
-
-ἁ
-
-ἂ
-
-ἃ
-
-ἄ
-
-ἅ
-
-ἆ
-
-ἇ
-
-Ἀ
-
-Ἁ
-
-Ἂ
-
-Ἃ
-
-Ἄ
-
-Ἅ
-
-Ἆ
-
-Ἇ
-
-ἐ
-
-ἑ
-
-ἒ
-
-ἓ
-
-ἔ
-
-ἕ
-
-Ἐ
-
-Ἑ
-
-Ἒ
-
-Ἓ
-
-Ἔ
-
-Ἕ
-
-ἠ
-
-ἡ
-
-ἢ
-
-ἣ
-
-ἤ
-
-ἥ
-
-ἦ
-
-ἧ
-
-Ἠ
-
-Ἡ
-
-Ἢ
-
-Ἣ
-
-Ἤ
-
-Ἥ
-
-Ἦ
-
-Ἧ
-
-ἰ
-
-ἱ
-
-ἲ
-
-ἳ
-
-ἴ
-
-ἵ
-
-ἶ
-
-ἷ
-
-Ἰ
-
-Ἱ
-
-Ἲ
-
-Ἳ
-
-Ἴ
-
-Ἵ
-
-Ἶ
-
-Ἷ
-
-ὀ
-
-ὁ
-
-ὂ
-
-ὃ
-
-ὄ
-
-ὅ
-
-Ὀ
-
-Ὁ
-
-Ὂ
-
-Ὃ
-
-Ὄ
-
-Ὅ
-
-ὐ
-
-ὑ
-
-ὒ
-
-ὓ
-
-ὔ
-
-ὕ
-
-ὖ
-
-ὗ
-
-Ὑ
-
-Ὓ
-
-Ὕ
-
-Ὗ
-
-ὠ
-
-ὡ
-
-ὢ
-
-ὣ
-
-ὤ
-
-ὥ
-
-ὦ
-
-ὧ
-
-Ὠ
-
-Ὡ
-
-Ὢ
-
-Ὣ
-
-Ὤ
-
-Ὥ
-
-Ὦ
-
-Ὧ
-
-ὰ
-
-ὲ
-
-ὴ
-
-ὶ
-
-ὸ
-
-ὺ
-
-ὼ
-
-ᾀ
-
-ᾁ
-
-ᾄ
-
-ᾅ
-
-ᾆ
-
-ᾐ
-
-ᾑ
-
-ᾔ
-
-ᾕ
-
-ᾖ
-
-ᾗ
-
-ᾠ
-
-ᾤ
-
-ᾦ
-
-ᾧ
-
-ᾳ
-
-ᾴ
-
-ᾶ
-
-ᾷ
-
-Ὰ
-
-᾽
-
-᾿
-
-ῂ
-
-ῃ
-
-ῄ
-
-ῆ
-
-ῇ
-
-Ὲ
-
-Ὴ
-
-῎
-
-῏
-
-ῒ
-
-ῖ
-
-ῗ
-
-Ὶ
-
-῞
-
-ῢ
-
-ῤ
-
-ῥ
-
-ῦ
-
-Ὺ
-
-Ῥ
-
-ῲ
-
-ῳ
-
-ῴ
-
-ῶ
-
-ῷ
-
-Ὸ
-
-Ὼ
-
-῾
-
-‍
-
-‐
-
-‑
-
-‒
-
-–
-
-—
-
-―
-
-‖
-
-‘
-
-’
-
-‚
-
-“
-
-”
-
-„
-
-†
-
-‡
-
-•
-
-‣
-
-…
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-⁄
-
-⁰
-
-⁹
-
-₁
-
-₂
-
-₤
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-№
-
-℗
-
-™
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↳
-
-⇄
-
-⇒
-
-⇓
-
-∆
-
-−
-
-∙
-
-√
-
-∞
-
-≈
-
-≡
-
-≤
-
-≥
-
-≫
-
-⋅
-
-⋆
-
-⌁
-
-⏭
-
-Ⓒ
-
-Ⓡ
-
-─
-
-│
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▾
-
-◄
-
-◆
-
-◇
-
-◊
-
-○
-
-●
-
-☀
-
-★
-
-☆
-
-☎
-
-☐
-
-☛
-
-☞
-
-☹
-
-☺
-
-♂
-
-♡
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-⚫
-
-✅
-
-✈
-
-✓
-
-✔
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➖
-
-➜
-
-➡
-
-➤
-
-⟫
-
-⠀
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-〈
-
-〉
-
-》
-
-【
-
-】
-
-・
-
-ꞌ
-
-ﬁ
-
-，
-
-：
-
-￡
-
-￥
-
-�
\ No newline at end of file
@@ -1,6575 +0,0 @@
-
-
- 
-
- ં
-
- ઃ
-
- ઃઃ
-
-
- ઃઃઃ
-
- ઃઃઃઃ
-
- ઃઃઃઃઃ
-
- ઃઃઃઃઃઃ
-
- ઃઃઃઃઃઃઃ
-
- ઃઃઃઃઃઃઃઃ	
- 
- ઃઃઃઃઃઃઃઃઃ
-
-#
- ઃઃઃઃઃઃઃઃઃઃ
-&
-" ઃઃઃઃઃઃઃઃઃઃઃ
-)
-% ઃઃઃઃઃઃઃઃઃઃઃઃ
-,
-( ઃઃઃઃઃઃઃઃઃઃઃઃઃ
-/
-+ ઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-2
-. ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-5
-1 ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-8
-4 ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-;
-7 ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
->
-: ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-D
-@ ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-
- ઼
-
- િ
-
- િઃ
-
-
- િઃઃ
-
- િઃઃઃ
-
- િઃઃઃઃ
-
- િઃઃઃઃઃ
-
- િઃઃઃઃઃઃ
- 
- િઃઃઃઃઃઃઃઃ
-#
- િઃઃઃઃઃઃઃઃઃ
-&
-" િઃઃઃઃઃઃઃઃઃઃ 
-)
-% િઃઃઃઃઃઃઃઃઃઃઃ!
-,
-( િઃઃઃઃઃઃઃઃઃઃઃઃ"
-2
-. િઃઃઃઃઃઃઃઃઃઃઃઃઃઃ#
-
- િિ$
-
- ુ%
-
- ું&
-
- ૂ'
-
- ે(
-
- ્)
-
- ૢ*
-
-!+
-
-",
-
-#-
-
-$.
-
-%/
-
-%ે0
-
-&1
-
-'2
-
-(3
-
-(ઃ4
-
-(ઃઃ5
-
-
-(ઃઃઃ6
-
-(ઃઃઃઃ7
-
-(ઃઃઃઃઃ8
-
-(ઃઃઃઃઃઃ9
-
-):
-
-)ઃ;
-
-)ઃઃ<
-
-
-)ઃઃઃ=
-
-)ઃઃઃઃ>
-
-)ઃઃઃઃઃઃ?
-
-*@
-
-+A
-
-+ઃB
-
-+ઃઃC
-
-+ઃઃઃઃD
-
-,E
-
-
-,ઃઃઃF
-
-,ઃઃઃઃG
-
-,ઃઃઃઃઃH
-
-,ઃઃઃઃઃઃI
-
--J
-
--ઃK
-
--િL
-
-.M
-
-.ેN
-
-/O
-
-0P
-
-1Q
-
-2R
-
-3S
-
-3ુT
-
-4U
-
-5V
-
-5ેW
-
-6X
-
-7Y
-
-8Z
-
-9[
-
-:\
-
-;]
-
-<^
-
-=_
-
->`
-
->ૂa
-
-?b
-
-@c
-
-Ad
-
-A્e
-
-A્છf
-
-A્ઠg
-
-A્તh
-
-A્યi
-
-A્રj
-
-Bk
-
-Cl
-
-Cેm
-
-Dn
-
-Eo
-
-Fp
-
-Fઃq
-
-F્r
-
-Gs
-
-Gેt
-
-G્u
-
-G્છv
-
-G્ઠw
-
-G્રx
-
-G્વy
-
-Hz
-
-Hં{
-
-H્|
-
-I}
-
-J~
-
-K
-
-L
-
-M
-	
-Mં
-
-N
-
-O
-
-O̟
-
-P
-
-Q
-
-R
-	
-Rં
-	
-Rૂ
-
-S
-	
-S્
-
-T
-	
-Tે
-
-U
-
-V
-
-W
-
-X
-
-Y
-
-Z
-
-[
-
-
-[ઃઃઃ
-	
-[ે
-
-\
-
-]
-	
-]ઃ
-
-]ઃઃ
-
-
-]ઃઃઃ
-
-]ઃઃઃઃ
-
-^
-
-_
-	
-_ં
-
-`
-
-a
-
-a̸
-
-b
-
-c
-
-d
-
-e
-
-e̟
-
-e̱
-
-f
-
-g
-
-h
-
-i
-
-i̇
-
-i̟
-
-j
-
-k
-
-l
-
-m
-
-m̃
-
-n
-
-o
-
-o̟
-
-p
-
-q
-
-r
-
-s
-
-s̟
-
-t
-
-t̃
-
-u
-
-u̟
-
-u̸
-
-v
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-	
-~્
-
- 
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˚
-
-˜
-
-˝
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-،
-
-।
-
-॥
-
-०
-
-॰
-
-০
-
-ં
-
-ઃ
-
-ઃઃ
-
-	ઃઃઃ
-
-ઃઃઃઃ
-
-ઃઃઃઃઃ
-
-ઃઃઃઃઃઃ
-
-ઃઃઃઃઃઃઃ
-
-ઃઃઃઃઃઃઃઃ
- 
-ઃઃઃઃઃઃઃઃઃ
-#
-ઃઃઃઃઃઃઃઃઃઃ
-&
-!ઃઃઃઃઃઃઃઃઃઃઃ
-)
-$ઃઃઃઃઃઃઃઃઃઃઃઃ
-,
-'ઃઃઃઃઃઃઃઃઃઃઃઃઃ
-/
-*ઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-2
--ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-5
-0ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-8
-3ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-;
-6ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
->
-9ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-A
-<ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-D
-?ઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-G
-Bઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-
-અ
-
-અઁ
-
-અં
-
-	અંં
-
-	અિે
-
-અુ
-
-અે
-
-અ્
-
-	અ્ઠ
-
-આ
-
-આઁ
-
-આં
-
-	આિે
-
-આે
-
-ઇ
-
-ઇં
-
-ઇે
-
-ઈ
-
-ઈઁ
-
-ઈં
-
-	ઈિે
-
-ઈે
-
-ઉ
-
-ઉઁ
-
-ઉં
-
-ઉે
-
-ઊ
-
-ઊઁ
-
-ઊં
-
-ઊે
-
-ઋ
-
-ઍ
-
-ઍં
-
-એ
-
-એઁ
-
-એં
-
-એિ
-
-એે
-
-	એેે
-
-ઐ
-
-ઐં
-
-ઑ
-
-ઓ
-
-ઓં
-
-ઓે
-
-ઓૢ
-
-ઔ
-
-ઔં
-
-ક
-
-કં
-
-ક઼
-
-કિ
-
-	કિે
-
-કુ
-
-	કું
-
-	કુે
-
-કૂ
-
-	કૂં
-
-કૃ
-
-કૅ
-
-કે
-
-	કેં
-
-	કેે
-
-કેેે
-
-કૈ
-
-	કૈં
-
-ક્
-
-	ક્ક
-
-ક્કં
-
-ક્કુ
-
-ક્કું
-
-ક્કે
-
-ક્ક્
-
-ક્ક્ષ
-
-ક્ક્સ
-
-	ક્ખ
-
-ક્ખુ
-
-ક્ખે
-
-	ક્ચ
-
-ક્ચુ
-
-ક્ચે
-
-ક્ચ્છ
-
-ક્ચ્યુ
-
-	ક્છ
-
-	ક્જ
-
-ક્જ઼ે
-
-	ક્ઝ
-
-ક્ઝુ
-
-ક્ઝે
-
-	ક્ટ
-
-ક્ટં
-
-ક્ટુ
-
-ક્ટે
-
-ક્ટ્ર
-
-ક્ટ્રે
-
-ક્ટ્સ
-
-	ક્ઠ
-
-	ક્ડ
-
-	ક્ત
-
-ક્તિે
-
-ક્તું
-
-ક્તૃ
-
-ક્તે
-
-ક્ત્ત
-
-ક્ત્ય
-
-ક્ત્યે
-
-ક્ત્ર
-
-ક્ત્વ
-
-	ક્થ
-
-	ક્દ
-
-	ક્ન
-
-ક્ને
-
-ક્ન્ડ
-
-	ક્પ
-
-	ક્બ
-
-	ક્ભ
-
-	ક્મ
-
-ક્મે
-
-	ક્ય
-
-ક્યુ
-
-ક્યું
-
-ક્યૂ
-
-ક્યે
-
-	ક્ર
-
-ક્રં
-
-ક્રુ
-
-ક્રૂ
-
-ક્રૃ
-
-ક્રૅ
-
-ક્રે
-
-ક્ર્મ
-
-	ક્લ
-
-ક્લં
-
-ક્લુ
-
-ક્લૂ
-
-ક્લૅ
-
-ક્લે
-
-ક્લ્ક્સ
-
-ક્લ્પ
-
-ક્લ્ય
-
-	ક્ળ
-
-ક્ળ્ય
-
-	ક્વ
-
-ક્વં
-
-ક્વે
-
-	ક્શ
-
-ક્શે
-
-	ક્ષ
-
-ક્ષં
-
-ક્ષુ
-
-ક્ષે
-
-ક્ષૈ
-
-ક્ષ્
-
-ક્ષ્ચ
-
-ક્ષ્ટ
-
-ક્ષ્ટ્ર
-
-ક્ષ્ણ
-
-ક્ષ્ણુ
-
-ક્ષ્પ
-
-ક્ષ્મ
-
-ક્ષ્ય
-
-ક્ષ્યુ
-
-ક્ષ્યું
-
-ક્ષ્વ
-
-	ક્સ
-
-ક્સં
-
-ક્સુ
-
-ક્સે
-
-ક્સ્ચ
-
-ક્સ્ચે
-
-ક્સ્ટ
-
-ક્સ્ટે
-
-ક્સ્ટ્ર
-
-ક્સ્ડ
-
-ક્સ્થ
-
-ક્સ્પ
-
-ક્સ્પે
-
-ક્સ્પ્લ
-
-ક્સ્ફ
-
-ક્સ્યુ
-
-	ક્હ
-
-ક્હે
-
-કૢ
-
-ખ
-
-ખં
-
-ખ઼
-
-	ખ઼ુ
-
-ખિ
-
-	ખિે
-
-ખિ્ર
-
-ખુ
-
-	ખું
-
-ખૂ
-
-	ખૂં
-
-ખે
-
-	ખેં
-
-	ખેે
-
-ખૈ
-
-ખ્
-
-	ખ્ખ
-
-ખ્ખુ
-
-ખ્ખું
-
-ખ્ખે
-
-ખ્ખેં
-
-	ખ્છ
-
-	ખ્ટ
-
-	ખ્ત
-
-ખ્તુ
-
-ખ્તે
-
-ખ્ત્ય
-
-	ખ્મ
-
-ખ્મે
-
-	ખ્ય
-
-ખ્યુ
-
-ખ્યું
-
-ખ્યે
-
-	ખ્ર
-
-ખ્રુ
-
-	ખ્લ
-
-ખ્લ્લુ
-
-	ખ્વ
-
-	ખ્શ
-
-ખ્શે
-
-ખ્શ્ર
-
-	ખ્સ
-
-ખ્સે
-
-ગ
-
-ગં
-
-	ગંે
-
-ગ઼
-
-	ગિે
-
-ગિ્ન
-
-ગિ્લ
-
-ગિ્વ
-
-ગુ
-
-	ગું
-
-ગૂ
-
-	ગૂં
-
-ગૃ
-
-ગૅ
-
-ગે
-
-	ગેં
-
-	ગેે
-
-ગે્ર
-
-ગૈ
-
-ગ્
-
-	ગ્ગ
-
-ગ્ગુ
-
-ગ્ગે
-
-ગ્ગ્લુ
-
-	ગ્છ
-
-	ગ્ઝ
-
-	ગ્ટ
-
-	ગ્ડ
-
-	ગ્ણ
-
-ગ્ણુ
-
-	ગ્ત
-
-	ગ્દ
-
-	ગ્ધ
-
-	ગ્ન
-
-ગ્નુ
-
-ગ્ને
-
-ગ્ન્ય
-
-	ગ્પ
-
-	ગ્બ
-
-	ગ્ભ
-
-	ગ્મ
-
-ગ્મૂ
-
-ગ્મે
-
-	ગ્ય
-
-ગ્યુ
-
-ગ્યું
-
-ગ્યૂ
-
-ગ્યે
-
-	ગ્ર
-
-ગ્રં
-
-ગ્રંે
-
-ગ્રુ
-
-ગ્રૂ
-
-ગ્રૅ
-
-ગ્રે
-
-ગ્રેં
-
-	ગ્લ
-
-ગ્લં
-
-ગ્લુ
-
-ગ્લૂ
-
-ગ્લૅ
-
-ગ્લે
-
-ગ્લેં
-
-	ગ્વ
-
-ગ્વે
-
-	ગ્સ
-
-ગ્સે
-
-ગ્સ્ટ
-
-ગૢ
-
-ઘ
-
-ઘં
-
-ઘુ
-
-	ઘું
-
-ઘૂ
-
-	ઘૂં
-
-ઘૃ
-
-ઘે
-
-	ઘેં
-
-	ઘેે
-
-ઘ્
-
-	ઘ્ધ
-
-	ઘ્ન
-
-ઘ્ને
-
-	ઘ્ય
-
-ઘ્યે
-
-	ઘ્ર
-
-ઘ્રુ
-
-	ઘ્વ
-
-ઙ
-
-ઙૂ
-
-ઙે
-
-	ઙ્ગ
-
-ચ
-
-ચં
-
-ચા
-
-ચિ
-
-	ચિે
-
-ચુ
-
-	ચું
-
-ચૂ
-
-	ચૂં
-
-ચૅ
-
-ચે
-
-	ચેં
-
-	ચેે
-
-ચૈ
-
-ચ્
-
-	ચ્ચ
-
-ચ્ચુ
-
-ચ્ચું
-
-ચ્ચે
-
-ચ્ચેં
-
-ચ્ચેે
-
-	ચ્છ
-
-ચ્છં
-
-ચ્છુ
-
-ચ્છું
-
-ચ્છે
-
-ચ્છ્વ
-
-	ચ્ટ
-
-	ચ્ડ
-
-	ચ્ન
-
-	ચ્મ
-
-	ચ્ય
-
-ચ્યુ
-
-ચ્યું
-
-ચ્યૂ
-
-ચ્યે
-
-	ચ્લ
-
-	ચ્વ
-
-	ચ્સ
-
-	ચ્હ
-
-છ
-
-છં
-
-છઃ
-
-	છઃઃ
-
-છઃઃઃ
-
-છઃઃઃઃ
-
-છઃઃઃઃઃ
-
-છઃઃઃઃઃઃ
-5
-0છઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-
-	છઃે
-
-છુ
-
-	છું
-
-છૂ
-
-	છૂં
-
-છૅ
-
-છે
-
-	છેં
-
-	છેે
-
-છેેે
-
-	છેૢ
-
-છૈ
-
-છ્
-
-	છ્છ
-
-છ્છે
-
-	છ્ઠ
-
-	છ્ત
-
-	છ્ય
-
-છ્યુ
-
-છ્યું
-
-	છ્લ
-
-છ્લે
-
-	છ્વ
-
-	છ્હ
-
-છ્હે
-
-જ
-
-જં
-
-જ઼
-
-	જ઼ે
-
-જ઼્ય
-
-	જિે
-
-જી
-
-	જીં
-
-જુ
-
-	જું
-
-	જુે
-
-જૂ
-
-	જૂં
-
-જૅ
-
-જે
-
-	જેં
-
-	જે઼
-
-	જેિ
-
-	જેે
-
-જેેે
-
-જૈ
-
-જ્
-
-	જ્ક
-
-	જ્ગ
-
-જ્ગ્ય
-
-	જ્છ
-
-જ્છે
-
-	જ્જ
-
-જ્જી
-
-જ્જુ
-
-જ્જૂ
-
-જ્જે
-
-જ્જૈ
-
-જ્જ્ઞ
-
-જ્જ્વ
-
-	જ્ઝ
-
-	જ્ઞ
-
-જ્ઞે
-
-	જ્ડ
-
-જ્ણુ
-
-	જ્ત
-
-	જ્થ
-
-	જ્ન
-
-જ્ન્મ
-
-	જ્બ
-
-જ્બુ
-
-જ્બે
-
-	જ્મ
-
-જ્મે
-
-	જ્ય
-
-જ્યં
-
-જ્યુ
-
-જ્યું
-
-જ્યૂ
-
-જ્યે
-
-જ્ય્
-
-જ્ય્સ
-
-	જ્ર
-
-જ્રે
-
-	જ્લ
-
-	જ્વ
-
-જ્વે
-
-	જ્સ
-
-	જ્હ
-
-ઝ
-
-ઝં
-
-ઝ઼
-
-ઝુ
-
-	ઝું
-
-ઝૂ
-
-	ઝૂં
-
-ઝૅ
-
-ઝે
-
-	ઝેં
-
-	ઝેે
-
-ઝૈ
-
-ઝ્
-
-	ઝ્ક
-
-	ઝ્ઝ
-
-	ઝ્ડ
-
-	ઝ્ન
-
-	ઝ્મ
-
-	ઝ્ય
-
-ઝ્યુ
-
-ઝ્યું
-
-	ઝ્ર
-
-	ઝ્લ
-
-ઝ્લે
-
-	ઝ્વ
-
-ઝ્વં
-
-	ઝ્હ
-
-ઝ્હે
-
-ઞ
-
-	ઞ્જ
-
-	ઞ્લ
-
-ટ
-
-ટં
-
-	ટિે
-
-ટુ
-
-	ટું
-
-ટૂ
-
-	ટૂં
-
-ટૅ
-
-ટે
-
-	ટેં
-
-	ટેે
-
-ટે્ર
-
-ટૈ
-
-ટ્
-
-	ટ્આ
-
-	ટ્ક
-
-	ટ્ચ
-
-	ટ્જ
-
-ટ્જે
-
-	ટ્ઝ
-
-ટ્ઝે
-
-	ટ્ટ
-
-ટ્ટુ
-
-ટ્ટે
-
-ટ્ટૈ
-
-ટ્ટ્
-
-	ટ્ઠ
-
-ટ્ણુ
-
-	ટ્ન
-
-	ટ્પ
-
-	ટ્ય
-
-ટ્યુ
-
-ટ્યું
-
-ટ્યૂ
-
-	ટ્ર
-
-ટ્રં
-
-ટ્રુ
-
-ટ્રૂ
-
-ટ્રૅ
-
-ટ્રે
-
-ટ્ર્સ
-
-	ટ્લ
-
-ટ્લું
-
-ટ્લે
-
-	ટ્વ
-
-ટ્વે
-
-	ટ્સ
-
-ટ્સે
-
-ટ્સ્ક
-
-ટ્સ્પ
-
-ઠ
-
-ઠં
-
-ઠુ
-
-	ઠું
-
-ઠૂ
-
-	ઠૂં
-
-ઠે
-
-	ઠેં
-
-	ઠેે
-
-ઠ્
-
-	ઠ્ઠ
-
-ઠ્ઠુ
-
-ઠ્ઠું
-
-ઠ્ઠે
-
-	ઠ્ય
-
-ઠ્યું
-
-ડ
-
-ડં
-
-ડ઼
-
-	ડ઼ે
-
-ડિ
-
-	ડિ઼
-
-	ડિે
-
-ડુ
-
-	ડું
-
-ડૂ
-
-	ડૂં
-
-ડૅ
-
-ડે
-
-	ડેં
-
-	ડે઼
-
-	ડેે
-
-ડૈ
-
-ડ્
-
-	ડ્ક
-
-ડ્ક્ટ
-
-	ડ્ગ
-
-	ડ્જ
-
-ડ્જે
-
-	ડ્ઝ
-
-ડ્ઝે
-
-	ડ્ટ
-
-ડ્ટે
-
-	ડ્ડ
-
-ડ્ડે
-
-ડ્ડ્રે
-
-	ડ્ત
-
-	ડ્થ
-
-	ડ્ન
-
-	ડ્મ
-
-	ડ્ય
-
-ડ્યુ
-
-ડ્યું
-
-ડ્યૂ
-
-ડ્યે
-
-	ડ્ર
-
-ડ્રં
-
-ડ્રુ
-
-ડ્રૂ
-
-ડ્રૅ
-
-ડ્રે	
-
-	ડ્લ	
-
-	ડ્વ	
-
-ડ્વે	
-
-	ડ્સ	
-
-ડ્સે	
-
-ઢ	
-
-ઢં	
-
-ઢ઼	
-
-ઢુ	
-
-	ઢું	
-
-ઢૂ	
-
-	ઢૂં	
-
-ઢે	
-
-	ઢેં	
-
-	ઢ્ઢ	
-
-	ઢ્ય	
-
-ઢ્યુ	
-
-ઢ્યું	
-
-ણ	
-
-ણં	
-
-	ણિે	
-
-ણુ	
-
-	ણું	
-
-ણુંં	
-
-	ણુુ	
-
-	ણુે	
-
-ણૂ	
-
-	ણૂં	
-
-ણૅ	
-
-ણે	
-
-	ણેં	
-
-	ણેે	
-
-ણૈ	
-
-ણ્	
-
-	ણ્આ	
-
-	ણ્ટ	
-
-	ણ્ઠ	
-
-	ણ્ડ	
-
-ણ્ડુ	
-
-ણ્ડે	
-
-	ણ્ણ	
-
-ણ્ણૂ	
-
-	ણ્મ	
-
-	ણ્ય	
-
-ણ્યુ	
-
-ણ્યું	
-
-ણ્યે	
-
-	ણ્વ	
-
-ણૢ	
-
-ત	
-
-તં	
-
-તા	
-
-તિ	
-
-	તિે	
-
-	તીે	
-
-તુ	
-
-	તુઁ	
-
-	તું	
-
-તૂ	
-
-	તૂં	
-
-તૃ	
-
-તૅ	
-
-તે	
-
-	તેં	
-
-	તેુ	
-
-	તેે	
-
-તેેે	
-
-તૈ	
-
-	તૈં	
-
-	તૈે	
-
-	તોૢ	
-
-ત્	
-
-	ત્આ	
-
-	ત્ક	
-
-ત્કં	
-
-ત્કુ	
-
-ત્કૃ	
-
-ત્કે	
-
-ત્ક્ર	
-
-ત્ક્રુ	
-
-ત્ક્ષ	
-
-	ત્ખ	
-
-	ત્ચ	
-
-	ત્છ	
-
-	ત્જ	
-
-	ત્ઝ	
-
-ત્ઝે	
-
-	ત્ત	
-
-ત્તં	
-
-ત્તુ	
-
-ત્તું	
-
-ત્તૂ	
-
-ત્તે	
-
-ત્ત્ત	
-
-ત્ત્પ	
-
-ત્ત્ર	
-
-ત્ત્વ	
-
-ત્ત્વે	
-
-	ત્થ	
-
-ત્થે	
-
-	ત્ન	
-
-ત્નું	
-
-ત્ને	
-
-	ત્પ	
-
-ત્પં	
-
-ત્પુ	
-
-ત્પૂ	
-
-ત્પ્ર	
-
-ત્પ્રે	
-
-	ત્ફ	
-
-	ત્બ	
-
-ત્બુ	
-
-	ત્ભ	
-
-	ત્મ	
-
-ત્મે	
-
-ત્મ્ય	
-
-	ત્ય	
-
-ત્યં	
-
-ત્યા	
-
-ત્યુ	
-
-ત્યું	
-
-ત્યૂ	
-
-ત્યે	
-
-ત્ય્	
-
-ત્ય્દ	
-
-ત્ય્હ	
-
-	ત્ર	
-
-ત્રં
-
-
-ત્રુ
-
-
-ત્રું
-
-
-ત્રૂ
-
-
-ત્રે
-
-
-ત્રેં
-
-
-ત્રેે
-
-
-ત્રૈ
-
-
-ત્ર્ન
-
-
-ત્ર્ય
-
-
-ત્ર્યં
-
-
-	ત્લ
-
-
-ત્લે
-
-
-	ત્વ
-
-
-ત્વં
-
-
-ત્વે
-
-
-	ત્શ
-
-
-ત્શે
-
-
-	ત્સ
-
-
-ત્સં
-
-
-ત્સુ
-
-
-ત્સૂ
-
-
-ત્સે
-
-
-ત્સ્ન
-
-
-ત્સ્ય
-
-
-ત્સ્યે
-
-
-ત્સ્વ
-
-
-	ત્હ
-
-
-ત્હે
-
-
-તૢ
-
-
-થ
-
-
-થં
-
-
-થા
-
-
-	થાે
-
-
-	થીે
-
-
-થુ
-
-
-	થું
-
-
-થૂ
-
-
-	થૂં
-
-
-થૅ
-
-
-થે
-
-
-	થેં
-
-
-	થેે
-
-
-થૈ
-
-
-થ્
-
-
-	થ્ઈ
-
-
-	થ્ત
-
-
-	થ્થ
-
-
-થ્થુ
-
-
-થ્થું
-
-
-થ્થૈ
-
-
-	થ્ન
-
-
-	થ્ય
-
-
-થ્યુ
-
-
-થ્યૂ
-
-
-થ્યે
-
-
-	થ્ર
-
-
-થ્રુ
-
-
-થ્રૂ
-
-
-થ્રે
-
-
-થ્ર્ય
-
-
-	થ્લ
-
-
-થ્લે
-
-
-	થ્વ
-
-
-	થ્સ
-
-
-દ
-
-
-દં
-
-
-	દિે
-
-
-દુ
-
-
-	દું
-
-
-	દુે
-
-
-દૂ
-
-
-	દૂં
-
-
-દૃ
-
-
-દૅ
-
-
-દે
-
-
-	દેં
-
-
-	દેે
-
-
-	દે્
-
-
-દૈ
-
-
-દ્
-
-
-દ્અં
-
-
-	દ્ઉ
-
-
-	દ્ક
-
-
-	દ્ગ
-
-
-દ્ગુ
-
-
-દ્ગૃ
-
-
-દ્ગ્ર
-
-
-	દ્ઘ
-
-
-	દ્ત
-
-
-	દ્દ
-
-
-દ્દં
-
-
-દ્દુ
-
-
-દ્દે
-
-
-	દ્ધ
-
-
-દ્ધં
-
-
-દ્ધુ
-
-
-દ્ધૃ
-
-
-દ્ધે
-
-
-દ્ધ્
-
-
-દ્ધ્વ
-
-
-	દ્ન
-
-
-દ્નુ
-
-
-દ્ને
-
-
-	દ્બ
-
-
-દ્બુ
-
-
-દ્બે
-
-
-	દ્ભ
-
-
-દ્ભુ
-
-
-દ્ભૂ
-
-
-	દ્મ
-
-
-	દ્ય
-
-
-દ્યં
-
-
-દ્યુ
-
-
-દ્યું
-
-
-દ્યૂ
-
-
-દ્યે
-
-
-	દ્ર
-
-
-દ્રં
-
-
-દ્રુ
-
-
-દ્રૂ
-
-
-દ્રે
-
-
-દ્ર્મ્સ
-
-
-દ્ર્ય
-
-
-દ્ર્ષ્ટ
-
-
-	દ્લ
-
-
-	દ્વ
-
-
-દ્વં
-
-
-દ્વે
-
-દ્વૈ
-
-દ્વ્ર
-
-	દ્શ
-
-	દ્સ
-
-	દ્હ
-
-ધ
-
-ધં
-
-ધિ
-
-ધુ
-
-	ધું
-
-ધુ્મ્ર
-
-ધુ્ર
-
-ધૂ
-
-	ધૂં
-
-ધૃ
-
-ધૅ
-
-ધે
-
-	ધેં
-
-	ધેે
-
-ધૈ
-
-ધ્
-
-	ધ્દ
-
-	ધ્ધ
-
-ધ્ધે
-
-	ધ્ન
-
-ધ્ને
-
-ધ્ન્ય્વ
-
-	ધ્મ
-
-	ધ્ય
-
-ધ્યુ
-
-ધ્યું
-
-ધ્યે
-
-	ધ્ર
-
-ધ્રુ
-
-ધ્રૂ
-
-ધ્રે
-
-ધ્ર્વ
-
-	ધ્વ
-
-ધ્વં
-
-ન
-
-નં
-
-	નંે
-
-ના
-
-નિ
-
-	નિે
-
-નિ્દ્ર
-
-નિ્સ
-
-નિ્સ્ટ
-
-	નીે
-
-નુ
-
-	નુઁ
-
-	નું
-
-	નુે
-
-	નુ્
-
-નૂ
-
-	નૂં
-
-નૃ
-
-નૅ
-
-ને
-
-	નેં
-
-	નેે
-
-નેેે
-
-નૈ
-
-	નૈં
-
-	નૈે
-
-ન્
-
-	ન્ક
-
-ન્કં
-
-ન્કુ
-
-ન્કે
-
-ન્ક્ટ
-
-ન્ક્ડ
-
-ન્ક્ય
-
-ન્ક્યુ
-
-ન્ક્ર
-
-ન્ક્વ
-
-ન્ક્વે
-
-ન્ક્સ
-
-	ન્ગ
-
-ન્ગુ
-
-ન્ગે
-
-ન્ગ્ટ
-
-ન્ગ્યુ
-
-ન્ગ્ર
-
-ન્ગ્રે
-
-ન્ગ્લ
-
-ન્ગ્વ
-
-ન્ગ્વે
-
-ન્ગ્સ્ટ
-
-	ન્ઘ
-
-ન્ઘુ
-
-	ન્ચ
-
-ન્ચં
-
-ન્ચુ
-
-ન્ચૂ
-
-ન્ચે
-
-ન્ચ્યુ
-
-	ન્છ
-
-ન્છુ
-
-ન્છે
-
-	ન્જ
-
-ન્જં
-
-ન્જી
-
-ન્જુ
-
-ન્જે
-
-	ન્ઝ
-
-ન્ઝે
-
-ન્ઝ્યુ
-
-	ન્ટ
-
-ન્ટં
-
-ન્ટુ
-
-ન્ટૂ
-
-ન્ટે
-
-ન્ટ્યુ
-
-ન્ટ્ર
-
-ન્ટ્રે
-
-ન્ટ્સ
-
-ન્ટ્સે
-
-	ન્ડ
-
-ન્ડં
-
-ન્ડુ
-
-ન્ડે
-
-ન્ડ્ઝ
-
-ન્ડ્ટ
-
-ન્ડ્યુ
-
-ન્ડ્ર
-
-ન્ડ્રુ
-
-ન્ડ્રૂ
-
-ન્ડ્રે
-
-ન્ડ્ર્યુ
-
-ન્ડ્સ
-
-ન્ડ્સે
-
-	ન્ત
-
-ન્તુ
-
-ન્તે
-
-ન્ત્
-
-ન્ત્ય
-
-ન્ત્યે
-
-ન્ત્ર
-
-	ન્થ
-
-ન્થુ
-
-ન્થે
-
-ન્થ્ર
-
-ન્થ્રે
-
-	ન્દ
-
-ન્દુ
-
-ન્દૂ
-
-ન્દે
-
-ન્દ્
-
-ન્દ્ગ
-
-ન્દ્ર
-
-ન્દ્રે
-
-ન્દ્વ
-
-	ન્ધ
-
-ન્ધુ
-
-ન્ધે
-
-ન્ધ્ય
-
-ન્ધ્ર
-
-	ન્ન
-
-ન્નુ
-
-ન્નૂ
-
-ન્ને
-
-ન્નેં
-
-ન્નૈ
-
-ન્ન્મ
-
-	ન્પ
-
-	ન્ફ
-
-ન્ફે
-
-ન્ફ્યુ
-
-ન્ફ્યૂ
-
-ન્ફ્ર
-
-ન્ફ્રે
-
-ન્ફ્લુ
-
-ન્ફ્લે
-
-	ન્બ
-
-ન્બુ
-
-ન્બે
-
-	ન્ભ
-
-	ન્મ
-
-ન્મુ
-
-ન્મૂ
-
-ન્મે
-
-ન્મ્ય
-
-ન્મ્યું
-
-ન્મ્ર
-
-	ન્ય
-
-ન્યં
-
-ન્યુ
-
-ન્યું
-
-ન્યુે
-
-ન્યૂ
-
-ન્યે
-
-ન્ય્
-
-	ન્ર
-
-ન્રુ
-
-ન્રે
-
-	ન્લ
-
-ન્લે
-
-	ન્વ
-
-ન્વં
-
-ન્વે
-
-	ન્શ
-
-ન્શુ
-
-ન્શે
-
-ન્શ્ય
-
-ન્શ્યુ
-
-	ન્સ
-
-ન્સં
-
-ન્સુ
-
-ન્સૂ
-
-ન્સે
-
-ન્સ્ક
-
-ન્સ્ક્ર
-
-ન્સ્ટ
-
-ન્સ્ટે
-
-ન્સ્ટ્ર
-
-ન્સ્ટ્રુ
-
-ન્સ્ટ્રે
-
-ન્સ્ડ
-
-ન્સ્પ
-
-ન્સ્પે
-
-ન્સ્ય
-
-ન્સ્યુ
-
-ન્સ્યૂ
-
-ન્સ્લ
-
-ન્સ્લે
-
-	ન્હ
-
-ન્હુ
-
-ન્હે
-
-ન્હેં
-
-નૢ
-
-પ
-
-પં
-
-પા
-
-પિ
-
-	પિિ
-
-	પિુ
-
-	પિે
-
-પિ્ત
-
-પિ્તે
-
-પિ્ર
-
-પિ્રે
-
-પિ્લ
-
-પિ્સ
-
-પુ
-
-	પું
-
-પૂ
-
-	પૂં
-
-પૃ
-
-પૅ
-
-પે
-
-	પેં
-
-	પેે
-
-પે્લ
-
-પૈ
-
-	પૈં
-
-પ્
-
-	પ્ક
-
-	પ્ચ
-
-પ્ચ્યુ
-
-પ્ચ્યૂ
-
-	પ્ટ
-
-પ્ટં
-
-પ્ટે
-
-પ્ટેં
-
-પ્ટ્સ
-
-	પ્ડ
-
-	પ્ણ
-
-	પ્ત
-
-પ્તે
-
-પ્ત્ય
-
-	પ્થ
-
-પ્થે
-
-	પ્ન
-
-પ્નું
-
-પ્ને
-
-	પ્પ
-
-પ્પુ
-
-પ્પે
-
-	પ્ફ
-
-પ્ફુ
-
-	પ્બ
-
-	પ્ય
-
-પ્યં
-
-પ્યુ
-
-પ્યું
-
-પ્યુંં
-
-પ્યૂ
-
-પ્યે
-
-	પ્ર
-
-પ્રં
-
-પ્રિ
-
-પ્રુ
-
-પ્રૂ
-
-પ્રે
-
-પ્રેં
-
-પ્રેે
-
-પ્રૈ
-
-પ્ર્
-
-પ્ર્ય
-
-	પ્લ
-
-પ્લં
-
-પ્લુ
-
-પ્લૂ
-
-પ્લૅ
-
-પ્લે
-
-પ્લેં
-
-પ્લ્યુ
-
-	પ્વ
-
-	પ્શ
-
-	પ્સ
-
-પ્સુ
-
-પ્સૂ
-
-પ્સે
-
-પ્સ્યુ
-
-પ્સ્યૂ
-
-	પ્હ
-
-પ્હે
-
-ફ
-
-ફં
-
-ફ઼
-
-	ફ઼ે
-
-ફ઼્ટ
-
-ફ઼્ર
-
-	ફિે
-
-ફુ
-
-	ફું
-
-ફૂ
-
-	ફૂં
-
-ફૅ
-
-ફે
-
-	ફેં
-
-	ફેે
-
-ફૈ
-
-ફ્
-
-	ફ્ક
-
-ફ્ક્ત
-
-	ફ્ઘ
-
-ફ્જી
-
-	ફ્ટ
-
-ફ્ટં
-
-ફ્ટે
-
-ફ્ટ્સ
-
-	ફ્ત
-
-ફ્તે
-
-	ફ્થ
-
-	ફ્દ
-
-	ફ્ન
-
-ફ્ન્સ્ટ
-
-	ફ્ફ
-
-ફ્ફે
-
-	ફ્ય
-
-ફ્યુ
-
-ફ્યૂ
-
-ફ્યે
-
-	ફ્ર
-
-ફ્રં
-
-ફ્રુ
-
-ફ્રૂ
-
-ફ્રૅ
-
-ફ્રે
-
-ફ્રેં
-
-	ફ્લ
-
-ફ્લુ
-
-ફ્લૂ
-
-ફ્લૅ
-
-ફ્લે
-
-ફ્લેં
-
-ફ્લ્યુ
-
-	ફ્ળ
-
-	ફ્સ
-
-ફ્હે
-
-	ફ્ે
-
-બ
-
-બઁ
-
-બં
-
-બિ
-
-	બિે
-
-બિ્ધ
-
-બિ્ર
-
-બિ્લ
-
-બુ
-
-	બું
-
-બુ્ર
-
-બૂ
-
-	બૂઁ
-
-	બૂં
-
-બૃ
-
-બૅ
-
-	બૅં
-
-બે
-
-	બેં
-
-	બેે
-
-બૈ
-
-	બૈં
-
-બ્
-
-	બ્ક
-
-	બ્જ
-
-બ્જે
-
-	બ્ઝ
-
-	બ્ડ
-
-બ્ડે
-
-	બ્ત
-
-	બ્દ
-
-બ્દુ
-
-બ્દે
-
-	બ્ધ
-
-	બ્ન
-
-બ્ને
-
-	બ્બ
-
-બ્બુ
-
-બ્બે
-
-	બ્ભ
-
-	બ્મ
-
-	બ્ય
-
-બ્યુ
-
-બ્યું
-
-બ્યૂ
-
-	બ્ર
-
-બ્રિ
-
-બ્રુ
-
-બ્રૂ
-
-બ્રૅ
-
-બ્રે
-
-બ્રેં
-
-બ્ર્ય
-
-બ્ર્હ્મ
-
-	બ્લ
-
-બ્લુ
-
-બ્લૂ
-
-બ્લૅ
-
-બ્લે
-
-બ્લેં
-
-બ્લૈ
-
-બ્લ્ડ
-
-બ્લ્યુ
-
-બ્લ્યૂ
-
-	બ્વ
-
-બ્વે
-
-	બ્શ
-
-	બ્સ
-
-બ્સે
-
-બ્સ્ટ
-
-બ્સ્ટે
-
-	બ્હ
-
-બ્હે
-
-ભ
-
-ભં
-
-ભા
-
-ભિ
-
-	ભિે
-
-ભુ
-
-	ભું
-
-ભૂ
-
-	ભૂં
-
-	ભૂે
-
-ભૃ
-
-ભૅ
-
-ભે
-
-	ભેં
-
-	ભેે
-
-ભૈ
-
-ભ્
-
-	ભ્છ
-
-	ભ્ભ
-
-	ભ્ય
-
-ભ્યં
-
-ભ્યુ
-
-ભ્યું
-
-ભ્યે
-
-	ભ્ર
-
-ભ્રં
-
-ભ્રુ
-
-ભ્રૂ
-
-મ
-
-મઁ
-
-મં
-
-	મંે
-
-મઃ
-
-મઃઃઃ
-
-મા
-
-	માં
-
-માંં
-
-મિ
-
-	મિં
-
-	મિિ
-
-	મિુ
-
-	મિે
-
-મિ્ર
-
-મુ
-
-	મું
-
-	મુઃ
-
-મુઃઃ
-
-	મુે
-
-મૂ
-
-	મૂં
-
-મૃ
-
-મૅ
-
-મે
-
-	મેં
-
-મેંં
-
-મેંે
-
-	મેે
-
-મેેે
-
-મૈ
-
-	મૈં
-
-મ્
-
-	મ્ક
-
-	મ્ખ
-
-	મ્ગ
-
-મ્ગ્ર
-
-	મ્ચ
-
-	મ્છ
-
-	મ્જ
-
-	મ્ઝ
-
-	મ્ટ
-
-મ્ટે
-
-	મ્ડ
-
-મ્ણુ
-
-	મ્ત
-
-	મ્થ
-
-	મ્દ
-
-	મ્ન
-
-મ્નું
-
-મ્ને
-
-	મ્પ
-
-મ્પં
-
-મ્પુ
-
-મ્પૂ
-
-મ્પે
-
-મ્પ્ટ
-
-મ્પ્ય
-
-મ્પ્યુ
-
-મ્પ્યૂ
-
-મ્પ્ર
-
-મ્પ્રુ
-
-મ્પ્રે
-
-મ્પ્લ
-
-મ્પ્લે
-
-મ્પ્સ
-
-	મ્ફ
-
-મ્ફે
-
-મ્ફ્ર
-
-	મ્બ
-
-મ્બં
-
-મ્બુ
-
-મ્બૂ
-
-મ્બે
-
-મ્બ્યુ
-
-મ્બ્ર
-
-મ્બ્રે
-
-મ્બ્લ
-
-મ્બ્શ
-
-મ્બ્સ
-
-	મ્ભ
-
-મ્ભુ
-
-મ્ભે
-
-	મ્મ
-
-મ્મુ
-
-મ્મૂ
-
-મ્મે
-
-	મ્ય
-
-મ્યુ
-
-મ્યું
-
-મ્યૂ
-
-મ્યે
-
-	મ્ર
-
-મ્રુ
-
-મ્રૂ
-
-મ્રે
-
-	મ્લ
-
-મ્લે
-
-	મ્વ
-
-	મ્શ
-
-	મ્સ
-
-મ્સે
-
-મ્સ્ક
-
-મ્સ્ટ
-
-	મ્હ
-
-મ્હે
-
-મ્હેં
-
-ય
-
-યં
-
-ય઼
-
-યુ
-
-	યું
-
-	યુે
-
-યૂ
-
-	યૂં
-
-યૅ
-
-યે
-
-	યેં
-
-	યેુ
-
-	યેે
-
-યૈ
-
-ય્
-
-ય્છે
-
-	ય્ઝ
-
-	ય્ત
-
-	ય્ય
-
-ય્રે
-
-	ય્સ
-
-ર
-
-રઁ
-
-રં
-
-રા
-
-રિ
-
-	રિે
-
-રી
-
-	રીુ
-
-	રીે
-
-	રીૢ
-
-રુ
-
-	રું
-
-રૂ
-
-	રૂં
-
-	રૂુ
-
-	રૂે
-
-રૃ
-
-રૅ
-
-રે
-
-	રેં
-
-	રેે
-
-રેેે
-
-રૈ
-
-ર્
-
-	ર્ં
-
-	ર્આ
-
-	ર્એ
-
-	ર્ક
-
-ર્કં
-
-ર્કા
-
-ર્કી
-
-ર્કીં
-
-ર્કુ
-
-ર્કે
-
-ર્કો
-
-ર્કોં
-
-ર્ક્ટ
-
-ર્ક્ડ
-
-ર્ક્યુ
-
-ર્ક્શ
-
-ર્ક્ષી
-
-ર્ક્સ
-
-	ર્ખ
-
-ર્ખા
-
-ર્ખે
-
-	ર્ગ
-
-ર્ગં
-
-ર્ગા
-
-ર્ગાં
-
-ર્ગી
-
-ર્ગુ
-
-ર્ગે
-
-ર્ગો
-
-ર્ગોં
-
-ર્ગ્યુ
-
-	ર્ઘ
-
-ર્ઘા
-
-	ર્ચ
-
-ર્ચં
-
-ર્ચા
-
-ર્ચી
-
-ર્ચુ
-
-ર્ચે
-
-ર્ચો
-
-ર્ચ્છ
-
-ર્ચ્યા
-
-ર્ચ્યુ
-
-ર્ચ્યૂ
-
-	ર્છ
-
-ર્છા
-
-	ર્જ
-
-ર્જં
-
-ર્જ઼
-
-ર્જા
-
-ર્જી
-
-ર્જીં
-
-ર્જુ
-
-ર્જૂ
-
-ર્જે
-
-ર્જેં
-
-ર્જો
-
-ર્જ્ડ
-
-ર્જ્ય
-
-ર્જ્યું
-
-ર્જ્યો
-
-	ર્ઝ
-
-ર્ઝા
-
-ર્ઝી
-
-ર્ઝે
-
-ર્ઝો
-
-	ર્ટ
-
-ર્ટં
-
-ર્ટા
-
-ર્ટી
-
-ર્ટીં
-
-ર્ટુ
-
-ર્ટૂ
-
-ર્ટે
-
-ર્ટો
-
-ર્ટ્ઝ
-
-ર્ટ્યુ
-
-ર્ટ્રા
-
-ર્ટ્રે
-
-ર્ટ્સ
-
-ર્ટ્સે
-
-	ર્ડ
-
-ર્ડં
-
-ર્ડા
-
-ર્ડી
-
-ર્ડીં
-
-ર્ડુ
-
-ર્ડે
-
-ર્ડો
-
-ર્ડ્ઝ
-
-ર્ડ્ઝે
-
-ર્ડ્સ
-
-ર્ડ્સે
-
-	ર્ણ
-
-ર્ણં
-
-ર્ણા
-
-ર્ણાં
-
-ર્ણી
-
-ર્ણુ
-
-ર્ણું
-
-ર્ણે
-
-ર્ણો
-
-	ર્ત
-
-ર્તં
-
-ર્તા
-
-ર્તા્સ
-
-ર્તિે
-
-ર્તી
-
-ર્તુ
-
-ર્તું
-
-ર્તૃ
-
-ર્તે
-
-ર્તેં
-
-ર્તો
-
-ર્ત્ત
-
-ર્ત્ય
-
-ર્ત્યા
-
-ર્ત્યે
-
-	ર્થ
-
-ર્થં
-
-ર્થા
-
-ર્થાં
-
-ર્થી
-
-ર્થુ
-
-ર્થે
-
-ર્થો
-
-ર્થોં
-
-ર્થ્ય
-
-ર્થ્રો
-
-	ર્દ
-
-ર્દં
-
-ર્દા
-
-ર્દી
-
-ર્દુ
-
-ર્દું
-
-ર્દૂ
-
-ર્દે
-
-ર્દો
-
-ર્દોં
-
-ર્દ્ધ
-
-ર્દ્ર
-
-ર્દ્રા
-
-ર્દ્વા
-
-	ર્ધ
-
-ર્ધા
-
-ર્ધાં
-
-ર્ધી
-
-ર્ધું
-
-ર્ધે
-
-ર્ધો
-
-ર્ધ્ય
-
-ર્ધ્યા
-
-ર્ધ્વ
-
-	ર્ન
-
-ર્નં
-
-ર્ના
-
-ર્નિ
-
-ર્ની
-
-ર્નીં
-
-ર્નુ
-
-ર્નું
-
-ર્નૂ
-
-ર્ને
-
-ર્નેં
-
-ર્નો
-
-ર્ન્ડ
-
-ર્ન્મે
-
-ર્ન્સ
-
-ર્ન્સ્ટ
-
-	ર્પ
-
-ર્પા
-
-ર્પી
-
-ર્પુ
-
-ર્પૂ
-
-ર્પે
-
-ર્પેા
-
-ર્પો
-
-ર્પ્ર
-
-ર્પ્સ
-
-	ર્ફ
-
-ર્ફં
-
-ર્ફા
-
-ર્ફી
-
-ર્ફીં
-
-ર્ફે
-
-ર્ફો
-
-ર્ફ્યુ
-
-	ર્બ
-
-ર્બં
-
-ર્બા
-
-ર્બી
-
-ર્બુ
-
-ર્બે
-
-ર્બો
-
-ર્બ્યુ
-
-ર્બ્સ
-
-ર્બ્સે
-
-	ર્ભ
-
-ર્ભા
-
-ર્ભી
-
-ર્ભીં
-
-ર્ભુ
-
-ર્ભૂ
-
-ર્ભે
-
-ર્ભો
-
-ર્ભ્રા
-
-	ર્મ
-
-ર્મં
-
-ર્મા
-
-ર્માં
-
-ર્મી
-
-ર્મીં
-
-ર્મુ
-
-ર્મૂ
-
-ર્મે
-
-ર્મેં
-
-ર્મો
-
-ર્મોં
-
-ર્મ્ડ
-
-ર્મ્યા
-
-ર્મ્યુ
-
-ર્મ્યૂ
-
-ર્મ્સ
-
-	ર્ય
-
-ર્યં
-
-ર્યા
-
-ર્યાં
-
-ર્યાે
-
-ર્યુ
-
-ર્યું
-
-ર્યુંં
-
-ર્યે
-
-ર્યો
-
-ર્યોં
-
-	ર્ર
-
-ર્રા
-
-ર્રી
-
-ર્રુ
-
-ર્રે
-
-ર્રેં
-
-ર્રો
-
-	ર્લ
-
-ર્લં
-
-ર્લા
-
-ર્લી
-
-ર્લીં
-
-ર્લૅ
-
-ર્લે
-
-ર્લેં
-
-ર્લો
-
-ર્લ્ટ
-
-ર્લ્ડ
-
-ર્લ્ડે
-
-ર્લ્ડ્સ
-
-ર્લ્સ
-
-ર્લ્સે
-
-	ર્વ
-
-ર્વં
-
-ર્વા
-
-ર્વાં
-
-ર્વી
-
-ર્વે
-
-ર્વૈ
-
-ર્વો
-
-ર્વ્ય
-
-ર્વ્યા
-
-ર્વ્યુ
-
-ર્વ્યૂ
-
-	ર્શ
-
-ર્શા
-
-ર્શી
-
-ર્શે
-
-ર્શો
-
-ર્શોં
-
-ર્શ્વ
-
-	ર્ષ
-
-ર્ષં
-
-ર્ષા
-
-ર્ષાં
-
-ર્ષી
-
-ર્ષે
-
-ર્ષો
-
-ર્ષોં
-
-ર્ષ્યા
-
-ર્ષ્હ
-
-	ર્સ
-
-ર્સં
-
-ર્સા
-
-ર્સી
-
-ર્સીં
-
-ર્સુ
-
-ર્સે
-
-ર્સો
-
-ર્સ્
-
-ર્સ્ક
-
-ર્સ્ટ
-
-ર્સ્ટી
-
-ર્સ્ટે
-
-ર્સ્ડ
-
-ર્સ્થા
-
-ર્સ્પ
-
-ર્સ્વ
-
-	ર્હ
-
-ર્હા
-
-ર્હી
-
-ર્હુ
-
-ર્હે
-
-ર્હો
-
-	ર્ે
-
-રૢ
-
-લ
-
-લઁ
-
-લં
-
-લા
-
-લિ
-
-	લિે
-
-લુ
-
-	લું
-
-લૂ
-
-	લૂં
-
-લૅ
-
-	લૅં
-
-લે
-
-	લેં
-
-	લેિ
-
-	લેે
-
-લેેે
-
-લૈ
-
-	લૈં
-
-	લોૢ
-
-લ્
-
-	લ્ક
-
-લ્કુ
-
-લ્કે
-
-લ્ક્ય
-
-લ્ક્યુ
-
-લ્ક્લ
-
-લ્ક્સ
-
-	લ્ખ
-
-	લ્ગ
-
-લ્ગુ
-
-લ્ગે
-
-	લ્ચ
-
-	લ્છ
-
-	લ્જ
-
-લ્જી
-
-લ્જે
-
-	લ્ઝ
-
-લ્ઝે
-
-	લ્ટ
-
-લ્ટં
-
-લ્ટુ
-
-લ્ટું
-
-લ્ટે
-
-લ્ટ્ઝ
-
-લ્ટ્ર
-
-લ્ટ્રે
-
-લ્ટ્સ
-
-	લ્ડ
-
-લ્ડં
-
-લ્ડે
-
-લ્ડ્ર
-
-લ્ડ્રે
-
-લ્ડ્સ
-
-	લ્ત
-
-લ્તુ
-
-લ્તે
-
-	લ્થ
-
-લ્થે
-
-	લ્દ
-
-લ્દે
-
-	લ્ધ
-
-	લ્ન
-
-લ્ને
-
-	લ્પ
-
-લ્પે
-
-લ્પ્ય
-
-લ્પ્સ
-
-	લ્ફ
-
-લ્ફે
-
-લ્ફ્યુ
-
-લ્ફ્ર
-
-લ્ફ્રે
-
-	લ્બ
-
-લ્બુ
-
-લ્બે
-
-લ્બ્સ
-
-	લ્ભ
-
-	લ્મ
-
-લ્મુ
-
-લ્મે
-
-લ્મેં
-
-લ્મ્સ
-
-	લ્ય
-
-લ્યુ
-
-લ્યું
-
-લ્યૂ
-
-લ્યે
-
-	લ્ર
-
-લ્ર્સ
-
-	લ્લ
-
-લ્લં
-
-લ્લુ
-
-લ્લું
-
-લ્લૂ
-
-લ્લે
-
-લ્લેં
-
-લ્લ્લ
-
-	લ્વ
-
-લ્વે
-
-	લ્શ
-
-લ્શે
-
-લ્શ્ય
-
-	લ્સ
-
-લ્સં
-
-લ્સે
-
-લ્સ્ક
-
-લ્સ્ટ
-
-	લ્હ
-
-લ્હુ
-
-લ્હે
-
-લૢ
-
-ળ
-
-ળં
-
-ળિ
-
-	ળિે
-
-ળુ
-
-	ળું
-
-ળૂ
-
-ળૅ
-
-ળે
-
-	ળેં
-
-	ળેે
-
-ળ્
-
-	ળ્ય
-
-ળ્યુ
-
-ળ્યું
-
-ળ્યે
-
-	ળ્વ
-
-વ
-
-વં
-
-વા
-
-	વાે
-
-વિ
-
-	વિે
-
-વુ
-
-	વું
-
-વૂ
-
-વૃ
-
-	વૃં
-
-વૅ
-
-વે
-
-	વેં
-
-	વેઃ
-
-	વેે
-
-વૈ
-
-	વૈં
-
-વ્
-
-	વ્ક
-
-વ્ચે
-
-	વ્ઝ
-
-	વ્ડ
-
-	વ્ત
-
-	વ્થ
-
-વ્ધુ
-
-	વ્ન
-
-	વ્પ
-
-	વ્ય
-
-વ્યં
-
-વ્યુ
-
-વ્યું
-
-વ્યુંં
-
-વ્યૂ
-
-વ્યે
-
-	વ્ર
-
-વ્રુ
-
-વ્રૂ
-
-વ્રૂં
-
-વ્રે
-
-વ્ર્ય
-
-	વ્લ
-
-	વ્વ
-
-વ્વુ
-
-વ્વે
-
-	વ્શ
-
-	વ્સ
-
-વ્સે
-
-વ્સ્ક
-
-	વ્હ
-
-વ્હે
-
-શ
-
-શં
-
-શા
-
-શિ
-
-	શિે
-
-શિ્ચ
-
-શિ્મ
-
-શિ્ર
-
-શુ
-
-	શું
-
-શૂ
-
-	શૂં
-
-શૃ
-
-	શૃં
-
-શૅ
-
-શે
-
-	શેં
-
-	શેે
-
-શૈ
-
-શ્
-
-	શ્ક
-
-શ્કુ
-
-શ્કે
-
-	શ્ચ
-
-શ્ચં
-
-શ્ચે
-
-	શ્છ
-
-	શ્ટ
-
-	શ્ડ
-
-શ્ણુ
-
-	શ્ત
-
-શ્તુ
-
-શ્તે
-
-શ્ત્ર
-
-	શ્થ
-
-	શ્દ
-
-	શ્ન
-
-શ્ને
-
-	શ્પ
-
-	શ્ફ
-
-	શ્બ
-
-શ્બુ
-
-શ્બે
-
-શ્બ્દ
-
-	શ્ભ
-
-	શ્મ
-
-શ્મે
-
-	શ્ય
-
-શ્યુ
-
-શ્યું
-
-શ્યૂ
-
-શ્યે
-
-	શ્ર
-
-શ્રં
-
-શ્રિઃઃઃ
-
-શ્રુ
-
-શ્રું
-
-શ્રૂ
-
-શ્રૃ
-
-શ્રૃં
-
-શ્રે
-
-શ્ર્
-
-શ્ર્ચ
-
-શ્ર્ન
-
-શ્ર્ય
-
-શ્ર્લ
-
-શ્ર્લે
-
-શ્ર્વ
-
-શ્ર્વે
-
-	શ્લ
-
-શ્લે
-
-શ્લેં
-
-	શ્વ
-
-શ્વં
-
-શ્વે
-
-શ્વ્ન
-
-શ્વ્લ
-
-શ્વ્લે
-
-શ્વ્વ
-
-શ્શૂ
-
-ષ
-
-ષઁ
-
-ષં
-
-ષુ
-
-ષૂ
-
-ષૅ
-
-ષે
-
-	ષેં
-
-	ષેે
-
-ષ્
-
-	ષ્ક
-
-ષ્કં
-
-ષ્કુ
-
-ષ્કૃ
-
-ષ્ક્ર
-
-	ષ્ચ
-
-	ષ્ટ
-
-ષ્ટુ
-
-ષ્ટે
-
-ષ્ટ્ય
-
-ષ્ટ્ર
-
-ષ્ટ્રે
- 
-ષ્ટ્ર્ધ્વ
-
-	ષ્ઠ
-
-ષ્ઠુ
-
-ષ્ઠે
-
-	ષ્ડ
-
-	ષ્ણ
-
-ષ્ણં
-
-ષ્ણુ
-
-ષ્ણું
-
-ષ્ણુે
-
-ષ્ણે
-
-	ષ્ત
-
-ષ્ત્ર
-
-	ષ્ન
-
-ષ્નુ
-
-	ષ્પ
-
-ષ્પે
-
-ષ્પ્ર
-
-	ષ્ફ
-
-	ષ્ભ
-
-	ષ્મ
-
-ષ્મે
-
-	ષ્ય
-
-ષ્યં
-
-ષ્યે
-
-	ષ્ર
-
-ષ્ર્ય
-
-ષ્લે
-
-	ષ્વ
-
-	ષ્હ
-
-સ
-
-સઁ
-
-સં
-
-	સંે
-
-સ઼
-
-સિ
-
-	સિે
-
-સિ્જ
-
-	સીે
-
-સુ
-
-	સું
-
-સૂ
-
-	સૂં
-
-સૃ
-
-સૅ
-
-સે
-
-	સેં
-
-	સેે
-
-સૈ
-
-	સૈં
-
-સ્
-
-	સ્ક
-
-સ્કં
-
-સ્કુ
-
-સ્કૂ
-
-સ્કૃ
-
-સ્કે
-
-સ્ક્ય
-
-સ્ક્યુ
-
-સ્ક્ર
-
-સ્ક્રુ
-
-સ્ક્રૂ
-
-સ્ક્રૃ
-
-સ્ક્રે
-
-સ્ક્લ
-
-સ્ક્લે
-
-સ્ક્વ
-
-સ્ક્વૅ
-
-સ્ક્વે
-
-	સ્ખ
-
-સ્ખે
-
-સ્ખેં
-
-	સ્ગ
-
-સ્ગે
-
-	સ્ચ
-
-સ્ચે
-
-સ્ચ્યુ
-
-	સ્છ
-
-	સ્જ
-
-સ્જી
-
-	સ્ઝ
-
-	સ્ટ
-
-સ્ટં
-
-સ્ટુ
-
-સ્ટૂ
-
-સ્ટૅ
-
-સ્ટે
-
-સ્ટેં
-
-સ્ટૈ
-
-સ્ટ્
-
-સ્ટ્યુ
-
-સ્ટ્ર
-
-સ્ટ્રં
-
-સ્ટ્રુ
-
-સ્ટ્રૅ
-
-સ્ટ્રે
-
-સ્ટ્સ
-
-સ્ટ્સે
-
-	સ્ડ
-
-સ્ડે
-
-	સ્ણ
-
-સ્ણુ
-
-	સ્ત
-
-સ્તં
-
-સ્તિ
-
-સ્તુ
-
-સ્તું
-
-સ્તૂ
-
-સ્તૃ
-
-સ્તે
-
-સ્તેં
-
-સ્તેે
-
-સ્ત્ય
-
-સ્ત્ર
-
-સ્ત્રીે
-
-સ્ત્રે
-
-સ્ત્વ
-
-	સ્થ
-
-સ્થં
-
-સ્થુ
-
-સ્થૂ
-
-સ્થે
-
-સ્થેે
-
-સ્થ્ય
-
-	સ્દ
-
-	સ્ન
-
-સ્નુ
-
-સ્નૂ
-
-સ્ને
-
-	સ્પ
-
-સ્પં
-
-સ્પુ
-
-સ્પૂ
-
-સ્પૃ
-
-સ્પૅ
-
-સ્પે
-
-સ્પેં
-
-સ્પૈ
-
-સ્પ્ત
-
-સ્પ્ર
-
-સ્પ્રં
-
-સ્પ્રે
-
-સ્પ્લ
-
-સ્પ્લે
-
-	સ્ફ
-
-સ્ફુ
-
-સ્ફૂ
-
-સ્ફે
-
-	સ્બ
-
-સ્બે
-
-સ્બ્ર
-
-	સ્ભ
-
-	સ્મ
-
-સ્મુ
-
-સ્મૂ
-
-સ્મૃ
-
-સ્મે
-
-સ્મેં
-
-સ્મૈ
-
-સ્મ્છ
-
-સ્મ્રુ
-
-	સ્ય
-
-સ્યં
-
-સ્યુ
-
-સ્યું
-
-સ્યૂ
-
-સ્યે
-
-	સ્ર
-
-સ્રે
-
-સ્ર્ટ
-
-	સ્લ
-
-સ્લં
-
-સ્લુ
-
-સ્લૅ
-
-સ્લે
-
-	સ્વ
-
-સ્વં
-
-સ્વઃ
-
-સ્વઃઃ
-
-સ્વઃઃઃ
-
-સ્વઃઃઃઃ
-
-સ્વઃઃઃઃઃ
- 
-સ્વઃઃઃઃઃઃ
-&
-!સ્વઃઃઃઃઃઃઃઃ
-)
-$સ્વઃઃઃઃઃઃઃઃઃ
-
-સ્વૂ
-
-સ્વે
-
-સ્વૈ
-
-	સ્સ
-
-સ્સુ
-
-સ્સું
-
-સ્સૂ
-
-સ્સે
-
-	સ્હ
-
-સ્હે
-
-સૢ
-
-હ
-
-હઁ
-
-હં
-
-હિ
-
-	હિુ
-
-	હિે
-
-હિ્બ
-
-હિ્લ
-
-	હીં
-
-હુ
-
-	હુઁ
-
-	હું
-
-	હુે
-
-હૂ
-
-	હૂઁ
-
-	હૂં
-
-હૃ
-
-હૅ
-
-હે
-
-	હેં
-
-	હેુ
-
-	હેે
-
-હૈ
-
-	હૈં
-
-	હૈે
-
-હ્
-
-	હ્ક
-
-	હ્છ
-
-હ્જે
-
-	હ્ડ
-
-	હ્ત
-
-હ્તે
-
-હ્ત્વ
-
-	હ્દ
-
-	હ્ન
-
-હ્ને
-
-	હ્બ
-
-	હ્ભ
-
-	હ્મ
-
-હ્મં
-
-હ્મે
-
-હ્મ્ણુ
-
-	હ્ય
-
-હ્યં
-
-હ્યુ
-
-હ્યું
-
-હ્યુંં
-
-હ્યૂ
-
-હ્યે
-
-	હ્ર
-
-હ્રૂં
-
-હ્રે
-
-	હ્લ
-
-હ્લે
-
-	હ્વ
-
-હ્વૃ
-
-	હ્સ
-
-ઽ
-
-ા
-
-ાઁ
-
-ાં
-
-િ
-
-િઃ
-
-	િઃઃ
-
-િઃઃઃ
-
-િઃઃઃઃ
-
-િઃઃઃઃઃ
-
-િઃઃઃઃઃઃ
- 
-િઃઃઃઃઃઃઃઃ
-#
-િઃઃઃઃઃઃઃઃઃ
-&
-!િઃઃઃઃઃઃઃઃઃઃ
-)
-$િઃઃઃઃઃઃઃઃઃઃઃ
-,
-'િઃઃઃઃઃઃઃઃઃઃઃઃ
-/
-*િઃઃઃઃઃઃઃઃઃઃઃઃઃ
-2
--િઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-5
-0િઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-8
-3િઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-;
-6િઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃઃ
-
-િિ
-
-	િિિ
-
-િિિિ
-
-ી
-
-ીઁ
-
-ીં
-
-ુ
-
-ૂ
-
-ે
-
-ૉ
-
-ૉં
-
-ો
-
-ોઁ
-
-ોં
-
-ૌ
-
-ૌં
-
-્
-
-ૐ
-
-ૠ
-
-૦
-
-૦ા
-
-૦ૢ
-
-૧
-
-૧ા
-
-૧ુ
-
-	૧ું
-
-૨
-
-૨ં
-
-૨ા
-
-૨ે
-
-૩
-
-૩ઃ
-
-	૩ઃઃ
-
-૩ઃઃઃ
-
-૩ઃઃઃઃ
-
-૩ા
-
-૪
-
-૪ં
-
-૪ા
-
-૫
-
-૫ં
-
-૫ુ
-
-૫ૂ
-
-૫ે
-
-૬
-
-૭
-
-૮
-
-૮ા
-
-૯
-
-૯ે
-
-૰
-
-་
-
-།
-
-៰
-
-ᵒ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ṁ
-
-ṁ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-‍
-
-‐
-
-‑
-
-‒
-
-–
-
-–ઃ
-
-	–ઃઃ
-
-–ઃઃઃ
-
-–ઃઃઃઃ
-
-–ઃઃઃઃઃ
-
-–ે
-
-—
-
-—ુ
-
-―
-
-‘
-
-’
-
-‚
-
-“
-
-“ઃ
-
-	“ઃઃ
-
-“ઃઃઃ
-
-“ઃઃઃઃ
-
-“ઃઃઃઃઃ
-
-“ઃઃઃઃઃઃ
-#
-“ઃઃઃઃઃઃઃઃઃ
-
-”
-
-„
-
-†
-
-‡
-
-•
-
-‣
-
-…
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-⁄
-
-⁰
-
-⁹
-
-₁
-
-₂
-
-₤
-
-₨
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-№
-
-℗
-
-™
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↳
-
-⇒
-
-⇓
-
-−
-
-∙
-
-√
-
-∞
-
-≈
-
-≠
-
-≤
-
-≥
-
-≫
-
-⋅
-
-⋆
-
-⌁
-
-⏭
-
-Ⓒ
-
-Ⓡ
-
-─
-
-│
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▾
-
-◄
-
-◆
-
-◇
-
-◊
-
-○
-
-●
-
-☀
-
-★
-
-☆
-
-☎
-
-☐
-
-☛
-
-☞
-
-☹
-
-☺
-
-♂
-
-♠
-
-♡
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-♭
-
-⚫
-
-✅
-
-✈
-
-✓
-
-✔
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➖
-
-➜
-
-➡
-
-➤
-
-⟨
-
-⟩
-
-⟫
-
-⠀
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-》
-
-【
-
-】
-
-・
-
-ꞌ
-
-ﬁ
-
-，
-
-：
-
-￡
-
-￥
-
-�
\ No newline at end of file
@@ -1,16486 +0,0 @@
-
-
- 
-
-!
-
-"
-
-#
-
-$
-
-%
-
-&
-
-'
-
-(
-
-)	
-
-*
-
-
-+
-
-,
-
--
-
-.
-
-/
-
-0
-
-1
-
-2
-
-3
-
-4
-
-5
-
-6
-
-7
-
-8
-
-9
-
-:
-
-;
-
-<
-
-=
-
->
-
-?
-
-@ 
-
-A!
-
-B"
-
-C#
-
-D$
-
-E%
-
-E̟&
-
-F'
-
-G(
-
-H)
-
-I*
-
-J+
-
-K,
-
-L-
-
-M.
-
-N/
-
-O0
-
-O̟1
-
-P2
-
-Q3
-
-R4
-
-S5
-
-T6
-
-U7
-
-V8
-
-W9
-
-X:
-
-Y;
-
-Z<
-
-[=
-
-\>
-
-\\?
-
-]@
-
-^A
-
-_B
-
-`C
-
-aD
-
-àE
-
-áF
-
-ãG
-
-ảH
-
-ạI
-
-a̸J
-
-bK
-
-cL
-
-c̈M
-
-dN
-
-ḍO
-
-eP
-
-èQ
-
-éR
-
-ẽS
-
-e̟T
-
-ẹU
-
-e̱V
-
-fW
-
-gX
-
-hY
-
-ḥZ
-
-i[
-
-ì\
-
-í]
-
-ĩ^
-
-i̟_
-
-ị`
-
-ja
-
-kb
-
-lc
-
-md
-
-m̃e
-
-nf
-
-ǹg
-
-oh
-
-òi
-
-ój
-
-ỏk
-
-o̟l
-
-ọm
-
-pn
-
-p̃o
-
-qp
-
-rq
-
-ṛr
-
-ss
-
-s̟t
-
-ṣu
-
-tv
-
-t̃w
-
-ṭx
-
-uy
-
-ùz
-
-ú{
-
-ũ|
-
-ủ}
-
-u̟~
-
-ụ
-
-u̸
-
-v
-
-v̄
-
-v̈
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-	
- ̃
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-­
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-	
-ầ
-	
-ấ
-	
-ậ
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-	
-ề
-	
-ế
-	
-ễ
-	
-ể
-	
-ệ
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-	
-ồ
-	
-ố
-	
-ỗ
-	
-ổ
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-	
-ắ
-	
-ặ
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ŗ
-
-ŗ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɣ
-
-Ɩ
-
-Ơ
-
-ơ
-	
-ờ
-	
-ớ
-	
-ợ
-
-ƭ
-
-Ư
-
-ư
-	
-ừ
-	
-ứ
-	
-ữ
-	
-ử
-	
-ự
-
-ƴ
-
-ǎ
-
-ǐ
-
-ǒ
-
-ǔ
-
-ǖ
-
-ǘ
-
-ǚ
-
-ǜ
-
-ǝ
-
-Ǧ
-
-ǧ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-ȳ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̀
-	
-ɔ́
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-	
-ə́
-
-ɛ
-	
-ɛ̀
-	
-ɛ̃
-	
-ɛ̈
-
-ɣ
-
-ɧ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʒ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˙
-
-˚
-
-˜
-
-˝
-
-Α
-
-Β
-
-Γ
-
-Δ
-
-Ε
-
-Ζ
-
-Η
-
-Θ
-
-Ι
-
-Κ
-
-Λ
-
-Μ
-
-Ν
-
-Ξ
-
-Ο
-
-Π
-
-Ρ
-
-Σ
-
-Τ
-
-Υ
-
-Φ
-
-Χ
-
-Ψ
-
-Ω
-
-ά
-
-έ
-
-ί
-
-α
-
-β
-
-γ
-
-δ
-
-ε
-
-ζ
-
-η
-
-θ
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ξ
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-φ
-
-χ
-
-ψ
-
-ω
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-،
-
-؛
-
-؟
-
-।
-
-॥
-
-०
-
-০
-
-᛬
-
-៰
-
-ᵒ
-
-Ḍ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ḽ
-
-Ṁ
-
-ṁ
-
-ṅ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ṱ
-
-ẓ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-Ỵ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-​
-
-‍
-
-‎
-
-‐
-
-‑
-
-‒
-
-–
-
-—
-
-―
-
-‖
-
-‘
-
-’
-
-‚
-
-“
-
-”
-
-„
-
-†
-
-‡
-
-•
-
-‣
-
-․
-
-…
-
-‧
-
-‪
-
-‬
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-※
-
-‿
-
-⁄
-
-⁡
-
-⁰
-
-⁴
-
-⁵
-
-⁹
-
-₁
-
-₂
-
-₃
-
-₄
-
-₤
-
-₦
-
-₧
-
-₩
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-℉
-
-ℓ
-
-№
-
-℗
-
-℡
-
-™
-
-⅓
-
-⅔
-
-⅛
-
-⅜
-
-⅝
-
-⅞
-
-Ⅰ
-
-Ⅱ
-
-Ⅲ
-
-Ⅳ
-
-Ⅴ
-
-Ⅵ
-
-Ⅶ
-
-Ⅷ
-
-Ⅸ
-
-Ⅹ
-
-Ⅺ
-
-Ⅻ
-
-ⅰ
-
-ⅱ
-
-ⅲ
-
-ⅳ
-
-ⅴ
-
-ⅵ
-
-ⅶ
-
-ⅷ
-
-ⅸ
-
-ⅹ
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↗
-
-↘
-
-↦
-
-↳
-
-↺
-
-⇌
-
-⇐
-
-⇒
-
-⇓
-
-⇔
-
-∀
-
-∂
-
-∃
-
-∅
-
-∆
-
-∇
-
-∈
-
-∉
-
-∏
-
-∑
-
-−
-
-∘
-
-∙
-
-√
-
-∝
-
-∞
-
-∠
-
-∣
-
-∧
-
-∨
-
-∩
-
-∪
-
-∫
-
-∴
-
-∼
-
-≈
-
-≠
-
-≡
-
-≤
-
-≥
-
-≦
-
-≧
-
-≪
-
-≫
-
-⊂
-
-⊃
-
-⊆
-
-⊇
-
-⊕
-
-⊙
-
-⊞
-
-⊥
-
-⋅
-
-⋆
-
-⋯
-
-⌁
-
-⌒
-
-⏭
-
-⑆
-
-⑇
-
-⑈
-
-⑉
-
-①
-
-②
-
-③
-
-④
-
-⑤
-
-⑥
-
-⑦
-
-⑧
-
-⑨
-
-⑩
-
-⑪
-
-⑫
-
-⑬
-
-⑭
-
-⑮
-
-⑯
-
-⑰
-
-⑱
-
-⑲
-
-⑳
-
-⑴
-
-⑵
-
-⑶
-
-⑷
-
-⑸
-
-⑹
-
-⑺
-
-⑻
-
-⑼
-
-⑽
-
-⑾
-
-⑿
-
-⒀
-
-⒁
-
-⒂
-
-⒃
-
-⒄
-
-⒅
-
-⒆
-
-⒇
-
-⒈
-
-⒉
-
-⒊
-
-⒋
-
-⒌
-
-⒍
-
-⒎
-
-⒏
-
-⒐
-
-⒑
-
-⒒
-
-⒓
-
-⒔
-
-⒕
-
-⒖
-
-⒗
-
-⒘
-
-⒙
-
-⒚
-
-⒛
-
-⒜
-
-⒝
-
-⒞
-
-⒟
-
-⒠
-
-⒡
-
-⒢
-
-⒣
-
-⒤
-
-⒥
-
-⒦
-
-⒧
-
-⒨
-
-⒩
-
-⒪
-
-⒫
-
-⒬
-
-⒭
-
-⒮
-
-⒯
-
-⒰
-
-⒱
-
-⒲
-
-⒳
-
-⒴
-
-⒵
-
-Ⓐ
-
-Ⓑ
-
-Ⓒ
-
-Ⓡ
-
-ⓐ
-
-ⓑ
-
-ⓒ
-
-ⓓ
-
-ⓔ
-
-ⓕ
-
-ⓖ
-
-ⓗ
-
-ⓘ
-
-ⓙ
-
-ⓚ
-
-ⓛ
-
-ⓜ
-
-ⓝ
-
-ⓞ
-
-ⓟ
-
-ⓠ
-
-ⓡ
-
-ⓢ
-
-ⓣ
-
-ⓤ
-
-ⓥ
-
-ⓦ
-
-ⓧ
-
-ⓨ
-
-ⓩ
-
-─
-
-━
-
-│
-
-┃
-
-┇
-
-┈
-
-┉
-
-┊
-
-┌
-
-└
-
-┗
-
-├
-
-┣
-
-┤
-
-┬
-
-┴
-
-╂
-
-═
-
-╭
-
-╮
-
-╯
-
-╰
-
-╱
-
-▂
-
-█
-
-▉
-
-░
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-△
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▽
-
-▾
-
-◄
-
-◆
-
-◇
-
-◉
-
-◊
-
-○
-
-◎
-
-●
-
-◕
-
-◢
-
-◤
-
-◦
-
-☀
-
-★
-
-☆
-
-☉
-
-☎
-
-☏
-
-☐
-
-☑
-
-☒
-
-☛
-
-☜
-
-☞
-
-☢
-
-☸
-
-☹
-
-☺
-
-♀
-
-♂
-
-♠
-
-♡
-
-♢
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-♭
-
-♯
-
-⚫
-
-⛤
-
-✅
-
-✈
-
-✉
-
-✍
-
-✎
-
-✓
-
-✔
-
-✗
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✱
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➔
-
-➖
-
-➜
-
-➝
-
-➡
-
-➤
-
-⟨
-
-⟩
-
-⟫
-
-⠀
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-〃
-
-々
-
-〇
-
-〈
-
-〉
-
-《
-
-》
-
-「
-
-」
-
-『
-
-』
-
-【
-
-】
-
-〒
-
-〓
-
-〔
-
-〕
-
-〖
-
-〗
-
-〜
-
-〝
-
-〞
-
-〟
-
-ぁ
-
-あ
-
-ぃ
-
-い
-
-ぅ
-
-う
-
-ぇ
-
-え
-
-ぉ
-
-お
-
-か
-
-が
-
-き
-
-ぎ
-
-く
-
-ぐ
-
-け
-
-げ
-
-こ
-
-ご
-
-さ
-
-ざ
-
-し
-
-じ
-
-す
-
-ず
-
-せ
-
-ぜ
-
-そ
-
-ぞ
-
-た
-
-だ
-
-ち
-
-ぢ
-
-っ
-
-つ
-
-づ
-
-て
-
-で
-
-と
-
-ど
-
-な
-
-に
-
-ぬ
-
-ね
-
-の
-
-は
-
-ば
-
-ぱ
-
-ひ
-
-び
-
-ぴ
-
-ふ
-
-ぶ
-
-ぷ
-
-へ
-
-べ
-
-ぺ
-
-ほ
-
-ぼ
-
-ぽ
-
-ま
-
-み
-
-む
-
-め
-
-も
-
-ゃ
-
-や
-
-ゅ
-
-ゆ
-
-ょ
-
-よ
-
-ら
-
-り
-
-る
-
-れ
-
-ろ
-
-ゎ
-
-わ
-
-ゐ	
-
-ゑ	
-
-を	
-
-ん	
-
-゛	
-
-゜	
-
-ゝ	
-
-ゞ	
-
-ァ	
-
-ア	
-
-ィ	
-
-イ	
-
-ゥ	
-
-ウ	
-
-ェ	
-
-エ	
-
-ォ	
-
-オ	
-
-カ	
-
-ガ	
-
-キ	
-
-ギ	
-
-ク	
-
-グ	
-
-ケ	
-
-ゲ	
-
-コ	
-
-ゴ	
-
-サ	
-
-ザ	
-
-シ	
-
-ジ	
-
-ス	
-
-ズ	
-
-セ	
-
-ゼ	
-
-ソ	
-
-ゾ	
-
-タ	
-
-ダ	
-
-チ	
-
-ヂ	
-
-ッ	
-
-ツ	
-
-ヅ	
-
-テ	
-
-デ	
-
-ト	
-
-ド	
-
-ナ	
-
-ニ	
-
-ヌ	
-
-ネ	
-
-ノ	
-
-ハ	
-
-バ	
-
-パ	
-
-ヒ	
-
-ビ	
-
-ピ	
-
-フ	
-
-ブ	
-
-プ	
-
-ヘ	
-
-ベ	
-
-ペ	
-
-ホ	
-
-ボ	
-
-ポ	
-
-マ	
-
-ミ	
-
-ム	
-
-メ	
-
-モ	
-
-ャ	
-
-ヤ	
-
-ュ	
-
-ユ	
-
-ョ	
-
-ヨ	
-
-ラ	
-
-リ	
-
-ル	
-
-レ	
-
-ロ	
-
-ヮ	
-
-ワ	
-
-ヰ	
-
-ヱ	
-
-ヲ	
-
-ン	
-
-ヴ	
-
-ヵ	
-
-ヶ	
-
-・	
-
-ー	
-
-ヽ	
-
-ヾ	
-
-ㄅ	
-
-ㄆ	
-
-ㄇ	
-
-ㄈ	
-
-ㄉ	
-
-ㄊ	
-
-ㄋ	
-
-ㄌ	
-
-ㄍ	
-
-ㄎ	
-
-ㄏ	
-
-ㄐ	
-
-ㄑ	
-
-ㄒ	
-
-ㄓ	
-
-ㄔ	
-
-ㄕ	
-
-ㄖ	
-
-ㄗ	
-
-ㄘ	
-
-ㄙ	
-
-ㄚ	
-
-ㄛ	
-
-ㄜ	
-
-ㄝ	
-
-ㄞ	
-
-ㄟ	
-
-ㄠ	
-
-ㄡ	
-
-ㄢ	
-
-ㄣ
-
-
-ㄤ
-
-
-ㄥ
-
-
-ㄦ
-
-
-ㄧ
-
-
-ㄨ
-
-
-ㄩ
-
-
-ㄷ
-
-
-ㅇ
-
-
-ㅋ
-
-
-ㅎ
-
-
-ㅜ
-
-
-ㅠ
-
-
-ㅡ
-
-
-ㅣ
-
-
-㈀
-
-
-㈁
-
-
-㈂
-
-
-㈃
-
-
-㈄
-
-
-㈅
-
-
-㈆
-
-
-㈇
-
-
-㈈
-
-
-㈉
-
-
-㈊
-
-
-㈋
-
-
-㈌
-
-
-㈍
-
-
-㈎
-
-
-㈏
-
-
-㈐
-
-
-㈑
-
-
-㈒
-
-
-㈓
-
-
-㈔
-
-
-㈕
-
-
-㈖
-
-
-㈗
-
-
-㈘
-
-
-㈙
-
-
-㈚
-
-
-㈛
-
-
-㈜
-
-
-㈠
-
-
-㈡
-
-
-㈢
-
-
-㈣
-
-
-㈤
-
-
-㈥
-
-
-㈦
-
-
-㈧
-
-
-㈨
-
-
-㈩
-
-
-㈱
-
-
-㈲
-
-
-㈹
-
-
-㉠
-
-
-㉡
-
-
-㉢
-
-
-㉣
-
-
-㉤
-
-
-㉥
-
-
-㉦
-
-
-㉧
-
-
-㉨
-
-
-㉩
-
-
-㉪
-
-
-㉫
-
-
-㉬
-
-
-㉭
-
-
-㉮
-
-
-㉯
-
-
-㉰
-
-
-㉱
-
-
-㉲
-
-
-㉳
-
-
-㉴
-
-
-㉵
-
-
-㉶
-
-
-㉷
-
-
-㉸
-
-
-㉹
-
-
-㉺
-
-
-㉻
-
-
-㊝
-
-
-㊠
-
-
-㊣
-
-
-㊤
-
-
-㊥
-
-
-㊦
-
-
-㊧
-
-
-㊨
-
-
-㊰
-
-
-㍗
-
-
-㍻
-
-
-㍼
-
-
-㍽
-
-
-㍾
-
-
-㎂
-
-
-㎃
-
-
-㎄
-
-
-㎍
-
-
-㎎
-
-
-㎏
-
-
-㎐
-
-
-㎑
-
-
-㎒
-
-
-㎓
-
-
-㎕
-
-
-㎖
-
-
-㎘
-
-
-㎛
-
-
-㎜
-
-
-㎝
-
-
-㎞
-
-
-㎡
-
-
-㎢
-
-
-㎥
-
-
-㎶
-
-
-㎷
-
-
-㎸
-
-
-㎾
-
-
-㎿
-
-
-㏀
-
-
-㏁
-
-
-㏂
-
-
-㏄
-
-
-㏇
-
-㏊
-
-㏍
-
-㏎
-
-㏕
-
-㏘
-
-㠊
-
-一
-
-丁
-
-七
-
-万
-
-丈
-
-三
-
-上
-
-下
-
-不
-
-与
-
-丐
-
-丑
-
-专
-
-且
-
-丕
-
-世
-
-丘
-
-丙
-
-业
-
-丛
-
-东
-
-丝
-
-丞
-
-丟
-
-両
-
-丢
-
-两
-
-严
-
-並
-
-丧
-
-丨
-
-个
-
-丫
-
-中
-
-丰
-
-串
-
-临
-
-丶
-
-丸
-
-丹
-
-为
-
-主
-
-丼
-
-丽
-
-举
-
-乂
-
-乃
-
-久
-
-么
-
-义
-
-之
-
-乌
-
-乍
-
-乎
-
-乏
-
-乐
-
-乒
-
-乓
-
-乔
-
-乖
-
-乗
-
-乘
-
-乙
-
-乜
-
-九
-
-乞
-
-也
-
-习
-
-乡
-
-乢
-
-乣
-
-书
-
-乨
-
-乩
-
-乮
-
-乯
-
-买
-
-乱
-
-乳
-
-乾
-
-亀
-
-亂
-
-了
-
-予
-
-争
-
-事
-
-二
-
-于
-
-亏
-
-云
-
-互
-
-五
-
-井
-
-亘
-
-亙
-
-亚
-
-些
-
-亜
-
-亞
-
-亟
-
-亡
-
-亢
-
-交
-
-亥
-
-亦
-
-产
-
-亨
-
-亩
-
-享
-
-京
-
-亭
-
-亮
-
-亲
-
-亳
-
-亵
-
-人
-
-亿
-
-什
-
-仁
-
-仅
-
-仆
-
-仇
-
-今
-
-介
-
-仍
-
-从
-
-仏
-
-仑
-
-仓
-
-仔
-
-仕
-
-他
-
-仗
-
-付
-
-仙
-
-仟
-
-代
-
-令
-
-以
-
-仨
-
-仪
-
-们
-
-仮
-
-仰
-
-仲
-
-件
-
-价
-
-任
-
-份
-
-仿
-
-企
-
-伃
-
-伊
-
-伍
-
-伎
-
-伏
-
-伐
-
-休
-
-众
-
-优
-
-伙
-
-会
-
-伝
-
-伞
-
-伟
-
-传
-
-伤
-
-伦
-
-伪
-
-伯
-
-估
-
-伱
-
-伴
-
-伶
-
-伸
-
-伺
-
-似
-
-伽
-
-佃
-
-但
-
-佇
-
-佈
-
-位
-
-低
-
-住
-
-佐
-
-佑
-
-体
-
-佔
-
-何
-
-佗
-
-余
-
-佚
-
-佛
-
-作
-
-佟
-
-你
-
-佢
-
-佣
-
-佩
-
-佬
-
-佰
-
-佳
-
-併
-
-佸
-
-佹
-
-佼
-
-佽
-
-使
-
-侃
-
-侄
-
-來
-
-侈
-
-例
-
-侍
-
-侏
-
-侖
-
-侗
-
-供
-
-依
-
-侠
-
-価
-
-侣
-
-侦
-
-侧
-
-侨
-
-侬
-
-侭
-
-侮
-
-侯
-
-侵
-
-侶
-
-侷
-
-便
-
-係
-
-促
-
-俄
-
-俊
-
-俎
-
-俏
-
-俐
-
-俑
-
-俗
-
-俘
-
-保
-
-俞
-
-俠
-
-信
-
-俣
-
-俨
-
-俩
-
-俪
-
-俭
-
-修
-
-俯
-
-俱
-
-俳
-
-俵
-
-俸
-
-俺
-
-俾
-
-倆
-
-倉
-
-個
-
-倌
-
-倍
-
-們
-
-倒
-
-倔
-
-倖
-
-倘
-
-候
-
-倚
-
-借
-
-倡
-
-倣
-
-値
-
-倦
-
-倩
-
-倪
-
-倫
-
-倭
-
-倶
-
-倹
-
-债
-
-值
-
-倾
-
-偃
-
-假
-
-偉
-
-偎
-
-偏
-
-偕
-
-做
-
-停
-
-健
-
-偲
-
-側
-
-偵
-
-偶
-
-偷
-
-偽
-
-偿
-
-傅
-
-傍
-
-傑
-
-傘
-
-備
-
-傢
-
-傣
-
-储
-
-催
-
-傭
-
-傲
-
-傳
-
-債
-
-傷
-
-傻
-
-傾
-
-僅
-
-働
-
-像
-
-僑
-
-僕
-
-僚
-
-僧
-
-僱
-
-僵
-
-價
-
-僻
-
-儀
-
-億
-
-儉
-
-儋
-
-儒
-
-儕
-
-儘
-
-償
-
-儡
-
-優
-
-儲
-
-儷
-
-儿
-
-兀
-
-允
-
-元
-
-兄
-
-充
-
-兆
-
-兇
-
-先
-
-光
-
-克
-
-兌
-
-免
-
-兎
-
-児
-
-兑
-
-兒
-
-兔
-
-兖
-
-兘
-
-党
-
-兜
-
-兢
-
-入
-
-內
-
-全
-
-兩
-
-八
-
-公
-
-六
-
-兮
-
-兰
-
-共
-
-关
-
-兴
-
-兵
-
-其
-
-具
-
-典
-
-兹
-
-养
-
-兼
-
-兽
-
-冀
-
-内
-
-円
-
-冇
-
-冈
-
-冉
-
-冊
-
-册
-
-再
-
-冒
-
-冕
-
-冗
-
-写
-
-军
-
-农
-
-冠
-
-冢
-
-冤
-
-冥
-
-冨
-
-冬
-
-冯
-
-冰
-
-冲
-
-决
-
-冴
-
-况
-
-冶
-
-冷
-
-冻
-
-冽
-
-净
-
-凄
-
-准
-
-凇
-
-凈
-
-凉
-
-凋
-
-凌
-
-凍
-
-减
-
-凑
-
-凛
-
-凜
-
-凝
-
-几
-
-凡
-
-凤
-
-処
-
-凧
-
-凪
-
-凭
-
-凯
-
-凰
-
-凱
-
-凳
-
-凶
-
-凸
-
-凹
-
-出
-
-击
-
-函
-
-凿
-
-刀
-
-刁
-
-刃
-
-分
-
-切
-
-刈
-
-刊
-
-刑
-
-划
-
-列
-
-刘
-
-则
-
-刚
-
-创
-
-初
-
-删
-
-判
-
-別
-
-刨
-
-利
-
-刪
-
-别
-
-刮
-
-到
-
-制
-
-刷
-
-券
-
-刹
-
-刺
-
-刻
-
-剁
-
-剂
-
-剃
-
-則
-
-削
-
-剋
-
-前
-
-剎
-
-剑
-
-剔
-
-剖
-
-剛
-
-剝
-
-剣
-
-剤
-
-剥
-
-剧
-
-剩
-
-剪
-
-副
-
-剰
-
-割
-
-創
-
-剿
-
-劃
-
-劇
-
-劈
-
-劉
-
-劍
-
-劑
-
-力
-
-劝
-
-办
-
-功
-
-加
-
-务
-
-劣
-
-动
-
-助
-
-努
-
-劫
-
-励
-
-劲
-
-劳
-
-労
-
-劵
-
-効
-
-劾
-
-势
-
-勁
-
-勃
-
-勅
-
-勇
-
-勉
-
-勋
-
-勐
-
-勒
-
-動
-
-勘
-
-務
-
-勝
-
-勞
-
-募
-
-勢
-
-勤
-
-勧
-
-勬
-
-勲
-
-勳
-
-勵
-
-勸
-
-勺
-
-勻
-
-勾
-
-勿
-
-匀
-
-匁
-
-匂
-
-包
-
-匆
-
-匈
-
-匕
-
-化
-
-北
-
-匙
-
-匝
-
-匠
-
-匡
-
-匣
-
-匪
-
-匮
-
-匯
-
-匹
-
-区
-
-医
-
-匾
-
-匿
-
-區
-
-十
-
-千
-
-卅
-
-升
-
-午
-
-卉
-
-半
-
-华
-
-协
-
-卑
-
-卒
-
-卓
-
-協
-
-单
-
-卖
-
-南
-
-単
-
-博
-
-卜
-
-卞
-
-占
-
-卡
-
-卢
-
-卤
-
-卦
-
-卧
-
-卫
-
-卯
-
-印
-
-危
-
-即
-
-却
-
-卵
-
-卷
-
-卸
-
-卻
-
-卿
-
-厂
-
-厄
-
-厅
-
-历
-
-厉
-
-压
-
-厌
-
-厕
-
-厘
-
-厚
-
-厝
-
-原
-
-厢
-
-厥
-
-厦
-
-厨
-
-厩
-
-厭
-
-厮
-
-厲
-
-厳
-
-去
-
-县
-
-叁
-
-参
-
-參
-
-又
-
-叉
-
-及
-
-友
-
-双
-
-反
-
-収
-
-发
-
-叔
-
-取
-
-受
-
-变
-
-叙
-
-叛
-
-叟
-
-叠
-
-叡
-
-叢
-
-口
-
-古
-
-句
-
-另
-
-叨
-
-叩
-
-只
-
-叫
-
-召
-
-叭
-
-叮
-
-可
-
-台
-
-叱
-
-史
-
-右
-
-叶
-
-号
-
-司
-
-叹
-
-叻
-
-叼
-
-叽
-
-吁
-
-吃
-
-各
-
-合
-
-吉
-
-吊
-
-吋
-
-同
-
-名
-
-后
-
-吏
-
-吐
-
-向
-
-吓
-
-吕
-
-吗
-
-君
-
-吝
-
-吞
-
-吟
-
-吠
-
-吡
-
-否
-
-吧
-
-吨
-
-吩
-
-含
-
-听
-
-吮
-
-启
-
-吱
-
-吲
-
-吳
-
-吴
-
-吵
-
-吶
-
-吸
-
-吹
-
-吻
-
-吼
-
-吾
-
-呀
-
-呂
-
-呃
-
-呆
-
-呈
-
-呉
-
-告
-
-呎
-
-呐
-
-呑
-
-呕
-
-呗
-
-员
-
-呛
-
-呜
-
-呢
-
-呦
-
-周
-
-呪
-
-呭
-
-呰
-
-呱
-
-呲
-
-味
-
-呵
-
-呷
-
-呼
-
-命
-
-咀
-
-咁
-
-咆
-
-咋
-
-和
-
-咎
-
-咏
-
-咐
-
-咒
-
-咔
-
-咕
-
-咖
-
-咗
-
-咙
-
-咚
-
-咤
-
-咦
-
-咧
-
-咨
-
-咩
-
-咪
-
-咫
-
-咬
-
-咭
-
-咯
-
-咱
-
-咲
-
-咳
-
-咸
-
-咽
-
-哀
-
-品
-
-哄
-
-哆
-
-哇
-
-哈
-
-哉
-
-哋
-
-哌
-
-响
-
-哎
-
-哑
-
-哒
-
-哔
-
-哗
-
-哚
-
-哞
-
-哟
-
-員
-
-哥
-
-哦
-
-哨
-
-哩
-
-哪
-
-哭
-
-哮
-
-哲
-
-哺
-
-哼
-
-唄
-
-唆
-
-唇
-
-唉
-
-唐
-
-唑
-
-唔
-
-唖
-
-唛
-
-唠
-
-唤
-
-唧
-
-唬
-
-售
-
-唯
-
-唱
-
-唷
-
-唸
-
-唾
-
-啃
-
-啄
-
-商
-
-啊
-
-問
-
-啓
-
-啖
-
-啜
-
-啞
-
-啟
-
-啡
-
-啤
-
-啥
-
-啦
-
-啪
-
-啫
-
-啱
-
-啲
-
-啶
-
-啸
-
-啼
-
-啾
-
-喀
-
-喂
-
-喃
-
-善
-
-喆
-
-喇
-
-喉
-
-喊
-
-喋
-
-喎
-
-喔
-
-喘
-
-喚
-
-喜
-
-喝
-
-喧
-
-喪
-
-喫
-
-喬
-
-單
-
-喰
-
-喱
-
-喲
-
-喵
-
-営
-
-喷
-
-喺
-
-喻
-
-喽
-
-嗅
-
-嗆
-
-嗎
-
-嗑
-
-嗒
-
-嗓
-
-嗗
-
-嗚
-
-嗜
-
-嗝
-
-嗡
-
-嗣
-
-嗦
-
-嗨
-
-嗯
-
-嗰
-
-嗳
-
-嗷
-
-嗽
-
-嘀
-
-嘅
-
-嘆
-
-嘈
-
-嘉
-
-嘍
-
-嘎
-
-嘔
-
-嘖
-
-嘗
-
-嘘
-
-嘛
-
-嘟
-
-嘢
-
-嘩
-
-嘯
-
-嘱
-
-嘲
-
-嘴
-
-嘶
-
-嘻
-
-嘿
-
-噁
-
-噂
-
-噌
-
-噗
-
-噛
-
-噜
-
-噢
-
-器
-
-噩
-
-噪
-
-噬
-
-噯
-
-噱
-
-噴
-
-噶
-
-噸
-
-噹
-
-噺
-
-噻
-
-嚀
-
-嚇
-
-嚎
-
-嚏
-
-嚐
-
-嚕
-
-嚟
-
-嚢
-
-嚣
-
-嚨
-
-嚮
-
-嚴
-
-嚷
-
-嚼
-
-囂
-
-囉
-
-囊
-
-囍
-
-囑
-
-囚
-
-四
-
-回
-
-因
-
-囡
-
-团
-
-団
-
-囤
-
-囧
-
-园
-
-困
-
-囱
-
-囲
-
-図
-
-围
-
-固
-
-国
-
-图
-
-圃
-
-圆
-
-圈
-
-國
-
-圍
-
-圏
-
-園
-
-圓
-
-圖
-
-團
-
-土
-
-圣
-
-圧
-
-在
-
-圩
-
-圭
-
-地
-
-圳
-
-场
-
-圾
-
-址
-
-坂
-
-均
-
-坊
-
-坋
-
-坍
-
-坎
-
-坏
-
-坐
-
-坑
-
-块
-
-坚
-
-坛
-
-坝
-
-坞
-
-坟
-
-坠
-
-坡
-
-坤
-
-坦
-
-坨
-
-坩
-
-坪
-
-坯
-
-坳
-
-坷
-
-垂
-
-垃
-
-垄
-
-型
-
-垒
-
-垛
-
-垠
-
-垢
-
-垣
-
-垦
-
-垫
-
-垮
-
-埃
-
-埋
-
-城
-
-埔
-
-埕
-
-埗
-
-埜
-
-域
-
-埠
-
-埴
-
-執
-
-培
-
-基
-
-埼
-
-堀
-
-堂
-
-堅
-
-堆
-
-堕
-
-堝
-
-堡
-
-堤
-
-堪
-
-堯
-
-堰
-
-報
-
-場
-
-堵
-
-堺
-
-塀
-
-塁
-
-塊
-
-塌
-
-塑
-
-塔
-
-塗
-
-塘
-
-塙
-
-塚
-
-塞
-
-塢
-
-塩
-
-填
-
-塵
-
-塾
-
-境
-
-墅
-
-墊
-
-墓
-
-増
-
-墙
-
-墜
-
-增
-
-墟
-
-墨
-
-墩
-
-墮
-
-墳
-
-墾
-
-壁
-
-壅
-
-壇
-
-壊
-
-壌
-
-壑
-
-壓
-
-壕
-
-壘
-
-壞
-
-壟
-
-壢
-
-壤
-
-壩
-
-士
-
-壬
-
-壮
-
-壯
-
-声
-
-壱
-
-売
-
-壳
-
-壶
-
-壷
-
-壹
-
-壺
-
-壽
-
-处
-
-备
-
-変
-
-夊
-
-夋
-
-复
-
-夏
-
-夕
-
-外
-
-夙
-
-多
-
-夜
-
-够
-
-夠
-
-夢
-
-夥
-
-大
-
-天
-
-太
-
-夫
-
-夬
-
-夭
-
-央
-
-夯
-
-失
-
-头
-
-夷
-
-夸
-
-夹
-
-夺
-
-夾
-
-奂
-
-奄
-
-奇
-
-奈
-
-奉
-
-奋
-
-奎
-
-奏
-
-契
-
-奔
-
-奕
-
-奖
-
-套
-
-奚
-
-奠
-
-奢
-
-奥
-
-奧
-
-奨
-
-奪
-
-奬
-
-奮
-
-女
-
-奴
-
-奶
-
-奸
-
-她
-
-好
-
-如
-
-妃
-
-妄
-
-妆
-
-妇
-
-妈
-
-妊
-
-妍
-
-妒
-
-妓
-
-妖
-
-妙
-
-妝
-
-妞
-
-妣
-
-妤
-
-妥
-
-妨
-
-妩
-
-妬
-
-妮
-
-妲
-
-妳
-
-妹
-
-妻
-
-妾
-
-姆
-
-姉
-
-姊
-
-始
-
-姐
-
-姑
-
-姓
-
-委
-
-姗
-
-姚
-
-姜
-
-姝
-
-姣
-
-姤
-
-姥
-
-姦
-
-姨
-
-姪
-
-姫
-
-姬
-
-姶
-
-姻
-
-姿
-
-威
-
-娃
-
-娄
-
-娅
-
-娆
-
-娇
-
-娉
-
-娌
-
-娑
-
-娓
-
-娘
-
-娛
-
-娜
-
-娟
-
-娠
-
-娥
-
-娩
-
-娯
-
-娱
-
-娲
-
-娴
-
-娶
-
-娼
-
-婀
-
-婁
-
-婆
-
-婉
-
-婕
-
-婚
-
-婢
-
-婦
-
-婧
-
-婪
-
-婴
-
-婵
-
-婷
-
-婺
-
-婿
-
-媒
-
-媚
-
-媛
-
-媲
-
-媳
-
-媽
-
-嫁
-
-嫂
-
-嫉
-
-嫌
-
-嫖
-
-嫡
-
-嫣
-
-嫦
-
-嫩
-
-嫻
-
-嬉
-
-嬌
-
-嬛
-
-嬢
-
-嬤
-
-嬬
-
-嬰
-
-嬳
-
-嬷
-
-子
-
-孔
-
-孕
-
-孖
-
-字
-
-存
-
-孙
-
-孚
-
-孜
-
-孝
-
-孟
-
-孢
-
-季
-
-孤
-
-学
-
-孩
-
-孫
-
-孰
-
-孳
-
-孵
-
-學
-
-孺
-
-孽
-
-宁
-
-它
-
-宅
-
-宇
-
-守
-
-安
-
-宋
-
-完
-
-宍
-
-宏
-
-宕
-
-宗
-
-官
-
-宙
-
-定
-
-宛
-
-宜
-
-宝
-
-实
-
-実
-
-宠
-
-审
-
-客
-
-宣
-
-室
-
-宥
-
-宦
-
-宪
-
-宫
-
-宮
-
-宰
-
-害
-
-宴
-
-宵
-
-家
-
-宸
-
-容
-
-宽
-
-宾
-
-宿
-
-寂
-
-寄
-
-寅
-
-密
-
-寇
-
-富
-
-寐
-
-寒
-
-寓
-
-寛
-
-寝
-
-寞
-
-察
-
-寡
-
-寢
-
-寥
-
-實
-
-寧
-
-寨
-
-審
-
-寫
-
-寬
-
-寮
-
-寰
-
-寳
-
-寵
-
-寶
-
-寸
-
-对
-
-寺
-
-寻
-
-导
-
-対
-
-寿
-
-封
-
-専
-
-射
-
-将
-
-將
-
-專
-
-尉
-
-尊
-
-尋
-
-對
-
-導
-
-小
-
-尐
-
-少
-
-尔
-
-尖
-
-尘
-
-尚
-
-尝
-
-尤
-
-尧
-
-尬
-
-尭
-
-就
-
-尴
-
-尷
-
-尸
-
-尹
-
-尺
-
-尻
-
-尼
-
-尽
-
-尾
-
-尿
-
-局
-
-屁
-
-层
-
-居
-
-屆
-
-屈
-
-屉
-
-届
-
-屋
-
-屌
-
-屍
-
-屎
-
-屏
-
-屑
-
-屒
-
-展
-
-屜
-
-属
-
-屠
-
-屡
-
-屢
-
-層
-
-履
-
-屬
-
-屯
-
-山
-
-屹
-
-屼
-
-屽
-
-屿
-
-岁
-
-岂
-
-岐
-
-岑
-
-岔
-
-岗
-
-岚
-
-岛
-
-岡
-
-岨
-
-岩
-
-岫
-
-岬
-
-岭
-
-岱
-
-岳
-
-岷
-
-岸
-
-峇
-
-峙
-
-峠
-
-峡
-
-峥
-
-峦
-
-峨
-
-峪
-
-峭
-
-峯
-
-峰
-
-島
-
-峻
-
-峽
-
-崁
-
-崂
-
-崇
-
-崎
-
-崑
-
-崔
-
-崖
-
-崗
-
-崙
-
-崛
-
-崩
-
-崭
-
-崴
-
-崽
-
-嵊
-
-嵋
-
-嵌
-
-嵐
-
-嵩
-
-嵯
-
-嶄
-
-嶅
-
-嶋
-
-嶺
-
-嶼
-
-嶽
-
-巅
-
-巌
-
-巍
-
-巒
-
-巓
-
-巔
-
-巖
-
-川
-
-州
-
-巡
-
-巢
-
-巣
-
-工
-
-左
-
-巧
-
-巨
-
-巩
-
-巫
-
-差
-
-己
-
-已
-
-巳
-
-巴
-
-巷
-
-巻
-
-巽
-
-巾
-
-巿
-
-币
-
-市
-
-布
-
-帅
-
-帆
-
-师
-
-希
-
-帐
-
-帕
-
-帖
-
-帘
-
-帚
-
-帛
-
-帜
-
-帝
-
-帥
-
-带
-
-帧
-
-師
-
-席
-
-帮
-
-帯
-
-帰
-
-帳
-
-帶
-
-帷
-
-常
-
-帼
-
-帽
-
-幂
-
-幅
-
-幌
-
-幕
-
-幟
-
-幡
-
-幢
-
-幣
-
-幫
-
-干
-
-平
-
-年
-
-并
-
-幸
-
-幹
-
-幺
-
-幻
-
-幼
-
-幽
-
-幾
-
-广
-
-庁
-
-広
-
-庄
-
-庆
-
-庇
-
-床
-
-序
-
-庐
-
-库
-
-应
-
-底
-
-庖
-
-店
-
-庙
-
-庚
-
-府
-
-庞
-
-废
-
-度
-
-座
-
-庫
-
-庭
-
-庵
-
-庶
-
-康
-
-庸
-
-庾
-
-廁
-
-廂
-
-廃
-
-廈
-
-廉
-
-廊
-
-廓
-
-廖
-
-廚
-
-廟
-
-廠
-
-廢
-
-廣
-
-廬
-
-廳
-
-延
-
-廷
-
-建
-
-廻
-
-廼
-
-廿
-
-开
-
-弁
-
-异
-
-弃
-
-弄
-
-弈
-
-弊
-
-弋
-
-式
-
-弐
-
-弓
-
-弔
-
-引
-
-弗
-
-弘
-
-弛
-
-弟
-
-张
-
-弥
-
-弦
-
-弧
-
-弩
-
-弭
-
-弯
-
-弱
-
-張
-
-強
-
-弹
-
-强
-
-弼
-
-弾
-
-彈
-
-彊
-
-彌
-
-彎
-
-归
-
-当
-
-录
-
-彙
-
-彝
-
-形
-
-彤
-
-彥
-
-彦
-
-彧
-
-彩
-
-彪
-
-彫
-
-彬
-
-彭
-
-彰
-
-影
-
-彷
-
-役
-
-彻
-
-彼
-
-彿
-
-往
-
-征
-
-径
-
-待
-
-很
-
-徉
-
-徊
-
-律
-
-後
-
-徐
-
-徑
-
-徒
-
-従
-
-得
-
-徘
-
-徙
-
-徜
-
-從
-
-徠
-
-御
-
-徨
-
-復
-
-循
-
-微
-
-徳
-
-徴
-
-徵
-
-德
-
-徹
-
-徽
-
-心
-
-必
-
-忆
-
-忌
-
-忍
-
-忏
-
-忐
-
-忑
-
-志
-
-忘
-
-忙
-
-応
-
-忠
-
-忡
-
-忧
-
-快
-
-忱
-
-念
-
-忻
-
-忽
-
-忿
-
-怀
-
-态
-
-怅
-
-怎
-
-怒
-
-怕
-
-怖
-
-怜
-
-思
-
-怠
-
-怡
-
-急
-
-性
-
-怨
-
-怪
-
-怯
-
-总
-
-恆
-
-恋
-
-恍
-
-恐
-
-恒
-
-恕
-
-恙
-
-恢
-
-恣
-
-恤
-
-恥
-
-恨
-
-恩
-
-恪
-
-恬
-
-恭
-
-息
-
-恰
-
-恳
-
-恵
-
-恶
-
-恺
-
-恼
-
-悄
-
-悅
-
-悉
-
-悌
-
-悍
-
-悔
-
-悖
-
-悚
-
-悟
-
-悠
-
-患
-
-悦
-
-您
-
-悩
-
-悪
-
-悬
-
-悲
-
-悴
-
-悶
-
-悸
-
-悼
-
-情
-
-惆
-
-惇
-
-惊
-
-惋
-
-惑
-
-惕
-
-惘
-
-惚
-
-惜
-
-惟
-
-惠
-
-惡
-
-惣
-
-惦
-
-惧
-
-惨
-
-惩
-
-惫
-
-惬
-
-惯
-
-惰
-
-惱
-
-想
-
-惶
-
-惹
-
-惺
-
-愁
-
-愈
-
-愉
-
-意
-
-愕
-
-愚
-
-愛
-
-愜
-
-感
-
-愣
-
-愤
-
-愧
-
-愫
-
-愭
-
-愿
-
-慈
-
-態
-
-慌
-
-慎
-
-慑
-
-慕
-
-慘
-
-慢
-
-慣
-
-慧
-
-慨
-
-慬
-
-慭
-
-慮
-
-慰
-
-慲
-
-慳
-
-慵
-
-慶
-
-慷
-
-慾
-
-憂
-
-憊
-
-憋
-
-憎
-
-憐
-
-憑
-
-憔
-
-憤
-
-憧
-
-憨
-
-憩
-
-憫
-
-憬
-
-憲
-
-憶
-
-憾
-
-懂
-
-懇
-
-懈
-
-應
-
-懊
-
-懋
-
-懐
-
-懒
-
-懦
-
-懲
-
-懵
-
-懶
-
-懷
-
-懸
-
-懺
-
-懼
-
-懿
-
-戀
-
-戈
-
-戊
-
-戌
-
-戍
-
-戎
-
-戏
-
-成
-
-我
-
-戒
-
-或
-
-战
-
-戚
-
-戛
-
-戜
-
-戝
-
-戞
-
-戟
-
-戠
-
-戦
-
-截
-
-戭
-
-戮
-
-戯
-
-戰
-
-戱
-
-戲
-
-戳
-
-戴
-
-戶
-
-户
-
-戸
-
-戻
-
-戾
-
-房
-
-所
-
-扁
-
-扇
-
-扈
-
-扉
-
-手
-
-才
-
-扎
-
-扑
-
-扒
-
-打
-
-扔
-
-払
-
-托
-
-扛
-
-扣
-
-扦
-
-执
-
-扩
-
-扫
-
-扬
-
-扭
-
-扮
-
-扯
-
-扰
-
-扱
-
-扲
-
-扳
-
-扶
-
-批
-
-扼
-
-找
-
-承
-
-技
-
-抄
-
-抉
-
-把
-
-抑
-
-抒
-
-抓
-
-投
-
-抖
-
-抗
-
-折
-
-抚
-
-抛
-
-抜
-
-択
-
-抠
-
-抢
-
-护
-
-报
-
-抨
-
-披
-
-抬
-
-抱
-
-抵
-
-抹
-
-押
-
-抽
-
-拂
-
-担
-
-拆
-
-拇
-
-拉
-
-拋
-
-拌
-
-拍
-
-拎
-
-拐
-
-拒
-
-拓
-
-拔
-
-拖
-
-拗
-
-拘
-
-拙
-
-拚
-
-招
-
-拜
-
-拝
-
-拟
-
-拠
-
-拡
-
-拢
-
-拣
-
-拥
-
-拦
-
-拧
-
-拨
-
-择
-
-括
-
-拭
-
-拯
-
-拰
-
-拱
-
-拳
-
-拶
-
-拷
-
-拼
-
-拽
-
-拾
-
-拿
-
-持
-
-挂
-
-指
-
-按
-
-挎
-
-挑
-
-挖
-
-挙
-
-挚
-
-挛
-
-挝
-
-挞
-
-挟
-
-挠
-
-挡
-
-挣
-
-挤
-
-挥
-
-挨
-
-挪
-
-挫
-
-振
-
-挺
-
-挽
-
-挿
-
-捂
-
-捅
-
-捆
-
-捉
-
-捌
-
-捍
-
-捏
-
-捐
-
-捕
-
-捗
-
-捜
-
-捞
-
-损
-
-捡
-
-换
-
-捣
-
-捥
-
-捧
-
-捨
-
-据
-
-捲
-
-捶
-
-捷
-
-捺
-
-捻
-
-掀
-
-掂
-
-掃
-
-授
-
-掉
-
-掌
-
-掏
-
-掐
-
-排
-
-掖
-
-掘
-
-掙
-
-掛
-
-掠
-
-採
-
-探
-
-接
-
-控
-
-推
-
-掩
-
-措
-
-掬
-
-掰
-
-掲
-
-掴
-
-掷
-
-掺
-
-掻
-
-揀
-
-揃
-
-揉
-
-揍
-
-描
-
-提
-
-插
-
-揖
-
-揚
-
-換
-
-握
-
-揣
-
-揪
-
-揭
-
-揮
-
-援
-
-揹
-
-揺
-
-揽
-
-搁
-
-搂
-
-搅
-
-損
-
-搏
-
-搐
-
-搓
-
-搔
-
-搖
-
-搗
-
-搜
-
-搞
-
-搪
-
-搬
-
-搭
-
-搴
-
-搵
-
-搶
-
-携
-
-搽
-
-搾
-
-摂
-
-摄
-
-摆
-
-摇
-
-摊
-
-摒
-
-摔
-
-摘
-
-摧
-
-摩
-
-摮
-
-摯
-
-摸
-
-摹
-
-摺
-
-撃
-
-撇
-
-撈
-
-撐
-
-撑
-
-撒
-
-撓
-
-撕
-
-撚
-
-撞
-
-撤
-
-撥
-
-撩
-
-撫
-
-撬
-
-播
-
-撮
-
-撰
-
-撲
-
-撸
-
-撹
-
-撻
-
-撼
-
-撿
-
-擀
-
-擁
-
-擂
-
-擅
-
-擇
-
-擊
-
-擋
-
-操
-
-擎
-
-擒
-
-擔
-
-據
-
-擠
-
-擢
-
-擦
-
-擬
-
-擱
-
-擲
-
-擴
-
-擷
-
-擺
-
-擾
-
-攀
-
-攏
-
-攒
-
-攔
-
-攘
-
-攜
-
-攝
-
-攠
-
-攣
-
-攤
-
-攪
-
-攬
-
-支
-
-收
-
-攸
-
-改
-
-攻
-
-放
-
-政
-
-故
-
-效
-
-敌
-
-敏
-
-救
-
-敕
-
-敖
-
-敗
-
-敘
-
-教
-
-敚
-
-敛
-
-敝
-
-敞
-
-敢
-
-散
-
-敤
-
-敦
-
-敬
-
-敮
-
-数
-
-敲
-
-敳
-
-整
-
-敵
-
-敷
-
-數
-
-斁
-
-斂
-
-斃
-
-文
-
-斉
-
-斋
-
-斌
-
-斎
-
-斐
-
-斑
-
-斓
-
-斗
-
-料
-
-斛
-
-斜
-
-斟
-
-斡
-
-斤
-
-斥
-
-斧
-
-斩
-
-斬
-
-断
-
-斯
-
-新
-
-斷
-
-方
-
-於
-
-施
-
-斿
-
-旁
-
-旅
-
-旇
-
-旋
-
-旌
-
-旎
-
-族
-
-旑
-
-旖
-
-旗
-
-无
-
-既
-
-日
-
-旦
-
-旧
-
-旨
-
-早
-
-旬
-
-旭
-
-旱
-
-旳
-
-时
-
-旷
-
-旺
-
-旻
-
-昀
-
-昂
-
-昆
-
-昇
-
-昊
-
-昌
-
-明
-
-昏
-
-易
-
-昔
-
-昕
-
-星
-
-映
-
-春
-
-昧
-
-昨
-
-昭
-
-是
-
-昱
-
-昵
-
-昶
-
-昸
-
-昼
-
-显
-
-時
-
-晃
-
-晉
-
-晋
-
-晌
-
-晏
-
-晒
-
-晓
-
-晕
-
-晖
-
-晗
-
-晚
-
-晝
-
-晟
-
-晤
-
-晦
-
-晨
-
-晩
-
-普
-
-景
-
-晰
-
-晴
-
-晶
-
-智
-
-晾
-
-暁
-
-暂
-
-暇
-
-暈
-
-暉
-
-暑
-
-暖
-
-暗
-
-暢
-
-暦
-
-暧
-
-暨
-
-暫
-
-暮
-
-暱
-
-暴
-
-暹
-
-曆
-
-曇
-
-曉
-
-曖
-
-曙
-
-曜
-
-曝
-
-曠
-
-曦
-
-曬
-
-曰
-
-曲
-
-曳
-
-更
-
-書
-
-曹
-
-曼
-
-曽
-
-曾
-
-替
-
-最
-
-會
-
-朆
-
-月
-
-有
-
-朋
-
-服
-
-朐
-
-朔
-
-朕
-
-朗
-
-望
-
-朝
-
-期
-
-朥
-
-朦
-
-朧
-
-木
-
-未
-
-末
-
-本
-
-札
-
-术
-
-朱
-
-朴
-
-朵
-
-机
-
-朽
-
-杀
-
-杂
-
-权
-
-杆
-
-杉
-
-李
-
-杏
-
-材
-
-村
-
-杓
-
-杖
-
-杜
-
-杞
-
-束
-
-杠
-
-条
-
-杢
-
-来
-
-杨
-
-杩
-
-杪
-
-杫
-
-杭
-
-杯
-
-杰
-
-東
-
-杵
-
-杷
-
-松
-
-板
-
-极
-
-枃
-
-构
-
-枇
-
-枉
-
-析
-
-枕
-
-林
-
-枚
-
-果
-
-枝
-
-枞
-
-枠
-
-枢
-
-枣
-
-枪
-
-枫
-
-枭
-
-枯
-
-枱
-
-枳
-
-架
-
-枷
-
-枸
-
-柁
-
-柄
-
-柉
-
-柊
-
-柏
-
-某
-
-柑
-
-柒
-
-染
-
-柔
-
-柘
-
-柚
-
-柜
-
-柞
-
-柠
-
-查
-
-柬
-
-柯
-
-柱
-
-柳
-
-柴
-
-柵
-
-査
-
-柾
-
-柿
-
-栂
-
-栃
-
-栄
-
-栅
-
-标
-
-栈
-
-栋
-
-栏
-
-树
-
-栓
-
-栖
-
-栗
-
-校
-
-栢
-
-栩
-
-株
-
-栴
-
-样
-
-核
-
-根
-
-格
-
-栽
-
-栾
-
-桀
-
-桁
-
-桂
-
-桃
-
-框
-
-案
-
-桉
-
-桌
-
-桐
-
-桑
-
-桓
-
-桔
-
-桜
-
-桝
-
-桟
-
-档
-
-桥
-
-桦
-
-桧
-
-桨
-
-桩
-
-桶
-
-桿
-
-梁
-
-梅
-
-梓
-
-梗
-
-條
-
-梢
-
-梦
-
-梧
-
-梨
-
-梭
-
-梯
-
-械
-
-梱
-
-梳
-
-梵
-
-梶
-
-梼
-
-检
-
-棄
-
-棉
-
-棋
-
-棍
-
-棒
-
-棕
-
-棗
-
-棘
-
-棚
-
-棟
-
-棠
-
-棣
-
-棧
-
-棬
-
-森
-
-棱
-
-棲
-
-棵
-
-棺
-
-椀
-
-椅
-
-椋
-
-植
-
-椎
-
-椒
-
-椙
-
-椛
-
-検
-
-椭
-
-椰
-
-椴
-
-椹
-
-椿
-
-楂
-
-楊
-
-楓
-
-楔
-
-楕
-
-楚
-
-楞
-
-楠
-
-楢
-
-楣
-
-楤
-
-楦
-
-楬
-
-業
-
-楮
-
-楯
-
-楳
-
-極
-
-楷
-
-楹
-
-楼
-
-楽
-
-概
-
-榄
-
-榆
-
-榈
-
-榉
-
-榊
-
-榎
-
-榔
-
-榕
-
-榛
-
-榜
-
-榨
-
-榫
-
-榭
-
-榮
-
-榴
-
-榻
-
-槃
-
-構
-
-槌
-
-槍
-
-槐
-
-槓
-
-様
-
-槙
-
-槛
-
-槟
-
-槤
-
-槭
-
-槳
-
-槻
-
-槽
-
-槿
-
-樁
-
-樂
-
-樊
-
-樋
-
-樑
-
-樓
-
-樗
-
-標
-
-樞
-
-樟
-
-模
-
-樣
-
-権
-
-横
-
-樫
-
-樱
-
-樵
-
-樸
-
-樹 
-
-樺 
-
-樽 
-
-橄 
-
-橇 
-
-橋 
-
-橘 
-
-橙 
-
-機 
-
-橡 
-
-橢 
-
-橫 
-
-橱 
-
-橼 
-
-橿 
-
-檀 
-
-檎 
-
-檐 
-
-檔 
-
-檜 
-
-檢 
-
-檬 
-
-檯 
-
-檳 
-
-檸 
-
-檻 
-
-櫃 
-
-櫑 
-
-櫓 
-
-櫚 
-
-櫛 
-
-櫥 
-
-櫨 
-
-櫻 
-
-欄 
-
-權 
-
-欖 
-
-欝 
-
-欠 
-
-次 
-
-欢 
-
-欣 
-
-欧 
-
-欲 
-
-欸 
-
-欺 
-
-欽 
-
-款 
-
-歆 
-
-歇 
-
-歉 
-
-歌 
-
-歎 
-
-歐 
-
-歓 
-
-歡 
-
-止 
-
-正 
-
-此 
-
-步 
-
-武 
-
-歧 
-
-歩 
-
-歪 
-
-歯 
-
-歲 
-
-歳 
-
-歴 
-
-歷 
-
-歸 
-
-歹 
-
-死 
-
-歼 
-
-殃 
-
-殆 
-
-殇 
-
-殉 
-
-殊 
-
-残 
-
-殑 
-
-殖 
-
-殘 
-
-殡 
-
-殭 
-
-殯 
-
-殴 
-
-段 
-
-殷 
-
-殺 
-
-殻 
-
-殼 
-
-殿 
-
-毀 
-
-毁 
-
-毂 
-
-毅 
-
-毆 
-
-毋 
-
-母 
-
-毎 
-
-每 
-
-毒 
-
-毓 
-
-比 
-
-毕 
-
-毗 
-
-毘 
-
-毙 
-
-毛 
-
-毡 
-
-毫 
-
-毯 
-
-氈 
-
-氏 
-
-民 
-
-氓 
-
-气 
-
-気 
-
-氙 
-
-氛 
-
-氟 
-
-氢 
-
-氣 
-
-氧 
-
-氨 
-
-氩 
-
-氫 
-
-氬 
-
-氭!
-
-氮!
-
-氯!
-
-氰!
-
-水!
-
-氷!
-
-永!
-
-氹!
-
-氾!
-
-汀!
-
-汁!
-
-求!
-
-汇!
-
-汉!
-
-汎!
-
-汐!
-
-汕!
-
-汗!
-
-汙!
-
-汚!
-
-汛!
-
-汝!
-
-汞!
-
-江!
-
-池!
-
-污!
-
-汤!
-
-汩!
-
-汪!
-
-汰!
-
-汲!
-
-汴!
-
-汶!
-
-汹!
-
-決!
-
-汽!
-
-汾!
-
-沁!
-
-沂!
-
-沃!
-
-沅!
-
-沈!
-
-沉!
-
-沌!
-
-沐!
-
-沒!
-
-沓!
-
-沖!
-
-沙!
-
-沛!
-
-沟!
-
-没!
-
-沢!
-
-沣!
-
-沥!
-
-沦!
-
-沧!
-
-沪!
-
-沫!
-
-沭!
-
-沮!
-
-沱!
-
-河!
-
-沵!
-
-沸!
-
-油!
-
-治!
-
-沼!
-
-沽!
-
-沾!
-
-沿!
-
-況!
-
-泂!
-
-泄!
-
-泉!
-
-泊!
-
-泌!
-
-泓!
-
-法!
-
-泗!
-
-泛!
-
-泠!
-
-泡!
-
-波!
-
-泣!
-
-泥!
-
-注!
-
-泪!
-
-泫!
-
-泰!
-
-泱!
-
-泳!
-
-泵!
-
-泸!
-
-泻!
-
-泼!
-
-泽!
-
-泾!
-
-洁!
-
-洋!
-
-洒!
-
-洗!
-
-洙!
-
-洛!
-
-洞!
-
-津!
-
-洩!
-
-洪!
-
-洱!
-
-洲!
-
-洶!
-
-活!
-
-洼!
-
-洽!
-
-派!
-
-流!
-
-浄!
-
-浅!
-
-浆!
-
-浇!
-
-浊!
-
-测!
-
-济!
-
-浏!
-
-浑!
-
-浒!
-
-浓!
-
-浔!
-
-浙"
-
-浚"
-
-浜"
-
-浠"
-
-浣"
-
-浦"
-
-浩"
-
-浪"
-
-浬"
-
-浮"
-
-浴"
-
-海"
-
-浸"
-
-浼"
-
-涂"
-
-涅"
-
-消"
-
-涉"
-
-涌"
-
-涎"
-
-涓"
-
-涔"
-
-涕"
-
-涘"
-
-涙"
-
-涛"
-
-涜"
-
-涝"
-
-涞"
-
-涟"
-
-涡"
-
-涢"
-
-涣"
-
-涤"
-
-润"
-
-涧"
-
-涨"
-
-涩"
-
-涪"
-
-涮"
-
-涯"
-
-液"
-
-涵"
-
-涸"
-
-涼"
-
-涿"
-
-淀"
-
-淄"
-
-淅"
-
-淆"
-
-淇"
-
-淋"
-
-淌"
-
-淑"
-
-淒"
-
-淖"
-
-淘"
-
-淚"
-
-淞"
-
-淡"
-
-淤"
-
-淨"
-
-淩"
-
-淪"
-
-淫"
-
-淬"
-
-淮"
-
-深"
-
-淳"
-
-淵"
-
-混"
-
-淹"
-
-淺"
-
-添"
-
-淼"
-
-清"
-
-渇"
-
-済"
-
-渉"
-
-渊"
-
-渋"
-
-渍"
-
-渎"
-
-渐"
-
-渓"
-
-渔"
-
-渗"
-
-渙"
-
-渚"
-
-減"
-
-渝"
-
-渠"
-
-渡"
-
-渣"
-
-渤"
-
-渥"
-
-渦"
-
-温"
-
-測"
-
-渭"
-
-港"
-
-渲"
-
-渴"
-
-游"
-
-渺"
-
-渾"
-
-湃"
-
-湄"
-
-湊"
-
-湍"
-
-湖"
-
-湘"
-
-湛"
-
-湥"
-
-湧"
-
-湯"
-
-湳"
-
-湾"
-
-湿"
-
-満"
-
-溃"
-
-溅"
-
-溉"
-
-溌"
-
-源"
-
-準"
-
-溜"
-
-溝"
-
-溢#
-
-溧#
-
-溪#
-
-溫#
-
-溯#
-
-溴#
-
-溶#
-
-溷#
-
-溺#
-
-溼#
-
-滁#
-
-滄#
-
-滅#
-
-滇#
-
-滋#
-
-滌#
-
-滑#
-
-滔#
-
-滕#
-
-滙#
-
-滚#
-
-滝#
-
-滞#
-
-满#
-
-滤#
-
-滥#
-
-滦#
-
-滨#
-
-滩#
-
-滬#
-
-滯#
-
-滲#
-
-滴#
-
-滷#
-
-滾#
-
-滿#
-
-漁#
-
-漂#
-
-漆#
-
-漉#
-
-漏#
-
-漓#
-
-演#
-
-漕#
-
-漠#
-
-漢#
-
-漣#
-
-漩#
-
-漪#
-
-漫#
-
-漬#
-
-漯#
-
-漱#
-
-漲#
-
-漳#
-
-漸#
-
-漾#
-
-漿#
-
-潅#
-
-潇#
-
-潍#
-
-潑#
-
-潔#
-
-潘#
-
-潛#
-
-潜#
-
-潟#
-
-潢#
-
-潤#
-
-潦#
-
-潬#
-
-潭#
-
-潮#
-
-潰#
-
-潲#
-
-潴#
-
-潵#
-
-潺#
-
-潼#
-
-澀#
-
-澄#
-
-澆#
-
-澈#
-
-澎#
-
-澗#
-
-澜#
-
-澡#
-
-澤#
-
-澧#
-
-澱#
-
-澳#
-
-澶#
-
-澹#
-
-激#
-
-濁#
-
-濃#
-
-濋#
-
-濒#
-
-濕#
-
-濛#
-
-濞#
-
-濟#
-
-濠#
-
-濡#
-
-濤#
-
-濫#
-
-濬#
-
-濮#
-
-濯#
-
-濱#
-
-濾#
-
-瀉#
-
-瀏#
-
-瀑#
-
-瀕#
-
-瀚#
-
-瀛#
-
-瀝#
-
-瀞#
-
-瀟#
-
-瀦#
-
-瀧#
-
-瀨#
-
-瀬#
-
-瀰#
-
-瀹#
-
-瀾#
-
-灃#
-
-灌$
-
-灏$
-
-灑$
-
-灘$
-
-灞$
-
-灣$
-
-火$
-
-灬$
-
-灭$
-
-灯$
-
-灰$
-
-灵$
-
-灶$
-
-灸$
-
-灼$
-
-災$
-
-灾$
-
-灿$
-
-炅$
-
-炉$
-
-炊$
-
-炎$
-
-炒$
-
-炔$
-
-炕$
-
-炖$
-
-炙$
-
-炜$
-
-炫$
-
-炬$
-
-炭$
-
-炮$
-
-炯$
-
-炳$
-
-炸$
-
-点$
-
-為$
-
-炼$
-
-炽$
-
-烁$
-
-烂$
-
-烃$
-
-烈$
-
-烊$
-
-烏$
-
-烘$
-
-烙$
-
-烛$
-
-烟$
-
-烤$
-
-烦$
-
-烧$
-
-烨$
-
-烩$
-
-烫$
-
-热$
-
-烯$
-
-烷$
-
-烹$
-
-烽$
-
-焉$
-
-焊$
-
-焔$
-
-焕$
-
-焖$
-
-焗$
-
-焙$
-
-焚$
-
-無$
-
-焦$
-
-焯$
-
-焰$
-
-焱$
-
-然$
-
-焼$
-
-煅$
-
-煉$
-
-煊$
-
-煌$
-
-煎$
-
-煒$
-
-煙$
-
-煜$
-
-煞$
-
-煤$
-
-煥$
-
-煦$
-
-照$
-
-煨$
-
-煩$
-
-煮$
-
-煲$
-
-煸$
-
-煽$
-
-熄$
-
-熊$
-
-熏$
-
-熒$
-
-熔$
-
-熙$
-
-熟$
-
-熠$
-
-熨$
-
-熬$
-
-熱$
-
-熹$
-
-熼$
-
-熾$
-
-燃$
-
-燈$
-
-燉$
-
-燊$
-
-燎$
-
-燐$
-
-燒$
-
-燕$
-
-燗$
-
-燙$
-
-營$
-
-燥$
-
-燦$
-
-燭$
-
-燮$
-
-燻$
-
-爆$
-
-爍$
-
-爐$
-
-爓$
-
-爛%
-
-爪%
-
-爬%
-
-爭%
-
-爱%
-
-爲%
-
-爵%
-
-父%
-
-爷%
-
-爸%
-
-爹%
-
-爺%
-
-爻%
-
-爽%
-
-爾%
-
-牆%
-
-片%
-
-版%
-
-牌%
-
-牒%
-
-牙%
-
-牛%
-
-牝%
-
-牟%
-
-牠%
-
-牡%
-
-牢%
-
-牥%
-
-牦%
-
-牧%
-
-物%
-
-牯%
-
-牲%
-
-牵%
-
-特%
-
-牺%
-
-牽%
-
-犀%
-
-犁%
-
-犊%
-
-犒%
-
-犠%
-
-犧%
-
-犬%
-
-犯%
-
-状%
-
-犹%
-
-狀%
-
-狂%
-
-狄%
-
-狐%
-
-狗%
-
-狙%
-
-狛%
-
-狠%
-
-狡%
-
-狩%
-
-独%
-
-狭%
-
-狮%
-
-狱%
-
-狸%
-
-狹%
-
-狼%
-
-狽%
-
-猎%
-
-猕%
-
-猖%
-
-猛%
-
-猜%
-
-猝%
-
-猟%
-
-猠%
-
-猥%
-
-猩%
-
-猪%
-
-猫%
-
-猬%
-
-献%
-
-猴%
-
-猶%
-
-猷%
-
-猿%
-
-獄%
-
-獅%
-
-獎%
-
-獒%
-
-獣%
-
-獧%
-
-獨%
-
-獭%
-
-獲%
-
-獵%
-
-獸%
-
-獻%
-
-玄%
-
-率%
-
-玉%
-
-王%
-
-玖%
-
-玛%
-
-玟%
-
-玥%
-
-玩%
-
-玫%
-
-玮%
-
-环%
-
-现%
-
-玲%
-
-玳%
-
-玺%
-
-玻%
-
-珀%
-
-珂%
-
-珈%
-
-珉%
-
-珊%
-
-珍%
-
-珐%
-
-珑%
-
-珞%
-
-珠%
-
-珩%
-
-珪%
-
-班%
-
-珮%
-
-珲%
-
-珺%
-
-現&
-
-球&
-
-琅&
-
-理&
-
-琉&
-
-琊&
-
-琐&
-
-琛&
-
-琠&
-
-琢&
-
-琥&
-
-琦&
-
-琨&
-
-琪&
-
-琰&
-
-琳&
-
-琴&
-
-琵&
-
-琶&
-
-琺&
-
-琼&
-
-瑄&
-
-瑋&
-
-瑕&
-
-瑙&
-
-瑚&
-
-瑛&
-
-瑜&
-
-瑞&
-
-瑟&
-
-瑠&
-
-瑣&
-
-瑤&
-
-瑨&
-
-瑩&
-
-瑪&
-
-瑯&
-
-瑰&
-
-瑳&
-
-瑶&
-
-瑾&
-
-璀&
-
-璁&
-
-璃&
-
-璇&
-
-璋&
-
-璐&
-
-璞&
-
-璟&
-
-璧&
-
-璨&
-
-環&
-
-璽&
-
-璿&
-
-瓊&
-
-瓜&
-
-瓢&
-
-瓣&
-
-瓦&
-
-瓯&
-
-瓶&
-
-瓷&
-
-甄&
-
-甑&
-
-甘&
-
-甙&
-
-甚&
-
-甜&
-
-生&
-
-產&
-
-産&
-
-甥&
-
-甦&
-
-用&
-
-甩&
-
-甫&
-
-甬&
-
-甯&
-
-田&
-
-由&
-
-甲&
-
-申&
-
-电&
-
-男&
-
-甸&
-
-町&
-
-画&
-
-畅&
-
-界&
-
-畏&
-
-畑&
-
-畔&
-
-留&
-
-畜&
-
-畝&
-
-畠&
-
-畢&
-
-略&
-
-畦&
-
-番&
-
-畫&
-
-異&
-
-畳&
-
-畴&
-
-當&
-
-畷&
-
-畸&
-
-畿&
-
-疆&
-
-疇&
-
-疊&
-
-疋&
-
-疎&
-
-疏&
-
-疑&
-
-疗&
-
-疙&
-
-疚&
-
-疝&
-
-疡&
-
-疣&
-
-疤&
-
-疫&
-
-疮&
-
-疯&
-
-疱&
-
-疲&
-
-疳&
-
-疵'
-
-疸'
-
-疹'
-
-疼'
-
-疽'
-
-疾'
-
-痂'
-
-病'
-
-症'
-
-痉'
-
-痊'
-
-痒'
-
-痔'
-
-痕'
-
-痘'
-
-痛'
-
-痞'
-
-痠'
-
-痢'
-
-痣'
-
-痤'
-
-痧'
-
-痨'
-
-痩'
-
-痪'
-
-痫'
-
-痰'
-
-痲'
-
-痴'
-
-痹'
-
-痺'
-
-痿'
-
-瘀'
-
-瘋'
-
-瘘'
-
-瘙'
-
-瘟'
-
-瘡'
-
-瘢'
-
-瘤'
-
-瘦'
-
-瘩'
-
-瘫'
-
-瘮'
-
-瘾'
-
-療'
-
-癌'
-
-癒'
-
-癖'
-
-癜'
-
-癡'
-
-癢'
-
-癣'
-
-癥'
-
-癫'
-
-癬'
-
-癮'
-
-癱'
-
-癲'
-
-癶'
-
-癸'
-
-発'
-
-登'
-
-發'
-
-白'
-
-百'
-
-皂'
-
-的'
-
-皆'
-
-皇'
-
-皈'
-
-皋'
-
-皎'
-
-皐'
-
-皑'
-
-皓'
-
-皖'
-
-皙'
-
-皦'
-
-皮'
-
-皱'
-
-皵'
-
-皺'
-
-皿'
-
-盂'
-
-盃'
-
-盅'
-
-盆'
-
-盈'
-
-益'
-
-盎'
-
-盏'
-
-盐'
-
-监'
-
-盒'
-
-盔'
-
-盖'
-
-盗'
-
-盘'
-
-盛'
-
-盜'
-
-盝'
-
-盞'
-
-盟'
-
-盡'
-
-監'
-
-盤'
-
-盦'
-
-盧'
-
-盪'
-
-目'
-
-盯'
-
-盱'
-
-盲'
-
-直'
-
-相'
-
-盼'
-
-盾'
-
-省'
-
-眉'
-
-看'
-
-県'
-
-眙'
-
-眞'
-
-真'
-
-眠'
-
-眣'
-
-眨'
-
-眩(
-
-眯(
-
-眶(
-
-眷(
-
-眸(
-
-眺(
-
-眼(
-
-眾(
-
-着(
-
-睁(
-
-睇(
-
-睐(
-
-睑(
-
-睛(
-
-睜(
-
-睞(
-
-睡(
-
-睢(
-
-督(
-
-睦(
-
-睨(
-
-睩(
-
-睫(
-
-睹(
-
-睽(
-
-睾(
-
-睿(
-
-瞄(
-
-瞅(
-
-瞎(
-
-瞒(
-
-瞞(
-
-瞥(
-
-瞧(
-
-瞩(
-
-瞪(
-
-瞬(
-
-瞭(
-
-瞰(
-
-瞳(
-
-瞻(
-
-矗(
-
-矚(
-
-矛(
-
-矜(
-
-矢(
-
-矣(
-
-知(
-
-矧(
-
-矩(
-
-矫(
-
-短(
-
-矮(
-
-矯(
-
-石(
-
-矶(
-
-矽(
-
-矾(
-
-矿(
-
-砀(
-
-码(
-
-砂(
-
-砌(
-
-砍(
-
-研(
-
-砕(
-
-砖(
-
-砗(
-
-砚(
-
-砝(
-
-砥(
-
-砦(
-
-砧(
-
-砭(
-
-砰(
-
-砲(
-
-破(
-
-砸(
-
-砺(
-
-砼(
-
-砾(
-
-砿(
-
-础(
-
-硅(
-
-硒(
-
-硕(
-
-硝(
-
-硫(
-
-硬(
-
-确(
-
-硯(
-
-硰(
-
-硲(
-
-硼(
-
-碁(
-
-碇(
-
-碉(
-
-碌(
-
-碍(
-
-碎(
-
-碑(
-
-碓(
-
-碕(
-
-碗(
-
-碘(
-
-碚(
-
-碟(
-
-碣(
-
-碧(
-
-碩(
-
-碰(
-
-碱(
-
-碳(
-
-確(
-
-碼(
-
-碾(
-
-磁(
-
-磅(
-
-磊(
-
-磋(
-
-磐(
-
-磕(
-
-磚(
-
-磡(
-
-磨(
-
-磬(
-
-磯(
-
-磲(
-
-磷)
-
-磺)
-
-礁)
-
-礎)
-
-礙)
-
-礦)
-
-礴)
-
-示)
-
-礼)
-
-社)
-
-祀)
-
-祁)
-
-祂)
-
-祇)
-
-祈)
-
-祉)
-
-祎)
-
-祐)
-
-祕)
-
-祖)
-
-祗)
-
-祛)
-
-祝)
-
-神)
-
-祟)
-
-祠)
-
-祢)
-
-祥)
-
-票)
-
-祭)
-
-祯)
-
-祷)
-
-祸)
-
-祺)
-
-祿)
-
-禀)
-
-禁)
-
-禄)
-
-禅)
-
-禍)
-
-禎)
-
-福)
-
-禦)
-
-禧)
-
-禪)
-
-禮)
-
-禰)
-
-禱)
-
-禹)
-
-禺)
-
-离)
-
-禽)
-
-禾)
-
-禿)
-
-秀)
-
-私)
-
-秃)
-
-秆)
-
-秉)
-
-秋)
-
-种)
-
-科)
-
-秒)
-
-秘)
-
-租)
-
-秤)
-
-秦)
-
-秧)
-
-秩)
-
-积)
-
-称)
-
-秸)
-
-移)
-
-秽)
-
-稀)
-
-稅)
-
-程)
-
-稍)
-
-税)
-
-稔)
-
-稗)
-
-稚)
-
-稜)
-
-稠)
-
-稣)
-
-種)
-
-稱)
-
-稲)
-
-稳)
-
-稷)
-
-稻)
-
-稼)
-
-稽)
-
-稿)
-
-穀)
-
-穂)
-
-穆)
-
-穉)
-
-穌)
-
-積)
-
-穎)
-
-穏)
-
-穐)
-
-穗)
-
-穢)
-
-穣)
-
-穩)
-
-穫)
-
-穴)
-
-究)
-
-穷)
-
-穹)
-
-空)
-
-穿)
-
-突)
-
-窃)
-
-窄)
-
-窈)
-
-窍)
-
-窑)
-
-窒)
-
-窓)
-
-窕)
-
-窖)
-
-窗)
-
-窘)
-
-窜)
-
-窝)
-
-窟*
-
-窥*
-
-窦*
-
-窩*
-
-窪*
-
-窮*
-
-窯*
-
-窺*
-
-竃*
-
-竄*
-
-竅*
-
-竇*
-
-竊*
-
-立*
-
-竖*
-
-站*
-
-竜*
-
-竞*
-
-竟*
-
-章*
-
-竣*
-
-童*
-
-竪*
-
-竭*
-
-端*
-
-竴*
-
-競*
-
-竹*
-
-竺*
-
-竿*
-
-笂*
-
-笃*
-
-笆*
-
-笈*
-
-笉*
-
-笋*
-
-笑*
-
-笔*
-
-笙*
-
-笛*
-
-笠*
-
-笥*
-
-符*
-
-笨*
-
-第*
-
-笹*
-
-笼*
-
-筆*
-
-筈*
-
-等*
-
-筋*
-
-筍*
-
-筏*
-
-筐*
-
-筑*
-
-筒*
-
-答*
-
-策*
-
-筛*
-
-筝*
-
-筠*
-
-筱*
-
-筵*
-
-筷*
-
-筹*
-
-签*
-
-简*
-
-箆*
-
-箇*
-
-箍*
-
-箏*
-
-箐*
-
-箔*
-
-箕*
-
-算*
-
-管*
-
-箧*
-
-箪*
-
-箫*
-
-箭*
-
-箰*
-
-箱*
-
-箴*
-
-箸*
-
-節*
-
-範*
-
-篆*
-
-篇*
-
-築*
-
-篋*
-
-篝*
-
-篠*
-
-篡*
-
-篤*
-
-篦*
-
-篩*
-
-篭*
-
-篮*
-
-篱*
-
-篷*
-
-簇*
-
-簡*
-
-簧*
-
-簪*
-
-簷*
-
-簸*
-
-簽*
-
-簾*
-
-簿*
-
-籁*
-
-籃*
-
-籌*
-
-籍*
-
-籓*
-
-籠*
-
-籤*
-
-籬*
-
-籲*
-
-米*
-
-类*
-
-籽*
-
-籾*
-
-粁*
-
-粂*
-
-粉*
-
-粋*
-
-粍*
-
-粑*
-
-粒+
-
-粕+
-
-粗+
-
-粘+
-
-粛+
-
-粟+
-
-粤+
-
-粥+
-
-粧+
-
-粪+
-
-粮+
-
-粱+
-
-粳+
-
-粵+
-
-粹+
-
-粽+
-
-精+
-
-粿+
-
-糊+
-
-糎+
-
-糕+
-
-糖+
-
-糗+
-
-糙+
-
-糜+
-
-糞+
-
-糟+
-
-糠+
-
-糧+
-
-糯+
-
-糰+
-
-糴+
-
-糸+
-
-系+
-
-糾+
-
-紀+
-
-約+
-
-紅+
-
-紉+
-
-紊+
-
-紋+
-
-納+
-
-紐+
-
-紒+
-
-紓+
-
-純+
-
-紗+
-
-紘+
-
-紙+
-
-級+
-
-紛+
-
-紝+
-
-素+
-
-紡+
-
-索+
-
-紧+
-
-紫+
-
-紬+
-
-紮+
-
-累+
-
-細+
-
-紳+
-
-紹+
-
-紺+
-
-終+
-
-絃+
-
-組+
-
-絅+
-
-絆+
-
-経+
-
-絎+
-
-結+
-
-絕+
-
-絞+
-
-絡+
-
-絢+
-
-給+
-
-絨+
-
-絮+
-
-統+
-
-絲+
-
-絵+
-
-絶+
-
-絹+
-
-綁+
-
-綉+
-
-綏+
-
-綑+
-
-經+
-
-継+
-
-続+
-
-綜+
-
-綠+
-
-綢+
-
-綣+
-
-綫+
-
-綬+
-
-維+
-
-綱+
-
-網+
-
-綴+
-
-綸+
-
-綺+
-
-綻+
-
-綽+
-
-綾+
-
-綿+
-
-緊+
-
-緋+
-
-総+
-
-緑+
-
-緒+
-
-線+
-
-緝+
-
-緞+
-
-締+
-
-緣+
-
-編+
-
-緩+
-
-緬+
-
-緯+
-
-練+
-
-緹+
-
-緻+
-
-縁+
-
-縄+
-
-縛+
-
-縞+
-
-縣,
-
-縦,
-
-縫,
-
-縮,
-
-縱,
-
-總,
-
-績,
-
-繁,
-
-繃,
-
-繊,
-
-繋,
-
-繍,
-
-織,
-
-繕,
-
-繚,
-
-繞,
-
-繡,
-
-繩,
-
-繪,
-
-繫,
-
-繭,
-
-繰,
-
-繳,
-
-繹,
-
-繼,
-
-繽,
-
-纂,
-
-續,
-
-纏,
-
-纖,
-
-纜,
-
-纠,
-
-红,
-
-纤,
-
-约,
-
-级,
-
-纪,
-
-纫,
-
-纬,
-
-纭,
-
-纯,
-
-纱,
-
-纲,
-
-纳,
-
-纵,
-
-纶,
-
-纷,
-
-纸,
-
-纹,
-
-纺,
-
-纽,
-
-线,
-
-练,
-
-组,
-
-绅,
-
-细,
-
-织,
-
-终,
-
-绉,
-
-绊,
-
-绍,
-
-绎,
-
-经,
-
-绑,
-
-绒,
-
-结,
-
-绔,
-
-绕,
-
-绗,
-
-绘,
-
-给,
-
-绚,
-
-绛,
-
-络,
-
-绝,
-
-绞,
-
-统,
-
-绢,
-
-绣,
-
-绥,
-
-继,
-
-绩,
-
-绪,
-
-绫,
-
-续,
-
-绮,
-
-绯,
-
-绰,
-
-绳,
-
-维,
-
-绵,
-
-绷,
-
-绸,
-
-综,
-
-绽,
-
-绾,
-
-绿,
-
-缀,
-
-缁,
-
-缃,
-
-缅,
-
-缆,
-
-缇,
-
-缉,
-
-缎,
-
-缓,
-
-缔,
-
-缕,
-
-编,
-
-缘,
-
-缚,
-
-缝,
-
-缠,
-
-缤,
-
-缩,
-
-缪,
-
-缭,
-
-缮,
-
-缴,
-
-缶,
-
-缸,
-
-缺,
-
-缽,
-
-罄,
-
-罅,
-
-罐,
-
-网,
-
-罔,
-
-罕-
-
-罗-
-
-罚-
-
-罢-
-
-罩-
-
-罪-
-
-罫-
-
-置-
-
-罰-
-
-署-
-
-罵-
-
-罷-
-
-罹-
-
-羁-
-
-羂-
-
-羅-
-
-羆-
-
-羈-
-
-羊-
-
-羌-
-
-美-
-
-羔-
-
-羚-
-
-羞-
-
-羟-
-
-羡-
-
-群-
-
-羧-
-
-羨-
-
-義-
-
-羯-
-
-羲-
-
-羶-
-
-羹-
-
-羽-
-
-羿-
-
-翁-
-
-翅-
-
-翊-
-
-翌-
-
-翎-
-
-習-
-
-翔-
-
-翘-
-
-翟-
-
-翠-
-
-翡-
-
-翩-
-
-翫-
-
-翰-
-
-翱-
-
-翹-
-
-翻-
-
-翼-
-
-耀-
-
-老-
-
-考-
-
-者-
-
-耆-
-
-而-
-
-耍-
-
-耐-
-
-耕-
-
-耗-
-
-耘-
-
-耙-
-
-耦-
-
-耳-
-
-耶-
-
-耸-
-
-耻-
-
-耽-
-
-耿-
-
-聂-
-
-聆-
-
-聊-
-
-聋-
-
-职-
-
-联-
-
-聖-
-
-聘-
-
-聚-
-
-聞-
-
-聡-
-
-聪-
-
-聯-
-
-聰-
-
-聲-
-
-聳-
-
-聴-
-
-聶-
-
-職-
-
-聽-
-
-聾-
-
-肃-
-
-肅-
-
-肆-
-
-肇-
-
-肉-
-
-肋-
-
-肌-
-
-肖-
-
-肘-
-
-肚-
-
-肛-
-
-肝-
-
-肟-
-
-肠-
-
-股-
-
-肢-
-
-肤-
-
-肥-
-
-肩-
-
-肪-
-
-肯-
-
-肱-
-
-育-
-
-肴-
-
-肺-
-
-肽-
-
-肾-
-
-肿-
-
-胀-
-
-胁-
-
-胃-
-
-胆-
-
-背-
-
-胎-
-
-胖.
-
-胚.
-
-胛.
-
-胜.
-
-胞.
-
-胡.
-
-胤.
-
-胥.
-
-胧.
-
-胫.
-
-胭.
-
-胯.
-
-胰.
-
-胱.
-
-胳.
-
-胴.
-
-胶.
-
-胸.
-
-胺.
-
-能.
-
-脂.
-
-脅.
-
-脆.
-
-脇.
-
-脈.
-
-脉.
-
-脊.
-
-脏.
-
-脐.
-
-脑.
-
-脓.
-
-脖.
-
-脚.
-
-脫.
-
-脯.
-
-脱.
-
-脲.
-
-脳.
-
-脸.
-
-脹.
-
-脾.
-
-腈.
-
-腊.
-
-腋.
-
-腌.
-
-腎.
-
-腐.
-
-腑.
-
-腓.
-
-腔.
-
-腕.
-
-腥.
-
-腦.
-
-腩.
-
-腫.
-
-腭.
-
-腮.
-
-腰.
-
-腱.
-
-腳.
-
-腸.
-
-腹.
-
-腺.
-
-腻.
-
-腾.
-
-腿.
-
-膀.
-
-膈.
-
-膊.
-
-膏.
-
-膚.
-
-膛.
-
-膜.
-
-膝.
-
-膠.
-
-膦.
-
-膨.
-
-膩.
-
-膳.
-
-膺.
-
-膽.
-
-膿.
-
-臀.
-
-臂.
-
-臃.
-
-臆.
-
-臉.
-
-臍.
-
-臓.
-
-臘.
-
-臟.
-
-臣.
-
-臥.
-
-臧.
-
-臨.
-
-自.
-
-臭.
-
-至.
-
-致.
-
-臺.
-
-臻.
-
-臼.
-
-舅.
-
-舆.
-
-與.
-
-興.
-
-舉.
-
-舊.
-
-舌.
-
-舍.
-
-舎.
-
-舒.
-
-舔.
-
-舖.
-
-舗.
-
-舘.
-
-舛.
-
-舜.
-
-舞.
-
-舟.
-
-航.
-
-般.
-
-舰.
-
-舱.
-
-舵.
-
-舶.
-
-舷.
-
-船.
-
-艇/
-
-艘/
-
-艙/
-
-艦/
-
-艮/
-
-良/
-
-艰/
-
-艱/
-
-色/
-
-艳/
-
-艶/
-
-艷/
-
-艺/
-
-艾/
-
-节/
-
-芈/
-
-芊/
-
-芋/
-
-芍/
-
-芎/
-
-芒/
-
-芙/
-
-芜/
-
-芝/
-
-芡/
-
-芥/
-
-芦/
-
-芩/
-
-芪/
-
-芬/
-
-芭/
-
-芮/
-
-芯/
-
-花/
-
-芳/
-
-芷/
-
-芸/
-
-芹/
-
-芽/
-
-苁/
-
-苅/
-
-苇/
-
-苋/
-
-苍/
-
-苏/
-
-苑/
-
-苓/
-
-苔/
-
-苗/
-
-苛/
-
-苞/
-
-苟/
-
-苡/
-
-苣/
-
-若/
-
-苦/
-
-苧/
-
-苫/
-
-苯/
-
-英/
-
-苷/
-
-苹/
-
-茁/
-
-茂/
-
-范/
-
-茄/
-
-茅/
-
-茉/
-
-茎/
-
-茗/
-
-茘/
-
-茜/
-
-茧/
-
-茨/
-
-茫/
-
-茬/
-
-茭/
-
-茯/
-
-茱/
-
-茲/
-
-茴/
-
-茵/
-
-茶/
-
-茸/
-
-茹/
-
-荃/
-
-荆/
-
-草/
-
-荊/
-
-荏/
-
-荐/
-
-荒/
-
-荔/
-
-荘/
-
-荞/
-
-荟/
-
-荠/
-
-荡/
-
-荣/
-
-荤/
-
-荥/
-
-荧/
-
-荨/
-
-荫/
-
-药/
-
-荳/
-
-荷/
-
-荸/
-
-荻/
-
-荼/
-
-莅/
-
-莆/
-
-莉/
-
-莊/
-
-莎/
-
-莒/
-
-莓/
-
-莖/
-
-莘/
-
-莞/
-
-莠/
-
-莢/
-
-莪/
-
-莫/
-
-莱/
-
-莲/
-
-获/
-
-莹/
-
-莺0
-
-莽0
-
-菁0
-
-菅0
-
-菇0
-
-菊0
-
-菌0
-
-菏0
-
-菓0
-
-菖0
-
-菜0
-
-菟0
-
-菠0
-
-菡0
-
-菩0
-
-華0
-
-菰0
-
-菱0
-
-菲0
-
-菴0
-
-菸0
-
-萃0
-
-萄0
-
-萊0
-
-萌0
-
-萍0
-
-萎0
-
-萘0
-
-萝0
-
-萤0
-
-营0
-
-萦0
-
-萧0
-
-萨0
-
-萩0
-
-萬0
-
-萱0
-
-落0
-
-葆0
-
-葉0
-
-葎0
-
-著0
-
-葚0
-
-葛0
-
-葡0
-
-董0
-
-葦0
-
-葩0
-
-葫0
-
-葬0
-
-葱0
-
-葳0
-
-葵0
-
-葺0
-
-蒂0
-
-蒋0
-
-蒌0
-
-蒐0
-
-蒔0
-
-蒙0
-
-蒜0
-
-蒞0
-
-蒟0
-
-蒡0
-
-蒲0
-
-蒸0
-
-蒻0
-
-蒼0
-
-蒿0
-
-蓁0
-
-蓄0
-
-蓉0
-
-蓋0
-
-蓑0
-
-蓓0
-
-蓝0
-
-蓞0
-
-蓟0
-
-蓬0
-
-蓮0
-
-蔀0
-
-蔑0
-
-蔓0
-
-蔔0
-
-蔗0
-
-蔘0
-
-蔚0
-
-蔡0
-
-蔣0
-
-蔥0
-
-蔦0
-
-蔬0
-
-蔭0
-
-蔵0
-
-蔷0
-
-蔻0
-
-蔼0
-
-蔽0
-
-蕁0
-
-蕃0
-
-蕉0
-
-蕊0
-
-蕎0
-
-蕓0
-
-蕗0
-
-蕙0
-
-蕨0
-
-蕩0
-
-蕪0
-
-蕭0
-
-蕲0
-
-蕴0
-
-蕾0
-
-薄0
-
-薇0
-
-薈0
-
-薊0
-
-薏0
-
-薑0
-
-薔0
-
-薗0
-
-薙0
-
-薛0
-
-薤0
-
-薦0
-
-薩0
-
-薪0
-
-薫0
-
-薬1
-
-薮1
-
-薯1
-
-薰1
-
-藁1
-
-藉1
-
-藍1
-
-藏1
-
-藕1
-
-藜1
-
-藝1
-
-藤1
-
-藥1
-
-藩1
-
-藷1
-
-藹1
-
-藻1
-
-蘆1
-
-蘇1
-
-蘊1
-
-蘋1
-
-蘑1
-
-蘭1
-
-蘸1
-
-蘿1
-
-虎1
-
-虏1
-
-虐1
-
-虑1
-
-虔1
-
-處1
-
-虚1
-
-虛1
-
-虜1
-
-虞1
-
-號1
-
-虧1
-
-虫1
-
-虱1
-
-虹1
-
-虻1
-
-虽1
-
-虾1
-
-蚀1
-
-蚁1
-
-蚂1
-
-蚊1
-
-蚌1
-
-蚓1
-
-蚕1
-
-蚜1
-
-蚝1
-
-蚣1
-
-蚤1
-
-蚩1
-
-蚯1
-
-蚵1
-
-蛀1
-
-蛆1
-
-蛇1
-
-蛊1
-
-蛋1
-
-蛍1
-
-蛎1
-
-蛏1
-
-蛙1
-
-蛛1
-
-蛟1
-
-蛤1
-
-蛭1
-
-蛮1
-
-蛸1
-
-蛻1
-
-蛾1
-
-蜀1
-
-蜂1
-
-蜃1
-
-蜇1
-
-蜈1
-
-蜒1
-
-蜓1
-
-蜕1
-
-蜗1
-
-蜘1
-
-蜜1
-
-蜡1
-
-蜻1
-
-蜿1
-
-蝇1
-
-蝉1
-
-蝋1
-
-蝎1
-
-蝕1
-
-蝗1
-
-蝙1
-
-蝠1
-
-蝦1
-
-蝴1
-
-蝶1
-
-蝸1
-
-蝿1
-
-螂1
-
-螃1
-
-融1
-
-螞1
-
-螢1
-
-螨1
-
-螯1
-
-螺1
-
-蟆1
-
-蟑1
-
-蟒1
-
-蟠1
-
-蟬1
-
-蟲1
-
-蟹1
-
-蟻1
-
-蟾1
-
-蠅1
-
-蠍1
-
-蠔1
-
-蠕1
-
-蠟1
-
-蠡1
-
-蠢1
-
-蠣1
-
-蠧1
-
-蠱1
-
-蠶2
-
-蠻2
-
-血2
-
-衅2
-
-衆2
-
-行2
-
-衍2
-
-衒2
-
-術2
-
-衔2
-
-街2
-
-衙2
-
-衛2
-
-衝2
-
-衡2
-
-衢2
-
-衣2
-
-补2
-
-表2
-
-衩2
-
-衫2
-
-衬2
-
-衰2
-
-衷2
-
-衿2
-
-袁2
-
-袂2
-
-袄2
-
-袅2
-
-袈2
-
-袋2
-
-袍2
-
-袖2
-
-袜2
-
-被2
-
-袭2
-
-袱2
-
-袴2
-
-袷2
-
-裁2
-
-裂2
-
-装2
-
-裆2
-
-裏2
-
-裔2
-
-裕2
-
-裘2
-
-裙2
-
-補2
-
-裝2
-
-裟2
-
-裡2
-
-裤2
-
-裱2
-
-裳2
-
-裴2
-
-裸2
-
-裹2
-
-製2
-
-裾2
-
-褂2
-
-複2
-
-褐2
-
-褒2
-
-褚2
-
-褥2
-
-褪2
-
-褫2
-
-褰2
-
-褲2
-
-褶2
-
-襄2
-
-襖2
-
-襟2
-
-襪2
-
-襯2
-
-襲2
-
-西2
-
-要2
-
-覃2
-
-覆2
-
-覇2
-
-見2
-
-規2
-
-覓2
-
-視2
-
-覗2
-
-覚2
-
-覧2
-
-親2
-
-観2
-
-覺2
-
-覽2
-
-觀2
-
-见2
-
-观2
-
-规2
-
-觅2
-
-视2
-
-览2
-
-觉2
-
-觑2
-
-角2
-
-解2
-
-触2
-
-觸2
-
-言2
-
-訂2
-
-計2
-
-訊2
-
-討2
-
-訓2
-
-託2
-
-記2
-
-訝2
-
-訟2
-
-訣2
-
-訪2
-
-設2
-
-許2
-
-訳2
-
-訴2
-
-診2
-
-註2
-
-証2
-
-詐2
-
-詑2
-
-詔2
-
-評3
-
-詛3
-
-詞3
-
-詠3
-
-詢3
-
-詣3
-
-試3
-
-詩3
-
-詫3
-
-詭3
-
-詮3
-
-詰3
-
-話3
-
-該3
-
-詳3
-
-詹3
-
-誅3
-
-誇3
-
-誉3
-
-誌3
-
-認3
-
-誓3
-
-誕3
-
-誘3
-
-語3
-
-誠3
-
-誡3
-
-誤3
-
-誦3
-
-誨3
-
-說3
-
-説3
-
-読3
-
-誰3
-
-課3
-
-誹3
-
-誼3
-
-調3
-
-諄3
-
-談3
-
-請3
-
-諌3
-
-諏3
-
-諒3
-
-論3
-
-諗3
-
-諜3
-
-諦3
-
-諧3
-
-諭3
-
-諮3
-
-諱3
-
-諷3
-
-諸3
-
-諺3
-
-諾3
-
-謀3
-
-謁3
-
-謂3
-
-謄3
-
-謊3
-
-謎3
-
-謐3
-
-謔3
-
-謗3
-
-謙3
-
-講3
-
-謝3
-
-謠3
-
-謡3
-
-謬3
-
-謹3
-
-證3
-
-識3
-
-譚3
-
-譜3
-
-警3
-
-譬3
-
-譯3
-
-議3
-
-譲3
-
-譴3
-
-護3
-
-譽3
-
-讀3
-
-讃3
-
-變3
-
-讐3
-
-讒3
-
-讓3
-
-讗3
-
-讚3
-
-计3
-
-订3
-
-认3
-
-讨3
-
-让3
-
-讪3
-
-训3
-
-议3
-
-讯3
-
-记3
-
-讲3
-
-讳3
-
-讶3
-
-许3
-
-论3
-
-讼3
-
-讽3
-
-设3
-
-访3
-
-诀3
-
-证3
-
-评3
-
-识3
-
-诈3
-
-诉3
-
-诊3
-
-词3
-
-诏3
-
-译3
-
-试3
-
-诗3
-
-诚3
-
-诛3
-
-话3
-
-诞3
-
-诠3
-
-诡4
-
-询4
-
-诣4
-
-该4
-
-详4
-
-诫4
-
-语4
-
-误4
-
-诱4
-
-诲4
-
-说4
-
-诵4
-
-请4
-
-诸4
-
-诺4
-
-读4
-
-诽4
-
-课4
-
-谁4
-
-调4
-
-谅4
-
-谈4
-
-谊4
-
-谋4
-
-谍4
-
-谎4
-
-谐4
-
-谓4
-
-谙4
-
-谚4
-
-谛4
-
-谜4
-
-谢4
-
-谣4
-
-谤4
-
-谦4
-
-谧4
-
-谨4
-
-谬4
-
-谭4
-
-谯4
-
-谱4
-
-谴4
-
-谷4
-
-豁4
-
-豆4
-
-豈4
-
-豉4
-
-豊4
-
-豌4
-
-豎4
-
-豐4
-
-豔4
-
-豚4
-
-象4
-
-豪4
-
-豫4
-
-豬4
-
-豹4
-
-貂4
-
-貅4
-
-貉4
-
-貌4
-
-貍4
-
-貓4
-
-貔4
-
-貝4
-
-貞4
-
-負4
-
-財4
-
-貢4
-
-貧4
-
-貨4
-
-販4
-
-貪4
-
-貫4
-
-責4
-
-貯4
-
-貰4
-
-貳4
-
-貴4
-
-貶4
-
-買4
-
-貸4
-
-費4
-
-貼4
-
-貿4
-
-賀4
-
-賁4
-
-賂4
-
-賃4
-
-賄4
-
-資4
-
-賈4
-
-賊4
-
-賎4
-
-賑4
-
-賓4
-
-賛4
-
-賜4
-
-賞4
-
-賠4
-
-賢4
-
-賣4
-
-賤4
-
-賦4
-
-質4
-
-賬4
-
-賭4
-
-賴4
-
-賺4
-
-購4
-
-賽4
-
-贅4
-
-贈4
-
-贊4
-
-贋4
-
-贍4
-
-贏4
-
-贖4
-
-贝4
-
-贞4
-
-负4
-
-贡4
-
-财4
-
-责4
-
-贤4
-
-败4
-
-账5
-
-货5
-
-质5
-
-贩5
-
-贪5
-
-贫5
-
-贬5
-
-购5
-
-贮5
-
-贯5
-
-贰5
-
-贱5
-
-贲5
-
-贴5
-
-贵5
-
-贷5
-
-贸5
-
-费5
-
-贺5
-
-贻5
-
-贼5
-
-贾5
-
-贿5
-
-赁5
-
-赂5
-
-赃5
-
-资5
-
-赋5
-
-赌5
-
-赎5
-
-赏5
-
-赐5
-
-赔5
-
-赖5
-
-赘5
-
-赚5
-
-赛5
-
-赞5
-
-赠5
-
-赢5
-
-赣5
-
-赤5
-
-赦5
-
-赫5
-
-走5
-
-赴5
-
-赵5
-
-赶5
-
-起5
-
-趁5
-
-超5
-
-越5
-
-趋5
-
-趕5
-
-趙5
-
-趟5
-
-趣5
-
-趨5
-
-足5
-
-趴5
-
-趾5
-
-跃5
-
-跆5
-
-跋5
-
-跌5
-
-跑5
-
-距5
-
-跟5
-
-跡5
-
-跤5
-
-跨5
-
-跪5
-
-路5
-
-跳5
-
-践5
-
-跷5
-
-跺5
-
-跻5
-
-踊5
-
-踏5
-
-踐5
-
-踝5
-
-踞5
-
-踢5
-
-踩5
-
-踪5
-
-踴5
-
-踵5
-
-踹5
-
-蹄5
-
-蹇5
-
-蹈5
-
-蹊5
-
-蹟5
-
-蹤5
-
-蹦5
-
-蹬5
-
-蹭5
-
-蹲5
-
-蹴5
-
-蹺5
-
-躁5
-
-躇5
-
-躍5
-
-躔5
-
-身5
-
-躬5
-
-躯5
-
-躲5
-
-躺5
-
-軀5
-
-車5
-
-軋5
-
-軌5
-
-軍5
-
-軒5
-
-軟5
-
-転5
-
-軸5
-
-軽5
-
-較5
-
-載5
-
-輔5
-
-輕5
-
-輛5
-
-輝5
-
-輩5
-
-輪5
-
-輯6
-
-輸6
-
-輻6
-
-輾6
-
-輿6
-
-轄6
-
-轉6
-
-轍6
-
-轎6
-
-轟6
-
-轡6
-
-车6
-
-轧6
-
-轨6
-
-轩6
-
-转6
-
-轮6
-
-软6
-
-轰6
-
-轲6
-
-轴6
-
-轶6
-
-轻6
-
-轼6
-
-载6
-
-轿6
-
-较6
-
-辄6
-
-辅6
-
-辆6
-
-辈6
-
-辉6
-
-辊6
-
-辐6
-
-辑6
-
-输6
-
-辕6
-
-辖6
-
-辗6
-
-辙6
-
-辛6
-
-辜6
-
-辞6
-
-辟6
-
-辣6
-
-辤6
-
-辦6
-
-辨6
-
-辩6
-
-辫6
-
-辭6
-
-辯6
-
-辰6
-
-辱6
-
-農6
-
-辷6
-
-边6
-
-辺6
-
-辻6
-
-込6
-
-辽6
-
-达6
-
-辿6
-
-迁6
-
-迂6
-
-迄6
-
-迅6
-
-过6
-
-迈6
-
-迎6
-
-运6
-
-近6
-
-返6
-
-还6
-
-这6
-
-进6
-
-远6
-
-违6
-
-连6
-
-迟6
-
-迢6
-
-迥6
-
-迦6
-
-迩6
-
-迪6
-
-迫6
-
-迭6
-
-述6
-
-迴6
-
-迷6
-
-迸6
-
-迹6
-
-追6
-
-退6
-
-送6
-
-适6
-
-逃6
-
-逅6
-
-逆6
-
-选6
-
-逊6
-
-逍6
-
-透6
-
-逐6
-
-递6
-
-逓6
-
-途6
-
-逕6
-
-逗6
-
-這6
-
-通6
-
-逛6
-
-逝6
-
-逞6
-
-速6
-
-造6
-
-逢6
-
-連6
-
-逧6
-
-逮6
-
-逰6
-
-週6
-
-進6
-
-逸6
-
-逻6
-
-逼6
-
-逾6
-
-遁6
-
-遂7
-
-遅7
-
-遇7
-
-遊7
-
-運7
-
-遍7
-
-過7
-
-遏7
-
-遐7
-
-道7
-
-達7
-
-違7
-
-遗7
-
-遙7
-
-遛7
-
-遜7
-
-遞7
-
-遠7
-
-遡7
-
-遣7
-
-遥7
-
-遨7
-
-適7
-
-遭7
-
-遮7
-
-遯7
-
-遲7
-
-遴7
-
-遵7
-
-遷7
-
-選7
-
-遺7
-
-遼7
-
-避7
-
-邀7
-
-邁7
-
-邂7
-
-邃7
-
-還7
-
-邇7
-
-邊7
-
-邏7
-
-邑7
-
-邓7
-
-邢7
-
-那7
-
-邦7
-
-邨7
-
-邪7
-
-邮7
-
-邯7
-
-邱7
-
-邳7
-
-邵7
-
-邸7
-
-邹7
-
-邻7
-
-郁7
-
-郃7
-
-郊7
-
-郎7
-
-郑7
-
-郓7
-
-郝7
-
-郡7
-
-郤7
-
-部7
-
-郭7
-
-郴7
-
-郵7
-
-郷7
-
-郸7
-
-都7
-
-鄂7
-
-鄉7
-
-鄒7
-
-鄙7
-
-鄞7
-
-鄧7
-
-鄭7
-
-鄰7
-
-酉7
-
-酋7
-
-酌7
-
-配7
-
-酎7
-
-酐7
-
-酒7
-
-酔7
-
-酗7
-
-酚7
-
-酝7
-
-酞7
-
-酢7
-
-酣7
-
-酥7
-
-酪7
-
-酬7
-
-酮7
-
-酯7
-
-酰7
-
-酱7
-
-酵7
-
-酶7
-
-酷7
-
-酸7
-
-酿7
-
-醃7
-
-醇7
-
-醉7
-
-醋7
-
-醍7
-
-醐7
-
-醒7
-
-醗7
-
-醚7
-
-醛7
-
-醜7
-
-醢7
-
-醣7
-
-醤7
-
-醪7
-
-醫7
-
-醬7
-
-醮7
-
-醯7
-
-醴7
-
-醸7
-
-釀8
-
-釁8
-
-釆8
-
-采8
-
-釈8
-
-釉8
-
-释8
-
-釋8
-
-里8
-
-重8
-
-野8
-
-量8
-
-釐8
-
-金8
-
-釘8
-
-釜8
-
-針8
-
-釣8
-
-釦8
-
-釧8
-
-鈉8
-
-鈊8
-
-鈍8
-
-鈎8
-
-鈔8
-
-鈕8
-
-鈞8
-
-鈣8
-
-鈦8
-
-鈴8
-
-鈷8
-
-鈺8
-
-鉀8
-
-鉄8
-
-鉅8
-
-鉑8
-
-鉗8
-
-鉛8
-
-鉢8
-
-鉤8
-
-鉦8
-
-鉱8
-
-鉴8
-
-鉻8
-
-鉾8
-
-銀8
-
-銃8
-
-銅8
-
-銆8
-
-銑8
-
-銓8
-
-銘8
-
-銚8
-
-銜8
-
-銥8
-
-銭8
-
-銮8
-
-銳8
-
-銷8
-
-銹8
-
-鋁8
-
-鋅8
-
-鋒8
-
-鋤8
-
-鋪8
-
-鋭8
-
-鋰8
-
-鋲8
-
-鋳8
-
-鋸8
-
-鋻8
-
-鋼8
-
-錄8
-
-錆8
-
-錐8
-
-錘8
-
-錙8
-
-錠8
-
-錢8
-
-錦8
-
-錨8
-
-錫8
-
-錬8
-
-錯8
-
-録8
-
-錶8
-
-鍊8
-
-鍋8
-
-鍍8
-
-鍏8
-
-鍑8
-
-鍒8
-
-鍔8
-
-鍗8
-
-鍙8
-
-鍚8
-
-鍛8
-
-鍠8
-
-鍥8
-
-鍦8
-
-鍬8
-
-鍵8
-
-鍾8
-
-鎂8
-
-鎊8
-
-鎌8
-
-鎏8
-
-鎔8
-
-鎖8
-
-鎗8
-
-鎚8
-
-鎢8
-
-鎧8
-
-鎬8
-
-鎮8
-
-鎰8
-
-鎴8
-
-鎵8
-
-鎷8
-
-鏀8
-
-鏁8
-
-鏂8
-
-鏃8
-
-鏄8
-
-鏇8
-
-鏈8
-
-鏉8
-
-鏍8
-
-鏑9
-
-鏗9
-
-鏞9
-
-鏟9
-
-鏡9
-
-鏤9
-
-鏽9
-
-鐗9
-
-鐘9
-
-鐙9
-
-鐚9
-
-鐞9
-
-鐧9
-
-鐨9
-
-鐩9
-
-鐫9
-
-鐵9
-
-鐸9
-
-鑄9
-
-鑈9
-
-鑊9
-
-鑑9
-
-鑒9
-
-鑓9
-
-鑫9
-
-鑰9
-
-鑲9
-
-鑼9
-
-鑽9
-
-鑾9
-
-鑿9
-
-针9
-
-钉9
-
-钎9
-
-钓9
-
-钙9
-
-钛9
-
-钜9
-
-钝9
-
-钞9
-
-钟9
-
-钠9
-
-钡9
-
-钢9
-
-钣9
-
-钥9
-
-钦9
-
-钧9
-
-钨9
-
-钩9
-
-钮9
-
-钯9
-
-钰9
-
-钱9
-
-钳9
-
-钴9
-
-钵9
-
-钻9
-
-钼9
-
-钾9
-
-铁9
-
-铂9
-
-铃9
-
-铅9
-
-铆9
-
-铛9
-
-铜9
-
-铝9
-
-铠9
-
-铢9
-
-铣9
-
-铬9
-
-铭9
-
-铮9
-
-铰9
-
-铲9
-
-铵9
-
-银9
-
-铸9
-
-铺9
-
-链9
-
-销9
-
-锁9
-
-锂9
-
-锄9
-
-锅9
-
-锆9
-
-锈9
-
-锋9
-
-锌9
-
-锐9
-
-锑9
-
-错9
-
-锚9
-
-锛9
-
-锟9
-
-锡9
-
-锣9
-
-锤9
-
-锥9
-
-锦9
-
-锭9
-
-键9
-
-锯9
-
-锰9
-
-锻9
-
-镀9
-
-镁9
-
-镂9
-
-镇9
-
-镍9
-
-镐9
-
-镑9
-
-镖9
-
-镗9
-
-镜9
-
-镭9
-
-镯9
-
-镰9
-
-镶9
-
-長9
-
-长9
-
-門9
-
-閃9
-
-閉9
-
-開9
-
-閏9
-
-閑9
-
-閒:
-
-間:
-
-閔:
-
-閘:
-
-関:
-
-閣:
-
-閤:
-
-閥:
-
-閨:
-
-閩:
-
-閭:
-
-閱:
-
-閲:
-
-閻:
-
-闂:
-
-闃:
-
-闄:
-
-闆:
-
-闇:
-
-闊:
-
-闔:
-
-闕:
-
-闖:
-
-闘:
-
-關:
-
-闡:
-
-闢:
-
-门:
-
-闪:
-
-闫:
-
-闭:
-
-问:
-
-闯:
-
-闲:
-
-间:
-
-闵:
-
-闷:
-
-闸:
-
-闹:
-
-闺:
-
-闻:
-
-闽:
-
-闾:
-
-阀:
-
-阁:
-
-阅:
-
-阆:
-
-阈:
-
-阎:
-
-阐:
-
-阑:
-
-阔:
-
-阙:
-
-阜:
-
-队:
-
-阪:
-
-阮:
-
-阱:
-
-防:
-
-阳:
-
-阴:
-
-阵:
-
-阶:
-
-阻:
-
-阿:
-
-陀:
-
-陂:
-
-附:
-
-际:
-
-陆:
-
-陇:
-
-陈:
-
-陋:
-
-陌:
-
-降:
-
-限:
-
-陕:
-
-陛:
-
-陝:
-
-陟:
-
-陡:
-
-院:
-
-陣:
-
-除:
-
-陥:
-
-陨:
-
-险:
-
-陪:
-
-陰:
-
-陳:
-
-陵:
-
-陶:
-
-陷:
-
-陸:
-
-険:
-
-陽:
-
-隅:
-
-隆:
-
-隈:
-
-隊:
-
-隋:
-
-隍:
-
-階:
-
-随:
-
-隐:
-
-隔:
-
-隘:
-
-隙:
-
-際:
-
-障:
-
-隠:
-
-隣:
-
-隧:
-
-隨:
-
-險:
-
-隱:
-
-隴:
-
-隶:
-
-隷:
-
-隸:
-
-隻:
-
-隼:
-
-隽:
-
-难:
-
-雀:
-
-雁:
-
-雄:
-
-雅:
-
-集;
-
-雇;
-
-雉;
-
-雋;
-
-雌;
-
-雍;
-
-雏;
-
-雑;
-
-雕;
-
-雖;
-
-雙;
-
-雛;
-
-雜;
-
-雞;
-
-離;
-
-難;
-
-雨;
-
-雪;
-
-雫;
-
-雯;
-
-雰;
-
-雲;
-
-雳;
-
-零;
-
-雷;
-
-電;
-
-雾;
-
-需;
-
-霄;
-
-霆;
-
-震;
-
-霉;
-
-霊;
-
-霍;
-
-霏;
-
-霓;
-
-霖;
-
-霜;
-
-霞;
-
-霧;
-
-露;
-
-霸;
-
-霹;
-
-霾;
-
-靂;
-
-靃;
-
-靄;
-
-靈;
-
-青;
-
-靓;
-
-靖;
-
-静;
-
-靚;
-
-靛;
-
-靜;
-
-非;
-
-靠;
-
-靡;
-
-面;
-
-革;
-
-靭;
-
-靳;
-
-靴;
-
-靶;
-
-鞄;
-
-鞋;
-
-鞍;
-
-鞏;
-
-鞑;
-
-鞘;
-
-鞠;
-
-鞭;
-
-韋;
-
-韌;
-
-韓;
-
-韦;
-
-韧;
-
-韩;
-
-韬;
-
-韭;
-
-韮;
-
-音;
-
-韵;
-
-韶;
-
-韻;
-
-響;
-
-頁;
-
-頂;
-
-頃;
-
-項;
-
-順;
-
-須;
-
-頌;
-
-預;
-
-頑;
-
-頒;
-
-頓;
-
-頗;
-
-領;
-
-頚;
-
-頤;
-
-頬;
-
-頭;
-
-頰;
-
-頴;
-
-頸;
-
-頻;
-
-頼;
-
-顆;
-
-題;
-
-額;
-
-顎;
-
-顏;
-
-顔;
-
-顕;
-
-願;
-
-顛;
-
-類;
-
-顧;
-
-顫;
-
-顯;
-
-顴;
-
-页;
-
-顶;
-
-顷;
-
-项;
-
-顺;
-
-须;
-
-顽<
-
-顾<
-
-顿<
-
-颁<
-
-颂<
-
-预<
-
-颅<
-
-领<
-
-颇<
-
-颈<
-
-颊<
-
-颌<
-
-颍<
-
-颐<
-
-频<
-
-颓<
-
-颖<
-
-颗<
-
-题<
-
-颚<
-
-颜<
-
-额<
-
-颞<
-
-颠<
-
-颤<
-
-颧<
-
-風<
-
-颱<
-
-飄<
-
-飆<
-
-风<
-
-飓<
-
-飘<
-
-飙<
-
-飚<
-
-飛<
-
-飞<
-
-食<
-
-飢<
-
-飪<
-
-飯<
-
-飲<
-
-飴<
-
-飼<
-
-飽<
-
-飾<
-
-餃<
-
-餅<
-
-養<
-
-餌<
-
-餐<
-
-餓<
-
-餘<
-
-餚<
-
-餡<
-
-館<
-
-餵<
-
-餾<
-
-饋<
-
-饌<
-
-饑<
-
-饒<
-
-饕<
-
-饗<
-
-饥<
-
-饨<
-
-饪<
-
-饭<
-
-饮<
-
-饯<
-
-饰<
-
-饱<
-
-饲<
-
-饵<
-
-饶<
-
-饺<
-
-饼<
-
-饿<
-
-馄<
-
-馅<
-
-馆<
-
-馈<
-
-馋<
-
-馍<
-
-馏<
-
-馒<
-
-首<
-
-馗<
-
-香<
-
-馥<
-
-馨<
-
-馬<
-
-馭<
-
-馮<
-
-馳<
-
-馴<
-
-駁<
-
-駄<
-
-駅<
-
-駆<
-
-駈<
-
-駐<
-
-駒<
-
-駕<
-
-駛<
-
-駝<
-
-駭<
-
-駱<
-
-駿<
-
-騎<
-
-騒<
-
-験<
-
-騙<
-
-騨<
-
-騰<
-
-騷<
-
-驅<
-
-驕<
-
-驗<
-
-驚<
-
-驛<
-
-驟<
-
-驢<
-
-驥<
-
-驩<
-
-马<
-
-驭<
-
-驯<
-
-驰=
-
-驱=
-
-驳=
-
-驴=
-
-驶=
-
-驹=
-
-驻=
-
-驼=
-
-驾=
-
-驿=
-
-骁=
-
-骂=
-
-骄=
-
-骅=
-
-骆=
-
-骇=
-
-骊=
-
-骋=
-
-验=
-
-骏=
-
-骐=
-
-骑=
-
-骗=
-
-骚=
-
-骞=
-
-骤=
-
-骥=
-
-骧=
-
-骨=
-
-骰=
-
-骶=
-
-骷=
-
-骸=
-
-骼=
-
-髂=
-
-髄=
-
-髅=
-
-髋=
-
-髏=
-
-髒=
-
-髓=
-
-體=
-
-高=
-
-髦=
-
-髪=
-
-髭=
-
-髮=
-
-髻=
-
-鬆=
-
-鬍=
-
-鬚=
-
-鬥=
-
-鬧=
-
-鬪=
-
-鬮=
-
-鬱=
-
-鬼=
-
-魁=
-
-魂=
-
-魄=
-
-魅=
-
-魏=
-
-魔=
-
-魚=
-
-魯=
-
-魷=
-
-鮎=
-
-鮑=
-
-鮒=
-
-鮪=
-
-鮫=
-
-鮭=
-
-鮮=
-
-鯉=
-
-鯊=
-
-鯖=
-
-鯛=
-
-鯨=
-
-鯵=
-
-鰍=
-
-鰐=
-
-鰭=
-
-鰯=
-
-鰹=
-
-鰻=
-
-鱈=
-
-鱒=
-
-鱗=
-
-鱠=
-
-鱷=
-
-鱸=
-
-鱼=
-
-鱿=
-
-鲁=
-
-鲍=
-
-鲜=
-
-鲤=
-
-鲨=
-
-鲫=
-
-鲸=
-
-鳄=
-
-鳅=
-
-鳌=
-
-鳍=
-
-鳕=
-
-鳖=
-
-鳗=
-
-鳝=
-
-鳞=
-
-鳥=
-
-鳩=
-
-鳳=
-
-鳴=
-
-鳶=
-
-鴇=
-
-鴉=
-
-鴎=
-
-鴛=
-
-鴦=
-
-鴨=
-
-鴫=
-
-鴬=
-
-鴻=
-
-鴿=
-
-鵑=
-
-鵜=
-
-鵝=
-
-鵠=
-
-鵡>
-
-鵬>
-
-鵲>
-
-鶏>
-
-鶯>
-
-鶴>
-
-鷗>
-
-鷦>
-
-鷲>
-
-鷹>
-
-鷺>
-
-鸙>
-
-鸞>
-
-鸟>
-
-鸠>
-
-鸡>
-
-鸣>
-
-鸥>
-
-鸦>
-
-鸭>
-
-鸯>
-
-鸳>
-
-鸽>
-
-鸿>
-
-鹃>
-
-鹅>
-
-鹉>
-
-鹊>
-
-鹏>
-
-鹑>
-
-鹤>
-
-鹦>
-
-鹭>
-
-鹰>
-
-鹵>
-
-鹸>
-
-鹹>
-
-鹼>
-
-鹽>
-
-鹿>
-
-麂>
-
-麋>
-
-麒>
-
-麓>
-
-麗>
-
-麝>
-
-麟>
-
-麥>
-
-麦>
-
-麩>
-
-麴>
-
-麵>
-
-麹>
-
-麺>
-
-麻>
-
-麼>
-
-麽>
-
-麿>
-
-黃>
-
-黄>
-
-黍>
-
-黎>
-
-黏>
-
-黑>
-
-黒>
-
-黔>
-
-默>
-
-黙>
-
-黛>
-
-點>
-
-黨>
-
-黯>
-
-黴>
-
-鼎>
-
-鼓>
-
-鼠>
-
-鼻>
-
-鼾>
-
-齊>
-
-齋>
-
-齐>
-
-齒>
-
-齔>
-
-齡>
-
-齢>
-
-齣>
-
-齿>
-
-龄>
-
-龈>
-
-龋>
-
-龍>
-
-龐>
-
-龙>
-
-龚>
-
-龛>
-
-龜>
-
-龟>
-
-ꞌ>
-
->
-
->
-
->
-
->
-
->
-
-更>
-
-契>
-
-金>
-
-來>
-
-冷>
-
-老>
-
-率>
-
-不>
-
-數>
-
-說>
-
-兩>
-
-量>
-
-力>
-
-年>
-
-列>
-
-了>
-
-流>
-
-類>
-
-利>
-
-理>
-
-度>
-
-行>
-
-降>
-
-見>
-
-羽>
-
-ﬁ?
-
-﴾?
-
-﴿?
-
-︗?
-
-︘?
-
-︙?
-
-︰?
-
-︱?
-
-︵?
-
-︶?
-
-︷?
-
-︸?
-
-︹?
-
-︺?
-
-︻?
-
-︼?
-
-︽?
-
-︾?
-
-︿?
-
-﹀?
-
-﹁?
-
-﹂?
-
-﹃?
-
-﹄?
-
-﹎?
-
-﹏?
-
-﹐?
-
-﹑?
-
-﹔?
-
-﹕?
-
-﹖?
-
-﹗?
-
-﹙?
-
-﹚?
-
-﹝?
-
-﹞?
-
-﹣?
-
-！?
-
-＂?
-
-＃?
-
-＄?
-
-％?
-
-＆?
-
-（?
-
-）?
-
-＊?
-
-＋?
-
-，?
-
-－?
-
-．?
-
-／?
-
-０?
-
-１?
-
-２?
-
-３?
-
-４?
-
-５?
-
-６?
-
-７?
-
-８?
-
-９?
-
-：?
-
-；?
-
-＜?
-
-＝?
-
-＞?
-
-？?
-
-＠?
-
-Ａ?
-
-Ｂ?
-
-Ｃ?
-
-Ｄ?
-
-Ｅ?
-
-Ｆ?
-
-Ｉ?
-
-Ｋ?
-
-Ｌ?
-
-Ｍ?
-
-Ｎ?
-
-Ｏ?
-
-Ｐ?
-
-Ｑ?
-
-Ｓ?
-
-Ｔ?
-
-Ｗ?
-
-Ｘ?
-
-［?
-
-＼?
-
-］?
-
-＿?
-
-｀?
-
-ｃ?
-
-ｈ?
-
-ｌ?
-
-ｕ?
-
-ｗ?
-
-ｘ?
-
-｜?
-
-～?
-
-｡?
-
-｢?
-
-｣?
-
-､?
-
-･?
-
-ｰ?
-
-ﾄ?
-
-ﾞ?
-
-ﾟ?
-
-￠?
-
-￡?
-
-￣?
-
-￥?
-
-￦?
-
-�??
\ No newline at end of file
@@ -1,2220 +0,0 @@
-
-
- 
-
- ֿ
-
-!
-
-"
-
-#
-
-$
-
-%
-
-&
-
-'
-
-(	
-
-)
-
-
-*
-
-+
-
-,
-
--
-
-.
-
-/
-
-0
-
-1
-
-2
-
-3
-
-4
-
-5
-
-6
-
-7
-
-8
-
-9
-
-:
-
-;
-
-<
-
-=
-
->
-
-? 
-
-@!
-
-A"
-
-B#
-
-C$
-
-D%
-
-E&
-
-F'
-
-G(
-
-H)
-
-I*
-
-J+
-
-K,
-
-L-
-
-M.
-
-N/
-
-O0
-
-O̟1
-
-P2
-
-Q3
-
-R4
-
-S5
-
-T6
-
-U7
-
-V8
-
-W9
-
-X:
-
-Y;
-
-Z<
-
-[=
-
-\>
-
-]?
-
-^@
-
-_A
-
-`B
-
-aC
-
-a̸D
-
-bE
-
-cF
-
-dG
-
-eH
-
-e̟I
-
-e̱J
-
-fK
-
-gL
-
-hM
-
-iN
-
-i̇O
-
-i̟P
-
-jQ
-
-kR
-
-lS
-
-mT
-
-m̃U
-
-nV
-
-oW
-
-o̟X
-
-pY
-
-qZ
-
-r[
-
-s\
-
-s̟]
-
-t^
-
-t̃_
-
-u`
-
-u̟a
-
-u̸b
-
-vc
-
-wd
-
-xe
-
-yf
-
-zg
-
-{h
-
-|i
-
-}j
-
-~k
-
- l
-
-¡m
-
-¢n
-
-£o
-
-¤p
-
-¥q
-
-¦r
-
-§s
-
-¨t
-
-©u
-
-ªv
-
-«w
-
-¬x
-
-­y
-
-®z
-
-¯{
-
-°|
-
-±}
-
-²~
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˚
-
-˜
-
-˝
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-К
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-У
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ц
-
-ч
-
-ш
-
-ы
-
-ь
-
-ю
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-־
-
-ֿ
-
-׃
-
-א
-	
-אְ
-	
-אֱ
-	
-אֲ
-	
-אֳ
-	
-אִ
-	
-אֵ
-	
-אֶ
-	
-אַ
-
-אַַ
-	
-אָ
-
-אָָ
-	
-אֹ
-	
-אֻ
-
-ב
-	
-בְ
-
-בְּ
-	
-בִ
-
-בִּ
-	
-בֵ
-
-בֵּ
-	
-בֶ
-
-בֶּ
-	
-בַ
-
-בַּ
-	
-בָ
-
-בָּ
-
-בָֿ
-	
-בֹ
-
-בֹּ
-	
-בֻ
-	
-בּ
-	
-בֿ
-
-ג
-	
-גְ
-
-גְּ
-	
-גִ
-
-גִּ
-	
-גֵ
-
-גֵּ
-	
-גֶ
-
-גֶּ
-	
-גַ
-
-גַּ
-	
-גָ
-
-גָּ
-	
-גֹ
-
-גֹּ
-	
-גֻ
-	
-גּ
-
-ד
-	
-דְ
-
-דְּ
-	
-דִ
-
-דִּ
-	
-דֵ
-
-דֵּ
-	
-דֶ
-
-דֶּ
-	
-דַ
-
-דַּ
-	
-דָ
-
-דָּ
-	
-דֹ
-
-דֹּ
-	
-דֻ
-	
-דּ
-
-ה
-	
-הְ
-	
-הֱ
-	
-הֲ
-	
-הֳ
-	
-הִ
-	
-הֵ
-	
-הֶ
-	
-הַ
-
-הַּ
-	
-הָ
-	
-הֹ
-	
-הֻ
-	
-הּ
-
-ו
-	
-וְ
-
-וְּ
-	
-וִ
-
-וִּ
-	
-וֵ
-
-וֵּ
-	
-וֶ
-
-וֶּ
-	
-וַ
-
-וַּ
-	
-וָ
-
-וָּ
-	
-וֹ
-	
-וּ
-	
-וׁ
-	
-וׂ
-
-ז
-	
-זְ
-
-זְּ
-	
-זִ
-
-זִּ
-	
-זֵ
-
-זֵּ
-	
-זֶ
-
-זֶּ
-	
-זַ
-
-זַּ
-	
-זָ
-
-זָּ
-	
-זֹ
-
-זֹּ
-	
-זּ
-
-ח
-	
-חְ
-	
-חֱ
-	
-חֲ
-	
-חֳ
-	
-חִ
-	
-חֵ
-	
-חֶ
-	
-חַ
-	
-חָ
-	
-חֹ
-	
-חֻ
-
-ט
-	
-טְ
-
-טְּ
-	
-טִ
-
-טִּ
-	
-טֵ
-
-טֵּ
-	
-טֶ
-
-טֶּ
-	
-טַ
-
-טַּ
-	
-טָ
-
-טָּ
-	
-טֹ
-
-טֹּ
-	
-טֻ
-	
-טּ
-
-י
-	
-יְ
-
-יְּ
-	
-יִ
-
-יִּ
-	
-יֵ
-
-יֵּ
-	
-יֶ
-
-יֶּ
-	
-יַ
-
-יַּ
-	
-יָ
-
-יָּ
-	
-יֹ
-
-יֹּ
-	
-יֻ
-	
-יּ
-
-ך
-	
-ךְ
-	
-ךָ
-
-ךָּ
-	
-ךּ
-
-כ
-	
-כְ
-
-כְּ
-	
-כִ
-
-כִּ
-	
-כֵ
-
-כֵּ
-	
-כֶ
-
-כֶּ
-	
-כַ
-
-כַּ
-	
-כָ
-
-כָּ
-	
-כֹ
-
-כֹּ
-	
-כֻ
-
-כֻּ
-	
-כּ
-
-ל
-	
-לְ
-
-לְּ
-	
-לִ
-
-לִּ
-	
-לֵ
-
-לֵּ
-	
-לֶ
-
-לֶּ
-	
-לַ
-
-לִַ
-
-לַּ
-	
-לָ
-
-לִָ
-
-לָּ
-	
-לֹ
-
-לֹּ
-	
-לֻ
-
-לֻּ
-	
-לּ
-
-ם
-
-מ
-	
-מְ
-
-מְּ
-	
-מִ
-
-מִּ
-	
-מֵ
-
-מֵּ
-	
-מֶ
-
-מֶּ
-	
-מַ
-
-מַּ
-	
-מָ
-
-מָּ
-	
-מֹ
-
-מֹּ
-	
-מֻ
-	
-מּ
-
-ן
-	
-ןָ
-
-נ
-	
-נְ
-
-נְּ
-	
-נִ
-
-נִּ
-	
-נֵ
-
-נֵּ
-	
-נֶ
-
-נֶּ
-	
-נַ
-
-נַּ
-	
-נָ
-
-נָּ
-	
-נֹ
-
-נֹּ
-	
-נֻ
-	
-נּ
-
-ס
-	
-סְ
-
-סְּ
-	
-סִ
-
-סִּ
-	
-סֵ
-
-סֵּ
-	
-סֶ
-
-סֶּ
-	
-סַ
-
-סַּ
-	
-סָ
-
-סָּ
-	
-סֹ
-
-סֹּ
-	
-סֻ
-	
-סּ
-
-ע
-	
-עְ
-	
-עֱ
-	
-עֲ
-	
-עֳ
-	
-עִ
-	
-עֵ
-	
-עֶ
-	
-עַ
-	
-עָ
-	
-עֹ
-	
-עֻ
-
-ף
-	
-ףּ
-
-פ
-	
-פְ
-
-פְּ
-	
-פִ
-
-פִּ
-	
-פֵ
-
-פֵּ
-	
-פֶ
-
-פֶּ
-	
-פַ
-
-פַּ
-	
-פָ
-
-פָּ
-
-פָֿ
-	
-פֹ
-
-פֹּ
-	
-פֻ
-	
-פּ
-
-פּֿ
-	
-פֿ
-
-פֿֿ
-
-ץ
-
-צ
-	
-צְ
-
-צְּ
-	
-צִ
-
-צִּ
-	
-צֵ
-
-צֵּ
-	
-צֶ
-
-צֶּ
-	
-צַ
-
-צַּ
-	
-צָ
-
-צָּ
-	
-צֹ
-
-צֹּ
-	
-צֻ
-	
-צּ
-
-ק
-	
-קְ
-
-קְּ
-	
-קִ
-
-קִּ
-	
-קֵ
-
-קֵּ
-	
-קֶ
-
-קֶּ
-	
-קַ
-
-קַּ
-	
-קָ
-
-קָּ
-	
-קֹ
-
-קֹּ
-	
-קֻ
-	
-קּ
-
-ר
-	
-רְ
-	
-רִ
-	
-רֵ
-	
-רֶ
-	
-רַ
-	
-רָ
-	
-רֹ
-	
-רֻ
-
-ש
-	
-שְ
-
-שְּׁ
-
-שְּׂ
-
-שְׁ
-
-שְׂ
-	
-שִ
-
-שִּׁ
-
-שִּׂ
-
-שִׁ
-
-שִׂ
-	
-שֵ
-
-שֵּׁ
-
-שֵּׂ
-
-שֵׁ
-
-שֵׂ
-	
-שֶ
-
-שֶּׁ
-
-שֶּׂ
-
-שֶׁ
-
-שֶׂ
-	
-שַ
-
-שַּׁ
-
-שַׁ
-
-שַׂ
-	
-שָ
-
-שָּׁ
-
-שָּׂ
-
-שָׁ
-
-שָׂ
-
-שֹּׁ
-
-שֹׁ
-
-שֹׂ
-
-שֻׁ
-
-שּׁ
-	
-שׁ
-	
-שׂ
-
-ת
-	
-תְ
-
-תְּ
-	
-תִ
-
-תִּ
-	
-תֵ
-
-תֵּ
-	
-תֶ
-
-תֶּ
-	
-תַ
-
-תַּ
-	
-תָ
-
-תָּ
-	
-תֹ
-
-תֹּ
-	
-תֻ
-
-תֻּ
-	
-תּ
-
-װ
-
-ױ
-
-ײ
-	
-ײִ
-	
-ײַ
-
-׳
-
-״
-
-ا
-
-ل
-
-क
-
-त
-
-य
-
-र
-
-ा
-
-ि
-
-ी
-
-०
-
-০
-
-க
-
-ப
-
-ா
-
-ാ
-
-ി
-
-་
-
-།
-
-៰
-
-ᵒ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ṁ
-
-ṁ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-‍
-
-‐
-
-‑
-
-‒
-
-–
-
-—
-
-―
-
-‘
-
-’
-
-‚
-
-“
-
-”
-
-„
-
-†
-
-‡
-
-•
-
-‣
-
-…
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-⁄
-
-⁰
-
-⁹
-
-₁
-
-₂
-
-₤
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-№
-
-℗
-
-™
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↳
-
-↺
-
-⇒
-
-⇓
-
-−
-
-∙
-
-√
-
-∞
-
-≈
-
-≠
-
-≤
-
-≥
-
-≫
-
-⋅
-
-⋆
-
-⌁
-
-⏭
-
-Ⓒ
-
-Ⓡ
-
-─
-
-│
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▾
-
-◂
-
-◄
-
-◆
-
-◇
-
-◊
-
-○
-
-●
-
-◘
-
-☀
-
-★
-
-☆
-
-☎
-
-☐
-
-☛
-
-☞
-
-☹
-
-☺
-
-♂
-
-♡
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-⚫
-
-✅
-
-✈
-
-✓
-
-✔
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➖
-
-➜
-
-➡
-
-➤
-
-⟫
-
-⠀
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-》
-
-【
-
-】
-
-・
-
-ꞌ
-
-ﬁ
-
-，
-
-：
-
-￡
-
-￥
-
-�
\ No newline at end of file
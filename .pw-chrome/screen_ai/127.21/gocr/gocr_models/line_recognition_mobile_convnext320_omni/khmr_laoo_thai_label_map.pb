@@ -1,12987 +0,0 @@
-
-
- 
-
- ์
-
- ັ
-
- ັິ
-
-
- ັົ້
-
- ັຼ
-
- ັ່
-
-
- ັ່້
-
- ັ້
-
- ຳ	
-
- ິ
-
-
- ິິ
-
- ິີ້່
-
- ິ່
-
- ິ້
-
- ິໍ
-
-
- ິໍ້
-
- ີ
-
- ີ່
-
- ີ້
-
-
- ີ້່
-
- ີໍ
-
- ຶ
-
- ຶ່
-
- ຶ້
-
- ື
-
- ືຼ
-
- ື່
-
-
- ື່່
-
- ື້
-
- ຸ
-
- ຸ່
-
- ຸ້ 
-
- ູ!
-
- ູ່"
-
- ູ້#
-
- ົ$
-
-
- ົີ່%
-
-
- ົຸ້&
-
- ົ່'
-
- ົ້(
-
-
- ົ້ັ)
-
-
- ົ້ີ*
-
-
- ົ້ື+
-
-
- ົ້ໍ,
-
- ຼ-
-
- ຼັ.
-
- ຼັຼັຼັ/
-
-
- ຼັ້0
-
- ຼື1
-
- ຼຸ2
-
-
- ຼຸ້3
-
-
- ຼົ່4
-
- ຼ່5
-
- ່6
-
- ່ັ7
-
- ່ິ8
-
- ່ີ9
-
- ່ຶ:
-
- ່ື;
-
- ຸ່<
-
- ູ່=
-
- ່ົ>
-
- ່່?
-
- ່່ີ່@
-
-
- ່່່A
-
- ່້B
-
- ່ໍC
-
- ້D
-
- ້ັE
-
- ູ້F
-
- ້່G
-
- ້້H
-
- ້ໍI
-
-
- ້ໍ່J
-
- ໊K
-
- ໋L
-
- ໌M
-
- ໍN
-
-
- ໍື້O
-
- ໍ່P
-
-
- ໍ່່Q
-
- ໍ້R
-
-
- ໍ້່S
-
- ាT
-
- ាំU
-
- ិV
-
- ីW
-
- ឹX
-
- ឺY
-
- ួZ
-
- ើ[
-
- ឿ\
-
- ៀ]
-
- េ^
-
- ែ_
-
- ៃ`
-
- ៅa
-
- ៈb
-
- ៉c
-
- ្គd
-
- ្ងe
-
- ្ញf
-
- ្ទg
-
- ្នh
-
- ្មi
-
- ្រj
-
- ្លk
-
-!l
-
-"m
-
-#n
-
-$o
-
-%p
-
-&q
-
-'r
-
-(s
-
-(ុt
-
-(ៈu
-
-(់v
-
-(៌w
-
-)x
-
-)ៈy
-
-*z
-
-+{
-
-,|
-
--}
-
-.~
-
-/
-
-0
-
-1
-
-2
-
-3
-
-4
-
-5
-
-6
-
-7
-
-8
-
-9
-
-:
-
-;
-
-<
-
-=
-
->
-
-?
-
-@
-
-A
-
-B
-
-C
-
-D
-
-E
-
-E̟
-
-F
-
-G
-
-H
-
-I
-
-J
-
-K
-
-L
-
-M
-
-N
-
-O
-
-O̟
-
-P
-
-Q
-
-R
-
-S
-
-T
-
-U
-
-V
-
-W
-
-X
-
-Y
-
-Z
-
-[
-
-\
-
-\\
-
-]
-
-^
-
-_
-
-`
-
-a
-
-à
-
-á
-
-ã
-
-ả
-
-ạ
-
-a̸
-
-b
-
-c
-
-c̈
-
-d
-
-ḍ
-
-e
-
-è
-
-é
-
-ẽ
-
-e̟
-
-ẹ
-
-e̱
-
-f
-
-g
-
-h
-
-ḥ
-
-i
-
-ì
-
-í
-
-ĩ
-
-i̟
-
-ị
-
-j
-
-k
-
-l
-
-m
-
-m̃
-
-n
-
-ǹ
-
-o
-
-ò
-
-ó
-
-ỏ
-
-o̟
-
-ọ
-
-p
-
-p̃
-
-q
-
-r
-
-ṛ
-
-s
-
-s̟
-
-ṣ
-
-t
-
-t̃
-
-ṭ
-
-u
-
-ù
-
-ú
-
-ũ
-
-ủ
-
-u̟
-
-ụ
-
-u̸
-
-v
-
-v̄
-
-v̈
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-
- 
-	
- ̃
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-­
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-	
-ầ
-	
-ấ
-	
-ậ
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-	
-ề
-	
-ế
-	
-ễ
-	
-ể
-	
-ệ
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-	
-ồ
-	
-ố
-	
-ỗ
-	
-ổ
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-	
-ắ
-	
-ặ
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ŗ
-
-ŗ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɣ
-
-Ɩ
-
-Ơ
-
-ơ
-	
-ờ
-	
-ớ
-	
-ợ
-
-ƭ
-
-Ư
-
-ư
-	
-ừ
-	
-ứ
-	
-ữ
-	
-ử
-	
-ự
-
-ƴ
-
-ǎ
-
-ǐ
-
-ǝ
-
-Ǧ
-
-ǧ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-ȳ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̀
-	
-ɔ́
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-	
-ə́
-
-ɛ
-	
-ɛ̀
-	
-ɛ̃
-	
-ɛ̈
-
-ɣ
-
-ɧ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʒ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˙
-
-˚
-
-˜
-
-˝
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-،
-
-؛
-
-؟
-
-ا
-
-ل
-
-क
-
-त
-
-य
-
-र
-
-ा
-
-ि
-
-ी
-
-।
-
-॥
-
-०
-
-০
-
-க
-
-ப
-
-ா
-
-ാ
-
-ി
-
-ก
-
-กั
-
-	กั่
-
-	กั้
-
-	กั๊
-
-	กั๋
-
-กำ
-
-กิ
-
-	กิ่
-
-	กิ้
-
-	กิ๊
-
-	กิ๋
-
-กี
-
-	กี่
-
-	กี้
-
-	กี๊
-
-	กี๋
-
-กึ
-
-	กึ่
-
-กื
-
-	กื่
-
-	กื้
-
-กุ
-
-	กุ่
-
-	กุ้
-
-	กุ๊
-
-	กุ๋
-
-กู
-
-	กู่
-
-	กู้
-
-	กู๊
-
-กฺ
-
-ก็
-
-ก่
-
-	ก่ำ
-
-ก้
-
-	ก้ำ
-
-ก๊
-
-ก๋
-
-ก์
-
-กํ
-
-ข
-
-ขั
-
-	ขั่
-
-	ขั้
-
-ขำ
-
-ขิ
-
-	ขิ่
-
-ขี
-
-	ขี่
-
-	ขี้
-
-ขึ
-
-	ขึ่
-
-	ขึ้
-
-ขื
-
-	ขื่
-
-ขุ
-
-	ขุ่
-
-ขู
-
-	ขู่
-
-ข็
-
-ข่
-
-ข้
-
-ข์
-
-ฃ
-
-ค
-
-คั
-
-	คั่
-
-	คั้
-
-คำ
-
-คิ
-
-	คิ่
-
-	คิ้
-
-	คิ๊
-
-คี
-
-	คี่
-
-	คี้
-
-คึ
-
-คื
-
-คุ
-
-	คุ่
-
-	คุ้
-
-คู
-
-	คู่
-
-	คู้
-
-คฺ
-
-ค็
-
-ค่
-
-	ค่ำ
-
-ค้
-
-	ค้ำ
-
-ค๊
-
-ค์
-
-คํ
-
-ฅ
-
-ฆ
-
-ฆั
-
-ฆิ
-
-	ฆี่
-
-ฆ่
-
-ฆ้
-
-ฆ์
-
-ง
-
-งั
-
-	งั่
-
-	งั้
-
-งำ
-
-งิ
-
-	งิ้
-
-งี
-
-	งี่
-
-	งี้
-
-งื
-
-	งื่
-
-	งื้
-
-งุ
-
-	งุ่
-
-	งุ้
-
-งู
-
-งฺ
-
-ง็
-
-ง่
-
-ง้
-
-จ
-
-จั
-
-	จั่
-
-	จั้
-
-	จั๊
-
-	จั๋
-
-จำ
-
-จิ
-
-	จิ่
-
-	จิ้
-
-	จิ๊
-
-	จิ๋
-
-จี
-
-	จี่
-
-	จี้
-
-	จี๊
-
-	จี๋
-
-จึ
-
-	จึ่
-
-จื
-
-	จื่
-
-	จื้
-
-	จื๊
-
-จุ
-
-	จุ่
-
-	จุ้
-
-	จุ๊
-
-	จุ๋
-
-จู
-
-	จู่
-
-	จู้
-
-	จู๊
-
-	จู๋
-
-จฺ
-
-จ็
-
-จ่
-
-จ้
-
-จ๊
-
-จ๋
-
-จ์
-
-จํ
-
-ฉ
-
-ฉั
-
-	ฉั่
-
-	ฉั้
-
-ฉำ
-
-ฉิ
-
-	ฉิ่
-
-ฉี
-
-	ฉี่
-
-ฉื
-
-	ฉื่
-
-ฉุ
-
-ฉู
-
-	ฉู่
-
-ฉ่
-
-	ฉ่ำ
-
-ฉ้
-
-ช
-
-ชั
-
-	ชั่
-
-	ชั้
-
-ชำ
-
-ชิ
-
-	ชิ่
-
-	ชิ้
-
-ชี
-
-	ชี่
-
-	ชี้
-
-	ชึ่
-
-	ชึ้
-
-ชื
-
-	ชื่
-
-	ชื้
-
-ชุ
-
-	ชุ่
-
-ชู
-
-	ชู่
-
-	ชู้
-
-	ชู๊
-
-ชฺ
-
-ช็
-
-ช่
-
-	ช่ำ
-
-ช้
-
-	ช้ำ
-
-ช๊
-
-ช์
-
-ซ
-
-ซั
-
-	ซั่
-
-ซำ
-
-ซิ
-
-	ซิ่
-
-	ซิ้
-
-ซี
-
-	ซี่
-
-	ซี้
-
-	ซี๊
-
-ซึ
-
-	ซึ่
-
-	ซึ้
-
-ซื
-
-	ซื่
-
-	ซื้
-
-ซุ
-
-	ซุ่
-
-	ซุ้
-
-ซู
-
-	ซู่
-
-ซ็
-
-ซ่
-
-ซ้
-
-	ซ้ำ
-
-ซ๊
-
-ซ์
-
-ฌ
-
-ฌั
-
-ฌิ
-
-ฌี
-
-ฌู
-
-ฌ็
-
-ฌ์
-
-ญ
-
-ญั
-
-ญิ
-
-ญี
-
-	ญี่
-
-ญุ
-
-ญู
-
-ญฺ
-
-ญ่
-
-ญ้
-
-ญ์
-
-ฎ
-
-ฎิ
-
-	ฎิ์
-
-ฎี
-
-ฎ์
-
-ฏ
-
-ฏิ
-
-ฏี
-
-ฏฺ
-
-ฏ์
-
-ฐ
-
-ฐั
-
-ฐิ
-
-ฐี
-
-ฐ์
-
-ฑ
-
-ฑั
-
-ฑิ
-
-ฑี
-
-ฑุ
-
-ฑู
-
-ฑฺ
-
-ฑ์
-
-ฒ
-
-ฒิ
-
-ฒ่
-
-ณ
-
-ณั
-
-ณิ
-
-ณี
-
-ณื
-
-ณุ
-
-ณู
-
-ณฺ
-
-ณ์
-
-ด
-
-ดั
-
-	ดั่
-
-	ดั้
-
-	ดั๊
-
-ดำ
-
-ดิ
-
-	ดิ่
-
-	ดิ้
-
-	ดิ๊
-
-	ดิ์
-
-ดี
-
-	ดี่
-
-	ดี้
-
-	ดี๋
-
-ดึ
-
-	ดึ๊
-
-ดื
-
-	ดื่
-
-	ดื้
-
-ดุ
-
-	ดุ้
-
-	ดุ๊
-
-	ดุ์
-
-ดู
-
-	ดู่
-
-	ดู๊
-
-	ดู๋
-
-ด็
-
-ด่
-
-ด้
-
-ด๊
-
-ด๋
-
-ด์
-
-ต
-
-ตั
-
-	ตั่
-
-	ตั้
-
-	ตั๊
-
-	ตั๋
-
-ตำ
-
-ติ
-
-	ติ่
-
-	ติ้
-
-	ติ๊
-
-	ติ๋
-
-	ติ์
-
-ตี
-
-	ตี่
-
-	ตี้
-
-	ตี๊
-
-	ตี๋
-
-ตึ
-
-	ตึ้
-
-	ตึ๊
-
-ตื
-
-	ตื่
-
-	ตื้
-
-ตุ
-
-	ตุ่
-
-	ตุ้
-
-	ตุ๊
-
-	ตุ๋
-
-ตู
-
-	ตู่
-
-	ตู้
-
-ตฺ
-
-ต็
-
-ต่
-
-	ต่ำ
-
-ต้
-
-ต๊
-
-ต๋
-
-ต์
-
-ตํ
-
-ถ
-
-ถั
-
-	ถั่
-
-ถิ
-
-	ถิ่
-
-	ถิ์
-
-ถี
-
-	ถี่
-
-ถึ
-
-ถื
-
-	ถื่
-
-ถุ
-
-	ถุ์
-
-ถู
-
-ถ่
-
-ถ้
-
-	ถ้ำ
-
-ถ์
-
-ท
-
-ทั
-
-	ทั่
-
-	ทั้
-
-ทำ
-
-ทิ
-
-	ทิ่
-
-	ทิ้
-
-ที
-
-	ที่
-
-ที่ำ
-
-ทึ
-
-	ทึ่
-
-ทื
-
-	ทื่
-
-ทุ
-
-	ทุ่
-
-	ทุ้
-
-ทู
-
-	ทู่
-
-	ทู้
-
-ทฺ
-
-ท็
-
-ท่
-
-ท้
-
-ท๊
-
-ท์
-
-ทํ
-
-ธ
-
-ธั
-
-ธำ
-
-ธิ
-
-	ธิ์
-
-ธี
-
-	ธี่
-
-ธึ
-
-ธุ
-
-	ธุ์
-
-ธู
-
-ธ่
-
-ธ์
-
-น
-
-นั
-
-	นั่
-
-	นั้
-
-นำ
-
-นิ
-
-	นิ่
-
-	นิ้
-
-นี
-
-	นี่
-
-	นี้
-
-นึ
-
-	นึ่
-
-	นึ้
-
-นื
-
-	นื่
-
-	นื้
-
-นุ
-
-	นุ่
-
-	นุ้
-
-	นุ๊
-
-นู
-
-	นู้
-
-นฺ
-
-น็
-
-น่
-
-	น่ำ
-
-น้
-
-	น้ำ
-
-น๊
-
-น์
-
-นํ
-
-	นํ้
-
-บ
-
-บั
-
-	บั่
-
-	บั้
-
-	บั๊
-
-บำ
-
-บิ
-
-	บิ่
-
-	บิ้
-
-	บิ๊
-
-บี
-
-	บี่
-
-	บี้
-
-บึ
-
-	บึ้
-
-บื
-
-	บื่
-
-	บื้
-
-บุ
-
-	บุ่
-
-	บุ้
-
-	บุ๊
-
-	บุ๋
-
-บู
-
-	บู่
-
-	บู๊
-
-บ็
-
-บ่
-
-บ้
-
-บ๊
-
-บ๋
-
-บ์
-
-ป
-
-ปั
-
-	ปั่
-
-	ปั้
-
-	ปั๊
-
-	ปั๋
-
-ปำ
-
-ปิ
-
-	ปิ่
-
-	ปิ้
-
-	ปิ๊
-
-ปี
-
-	ปี่
-
-	ปี้
-
-	ปี๊
-
-ปึ
-
-	ปึ๊
-
-ปื
-
-	ปื่
-
-	ปื้	
-
-ปุ	
-
-	ปุ่	
-
-	ปุ้	
-
-	ปุ๊	
-
-	ปุ๋	
-
-ปู	
-
-	ปู่	
-
-	ปู้	
-
-	ปู๋	
-
-ปฺ	
-
-ป็	
-
-ป่	
-
-ป้	
-
-ป๊	
-
-ป๋	
-
-ป์	
-
-ผ	
-
-ผั	
-
-ผิ	
-
-ผี	
-
-	ผึ่	
-
-	ผึ้	
-
-ผื	
-
-	ผื่	
-
-ผุ	
-
-	ผุ้	
-
-ผู	
-
-	ผู่	
-
-	ผู้	
-
-ผ็	
-
-ผ่	
-
-ผ้	
-
-ฝ	
-
-ฝั	
-
-	ฝั่	
-
-	ฝั้	
-
-ฝิ	
-
-	ฝิ่	
-
-ฝี	
-
-ฝึ	
-
-ฝื	
-
-	ฝุ่	
-
-ฝู	
-
-	ฝู่	
-
-ฝ่	
-
-ฝ้	
-
-พ	
-
-พั	
-
-	พั้	
-
-	พั๊	
-
-พำ	
-
-พิ	
-
-	พิ่	
-
-	พิ้	
-
-พี	
-
-	พี่	
-
-	พี้	
-
-พึ	
-
-	พึ่	
-
-พื	
-
-	พื่	
-
-	พื้	
-
-พุ	
-
-	พุ่	
-
-	พุ้	
-
-พู	
-
-	พู่	
-
-พฺ	
-
-พ็	
-
-พ่	
-
-พ้	
-
-พ์	
-
-ฟ	
-
-ฟั	
-
-	ฟั่	
-
-ฟิ	
-
-ฟี	
-
-	ฟี่	
-
-	ฟี้	
-
-ฟื	
-
-	ฟื่	
-
-	ฟื้	
-
-ฟุ	
-
-	ฟุ่	
-
-	ฟุ้	
-
-ฟู	
-
-	ฟู่	
-
-	ฟู้	
-
-ฟ็	
-
-ฟ่	
-
-ฟ้	
-
-ฟ์	
-
-ภ	
-
-ภั	
-
-ภิ	
-
-ภี	
-
-ภุ	
-
-ภู	
-
-	ภู่	
-
-ภ้	
-
-ภ์	
-
-ม	
-
-มั	
-
-	มั่	
-
-	มั้	
-
-มิ	
-
-	มิ่	
-
-	มิ้	
-
-	มิ์	
-
-มี	
-
-	มี่	
-
-	มี้	
-
-มึ	
-
-มื	
-
-	มื่	
-
-	มื้	
-
-มุ	
-
-	มุ่	
-
-	มุ้	
-
-มู	
-
-	มู่	
-
-	มู้	
-
-มฺ	
-
-ม็	
-
-ม่	
-
-	ม่ำ	
-
-ม้	
-
-ม๊
-
-
-ม์
-
-
-ย
-
-
-ยั
-
-
-	ยั่
-
-
-	ยั้
-
-
-ยำ
-
-
-ยิ
-
-
-	ยิ่
-
-
-	ยิ้
-
-
-ยี
-
-
-	ยี่
-
-
-	ยี้
-
-
-ยึ
-
-
-ยื
-
-
-	ยื่
-
-
-	ยื้
-
-
-ยุ
-
-
-	ยุ่
-
-
-	ยุ้
-
-
-ยู
-
-
-	ยู่
-
-
-	ยู้
-
-
-	ยู๋
-
-
-ยฺ
-
-
-ย็
-
-
-ย่
-
-
-	ย่ำ
-
-
-ย้
-
-
-	ย้ำ
-
-
-ย์
-
-
-ร
-
-
-รั
-
-
-	รั่
-
-
-	รั้
-
-
-รำ
-
-
-ริ
-
-
-	ริ่
-
-
-	ริ้
-
-
-	ริ๊
-
-
-	ริ์
-
-
-รี
-
-
-	รี่
-
-
-	รี้
-
-
-	รี๊
-
-
-รึ
-
-
-	รึ่
-
-
-	รึ้
-
-
-รื
-
-
-	รื่
-
-
-	รื้
-
-
-รุ
-
-
-	รุ่
-
-
-	รุ้
-
-
-	รุ๊
-
-
-รู
-
-
-	รู่
-
-
-	รู้
-
-
-	รู๊
-
-
-รฺ
-
-
-ร็
-
-
-ร่
-
-
-	ร่ำ
-
-
-ร้
-
-
-ร๊
-
-
-ร์
-
-
-รํ
-
-
-ฤ
-
-
-ล
-
-
-ลั
-
-
-	ลั่
-
-
-	ลั้
-
-
-	ลั๊
-
-
-ลำ
-
-
-ลิ
-
-
-	ลิ่
-
-
-	ลิ้
-
-
-ลี
-
-
-	ลี่
-
-
-	ลี้
-
-
-ลึ
-
-
-	ลึ่
-
-
-ลื
-
-
-	ลื่
-
-
-	ลื้
-
-
-ลุ
-
-
-	ลุ่
-
-
-	ลุ้
-
-
-	ลุ๊
-
-
-ลู
-
-
-	ลู่
-
-
-ล็
-
-
-ล่
-
-
-	ล่ำ
-
-
-ล้
-
-
-	ล้ำ
-
-
-ล๊
-
-
-ล์
-
-
-ลํ
-
-
-	ลํ้
-
-
-ฦ
-
-
-ว
-
-
-วั
-
-
-	วั่
-
-
-วิ
-
-
-	วิ่
-
-
-	วิ้
-
-
-	วิ๋
-
-
-วี
-
-
-	วี่
-
-
-	วี้
-
-
-	วึ่
-
-
-วื
-
-
-วุ
-
-
-	วุ่
-
-
-	วุ้
-
-
-วู
-
-
-	วู่
-
-
-	วู้
-
-
-	วู๊
-
-
-ว็
-
-
-ว่
-
-
-	ว่ำ
-
-
-ว้
-
-
-ว๊
-
-
-ว๋
-
-
-ว์
-
-
-วํ
-
-
-ศ
-
-ศั
-
-ศิ
-
-ศี
-
-ศึ
-
-ศุ
-
-ศู
-
-ศ็
-
-ศ์
-
-ษ
-
-ษั
-
-ษิ
-
-ษี
-
-ษุ
-
-ษ์
-
-ส
-
-สั
-
-	สั่
-
-	สั้
-
-สำ
-
-สิ
-
-	สิ่
-
-	สิ้
-
-สี
-
-	สี่
-
-	สี้
-
-สึ
-
-สื
-
-	สื่
-
-	สื้
-
-สุ
-
-	สุ่
-
-	สุ้
-
-สู
-
-	สู่
-
-	สู้
-
-สฺ
-
-ส็
-
-ส่
-
-	ส่ำ
-
-ส้
-
-ส์
-
-สํ
-
-ห
-
-หั
-
-	หั่
-
-หำ
-
-หิ
-
-	หิ่
-
-	หิ้
-
-หี
-
-	หี่
-
-	หี้
-
-หึ
-
-	หึ่
-
-หื
-
-	หื้
-
-หุ
-
-	หุ่
-
-	หุ้
-
-หู
-
-	หู่
-
-	หู้
-
-หฺ
-
-ห็
-
-ห่
-
-	ห่ำ
-
-ห้
-
-	ห้ำ
-
-ห์
-
-ฬ
-
-ฬิ
-
-ฬุ
-
-ฬ่
-
-อ
-
-อั
-
-	อั้
-
-	อั๊
-
-	อั๋
-
-อำ
-
-อิ
-
-	อิ่
-
-	อิ้
-
-	อิ๊
-
-	อิ๋
-
-อี
-
-	อี่
-
-	อี้
-
-	อี๊
-
-	อี๋
-
-อึ
-
-	อึ่
-
-	อึ้
-
-	อึ๊
-
-อื
-
-	อื่
-
-	อื้
-
-อุ
-
-	อุ่
-
-	อุ้
-
-	อุ๊
-
-	อุ๋
-
-อู
-
-	อู่
-
-	อู้
-
-	อู๊
-
-	อู๋
-
-อฺ
-
-อ็
-
-อ่
-
-	อ่ำ
-
-อ้
-
-อ๊
-
-อ๋
-
-อ์
-
-ฮ
-
-ฮั
-
-	ฮั่
-
-	ฮั้
-
-ฮิ
-
-ฮี
-
-	ฮี้
-
-ฮึ
-
-ฮื
-
-ฮุ
-
-	ฮุ่
-
-	ฮุ้
-
-ฮู
-
-	ฮู่
-
-	ฮู้
-
-ฮฺ
-
-ฮ็
-
-ฮ่
-
-ฮ้
-
-ฮ๊
-
-ฮ์
-
-ฯ
-
-ะ
-
-ั
-
-า
-
-า่
-
-ำ
-
-ิ
-
-ี
-
-ึ
-
-ื
-
-ุ
-
-ู
-
-ฺ
-
-฿
-
-เ
-
-แ
-
-โ
-
-ใ
-
-ไ
-
-ๅ
-
-ๆ
-
-็
-
-่
-
-้
-
-๊
-
-๋
-
-์
-
-ํ
-
-๎
-
-๏
-
-๐
-
-๑
-
-๒
-
-๓
-
-๔
-
-๕
-
-๖
-
-๗
-
-๘
-
-๙
-
-๚
-
-๛
-
-ກ
-
-ກັ
-
-	ກັັ
-
-ກັັັ
-
-ກັຶັຶັຶ
-
-	ກັ່
-
-	ກັ້
-
-	ກັ໋
-
-ກຳ
-
-	ກຳ່
-
-ກິ
-
-	ກິີ
-
-	ກິ່
-
-	ກິ້
-
-	ກິ໋
-
-ກີ
-
-ກີີີ
-
-	ກີ່
-
-	ກີ້
-
-ກຶ
-
-	ກຶ່
-
-ກື
-
-ກືືື
-
-	ກື່
-
-	ກື້
-
-ກຸ
-
-ກຸຸ່
-
-	ກຸ່
-
-	ກຸ້
-
-ກູ
-
-ກູື້
-
-ກູຸ້
-
-ກູູູ
-
-	ກູ່
-
-	ກູ້
-
-ກົ
-
-ກົົົ
-
-	ກົ່
-
-	ກົ້
-
-ກຼ
-
-	ກຼັ
-
-ກຼັຼັຼັ
-
-	ກຼີ
-
-	ກຼຸ
-
-ກ່
-
-	ກ່ັ
-
-	ກ່ຳ
-
-	ກ່ີ
-
-	ກຸ່
-
-	ກ່່
-
-ກ່່່່
-
-	ກ່ໍ
-
-ກ້
-
-	ກ້ຳ
-
-	ກູ້
-
-ກ້້້້
-
-ກ໊
-
-ກ໋
-
-ກ໌
-
-ກໍ
-
-	ກໍ່
-
-	ກໍ້
-
-	ກໍ໋
-
-	ກໍໍ
-
-ກໍໍ່
-
-ຂ
-
-ຂັ
-
-ຂັື້
-
-ຂັຸ້
-
-	ຂັ່
-
-	ຂັ້
-
-ຂຳ
-
-ຂິ
-
-	ຂິ່
-
-	ຂິ້
-
-ຂີ
-
-	ຂີ່
-
-	ຂີ້
-
-ຂຶ
-
-ຂຶຸ້
-
-	ຂຶ່
-
-	ຂຶ້
-
-ຂື
-
-ຂືຶ້
-
-ຂືຸ້
-
-	ຂື່
-
-	ຂື້
-
-ຂຸ
-
-	ຂຸ່
-
-	ຂຸ້
-
-ຂູ
-
-	ຂູ່
-
-ຂົ
-
-ຂົື້
-
-ຂົຸ້
-
-	ຂົ່
-
-	ຂົ້
-
-ຂ່
-
-	ຂ່ຳ
-
-ຂ້
-
-	ຂ້ັ
-
-	ຂ້ົ
-
-	ຂ້່
-
-	ຂ້້
-
-	ຂ້ໍ
-
-ຂ໋
-
-ຂ໌
-
-ຂໍ
-
-ຂໍື້
-
-	ຂໍ່
-
-	ຂໍ້
- 
-ຂໍ້ໍ້ໍ້ໍ້
-
-	ຂໍ໊
-
-ຂໍໍໍໍ
-
-ຄ
-
-ຄັ
-
-ຄັື້
-
-ຄັຸ້
-
-	ຄັ່
-
-	ຄັ້
-
-ຄຳ
-
-	ຄຳ່
-
-ຄິ
-
-	ຄິ່
-
-	ຄິ້
-
-ຄີ
-
-	ຄີ່
-
-ຄຶ
-
-	ຄຶ່
-
-	ຄຶ້
-
-ຄື
-
-ຄືີ່
-
-	ຄືື
-
-	ຄື່
-
-ຄື່ຶ
-
-ຄື່່
-
-	ຄື້
-
-ຄຸ
-
-ຄຸັ້
-
-ຄຸື້
-
-	ຄຸຸ
-
-ຄຸຸີັ
-
-	ຄຸ່
-
-	ຄຸ້
-
-ຄູ
-
-	ຄູ່
-
-	ຄູ້
-
-ຄົ
-
-	ຄົື
-
-ຄົື້
-
-ຄົຸ້
-
-	ຄົົ
-
-	ຄົ່
-
-	ຄົ້
-
-ຄຼ
-
-	ຄຼິ
-
-	ຄຼີ
-
-	ຄຼໍ
-
-ຄ່
-
-	ຄ່ຳ
-
-	ຄ່ິ
-
-	ຄ່ື
-
-	ຄູ່
-
-	ຄ່່
-
-	ຄ່້
-
-ຄ້
-
-	ຄ້ຳ
-
-	ຄຸ້
-
-	ຄ້ໍ
-
-ຄ໋
-
-ຄ໌
-
-ຄໍ
-
-	ຄໍ່
-
-	ຄໍ້
-
-ງ
-
-ງັ
-
-ງັັັ
-
-	ງັ່
-
-	ງັ້
-
-ງັ້ັ້ັ້
-
-ງຳ
-
-ງິ
-
-ງິິິ
-
-	ງິ່
-
-ງິ່ິ່ິ່
-
-	ງິ້
-
-ງີ
-
-	ງີ່
-
-	ງີ້
-
-ງຶ
-
-	ງຶ່
-
-ງື
-
-ງືືື
-
-	ງື່
-
-ງື່ື່ື່
-
-	ງື້
-
-ງຸ
-
-	ງຸ່
-
-ງູ
-
-ງົ
-
-ງົົົ
-
-	ງົ່
-
-ງົ່ົ່ົ່
-
-	ງົ້
-
-	ງຼັ
-
-ງ່
-
-	ງຸ່
-
-ງ່່່
-
-ງ້
-
-ງ້້້
-
-ງ໋
-
-ງ໋ຶ່
-
-ງໍ
-
-	ງໍ້
-
-ຈ
-
-ຈັ
-
-	ຈັັ
-
-	ຈັ່
-
-	ຈັ້
-
-	ຈັ໊
-
-ຈຳ
-
-ຈິ
-
-	ຈິ່
-
-ຈິ່ຶ
-
-	ຈິ້
-
-ຈີ
-
-	ຈີ່
-
-	ຈີ້
-
-ຈຶ
-
-	ຈຶ່
-
-	ຈຶ້
-
-ຈື
-
-ຈືີ່
-
-	ຈື່
-
-	ຈື້
-
-ຈຸ
-
-ຈຸັຸັຸັຸ
-
-	ຈຸ່
-
-	ຈຸ້
-
-	ຈຸ໋
-
-ຈູ
-
-	ຈູ່
-
-	ຈູ້
-
-ຈົ
-
-ຈົື້
-
-ຈົຸ້
-
-	ຈົ່
-
-	ຈົ້
-
-ຈົ້ົ້
-
-	ຈຼຸ
-
-ຈ່
-
-	ຈ່ີ
-
-	ຈ່ຶ
-
-ຈ້
-
-	ຈ້ຳ
-
-	ຈ້ົ
-
-ຈ໊
-
-ຈ໋
-
-ຈ໌
-
-ຈໍ
-
-	ຈໍ່
-
-	ຈໍ້
-
-ຊ
-
-ຊັ
-
-ຊັີ່
-
-ຊັື້
-
-	ຊັ່
-
-	ຊັ້
-
-	ຊັ໋
-
-ຊຳ
-
-ຊິ
-
-ຊິີ່
-
-	ຊິ່
-
-	ຊິ້
-
-ຊີ
-
-	ຊີ່
-
-	ຊີ້
-
-ຊຶ
-
-	ຊຶ່
-
-	ຊຶ້
-
-ຊື
-
-ຊືີ່
-
-	ຊື່
-
-	ຊື້
-
-ຊຸ
-
-	ຊຸ່
-
-	ຊຸ້
-
-ຊູ
-
-ຊູູູູ
-
-	ຊູ່
-
-	ຊູ້
-
-ຊົ
-
-	ຊົ່
-
-	ຊົ້
-
-	ຊຼ໌
-
-ຊ່
-
-	ຊ່ັ
-
-	ຊ່ຳ
-
-	ຊ່ິ
-
-	ຊ່ີ
-
-	ຊ່ຶ
-
-	ຊ່ື
-
-	ຊ່ົ
-
-	ຊ່ຼ
-
-	ຊ່່
-
-ຊ້
-
-	ຊ້ຳ
-
-	ຊ້້
-
-ຊ້້້້
-
-	ຊ້ໍ
-
-ຊ໊
-
-ຊ໋
-
-ຊ໌
-
-ຊໍ
-
-	ຊໍ່
-
-	ຊໍ້
-
-ຍ
-
-ຍັ
-
-	ຍັ່
-
-	ຍັ້
-
-ຍິ
-
-	ຍິ່
-
-	ຍິ້
-
-ຍີ
-
-ຍີີີ
-
-	ຍີ່
-
-	ຍີ້
-
-ຍຶ
-
-	ຍຶ່
-
-ຍື
-
-	ຍື່
-
-	ຍື້
-
-ຍຸ
-
-ຍຸື້
-
-	ຍຸ່
-
-	ຍຸ້
-
-ຍູ
-
-ຍູື້
-
-	ຍູ່
-
-	ຍູ້
-
-ຍົ
-
-	ຍົ່
-
-	ຍົ້
-
-ຍຼຸ້
-
-ຍ່
-
-	ຍ່ິ
-
-	ຍ່ີ
-
-	ຍ່່
-
-ຍ່່່
-
-ຍ້
-
-	ຍ້ຳ
-
-	ຍຸ້
-
-	ຍູ້
-
-ຍ້້້
-
-ຍ້້້້
-
-ຍ໊
-
-ຍ໌
-
-ຍໍ
-
-	ຍໍ່
-
-	ຍໍ້
-
-ດ
-
-ດັ
-
-ດັັັ
-
-ດັີ່
-
-	ດັ່
-
-	ດັ້
-
-ດຳ
-
-ດິ
-
-ດິັິັິັ
-
-ດິິິ
-
-	ດິ່
-
-	ດິ້
-
-ດີ
-
-	ດີີ
-
-ດີີີ
-
-ດີີີີ
-
-	ດີ່
-
-	ດີ້
-
-ດຶ
-
-	ດຶ່
-
-ດື
-
-	ດື່
-
-	ດື້
-
-ດຸ
-
-ດຸຸຸ
-
-	ດຸ່
-
-	ດຸ້
-
-ດູ
-
-	ດູ່
-
-ດົ
-
-ດົົົ
-
-	ດົ່
-
-	ດົ້
-
-ດຼ
-
-	ດຼິ
-
-	ດຼີ
-
-	ດຼຸ
-
-ດ່
-
-	ດ່ັ
-)
-$ດ່ັົຸ້ົຸຸີັ້
-
-ດ່ັ່
-
-	ດ່ີ
-
-ດ່່່່
-
-ດ້
-
-	ດ້ັ
-
-	ດ້ີ
-
-	ດ້່
-
-	ດ້້
-
-ດ້້້້
-
-ດ໊
-
-ດ໋
-
-ດ໌
-
-ດໍ
-
-ດໍົໍົໍົ
-
-	ດໍ້
-
-ຕ
-
-ຕັ
-
-ຕັັ້
-
-ຕັື້
-
-ຕັຸ້
-
-ຕັົ້
-
-	ຕັ່
-
-	ຕັ້
-
-ຕຳ
-
-	ຕຳ່
-
-ຕິ
-
-	ຕິິ
-
-ຕິິິິ
-
-	ຕິ່
-
-	ຕິ້
-
-	ຕິ໋
-
-	ຕິໍ
-
-ຕີ
-
-	ຕີ່
-
-	ຕີ້
-
-	ຕີ໋
-
-ຕຶ
-
-	ຕຶ່
-
-	ຕຶ້
-
-ຕື
-
-	ຕື່
-
-	ຕື້
-
-ຕຸ
-
-	ຕຸ່
-
-	ຕຸ້
-
-ຕູ
-
-	ຕູ່
-
-	ຕູ້
-
-ຕົ
-
-ຕົື້
-
-ຕົຸ້
-
-	ຕົ່
-
-	ຕົ້
-
-ຕຼ
-
-	ຕຼີ
-
-ຕ່
-
-	ຕ່ັ
-
-	ຕ່ຳ
-
-	ຕ່ີ
-
-	ຕ່ື
-
-	ຕ່່
-
-ຕ່່່່
-
-ຕ່້ີ
-
-	ຕ່ໍ
-
-ຕ້
-
-	ຕ້ັ
-
-	ຕຸ້
-
-	ຕູ້
-
-	ຕ້ົ
-
-	ຕ້້
-
-ຕ໊
-
-ຕ໋
-
-ຕ໌
-
-ຕໍ
-
-	ຕໍ່
-2
--ຕໍ່ັ້ໍ່ັ້ໍ່ັ້ໍ່
- 
-ຕໍ່ໍ່ໍ່ໍ່
-
-	ຕໍ້
-
-ຕໍໍ່
-
-ຖ
-
-ຖັ
-
-	ຖັ່
-
-	ຖັ໋
-
-ຖຳ
-
-	ຖຳ້
-
-ຖິ
-
-ຖິີ່
-
-ຖິື້
-
-	ຖິ່
-
-	ຖິ້
-
-ຖີ
-
-	ຖີ່
-
-	ຖີ້
-
-ຖຶ
-
-ຖື
-
-	ຖື່
-
-	ຖື້
-
-ຖຸ
-
-	ຖຸ້
-
-ຖູ
-
-ຖົ
-
-ຖົີ່
-
-ຖົື້
-
-	ຖົ່
-
-	ຖົ້
-
-ຖ່
-
-	ຖ່ິ
-
-ຖ້
-
-	ຖ້ຳ
-
-ຖ໌
-
-ຖໍ
-
-	ຖໍ້
-
-ທ
-
-ທັ
-
-	ທັ່
-
-	ທັ້
-
-ທຳ
-
-ທິ
-
-	ທິິ
-
-ທິິິິິິິ
-
-	ທິີ
-
-	ທິ່
-
-	ທິ້
-
-	ທິ໌
-
-ທີ
-
-ທີີ່
-
-	ທີ່
-
-ທີ່ີ
-
-ທີ່ີ່
- 
-ທີ່ີ່ີ່ີ່
-
-ທີ່່
-
-	ທີ້
-
-ທຶ
-
-	ທຶ່
-
-ທື
-
-ທືີ່
-
-ທືີ້່
-
-	ທື່
-
-	ທື້
-
-ທຸ
-
-	ທຸ່
-
-	ທຸ້
-
-ທູ
-
-	ທູ້
-
-ທົ
-
-ທົີ່
-
-	ທົ່
-
-ທົ່່
-
-	ທົ້
-
-ທຼ
-
-ທ່
-
-	ທ່ັ
-
-	ທ່ຳ
-
-	ທ່ີ
-
-ທ່ີ່
-
-	ທ່ື
-
-	ທ່ົ
-
-	ທ່່
-
-	ທ່້
-
-	ທ່ໍ
-
-ທ້
-
-ທ້ີ່
-
-ທ໊
-
-ທ໋
-
-ທ໌
-
-ທໍ
-
-	ທໍ່
-
-	ທໍ້
-
-ນ
-
-ນັ
-
-ນັັັ
-
-ນັິັິັິ
-
-	ນັີ
-
-ນັື້
-
-ນັຸ້
-
-	ນັ່
-
-	ນັ້
-
-ນັ້ັ້ັ້
-
-ນຳ
-
-	ນຳ້
-
-ນິ
-
-ນິິິ
-
-	ນິ່
-
-	ນິ້
-
-	ນິ໋
-
-ນີ
-
-	ນີີ
-
-ນີີີ
-
-ນີື້
-
-	ນີ່
-
-	ນີ້
- 
-ນີ້ີ້ີ້ີ້
-
-ນີ້້
-
-ນຶ
-
-	ນຶ່
-
-	ນຶ້
-
-ນື
-
-ນືືື
-
-ນືຸ້
-
-	ນື່
-
-ນື່ື່ື່
-
-	ນື້
-
-ນຸ
-
-ນຸຸຸ
-
-	ນຸ່
-
-	ນຸ້
-
-ນູ
-
-ນູູູ
-
-	ນູ່
-
-ນົ
-
-ນົົົ
-
-	ນົ່
-
-	ນົ້
-
-ນົ້ົ້ົ້
-
-ນຼືົ້
-
-ນ່
-
-	ນ່ີ
-
-	ນ່ຶ
-
-	ນຸ່
-
-ນ່່່
-
-	ນ່ໍ
-
-ນ້
-
-	ນ້ັ
-
-	ນ້ຳ
-
-	ນ້ີ
-
-	ນ້ື
-
-	ນ້່
-
-ນ້້້
-
-	ນ້ໍ
-
-ນ໊
-
-ນ໋
-
-ນ໌
-
-ນໍ
-
-ນໍື້
-
-	ນໍົ
-
-ນໍົ້
-
-	ນໍ່
-
-	ນໍ້
-
-ບ
-
-ບັ
-
-	ບັັ
-
-ບັັັ
-
-	ບັີ
-
-ບັື້
-
-	ບັ່
-
-	ບັ້
-
-ບັໍ່
-
-ບຳ
-
-ບິ
-
-ບິິິ
-
-	ບິ່
-
-	ບິ້
-
-ບີ
-
-	ບີີ
-
-	ບີ່
-
-	ບີ້
-
-ບີໍ້່
-
-ບຶ
-
-	ບຶ່
-
-	ບຶ້
-
-ບື
-
-	ບື່
-
-	ບື້
-
-ບື້ຶ
-
-ບຸ
-
-	ບຸຸ
-
-	ບຸ່
-
-	ບຸ້
-
-ບູ
-
-	ບູ່
-
-ບົ
-
-	ບົ່
-
-	ບົ້
-
-ບຼ
-
-ບຼືໍ່
-
-	ບຼຸ
-
-	ບຼູ
-
-	ບຼ່
-
-ບ່
-
-	ບ່ິ
-
-	ບ່ີ
-
-	ບ່ໍ
-
-ບ້
-
-ບ໊
-
-ບ໋
-
-ບ໋ໍ່
-
-ບໍ
-
-ບໍັໍັໍັ
-
-	ບໍ່
-2
--ບໍ່ຼືໍ່ຼືໍ່ຼືໍ່
-
-ບໍ່່
-
-ບໍ່ໍ່
- 
-ບໍ່ໍ່ໍ່ໍ່
-
-	ບໍ້
-
-	ບໍໍ
-
-ບໍໍ່
-
-ປ
-
-ປັ
-
-	ປັັ
-
-	ປັົ
-
-	ປັ່
-
-	ປັ້
-
-ປິ
-
-	ປິ່
-
-	ປິ້
-
-ປີ
-
-	ປີ່
-
-	ປີ້
-
-ປຶ
-
-	ປຶ້
-
-ປື
-
-	ປື່
-
-	ປື້
-
-ປຸ
-
-	ປຸ່
-
-	ປຸ້
-
-	ປຸ໋
-
-ປູ
-
-	ປູ່
-
-	ປູ້
-
-ປົ
-
-ປົຸ້
-
-	ປົ່
-
-	ປົ້
-
-	ປົ໋
-
-ປຼ
-
-	ປຼຸ
-
-ປ່
-
-	ປ່ິ
-
-	ປ່ີ
-
-	ປຸ່
-
-ປ້
-
-	ປ້ຳ
-
-	ປຸ້
-
-	ປ້ົ
-
-	ປ້້
-
-ປ໊
-
-ປ໋
-
-ປ໌
-
-ປໍ
-
-	ປໍີ
-
-	ປໍ້
-
-ຜ
-
-ຜັ
-
-ຜິ
-
-	ຜິ້
-
-ຜີ
-
-	ຜີ່
-
-	ຜີ້
-
-ຜື
-
-	ຜື່
-
-	ຜື້
-
-ຜຸ
-
-	ຜຸ່
-
-ຜູ
-
-ຜູື້
-
-ຜູຸ້
-
-	ຜູ່
-
-	ຜູ້
- 
-ຜູູູູ້້້້
-
-ຜູ້້
-
-ຜົ
-
-ຜົີ່
-
-	ຜົ່
-
-	ຜົ້
-
-ຜ່
-
-	ຜ່ີ
-
-	ຜູ່
-
-ຜ້
-
-	ຜ້ີ
-
-	ຜ້ື
-
-	ຜູ້
-
-	ຜ້້
-
-ຜໍ
-
-ຝ
-
-ຝັ
-
-	ຝັ່
-
-	ຝັ້
-
-ຝິ
-
-	ຝິ່
-
-ຝີ
-
-ຝຶ
-
-ຝື
-
-	ຝື້
-
-ຝຸ
-
-	ຝຸ່
-
-ຝູ
-
-ຝົ
-
-	ຝົ້
-
-ຝຼັ່
-
-ຝ່
-
-ຝ້
-
-ພ
-
-ພັ
-
-	ພັ່
-
-	ພັ້
-
-ພຳ
-
-ພິ
-
-	ພິັ
-
-ພິິິິ
-
-	ພິ່
-
-	ພິ້
-
-ພີ
-
-	ພີ່
-
-	ພີ້
-
-ພຶ
-
-	ພຶ່
-
-	ພຶ້
-
-ພື
-
-ພືີ່
-
-ພືຸ້
-
-	ພື່
-
-	ພື້
-
-ພຸ
-
-	ພຸ່
-
-	ພຸ້
-
-ພູ
-
-	ພູ່
-
-	ພູ້
-
-ພົ
-
-ພົື້
-
-	ພົ່
-
-	ພົ້
-
-ພຼ
-
-ພ່
-
-	ພ່ຳ
-
-	ພ່ິ
-
-	ພ່ີ
-
-	ພ່ື
-
-	ພ່ໍ
-
-ພ້
-
-	ພຸ້
-
-ພ໊
-
-ພ໌
-
-ພໍ
-
-	ພໍ່
- 
-ພໍ່ໍ່ໍ່ໍ່
-
-	ພໍ້
-
-ຟ
-
-ຟັ
-
-	ຟັ່
-
-	ຟັ້
-
-ຟິ
-
-ຟີ
-
-	ຟີ້
-
-	ຟຶ້
-
-ຟື
-
-	ຟື້
-
-ຟຸ
-
-	ຟຸ່
-
-	ຟຸ້
-
-ຟູ
-
-ຟົ
-
-	ຟົ້
-
-ຟຼ
-
-	ຟຼິ
-
-ຟ່
-
-ຟ້
-
-ຟ໌
-
-ຟໍ
-
-ມ
-
-ມັ
-
-ມັັັ
-
-	ມັ່
-
-	ມັ້
-
-ມິ
-
-	ມິ່
-
-	ມິ້
-
-ມີ
-
-	ມີິ
-
-	ມີີ
-
-ມີີີ
-
-ມີີີີ
-
-ມີີ້
-
-	ມີື
-
-	ມີ່
-
-ມີ່ີ່ີ່
-
-	ມີ້
-
-ມຶ
-
-	ມຶ່
-
-	ມຶ້
-
-ມື
-
-	ມືຶ
-
-	ມື່
-
-	ມື້
-
-ມຸ
-
-ມຸຸຸ
-
-	ມຸ່
-
-	ມຸ້
-
-ມູ
-
-	ມູ່
-
-	ມູ້
-
-ມົ
-
-ມົົົ
-
-	ມົ່
-
-	ມົ້
-
-ມຼ
-
-ມຼັ້
-
-ມ່
-
-	ມ່ຳ
-
-	ມ່ີ
-
-	ມ່ື
-
-	ມຸ່
-
-	ມູ່
-
-	ມ່່
-
-ມ່່່
-
-ມ່່່່
-
-ມ້
-
-	ມ້ີ
-
-ມ້້້
-
-ມ໊
-
-ມ໋
-
-ມ໌
-
-ມໍ
-
-	ມໍ່
-
-	ມໍ້
-
-ມໍໍໍ
-
-ຢ
-
-ຢັ
-
-ຢັື້
-
-	ຢັ່
-
-	ຢັ້
-
-ຢຳ
-
-ຢິ
-
-	ຢິ່
-
-ຢີ
-
-	ຢີ່
-
-	ຢີ້
-
-ຢຶ
-
-ຢື
-
-	ຢື່
-
-	ຢື້
-
-ຢຸ
-
-	ຢຸ່
-
-ຢູ
-
-ຢູີ່
-
-ຢູີ່່
-
-ຢູູ່
-
-	ຢູ່
- 
-ຢູູູູ່່່່
-
-ຢູ່່
-
-	ຢູ້
-
-ຢົ
-
-	ຢົ້
-
-ຢ່
-
-	ຢ່ຳ
-
-	ຢ່ີ
-
-	ຢູ່
-
-ຢູ່່
-
-ຢ້
-
-	ຢ້ຳ
-
-ຢ໊
-
-ຢ໋
-
-ຢໍ
-
-	ຢໍ່
-
-	ຢໍ້
-
-ຣ
-
-ຣັ
-
-	ຣັ່
-
-ຣຳ
-
-ຣິ
-
-	ຣິີ
-
-ຣີ
-
-ຣີີີີ
-
-	ຣີ່
-
-	ຣີ້
-
-ຣຶ
-
-	ຣຶ່
-
-	ຣຶ້
-
-ຣື
-
-	ຣື່
-
-	ຣື້
-
-ຣຸ
-
-	ຣຸ່
-
-ຣູ
-
-	ຣູ້
-
-ຣົ
-
-ຣ່
-
-	ຣ່ັ
-
-	ຣ່ື
-
-ຣ້
-
-ຣ໊
-
-ຣ໌
-
-ຣໍ
-
-ລ
-
-ລັ
-
-	ລັັ
-
-ລັື້
-
-ລັຸ້
-
-	ລັູ
-
-	ລັ່
-
-	ລັ້
-
-	ລັໍ
-
-ລຳ
-
-ລິ
-
-	ລິ່
-
-	ລິ້
-
-ລີ
-
-ລີື້
-
-	ລີ່
-
-	ລີ້
-
-ລຶ
-
-	ລຶ່
-
-	ລຶ້
-
-ລື
-
-	ລືື
-
-ລືື້
-
-	ລື່
-
-	ລື້
-
-ລຸ
-
-	ລຸ່
-
-	ລຸ້
-
-ລູ
-
-	ລູ່
-
-	ລູ້
-
-ລົ
-
-ລົີ່
-
-ລົື້
-
-	ລົ່
-
-	ລົ້
-
-ລ່
-
-	ລ່ຳ
-
-	ລ່ີ
-
-	ລ່ື
-
-	ລຸ່
-
-	ລ່ົ
-
-	ລ່້
-
-ລ້
-
-	ລ້ຳ
-
-	ລຸ້
-
-	ລ້ໍ
-
-ລ໊
-
-ລ໋
-
-ລ໌
-
-ລໍ
-
-	ລໍິ
-
-	ລໍ່
-
-	ລໍ້
-
-ວ
-
-ວັ
-
-	ວັັ
-
-	ວັ່
-
-	ວັ້
-
-ວິ
-
-ວິິິິ
-
-	ວິ່
-
-	ວິ້
-
-ວີ
-
-	ວີ່
-
-	ວີ້
-
-	ວີ໋
-
-ວຶ
-
-	ວື້
-
-ວຸ
-
-	ວຸ່
-
-	ວຸ້
-
-ວູ
-
-	ວູ້
-
-ວົ
-
-ວົື້
-
-ວົົົ
-
-	ວົ່
-
-	ວົ້
-
-ວຼ
-
-ວ່
-
-	ວ່ີ
-
-	ວ່່
-
-ວ່່່
-
-ວ້
-
-	ວ້ຳ
-
-ວ້້້
-
-ວ້້້້
-
-ວ໊
-
-ວ໋
-
-ວ໌
-
-ວໍ
-
-	ວໍ້
-
-ສ
-
-ສັ
-
-	ສັື
-
-ສັຸ້
-
-	ສັ່
-
-	ສັ້
-
-ສຳ
-
-ສິ
-
-	ສິິ
-
-	ສິີ
-
-	ສິ່
-
-	ສິ້
-
-ສີ
-
-	ສີັ
-
-	ສີິ
-
-	ສີ່
-
-	ສີ້
-
-ສຶ
-
-	ສຶ້
-
-ສື
-
-	ສື່
-
-	ສື້
-
-ສຸ
-
-	ສຸີ
-
-	ສຸຸ
-
-	ສຸ່
-
-	ສຸ້
-
-ສູ
-
-ສູື້
-
-	ສູ່
-
-	ສູ້
-
-ສົ
-
-ສົຸ້
-
-	ສົ່
-
-	ສົ້
-
-ສຼ
-
-ສ່
-
-	ສ່ັ
-
-	ສ່ຳ
-
-	ສ່ິ
-
-	ສ່ີ
-
-	ສ່ື
-
-	ສູ່
-
-	ສ່ົ
-
-	ສ່່
-
-ສ້
-
-	ສ້ື
-
-	ສູ້
-
-	ສ້່
-
-ສ໋
-
-ສ໌
-
-ສໍ
-
-	ສໍ່
-
-	ສໍ້
-
-ຫ
-
-ຫັ
-
-	ຫັຼ
-
-	ຫັ່
-
-	ຫັ້
-
-ຫຳ
-
-ຫິ
-
-	ຫິ່
-
-	ຫິ້
-
-ຫີ
-
-	ຫີ່
-
-	ຫີ້
-
-ຫຶ
-
-	ຫຶ່
-
-ຫື
-
-	ຫືຼ
-
-	ຫື່
-
-	ຫື້
-
-ຫຸ
-
-	ຫຸ່
-
-	ຫຸ້
-
-ຫູ
-
-	ຫູ່
-
-ຫົ
-
-	ຫົຼ
-
-	ຫົ່
-
-	ຫົ້
-
-ຫຼ
-
-	ຫຼັ
-
-ຫຼັ່
-
-ຫຼັ້
-
-	ຫຼິ
-
-ຫຼິ້
-
-	ຫຼີ
-
-ຫຼີ່
-
-ຫຼີ້
-
-	ຫຼຶ
-
-	ຫຼື
- 
-ຫຼືຼືຼືຼື
-
-ຫຼື່
-
-ຫຼື້
-
-	ຫຼຸ
-
-ຫຼຸ້
-
-	ຫຼູ
-
-	ຫຼົ
-
-ຫຼົ່
-
-ຫຼົ້
-
-	ຫຼຼ
-
-	ຫຼ່
-
-	ຫຼ້
-
-ຫຼໍ່
-
-ຫ່
-
-	ຫ່ັ
-
-	ຫ່ຼ
-
-ຫ້
-
-	ຫ້ັ
-
-	ຫຸ້
-
-	ຫ້່
-
-	ຫ້້
-
-ຫຸ້້
-
-ຫ້້້້
-
-ຫ໊
-
-ຫ໋
-
-ຫ໌
-
-ຫໍ
-
-	ຫໍ່
-
-	ຫໍ້
-
-ອ
-
-ອັ
-
-	ອັ່
-
-	ອັ້
-
-ອຳ
-
-ອິ
-
-	ອິ່
-
-	ອິ້
-
-ອີ
-
-ອີື້
-
-	ອີ່
-
-	ອີ້
-
-ອຶ
-
-	ອຶ່
-
-	ອຶ້
-
-ອື
-
-ອືີ່
-
-	ອື່
-
-ອື່ື່ື່
-
-	ອື້
-
-ອຸ
-
-	ອຸ່
-
-	ອຸ້
-
-	ອຸ໋
-
-ອູ
-
-	ອູ່
-
-	ອູ້
-
-ອົ
-
-	ອົ່
-
-	ອົ້
-
-	ອຼື
-
-ອຼື່
-
-ອ່
-
-	ອ່ີ
-
-	ອ່ື
-
-	ອຸ່
-
-ອ້
-
-	ອຸ້
-
-	ອູ້
-
-ອ໊
-
-ອ໋
-
-ອໍ
-
-ຮ
-
-ຮັ
-
-	ຮັັ
-
-	ຮັ່
-
-	ຮັ້
-
-ຮຳ
-
-	ຮຳ່
-
-ຮິ
-
-	ຮິ່
-
-	ຮິ້
-
-ຮີ
-
-	ຮີ່
-
-	ຮີ້
-
-ຮຶ
-
-ຮື
-
-	ຮືີ
-
-	ຮືື
-
-	ຮື່
-
-	ຮື້
-
-ຮຸ
-
-	ຮຸ່
-
-	ຮຸ້
-
-ຮູ
-
-ຮູື້
-
-ຮູຸ້
-
-	ຮູ່
-
-	ຮູ້
- 
-ຮູູູູ້້້້
-
-ຮົ
-
-ຮົຸ້
-
-	ຮົ່
-
-	ຮົ້
-
-	ຮົໍ
-
-	ຮຼ້
-
-ຮ່
-
-	ຮ່ຳ
-
-	ຮຸ່
-
-	ຮ່ໍ
-
-ຮ້
-
-	ຮູ້
-
-	ຮ້ໍ
-
-ຮ໊
-
-ຮ໋
-
-ຮ໌
-
-ຮໍ
-
-	ຮໍ່
-
-ຯ
-
-ະ
-
-ະັ
-
-ະິ
-
-ະີ
-
-ະົ
-
-າ
-
-າັ
-
-າັັັ
-
-	າັ່
-
-າິ
-
-າີ
-
-	າີ່
-
-າຶຶຶ
-
-າຸຸຸ
-
-າົ
-
-າົົົ
-
-	າົ່
-
-	າົ້
-
-າົ້ົ້ົ້
-
-າຼ
-
-າຼົ່
-
-າ່
-
-	າ່ັ
-
-	າ່່
-
-າ່່່
-
-າ້
-
-າ້້້
-
-າໍ
-
-	າໍ່
-
-	າໍ້
-
-າໍໍໍ
-
-ຽ
-
-ຽັ
-
-ຽັັັ
-
-ຽ່
-
-ຽ້
-
-ເ
-
-ເັ
-
-ເິ
-
-ເີ
-
-ເຶ
-
-ເື
-
-ເົ
-
-ແ
-
-ໂ
-
-ໃ
-
-ໄ
-
-ໆ
-
-ໆື່ື່ື່
-
-໐
-
-໑
-
-໒
-
-໓
-
-໔
-
-໕
-
-໖
-
-໗
-
-໘
-
-໙
-
-ໜ
-
-ໜັ
-
-	ໜັ່
-
-	ໜັ້
-
-ໜຳ
-
-ໜິ
-
-	ໜິ້
-
-ໜີ
-
-	ໜີ່
-
-	ໜີ້
-
-ໜຶ
-
-ໜຶີ່
-
-	ໜຶ່
-
-	ໜຶ້
-
-ໜຶ້່
-
-ໜື
-
-	ໜື່
-
-	ໜື້
-
-ໜຸ
-
-	ໜຸ່
-
-	ໜຸ້
-
-ໜູ
-
-	ໜູ່
-
-ໜົ
-
-	ໜົ່
-
-ໜ່
-
-	ໜ່ີ
-
-	ໜ່ຶ
-
-	ໜຸ່
-
-ໜ້
-
-ໜ໊
-
-ໜ໋
-
-ໜໍ
-
-	ໜໍ່
-
-ໝ
-
-ໝັ
-
-ໝັື້
-
-ໝັຸ້
-
-	ໝັ່
-
-	ໝັ້
-
-ໝິ
-
-	ໝິ່
-
-ໝີ
-
-	ໝີ່
-
-ໝຶ
-
-	ໝຶ່
-
-ໝື
-
-	ໝື່
-
-ໝຸ
-
-	ໝຸ່
-
-	ໝຸ້
-
-ໝູ
-
-	ໝູ່
-
-ໝົ
-
-	ໝົ່
-
-	ໝົ້
-
-ໝ່
-
-	ໝ່ຳ
-
-	ໝູ່
-
-ໝ້
-
-ໝໍ
-
-	ໝໍ່
-
-	ໝໍ້
-
-་
-
-᛬
-
-ក
-
-កា
-
-	កាំ
-
-កា្ល
-
-កិ
-
-កិ្ត
-
-កី
-
-កី្ត
-
-កឹ
-
-កឺ
-
-កុ
-
-	កុំ
-
-	កុះ
-
-កុ្រ
-
-កូ
-
-កួ
-
-កើ
-
-កឿ
-
-កៀ
-
-កៀ្រ
-
-កេ
-
-	កេះ
-
-កេ្ម
-
-កែ
-
-កែ្ប
-
-កែ្ល
-
-កែ្អ
-
-កៃ
-
-កោ
-
-	កោះ
-
-កៅ
-
-កំ
-
-	កំា
-
-កៈ
-
-ក់
-
-	ក់ៈ
-
-	ក់់
-
-ក៌
-
-ក៍
-
-ក៏
-
-ក័
-
-	ក្ក
-
-ក្កា
-
-ក្កិ
-
-ក្កី
-
-ក្កុ
-
-ក្កោ
-
-ក្កៈ
-
-	ក្ខ
-
-ក្ខា
-
-ក្ខិ
-
-ក្ខី
-
-ក្ខុ
-
-ក្ខេ
-
-ក្ខោ
-
-ក្ខំ
-
-ក្ខៈ
-
-ក្ខ័
-
-	ក្គ
-
-	ក្ង
-
-ក្ងា
-
-ក្ងិ
-
-ក្ងោ
-
-	ក្ច
-
-	ក្ដ
-
-ក្ដា
-
-ក្ដាំ
-
-ក្ដិ
-
-ក្ដី
-
-ក្ដុ
-
-ក្ដួ
-
-ក្ដឿ
-
-ក្ដោ
-
-ក្ដៅ
-
-ក្ដ្រ
-
-	ក្ត
-
-ក្តា
-
-ក្តាំ
-
-ក្តិ
-
-ក្តី
-
-ក្តុ
-
-ក្តួ
-
-ក្តោ
-
-ក្តៅ
-
-ក្ត័
-
-ក្ត្រ
-
-ក្ត្រា
-
-	ក្ន
-
-ក្នា
-
-ក្នុ
-
-	ក្ប
-
-ក្បា
-
-ក្បាំ
-
-ក្បិ
-
-ក្បុ
-
-ក្បូ
-
-ក្បួ
-
-ក្បឿ
-
-ក្បៀ
-
-ក្បែ
-
-ក្បោះ
-
-ក្បំ
-
-	ក្ម
-
-ក្មា
-
-ក្មុ
-
-ក្មួ
-
-ក្មេ
-
-ក្មែ
-
-	ក្យ
-
-ក្យូ
-
-ក្យៈ
-
-	ក្រ
-
-ក្រា
-
-ក្រាំ
-
-ក្រិ
-
-ក្រី
-
-ក្រឹ
-
-ក្រុ
-
-ក្រូ
-
-ក្រួ
-
-ក្រើ
-
-ក្រឿ
-
-ក្រៀ
-
-ក្រេ
-
-ក្រែ
-
-ក្រៃ
-
-ក្រោ
-
-ក្រោះ
-
-ក្រៅ
-
-ក្រំ
-
-ក្រៈ
-
-ក្រ្ដ
-
-ក្រ្ត
-
-ក្រ្តា
-
-	ក្ល
-
-ក្លា
-
-ក្លាំ
-
-ក្លិ
-
-ក្លី
-
-ក្លឹ
-
-ក្លូ
-
-ក្លើ
-
-ក្លៀ
-
-ក្លេ
-
-ក្លែ
-
-ក្លោ
-
-ក្លំ
-
-ក្វា
-
-	ក្ស
-
-ក្សា
-
-ក្សិ
-
-ក្សី
-
-ក្សេ
-
-ក្ស៍
-
-ក្ស័
-
-ក្ស្មី
-
-	ក្អ
-
-ក្អា
-
-ក្អួ
-
-ក្អេ
-
-ក្អែ
-
-	ក្ឫ
-
-ខ
-
-ខា
-
-	ខាំ
-
-ខិ
-
-ខី
-
-ខឹ
-
-ខឺ
-
-ខុ
-
-ខូ
-
-ខួ
-
-ខើ
-
-ខឿ
-
-ខៀ
-
-ខេ
-
-ខែ
-
-ខែ្ម
-
-ខែ្ស
-
-ខៃ
-
-ខោ
-
-ខោ្ម
-
-ខៅ
-
-ខៅ្ម
-
-ខំ
-
-ខះ
-
-ខៈ
-
-ខ់
-
-ខ័
-
-	ខ្ច
-
-ខ្ចា
-
-ខ្ចី
-
-ខ្ចោះ
-
-ខ្ចៅ
-
-ខ្ជា
-
-ខ្ជិ
-
-ខ្ជី
-
-ខ្ជឹ
-
-ខ្ជួ
-
-ខ្ជះ
-
-ខ្ញា
-
-ខ្ញី
-
-ខ្ញុំ
-
-ខ្ញូ
-
-ខ្ញៀ
-
-ខ្ញែ
-
-ខ្ញំ
-
-ខ្ញំុ
-
-	ខ្ទ
-
-ខ្ទា
-
-ខ្ទាំ
-
-ខ្ទី
-
-ខ្ទឹ
-
-ខ្ទុះ
-
-ខ្ទើ
-
-ខ្ទេ
-
-ខ្ទះ
-
-ខ្ទ័
-
-	ខ្ន
-
-ខ្នា
-
-ខ្នុ
-
-ខ្នើ
-
-ខ្នែ
-
-ខ្នោះ
-
-ខ្នះ
-
-	ខ្ព
-
-ខ្ពុ
-
-ខ្ពើ
-
-ខ្មា
-
-ខ្មាំ
-
-ខ្មី
-
-ខ្មុ
-
-ខ្មុំ
-
-ខ្មួ
-
-ខ្មេ
-
-ខ្មេះ
-
-ខ្មែ
-
-ខ្មោ
-
-ខ្មៅ
-
-	ខ្យ
-
-ខ្យា
-
-ខ្យូ
-
-ខ្យួ
-
-ខ្យោ
-
-ខ្រេ
-
-	ខ្ល
-
-ខ្លា
-
-ខ្លាំ
-
-ខ្លិ
-
-ខ្លី
-
-ខ្លឹ
-
-ខ្លឺ
-
-ខ្លុ
-
-ខ្លូ
-
-ខ្លួ
-
-ខ្លែ
-
-ខ្លោ
-
-ខ្លៅ
-
-ខ្លំា
-
-ខ្លះ
-
-	ខ្វ
-
-ខ្វា
-
-ខ្វិ
-
-ខ្វី
-
-ខ្វឿ
-
-ខ្វែ
-
-ខ្វះ
-
-ខ្វ្រា
-
-	ខ្ស
-
-ខ្សា
-
-ខ្សឹ
-
-ខ្សួ
-
-ខ្សៀ
-
-ខ្សែ
-
-ខ្សោ
-
-ខ្សោះ
-
-គ
-
-គា
-
-	គាំ
-
-គា្ន
-
-គា្ម
-
-គា្រ
-
-គិ
-
-គិ្គ
-
-គី
-
-គឹ
-
-គឺ
-
-	គឺៈ
-
-គុ
-
-	គុំ
-
-គូ
-
-គួ
-
-គឿ
-
-គឿ្រ
-
-គៀ
-
-គេ
-
-គេ្ន
-
-គេ្ល
-
-គែ
-
-គោ
-
-	គោះ
-
-គំ
-
-គៈ
-
-គ់
-
-គ៌
-
-	គ៌ា
-
-គ៏
-
-គ័
-
-	គ្ក
-
-	គ្គ
-
-គ្គា
-
-គ្គិ
-
-គ្គី
-
-គ្គុ
-
-គ្គេ
-
-គ្គោ
-
-គ្គំ
-
-គ្គៈ
-
-	គ្ន
-
-គ្នា
-
-គ្នី
-
-គ្នុ
-
-គ្នេ
-
-	គ្ព
-
-គ្មា
-
-គ្មិ
-
-	គ្រ
-
-គ្រា
-
-គ្រាំ
-
-គ្រិ
-
-គ្រិះ
-
-គ្រី
-
-គ្រឹ
-
-គ្រឹះ
-
-គ្រឺ
-
-គ្រឺះ
-
-គ្រុ
-
-គ្រូ
-
-គ្រួ
-
-គ្រើ
-
-គ្រឿ
-
-គ្រៀ
-
-គ្រេ
-
-គ្រែ
-
-គ្រៃ
-
-គ្រោ
-
-គ្រោះ
-
-គ្រំ
-
-គ្រ័
-
-គ្លី
-
-គ្លេ
-
-គ្វី
-
-ឃ
-
-ឃា
-
-	ឃាំ
-
-ឃិ
-
-ឃី
-
-ឃឹ
-
-ឃឺ
-
-ឃុ
-
-	ឃុំ
-
-ឃូ
-
-ឃួ
-
-ឃើ
-
-ឃឿ
-
-ឃេ
-
-ឃែ
-
-ឃោ
-
-ឃៅ
-
-ឃំ
-
-ឃៈ
-
-ឃ្ជា
-
-	ឃ្ន
-
-ឃ្នា
-
-ឃ្នើ
-
-ឃ្នេ
-
-ឃ្មា
-
-ឃ្មុំ
-
-ឃ្យឺ
-
-ឃ្យូ
-
-	ឃ្ល
-
-ឃ្លា
-
-ឃ្លាំ
-
-ឃ្លី
-
-ឃ្លុំ
-
-ឃ្លៀ
-
-ឃ្លេ
-
-ឃ្លោ
-
-ឃ្វា
-
-ឃ្វី
-
-ឃ្វៀ
-
-ង
-
-ងា
-
-ងិ
-
-ងី
-
-ងឹ
-
-ងឹ្ឈ
-
-ងឺ
-
-ងុ
-
-ងូ
-
-ងួ
-
-ងើ
-
-ងើ្ក
-
-ងើ្ហ
-
-ងឿ
-
-ងៀ
-
-ងៀ្រ
-
-ងេ
-
-	ងេះ
-
-ងេ្ក
-
-ងេ្កះ
-
-ងេ្ខ
-
-ងែ
-
-ងែ្ក
-
-ងែ្វ
-
-ងែ្អ
-
-ងៃ
-
-ងោ
-
-ងំ
-
-ងៈ
-
-ង៉
-
-	ង៉ា
-
-	ង៉ុ
-
-	ង៉ូ
-
-ង៉េះ
-
-	ង៉ែ
-
-	ង៉ៃ
-
-	ង៉ោ
-
-ង៉ោះ
-
-ង់
-
-	ង់់
-
-	ង្ក
-
-ង្កា
-
-ង្កាំ
-
-ង្កិ
-
-ង្កឹះ
-
-ង្កុ
-
-ង្កូ
-
-ង្កួ
-
-ង្កើ
-
-ង្កើះ
-
-ង្កៀ
-
-ង្កេ
-
-ង្កេះ
-
-ង្កែ
-
-ង្កោ
-
-ង្ក័
-
-ង្ក្រ
-
-ង្ក្រា
-
-	ង្ខ
-
-ង្ខា
-
-ង្ខាំ
-
-ង្ខិ
-
-ង្ខុ
-
-ង្ខេ
-
-ង្ខៅ
-
-ង្ខំ
-
-ង្ខ័
-
-	ង្គ
-
-ង្គា
-
-ង្គា្រ
-
-ង្គិ
-
-ង្គី
-
-ង្គុ
-
-ង្គុំ
-
-ង្គួ
-
-ង្គើ
-
-ង្គៀ
-
-ង្គេ
-
-ង្គោ
-
-ង្គោះ
-
-ង្គំ
-
-ង្គៈ
-
-ង្គ័
-
-ង្គ្រ
-
-ង្គ្រា
-
-ង្គ្រោ
-
-ង្គ្រោះ
-
-	ង្ឃ
-
-ង្ឃា
-
-ង្ឃឹ
-
-ង្ឃុ
-
-ង្ឃោ
-
-ង្ឃំ
-
-ង្ងំ
-
-	ង្ឈ
-
-ង្ឈឹ
-
-	ង្ឍ
-
-	ង្ត
-
-ង្តើ
-
-	ង្ន
-
-	ង្រ
-
-ង្រា
-
-ង្រា្គ
-
-ង្រិ
-
-ង្រី
-
-ង្រឹ
-
-ង្រុ
-
-ង្រូ
-
-ង្រួ
-
-ង្រៀ
-
-ង្រេ
-
-ង្រែ
-
-ង្រៃ
-
-ង្រ្ក
-
-ង្រ្កា
-
-ង្រ្កឹ
-
-ង្រ្គ
-
-ង្រ្គា
-
-ង្រ្គោះ
-
-	ង្វ
-
-ង្វា
-
-ង្វិ
-
-ង្វឹ
-
-ង្វើ
-
-ង្វៀ
-
-ង្វេ
-
-ង្វែ
-
-ង្វះ
-
-	ង្ស
-
-ង្សា
-
-ង្សិ
-
-ង្សី
-
-ង្សុ
-
-ង្ស៊ី
-
-ង្ស័
-
-	ង្ហ
-
-ង្ហា
-
-ង្ហិ
-
-ង្ហី
-
-ង្ហុ
-
-ង្ហូ
-
-ង្ហួ
-
-ង្ហើ
-
-ង្ហែ
-
-ង្ហោ
-
-ង្ហោះ
-
-ង្ហៈ
-
-	ង្អ
-
-ង្អា
-
-ង្អុ
-
-ង្អូ
-
-ង្អួ
-
-ង្អើ
-
-ង្អៀ
-
-ង្អេ
-
-ង្អែ
-
-ង្អោ
-
-ច
-
-ចា
-
-	ចាំ
-
-ចិ
-
-	ចិ៍
-
-ចី
-
-ចឹ
-
-ចឺ
-
-ចុ
-
-	ចុះ
-
-ចូ
-
-ចួ
-
-ចើ
-
-ចើ្រ
-
-ចៀ
-
-ចេ
-
-	ចេះ
-
-ចេ្ច
-
-ចេ្ឆ
-
-ចេ្នះ
-
-ចែ
-
-ចៃ
-
-ចៃ្ន
-
-ចោ
-
-	ចោះ
-
-ចៅ
-
-ចំ
-
-	ចំា
-
-ចះ
-
-ច់
-
-ច័
-
-	ច្ច
-
-ច្ចា
-
-ច្ចិ
-
-ច្ចឹ
-
-ច្ចុ
-
-ច្ចេ
-
-ច្ចំ
-
-ច្ចៈ
-
-ច្ច័
-
-	ច្ឆ
-
-ច្ឆា
-
-ច្ឆិ
-
-ច្ឆេ
-
-ច្ឆ័
-
-	ច្ជ
-
-ច្នេះ
-
-ច្នៃ
-
-ច្នោះ
-
-	ច្ប
-
-ច្បា
-
-ច្បាំ
-
-ច្បិ
-
-ច្បូ
-
-ច្យុ
-
-	ច្រ
-
-ច្រា
-
-ច្រាំ
-
-ច្រឹ
-
-ច្រូ
-
-ច្រើ
-
-ច្រៀ
-
-ច្រេ
-
-ច្រែ
-
-ច្រែះ
-
-ច្រោ
-
-ច្រោះ
-
-ច្រំ
-
-	ច្ស
-
-ច្សុ
-
-ឆ
-
-ឆា
-
-	ឆាំ
-
-ឆាំ្ន
-
-ឆាំ្ម
-
-ឆិ
-
-ឆី
-
-ឆឹ
-
-ឆឺ
-
-ឆុ
-
-ឆូ
-
-ឆួ
-
-ឆើ
-
-ឆៀ
-
-ឆេ
-
-	ឆេះ
-
-ឆេ្ន
-
-ឆេ្វ
-
-ឆែ
-
-ឆែ្ក
-
-ឆែ្អ
-
-ឆៃ
-
-ឆោ
-
-ឆៅ
-
-ឆំា្ន
-
-ឆ័
-
-ឆ្កា
-
-ឆ្កួ
-
-ឆ្កើះ
-
-ឆ្កៀ
-
-ឆ្កែ
-
-	ឆ្គ
-
-ឆ្គាំ
-
-	ឆ្ង
-
-ឆ្ងា
-
-ឆ្តោ
-
-ឆ្នា
-
-ឆ្នាំ
-
-ឆ្នុ
-
-ឆ្នូ
-
-ឆ្នួ
-
-ឆ្នើ
-
-ឆ្នេ
-
-ឆ្នេះ
-
-ឆ្នៃ
-
-ឆ្នោ
-
-ឆ្នំា
-
-ឆ្ពិ
-
-ឆ្ពោះ
-
-	ឆ្ម
-
-ឆ្មា
-
-ឆ្មាំ
-
-ឆ្មើ
-
-ឆ្មៃ
-
-	ឆ្ល
-
-ឆ្លា
-
-ឆ្លុះ
-
-ឆ្លូ
-
-ឆ្លើ
-
-ឆ្លៀ
-
-ឆ្លេ
-
-	ឆ្វ
-
-ឆ្វា
-
-ឆ្វេ
-
-ឆ្វែ
-
-	ឆ្អ
-
-ឆ្អា
-
-ឆ្អិ
-
-ឆ្អឹ
-
-ឆ្អើ
-
-ឆ្អេះ
-
-ឆ្អែ
-
-ឆ្អៅ
-
-ជ
-
-ជា
-
-	ជាំ
-
-	ជាៈ
-
-ជា្ជ
-
-ជា្ញ
-
-ជា្រ
-
-ជា្វ
-
-ជិ
-
-	ជិះ
-
-ជី
-
-ជឹ
-
-ជឺ
-
-ជុ
-
-	ជុំ
-
-	ជុះ
-
-ជូ
-
-ជួ
-
-ជើ
-
-ជឿ
-
-ជៀ
-
-ជេ
-
-ជែ
-
-ជៃ
-
-ជោ
-
-ជៅ
-
-ជំ
-
-ជះ
-
-ជៈ
-
-ជ៌
-
-ជ័
-
-	ជ្ឃ
-
-	ជ្ច
-
-ជ្ចា
-
-	ជ្ជ
-
-ជ្ជា
-
-ជ្ជី
-
-ជ្ជុ
-
-ជ្ជេ
-
-ជ្ជោ
-
-ជ្ជំ
-
-ជ្ជៈ
-
-	ជ្ឈ
-
-ជ្ឈា
-
-ជ្ឈិ
-
-ជ្ឈឹ
-
-	ជ្ញ
-
-ជ្ញា
-
-	ជ្ឍ
-
-ជ្ឍិ
-
-ជ្ឍឹ
-
-	ជ្យ
-
-	ជ្រ
-
-ជ្រា
-
-ជ្រាំ
-
-ជ្រឹ
-
-ជ្រុ
-
-ជ្រុំ
-
-ជ្រុះ
-
-ជ្រូ
-
-ជ្រួ
-
-ជ្រើ
-
-ជ្រៀ
-
-ជ្រេ
-
-ជ្រែ
-
-ជ្រៃ
-
-ជ្រោ
-
-ជ្រោះ
-
-ជ្រៅ
-
-ជ្រំ
-
-ជ្រះ
-
-ជ្វា
-
-ជ្វី
-
-ឈ
-
-ឈា
-
-ឈិ
-
-ឈី
-
-ឈឹ
-
-ឈឺ
-
-ឈុ
-
-	ឈុំ
-
-ឈូ
-
-ឈួ
-
-ឈើ
-
-ឈឿ
-
-ឈៀ
-
-ឈែ
-
-ឈៃ
-
-ឈោ
-
-	ឈោះ
-
-ឈោ្មះ
-
-	ឈ្ង
-
-ឈ្ងុ
-
-ឈ្ងោ
-
-ឈ្នា
-
-ឈ្នួ
-
-ឈ្នោះ
-
-ឈ្នះ
-
-ឈ្មួ
-
-ឈ្មោ
-
-ឈ្មោះ
-
-	ឈ្ល
-
-ឈ្លា
-
-ឈ្លី
-
-ឈ្លូ
-
-ឈ្លើ
-
-ឈ្លោះ
-
-ឈ្វេ
-
-ញ
-
-ញា
-
-	ញាំ
-
-ញិ
-
-ញី
-
-ញឹ
-
-ញុ
-
-	ញុំ
-
-ញុំា
-
-	ញុះ
-
-ញូ
-
-ញួ
-
-ញើ
-
-ញៀ
-
-ញេ
-
-ញេ្ច
-
-ញែ
-
-ញោ
-
-ញំ
-
-ញៈ
-
-ញ៉
-
-	ញ៉ា
-
-ញ៉ាំ
-
-	ញ៉ុ
-
-	ញ៉ូ
-
-	ញ៉េ
-
-	ញ៉ែ
-
-	ញ៉ៃ
-
-	ញ៉ៈ
-
-ញ់
-
-ញ៍
-
-ញ័
-
-	ញ្ច
-
-ញ្ចា
-
-ញ្ចាំ
-
-ញ្ចិ
-
-ញ្ចី
-
-ញ្ចឹ
-
-ញ្ចុ
-
-ញ្ចុះ
-
-ញ្ចូ
-
-ញ្ចួ
-
-ញ្ចើ
-
-ញ្ចៀ
-
-ញ្ចេ
-
-ញ្ចែ
-
-ញ្ចោ
-
-ញ្ចំ
-
-ញ្ច័
-
-ញ្ច្រ
-
-ញ្ច្រា
-
-ញ្ច្រាំ
-
-ញ្ច្រែ
-
-	ញ្ឆ
-
-ញ្ឆា
-
-ញ្ឆិ
-
-ញ្ឆេះ
-
-ញ្ឆោ
-
-	ញ្ជ
-
-ញ្ជា
-
-ញ្ជាំ
-
-ញ្ជី
-
-ញ្ជឹ
-
-ញ្ជុះ
-
-ញ្ជូ
-
-ញ្ជួ
-
-ញ្ជើ
-
-ញ្ជេ
-
-ញ្ជែ
-
-ញ្ជោ
-
-ញ្ជោះ
-
-ញ្ជះ
-
-ញ្ជ័
-
-ញ្ជ្រា
-
-ញ្ជ្រៀ
-
-ញ្ជ្រោ
-
-	ញ្ឈ
-
-	ញ្ញ
-
-ញ្ញា
-
-ញ្ញិ
-
-ញ្ញុ
-
-ញ្ញូ
-
-ញ្ញើ
-
-ញ្ញេ
-
-ញ្ញោ
-
-ញ្ញំ
-
-ញ្ញះ
-
-ញ្ញៈ
-
-ញ្ញ៉ា
-
-	ញ្ឍ
-
-ញ្រ្ចា
-
-ញ្រ្ចាំ
-
-ញ្រ្ចែ
-
-ញ្រ្ជាំ
-
-ញ្ហា
-
-ដ
-
-ដា
-
-	ដាំ
-
-ដា្ឋ
-
-ដិ
-
-ដី
-
-ដឹ
-
-ដឺ
-
-ដុ
-
-	ដុំ
-
-	ដុះ
-
-ដូ
-
-ដួ
-
-ដើ
-
-ដៀ
-
-ដេ
-
-ដែ
-
-ដៃ
-
-ដោ
-
-	ដោះ
-
-ដៅ
-
-ដំ
-
-	ដំា
-
-ដ់
-
-ដ៍
-
-ដ៏
-
-ដ័
-
-	ដ្ខ
-
-ដ្ខា
-
-	ដ្ជ
-
-	ដ្ដ
-
-ដ្ដី
-
-	ដ្ឋ
-
-ដ្ឋា
-
-ដ្ឋិ
-
-ដ្ឋី
-
-ដ្ឋេ
-
-ដ្ឋោ
-
-ដ្ឋំ
-
-	ដ្ឌ
-
-ដ្ឌា
-
-	ដ្ត
-
-ដ្តី
-
-ដ្តៈ
-
-	ដ្ថ
-
-ដ្ថា
-
-	ដ្ធ
-
-ដ្ធា
-
-ដ្ធី
-
-	ដ្ន
-
-ដ្នា
-
-ដ្និ
-
-ដ្នី
-
-ដ្បិ
-
-	ដ្ផ
-
-ដ្ផា
-
-	ដ្យ
-
-ដ្យា
-
-ដ្យូ
-
-ដ្យឿ
-
-ដ្រា
-
-ដ្រូ
-
-ដ្រេ
-
-ដ្វឺ
-
-ឋ
-
-ឋា
-
-ឋិ
-
-ឌ
-
-ឌា
-
-ឌិ
-
-ឌី
-
-ឌឹ
-
-ឌឺ
-
-ឌុ
-
-ឌូ
-
-ឌួ
-
-ឌើ
-
-ឌៀ
-
-ឌេ
-
-ឌែ
-
-ឌ័
-
-	ឌ្ឃ
-
-	ឌ្ឈ
-
-	ឌ្ឌ
-
-	ឌ្ឍ
-
-ឌ្ឍៈ
-
-ឌ្រា
-
-ឌ្រិ
-
-ឌ្រី
-
-ឍ
-
-	ឍ្ឍ
-
-ណ
-
-ណា
-
-	ណាំ
-
-ណាំៈ
-
-	ណា៎
-
-ណា្ត
-
-ណិ
-
-ណី
-
-ណឹ
-
-	ណឹះ
-
-ណឺ
-
-ណុ
-
-	ណុំ
-
-	ណុះ
-
-ណូ
-
-ណួ
-
-ណើ
-
-	ណើះ
-
-ណើ្ត
-
-ណេ
-
-	ណេះ
-
-ណេ្ត
-
-ណែ
-
-ណែ្ដ
-
-ណៃ
-
-ណោ
-
-	ណោះ
-
-ណៅ
-
-ណំ
-
-ណះ
-
-ណៈ
-
-ណ៌
-
-ណ៍
-
-	ណ៍ៈ
-
-	ណ៍់
-
-	ណ៎ា
-
-ណ៏
-
-	ណ៏ៈ
-
-ណ័
-
-	ណ្ខ
-
-	ណ្ដ
-
-ណ្ដា
-
-ណ្ដាំ
-
-ណ្ដឹ
-
-ណ្ដុ
-
-ណ្ដុំ
-
-ណ្ដុះ
-
-ណ្ដូ
-
-ណ្ដើ
-
-ណ្ដៀ
-
-ណ្ដេ
-
-ណ្ដែ
-
-ណ្ដោ
-
-ណ្ដោះ
-
-ណ្ដៅ
-
-ណ្ដំ
-
-	ណ្ឋ
-
-ណ្ឋា
-
-ណ្ឋិ
-
-	ណ្ឌ
-
-ណ្ឌា
-
-ណ្ឌិ
-
-ណ្ឌី
-
-ណ្ឌុ
-
-ណ្ឌូ
-
-ណ្ឌៀ
-
-ណ្ឌ័
-
-	ណ្ណ
-
-ណ្ណា
-
-ណ្ណិ
-
-ណ្ណី
-
-ណ្ណឹ
-
-ណ្ណេ
-
-ណ្ណេះ
-
-ណ្ណោះ
-
-ណ្ណំ
-
-ណ្ណះ
-
-ណ្ណៈ
-
-ណ្ណ័
-
-	ណ្ត
-
-ណ្តា
-
-ណ្តាំ
-
-ណ្តិ
-
-ណ្តឹ
-
-ណ្តុ
-
-ណ្តុំ
-
-ណ្តុះ
-
-ណ្តូ
-
-ណ្តើ
-
-ណ្តៀ
-
-ណ្តេ
-
-ណ្តែ
-
-ណ្តោ
-
-ណ្តោះ
-
-ណ្តៅ
-
-ណ្តំ
-
-ណ្នា
-
-ណ្នោះ
-
-	ណ្យ
-
-ណ្វៃ
-
-	ណ្ហ
-
-ណ្ហា
-
-ណ្ហើ
-
-ត
-
-តា
-
-	តាំ
-
-តិ
-
-	តិះ
-
-	តិ៍
-
-តិ្ដ
-
-តិ្ត
-
-តិ្ថ
-
-តី
-
-តឹ
-
-តឺ 
-
-តុ 
-
-	តុំ 
-
-	តុះ 
-
-តូ 
-
-តូ្រ 
-
-តួ 
-
-តើ 
-
-តឿ 
-
-តៀ 
-
-តៀ្រ 
-
-តេ 
-
-តែ 
-
-តៃ 
-
-តោ 
-
-	តោះ 
-
-តៅ 
-
-តំ 
-
-	តំា 
-
-តះ 
-
-តៈ 
-
-ត៉្តិ 
-
-ត់ 
-
-	ត់ៈ 
-
-ត៌ 
-
-ត៍ 
-
-ត៏ 
-
-ត័ 
-
-	ត្ដ 
-
-ត្ដា 
-
-ត្ដិ 
-
-ត្ដុ 
-
-	ត្ត 
-
-ត្តា 
-
-ត្តិ 
-
-ត្តី 
-
-ត្តឹ 
-
-ត្តុ 
-
-ត្តុំ 
-
-ត្តូ 
-
-ត្តេ 
-
-ត្តោ 
-
-ត្តំ 
-
-ត្តៈ 
-
-	ត្ថ 
-
-ត្ថា 
-
-ត្ថិ 
-
-ត្ថី 
-
-ត្ថុ 
-
-ត្ថេ 
-
-ត្ថៈ 
-
-	ត្ន 
-
-ត្នោ 
-
-ត្ន័ 
-
-	ត្ប 
-
-ត្បា 
-
-ត្បិ 
-
-ត្បុ 
-
-ត្បូ 
-
-ត្បួ 
-
-ត្បៀ 
-
-ត្បែ 
-
-ត្មា 
-
-ត្មះ 
-
-ត្ម័ 
-
-	ត្យ 
-
-ត្យា 
-
-ត្យូ 
-
-	ត្រ 
-
-ត្រា 
-
-ត្រាំ 
-
-ត្រិ 
-
-ត្រិះ 
-
-ត្រី 
-
-ត្រឹ 
-
-ត្រឹះ 
-
-ត្រឺ 
-
-ត្រុ 
-
-ត្រុំ 
-
-ត្រូ 
-
-ត្រួ 
-
-ត្រើ 
-
-ត្រៀ 
-
-ត្រេ 
-
-ត្រេះ 
-
-ត្រែ 
-
-ត្រៃ 
-
-ត្រោ 
-
-ត្រ័ 
-
-	ត្ល 
-
-ត្លុ 
-
-ត្លែ 
-
-	ត្វ 
-
-ត្វា 
-
-	ត្ស 
-
-ត្សា 
-
-ត្សឹ 
-
-ត្ស៍ 
-
-ត្ស្យ 
-
-ត្អឹ 
-
-ត្អូ 
-
-ត្អែ 
-
-ថ 
-
-ថា 
-
-	ថាំ 
-
-	ថាៈ 
-
-ថា្ន 
-
-ថា្ល 
-
-ថិ 
-
-ថី 
-
-ថី្ម 
-
-ថឹ 
-
-ថឺ 
-
-ថុ 
-
-ថូ 
-
-ថួ 
-
-ថើ 
-
-ថេ 
-
-ថែ 
-
-ថែ្ល 
-
-ថៃ 
-
-ថៃ្ង 
-
-ថៃ្ល 
-
-ថោ 
-
-	ថោះ 
-
-ថៅ 
-
-ថៈ 
-
-ថ៌ 
-
-ថ៍!
-
-ថ៏!
-
-ថ័!
-
-	ថ្ក!
-
-ថ្កា!
-
-ថ្កុ!
-
-ថ្កុំ!
-
-ថ្កូ!
-
-ថ្កើ!
-
-ថ្កោ!
-
-ថ្គា!
-
-ថ្ងា!
-
-ថ្ងូ!
-
-ថ្ងួ!
-
-ថ្ងែ!
-
-ថ្ងៃ!
-
-ថ្ញៃ!
-
-	ថ្ត!
-
-ថ្ថៃ!
-
-	ថ្ន!
-
-ថ្នា!
-
-ថ្នាំ!
-
-ថ្នី!
-
-ថ្នឹ!
-
-ថ្នូ!
-
-	ថ្ព!
-
-ថ្ពា!
-
-ថ្ពេ!
-
-	ថ្ម!
-
-ថ្មី!
-
-ថ្មើ!
-
-ថ្មោ!
-
-ថ្រា!
-
-	ថ្ល!
-
-ថ្លា!
-
-ថ្លឹ!
-
-ថ្លុ!
-
-ថ្លុំ!
-
-ថ្លើ!
-
-ថ្លែ!
-
-ថ្លៃ!
-
-ថ្លោះ!
-
-ថ្លះ!
-
-ថ្ល៍!
-
-ថ្វា!
-
-ថ្វី!
-
-ថ្វើ!
-
-ទ!
-
-ទា!
-
-	ទាំ!
-
-ទិ!
-
-	ទិ៍!
-
-	ទិ៏!
-
-ទិ្ទ!
-
-ទិ្ធ!
-
-ទី!
-
-ទី្វ!
-
-ទឹ!
-
-ទឺ!
-
-ទុ!
-
-	ទុំ!
-
-	ទុះ!
-
-ទូ!
-
-ទួ!
-
-ទើ!
-
-ទើ្ប!
-
-ទឿ!
-
-ទៀ!
-
-ទេ!
-
-	ទេះ!
-
-ទែ!
-
-ទៃ!
-
-ទោ!
-
-	ទោះ!
-
-ទៅ!
-
-	ទៅៈ!
-
-ទំ!
-
-	ទំា!
-
-ទះ!
-
-ទៈ!
-
-ទ៍!
-
-ទ័!
-
-	ទ្ឋ!
-
-ទ្ឋា!
-
-ទ្ឋិ!
-
-	ទ្ទ!
-
-ទ្ទា!
-
-ទ្ទិ!
-
-ទ្ទេ!
-
-ទ្ទៈ!
-
-	ទ្ធ!
-
-ទ្ធា!
-
-ទ្ធិ!
-
-ទ្ធិ៍!
-
-ទ្ធី!
-
-ទ្ធុ!
-
-ទ្ធេ!
-
-ទ្ធោ!
-
-ទ្ធំ!
-
-ទ្ធៈ!
-
-ទ្ធ័!
-
-ទ្បា!
-
-ទ្បិ!
-
-ទ្បុ!
-
-ទ្បូ!
-
-ទ្បើ!
-
-ទ្បេ!
-
-	ទ្ម!
-
-	ទ្យ!
-
-ទ្យា!
-
-ទ្យុ!
-
-	ទ្រ!
-
-ទ្រា!
-
-ទ្រាំ!
-
-ទ្រិ!
-
-ទ្រី!
-
-ទ្រឹ!
-
-ទ្រឺ!
-
-ទ្រុ!
-
-ទ្រូ!
-
-ទ្រើ!
-
-ទ្រឿ!
-
-ទ្រៀ!
-
-ទ្រេ!
-
-ទ្រោ!
-
-ទ្រៅ!
-
-ទ្រៈ!
-
-	ទ្វ!
-
-ទ្វា"
-
-ទ្វិ"
-
-ទ្វី"
-
-ទ្វេ"
-
-ធ"
-
-ធា"
-
-ធា្ល"
-
-ធិ"
-
-	ធិ៍"
-
-	ធិ៏"
-
-ធី"
-
-ធឹ"
-
-ធឺ"
-
-ធុ"
-
-	ធុំ"
-
-ធូ"
-
-ធួ"
-
-ធើ"
-
-ធើ្វ"
-
-ធឿ"
-
-ធៀ"
-
-ធេ"
-
-ធោ"
-
-ធំ"
-
-ធៈ"
-
-ធ៌"
-
-ធ៍"
-
-ធ៏"
-
-ធ័"
-
-	ធ្ង"
-
-ធ្ចើ"
-
-	ធ្ន"
-
-ធ្នា"
-
-ធ្នាំ"
-
-ធ្នឹ"
-
-ធ្នូ"
-
-ធ្នើ"
-
-ធ្នោះ"
-
-ធ្នះ"
-
-	ធ្ម"
-
-ធ្មឹ"
-
-ធ្មេ"
-
-	ធ្យ"
-
-ធ្យា"
-
-ធ្យូ"
-
-ធ្យោ"
-
-ធ្រា"
-
-	ធ្ល"
-
-ធ្លា"
-
-ធ្លី"
-
-ធ្លុ"
-
-ធ្លុះ"
-
-ធ្លោ"
-
-	ធ្វ"
-
-ធ្វា"
-
-ធ្វី"
-
-ធ្វើ"
-
-ធ្វេ"
-
-	ធ្ឫ"
-
-ន"
-
-នា"
-
-	នាំ"
-
-	នាះ"
-
-និ"
-
-	និះ"
-
-និ្ត"
-
-និ្ន"
-
-នី"
-
-នី្ទ"
-
-នឹ"
-
-នឺ"
-
-នុ"
-
-	នុំ"
-
-	នុះ"
-
-នុ៎ះ"
-
-នូ"
-
-នួ"
-
-នើ"
-
-នឿ"
-
-នៀ"
-
-នេ"
-
-	នេះ"
-
-នេ្ទ"
-
-នេ្ល"
-
-នែ"
-
-	នែ៎"
-
-នែ្ដ"
-
-នែ្ត"
-
-នែ្ថ"
-
-នែ្ល"
-
-នៃ"
-
-នោ"
-
-	នោះ"
-
-នៅ"
-
-នំ"
-
-	នំា"
-
-នះ"
-
-នៈ"
-
-	ន៉ា"
-
-ន់"
-
-ន៌"
-
-ន៍"
-
-ន៏"
-
-ន័"
-
-ន័្ធ"
-
-	ន្ង"
-
-	ន្ដ"
-
-ន្ដា"
-
-ន្ដាំ"
-
-ន្ដិ"
-
-ន្ដឹ"
-
-ន្ដួ"
-
-ន្ដើ"
-
-ន្ដេ"
-
-ន្ដែ"
-
-ន្ដោ"
-
-ន្ដោះ"
-
-ន្ដ្រា"
-
-ន្ដ្រី"
-
-	ន្ឋ"
-
-ន្ឋា"
-
-ន្ឋិ"
-
-ន្ឋឹ"
-
-ន្ឋូ"
-
-ន្ឋ័"
-
-ន្ឌា"
-
-	ន្ត"
-
-ន្តា"
-
-ន្តាំ#
-
-ន្តិ#
-
-ន្តី#
-
-ន្តឹ#
-
-ន្តុ#
-
-ន្តូ#
-
-ន្តួ#
-
-ន្តើ#
-
-ន្តេ#
-
-ន្តែ#
-
-ន្តោ#
-
-ន្តំ#
-
-ន្តៈ#
-
-ន្ត័#
-
-ន្ត្រ#
-
-ន្ត្រា#
-
-ន្ត្រី#
-
-ន្ត្រៃ#
-
-ន្ត្វា#
-
-	ន្ថ#
-
-ន្ថា#
-
-ន្ថឹ#
-
-ន្ថើ#
-
-ន្ថែ#
-
-ន្ថោ#
-
-ន្ថៈ#
-
-	ន្ទ#
-
-ន្ទា#
-
-ន្ទាំ#
-
-ន្ទិ#
-
-ន្ទី#
-
-ន្ទឹ#
-
-ន្ទឺ#
-
-ន្ទុ#
-
-ន្ទុះ#
-
-ន្ទូ#
-
-ន្ទួ#
-
-ន្ទេ#
-
-ន្ទែ#
-
-ន្ទោ#
-
-ន្ទោះ#
-
-ន្ទំ#
-
-ន្ទះ#
-
-ន្ទៈ#
-
-ន្ទ័#
-
-ន្ទ្រ#
-
-ន្ទ្រា#
-
-ន្ទ្រិ#
-
-ន្ទ្រី#
-
-	ន្ធ#
-
-ន្ធា#
-
-ន្ធិ#
-
-ន្ធិះ#
-
-ន្ធី#
-
-ន្ធឹ#
-
-ន្ធុ#
-
-ន្ធូ#
-
-ន្ធែ#
-
-ន្ធោ#
-
-ន្ធៅ#
-
-ន្ធំ#
-
-ន្ធៈ#
-
-ន្ធ័#
-
-	ន្ន#
-
-ន្នា#
-
-ន្និ#
-
-ន្នី#
-
-ន្នោ#
-
-ន្នោះ#
-
-ន្នំ#
-
-ន្នៈ#
-
-ន្ន័#
-
-	ន្ប#
-
-	ន្ម#
-
-ន្មា#
-
-ន្ម័#
-
-	ន្យ#
-
-ន្យា#
-
-ន្យឺ#
-
-ន្យុ#
-
-ន្រី#
-
-ន្រី្ត#
-
-ន្រី្ទ#
-
-ន្រៃ#
-
-ន្រៃ្ត#
-
-ន្រ្ដី#
-
-ន្រ្តា#
-
-ន្រ្តី#
-
-ន្រ្តៃ#
-
-ន្រ្ទ#
-
-ន្រ្ទា#
-
-ន្រ្ទិ#
-
-ន្រ្ទី#
-
-	ន្ល#
-
-ន្លា#
-
-ន្លិ#
-
-ន្លិះ#
-
-ន្លី#
-
-ន្លឹ#
-
-ន្លឹះ#
-
-ន្លឺ#
-
-ន្លុ#
-
-ន្លុះ#
-
-ន្លូ#
-
-ន្លួ#
-
-ន្លើ#
-
-ន្លឿ#
-
-ន្លេ#
-
-ន្លែ#
-
-ន្លៃ#
-
-ន្លោ#
-
-ន្លោះ#
-
-ន្លំ#
-
-ន្លះ#
-
-	ន្វ#
-
-ន្វេ#
-
-	ន្ស#
-
-ន្សា#
-
-ន្សឹ#
-
-ន្សុ#
-
-ន្សើ#
-
-ន្សែ#
-
-ន្សៃ#
-
-ន្សោ#
-
-ន្សំ#
-
-ន្ស៊ី#
-
-ប#
-
-បា#
-
-	បាំ$
-
-បា្ដ$
-
-បា្ត$
-
-បា្រ$
-
-បា្ល$
-
-បិ$
-
-បី$
-
-បឹ$
-
-បឺ$
-
-បុ$
-
-	បុំ$
-
-បូ$
-
-បួ$
-
-បើ$
-
-បឿ$
-
-បៀ$
-
-បៀ្រ$
-
-បេ$
-
-	បេះ$
-
-បែ$
-
-បែ្រ$
-
-បែ្ល$
-
-បៃ$
-
-បោ$
-
-	បោះ$
-
-បៅ$
-
-បំ$
-
-បះ$
-
-បៈ$
-
-ប៉$
-
-	ប៉ា$
-
-ប៉ាំ$
-
-	ប៉ិ$
-
-	ប៉ី$
-
-	ប៉ឹ$
-
-	ប៉ុ$
-
-	ប៉ូ$
-
-	ប៉ើ$
-
-	ប៉េ$
-
-	ប៉ែ$
-
-	ប៉ៃ$
-
-	ប៉ោ$
-
-ប៉ោះ$
-
-	ប៉ៅ$
-
-	ប៉ះ$
-
-	ប៉ៈ$
-
-	ប៉័$
-
-ប៉្រៃ$
-
-ប៊$
-
-	ប៊ិ$
-
-	ប៊ី$
-
-	ប៊ឹ$
-
-	ប៊ឺ$
-
-	ប៊ុ$
-
-	ប៊ូ$
-
-	ប៊ួ$
-
-	ប៊ើ$
-
-	ប៊េ$
-
-	ប៊ែ$
-
-	ប៊័$
-
-ប៊្រី$
-
-ប៊្រុ$
-
-ប៊្រូ$
-
-ប៊្រេ$
-
-ប់$
-
-	ប់ៈ$
-
-	ប់់$
-
-ប័$
-
-	ប្ញ$
-
-	ប្ដ$
-
-ប្ដា$
-
-ប្ដិ$
-
-ប្ដី$
-
-ប្ដឹ$
-
-ប្ដូ$
-
-ប្ដេ$
-
-	ប្ត$
-
-ប្តា$
-
-ប្តិ$
-
-ប្តី$
-
-ប្តឹ$
-
-ប្តូ$
-
-ប្តួ$
-
-ប្តេ$
-
-	ប្ប$
-
-ប្បា$
-
-ប្បិ$
-
-ប្បី$
-
-ប្បុ$
-
-ប្បំ$
-
-ប្បៈ$
-
-	ប្ផ$
-
-ប្ផា$
-
-ប្យា$
-
-	ប្រ$
-
-ប្រា$
-
-ប្រាំ$
-
-ប្រិ$
-
-ប្រិ៍$
-
-ប្រី$
-
-ប្រឹ$
-
-ប្រឺ$
-
-ប្រុ$
-
-ប្រូ$
-
-ប្រួ$
-
-ប្រើ$
-
-ប្រឿ$
-
-ប្រៀ$
-
-ប្រេ$
-
-ប្រេះ$
-
-ប្រែ$
-
-ប្រែៈ$
-
-ប្រៃ$
-
-ប្រោ$
-
-ប្រោះ$
-
-ប្រះ$
-
-ប្រៈ$
-
-ប្រ៉ា$
-
-ប្រ៊ី$
-
-ប្រ៊ុ$
-
-ប្រ៊ូ$
-
-ប្រ័$
-
-	ប្ល$
-
-ប្លា$
-
-ប្លី$
-
-ប្លុ$
-
-ប្លូ$
-
-ប្លែ$
-
-ប្លោ%
-
-	ប្ស%
-
-ប្អូ%
-
-ប្អៀ%
-
-ផ%
-
-ផា%
-
-	ផាំ%
-
-ផិ%
-
-ផី%
-
-ផឹ%
-
-ផឺ%
-
-ផុ%
-
-ផូ%
-
-ផួ%
-
-ផើ%
-
-ផើ្ត%
-
-ផៀ%
-
-ផេ%
-
-	ផេះ%
-
-ផេ្ទ%
-
-ផេ្ស%
-
-ផែ%
-
-ផែ្ន%
-
-ផែ្ល%
-
-ផែ្អ%
-
-ផៃ%
-
-ផៃ្ទ%
-
-ផោ%
-
-ផៅ%
-
-ផៈ%
-
-ផ្កា%
-
-	ផ្គ%
-
-ផ្គា%
-
-ផ្គាំ%
-
-ផ្គុ%
-
-ផ្គុំ%
-
-ផ្គូ%
-
-ផ្គួ%
-
-ផ្ងា%
-
-ផ្ងូ%
-
-	ផ្ច%
-
-ផ្ចា%
-
-ផ្ចិ%
-
-ផ្ញើ%
-
-	ផ្ដ%
-
-ផ្ដា%
-
-ផ្ដាំ%
-
-ផ្ដិ%
-
-ផ្ដុំ%
-
-ផ្ដួ%
-
-ផ្ដើ%
-
-ផ្ដេ%
-
-ផ្ដែ%
-
-ផ្ដោ%
-
-ផ្ដោះ%
-
-ផ្ដៅ%
-
-	ផ្ត%
-
-ផ្តា%
-
-ផ្តាំ%
-
-ផ្តិ%
-
-ផ្តុំ%
-
-ផ្តូ%
-
-ផ្តួ%
-
-ផ្តើ%
-
-ផ្តេ%
-
-ផ្តែ%
-
-ផ្តោ%
-
-ផ្តោះ%
-
-ផ្តៅ%
-
-ផ្តះ%
-
-	ផ្ទ%
-
-ផ្ទា%
-
-ផ្ទាំ%
-
-ផ្ទិ%
-
-ផ្ទី%
-
-ផ្ទឹ%
-
-ផ្ទុ%
-
-ផ្ទុំ%
-
-ផ្ទុះ%
-
-ផ្ទួ%
-
-ផ្ទៀ%
-
-ផ្ទេ%
-
-ផ្ទែ%
-
-ផ្ទៃ%
-
-ផ្ទំ%
-
-ផ្ទះ%
-
-	ផ្ន%
-
-ផ្នូ%
-
-ផ្នួ%
-
-ផ្នែ%
-
-ផ្ផា%
-
-ផ្យា%
-
-ផ្រា%
-
-	ផ្ល%
-
-ផ្លា%
-
-ផ្លិ%
-
-ផ្លី%
-
-ផ្លុ%
-
-ផ្លុំ%
-
-ផ្លូ%
-
-ផ្លួ%
-
-ផ្លើ%
-
-ផ្លេ%
-
-ផ្លែ%
-
-ផ្លោ%
-
-ផ្លោះ%
-
-	ផ្វ%
-
-ផ្វា%
-
-ផ្វាំ%
-
-ផ្វុ%
-
-ផ្វ្រ%
-
-	ផ្ស%
-
-ផ្សា%
-
-ផ្សាំ%
-
-ផ្សិ%
-
-ផ្សឹ%
-
-ផ្សុ%
-
-ផ្សើ%
-
-ផ្សេ%
-
-ផ្សែ%
-
-ផ្សៃ%
-
-ផ្សោ%
-
-ផ្សំ%
-
-ផ្សះ%
-
-ផ្ស៊ាំ%
-
-	ផ្អ%
-
-ផ្អា%
-
-ផ្អើ%
-
-ផ្អៀ&
-
-ផ្អែ&
-
-ផ្អោ&
-
-ព&
-
-ពា&
-
-	ពាំ&
-
-	ពា៏&
-
-ពា្ច&
-
-ពា្ជ&
-
-ពា្វ&
-
-ពិ&
-
-ពី&
-
-ពឹ&
-
-ពឺ&
-
-ពុ&
-
-	ពុំ&
-
-	ពុះ&
-
-ពូ&
-
-ពួ&
-
-ពើ&
-
-ពៀ&
-
-ពេ&
-
-	ពេះ&
-
-ពែ&
-
-ពៃ&
-
-ពោ&
-
-	ពោះ&
-
-ពៅ&
-
-ពំ&
-
-ពះ&
-
-ពៈ&
-
-ព៌&
-
-	ព៌ា&
-
-	ព៌េ&
-
-ព៍&
-
-ព៏&
-
-ព័&
-
-	ព្ច&
-
-ព្ចឹា&
-
-ព្ជា&
-
-ព្ជើា&
-
-ព្ដា&
-
-	ព្ឋ&
-
-ព្តា&
-
-	ព្ទ&
-
-ព្ទៈ&
-
-ព្ទ័&
-
-	ព្ធ&
-
-	ព្ន&
-
-ព្នា&
-
-ព្នៅ&
-
-	ព្ព&
-
-	ព្ភ&
-
-ព្ភូ&
-
-	ព្យ&
-
-ព្យា&
-
-ព្យុ&
-
-ព្យុះ&
-
-ព្យូ&
-
-ព្យួ&
-
-ព្យែ&
-
-	ព្រ&
-
-ព្រា&
-
-ព្រិ&
-
-ព្រី&
-
-ព្រឹ&
-
-ព្រឺ&
-
-ព្រុ&
-
-ព្រុំ&
-
-ព្រុះ&
-
-ព្រូ&
-
-ព្រួ&
-
-ព្រើ&
-
-ព្រៀ&
-
-ព្រេ&
-
-ព្រែ&
-
-ព្រៃ&
-
-ព្រោ&
-
-ព្រោះ&
-
-ព្រៅ&
-
-ព្រំ&
-
-ព្រះ&
-
-ព្រ័&
-
-	ព្ល&
-
-	ព្វ&
-
-ព្វា&
-
-ព្វិ&
-
-ព្វុ&
-
-ព្វេ&
-
-ព្វោ&
-
-ព្វំ&
-
-ព្វៈ&
-
-ភ&
-
-ភា&
-
-	ភាំ&
-
-ភា្ជ&
-
-ភា្ល&
-
-ភិ&
-
-ភី&
-
-ភឹ&
-
-ភឺ&
-
-ភឺ្ល&
-
-ភុ&
-
-	ភុំ&
-
-ភូ&
-
-ភួ&
-
-ភើ&
-
-ភើ្ល&
-
-ភឿ&
-
-ភៀ&
-
-ភេ&
-
-ភេ្ល&
-
-ភែ&
-
-ភែ្ន&
-
-ភោ&
-
-ភៅ&
-
-ភំ&
-
-ភំ្ន&
-
-ភៈ&
-
-ភ៌&
-
-ភ័&
-
-ភ្ងា&
-
-ភ្ជា&
-
-ភ្ជុំ&
-
-ភ្ជួ&
-
-ភ្ញា&
-
-ភ្ញី&
-
-ភ្ញៀ&
-
-	ភ្ន'
-
-ភ្នា'
-
-ភ្នុំ'
-
-ភ្នែ'
-
-ភ្នំ'
-
-	ភ្ល'
-
-ភ្លា'
-
-ភ្លាំ'
-
-ភ្លី'
-
-ភ្លឹ'
-
-ភ្លឺ'
-
-ភ្លុ'
-
-ភ្លូ'
-
-ភ្លើ'
-
-ភ្លៀ'
-
-ភ្លេ'
-
-ភ្លែ'
-
-ភ្លៃ'
-
-ភ្លោះ'
-
-ភ្លៅ'
-
-ភ្វិ'
-
-ភ្វី'
-
-ភ្វូ'
-
-ម'
-
-មា'
-
-	មាំ'
-
-មា្ច'
-
-មា្ដ'
-
-មា្ន'
-
-មា្ល'
-
-មិ'
-
-	មិះ'
-
-មិ្ម'
-
-មី'
-
-មី្ប'
-
-មឹ'
-
-មឺ'
-
-មុ'
-
-	មុំ'
-
-មុំា'
-
-	មុះ'
-
-មូ'
-
-មួ'
-
-	មួួ'
-
-មើ'
-
-មឿ'
-
-មៀ'
-
-មេ'
-
-មេ្ដ'
-
-មេ្ត'
-
-មែ'
-
-មែ្ត'
-
-មៃ'
-
-មៃ្ល'
-
-មោ'
-
-	មោះ'
-
-មៅ'
-
-មំ'
-
-មៈ'
-
-ម៉'
-
-	ម៉ា'
-
-ម៉ាំ'
-
-	ម៉ិ'
-
-	ម៉ី'
-
-	ម៉ឹ'
-
-	ម៉ឺ'
-
-	ម៉ុ'
-
-	ម៉ូ'
-
-	ម៉េ'
-
-ម៉េ្លះ'
-
-	ម៉ែ'
-
-	ម៉ៃ'
-
-	ម៉ោ'
-
-ម៉ោះ'
-
-	ម៉ៅ'
-
-ម៉្យា'
-
-ម៉្លេះ'
-
-ម៉្លោះ'
-
-	ម៊ី'
-
-	ម៊ឺ'
-
-	ម៊ែ'
-
-ម់'
-
-ម៌'
-
-ម៍'
-
-ម៏'
-
-ម័'
-
-ម័្ព'
-
-	ម្ក'
-
-ម្កា'
-
-ម្កុ'
-
-ម្កើ'
-
-ម្ខា'
-
-ម្គា'
-
-ម្គី'
-
-	ម្ង'
-
-ម្ងា'
-
-ម្ងឺ'
-
-ម្ងួ'
-
-ម្ងំ'
-
-ម្ចា'
-
-ម្ចី'
-
-	ម្ជ'
-
-ម្ជុ'
-
-ម្ជូ'
-
-	ម្ដ'
-
-ម្ដា'
-
-ម្ដី'
-
-ម្ដុំ'
-
-ម្ដេ'
-
-ម្ដែ'
-
-ម្ដៅ'
-
-	ម្ត'
-
-ម្តា'
-
-ម្តី'
-
-ម្តុំ'
-
-ម្តេ'
-
-ម្តែ'
-
-ម្តៅ'
-
-	ម្ថ'
-
-ម្ទេ'
-
-	ម្ន'
-
-ម្នា'
-
-ម្នី'
-
-ម្នេ'
-
-ម្នះ'
-
-	ម្ប'
-
-ម្បា'
-
-ម្បាំ'
-
-ម្បិ(
-
-ម្បី(
-
-ម្បុ(
-
-ម្បូ(
-
-ម្បើ(
-
-ម្បែ(
-
-ម្ប៉ា(
-
-	ម្ផ(
-
-	ម្ព(
-
-ម្ពា(
-
-ម្ពិ(
-
-ម្ពី(
-
-ម្ពុ(
-
-ម្ពូ(
-
-ម្ពោ(
-
-ម្ព័(
-
-	ម្ភ(
-
-ម្ភា(
-
-ម្ភិ(
-
-ម្ភុ(
-
-ម្ភៃ(
-
-ម្ភោ(
-
-ម្ភះ(
-
-ម្ភៈ(
-
-	ម្ម(
-
-ម្មា(
-
-ម្មិ(
-
-ម្មុ(
-
-ម្មេ(
-
-ម្មោ(
-
-ម្មំ(
-
-ម្មៈ(
-
-	ម្យ(
-
-ម្យា(
-
-ម្យ៉ា(
-
-	ម្រ(
-
-ម្រា(
-
-ម្រាំ(
-
-ម្រិ(
-
-ម្រិះ(
-
-ម្រឹ(
-
-ម្រុ(
-
-ម្រុះ(
-
-ម្រូ(
-
-ម្រួ(
-
-ម្រើ(
-
-ម្រៀ(
-
-ម្រេ(
-
-ម្រែ(
-
-ម្រៃ(
-
-ម្រោ(
-
-ម្រៅ(
-
-ម្រះ(
-
-ម្រ៉ែ(
-
-ម្រ័(
-
-	ម្ល(
-
-ម្លា(
-
-ម្លាំ(
-
-ម្លិះ(
-
-ម្លឹ(
-
-ម្លុ(
-
-ម្លុះ(
-
-ម្លូ(
-
-ម្លើ(
-
-ម្លៀ(
-
-ម្លេ(
-
-ម្លេះ(
-
-ម្លែ(
-
-ម្លៃ(
-
-ម្លោះ(
-
-ម្ល៉េះ(
-
-ម្ល៉ោះ(
-
-ម្វុ(
-
-	ម្ស(
-
-ម្សា(
-
-ម្សិ(
-
-ម្សៀ(
-
-ម្សៅ(
-
-	ម្ហ(
-
-ម្ហិ(
-
-ម្ហូ(
-
-	ម្អ(
-
-ម្អា(
-
-ម្អិ(
-
-ម្អូ(
-
-ម្អៀ(
-
-ម្អែ(
-
-យ(
-
-យា(
-
-	យាំ(
-
-	យា៉(
-
-យិ(
-
-យី(
-
-យឹ(
-
-យឺ(
-
-យុ(
-
-	យុំ(
-
-យុំា(
-
-យូ(
-
-យួ(
-
-យើ(
-
-យឿ(
-
-យៀ(
-
-យេ(
-
-យែ(
-
-យោ(
-
-យំ(
-
-យះ(
-
-យៈ(
-
-យ៉(
-
-	យ៉ា(
-
-យ៉ាំ(
-
-	យ៉ឺ(
-
-	យ៉ុ(
-
-	យ៉ូ(
-
-	យ៉េ(
-
-	យ៉ែ(
-
-	យ៉ៃ(
-
-យ់(
-
-យ៍(
-
-យ៏(
-
-យ័(
-
-	យ្យ(
-
-យ្យា(
-
-យ្យិ(
-
-យ្យេ(
-
-យ្យោ(
-
-យ្យំ(
-
-យ្យៈ)
-
-	យ្ហ)
-
-រ)
-
-រា)
-
-	រាំ)
-
-រា្រ)
-
-រិ)
-
-	រិះ)
-
-	រិ៍)
-
-រី)
-
-រឹ)
-
-រឺ)
-
-រុ)
-
-	រុំ)
-
-	រុះ)
-
-	រុ៍)
-
-រូ)
-
-រួ)
-
-រើ)
-
-រឿ)
-
-រៀ)
-
-រេ)
-
-រែ)
-
-រៃ)
-
-រោ)
-
-	រោះ)
-
-រៅ)
-
-រំ)
-
-	រំា)
-
-រះ)
-
-រៈ)
-
-រ៉)
-
-	រ៉ា)
-
-រ៉ាំ)
-
-	រ៉ិ)
-
-	រ៉ី)
-
-	រ៉ឹ)
-
-	រ៉ឺ)
-
-	រ៉ុ)
-
-	រ៉ូ)
-
-	រ៉េ)
-
-	រ៉ែ)
-
-	រ៉ៃ)
-
-	រ៊ិ)
-
-រ់)
-
-រ៌)
-
-រ៍)
-
-រ៏)
-
-រ័)
-
-រ័្ម)
-
-រ្ដិ៍)
-
-រ្ដិ៏)
-
-រ្តិ)
-
-រ្តិ៍)
-
-រ្តិ៏)
-
-	រ្ម)
-
-រ្ម័)
-
-	រ្យ)
-
-រ្យូ)
-
-រ្យែ)
-
-រ្យ័)
-
-	រ្រ)
-
-	រ្វ)
-
-	រ្ស)
-
-ល)
-
-លា)
-
-	លាំ)
-
-លិ)
-
-លី)
-
-	លីៈ)
-
-លឹ)
-
-លឺ)
-
-លុ)
-
-	លុះ)
-
-លូ)
-
-លួ)
-
-លើ)
-
-លឿ)
-
-លៀ)
-
-លេ)
-
-	លេះ)
-
-លែ)
-
-លែ្ប)
-
-លៃ)
-
-លោ)
-
-	លោះ)
-
-លៅ)
-
-លំ)
-
-លះ)
-
-លៈ)
-
-ល់)
-
-	ល់ៈ)
-
-ល៍)
-
-ល៍្ប)
-
-ល័)
-
-ល្ខោ)
-
-	ល្គ)
-
-ល្គឹ)
-
-ល្គុ)
-
-	ល្ង)
-
-ល្ងា)
-
-ល្ងិ)
-
-ល្ងើ)
-
-	ល្ប)
-
-ល្បា)
-
-ល្បិ)
-
-ល្បី)
-
-ល្បុ)
-
-ល្បួ)
-
-ល្បើ)
-
-ល្បឿ)
-
-ល្បែ)
-
-ល្បះ)
-
-ល្បៈ)
-
-ល្ប៍)
-
-ល្ប៏)
-
-ល្ពៅ)
-
-	ល្ម)
-
-ល្មា)
-
-ល្មុ)
-
-ល្មួ)
-
-ល្មើ)
-
-ល្មៃ)
-
-ល្មោ)
-
-	ល្យ)
-
-ល្យា)
-
-ល្យូ)
-
-	ល្ល)
-
-ល្លា*
-
-ល្លិ*
-
-ល្លិ៍*
-
-ល្លី*
-
-ល្លឺ*
-
-ល្លៀ*
-
-ល្លែ*
-
-ល្លៈ*
-
-ល្ល៍*
-
-ល្ល័*
-
-	ល្វ*
-
-ល្វា*
-
-ល្វី*
-
-ល្វឹ*
-
-ល្វើ*
-
-ល្វេ*
-
-ល្វែ*
-
-ល្វោ*
-
-	ល្ហ*
-
-ល្ហិ*
-
-ល្ហុ*
-
-ល្ហើ*
-
-ល្ហេ*
-
-ល្ហែ*
-
-ល្ហៃ*
-
-	ល្អ*
-
-ល្អា*
-
-ល្អិ*
-
-ល្អី*
-
-ល្អៀ*
-
-ល្អះ*
-
-វ*
-
-វា*
-
-	វាំ*
-
-វិ*
-
-វី*
-
-វឹ*
-
-វឺ*
-
-វុ*
-
-វូ*
-
-វើ*
-
-វឿ*
-
-វៀ*
-
-វេ*
-
-	វេះ*
-
-វែ*
-
-វៃ*
-
-វោ*
-
-វំ*
-
-	វំា*
-
-វះ*
-
-វៈ*
-
-វ៉*
-
-	វ៉ា*
-
-វ៉ាំ*
-
-	វ៉ិ*
-
-	វ៉ី*
-
-	វ៉ឹ*
-
-	វ៉ឺ*
-
-	វ៉ុ*
-
-	វ៉ូ*
-
-	វ៉ើ*
-
-	វ៉េ*
-
-	វ៉ែ*
-
-	វ៉ៃ*
-
-	វ៉ោ*
-
-	វ៉ៅ*
-
-វ៌*
-
-វ៍*
-
-វ័*
-
-វ្នំ*
-
-វ្យា*
-
-វ្យូ*
-
-វ្យែ*
-
-វ្លែ*
-
-វ្ល៉ា*
-
-វ្ហា*
-
-ឝ*
-
-ឝា*
-
-	ឝ៊ិ*
-
-	ឝ៊ឺ*
-
-	ឝ៊ូ*
-
-ឞ*
-
-ស*
-
-សា*
-
-	សាំ*
-
-សា្ថ*
-
-សា្រ*
-
-សា្ល*
-
-សា្វ*
-
-សិ*
-
-សិ្ថ*
-
-សិ្ស*
-
-សី*
-
-	សីុ*
-
-សឹ*
-
-សឹ្ទ*
-
-សឺ*
-
-សុ*
-
-	សុី*
-
-	សុែ*
-
-	សុំ*
-
-	សុះ*
-
-សូ*
-
-សួ*
-
-សើ*
-
-សឿ*
-
-សៀ*
-
-សេ*
-
-	សេះ*
-
-សេ្ត*
-
-សេ្ថ*
-
-សេ្ន*
-
-សែ*
-
-សែ្ប*
-
-សែ្ល*
-
-សែ្វ*
-
-សៃ*
-
-សោ*
-
-	សោះ*
-
-សៅ*
-
-សំ*
-
-សះ*
-
-សៈ*
-
-ស៉្បា*
-
-ស៉្យា*
-
-ស៊*
-
-	ស៊ា*
-
-ស៊ាំ+
-
-	ស៊ិ+
-
-	ស៊ី+
-
-	ស៊ឹ+
-
-	ស៊ឺ+
-
-	ស៊ុ+
-
-ស៊ុំ+
-
-	ស៊ូ+
-
-	ស៊ួ+
-
-	ស៊ើ+
-
-	ស៊ៀ+
-
-	ស៊េ+
-
-	ស៊ែ+
-
-	ស៊័+
-
-ស៊្រុ+
-
-ស៊្លី+
-
-ស៊្វែ+
-
-ស៊្សី+
-
-ស់+
-
-	ស់់+
-
-ស៌+
-
-ស៍+
-
-ស៏+
-
-ស័+
-
-	ស្ក+
-
-ស្កា+
-
-ស្កិ+
-
-ស្កី+
-
-ស្កឹ+
-
-ស្កុ+
-
-ស្កូ+
-
-ស្កួ+
-
-ស្កេ+
-
-ស្កែ+
-
-ស្កៃ+
-
-ស្កះ+
-
-ស្ក្រឹ+
-
-	ស្គ+
-
-ស្គា+
-
-ស្គាំ+
-
-ស្គី+
-
-ស្គី្រ+
-
-ស្គុ+
-
-ស្គុះ+
-
-ស្គូ+
-
-ស្គ៍+
-
-ស្គ្រី+
-
-	ស្ង+
-
-ស្ងា+
-
-ស្ងួ+
-
-ស្ងើ+
-
-ស្ងៀ+
-
-ស្ងោ+
-
-ស្ចា+
-
-ស្ចិ+
-
-ស្ចឹ+
-
-	ស្ឆ+
-
-ស្ឆា+
-
-ស្ឈូ+
-
-	ស្ញ+
-
-ស្ញើ+
-
-ស្ញែ+
-
-	ស្ដ+
-
-ស្ដា+
-
-ស្ដាំ+
-
-ស្ដិ+
-
-ស្ដី+
-
-ស្ដឹ+
-
-ស្ដុ+
-
-ស្ដូ+
-
-ស្ដួ+
-
-ស្ដើ+
-
-ស្ដេ+
-
-ស្ដែ+
-
-ស្ដោះ+
-
-ស្ដៅ+
-
-ស្ដ្រ+
-
-ស្ដ្រា+
-
-ស្ដ្រី+
-
-	ស្ឋ+
-
-ស្ឋា+
-
-ស្ឋិ+
-
-	ស្ណ+
-
-ស្ណុ+
-
-ស្ណៈ+
-
-	ស្ត+
-
-ស្តា+
-
-ស្តាំ+
-
-ស្តិ+
-
-ស្តិ៍+
-
-ស្តី+
-
-ស្តឹ+
-
-ស្តុ+
-
-ស្តូ+
-
-ស្តួ+
-
-ស្តើ+
-
-ស្តេ+
-
-ស្តែ+
-
-ស្តោះ+
-
-ស្តៅ+
-
-ស្ត៍+
-
-ស្ត្រ+
-
-ស្ត្រា+
-
-ស្ត្រី+
-
-ស្ត្រុំ+
-
-ស្ត្រូ+
-
-ស្ត្រេ+
-
-	ស្ថ+
-
-ស្ថា+
-
-ស្ថិ+
-
-ស្ថូ+
-
-ស្ថេ+
-
-	ស្ទ+
-
-ស្ទា+
-
-ស្ទាំ+
-
-ស្ទិ+
-
-ស្ទី+
-
-ស្ទឹ+
-
-ស្ទុះ+
-
-ស្ទូ+
-
-ស្ទួ+
-
-ស្ទើ+
-
-ស្ទៀ+
-
-ស្ទេ+
-
-ស្ទែ+
-
-ស្ទោ+
-
-ស្ទះ+
-
-ស្ទ័+
-
-	ស្ធ,
-
-	ស្ន,
-
-ស្នា,
-
-ស្និ,
-
-ស្នឹ,
-
-ស្នុ,
-
-ស្នូ,
-
-ស្នួ,
-
-ស្នើ,
-
-ស្នៀ,
-
-ស្នេ,
-
-ស្នែ,
-
-ស្នំ,
-
-	ស្ប,
-
-ស្បា,
-
-ស្បុ,
-
-ស្បូ,
-
-ស្បើ,
-
-ស្បៀ,
-
-ស្បែ,
-
-ស្បៃ,
-
-ស្បោ,
-
-ស្ប៉ា,
-
-ស្ប៉ូ,
-
-	ស្ព,
-
-ស្ពា,
-
-ស្ពិ,
-
-ស្ពី,
-
-ស្ពឹ,
-
-ស្ពឺ,
-
-ស្ពៀ,
-
-ស្ពេ,
-
-ស្ពែ,
-
-ស្ពៃ,
-
-ស្ពោ,
-
-ស្ព្រេ,
-
-	ស្ម,
-
-ស្មា,
-
-ស្មិ,
-
-ស្មី,
-
-ស្មឹ,
-
-ស្មុ,
-
-ស្មុំ,
-
-ស្មូ,
-
-ស្មើ,
-
-ស្មៀ,
-
-ស្មេ,
-
-ស្មោ,
-
-ស្មោះ,
-
-ស្មៅ,
-
-ស្មៈ,
-
-ស្ម័,
-
-	ស្យ,
-
-ស្យា,
-
-ស្យុ,
-
-ស្យូ,
-
-ស្យែ,
-
-ស្យ៉ឺ,
-
-	ស្រ,
-
-ស្រា,
-
-ស្រាំ,
-
-ស្រា្ត,
-
-ស្រិ,
-
-ស្រី,
-
-ស្រី្ត,
-
-ស្រឹ,
-
-ស្រុ,
-
-ស្រុះ,
-
-ស្រូ,
-
-ស្រួ,
-
-ស្រើ,
-
-ស្រៀ,
-
-ស្រេ,
-
-ស្រេះ,
-
-ស្រែ,
-
-ស្រែះ,
-
-ស្រោ,
-
-ស្រះ,
-
-ស្រៈ,
-
-ស្រ៊ុ,
-
-ស្រ័,
-
-ស្រ្កឹ,
-
-ស្រ្ដ,
-
-ស្រ្ដា,
-
-ស្រ្ដី,
-
-ស្រ្ត,
-
-ស្រ្តា,
-
-ស្រ្តី,
-
-ស្រ្តឹ,
-
-ស្រ្តូ,
-
-ស្រ្តេ,
-
-	ស្ល,
-
-ស្លា,
-
-ស្លាំ,
-
-ស្លី,
-
-ស្លឹ,
-
-ស្លឺ,
-
-ស្លុ,
-
-ស្លូ,
-
-ស្លៀ,
-
-ស្លេ,
-
-ស្លេះ,
-
-ស្លែ,
-
-ស្លោ,
-
-	ស្វ,
-
-ស្វា,
-
-ស្វិ,
-
-ស្វី,
-
-ស្វូ,
-
-ស្វេ,
-
-ស្វែ,
-
-ស្វៃ,
-
-ស្វះ,
-
-ស្វ៊ី,
-
-ស្វ៊ែ,
-
-ស្វ័,
-
-	ស្ស,
-
-ស្សា,
-
-ស្សិ,
-
-ស្សី,
-
-ស្សឹ,
-
-ស្សឺ,
-
-ស្សុ,
-
-ស្សូ,
-
-ស្សេ,
-
-ស្សែ,
-
-ស្សោ,
-
-ស្សំ,
-
-ស្សៈ-
-
-ស្ស៊ិ-
-
-ស្ស៊ី-
-
-ស្ស័-
-
-ស្ហែ-
-
-	ស្អ-
-
-ស្អា-
-
-ស្អិ-
-
-ស្អី-
-
-ស្អុ-
-
-ស្អេ-
-
-ស្អែ-
-
-ស្អំ-
-
-ហ-
-
-ហា-
-
-	ហាំ-
-
-ហិ-
-
-ហី-
-
-ហឹ-
-
-ហឺ-
-
-ហុ-
-
-	ហុំ-
-
-ហូ-
-
-	ហូ៎-
-
-ហួ-
-
-ហើ-
-
-ហឿ-
-
-ហៀ-
-
-ហេ-
-
-	ហេះ-
-
-ហែ-
-
-ហៃ-
-
-ហោ-
-
-	ហោះ-
-
-ហៅ-
-
-ហំ-
-
-ហះ-
-
-ហៈ-
-
-	ហ៉ា-
-
-ហ៊-
-
-	ហ៊ា-
-
-	ហ៊ិ-
-
-	ហ៊ី-
-
-	ហ៊ឹ-
-
-	ហ៊ឺ-
-
-	ហ៊ុ-
-
-ហ៊ុំ-
-
-	ហ៊ូ-
-
-	ហ៊ួ-
-
-	ហ៊ែ-
-
-	ហ៊ោ-
-
-ហ៊្គី-
-
-ហ៊្គោ-
-
-ហ៊្វា-
-
-ហ៊្វិ-
-
-ហ៊្វី-
-
-ហ៊្វុ-
-
-ហ៊្វូ-
-
-ហ៊្សី-
-
-ហ៌-
-
-ហ៍-
-
-ហ៏-
-
-ហ័-
-
-	ហ្ក-
-
-ហ្កា-
-
-ហ្កិ-
-
-ហ្កេ-
-
-	ហ្គ-
-
-ហ្គា-
-
-ហ្គាំ-
-
-ហ្គិ-
-
-ហ្គី-
-
-ហ្គឹ-
-
-ហ្គឺ-
-
-ហ្គុ-
-
-ហ្គូ-
-
-ហ្គួ-
-
-ហ្គើ-
-
-ហ្គេ-
-
-ហ្គែ-
-
-ហ្គោ-
-
-ហ្គ័-
-
-ហ្គ្រ-
-
-ហ្គ្រា-
-
-ហ្គ្រី-
-
-ហ្គ្រេ-
-
-ហ្គ្រែ-
-
-ហ្គ្លី-
-
-	ហ្ន-
-
-ហ្នឹ-
-
-ហ្ន៎-
-
-ហ្ន៏-
-
-	ហ្ម-
-
-ហ្មា-
-
-ហ្មឺ-
-
-ហ្ម័-
-
-ហ្យូ-
-
-ហ្រា-
-
-ហ្រិ-
-
-ហ្រ្គេ-
-
-ហ្រ្វ-
-
-ហ្រ្វា-
-
-ហ្រ្វាំ-
-
-ហ្រ្វិ-
-
-	ហ្ល-
-
-ហ្លា-
-
-ហ្លូ-
-
-ហ្លួ-
-
-	ហ្វ-
-
-ហ្វា-
-
-ហ្វាំ-
-
-ហ្វិ-
-
-ហ្វី-
-
-ហ្វឹ-
-
-ហ្វឺ-
-
-ហ្វុ-
-
-ហ្វូ-
-
-ហ្វួ-
-
-ហ្វើ-
-
-ហ្វេ-
-
-ហ្វែ-
-
-ហ្វៃ-
-
-ហ្វ៊ា-
-
-ហ្វ៊ី-
-
-ហ្វ៊ុ-
-
-ហ្វ័-
-
-ហ្វ្រ-
-
-ហ្វ្រា-
-
-ហ្វ្រិ.
-
-ហ្វ្រី.
-
-ហ្វ្រេ.
-
-ហ្វ្រែ.
-
-	ហ្ស.
-
-ហ្សា.
-
-ហ្សិ.
-
-ហ្សី.
-
-ហ្សឹ.
-
-ហ្សឺ.
-
-ហ្សុ.
-
-ហ្សូ.
-
-ហ្សៀ.
-
-ហ្សេ.
-
-ហ្សែ.
-
-ហ្សំ.
-
-ហ្ស៊.
-
-ហ្ស៊ិ.
-
-ហ្ស៊ី.
-
-ហ្ស៊ុ.
-
-ហ្ស៊ូ.
-
-ហ្ស៍.
-
-ហ្ស័.
-
-	ហ្ឫ.
-
-ឡ.
-
-ឡា.
-
-	ឡាំ.
-
-ឡិ.
-
-ឡី.
-
-ឡឹ.
-
-ឡឺ.
-
-ឡុ.
-
-	ឡុំ.
-
-ឡូ.
-
-ឡួ.
-
-ឡើ.
-
-ឡេ.
-
-	ឡេះ.
-
-ឡែ.
-
-ឡៃ.
-
-ឡោ.
-
-	ឡោះ.
-
-ឡៅ.
-
-ឡំ.
-
-ឡះ.
-
-ឡៈ.
-
-	ឡ្ហ.
-
-ឡ្ហៈ.
-
-អ.
-
-អា.
-
-	អាំ.
-
-អិ.
-
-អី.
-
-អី្វ.
-
-អឹ.
-
-អឺ.
-
-អុ.
-
-	អុំ.
-
-អូ.
-
-អួ.
-
-អើ.
-
-អឿ.
-
-អៀ.
-
-អេ.
-
-	អេះ.
-
-អែ.
-
-អៃ.
-
-អោ.
-
-អៅ.
-
-អំ.
-
-អះ.
-
-អៈ.
-
-អ៊.
-
-	អ៊ា.
-
-	អ៊ិ.
-
-	អ៊ី.
-
-	អ៊ឹ.
-
-	អ៊ឺ.
-
-	អ៊ុ.
-
-អ៊ុំ.
-
-	អ៊ូ.
-
-	អ៊ួ.
-
-	អ៊េ.
-
-	អ៊ែ.
-
-	អ៊ំ.
-
-អ័.
-
-អ្ចី.
-
-	អ្ន.
-
-	អ្ម.
-
-អ្វី.
-
-អ្ហើ.
-
-ឤ.
-
-ឥ.
-
-ឦ.
-
-ឧ.
-
-ឧិ.
-
-ឧះ.
-
-ឧៈ.
-
-	ឧ្យ.
-
-ឩ.
-
-ឪ.
-
-	ឪ្យ.
-
-ឫ.
-
-ឫុ.
-
-ឬ.
-
-ឭ.
-
-ឮ.
-
-ឯ.
-
-ឰ.
-
-ឱ.
-
-ឱះ.
-
-	ឱ្យ.
-
-ឲ.
-
-	ឲ្យ.
-
-ឳ.
-
-	ឳ្យ.
-
-េ.
-
-។.
-
-៕.
-
-៖.
-
-ៗ.
-
-៘.
-
-៚.
-
-៛.
-
-០.
-
-១.
-
-២.
-
-៣.
-
-៤/
-
-៥/
-
-៦/
-
-៧/
-
-៨/
-
-៩/
-
-៰/
-
-ᵒ/
-
-Ḍ/
-
-ḍ/
-
-Ḥ/
-
-ḥ/
-
-Ḽ/
-
-Ṁ/
-
-ṁ/
-
-ṅ/
-
-Ṇ/
-
-ṇ/
-
-Ṛ/
-
-ṛ/
-
-Ṣ/
-
-ṣ/
-
-Ṭ/
-
-ṭ/
-
-ṱ/
-
-ẓ/
-
-ẞ/
-
-Ạ/
-
-ạ/
-
-Ả/
-
-ả/
-
-Ấ/
-
-ấ/
-
-Ầ/
-
-ầ/
-
-Ẩ/
-
-ẩ/
-
-Ẫ/
-
-ẫ/
-
-Ậ/
-
-ậ/
-
-Ắ/
-
-ắ/
-
-Ằ/
-
-ằ/
-
-Ẳ/
-
-ẳ/
-
-Ẵ/
-
-ẵ/
-
-Ặ/
-
-ặ/
-
-Ẹ/
-
-ẹ/
-
-Ẻ/
-
-ẻ/
-
-Ẽ/
-
-ẽ/
-
-Ế/
-
-ế/
-
-Ề/
-
-ề/
-
-Ể/
-
-ể/
-
-Ễ/
-
-ễ/
-
-Ệ/
-
-ệ/
-
-Ỉ/
-
-ỉ/
-
-Ị/
-
-ị/
-
-Ọ/
-
-ọ/
-
-Ỏ/
-
-ỏ/
-
-Ố/
-
-ố/
-
-Ồ/
-
-ồ/
-
-Ổ/
-
-ổ/
-
-Ỗ/
-
-ỗ/
-
-Ộ/
-
-ộ/
-
-Ớ/
-
-ớ/
-
-Ờ/
-
-ờ/
-
-Ở/
-
-ở/
-
-Ỡ/
-
-ỡ/
-
-Ợ/
-
-ợ/
-
-Ụ/
-
-ụ/
-
-Ủ/
-
-ủ/
-
-Ứ/
-
-ứ/
-
-Ừ/
-
-ừ/
-
-Ử/
-
-ử/
-
-Ữ/
-
-ữ/
-
-Ự/
-
-ự/
-
-Ỳ/
-
-ỳ/
-
-Ỵ/
-
-ỵ/
-
-Ỷ/
-
-ỷ/
-
-Ỹ/
-
-ỹ/
-
-​/
-
-‎/
-
-‐/
-
-‑/
-
-‒/
-
-–/
-
-—/
-
-―/
-
-‖/
-
-‘/
-
-’/
-
-‚0
-
-“0
-
-”0
-
-„0
-
-†0
-
-‡0
-
-•0
-
-‣0
-
-…0
-
-‰0
-
-′0
-
-″0
-
-‹0
-
-›0
-
-‿0
-
-⁄0
-
-⁰0
-
-⁴0
-
-⁵0
-
-⁹0
-
-₁0
-
-₂0
-
-₃0
-
-₄0
-
-₤0
-
-₦0
-
-₧0
-
-₩0
-
-₪0
-
-₫0
-
-€0
-
-₹0
-
-₺0
-
-℃0
-
-№0
-
-℗0
-
-™0
-
-⅓0
-
-Ⅰ0
-
-Ⅱ0
-
-Ⅲ0
-
-Ⅵ0
-
-Ⅹ0
-
-←0
-
-↑0
-
-→0
-
-↓0
-
-↔0
-
-↘0
-
-↦0
-
-↳0
-
-↺0
-
-⇌0
-
-⇐0
-
-⇒0
-
-⇓0
-
-⇔0
-
-∀0
-
-∂0
-
-∃0
-
-∅0
-
-∆0
-
-∇0
-
-∈0
-
-∉0
-
-∏0
-
-∑0
-
-−0
-
-∘0
-
-∙0
-
-√0
-
-∝0
-
-∞0
-
-∧0
-
-∨0
-
-∩0
-
-∪0
-
-∫0
-
-∴0
-
-≈0
-
-≠0
-
-≡0
-
-≤0
-
-≥0
-
-≪0
-
-≫0
-
-⊂0
-
-⊃0
-
-⊆0
-
-⊕0
-
-⊞0
-
-⊥0
-
-⋅0
-
-⋆0
-
-⌁0
-
-⏭0
-
-⑆0
-
-⑇0
-
-⑈0
-
-⑉0
-
-①0
-
-②0
-
-③0
-
-④0
-
-⑤0
-
-⑥0
-
-⑦0
-
-⑧0
-
-⑨0
-
-⑩0
-
-⑪0
-
-⑫0
-
-⑬0
-
-⑭0
-
-⑮0
-
-⑯0
-
-⑰0
-
-⑱0
-
-⑲0
-
-⑳0
-
-Ⓐ0
-
-Ⓑ0
-
-Ⓒ0
-
-Ⓡ0
-
-ⓐ0
-
-ⓑ0
-
-─0
-
-│0
-
-┈1
-
-┌1
-
-└1
-
-├1
-
-┬1
-
-┴1
-
-═1
-
-╬1
-
-╰1
-
-▀1
-
-▂1
-
-▄1
-
-█1
-
-▉1
-
-░1
-
-■1
-
-□1
-
-▪1
-
-▬1
-
-▲1
-
-▴1
-
-▶1
-
-▷1
-
-▸1
-
-►1
-
-▼1
-
-▾1
-
-◄1
-
-◆1
-
-◇1
-
-◉1
-
-◊1
-
-○1
-
-◌1
-
-◌ຸ1
-
-◌ູ1
-
-◎1
-
-●1
-
-◔1
-
-◕1
-
-◡1
-
-◦1
-
-☀1
-
-★1
-
-☆1
-
-☉1
-
-☎1
-
-☏1
-
-☐1
-
-☑1
-
-☒1
-
-☛1
-
-☜1
-
-☞1
-
-☢1
-
-☸1
-
-☹1
-
-☺1
-
-☼1
-
-♀1
-
-♂1
-
-♠1
-
-♡1
-
-♢1
-
-♣1
-
-♥1
-
-♦1
-
-♪1
-
-♫1
-
-♬1
-
-♭1
-
-♯1
-
-⚫1
-
-⛤1
-
-✅1
-
-✈1
-
-✉1
-
-✍1
-
-✎1
-
-✓1
-
-✔1
-
-✗1
-
-✡1
-
-✦1
-
-✨1
-
-✩1
-
-✪1
-
-✯1
-
-✰1
-
-✱1
-
-✶1
-
-✿1
-
-❀1
-
-❉1
-
-❍1
-
-❑1
-
-❖1
-
-❗1
-
-❘1
-
-❜1
-
-❝1
-
-❞1
-
-❤1
-
-➔1
-
-➖1
-
-➜1
-
-➝1
-
-➡1
-
-➢1
-
-➤1
-
-➳1
-
-⟨1
-
-⟩1
-
-⟫1
-
-⠀1
-
-⭑1
-
-Ɑ1
-
-、1
-
-。1
-
-〃1
-
-〈1
-
-〉1
-
-《1
-
-》1
-
-「1
-
-」1
-
-『1
-
-』1
-
-【2
-
-】2
-
-〜2
-
-・2
-
-ー2
-
-ꞌ2
-
-ﬁ2
-
-﴾2
-
-﴿2
-
-，2
-
-：2
-
-｡2
-
-｢2
-
-｣2
-
-￡2
-
-￥2
-
-￩2
-
-￫2
-
-�22
\ No newline at end of file
@@ -1,15606 +0,0 @@
-
-
- 
-
- ೀ
-
- ೆ
-
- ೊ
-
-
- ೋ
-
- ೇ
-
- ೕ
-
- ං
-
- ්
-
-
- ්බා	
-
- ා
-
-
- ැ
-
- ෑ
-
- ි
-
- ී
-
- ු
-
- ූ
-
- ෙ
-
- ෙෙ
-
- ේ
-
- ො
-
- ‌
-
- ‌‌
-
-!
-
-"
-
-#
-
-#್‌
-
-$
-
-%
-
-&
-
-'
-
-(
-
-) 
-
-*!
-
-+"
-
-,#
-
--$
-
-.%
-
-.්&
-
-.ි'
-
-.ෙ(
-
-/)
-
-0*
-
-1+
-
-2,
-
-3-
-
-4.
-
-5/
-
-60
-
-71
-
-82
-
-93
-
-:4
-
-:ී5
-
-;6
-
-<7
-
-=8
-
->9
-
-?:
-
-@;
-
-A<
-
-B=
-
-C>
-
-D?
-
-E@
-
-E̟A
-
-FB
-
-GC
-
-HD
-
-IE
-
-JF
-
-KG
-
-LH
-
-MI
-
-NJ
-
-OK
-
-O̟L
-
-PM
-
-QN
-
-RO
-
-SP
-
-TQ
-
-UR
-
-VS
-
-WT
-
-XU
-
-YV
-
-ZW
-
-[X
-
-\Y
-
-\\Z
-
-][
-
-^\
-
-_]
-
-`^
-
-a_
-
-à`
-
-áa
-
-ãb
-
-ảc
-
-ạd
-
-a̸e
-
-bf
-
-cg
-
-c̈h
-
-di
-
-ḍj
-
-ek
-
-èl
-
-ém
-
-ẽn
-
-e̟o
-
-ẹp
-
-e̱q
-
-fr
-
-gs
-
-ht
-
-ḥu
-
-iv
-
-ìw
-
-íx
-
-ĩy
-
-i̇z
-
-i̟{
-
-ị|
-
-j}
-
-k~
-
-l
-
-m
-
-m̃
-
-n
-
-ǹ
-
-o
-
-ò
-
-ó
-
-ỏ
-
-o̟
-
-ọ
-
-p
-
-p̃
-
-q
-
-r
-
-ṛ
-
-s
-
-s̟
-
-ṣ
-
-t
-
-t̃
-
-ṭ
-
-u
-
-ù
-
-ú
-
-ũ
-
-ủ
-
-u̟
-
-ụ
-
-u̸
-
-v
-
-v̄
-
-v̈
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-
- 
-	
- ̃
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-­
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-	
-ầ
-	
-ấ
-	
-ậ
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-	
-ề
-	
-ế
-	
-ễ
-	
-ể
-	
-ệ
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-	
-ồ
-	
-ố
-	
-ỗ
-	
-ổ
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-	
-ắ
-	
-ặ
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ŗ
-
-ŗ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɣ
-
-Ɩ
-
-Ơ
-
-ơ
-	
-ờ
-	
-ớ
-	
-ợ
-
-ƭ
-
-Ư
-
-ư
-	
-ừ
-	
-ứ
-	
-ữ
-	
-ử
-	
-ự
-
-ƴ
-
-ǎ
-
-ǐ
-
-ǝ
-
-Ǧ
-
-ǧ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-ȳ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̀
-	
-ɔ́
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-	
-ə́
-
-ɛ
-	
-ɛ̀
-	
-ɛ̃
-	
-ɛ̈
-
-ɣ
-
-ɧ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʒ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˙
-
-˚
-
-˛
-
-˜
-
-˝
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-،
-
-؛
-
-؟
-
-ا
-
-د
-
-ر
-
-ل
-
-م
-
-ن
-
-و
-
-क
-
-त
-
-य
-
-र
-
-ा
-
-ि
-
-ी
-
-।
-
-॥
-
-०
-
-॰
-
-০
-
-க
-
-ப
-
-ா
-
-ఁ
-
-ం
-
-ః
-
-అ
-
-ఆ
-
-ఇ
-
-ఈ
-
-ఉ
-
-ఊ
-
-ఋ
-
-ఌ
-
-ఎ
-
-ఏ
-
-ఐ
-
-ఒ
-
-ఓ
-
-ఔ
-
-క
-
-కా
-
-కి
-
-కీ
-
-కె
-
-కే
-
-కై
-
-కొ
-
-కో
-
-కౌ
-
-క్
-
-	క్అ
-
-	క్ఆ
-
-	క్ఇ
-
-	క్ఎ
-
-క్క్
-
-క్క్లో
-
-	క్గ
-
-క్గా
-
-క్గి
-
-క్గ్రా
-
-	క్జ
-
-క్జా
-
-క్జి
-
-క్జె
-
-క్జే
-
-	క్ట
-
-క్టా
-
-క్టి
-
-క్టీ
-
-క్టె
-
-క్టే
-
-క్టై
-
-క్టో
-
-క్ట్
-
-క్ట్ర
-
-క్ట్రా
-
-క్ట్రి
-
-క్ట్రె
-
-క్ట్రో
-
-క్ట్ల
-
-క్ట్లో
-
-క్ట్స్
-
-	క్డ
-
-క్డొ
-
-క్డో
-
-క్డౌ
-
-క్డ్
-
-	క్త
-
-క్తా
-
-క్తి
-
-క్తీ
-
-క్తే
-
-క్తో
-
-క్త్
-
-క్త్ర
-
-క్త్రో
-
-	క్ద
-
-	క్ర
-
-క్రా
-
-క్రి
-
-క్రీ
-
-క్రె
-
-క్రే
-
-క్రై
-
-క్రొ
-
-క్రో
-
-క్రౌ
-
-క్ర్
-
-	క్ల
-
-క్లా
-
-క్లి
-
-క్లీ
-
-క్లె
-
-క్లే
-
-క్లై
-
-క్లో
-
-క్లౌ
-
-క్ల్లో
-
-క్ల్స్
-
-	క్ష
-
-క్షా
-
-క్షి
-
-క్షీ
-
-క్షె
-
-క్షే
-
-క్షై
-
-క్షో
-
-క్షౌ
-
-క్ష్
-
-క్ష్ప్రె
-
-క్స్
-
-క్స్గా
-
-క్స్ట
-
-క్స్టి
-
-క్స్టె
-
-క్స్టై
-
-క్స్ట్
-
-క్స్ట్రా
-
-క్స్ట్రీ
-
-క్స్డ్
-
-క్స్తో
-
-క్స్త్
-
-క్స్ప్రె
-
-క్స్ప్లో
-
-క్స్రే
-
-క్స్ల
-
-క్స్లో
-
-క్హా
-
-క్హీ
-
-క్హో
-
-ఖ
-
-ఖా
-
-ఖి
-
-ఖీ
-
-ఖె
-
-ఖే
-
-ఖై
-
-ఖొ
-
-ఖో
-
-ఖ్
-
-	ఖ్త
-
-ఖ్రా
-
-గ
-
-గా
-
-గి
-
-గీ
-
-గె
-
-గే
-
-గై
-
-గొ
-
-గో
-
-గౌ
-
-గ్
-
-	గ్ఇ
-
-	గ్ఎ
-
-	గ్గ
-
-గ్గా
-
-గ్గి
-
-గ్గీ
-
-గ్గె
-
-గ్గే
-
-గ్గొ
-
-గ్గో
-
-	గ్జ
-
-గ్జా
-
-గ్జి
-
-గ్జీ
-
-గ్జె
-
-గ్జే
-
-గ్జో
-
-గ్ఝౌ
-
-	గ్ట
-
-	గ్డ
-
-గ్డా
-
-గ్డి
-
-గ్డో
-
-గ్డ్
-
-గ్తో
-
-గ్త్
-
-	గ్ద
-
-గ్దా
-
-గ్ది
-
-గ్దే
-
-	గ్ధ
-
-గ్ధా
-
-గ్న్
-
-గ్భ్రా
-
-	గ్ర
-
-గ్రా
-
-గ్రి
-
-గ్రీ
-
-గ్రె
-
-గ్రే
-
-గ్రై
-
-గ్రో
-
-గ్రౌ
-
-	గ్ల
-
-గ్లా
-
-గ్లి
-
-గ్లీ
-
-గ్లె
-
-గ్లే
-
-గ్లై
-
-గ్లో
-
-గ్ల్లో
-
-గ్షా
-
-గ్స్
-
-గ్స్ట
-
-గ్స్టీ
-
-గ్స్టో
-
-గ్స్ల
-
-గ్స్లో
-
-	గ్హ
-
-గ్హా
-
-గ్హౌ
-
-ఘ
-
-ఘా
-
-ఘి
-
-ఘీ
-
-ఘె
-
-ఘే
-
-ఘై
-
-ఘో
-
-ఘ్
-
-	ఘ్ర
-
-ఘ్రా
-
-ఙ
-
-ఙా
-
-	ఙ్గ
-
-	ఙ్ఞ
-
-ఙ్ఞా
-
-చ
-
-చా
-
-చి
-
-చీ
-
-చె
-
-చే
-
-చై
-
-చొ
-
-చో
-
-చౌ
-
-చ్
-
-	చ్ఎ
-
-	చ్ఐ
-
-చ్గా
-
-చ్టె
-
-చ్ట్
-
-చ్డ్
-
-	చ్త
-
-చ్తె
-
-చ్తొ
-
-చ్తో
-
-	చ్ల
-
-చ్లా
-
-చ్లో
-
-చ్ల్లో
-
-చ్స్
-
-చ్స్క్రీ
-
-చ్స్తా
-
-ఛ
-
-ఛా
-
-ఛి
-
-ఛీ
-
-ఛె
-
-ఛే
-
-ఛై
-
-ఛో
-
-ఛ్
-
-	ఛ్ర
-
-జ
-
-జా
-
-జి
-
-జీ
-
-జె
-
-జే
-
-జై
-
-జొ
-
-జో
-
-జౌ
-
-జ్
-
-	జ్గ
-
-జ్గా
-
-	జ్ఙ
-
-జ్ఙా
-
-	జ్జ
-
-జ్జా
-
-జ్జి
-
-జ్జీ
-
-జ్జె
-
-జ్జే
-
-జ్జో
-
-	జ్ఝ
-
-	జ్ఞ
-
-జ్ఞా
-
-జ్ఞి
-
-జ్ఞే
-
-జ్ఞో
-
-జ్ఞ్గ
-
-జ్డా
-
-జ్డె
-
-జ్డ్
-
-	జ్ణ
-
-జ్తో
-
-జ్దా
-
-జ్ద్
-
-	జ్ర
-
-జ్రా
-
-జ్రి
-
-జ్రే
-
-	జ్ల
-
-జ్లా
-
-జ్లి
-
-జ్లో
-
-జ్స్
-
-ఝ
-
-ఝా
-
-ఝి
-
-ఝె
-
-ఝౌ
-
-ఞ
-
-ట
-
-టా
-
-టి
-
-టీ
-
-టె
-
-టే
-
-టై
-
-టొ
-
-టో
-
-టౌ
-
-ట్
-
-	ట్అ
-
-	ట్ఎ
-
-ట్క్ల
-
-ట్క్లి
-
-	ట్గ
-
-ట్గా
-
-ట్గో
-
-ట్చ్
-
-	ట్జ
-
-ట్జా
-
-ట్జి
-
-ట్జె
-
-ట్జ్
-
-ట్జ్గె
-
-	ట్ట
-
-ట్టా
-
-ట్టి
-
-ట్టీ
-
-ట్టె
-
-ట్టే
-
-ట్టై
-
-ట్టొ
-
-ట్టో
-
-ట్ట్
-
-ట్ట్ల
-
-ట్ట్స్
-
-ట్డో
-
-	ట్ణ
-
-	ట్త
-
-ట్తి
-
-ట్తో
-
-	ట్ర
-
-ట్రా
-
-ట్రి
-
-ట్రీ
-
-ట్రె
-
-ట్రే
-
-ట్రై
-
-ట్రొ
-
-ట్రో
-
-ట్రౌ
-
-	ట్ల
-
-ట్లా
-
-ట్లి
-
-ట్లీ
-
-ట్లె
-
-ట్లే
-
-ట్లై
-
-ట్లొ
-
-ట్లో
-
-ట్ల్లో
-
-ట్స్
-
-ట్స్డా
-
-ట్స్తో
-
-ట్స్ల
-
-ట్స్లో
-
-ట్హా
-
-ట్హె
-
-ట్హో
-
-ట్హౌ
-
-ఠ
-
-ఠా
-
-ఠి
-
-ఠీ
-
-ఠే
-
-ఠో
-
-ఠ్
-
-డ
-
-డా
-
-డి
-
-డీ
-
-డె
-
-డే
-
-డై
-
-డొ
-
-డో
-
-డౌ
-
-డ్
-
-	డ్అ
-
-	డ్ఆ
-
-డ్క్లి
-
-	డ్గ
-
-డ్గా
-
-డ్గె
-
-డ్గే
-
-	డ్జ
-
-డ్జా
-
-డ్జి
-
-డ్జీ
-
-డ్జె
-
-డ్జే
-
-డ్జో
-
-డ్జ్
-
-డ్జ్ల
-
-డ్జ్లో
-
-డ్టా
-
-డ్ట్
-
-డ్ట్రా
-
-డ్ట్రీ
-
-	డ్డ
-
-డ్డా
-
-డ్డి
-
-డ్డీ
-
-డ్డె
-
-డ్డే
-
-	డ్త
-
-డ్తా
-
-డ్తో
-
-డ్త్
-
-	డ్ద
-
-డ్ది
-
-	డ్ర
-
-డ్రా
-
-డ్రి
-
-డ్రీ
-
-డ్రె
-
-డ్రే
-
-డ్రై
-
-డ్రొ
-
-డ్రో
-
-	డ్ల
-
-డ్లా
-
-డ్లి
-
-డ్లీ
-
-డ్లె
-
-డ్లే
-
-డ్లై
-
-డ్లో
-
-డ్ల్లో
-
-డ్శ్లా
-
-డ్షా
-
-డ్స్
-
-డ్స్టా
-
-డ్స్తో
-
-డ్స్లా
-
-డ్స్లో
-
-	డ్హ
-
-డ్హా
-
-డ్హౌ
-
-ఢ
-
-ఢా
-
-ఢి
-
-ఢీ
-
-ఢ్
-
-ణ
-
-ణా
-
-ణి
-
-ణీ
-
-ణె
-
-ణే
-
-ణై
-
-ణో
-
-ణ్
-
-	ణ్డ
-
-	ణ్ణ
-
-ణ్ణా
-
-ణ్ణి
-
-ణ్ధీ
-
-త
-
-తా
-
-తి
-
-తీ
-
-తె
-
-తే
-
-తై
-
-తొ
-
-తో
-
-తౌ
-
-త్
-
-	త్అ
-
-	త్గ
-
-త్గా
-
-త్గో
-
-త్జ్
-
-త్ట్
-
-	త్త
-
-త్తా
-
-త్తి
-
-త్తీ
-
-త్తె
-
-త్తే
-
-త్తై
-
-త్తో
-
-త్త్
-
-త్త్రి
-
-	త్థ
-
-త్థా
-
-త్ప్ర
-
-త్ప్రే
-
-త్య్ర
-
-త్య్రా
-
-త్య్రో
-
-	త్ర
-
-త్రా
-
-త్రి
-
-త్రీ
-
-త్రె
-
-త్రే
-
-త్రై
-
-త్రొ
-
-త్రో
-
-	త్ల
-
-త్లా
-
-త్లీ
-
-త్లో
-
-త్స్
-
-థ
-
-థా
-
-థి
-
-థీ
-
-థె
-
-థే
-
-థై
-
-థొ
-
-థో
-
-థౌ
-
-థ్
-
-థ్థా
-
-	థ్ర
-
-థ్రా
-
-థ్రి
-
-థ్రె
-
-థ్రో
-
-థ్లా
-
-థ్లె
-
-థ్స్
-
-ద
-
-దా
-
-ది
-
-దీ
-
-దె
-
-దే
-
-దై
-
-దొ
-
-దో
-
-దౌ
-
-ద్
-
-	ద్గ
-
-ద్గా
-
-ద్గి
-
-ద్గీ
-
-ద్గ్ర
-
-ద్ఘా
-
-	ద్డ
-
-	ద్థ
-
-	ద్ద
-
-ద్దా
-
-ద్ది
-
-ద్దీ
-
-ద్దె
-
-ద్దే
-
-ద్దై
-
-ద్దో
-
-	ద్ధ
-
-ద్ధా
-
-ద్ధి
-
-ద్ధీ
-
-ద్ధె
-
-ద్ధే
-
-ద్ధో
-
-ద్య్ర	
-
-	ద్ర	
-
-ద్రా	
-
-ద్రి	
-
-ద్రీ	
-
-ద్రె	
-
-ద్రే	
-
-ద్రొ	
-
-ద్రో	
-
-ద్రౌ	
-
-ద్ర్	
-
-	ద్ల	
-
-ద్లో	
-
-ధ	
-
-ధా	
-
-ధి	
-
-ధీ	
-
-ధె	
-
-ధే	
-
-ధై	
-
-ధొ	
-
-ధో	
-
-ధౌ	
-
-ధ్	
-
-	ధ్ద	
-
-ధ్దా	
-
-ధ్ది	
-
-	ధ్ధ	
-
-ధ్ధా	
-
-ధ్ధి	
-
-	ధ్ర	
-
-ధ్రా	
-
-ధ్రి	
-
-ధ్రీ	
-
-ధ్రో	
-
-న	
-
-నా	
-
-ని	
-
-నీ	
-
-నె	
-
-నే	
-
-నై	
-
-నొ	
-
-నో	
-
-నౌ	
-
-న్	
-
-	న్అ	
-
-	న్ఆ	
-
-	న్ఇ	
-
-	న్ఎ	
-
-	న్ఏ	
-
-	న్ఐ	
-
-న్క్	
-
-న్క్రి	
-
-న్క్రె	
-
-న్క్రో	
-
-న్క్లి	
-
-న్క్స్	
-
-	న్గ	
-
-న్గా	
-
-న్గి	
-
-న్గె	
-
-న్గే	
-
-న్గై	
-
-న్గో	
-
-న్గ్	
-
-న్గ్లా	
-
-న్గ్లో	
-
-	న్ఘ	
-
-న్చ్	
-
-	న్జ	
-
-న్జా	
-
-న్జి	
-
-న్జీ	
-
-న్జె	
-
-న్జే	
-
-న్జో	
-
-న్జ్	
-
-	న్ట	
-
-న్టా	
-
-న్టి	
-
-న్టీ	
-
-న్టె	
-
-న్టే	
-
-న్టై	
-
-న్టో	
-
-న్టౌ	
-
-న్ట్	
-
-న్ట్రి	
-
-న్ట్రీ	
-
-న్ట్రె	
-
-న్ట్స్	
-
-	న్డ	
-
-న్డా	
-
-న్డి	
-
-న్డీ	
-
-న్డె	
-
-న్డే	
-
-న్డో	
-
-న్డ్	
-
-న్డ్రి	
-
-	న్త	
-
-న్తా	
-
-న్తి	
-
-న్తీ	
-
-న్తె	
-
-న్తో	
-
-న్త్	
-
-	న్థ	
-
-న్థె	
-
-	న్ద	
-
-న్దా	
-
-న్ది	
-
-న్దె	
-
-న్దే	
-
-న్దో	
-
-న్ద్ర	
-
-	న్ధ	
-
-న్ధి	
-
-న్న్	
-
-న్ప్ల	
-
-న్ప్లే	
-
-న్ఫ్రా	
-
-న్ఫ్రె	
-
-న్ఫ్రే	
-
-న్ఫ్ల	
-
-న్బ్రే	
-
-	న్ర	
-
-న్రా
-
-
-న్రి
-
-
-న్రీ
-
-
-న్రె
-
-
-న్రే
-
-
-న్రై
-
-
-న్రో
-
-
-	న్ల
-
-
-న్లా
-
-
-న్లి
-
-
-న్లీ
-
-
-న్లె
-
-
-న్లే
-
-
-న్లై
-
-
-న్లో
-
-
-న్ల్లో
-
-
-	న్ష
-
-
-న్షా
-
-
-న్షి
-
-
-న్షీ
-
-
-న్షె
-
-
-న్షై
-
-
-న్స్
-
-
-న్స్క్రి
-
-
-న్స్గా
-
-
-న్స్ట
-
-
-న్స్టా
-
-
-న్స్టి
-
-
-న్స్టీ
-
-
-న్స్టె
-
-
-న్స్టే
-
-
-న్స్టై
-
-
-న్స్టో
-
-
-న్స్ట్
-
-
-న్స్ట్ర
-
-
-న్స్డ
-
-
-న్స్డ్
-
-
-న్స్త
-
-
-న్స్తో
-
-
-న్స్ల
-
-
-న్స్లా
-
-
-న్స్లే
-
-
-న్స్లో
-
-
-	న్హ
-
-
-న్హా
-
-
-న్హి
-
-
-న్హీ
-
-
-న్హె
-
-
-న్హే
-
-
-న్హో
-
-
-న్హౌ
-
-
-న్హ్
-
-
-ప
-
-
-పా
-
-
-పి
-
-
-పీ
-
-
-పె
-
-
-పే
-
-
-పై
-
-
-పొ
-
-
-పో
-
-
-పౌ
-
-
-ప్
-
-
-ప్గా
-
-
-ప్గ్రే
-
-
-ప్జి
-
-
-	ప్ట
-
-
-ప్టా
-
-
-ప్టి
-
-
-ప్టీ
-
-
-ప్టె
-
-
-ప్టే
-
-
-ప్టై
-
-
-ప్టో
-
-
-ప్ట్
-
-
-ప్ట్లో
-
-
-ప్డే
-
-
-ప్డ్
-
-
-	ప్త
-
-
-ప్తా
-
-
-ప్తి
-
-
-ప్తీ
-
-
-ప్తె
-
-
-ప్తే
-
-
-ప్తో
-
-
-ప్త్
-
-
-ప్ప్
-
-
-ప్ఫ్
-
-
-	ప్ర
-
-
-ప్రా
-
-
-ప్రి
-
-
-ప్రీ
-
-
-ప్రె
-
-
-ప్రే
-
-
-ప్రై
-
-
-ప్రొ
-
-
-ప్రో
-
-
-ప్రౌ
-
-
-ప్ర్ర
-
-
-ప్ర్రా
-
-
-	ప్ల
-
-
-ప్లా
-
-
-ప్లి
-
-
-ప్లీ
-
-
-ప్లె
-
-
-ప్లే
-
-
-ప్లై
-
-
-ప్లొ
-
-
-ప్లో
-
-
-ప్ల్లో
-
-
-	ప్ష
-
-
-ప్షి
-
-
-ప్షై
-
-
-ప్స్
-
-
-ప్స్టీ
-
-
-ప్స్లో
-
-
-ఫ
-
-
-ఫా
-
-
-ఫి
-
-
-ఫీ
-
-
-ఫె
-
-
-ఫే
-
-
-ఫై
-
-
-ఫొ
-
-
-ఫో
-
-
-ఫౌ
-
-
-ఫ్
-
-
-	ఫ్ఎ
-
-
-	ఫ్గ
-
-ఫ్గా
-
-	ఫ్ఘ
-
-ఫ్ఘా
-
-	ఫ్ట
-
-ఫ్టా
-
-ఫ్టి
-
-ఫ్టీ
-
-ఫ్టె
-
-ఫ్టే
-
-ఫ్టై
-
-ఫ్ట్
-
-ఫ్ట్ల
-
-ఫ్ట్లో
-
-ఫ్ట్స్
-
-ఫ్డి
-
-	ఫ్త
-
-ఫ్తా
-
-ఫ్తో
-
-ఫ్త్
-
-ఫ్ఫ్
-
-	ఫ్ర
-
-ఫ్రా
-
-ఫ్రి
-
-ఫ్రీ
-
-ఫ్రె
-
-ఫ్రే
-
-ఫ్రై
-
-ఫ్రొ
-
-ఫ్రో
-
-	ఫ్ల
-
-ఫ్లా
-
-ఫ్లి
-
-ఫ్లీ
-
-ఫ్లె
-
-ఫ్లే
-
-ఫ్లై
-
-ఫ్లో
-
-ఫ్షో
-
-ఫ్స్
-
-బ
-
-బా
-
-బి
-
-బీ
-
-బె
-
-బే
-
-బై
-
-బొ
-
-బో
-
-బౌ
-
-బ్
-
-	బ్ఖ
-
-బ్గా
-
-	బ్జ
-
-బ్జా
-
-బ్జె
-
-బ్డి
-
-బ్తో
-
-	బ్ద
-
-బ్దా
-
-బ్ది
-
-బ్దే
-
-బ్ద్
-
-	బ్ధ
-
-బ్ధా
-
-బ్ధి
-
-బ్న్
-
-బ్ప్రై
-
-	బ్ర
-
-బ్రా
-
-బ్రి
-
-బ్రీ
-
-బ్రె
-
-బ్రే
-
-బ్రై
-
-బ్రొ
-
-బ్రో
-
-బ్రౌ
-
-	బ్ల
-
-బ్లా
-
-బ్లి
-
-బ్లీ
-
-బ్లె
-
-బ్లే
-
-బ్లై
-
-బ్లో
-
-బ్లౌ
-
-బ్ల్
-
-బ్ల్లో
-
-బ్షా
-
-బ్స్
-
-బ్స్క్రి
-
-బ్స్ట
-
-బ్స్టి
-
-బ్స్టె
-
-బ్స్టే
-
-భ
-
-భా
-
-భి
-
-భీ
-
-భే
-
-భై
-
-భొ
-
-భో
-
-భౌ
-
-భ్
-
-	భ్ద
-
-భ్దా
-
-	భ్ర
-
-భ్రా
-
-మ
-
-మా
-
-మి
-
-మీ
-
-మె
-
-మే
-
-మై
-
-మొ
-
-మో
-
-మౌ
-
-మ్
-
-	మ్ఎ
-
-	మ్ఐ
-
-	మ్గ
-
-మ్గా
-
-మ్జీ
-
-	మ్ట
-
-మ్టే
-
-మ్ట్రా
-
-మ్డా
-
-మ్డి
-
-మ్డ్
-
-	మ్త
-
-మ్తో
-
-	మ్ద
-
-మ్ద్
-
-మ్ప్రే
-
-మ్ప్లే
-
-మ్బ్రో
-
-మ్మ్య్
-
-మ్మ్లే
-
-	మ్ర
-
-మ్రా
-
-మ్రి
-
-మ్రీ
-
-మ్రే
-
-మ్రొ
-
-మ్రో
-
-	మ్ల
-
-మ్లా
-
-మ్లి
-
-మ్లీ
-
-మ్లె
-
-మ్లే
-
-మ్లై
-
-మ్లో
-
-మ్ల్లో
-
-మ్షై
-
-మ్స్
-
-మ్స్ట
-
-మ్స్టి
-
-మ్స్లో
-
-	మ్హ
-
-మ్హా
-
-య
-
-యా
-
-యి
-
-యీ
-
-యె
-
-యే
-
-యై
-
-యొ
-
-యో
-
-యౌ
-
-య్
-
-య్గా
-
-య్డ్
-
-య్న్
-
-య్రా
-
-	య్ల
-
-య్లా
-
-య్లె
-
-య్లే
-
-య్లో
-
-య్ల్
-
-య్స్
-
-ర
-
-రా
-
-రి
-
-రీ
-
-రె
-
-రే
-
-రై
-
-రొ
-
-రో
-
-రౌ
-
-ర్
-
-	ర్అ
-
-	ర్ఆ
-
-	ర్ఎ
-
-ర్క్
-
-ర్క్గా
-
-ర్క్టి
-
-ర్క్తో
-
-ర్క్ర
-
-ర్క్రా
-
-ర్క్రి
-
-ర్క్ల
-
-ర్క్లీ
-
-ర్క్లే
-
-ర్క్లో
-
-ర్క్ల్లో
-
-ర్క్ష
-
-ర్క్షా
-
-ర్క్షై
-
-ర్క్స్
-
-	ర్ఖ
-
-ర్ఖా
-
-ర్ఖీ
-
-	ర్గ
-
-ర్గా
-
-ర్గి
-
-ర్గీ
-
-ర్గె
-
-ర్గే
-
-ర్గో
-
-ర్గ్
-
-ర్గ్ర
-
-ర్గ్రా
-
-ర్గ్రౌ
-
-ర్గ్ల
-
-ర్గ్లై
-
-ర్గ్లో
-
-	ర్ఘ
-
-ర్ఘా
-
-ర్చ్
-
-ర్చ్తో
-
-ర్చ్ల
-
-ర్చ్లో
-
-	ర్జ
-
-ర్జా
-
-ర్జి
-
-ర్జీ
-
-ర్జె
-
-ర్జే
-
-ర్జో
-
-ర్జ్
-
-ర్జ్డ్
-
-ర్జ్ల
-
-	ర్ట
-
-ర్టా
-
-ర్టి
-
-ర్టీ
-
-ర్టె
-
-ర్టే
-
-ర్టై
-
-ర్టో
-
-ర్టౌ
-
-ర్ట్
-
-ర్ట్గా
-
-ర్ట్జ్
-
-ర్ట్తో
-
-ర్ట్రా
-
-ర్ట్రె
-
-ర్ట్రే
-
-ర్ట్ల
-
-ర్ట్లా
-
-ర్ట్లే
-
-ర్ట్లో
-
-ర్ట్ల్లో
-
-ర్ట్స్
-
-ర్ట్స్లో
-
-	ర్డ
-
-ర్డా
-
-ర్డి
-
-ర్డీ
-
-ర్డె
-
-ర్డే
-
-ర్డై
-
-ర్డో
-
-ర్డ్
-
-ర్డ్గా
-
-ర్డ్తో
-
-ర్డ్రో
-
-ర్డ్ల
-
-ర్డ్లో
-
-ర్డ్ల్లో
-
-ర్డ్షై
-
-ర్డ్స్
-
-ర్డ్స్తో
-
-ర్డ్స్లో
-
-	ర్ణ
-
-ర్ణా
-
-ర్ణి
-
-ర్ణీ
-
-ర్ణే
-
-ర్ణో
-
-	ర్త
-
-ర్తా
-
-ర్తి
-
-ర్తీ
-
-ర్తె
-
-ర్తే
-
-ర్తై
-
-ర్తొ
-
-ర్తో
-
-ర్త్
-
-ర్త్ల
-
-ర్త్లో
-
-ర్త్స్
-
-	ర్థ
-
-ర్థా
-
-ర్థి
-
-ర్థీ
-
-ర్థే
-
-ర్థో
-
-ర్థ్
-
-ర్థ్రో
-
-	ర్ద
-
-ర్దా
-
-ర్ది
-
-ర్దీ
-
-ర్దే
-
-ర్దొ
-
-ర్దో
-
-ర్ద్
-
-ర్ద్ర
-
-ర్ద్రీ
-
-	ర్ధ
-
-ర్ధా
-
-ర్ధి
-
-ర్ధే
-
-ర్ధో
-
-ర్ధ్ర
-
-ర్న్
-
-ర్న్ల
-
-ర్న్లో
-
-ర్న్షి
-
-ర్న్స్
-
-ర్ప్
-
-ర్ప్రి
-
-ర్ప్రై
-
-ర్ప్లే
-
-ర్ప్ష
-
-ర్ప్స్
-
-ర్ఫ్
-
-ర్ఫ్ర
-
-ర్ఫ్లో
-
-ర్బ్
-
-ర్బ్రో
-
-ర్బ్స్
-
-ర్మ్
-
-ర్మ్డ్
-
-ర్మ్స్
-#
-ర్మ్స్ట్రా
-
-	ర్ర
-
-ర్రా
-
-ర్రి
-
-ర్రీ
-
-ర్రె
-
-ర్రే
-
-ర్రో
-
-ర్ర్
-
-	ర్ల
-
-ర్లా
-
-ర్లి
-
-ర్లీ
-
-ర్లె
-
-ర్లే
-
-ర్లై
-
-ర్లొ
-
-ర్లో
-
-ర్ల్
-
-ర్ల్ట
-
-ర్ల్డ్
-
-ర్ల్లో
-
-ర్ల్స్
-
-ర్వ్
-
-ర్వ్లె
-
-ర్శ్
-
-	ర్ష
-
-ర్షా
-
-ర్షి
-
-ర్షీ
-
-ర్షె
-
-ర్షే
-
-ర్ష్
-
-ర్స్
-
-ర్స్గా
-
-ర్స్ట
-
-ర్స్టా
-
-ర్స్టే
-
-ర్స్ట్
-
-ర్స్డ్
-
-ర్స్తే
-
-ర్స్తో
-
-ర్స్ల
-
-ర్స్లా
-
-ర్స్లీ
-
-ర్స్లో
-
-	ర్హ
-
-ర్హా
-
-ర్హి
-
-ర్హీ
-
-ర్హె
-
-ర్హే
-
-ర్హొ
-
-ర్హో
-
-ర్హౌ
-
-ఱ
-
-ఱి
-
-ఱో
-
-	ఱ్ర
-
-	ఱ్ఱ
-
-ఱ్ఱా
-
-ల
-
-లా
-
-లి
-
-లి్ఆ
-
-లీ
-
-లె
-
-లే
-
-లై
-
-లొ
-
-లో
-
-లౌ
-
-ల్
-
-	ల్అ
-
-	ల్ఆ
-
-	ల్ఎ
-
-ల్క్
-
-ల్క్రి
-
-ల్ఖై
-
-	ల్గ
-
-ల్గా
-
-ల్గి
-
-ల్గె
-
-ల్గే
-
-ల్గొ
-
-ల్గో
-
-ల్చ్
-
-	ల్జ
-
-ల్జా
-
-ల్జి
-
-ల్జీ
-
-ల్జె
-
-ల్జ్
-
-	ల్ట
-
-ల్టా
-
-ల్టి
-
-ల్టీ
-
-ల్టె
-
-ల్టే
-
-ల్టై
-
-ల్టో
-
-ల్ట్
-
-ల్ట్జ్
-
-ల్ట్రా
-
-ల్ట్రీ
-
-ల్ట్ల
-
-ల్ట్స్
-
-	ల్డ
-
-ల్డా
-
-ల్డి
-
-ల్డీ
-
-ల్డె
-
-ల్డే
-
-ల్డై
-
-ల్డో
-
-ల్డ్
-
-ల్డ్తో
-
-ల్డ్ర
-
-ల్డ్రి
-
-ల్డ్రె
-
-ల్డ్రే
-
-ల్డ్ల
-
-ల్డ్లో
-
-ల్డ్స్
-
-	ల్త
-
-ల్తా
-
-ల్తి
-
-ల్తీ
-
-ల్తె
-
-ల్తే
-
-ల్తో
-
-ల్త్
-
-ల్త్రి
-
-	ల్ద
-
-ల్దా
-
-ల్ది
-
-ల్దీ
-
-ల్దే
-
-ల్ద్
-
-ల్న్
-
-ల్ప్
-
-ల్ప్స్
-
-ల్ఫ్
-
-ల్ఫ్గా
-
-ల్ఫ్రె
-
-ల్ఫ్లో
-
-ల్బ్
-
-ల్బ్రె
-
-ల్బ్లో
-
-ల్మ్
-
-ల్మ్ల
-
-ల్మ్స్
-
-	ల్ర
-
-ల్రా
-
-ల్రి
-
-ల్రె
-
-ల్రై
-
-ల్రో
-
-ల్రౌ
-
-	ల్ల
-
-ల్లా
-
-ల్లి
-
-ల్లీ
-
-ల్లె
-
-ల్లే
-
-ల్లై
-
-ల్లొ
-
-ల్లో
-
-ల్ల్
-
-ల్ల్లో
-
-ల్ల్స్
-
-ల్వ్
-
-	ల్ష
-
-ల్షా
-
-ల్షి
-
-ల్ష్
-
-ల్స్
-
-ల్స్గా
-
-ల్స్ట
-
-ల్స్టా
-
-ల్స్టో
-
-ల్స్తో
-
-ల్స్బ్రో
-
-ల్స్ల
-
-ల్స్లో
-
-	ల్హ
-
-ల్హా
-
-ల్హె
-
-ల్హే
-
-ల్హో
-
-ల్హౌ
-
-ళ
-
-ళా
-
-ళి
-
-ళీ
-
-ళె
-
-ళే
-
-ళై
-
-ళొ
-
-ళో
-
-ళ్
-
-	ళ్త
-
-ళ్తా
-
-ళ్తే
-
-	ళ్ల
-
-ళ్లా
-
-ళ్లి
-
-ళ్లీ
-
-ళ్లె
-
-ళ్లే
-
-ళ్లై
-
-ళ్లొ
-
-ళ్లో
-
-ళ్స్
-
-వ
-
-వా
-
-వి
-
-వీ
-
-వె
-
-వే
-
-వై
-
-వొ
-
-వో
-
-వౌ
-
-వ్
-
-వ్గా
-
-వ్డ్
-
-వ్తో
-
-వ్దా
-
-	వ్ర
-
-వ్రా
-
-వ్రి
-
-వ్రీ
-
-వ్రే
-
-వ్రో
-
-	వ్ల
-
-వ్లా
-
-వ్లి
-
-వ్లీ
-
-వ్లో
-
-వ్స్
-
-శ
-
-శా
-
-శి
-
-శీ
-
-శె
-
-శే
-
-శై
-
-శొ
-
-శో
-
-శౌ
-
-శ్
-
-శ్తో
-
-	శ్ర
-
-శ్రా
-
-శ్రి
-
-శ్రీ
-
-శ్రే
-
-శ్రో
-
-	శ్ల
-
-శ్లా
-
-శ్లీ
-
-శ్లే
-
-శ్లో
-
-ష
-
-షా
-
-షి
-
-షీ
-
-షె
-
-షే
-
-షై
-
-షొ
-
-షో
-
-షౌ
-
-ష్
-
-ష్క్
-
-ష్క్ర
-
-ష్క్రి
-
-ష్గా
-
-	ష్ట
-
-ష్టా
-
-ష్టి
-
-ష్టీ
-
-ష్టే
-
-ష్టో
-
-ష్ట్
-
-ష్ట్ర
-
-ష్ట్రా
-
-ష్ట్రి
-
-ష్ట్రీ
-
-ష్ట్లా
-
-	ష్ఠ
-
-ష్ఠా
-
-ష్ఠి
-
-ష్ఠీ
-
-ష్డ్
-
-	ష్ణ
-
-ష్ణా
-
-ష్ణొ
-
-ష్ణో
-
-	ష్త
-
-ష్తా
-
-ష్తి
-
-ష్తీ
-
-ష్తో
-
-ష్త్ర
-
-ష్త్రా
-
-ష్ప్ర
-
-	ష్ర
-
-ష్రి
-
-ష్రె
-
-ష్ర్ట
-
-	ష్ల
-
-ష్లీ
-
-ష్లే
-
-ష్లో
-
-	ష్ష
-
-స
-
-సా
-
-సి
-
-సీ
-
-సె
-
-సే
-
-సై
-
-సొ
-
-సో
-
-సౌ
-
-స్
-
-స్Q
-
-స్q
-
-	స్అ
-
-	స్ఆ
-
-	స్ఇ
-
-	స్ఈ
-
-	స్ఎ
-
-	స్ఏ
-
-	స్ఐ
-
-	స్ఓ
-
-స్క్
-
-స్క్టా
-
-స్క్ర
-
-స్క్రా
-
-స్క్రి
-
-స్క్రీ
-
-స్క్రై
-
-స్క్రో
-
-స్క్ల
-
-స్క్లా
-
-స్క్లె
-
-స్క్లో
-
-	స్ఖ
-
-	స్గ
-
-స్గా
-
-స్గి
-
-స్గో
-
-	స్ఘ
-
-స్చ్
-
-స్జి
-
-స్జీ
-
-స్జే
-
-	స్ట
-
-స్టా
-
-స్టి
-
-స్టీ
-
-స్టె
-
-స్టే
-
-స్టై
-
-స్టొ
-
-స్టో
-
-స్టౌ
-
-స్ట్
-
-స్ట్ఇ
-
-స్ట్గా
-
-స్ట్గ్రా
-
-స్ట్తో
-
-స్ట్ర
-
-స్ట్రా
-
-స్ట్రి
-
-స్ట్రీ
-
-స్ట్రె
-
-స్ట్రే
-
-స్ట్రై
-
-స్ట్రో
-
-స్ట్రౌ
-
-స్ట్ల
-
-స్ట్లే
-
-స్ట్లో
-
-స్ట్ల్లో
-
-స్ట్స్
-
-	స్ఠ
-
-స్డా
-
-స్డె
-
-స్డే
-
-స్డ్
-
-	స్త
-
-స్తా
-
-స్తి
-
-స్తీ
-
-స్తె
-
-స్తే
-
-స్తొ
-
-స్తో
-
-స్త్
-
-స్త్ర
-
-స్త్రా
-
-స్త్రి
-
-స్త్రీ
-
-స్త్రే
-
-స్త్రై
-
-స్త్రో
-
-	స్థ
-
-స్థా
-
-స్థి
-
-స్థీ
-
-స్థె
-
-స్థే
-
-స్థై
-
-స్థో
-
-	స్ద
-
-స్దా
-
-స్ది
-
-	స్ధ
-
-స్ధా
-
-స్ధి
-
-స్ప్
-
-స్ప్ర
-
-స్ప్రి
-
-స్ప్రె
-
-స్ప్రే
-
-స్ప్లా
-
-స్ప్లే
-
-	స్ర
-
-స్రా
-
-స్రి
-
-స్రీ
-
-స్రే
-
-స్రో
-
-స్ర్తీ
-
-	స్ల
-
-స్లా
-
-స్లి
-
-స్లీ
-
-స్లె
-
-స్లే
-
-స్లై
-
-స్లొ
-
-స్లో
-
-స్ల్
-
-	స్ష
-
-స్స్
-
-హ
-
-హా
-
-హి
-
-హీ
-
-హె
-
-హే
-
-హై
-
-హొ
-
-హో
-
-హౌ
-
-హ్
-
-హ్దీ
-
-హ్న్
-
-	హ్ర
-
-హ్రా
-
-హ్రి
-
-హ్రీ
-
-హ్రె
-
-హ్రే
-
-హ్రో
-
-హ్ర్
-
-	హ్ల
-
-హ్లా
-
-హ్లి
-
-హ్లె
-
-హ్లే
-
-హ్లో
-
-హ్ల్
-
-	హ్హ
-
-ఽ
-
-ా
-
-ి
-
-ీ
-
-ు
-
-ూ
-
-ృ
-
-ౄ
-
-ె
-
-ే
-
-ై
-
-ొ
-
-ో
-
-ౌ
-
-్
-
-్క
-
-్చ
-
-్ఛ
-
-్న
-
-్ప
-
-్ఫ
-
-్బ
-
-్భ
-
-్మ
-
-్య
-
-్ళ
-
-్వ
-
-్శ
-
-్స
-
-ౠ
-
-౦
-
-౧
-
-౨
-
-౩
-
-౪
-
-౫
-
-౬
-
-౭
-
-౮
-
-౯
-
-ಂ
-
-ಃ
-
-ಅ
-
-ಆ
-
-	ಆ್ಯ
-
-ಇ
-
-ಈ
-
-ಉ
-
-ಊ
-
-ಋ
-
-ಎ
-
-ಏ
-
-ಐ
-
-ಒ
-
-ಓ
-
-ಔ
-
-ಕ
-
-ಕಿ
-
-	ಕೀ
-
-ಕೀ
-
-ಕೂ
-
-ಕೃ
-
-ಕೆ
-
-	ಕೊ
-
-ಕೋ
-
-	ಕೇ
-
-	ಕೈ
-
-ಕೇ
-
-ಕೈ
-
-ಕೊ
-
-	ಕೋ
-
-ಕೋ
-
-ಕೌ
-
-ಕ್
-
-	ಕ್ಕ
-
-ಕ್ಕಿ
-
-ಕ್ಕೀ
-
-ಕ್ಕೂ
-
-ಕ್ಕೆ
-
-ಕ್ಕೇ
-
-ಕ್ಕೇ
-
-ಕ್ಕೊ
-
-ಕ್ಕೋ
-
-	ಕ್ಖ
-
-ಕ್ಖಿ
-
-ಕ್ಖೂ
-
-ಕ್ಖೇ
-
-	ಕ್ಗ
-
-	ಕ್ಚ
-
-	ಕ್ಟ
-
-ಕ್ಟಿ
-
-ಕ್ಟೋ
-
-ಕ್ಟೇ
-
-ಕ್ಟೇ
-
-ಕ್ಟೋ
-
-ಕ್ಟ್
-
-ಕ್ಟ್ರ
-
-ಕ್ಟ್‌
-
-	ಕ್ತ
-
-ಕ್ತಿ
-
-	ಕ್ನ
-
-ಕ್ನಿ
-
-	ಕ್ಯ
-
-ಕ್ಯೂ
-
-ಕ್ಯೋ
-
-	ಕ್ರ
-
-ಕ್ರಿ
-
-ಕ್ರೀ
-
-ಕ್ರೀ
-
-ಕ್ರೂ
-
-ಕ್ರೆ
-
-ಕ್ರೋ
-
-ಕ್ರೇ
-
-ಕ್ರೇ
-
-ಕ್ರೈ
-
-ಕ್ರೋ
-
-ಕ್ರೌ
-
-	ಕ್ಲ
-
-ಕ್ಲಿ
-
-ಕ್ಲೀ
-
-ಕ್ಲೀ
-
-ಕ್ಲೋ
-
-	ಕ್ವ
-
-ಕ್ವಿ
-
-ಕ್ವೆ
-
-	ಕ್ಷ
-
-ಕ್ಷಿ
-
-ಕ್ಷೀ
-
-ಕ್ಷೀ
-
-ಕ್ಷೆ
-
-ಕ್ಷೇ
-
-ಕ್ಷೇ
-
-ಕ್ಷೌ
-
-ಕ್ಷ್ಮ
-
-ಕ್ಷ್ಮಿ
-
-ಕ್ಷ್ಮೀ
-
-ಕ್ಷ್ಮೀ
-
-ಕ್ಷ್ಯ
-
-	ಕ್ಸ
-
-ಕ್ಸಿ
-
-ಕ್ಸೆ
-
-ಕ್ಸ್
-
-ಕ್ಸ್‌
-
-	ಕ್‌
-
-ಖ
-
-ಖಿ
-
-ಖೀ
-
-ಖೂ
-
-ಖೆ
-
-ಖೇ
-
-ಖೈ
-
-ಖೋ
-
-ಖ್
-
-	ಖ್ಯ
-
-ಖ್ಯಿ
-
-ಖ್ಯೆ
-
-ಖ್ಯೋ
-
-	ಖ್‌
-
-ಗ
-
-ಗಿ
-
-	ಗೀ
-
-ಗೀ
-
-ಗೂ
-
-ಗೃ
-
-ಗೆ
-
-	ಗೊ
-
-ಗೋ
-
-	ಗೇ
-
-	ಗೈ
-
-ಗೇ
-
-ಗೈ
-
-ಗೊ
-
-ಗೋ
-
-ಗೌ
-
-ಗ್
-
-	ಗ್ಗ
-
-ಗ್ಗಿ
-
-ಗ್ಗೂ
-
-ಗ್ಗೆ
-
-ಗ್ಗೇ
-
-ಗ್ಗೋ
-
-	ಗ್ಟ
-
-ಗ್ಡೆ
-
-	ಗ್ತ
-
-ಗ್ತಿ
-
-	ಗ್ದ
-
-	ಗ್ಧ
-
-	ಗ್ನ
-
-ಗ್ನಿ
-
-ಗ್ನೆ
-
-	ಗ್ಯ
-
-ಗ್ಯೂ
-
-	ಗ್ರ
-
-ಗ್ರಿ
-
-ಗ್ರೀ
-
-ಗ್ರೀ
-
-ಗ್ರೂ
-
-ಗ್ರೆ
-
-ಗ್ರೇ
-
-ಗ್ರೇ
-
-	ಗ್ಲ
-
-ಗ್ಲಿ
-
-ಗ್ಲೀ
-
-ಗ್ಲೆ
-
-ಗ್ಲೋ
-
-	ಗ್ವ
-
-ಗ್ವಿ
-
-ಗ್ಸ್
-
-ಗ್ಸ್‌
-
-	ಗ್‌
-
-ಘ
-
-ಘಿ
-
-ಘೀ
-
-ಘೋ
-
-ಘೋ
-
-	ಘ್ನ
-
-	ಘ್ರ
-
-	ಙ್ಕ
-
-	ಙ್ಖ
-
-	ಙ್ಗ
-
-ಚ
-
-ಚಿ
-
-	ಚೀ
-
-ಚೀ
-
-ಚೂ
-
-ಚೆ
-
-	ಚೇ
-
-ಚೇ
-
-ಚೈ
-
-ಚೊ
-
-ಚೋ
-
-ಚೌ
-
-ಚ್
-
-	ಚ್ಚ
-
-ಚ್ಚಿ
-
-ಚ್ಚೆ
-
-ಚ್ಚೇ
-
-	ಚ್ಛ
-
-ಚ್ಛಿ
-
-ಚ್ಛೆ
-
-ಚ್ಛೇ
-
-	ಚ್ಯ
-
-	ಚ್‌
-
-ಛ
-
-ಛಿ
-
-ಛೀ
-
-ಛೇ
-
-ಛೋ
-
-ಜ
-
-ಜಿ
-
-	ಜೀ
-
-ಜೀ
-
-ಜೂ
-
-ಜೃ
-
-ಜೆ
-
-	ಜೊ
-
-ಜೋ
-
-	ಜೇ
-
-ಜೇ
-
-ಜೈ
-
-ಜೊ
-
-	ಜೋ
-
-ಜೋ
-
-ಜ್
-
-	ಜ್ಜ
-
-ಜ್ಜಿ
-
-ಜ್ಜೆ
-
-	ಜ್ಝ
-
-	ಜ್ಞ
-
-ಜ್ಞೆ
-
-	ಜ್ಯ
-
-ಜ್ಯೂ
-
-ಜ್ಯೋ
-
-	ಜ್ರ
-
-	ಜ್ವ
-
-	ಜ್‌
-
-ಝ
-
-ಝಿ
-
-ಝೀ
-
-ಝೂ
-
-ಝೇ
-
-ಝ್
-
-ಞ
-
-	ಞ್ಚ
-
-ಞ್ಚಿ
-
-	ಞ್ಜ
-
-	ಞ್ಞ
-
-ಞ್ಞೇ
-
-ಞ್ಞೋ
-
-ಟ
-
-ಟಿ
-
-	ಟೀ
-
-ಟೀ
-
-ಟೂ
-
-ಟೆ
-
-	ಟೊ
-
-ಟೋ
-
-	ಟೇ
-
-	ಟೈ
-
-ಟೇ
-
-ಟೈ
-
-ಟೊ
-
-ಟೋ
-
-ಟೌ
-
-ಟ್
-
-	ಟ್ಕ
-
-	ಟ್ಗ
-
-ಟ್ಗೊ
-
-	ಟ್ಟ
-
-ಟ್ಟಿ
-
-ಟ್ಟೂ
-
-ಟ್ಟೆ
-
-ಟ್ಟೇ
-
-ಟ್ಟೋ
-
-	ಟ್ಠ
-
-ಟ್ಠಿ
-
-ಟ್ಠೇ
-
-ಟ್ಠೋ
-
-	ಟ್ನ
-
-	ಟ್ಬ
-
-	ಟ್ಯ
-
-ಟ್ಯೂ
-
-	ಟ್ರ
-
-ಟ್ರಿ
-
-ಟ್ರೆ
-
-ಟ್ರೋ
-
-ಟ್ರೇ
-
-ಟ್ರೇ
-
-ಟ್ರೈ
-
-ಟ್ರೊ
-
-ಟ್ರೋ
-
-ಟ್ರ್ಯ
-
-	ಟ್ಲ
-
-ಟ್ಲಿ
-
-	ಟ್ವ
-
-ಟ್ವಿ
-
-ಟ್ವೆ
-
-	ಟ್ಸ
-
-ಟ್ಸ್
-
-ಟ್ಸ್‌
-
-	ಟ್‌
-
-ಠ
-
-ಠಿ
-
-ಠೀ
-
-ಠೇ
-
-ಠೋ
-
-	ಠ್ಯ
-
-ಡ
-
-ಡಿ
-
-	ಡೀ
-
-ಡೀ
-
-ಡೂ
-
-ಡೆ
-
-	ಡೊ
-
-ಡೋ
-
-	ಡೇ
-
-	ಡೈ
-
-ಡೇ
-
-ಡೈ
-
-ಡೊ
-
-ಡೋ
-
-ಡೌ
-
-ಡ್
-
-	ಡ್ಕ
-
-ಡ್ಕೊ
-
-	ಡ್ಗ
-
-ಡ್ಜ್
-
-ಡ್ಜ್‌
-
-	ಡ್ಡ
-
-ಡ್ಡಿ
-
-ಡ್ಡೆ
-
-	ಡ್ತ
-
-ಡ್ತಿ
-
-ಡ್ತೀ
-
-	ಡ್ನ
-
-ಡ್ನಿ
-
-ಡ್ಪ್ರೆ
-
-ಡ್ಮಿ
-
-	ಡ್ಯ
-
-ಡ್ಯೂ
-
-	ಡ್ರ
-
-ಡ್ರಿ
-
-ಡ್ರೆ
-
-ಡ್ರೈ
-
-ಡ್ರೈ
-
-	ಡ್ಲ
-
-ಡ್ಲಿ
-
-ಡ್ಲೆ
-
-	ಡ್ವ
-
-ಡ್ಸ್
-
-ಡ್ಸ್‌
-
-	ಡ್‌
-
-ಢ
-
-ಢಿ
-
-ಢೀ
-
-ಣ
-
-ಣಿ
-
-ಣೀ
-
-ಣೂ
-
-ಣೆ
-
-ಣೇ
-
-ಣೈ
-
-ಣೋ
-
-ಣ್
-
-	ಣ್ಡ
-
-	ಣ್ಣ
-
-ಣ್ಣಿ
-
-ಣ್ಣೀ
-
-ಣ್ಣೀ
-
-ಣ್ಣೂ
-
-ಣ್ಣೆ
-
-ಣ್ನೆ
-
-	ಣ್ಮ
-
-	ಣ್ಯ
-
-	ಣ್ವ
-
-	ಣ್ಹ
-
-	ಣ್‌
-
-ತ
-
-ತಿ
-
-	ತೀ
-
-ತೀ
-
-ತೂ
-
-ತೃ
-
-ತೆ
-
-	ತೊ
-
-ತೋ
-
-	ತೇ
-
-ತೇ
-
-ತೈ
-
-ತೊ
-
-	ತೋ
-
-ತೋ
-
-ತೌ
-
-ತ್
-
-	ತ್ಕ
-
-ತ್ಕೃ
-
-	ತ್ತ
-
-ತ್ತಿ
-
-ತ್ತೀ
-
-ತ್ತೀ
-
-ತ್ತೂ
-
-ತ್ತೆ
-
-ತ್ತೊ
-
-ತ್ತೇ
-
-ತ್ತೇ
-
-ತ್ತೈ
-
-ತ್ತೊ
-
-ತ್ತೋ
-
-ತ್ತ್
-
-ತ್ತ್ವ
-
-	ತ್ಥ
-
-ತ್ಥಿ
-
-ತ್ಥೇ
-
-ತ್ಥೋ
-
-	ತ್ನ
-
-ತ್ನಿ
-
-	ತ್ಪ
-
-	ತ್ಮ
-
-ತ್ಮಿ
-
-ತ್ಮೀ
-
-	ತ್ಯ
-
-ತ್ಯೆ
-
-ತ್ಯೇ
-
-ತ್ಯೇ
-
-ತ್ಯೋ
-
-	ತ್ರ
-
-ತ್ರಿ
-
-ತ್ರೀ
-
-ತ್ರೀ
-
-ತ್ರೆ
-
-ತ್ರೇ
-
-ತ್ರೈ
-
-ತ್ರೋ
-
-ತ್ರ್ಯ
-
-ತ್ರ್ಯೋ
-
-	ತ್ವ
-
-ತ್ವಿ
-
-	ತ್ಸ
-
-ತ್ಸೆ
-
-	ತ್‌
-
-ಥ
-
-ಥಿ
-
-	ಥೀ
-
-ಥೀ
-
-ಥೆ
-
-ಥೇ
-
-ಥೈ
-
-ಥೊ
-
-ಥೋ
-
-ಥ್
-
-	ಥ್ಯ
-
-ಥ್ಲೆ
-
-ಥ್ವಿ
-
-	ಥ್‌
-
-ದ
-
-ದಿ
-
-	ದೀ
-
-ದೀ
-
-ದೂ
-
-ದೃ
-
-ದೆ
-
-	ದೊ
-
-ದೋ
-
-	ದೇ
-
-	ದೈ
-
-ದೇ
-
-ದೈ
-
-ದೊ
-
-ದೋ
-
-ದೌ
-
-ದ್
-
-	ದ್ಗ
-
-ದ್ಗೀ
-
-	ದ್ಘ
-
-	ದ್ದ
-
-ದ್ದಿ
-
-ದ್ದೀ
-
-ದ್ದೀ
-
-ದ್ದೂ
-
-ದ್ದೆ
-
-ದ್ದೇ
-
-ದ್ದೇ
-
-ದ್ದೊ
-
-ದ್ದೋ
-
-	ದ್ಧ
-
-ದ್ಧಿ
-
-ದ್ಧೂ
-
-ದ್ಧೆ
-
-ದ್ಧೇ
-
-ದ್ಧೋ
-
-	ದ್ಬ
-
-	ದ್ಭ
-
-	ದ್ಮ
-
-	ದ್ಯ
-
-ದ್ಯೆ
-
-ದ್ಯೋ
-
-ದ್ಯೋ
-
-	ದ್ರ
-
-ದ್ರಿ
-
-ದ್ರೀ
-
-ದ್ರೀ
-
-ದ್ರೂ
-
-ದ್ರೆ
-
-ದ್ರೇ
-
-ದ್ರೇ
-
-ದ್ರೋ
-
-	ದ್ಲ
-
-	ದ್ವ
-
-ದ್ವಿ
-
-ದ್ವೀ
-
-ದ್ವೀ
-
-ದ್ವೇ
-
-	ದ್‌
-
-ಧ
-
-ಧಿ
-
-ಧೀ
-
-ಧೂ
-
-ಧೃ
-
-ಧೆ
-
-ಧೇ
-
-ಧೈ
-
-ಧೋ
-
-	ಧ್ಯ
-
-ಧ್ಯೆ
-
-	ಧ್ರ
-
-	ಧ್ವ
-
-ನ
-
-ನಿ
-
-	ನೀ
-
-ನೀ
-
-ನೂ
-
-ನೃ
-
-ನೆ
-
-	ನೊ
-
-ನೋ
-
-	ನೇ
-
-	ನೈ
-
-ನೇ
-
-ನೈ
-
-ನೊ
-
-ನೋ
-
-ನೌ
-
-ನ್
-
-	ನ್ಎ
-
-	ನ್ಗ
-
-	ನ್ತ
-
-ನ್ತಿ
-
-ನ್ತೀ
-
-ನ್ತೇ
-
-ನ್ತೋ
-
-	ನ್ದ
-
-ನ್ದಿ
-
-ನ್ದೀ
-
-ನ್ದ್ರ
-
-ನ್ದ್ರಿ
-
-	ನ್ಧ
-
-ನ್ಧಿ
-
-	ನ್ನ
-
-ನ್ನಿ
-
-ನ್ನೀ
-
-ನ್ನೂ
-
-ನ್ನೆ
-
-ನ್ನೇ
-
-ನ್ನೇ
-
-ನ್ನೈ
-
-ನ್ನೊ
-
-ನ್ನೋ
-
-ನ್ಫೋ
-
-	ನ್ಮ
-
-ನ್ಮೂ
-
-	ನ್ಯ
-
-ನ್ಯೂ
-
-ನ್ರಿ
-
-ನ್ಲೋ
-
-ನ್ಲೈ
-
-ನ್ಲೋ
-
-	ನ್ವ
-
-ನ್ವಿ
-
-ನ್ವೆ
-
-ನ್ವೇ
-
-ನ್ಶಿ
-
-	ನ್ಸ
-
-ನ್ಸಿ
-
-ನ್ಸೂ
-
-ನ್ಸೆ
-
-ನ್ಸ್
-
-ನ್ಸ್‌
-
-	ನ್ಹ
-
-ನ್ಹೇ
-
-ನ್ಹೋ
-
-	ನ್‌
-
-ನ್‌‌
-
-಩
-
-ಪ
-
-ಪಿ
-
-	ಪೀ
-
-ಪೀ
-
-ಪೂ
-
-ಪೃ
-
-ಪೆ
-
-	ಪೊ
-
-ಪೋ
-
-	ಪೇ
-
-	ಪೈ
-
-ಪೇ
-
-ಪೈ
-
-ಪೊ
-
-ಪೋ
-
-ಪೌ
-
-ಪ್
-
-	ಪ್ಟ
-
-ಪ್ಟಿ
-
-ಪ್ಟೆ
-
-ಪ್ಟ್
-
-ಪ್ಡೇ
-
-	ಪ್ತ
-
-ಪ್ತಿ
-
-	ಪ್ನ
-
-	ಪ್ಪ
-
-ಪ್ಪಿ
-
-ಪ್ಪೆ
-
-ಪ್ಪೇ
-
-ಪ್ಪೇ
-
-ಪ್ಪೋ
-
-	ಪ್ಯ
-
-ಪ್ಯೂ
-
-	ಪ್ರ
-
-ಪ್ರಿ
-
-ಪ್ರೀ
-
-ಪ್ರೀ
-
-ಪ್ರೆ
-
-ಪ್ರೊ
-
-ಪ್ರೋ
-
-ಪ್ರೇ
-
-ಪ್ರೇ
-
-ಪ್ರೈ
-
-ಪ್ರೊ
-
-ಪ್ರೋ
-
-ಪ್ರೌ
-
-	ಪ್ಲ
-
-ಪ್ಲಿ
-
-ಪ್ಲೆ
-
-ಪ್ಲೇ
-
-ಪ್ಲೇ
-
-ಪ್ಲೊ
-
-ಪ್ಲೋ
-
-	ಪ್ಸ
-
-ಪ್ಸ್
-
-	ಪ್‌
-
-ಫ
-
-ಫಿ
-
-	ಫೀ
-
-ಫೀ
-
-ಫೂ
-
-ಫೆ
-
-ಫೋ
-
-	ಫೇ
-
-	ಫೈ
-
-ಫೇ
-
-ಫೈ
-
-ಫೊ
-
-ಫೋ
-
-ಫೌ
-
-ಫ್
-
-	ಫ್ಘ
-
-ಫ್ಟಿ
-
-ಫ್ಟ್
-
-ಫ್ಟ್‌
-
-	ಫ್ತ
-
-	ಫ್ಯ
-
-	ಫ್ರ
-
-ಫ್ರಿ
-
-ಫ್ರೀ
-
-ಫ್ರೀ
-
-ಫ್ರೆ
-
-	ಫ್ಲ
-
-ಫ್ಲೋ
-
-ಫ್ಲ್ಯ
-
-	ಫ್‌
-
-ಫ‌
-
-ಬ
-
-ಬಿ
-
-	ಬೀ
-
-ಬೀ
-
-ಬೂ
-
-ಬೃ
-
-ಬೆ
-
-	ಬೊ
-
-ಬೋ
-
-	ಬೇ
-
-	ಬೈ
-
-ಬೇ
-
-ಬೈ
-
-ಬೊ
-
-ಬೋ
-
-ಬೌ
-
-ಬ್
-
-	ಬ್ದ
-
-	ಬ್ಧ
-
-	ಬ್ಬ
-
-ಬ್ಬಿ
-
-ಬ್ಬೆ
-
-ಬ್ಬೇ
-
-ಬ್ಬೊ
-
-ಬ್ಬೋ
-
-	ಬ್ಭ
-
-	ಬ್ಯ
-
-ಬ್ಯೂ
-
-	ಬ್ರ
-
-ಬ್ರಿ
-
-ಬ್ರೂ
-
-ಬ್ರೆ
-
-ಬ್ರೇ
-
-ಬ್ರೇ
-
-ಬ್ರೌ
-
-	ಬ್ಲ
-
-ಬ್ಲಿ
-
-ಬ್ಲೂ
-
-ಬ್ಲೆ
-
-ಬ್ಲೊ
-
-ಬ್ಲ್ಯ
-
-ಬ್ಲ್ಯೂ
-
-ಬ್ಳೆ
-
-ಬ್ಸಿ
-
-ಬ್ಸೈ
-
-	ಬ್‌
-
-ಭ
-
-ಭಿ
-
-ಭೀ
-
-ಭೂ
-
-ಭೆ
-
-	ಭೇ
-
-ಭೇ
-
-ಭೈ
-
-ಭೋ
-
-ಭೌ
-
-ಭ್
-
-	ಭ್ಯ
-
-	ಭ್ರ
-
-ಭ್ರೂ
-
-ಮ
-
-ಮಿ
-
-	ಮೀ
-
-ಮೀ
-
-ಮೂ
-
-ಮೃ
-
-ಮೆ
-
-	ಮೊ
-
-ಮೋ
-
-	ಮೇ
-
-	ಮೈ
-
-ಮೇ
-
-ಮೈ
-
-ಮೊ
-
-ಮೋ
-
-ಮೌ
-
-ಮ್
-
-	ಮ್ಗ
-
-	ಮ್ನ
-
-	ಮ್ಪ
-
-ಮ್ಪಿ
-
-	ಮ್ಬ
-
-	ಮ್ಭ
-
-	ಮ್ಮ
-
-ಮ್ಮಿ
-
-ಮ್ಮೂ
-
-ಮ್ಮೆ
-
-ಮ್ಮೇ
-
-ಮ್ಮೇ
-
-ಮ್ಮೊ
-
-ಮ್ಮೋ
-
-	ಮ್ಯ
-
-ಮ್ಯೂ
-
-	ಮ್ರ
-
-	ಮ್ಲ
-
-ಮ್ಸ್
-
-ಮ್ಸ್‌
-
-	ಮ್ಹ
-
-	ಮ್‌
-
-ಯ
-
-ಯಿ
-
-ಯೀ
-
-ಯೂ
-
-ಯೆ
-
-	ಯೊ
-
-ಯೋ
-
-	ಯೇ
-
-ಯೇ
-
-ಯೊ
-
-	ಯೋ
-
-ಯೋ
-
-ಯೌ
-
-ಯ್
-
-	ಯ್ಕ
-
-ಯ್ಕಿ
-
-ಯ್ಕೆ
-
-	ಯ್ಡ
-
-ಯ್ಡ್
-
-	ಯ್ತ
-
-ಯ್ತಿ
-
-	ಯ್ದ
-
-ಯ್ದಿ
-
-ಯ್ದೆ
-
-	ಯ್ಯ
-
-ಯ್ಯೋ
-
-ಯ್ಲಿ
-
-ಯ್ಲೆ
-
-	ಯ್ಸ
-
-ಯ್ಸ್
-
-	ಯ್‌
-
-ರ
-
-ರಿ
-
-	ರೀ
-
-ರೀ
-
-ರೂ
-
-ರೆ
-
-	ರೊ
-
-ರೋ
-
-	ರೇ
-
-	ರೈ
-
-ರೇ
-
-ರೈ
-
-ರೊ
-
-ರೋ
-
-ರೌ
-
-ರ್
-
-ಱ
-
-ಲ
-
-ಲಿ
-
-	ಲೀ
-
-ಲೀ
-
-ಲೂ
-
-ಲೆ
-
-	ಲೊ
-
-ಲೋ
-
-	ಲೇ
-
-	ಲೈ
-
-ಲೇ
-
-ಲೈ
-
-ಲೊ
-
-ಲೋ
-
-ಲೌ
-
-ಲ್
-
-	ಲ್ಕ
-
-ಲ್ಕಿ
-
-ಲ್ಕೂ
-
-ಲ್ಕೆ
-
-ಲ್ಕ್
-
-	ಲ್ಗ
-
-ಲ್ಗೊ
-
-	ಲ್ಟ
-
-ಲ್ಟಿ
-
-ಲ್ಟ್
-
-	ಲ್ಡ
-
-ಲ್ಡಿ
-
-ಲ್ಡ್
-
-ಲ್ಡ್‌
-
-	ಲ್ತ
-
-ಲ್ತಿ
-
-ಲ್ತ್
-
-ಲ್ತ್‌
-
-	ಲ್ದ
-
-	ಲ್ನ
-
-ಲ್ನೋ
-
-	ಲ್ಪ
-
-ಲ್ಪಿ
-
-ಲ್ಪೆ
-
-	ಲ್ಫ
-
-ಲ್ಫ್
-
-	ಲ್ಬ
-
-	ಲ್ಮ
-
-ಲ್ಮೀ
-
-ಲ್ಮೀ
-
-	ಲ್ಯ
-
-ಲ್ಯೂ
-
-	ಲ್ಲ
-
-ಲ್ಲಿ
-
-ಲ್ಲೀ
-
-ಲ್ಲೂ
-
-ಲ್ಲೆ
-
-ಲ್ಲೇ
-
-ಲ್ಲೇ
-
-ಲ್ಲೊ
-
-ಲ್ಲೋ
-
-ಲ್ಲ್ಯ
-
-	ಲ್ವ
-
-ಲ್ವಿ
-
-ಲ್ವೆ
-
-ಲ್ವೇ
-
-	ಲ್ಸ
-
-ಲ್ಸಿ
-
-ಲ್ಸ್
-
-ಲ್ಸ್‌
-
-	ಲ್‌
-
-ಳ
-
-ಳಿ
-
-	ಳೀ
-
-ಳೀ
-
-ಳೂ
-
-ಳೆ
-
-	ಳೊ
-
-ಳೇ
-
-ಳೊ
-
-ಳೋ
-
-ಳ್
-
-ಳ್ಕೊ
-
-	ಳ್ತ
-
-ಳ್ತಿ
-
-ಳ್ಮೆ
-
-	ಳ್ಯ
-
-	ಳ್ಳ
-
-ಳ್ಳಿ
-
-ಳ್ಳೂ
-
-ಳ್ಳೆ
-
-ಳ್ಳೇ
-
-ಳ್ಳೇ
-
-ಳ್ಳೋ
-
-	ಳ್ವ
-
-ಳ್ವಿ
-
-ಳ್ವೆ
-
-	ಳ್‌
-
-಴
-
-ವ
-
-ವಿ
-
-	ವೀ
-
-ವೀ
-
-ವೂ
-
-ವೃ
-
-ವೆ
-
-	ವೊ
-
-	ವೇ
-
-	ವೈ
-
-ವೇ
-
-ವೈ
-
-ವೊ
-
-ವೋ
-
-ವೌ
-
-ವ್
-
-ವ್ಕ್
-
-ವ್ನ್
-
-	ವ್ಯ
-
-ವ್ಯೂ
-
-	ವ್ರ
-
-	ವ್ವ
-
-	ವ್ಹ
-
-	ವ್‌
-
-ಶ
-
-ಶಿ
-
-	ಶೀ
-
-ಶೀ
-
-ಶೂ
-
-ಶೃ
-
-ಶೆ
-
-ಶೋ
-
-	ಶೇ
-
-	ಶೈ
-
-ಶೇ
-
-ಶೈ
-
-ಶೋ
-
-ಶೌ
-
-ಶ್
-
-	ಶ್ಚ
-
-ಶ್ಚಿ
-
-	ಶ್ನ
-
-ಶ್ನಿ
-
-ಶ್ನೆ
-
-ಶ್ಮಿ
-
-ಶ್ಮೀ
-
-ಶ್ಮೀ
-
-	ಶ್ಯ
-
-	ಶ್ರ
-
-ಶ್ರಿ
-
-ಶ್ರೀ
-
-ಶ್ರೀ
-
-ಶ್ರೇ
-
-ಶ್ರೇ
-
-	ಶ್ಲ
-
-ಶ್ಲೀ
-
-ಶ್ಲೇ
-
-ಶ್ಲೇ
-
-ಶ್ಲೋ
-
-	ಶ್ವ
-
-ಶ್ವಿ
-
-ಶ್ವೇ
-
-ಶ್ವೇ
-
-	ಶ್‌
-
-ಷ
-
-ಷಿ
-
-ಷೀ
-
-ಷೆ
-
-	ಷೇ
-
-ಷೇ
-
-ಷೋ
-
-ಷ್
-
-	ಷ್ಕ
-
-ಷ್ಕೃ
-
-ಷ್ಕ್ರಿ
-
-	ಷ್ಟ
-
-ಷ್ಟಿ
-
-ಷ್ಟೂ
-
-ಷ್ಟೆ
-
-ಷ್ಟೇ
-
-ಷ್ಟೇ
-
-ಷ್ಟೊ
-
-ಷ್ಟೋ
-
-ಷ್ಟ್ಯ
-
-ಷ್ಟ್ರ
-
-ಷ್ಟ್ರೀ
-
-ಷ್ಟ್ರೀ
-
-	ಷ್ಠ
-
-ಷ್ಠಿ
-
-ಷ್ಠೆ
-
-	ಷ್ಣ
-
-	ಷ್ಪ
-
-	ಷ್ಮ
-
-ಷ್ಮೆ
-
-	ಷ್ಯ
-
-	ಷ್‌
-
-ಸ
-
-ಸಿ
-
-	ಸೀ
-
-ಸೀ
-
-ಸೂ
-
-ಸೃ
-
-ಸೆ
-
-	ಸೊ
-
-ಸೋ
-
-	ಸೇ
-
-	ಸೈ
-
-ಸೇ
-
-ಸೈ
-
-ಸೊ
-
-ಸೋ
-
-ಸೌ
-
-ಸ್
-
-	ಸ್ಎ
-
-	ಸ್ಕ
-
-ಸ್ಕಿ
-
-ಸ್ಕೂ
-
-ಸ್ಕೃ
-
-ಸ್ಕೆ
-
-ಸ್ಕೋ
-
-ಸ್ಕೇ
-
-ಸ್ಕೊ
-
-ಸ್ಕೋ
-
-ಸ್ಕ್
-
-ಸ್ಕ್ಯ
-
-ಸ್ಕ್ರಿ
-
-ಸ್ಕ್‌
-
-	ಸ್ಟ
-
-ಸ್ಟಿ
-
-ಸ್ಟೀ
-
-ಸ್ಟೀ
-
-ಸ್ಟೆ
-
-ಸ್ಟೋ
-
-ಸ್ಟೇ
-
-ಸ್ಟೇ
-
-ಸ್ಟೈ
-
-ಸ್ಟೋ
-
-ಸ್ಟ್
-
-ಸ್ಟ್ಯ
-
-ಸ್ಟ್ರ
-
-ಸ್ಟ್ರಿ
-
-ಸ್ಟ್ರೀ
-
-ಸ್ಟ್ರೀ
-
-ಸ್ಟ್ರೇ
-
-ಸ್ಟ್ರೇ
-
-ಸ್ಟ್‌
-
-	ಸ್ತ
-
-ಸ್ತಿ
-
-ಸ್ತೀ
-
-ಸ್ತೂ
-
-ಸ್ತೆ
-
-ಸ್ತೇ
-
-ಸ್ತೋ
-
-ಸ್ತ್
-
-ಸ್ತ್ರ
-
-ಸ್ತ್ರಿ
-
-ಸ್ತ್ರೀ
-
-ಸ್ತ್ರೀ
-
-	ಸ್ಥ
-
-ಸ್ಥಿ
-
-ಸ್ಥೆ
-
-ಸ್ಥ್ಯ
-
-	ಸ್ನ
-
-ಸ್ನಿ
-
-ಸ್ನೇ
-
-ಸ್ನೇ
-
-	ಸ್ಪ
-
-ಸ್ಪಿ
-
-ಸ್ಪೀ
-
-ಸ್ಪೀ
-
-ಸ್ಪೂ
-
-ಸ್ಪೃ
-
-ಸ್ಪೆ
-
-ಸ್ಪೇ
-
-ಸ್ಪೇ
-
-ಸ್ಪೋ
-
-ಸ್ಪ್ಯ
-
-ಸ್ಫೂ
-
-ಸ್ಫೋ
-
-ಸ್ಬಿ
-
-	ಸ್ಮ
-
-ಸ್ಮಿ
-
-ಸ್ಮೃ
-
-	ಸ್ಯ
-
-ಸ್ಯೆ
-
-	ಸ್ರ
-
-ಸ್ರೇ
-
-ಸ್ರೋ
-
-	ಸ್ಲ
-
-ಸ್ಲಿ
-
-ಸ್ಲೈ
-
-	ಸ್ವ
-
-ಸ್ವಿ
-
-ಸ್ವೀ
-
-ಸ್ವೀ
-
-	ಸ್ಸ
-
-ಸ್ಸಿ
-
-ಸ್ಸೆ
-
-ಸ್ಸೇ
-
-	ಸ್‌
-
-ಹ
-
-ಹಿ
-
-	ಹೀ
-
-ಹೀ
-
-ಹೂ
-
-ಹೃ
-
-ಹೆ
-
-	ಹೊ
-
-ಹೋ
-
-	ಹೇ
-
-	ಹೈ
-
-ಹೇ
-
-ಹೈ
-
-ಹೊ
-
-ಹೋ
-
-ಹೌ
-
-ಹ್
-
-	ಹ್ನ
-
-ಹ್ನೆ
-
-	ಹ್ಮ
-
-	ಹ್ಯ
-
-	ಹ್ರ
-
-	ಹ್ಲ
-
-ಹ್ಲಿ
-
-	ಹ್ವ
-
-಺
-
-ಽ
-
-ಾ
-
-ಿ
-
-ು
-
-್ರ
-
-ೕ
-
-೦
-
-೧
-
-೨
-
-೩
-
-೪
-
-೫
-
-೬
-
-೭
-
-೮
-
-೯
-
-ാ
-
-ി
-
-ං
-
-අ
-
-අං
-
-අඃ
-
-අා
-
-අැ
-
-අෙ
-
-ආ
-
-ආං
-
-ඇ
-
-ඇං
-
-ඈ
-
-ඉ
-
-ඉං
-
-ඉැ
-
-ඊ
-
-උ
-
-ඌ
-
-ඍ
-
-එ
-
-එං
-
-එ්
-
-එ්වා
-
-එැ
-
-එෙ
-
-එ‌
-
-ඒ
-
-ඓ
-
-ඔ
-
-ඔු
-
-ඕ
-
-ඖ
-
-ක
-
-කං
-
-කඃ
-
-ක්
-
-	ක්අ
-
-	ක්ඇ
-
-	ක්උ
-
-	ක්එ
-
-	ක්ඔ
-
-	ක්ක
-
-ක්කං
-
-ක්ක්‍ර
-
-ක්ක්‍රො
-
-ක්ක්‍රෝ
-
-ක්කා
-
-ක්කැ
-
-ක්කි
-
-ක්කී
-
-ක්කු
-
-ක්කූ
-
-ක්කෙ
-
-ක්කේ
-
-ක්කො
-
-ක්කෝ
-
-	ක්ඛ
-
-ක්ඛං
-
-ක්ඛා
-
-ක්ඛි
-
-ක්ඛී
-
-ක්ඛු
-
-ක්ඛුං
-
-ක්ඛූ
-
-ක්ඛෙ
-
-ක්ඛො
-
-ක්ඛෝ
-
-	ක්ග
-
-ක්ග්‍රා
-
-ක්ගැ
-
-ක්ගෙ
-
-ක්ගේ
-
-ක්ගො
-
-	ක්ච
-
-	ක්ජ
-
-	ක්ට
-
-ක්ට්
-
-ක්ට්රො
-
-ක්ට්රෝ
-
-ක්ට්ස්
-
-ක්ට්‍ර
-
-ක්ට්‍රා
-
-ක්ට්‍රි
-
-ක්ට්‍රො
-
-ක්ට්‍රෝ
-
-ක්ටා
-
-ක්ටි
-
-ක්ටී
-
-ක්ටෙ
-
-ක්ටේ
-
-ක්ටො
-
-ක්ටෝ
-
-	ක්ඩ
-
-ක්ඩො
-
-ක්ඩෝ
-
-	ක්ණ
-
-	ක්ත
-
-ක්තං
-
-ක්තඃ
-
-ක්ත්
-
-ක්ත්වා
-
-ක්ත්‍යා
-
-ක්ත්‍ර
-
-ක්තා
-
-ක්තාං
-
-ක්තාඃ
-
-ක්තැ
-
-ක්ති
-
-ක්තී
-
-ක්තු
-
-ක්තෘ
-
-ක්තෙ
-
-ක්තේ
-
-ක්තො
-
-ක්තෝ
-
-ක්තෞ
-
-	ක්ථ
-
-	ක්ද
-
-ක්දා
-
-ක්දැ
-
-ක්දි
-
-ක්දු
-
-ක්දෙ
-
-	ක්ධ
-
-	ක්න
-
-ක්න්
-
-ක්නා
-
-ක්නි
-
-ක්නී
-
-ක්නු
-
-ක්නෙ
-
-ක්නේ
-
-ක්නො
-
-	ක්ප
-
-ක්පා
-
-ක්පැ
-
-ක්පි
-
-ක්පී
-
-ක්පු
-
-ක්පූ
-
-ක්පේ
-
-	ක්බ
-
-ක්බා
-
-ක්බි
-
-ක්බී
-
-	ක්ම
-
-ක්මා
-
-ක්මැ
-
-ක්මි
-
-ක්මී
-
-ක්මු
-
-ක්මෙ
-
-ක්මේ
-
-ක්මො
-
-	ක්ය
-
-ක්යා
-
-ක්යැ
-
-ක්යු
-
-ක්යේ
-
-ක්යෝ
-
-	ක්ර
-
-ක්ර්ම
-
-ක්රා
-
-ක්රැ
-
-ක්රෑ
-
-ක්රි
-
-ක්රි්යා
-
-ක්රිා
-
-ක්රිැ
-
-ක්රිි
-
-ක්රිී
-
-ක්රිු
-
-ක්රිෙ
-
-ක්රිේ
-
-ක්රී
-
-ක්රු
-
-ක්රූ
-
-ක්රෙ
-
-ක්රේ
-
-ක්රො
-
-ක්රෝ
-
-	ක්ල
-
-ක්ල්
-
-ක්ලා
-
-ක්ලැ
-
-ක්ලෑ
-
-ක්ලි
-
-ක්ලී
-
-ක්ලෙ
-
-ක්ලේ
-
-ක්ලො
-
-ක්ලෝ
-
-	ක්ව
-
-ක්ව්බෙ
-
-ක්වා
-
-ක්වැ
-
-ක්වි
-
-ක්වී
-
-ක්වු
-
-ක්වූ
-
-ක්වෙ
-
-ක්වේ
-
-ක්වො
-
-ක්වෝ
-
-	ක්ශ
-
-ක්ශා
-
-ක්ශි
-
-ක්ශී
-
-ක්ශු
-
-ක්ශේ
-
-	ක්ෂ
-
-ක්ෂං
-
-ක්ෂඃ
-
-ක්ෂ්
-
-ක්ෂ්ම
-
-ක්ෂ්මි
-
-ක්ෂ්මී
-
-ක්ෂ්ය
-
-ක්ෂ්‍ය
-
-ක්ෂා
-
-ක්ෂාං
-
-ක්ෂි
-
-ක්ෂී
-
-ක්ෂු
-
-ක්ෂූ
-
-ක්ෂෙ
-
-ක්ෂේ
-
-ක්ෂො
-
-ක්ෂෞ
-
-	ක්ස
-
-ක්ස්
-
-ක්ස්කි
-
-ක්ස්ගේ
-
-ක්ස්ට
-
-ක්ස්ට්
-
-ක්ස්ටෝ
-
-ක්ස්ඩෙ
-
-ක්ස්ප
-
-ක්ස්ප්ලෝ
-
-ක්ස්ප්‍ර
-
-ක්ස්පි
-
-ක්ස්පී
-
-ක්ස්ලි
-
-ක්ස්ලෙ
-
-ක්ස්ව
-
-ක්ස්වා
-
-ක්ස්වෙ
-
-ක්ස්ස
-
-ක්ස්හි
-
-ක්ස්ෆ
-
-ක්සා
-
-ක්සැ
-
-ක්සි
-
-ක්සිං
-
-ක්සී
-
-ක්සු
-
-ක්සෙ
-
-ක්සේ
-
-ක්සො
-
-ක්සෝ
-
-	ක්හ
-
-ක්හා
-
-ක්හැ
-
-ක්හි
-
-ක්හී
-
-ක්හු
-
-ක්හො
-
-ක්හෝ
-
-	ක්ෆ
-
-ක්ෆෙ
-
-	ක්්
-
-	ක්ෙ
-
-	ක්‌
-
-ක්‍ඛ
-
-ක්‍ඛි
-
-ක්‍ද
-
-ක්‍ය
-
-ක්‍යං
-
-ක්‍යා
-
-ක්‍යාං
-
-ක්‍යු
-
-ක්‍යූ
-
-ක්‍ර
-
-ක්‍රා
-
-ක්‍රැ
-
-ක්‍රෑ
-
-ක්‍රි
-
-ක්‍රී
-
-ක්‍රෙ
-
-ක්‍රේ
-
-ක්‍රො
-
-ක්‍රෝ
-
-ක්‍රෞ
-
-ක්‍ෂ
- 
-ක්‍ෂ්ත්‍ර
-
-ක්‍ෂ්ප
-
-ක්‍ෂ්ම
-
-ක්‍ෂ්‍ය
-
-ක්‍ෂා
-
-ක්‍ෂාං
-
-ක්‍ෂි
-
-ක්‍ෂී
-
-ක්‍ෂු
-
-ක්‍ෂූ
-
-ක්‍ෂෙ
-
-ක්‍ෂේ
-
-කා
-
-	කාං
-
-	කාඃ
-
-	කාෙ
-
-	කා‌
-
-කා‌‌
-
-කැ
-
-කෑ
-
-කි
-
-	කිං
-
-කි්‍ර
-
-	කිි
-
-	කි‌
-
-කී
-
-කී්‍ර
-
-කු
-
-	කුං
-
-කූ
-
-කෘ
-
-	කෘෘ
-
-කෙ
-
-	කො
-
-	කෙ‌
-
-කේ
-
-කෛ
-
-	කෛඃ
-
-කො
-
-	කොං
-
-කෝ
-
-කෞ
-
-කෟ
-
-කෲ
-
-ක‌
-
-ඛ
-
-ඛං
-
-	ඛ්ය
-
-ඛ්යා
-
-ඛ්යා්ව
-
-ඛ්යාි
-
-ඛ්‍ය
-
-ඛ්‍යං
-
-ඛ්‍යා
-
-ඛ්‍යාං
-
-ඛ්‍යාඃ
-
-ඛ්‍යෙ
-
-ඛ්‍රි
-
-ඛා
-
-ඛි
-
-ඛී
-
-ඛු
-
-ඛූ
-
-ඛෙ
-
-ඛේ
-
-ඛො
-
-ඛෝ
-
-ග
-
-ගං
-
-ගඃ
-
-ග්
-
-	ග්ඓ
-
-	ග්ක
-
-	ග්ග
-
-ග්ගං
-
-ග්ගා
-
-ග්ගි
-
-ග්ගු
-
-ග්ගෙ
-
-ග්ගේ
-
-ග්ගො
-
-	ග්ඝ
-
-	ග්ජ
-
-	ග්ට
-
-ග්ඩැ
-
-ග්ඩෑ
-
-ග්ඩි
-
-	ග්ත
-
-	ග්ධ
-
-	ග්න
-
-ග්න්‍ය
-
-ග්න්‍යා
-
-ග්නා
-
-ග්නාං
-
-ග්නි
-
-ග්නී
-
-ග්නෙ
-
-ග්නේ
-
-ග්නෝ
-
-ග්බි
-
-ග්බෝ
-
-ග්භා
-
-	ග්ම
-
-ග්මා
-
-ග්මි
-
-	ග්ය
-
-ග්යු
-
-	ග්ර
-
-ග්ර්න්ථ
-
-ග්ර්හ
-
-ග්රා
-
-ග්රැ
-
-ග්රෑ
-
-ග්රි
-
-ග්රී
-
-ග්රීි
-
-ග්රීු
-
-ග්රු
-
-ග්රූ
-
-ග්රෙ
-
-ග්රේ
-
-ග්රෝ
-
-	ග්ල
-
-ග්ලං
-
-ග්ලා
-
-ග්ලැ
-
-ග්ලි
-
-ග්ලී
-
-ග්ලු
-
-ග්ලූ
-
-ග්ලෙ
-
-ග්ලේ
-
-ග්ලො
-
-ග්ලෝ
-
-	ග්ව
-
-ග්වා
-
-ග්වෑ
-
-ග්වි
-
-ග්වෙ
-
-ග්වේ
-
-ග්වො
-
-ග්ස්
-
-ග්ස්ට
-
-ග්ස්ට්‍ර
- 
-ග්ස්ට්‍රො
-
-ග්සි
-
-	ග්හ
-
-ග්හි
-
-ග්හෝ
-
-ග්‍ය
-
-ග්‍යා
-
-ග්‍ර
-
-ග්‍රා
-
-ග්‍රැ
-
-ග්‍රෑ
-
-ග්‍රි
-
-ග්‍රී
-
-ග්‍රෙ
-
-ග්‍රේ
-
-ග්‍රෛ
-
-ග්‍රො
-
-ග්‍රෝ
-
-ගා
-
-	ගාං
-
-	ගාඃ
-
-ගැ
-
-	ගැං
-
-ගෑ
-
-ගි
-
-	ගිං
-
-ගී
-
-ගී්‍ර
-
-ගු
-
-ගූ
-
-ගෘ
-
-ගෙ
-
-	ගේ
-
-	ගෞ
-
-ගේ
-
-	ගේ්
-
-ගෛ
-
-	ගෛඃ
-
-ගො
-
-	ගොං
-
-ගෝ
-
-ගෞ
-
-ගෟ
-
-ගෲ
-
-ඝ
-
-ඝං
-
-	ඝ්ර
-
-ඝ්‍ර
-
-ඝ්‍රා
-
-ඝ්‍රි
-
-ඝා
-
-ඝි
-
-ඝී
-
-ඝු
-
-	ඝුඃ
-
-ඝූ
-
-ඝෘ
-
-ඝෙ
-
-ඝො
-
-ඝෝ
-
-ඞ
-
-ඞ්
-
-ඞ්කා
-
-ඞ්ගේ
-
-ඞ්නි
-
-ඞ්බො
-
-ඞ්රි
-
-ඞ්ලි
-
-ඞ්වි
-
-	ඞ්ස
-
-ඞ්ස්
-
-ඞා
-
-ඞි
-
-ඞී
-
-ඞු
-
-ඟ
-
-ඟ්
-
-ඟා
-
-ඟැ
-
-ඟි
-
-ඟී
-
-ඟු
-
-ඟූ
-
-ඟෙ
-
-ඟේ
-
-ච
-
-චං
-
-චඃ
-
-ච්
-
-ච්ගේ
-
-	ච්ච
-
-ච්චං
-
-ච්ච්
-
-ච්චා
-
-ච්චි
-
-ච්චී
-
-ච්චු
-
-ච්චෙ
-
-ච්චේ
-
-ච්චො
-
-	ච්ඡ
-
-ච්ඡං
-
-ච්ඡා
-
-ච්ඡි
-
-ච්ඡිං
-
-ච්ඡු
-
-ච්ඡුා
-
-ච්ඡෙ
-
-ච්ඡේ
-
-	ච්ජ
-
-ච්ජා
-
-ච්ජි
-
-ච්ජෙ
-
-ච්ජේ
-
-ච්ඤා
-
-ච්ඥා
-
-	ච්ට
-
-ච්ට්
-
-ච්ටි
-
-ච්ත්ත
-
-ච්ත්‍ර
-
-ච්නි
-
-	ච්ම
-
-	ච්ව
-
-ච්හි
-
-	ච්ෙ
-
-ච්‍ය
-
-ච්‍යා
-
-ච්‍යු
-
-චා
-
-	චාං
-
-චැ
-
-චෑ
-
-චි
-
-	චිං
-
-	චිි
-
-චී
-
-චු
-
-චූ
-
-චෙ
-
-	චෙෙ
-
-චේ
-
-චෛ
-
-චො
-
-චෝ
-
-චෞ
-
-ඡ
-
-ඡ්ඡා
-
-	ඡ්ද
-
-ඡ්මා
-
-ඡ්‍ය
-
-ඡා
-
-ඡි
-
-ඡී
-
-ඡු
-
-ඡෙ
-
-ඡේ
-
-ඡෛ
-
-ජ
-
-ජං
-
-ජඃ
-
-ජ්
-
-ජ්ගේ
-
-	ජ්ජ
-
-ජ්ජං
-
-ජ්ජා
-
-ජ්ජි
-
-ජ්ජී
-
-ජ්ජු
-
-ජ්ජෙ
-
-ජ්ජේ
-
-ජ්ජො
-
-	ජ්ඣ
-
-ජ්ඣං
-
-ජ්ඣා
-
-ජ්ඣි
-
-ජ්ඣෙ
-
-ජ්ඣො
-
-	ජ්ට
-
-	ජ්න
-
-ජ්පු
-
-ජ්බැ
-
-	ජ්ම
-
-ජ්මා
-
-	ජ්ය
-
-ජ්ය්
-
-ජ්ය්ය
-
-ජ්යා
-
-ජ්යි
-
-ජ්යී
-
-ජ්යු
-
-ජ්යෙ
-
-ජ්යේ
-
-ජ්යෝ
-
-	ජ්ර
-
-ජ්ර්
-
-ජ්රා
-
-ජ්රි
-
-	ජ්ව
-
-ජ්වා
-
-ජ්හී
-
-ජ්්‍ය
-
-ජ්‍ය
-
-ජ්‍යං
-
-ජ්‍ය්‍ය
-
-ජ්‍යා
-
-ජ්‍යෙ
-
-ජ්‍යේ
-
-ජ්‍යො
-
-ජ්‍යෝ
-
-ජ්‍ර
-
-ජ්‍රා 
-
-ජා 
-
-	ජාං 
-
-	ජාඃ 
-
-ජැ 
-
-ජෑ 
-
-ජි 
-
-	ජිං 
-
-ජී 
-
-ජු 
-
-ජූ 
-
-ජෘ 
-
-ජෙ 
-
-ජේ 
-
-ජෛ 
-
-ජො 
-
-ජෝ 
-
-ජෞ 
-
-ඣ 
-
-ඣා 
-
-ඤ 
-
-ඤ් 
-
-	ඤ්ච 
-
-ඤ්චා 
-
-ඤ්චි 
-
-ඤ්චෙ 
-
-	ඤ්ඡ 
-
-ඤ්ඡි 
-
-	ඤ්ජ 
-
-ඤ්ජා 
-
-ඤ්ජි 
-
-ඤ්ජු 
-
-	ඤ්ඤ 
-
-ඤ්ඤං 
-
-ඤ්ඤා 
-
-ඤ්ඤාා 
-
-ඤ්ඤැ 
-
-ඤ්ඤෑ 
-
-ඤ්ඤි 
-
-ඤ්ඤු 
-
-ඤ්ඤෙ 
-
-ඤ්ඤො 
-
-ඤ්ඤො 
-
-ඤ්ඤෝ 
-
-	ඤ්ඥ 
-
-ඤ්ඥං 
-
-ඤ්ඥා 
-
-	ඤ්ව 
-
-ඤ්වා 
-
-ඤා 
-
-ඤෙ 
-
-ඤේ 
-
-ඤො 
-
-ඤෝ 
-
-ඥ 
-
-ඥඃ 
-
-	ඥ්ඤ 
-
-	ඥ්ඥ 
-
-ඥ්ඥා 
-
-ඥා 
-
-	ඥාඃ 
-
-	ඥාා 
-
-ඥි 
-
-ඥෙ 
-
-ඦ 
-
-ට 
-
-ටං 
-
-ටඃ 
-
-ට් 
-
-	ට්ක 
-
-ට්කා 
-
-ට්කි 
-
-ට්කො 
-
-ට්ගේ 
-
-ට්චි 
-
-	ට්ට 
-
-ට්ට්‍ර 
-
-ට්ට්‍රි 
-
-ට්ට්‍රො 
-
-ට්ට්‍රෝ 
-
-ට්ටා 
-
-ට්ටි 
-
-ට්ටු 
-
-ට්ටෙ 
-
-ට්ටේ 
-
-ට්ටො 
-
-ට්ටෝ 
-
-	ට්ඨ 
-
-ට්ඨං 
-
-ට්ඨා 
-
-ට්ඨි 
-
-ට්ඨිං 
-
-ට්ඨී 
-
-ට්ඨෙ 
-
-ට්ඨො 
-
-ට්ඨො 
-
-ට්ඨෝ 
-
-ට්තු 
-
-	ට්න 
-
-ට්න් 
-
-ට්නා 
-
-ට්නි 
-
-ට්නෙ 
-
-	ට්ප 
-
-ට්බි 
-
-ට්බෝ 
-
-	ට්ම 
-
-ට්මි 
-
-ට්මු 
-
-ට්මේ 
-
-	ට්ය 
-
-ට්යා 
-
-ට්යි 
-
-	ට්ර 
-
-ට්රා 
-
-ට්රි 
-
-ට්රු 
-
-ට්රූ 
-
-ට්රේ 
-
-ට්රො 
-
-ට්රෝ 
-
-ට්රෝි 
-
-	ට්ල 
-
-ට්ල් 
-
-ට්ලැ 
-
-ට්ලි 
-
-ට්ලී 
-
-	ට්ව 
-
-ට්ව්!
-
-ට්වා!
-
-ට්වි!
-
-ට්වී!
-
-ට්වෙ!
-
-ට්වේ!
-
-	ට්ස!
-
-ට්ස්!
-
-ට්ස්කි!
-
-ට්ස්ගේ!
-
-ට්ස්බ!
-
-ට්ස්ව!
-
-ට්ස්වා!
-
-ට්ස්හි!
-
-ට්සි!
-
-ට්සු!
-
-ට්සෙ!
-
-	ට්හ!
-
-ට්හි!
-
-ට්හු!
-
-ට්ෆ්‍ර!
-
-ට්ෆි!
-
-ට්ෆී!
-
-ට්ෆෝ!
-
-	ට්‌!
-
-ට්‍ට!
-
-ට්‍ටු!
-
-ට්‍ය!
-
-ට්‍යා!
-
-ට්‍යෙ!
-
-ට්‍ර!
-
-ට්‍රා!
-
-ට්‍රැ!
-
-ට්‍රෑ!
-
-ට්‍රි!
-
-ට්‍රී!
-
-ට්‍රෙ!
-
-ට්‍රේ!
-
-ට්‍රො!
-
-ට්‍රෝ!
-
-ටා!
-
-	ටාං!
-
-ටැ!
-
-	ටැං!
-
-ටෑ!
-
-	ටෑං!
-
-ටි!
-
-	ටිං!
-
-ටී!
-
-ටු!
-
-ටූ!
-
-ටෘ!
-
-ටෙ!
-
-	ටෙි!
-
-ටේ!
-
-ටො!
-
-	ටොං!
-
-ටෝ!
-
-ටෲ!
-
-ඨ!
-
-ඨං!
-
-ඨා!
-
-	ඨාං!
-
-ඨි!
-
-ඨී!
-
-ඨු!
-
-ඨූ!
-
-ඨෙ!
-
-ඨො!
-
-ඨෝ!
-
-ඩ!
-
-ඩං!
-
-ඩ්!
-
-	ඩ්ක!
-
-ඩ්ක්ලි!
-
-ඩ්කා!
-
-ඩ්කි!
-
-ඩ්ගා!
-
-ඩ්ගේ!
-
-ඩ්ජ්!
-
-	ඩ්ට!
-
-ඩ්ට්!
-
-ඩ්ට්‍රී!
-
-	ඩ්ඩ!
-
-ඩ්ඩා!
-
-ඩ්ඩි!
-
-ඩ්ඩො!
-
-	ඩ්ඪ!
-
-ඩ්ඪි!
-
-ඩ්ඪෙ!
-
-	ඩ්න!
-
-ඩ්න්!
-
-ඩ්නා!
-
-ඩ්නි!
-
-	ඩ්ප!
-
-	ඩ්බ!
-
-ඩ්බ්!
-
-ඩ්බෝ!
-
-	ඩ්ම!
-
-ඩ්ම්ස්!
-
-ඩ්මි!
-
-	ඩ්ය!
-
-	ඩ්ර!
-
-ඩ්රා!
-
-ඩ්රැ!
-
-ඩ්රි!
-
-ඩ්රී!
-
-ඩ්රේ!
-
-ඩ්රෝ!
-
-	ඩ්ල!
-
-ඩ්ල්!
-
-ඩ්ල්වෙ!
-
-ඩ්ල්සෙ!
-
-ඩ්ලි!
-
-ඩ්ලේ!
-
-	ඩ්ව!
-
-ඩ්වා!
-
-ඩ්වි!
-
-ඩ්වෙ!
-
-ඩ්වේ!
-
-ඩ්ෂී!
-
-	ඩ්ස!
-
-ඩ්ස්!
-
-ඩ්ස්ට!
-
-ඩ්ස්ම!
-
-ඩ්ස්හි!
-
-ඩ්සි!
-
-ඩ්හැ!
-
-ඩ්හි"
-
-ඩ්හී"
-
-ඩ්ෆ්ල"
-
-ඩ්ෆෝ"
-
-ඩ්‍ය"
-
-ඩ්‍යු"
-
-ඩ්‍ර"
-
-ඩ්‍රා"
-
-ඩ්‍රැ"
-
-ඩ්‍රි"
-
-ඩ්‍රී"
-
-ඩ්‍රෙ"
-
-ඩ්‍රේ"
-
-ඩ්‍රො"
-
-ඩ්‍රෝ"
-
-ඩා"
-
-	ඩාං"
-
-ඩැ"
-
-ඩෑ"
-
-ඩි"
-
-	ඩිං"
-
-ඩී"
-
-ඩු"
-
-ඩූ"
-
-ඩෘ"
-
-ඩෙ"
-
-	ඩෙං"
-
-ඩේ"
-
-ඩො"
-
-	ඩොං"
-
-ඩෝ"
-
-ඩෲ"
-
-ඪ"
-
-ඪ්‍ය"
-
-ඪා"
-
-	ඪාං"
-
-ඪි"
-
-ණ"
-
-ණං"
-
-ණඃ"
-
-ණ්"
-
-ණ්ඞා"
-
-	ණ්ට"
-
-ණ්ටා"
-
-	ණ්ඨ"
-
-ණ්ඨා"
-
-ණ්ඨි"
-
-	ණ්ඩ"
-
-ණ්ඩං"
-
-ණ්ඩ්ය"
-
-ණ්ඩ්‍ය"
-
-ණ්ඩා"
-
-ණ්ඩාං"
-
-ණ්ඩි"
-
-ණ්ඩී"
-
-ණ්ඩු"
-
-ණ්ඩෙ"
-
-ණ්ඩේ"
-
-ණ්ඩො"
-
-	ණ්ණ"
-
-ණ්ණං"
-
-ණ්ණා"
-
-ණ්ණි"
-
-ණ්ණෙ"
-
-ණ්ණො"
-
-	ණ්ඬ"
-
-	ණ්ත"
-
-ණ්ත්ර"
-
-ණ්ත්‍ර"
-
-	ණ්න"
-
-ණ්නි"
-
-	ණ්ය"
-
-	ණ්ව"
-
-ණ්වී"
-
-	ණ්හ"
-
-ණ්හං"
-
-ණ්හා"
-
-ණ්හි"
-
-ණ්හී"
-
-ණ්හු"
-
-ණ්හො"
-
-	ණ්‌"
-
-ණ්‍ඩ"
-
-ණ්‍ය"
-
-ණ්‍යා"
-
-ණා"
-
-	ණාං"
-
-ණැ"
-
-ණෑ"
-
-ණි"
-
-	ණිං"
-
-	ණිඃ"
-
-ණී"
-
-ණු"
-
-ණූ"
-
-ණෙ"
-
-	ණො"
-
-ණේ"
-
-	ණෛඃ"
-
-ණො"
-
-ණෝ"
-
-ඬ"
-
-ඬ්‍ය"
-
-ඬා"
-
-ඬැ"
-
-ඬි"
-
-ඬී"
-
-ඬු"
-
-ඬෙ"
-
-ඬේ"
-
-ත"
-
-තං"
-
-තඃ"
-
-ත්"
-
-	ත්අ"
-
-	ත්ඇ"
-
-	ත්ක"
-
-ත්ක්‍ර"
-
-ත්කා"
-
-ත්කැ"
-
-ත්කි"
-
-ත්කු"
-
-ත්කෘ"
-
-ත්කෙ"
-
-ත්කේ"
-
-ත්කො"
-
-ත්කෝ"
-
-	ත්ඛ"
-
-	ත්ග#
-
-ත්ගා#
-
-ත්ගු#
-
-ත්ගෙ#
-
-ත්ගේ#
-
-ත්ගො#
-
-	ත්ච#
-
-ත්චු#
-
-	ත්ජ#
-
-ත්ජා#
-
-	ත්ඥ#
-
-	ත්ට#
-
-	ත්ත#
-
-ත්තං#
-
-ත්තඃ#
-
-ත්ත්ප#
-
-ත්ත්ව#
-
-ත්ත්වා#
-
-ත්ත්‍ය#
-
-ත්ත්‍ර#
-
-ත්ත්‍රා#
-
-ත්ත්‍රි#
-
-ත්ත්‍රො#
-
-ත්ත්‍ව#
-
-ත්තා#
-
-ත්තැ#
-
-ත්තෑ#
-
-ත්ති#
-
-ත්තිං#
-
-ත්තී#
-
-ත්තු#
-
-ත්තුං#
-
-ත්තූ#
-
-ත්තෙ#
-
-ත්තේ#
-
-ත්තේය#
-
-ත්තො#
-
-ත්තේ#
-
-ත්තො#
-
-ත්තෝ#
-
-	ත්ථ#
-
-ත්ථං#
-
-ත්ථ්‍යා#
-
-ත්ථා#
-
-ත්ථි#
-
-ත්ථී#
-
-ත්ථු#
-
-ත්ථුං#
-
-ත්ථූ#
-
-ත්ථෙ#
-
-ත්ථො#
-
-	ත්ද#
-
-ත්ද්‍ර#
-
-ත්දා#
-
-ත්දැ#
-
-ත්දි#
-
-ත්දු#
-
-ත්දෙ#
-
-ත්ධා#
-
-	ත්න#
-
-ත්නා#
-
-ත්නැ#
-
-ත්නි#
-
-ත්නු#
-
-ත්නෙ#
-
-ත්නේ#
-
-ත්නො#
-
-	ත්ප#
-
-ත්ප්ලා#
-
-ත්ප්‍ර#
-
-ත්ප්‍රා#
-
-ත්ප්‍රේ#
-
-ත්පා#
-
-ත්පැ#
-
-ත්පි#
-
-ත්පු#
-
-ත්පේ#
-
-ත්පො#
-
-	ත්ඵ#
-
-	ත්බ#
-
-ත්බා#
-
-ත්බැ#
-
-ත්බි#
-
-ත්බු#
-
-ත්බෝ#
-
-	ත්භ#
-
-ත්භා#
-
-ත්භූ#
-
-	ත්ම#
-
-ත්මා#
-
-ත්මැ#
-
-ත්මි#
-
-ත්මී#
-
-ත්මු#
-
-ත්මෙ#
-
-ත්මේ#
-
-ත්මො#
-
-	ත්ය#
-
-ත්ය්#
-
-ත්යා#
-
-ත්යාං#
-
-ත්යාි#
-
-ත්යි#
-
-ත්යු#
-
-ත්යෙ#
-
-ත්යේ#
-
-ත්යො#
-
-	ත්ර#
-
-ත්රං#
-
-ත්ර්#
-
-ත්ර්ක#
-
-ත්ර්ස්ත#
-
-ත්රා#
-
-ත්රැ#
-
-ත්රි#
-
-ත්රී#
-
-ත්රු#
-
-ත්රේ#
-
-ත්රෝ#
-
-	ත්ල#
-
-ත්ලා#
-
-ත්ලි#
-
-ත්ලෙ#
-
-ත්ලේ#
-
-	ත්ව#
-
-ත්වං#
-
-ත්ව්ය#
-
-ත්වා#
-
-ත්වැ$
-
-ත්වි$
-
-ත්වී$
-
-ත්වු$
-
-ත්වූ$
-
-ත්වෙ$
-
-ත්වේ$
-
-ත්වො$
-
-ත්වෝ$
-
-ත්ෂා$
-
-	ත්ස$
-
-ත්ස්$
-
-ත්ස්ච$
-
-ත්ස්ය$
-
-ත්ස්වේ$
-
-ත්ස්‍ය$
-
-ත්ස්‍යා$
-
-ත්සා$
-
-ත්සි$
-
-ත්සිං$
-
-ත්සු$
-
-ත්සෙ$
-
-ත්සේ$
-
-ත්සෝ$
-
-	ත්හ$
-
-ත්හැ$
-
-ත්හි$
-
-ත්හී$
-
-ත්හු$
-
-ත්හූ$
-
-ත්හො$
-
-	ත්ෙ$
-
-	ත්‌$
-
-ත්‍ත$
-
-ත්‍ත්‍ර$
-
-ත්‍ථ$
-
-ත්‍ම$
-
-ත්‍ය$
-
-ත්‍යං$
-
-ත්‍ය්‍ය$
-
-ත්‍යා$
-
-ත්‍යාං$
-
-ත්‍යි$
-
-ත්‍යී$
-
-ත්‍යු$
-
-ත්‍යෙ$
-
-ත්‍යෞ$
-
-ත්‍ර$
-
-ත්‍රං$
-
-ත්‍රඃ$
-
-ත්‍ර්‍ය$
-
-ත්‍ර්‍යා$
-
-ත්‍රා$
-
-ත්‍රාං$
-
-ත්‍රාඃ$
-
-ත්‍රැ$
-
-ත්‍රි$
-
-ත්‍රිං$
-
-ත්‍රී$
-
-ත්‍රෙ$
-
-ත්‍රෙෙ$
-
-ත්‍රේ$
-
-ත්‍රෛ$
-
-ත්‍රො$
-
-ත්‍රෝ$
-
-ත්‍රෞ$
-
-ත්‍ව$
-
-ත්‍වා$
-
-තා$
-
-	තාං$
-
-	තාඃ$
-
-තැ$
-
-තෑ$
-
-ති$
-
-	තිං$
-
-	තිඃ$
-
-	තිි$
-
-	තිෙ$
-
-තී$
-
-තු$
-
-	තුං$
-
-	තුඃ$
-
-තූ$
-
-තෘ$
-
-තෙ$
-
-	තො$
-
-තේ$
-
-තෛ$
-
-	තෛඃ$
-
-තො$
-
-තෝ$
-
-තෞ$
-
-තෟ$
-
-තෲ$
-
-ත‌$
-
-ථ$
-
-ථං$
-
-ථඃ$
-
-ථ්‍ය$
-
-ථ්‍යා$
-
-ථා$
-
-	ථාං$
-
-ථි$
-
-	ථිං$
-
-ථී$
-
-ථු$
-
-ථූ$
-
-ථෙ$
-
-	ථො$
-
-ථේ$
-
-ථෛ$
-
-ථො$
-
-ථෝ$
-
-ථෞ$
-
-ද$
-
-දං$
-
-දඃ$
-
-ද්$
-
-	ද්ක$
-
-	ද්ග$
-
-ද්ග්‍ර$
-
-ද්ගී$
-
-ද්ගු$
-
-ද්ගේ$
-
-ද්ඝෝ$
-
-ද්තු$
-
-	ද්ද$
-
-ද්දං$
-
-ද්දා%
-
-ද්දැ%
-
-ද්දි%
-
-ද්දී%
-
-ද්දු%
-
-ද්දූ%
-
-ද්දෙ%
-
-ද්දේ%
-
-ද්දො%
-
-ද්දෝ%
-
-	ද්ධ%
-
-ද්ධං%
-
-ද්ධ්‍ය%
-
-ද්ධ්‍යං%
-
-ද්ධ්‍යා%
-
-ද්ධ්‍යාං%
-
-ද්ධා%
-
-ද්ධාං%
-
-ද්ධි%
-
-ද්ධිං%
-
-ද්ධී%
-
-ද්ධු%
-
-ද්ධෘ%
-
-ද්ධෙ%
-
-ද්ධො%
-
-ද්ධෝ%
-
-	ද්භ%
-
-ද්භා%
-
-ද්භි%
-
-ද්භු%
-
-ද්භූ%
-
-	ද්ම%
-
-ද්මා%
-
-ද්මි%
-
-ද්මී%
-
-	ද්ය%
-
-ද්ය්%
-
-ද්යා%
-
-ද්යා්%
-
-ද්යා්ල%
-
-ද්යා්ව%
-
-ද්යා්වේ%
-
-ද්යාා%
-
-ද්යාැ%
-
-ද්යාි%
-
-ද්යාී%
-
-ද්යාු%
-
-ද්යාෙ%
-
-ද්යාේ%
-
-ද්යාෝ%
-
-ද්යි%
-
-ද්යු%
-
-ද්යෝ%
-
-	ද්ර%
-
-ද්රා%
-
-ද්රාි%
-
-ද්රි%
-
-ද්රු%
-
-ද්රෙ%
-
-ද්රෝ%
-
-	ද්ල%
-
-ද්ලි%
-
-	ද්ව%
-
-ද්වං%
-
-ද්ව්‍යා%
-
-ද්වා%
-
-ද්වි%
-
-ද්වී%
-
-ද්වෙ%
-
-ද්වේ%
-
-ද්වෛ%
-
-ද්වො%
-
-	ද්ශ%
-
-ද්ශී%
-
-	ද්හ%
-
-ද්හි%
-
-ද්‍ධ%
-
-ද්‍ය%
-
-ද්‍යා%
-
-ද්‍යු%
-
-ද්‍යූ%
-
-ද්‍යෙ%
-
-ද්‍යො%
-
-ද්‍යෝ%
-
-ද්‍ර%
-
-ද්‍රා%
-
-ද්‍රැ%
-
-ද්‍රි%
-
-ද්‍රී%
-
-ද්‍රෘ%
-
-ද්‍රෙ%
-
-ද්‍රො%
-
-ද්‍රෝ%
-
-දා%
-
-	දාං%
-
-	දාඃ%
-
-	දාා%
-
-	දාි%
-
-දැ%
-
-දෑ%
-
-දි%
-
-	දිං%
-
-	දිි%
-
-දී%
-
-දු%
-
-	දුඃ%
-
-	දුු%
-
-දූ%
-
-දෘ%
-
-දෙ%
-
-	දො%
-
-දේ%
-
-දෛ%
-
-	දෛඃ%
-
-දො%
-
-	දොං%
-
-දෝ%
-
-	දෝං%
-
-දෞ%
-
-දෟ%
-
-ධ%
-
-ධං%
-
-ධඃ%
-
-ධ්%
-
-	ධ්ධ%
-
-	ධ්ප%
-
-	ධ්ය%
-
-ධ්ය්%
-
-ධ්ය්ය&
-
-ධ්ය්ස්ථා&
-
-ධ්යා&
-
-ධ්යාා&
-
-ධ්යාි&
-
-ධ්යාේ&
-
-ධ්යැ&
-
-ධ්යි&
-
-ධ්යී&
-
-ධ්යු&
-
-ධ්යේ&
-
-ධ්රැ&
-
-	ධ්ව&
-
-ධ්වං&
-
-ධ්‍ය&
-
-ධ්‍යා&
-
-ධ්‍යෙ&
-
-ධ්‍ර&
-
-ධ්‍රැ&
-
-ධ්‍ව&
-
-ධා&
-
-	ධාං&
-
-ධි&
-
-	ධිං&
-
-	ධිඃ&
-
-ධී&
-
-ධු&
-
-ධූ&
-
-ධෘ&
-
-ධෙ&
-
-ධේ&
-
-ධෛ&
-
-ධො&
-
-ධෝ&
-
-ධෞ&
-
-න&
-
-නං&
-
-නඃ&
-
-න්&
-
-	න්අ&
-
-	න්ආ&
-
-	න්ඇ&
-
-	න්ඉ&
-
-	න්උ&
-
-	න්එ&
-
-	න්ඒ&
-
-	න්ඔ&
-
-	න්ක&
-
-න්ක්&
-
-න්ක්ගේ&
-
-න්ක්ලි&
-
-න්ක්ලෙ&
-
-න්ක්ව&
-
-න්ක්වි&
-
-න්ක්ස්&
-
-න්ක්ෆ&
-
-න්ක්‍ර&
-
-න්ක්‍රා&
-
-න්ක්‍රි&
-
-න්ක්‍රී&
-
-න්කා&
-
-න්කි&
-
-න්කී&
-
-න්කු&
-
-න්කූ&
-
-න්කෙ&
-
-න්කේ&
-
-න්කො&
-
-න්කෝ&
-
-	න්ග&
-
-න්ග්&
-
-න්ග්ගේ&
-
-න්ග්ට&
-
-න්ග්ඩි&
-
-න්ග්ය&
-
-න්ග්ල&
-
-න්ග්ලි&
-
-න්ග්ලෝ&
-
-න්ග්ස්&
-
-න්ග්ස්ට&
-
-න්ග්ස්ලි&
-
-න්ග්හැ&
-
-න්ග්හි&
-
-න්ග්‍ර&
-
-න්ග්‍රෑ&
-
-න්ග්‍රී&
-
-න්ගා&
-
-න්ගැ&
-
-න්ගි&
-
-න්ගී&
-
-න්ගු&
-
-න්ගූ&
-
-න්ගෙ&
-
-න්ගේ&
-
-න්ගේ&
-
-න්ගො&
-
-න්ගෝ&
-
-	න්ඝ&
-
-න්ඞ්&
-
-	න්ච&
-
-න්ච්&
-
-න්ච්ගේ&
-
-න්ච්මා&
-
-න්චා&
-
-න්චි&
-
-න්චු&
-
-න්චූ&
-
-න්චෙ&
-
-න්චො&
-
-	න්ඡ&
-
-	න්ජ&
-
-න්ජ්&
-
-න්ජ්ගේ&
-
-න්ජා&
-
-න්ජි&
-
-න්ජී&
-
-න්ජු&
-
-න්ජෙ&
-
-න්ජො&
-
-න්ජෝ&
-
-	න්ට&
-
-න්ට්&
-
-න්ට්ගේ&
-
-න්ට්ගෝ&
-
-න්ට්ය&
-
-න්ට්රි&
-
-න්ට්ව&
-
-න්ට්ස්&
-
-න්ට්හි'
-
-න්ට්‍ර'
-
-න්ට්‍රා'
-
-න්ට්‍රි'
-
-න්ට්‍රො'
-
-න්ට්‍රෝ'
-
-න්ටා'
-
-න්ටැ'
-
-න්ටෑ'
-
-න්ටි'
-
-න්ටී'
-
-න්ටු'
-
-න්ටෙ'
-
-න්ටේ'
-
-න්ටො'
-
-න්ටෝ'
-
-	න්ඨ'
-
-	න්ඩ'
-
-න්ඩ්'
-
-න්ඩ්ගේ'
-
-න්ඩ්ට්'
-
-න්ඩ්ර්'
-
-න්ඩ්රා'
-
-න්ඩ්රි'
-
-න්ඩ්රූ'
-
-න්ඩ්ල'
-
-න්ඩ්ලි'
-
-න්ඩ්ස'
-
-න්ඩ්ස්'
-
-න්ඩ්සේ'
-
-න්ඩ්හි'
-
-න්ඩ්‍ය'
-
-න්ඩ්‍ර'
-
-න්ඩ්‍රා'
-
-න්ඩ්‍රෑ'
-
-න්ඩ්‍රි'
-
-න්ඩ්‍රො'
-
-න්ඩ්‍රෝ'
-
-න්ඩා'
-
-න්ඩි'
-
-න්ඩී'
-
-න්ඩු'
-
-න්ඩූ'
-
-න්ඩෘ'
-
-න්ඩෙ'
-
-න්ඩේ'
-
-න්ඩො'
-
-න්ඩෝ'
-
-න්ඩෲ'
-
-න්ණු'
-
-න්ණේ'
-
-න්ඬේ'
-
-	න්ත'
-
-න්තං'
-
-න්තඃ'
-
-න්ත්'
-
-න්ත්ර'
-
-න්ත්ර්ය'
-
-න්ත්රි'
-
-න්ත්රී'
-
-න්ත්රො'
-
-න්ත්වා'
-
-න්ත්‍ය'
-
-න්ත්‍යා'
-
-න්ත්‍ර'
-
-න්ත්‍රා'
-
-න්ත්‍රැ'
-
-න්ත්‍රි'
-
-න්ත්‍රී'
-
-න්ත්‍රො'
-
-න්ත්‍රෝ'
-
-න්තා'
-
-න්තැ'
-
-න්ති'
-
-න්තී'
-
-න්තු'
-
-න්තුං'
-
-න්තූ'
-
-න්තෘ'
-
-න්තෙ'
-
-න්තො'
-
-න්තේ'
-
-න්තො'
-
-න්තෝ'
-
-	න්ථ'
-
-න්ථා'
-
-න්ථි'
-
-න්ථී'
-
-	න්ද'
-
-න්දං'
-
-න්දඃ'
-
-න්ද්'
-
-න්ද්ර'
-
-න්ද්ර්යා'
-
-න්ද්රා'
-
-න්ද්රි'
-
-න්ද්රී'
-
-න්ද්ව'
-
-න්ද්‍ර'
-
-න්ද්‍රඃ'
-
-න්ද්‍රා'
-
-න්ද්‍රි'
-
-න්ද්‍රී'
-
-න්ද්‍රෙ'
-
-න්ද්‍රො'
-
-න්ද්‍රෝ'
-
-න්දා'
-
-න්දැ'
-
-න්දෑ'
-
-න්දි'
-
-න්දී'
-
-න්දු'
-
-න්දූ'
-
-න්දෙ'
-
-න්දේ'
-
-න්දො'
-
-න්දෝ'
-
-	න්ධ'
-
-න්ධං'
-
-න්ධ්‍ය'
-
-න්ධ්‍යා'
-
-න්ධා'
-
-න්ධි'
-
-න්ධී'
-
-න්ධු'
-
-න්ධෙ'
-
-න්ධො'
-
-න්ධෝ'
-
-	න්න(
-
-න්නං(
-
-න්න්(
-
-න්න්න(
-
-න්න්‍ය(
-
-න්නා(
-
-න්නැ(
-
-න්නෑ(
-
-න්නි(
-
-න්නිෙ(
-
-න්නී(
-
-න්නු(
-
-න්නූ(
-
-න්නෙ(
-
-න්නේ(
-
-න්නේය(
-
-න්නේ(
-
-න්නො(
-
-න්නෝ(
-
-	න්ඳ(
-
-න්ඳා(
-
-න්ඳු(
-
-	න්ප(
-
-න්පා(
-
-න්පැ(
-
-න්පි(
-
-න්පු(
-
-න්පූ(
-
-න්පෙ(
-
-න්පො(
-
-න්පෝ(
-
-	න්ඵ(
-
-	න්බ(
-
-න්බා(
-
-න්බැ(
-
-න්බි(
-
-න්බු(
-
-න්බෙ(
-
-න්බො(
-
-න්බෝ(
-
-න්භා(
-
-	න්ම(
-
-න්ම්(
-
-න්මා(
-
-න්මැ(
-
-න්මි(
-
-න්මු(
-
-න්මෙ(
-
-න්මේ(
-
-න්මො(
-
-න්මෝ(
-
-	න්ය(
-
-න්ය්(
-
-න්ය්ය(
-
-න්ය්ෂ්ටි(
-
-න්යා(
-
-න්යැ(
-
-න්යි(
-
-න්යී(
-
-න්යු(
-
-න්යූ(
-
-න්යෙ(
-
-න්යේ(
-
-න්යො(
-
-න්යෝ(
-
-	න්ර(
-
-න්රා(
-
-න්රැ(
-
-න්රි(
-
-න්රු(
-
-න්රෝ(
-
-	න්ල(
-
-න්ලා(
-
-න්ලැ(
-
-න්ලි(
-
-න්ලෙ(
-
-න්ලේ(
-
-න්ලො(
-
-න්ලෝ(
-
-	න්ව(
-
-න්ව්ත(
-
-න්වා(
-
-න්වැ(
-
-න්වි(
-
-න්වී(
-
-න්වු(
-
-න්වූ(
-
-න්වෙ(
-
-න්වේ(
-
-න්වො(
-
-න්වෝ(
-
-	න්ශ(
-
-න්ශි(
-
-න්ශෙ(
-
-	න්ෂ(
-
-න්ෂා(
-
-න්ෂි(
-
-න්ෂු(
-
-න්ෂෙ(
-
-න්ෂෝ(
-
-	න්ස(
-
-න්ස්(
-
-න්ස්ක(
-
-න්ස්කි(
-
-න්ස්ගේ(
-
-න්ස්ට(
-
-න්ස්ටා(
-
-න්ස්ටි(
-
-න්ස්ටෝ(
-
-න්ස්ත(
-
-න්ස්ථා(
-
-න්ස්බ(
-
-න්ස්ම(
-
-න්ස්මී(
-
-න්ස්මෝ(
-
-න්ස්ල(
-
-න්ස්ව(
-
-න්ස්වි(
-
-න්ස්සූ(
-
-න්ස්හි(
-
-න්සා(
-
-න්සැ(
-
-න්සි(
-
-න්සී(
-
-න්සු(
-
-න්සූ(
-
-න්සෙ(
-
-න්සේ(
-
-න්සේ)
-
-න්සො)
-
-න්සෝ)
-
-	න්හ)
-
-න්හා)
-
-න්හැ)
-
-න්හි)
-
-න්හී)
-
-න්හු)
-
-න්හෙ)
-
-න්හො)
-
-න්හෝ)
-
-	න්ෆ)
-
-න්ෆ්ලු)
-
-න්ෆ්‍රැ)
-
-න්ෆ්‍රේ)
-
-න්ෆි)
-
-න්ෆී)
-
-න්ෆු)
-
-න්ෆෙ)
-
-න්ෆො)
-
-න්ෆෝ)
-
-	න්්)
-
-	න්ි)
-
-	න්ෙ)
-
-	න්‌)
-
-න්‍ගේ)
-
-න්‍ට)
-
-න්‍ඩ)
-
-න්‍ත)
-
-න්‍තා)
-
-න්‍ද)
-
-න්‍ද්‍ර)
-
-න්‍ද්‍රි)
-
-න්‍දි)
-
-න්‍දී)
-
-න්‍ධ)
-
-න්‍ධි)
-
-න්‍ය)
-
-න්‍ය්‍ය)
-
-න්‍යා)
-
-න්‍යු)
-
-න්‍යෙ)
-
-න්‍යො)
-
-න්‍යෝ)
-
-න්‍ර)
-
-න්‍රි)
-
-න්‍ව)
-
-නා)
-
-	නාං)
-
-	නාඃ)
-
-	නාා)
-
-	නාෙ)
-
-නැ)
-
-	නැං)
-
-	නැෙ)
-
-නෑ)
-
-නි)
-
-	නිං)
-
-	නිඃ)
-
-	නිෙ)
-
-නී)
-
-	නීි)
-
-නු)
-
-	නුඃ)
-
-	නුු)
-
-නූ)
-
-නෘ)
-
-නෙ)
-
-	නො)
-
-නේ)
-
-නෛ)
-
-නො)
-
-නෝ)
-
-නෞ)
-
-න‌)
-
-ඳ)
-
-	ඳ්ග)
-
-	ඳ්ධ)
-
-ඳ්‍ර)
-
-ඳා)
-
-ඳැ)
-
-ඳෑ)
-
-ඳි)
-
-ඳී)
-
-ඳු)
-
-ඳූ)
-
-ඳෙ)
-
-ඳේ)
-
-ඳෝ)
-
-ප)
-
-පං)
-
-පඃ)
-
-ප්)
-
-	ප්ක)
-
-ප්කි)
-
-ප්කේ)
-
-ප්කෝ)
-
-ප්ගේ)
-
-	ප්ච)
-
-ප්චු)
-
-ප්චූ)
-
-	ප්ට)
-
-ප්ට්)
-
-ප්ට්ව)
-
-ප්ට්‍රා)
-
-ප්ටා)
-
-ප්ටි)
-
-ප්ටෙ)
-
-ප්ටො)
-
-ප්ටෝ)
-
-	ප්ත)
-
-ප්තා)
-
-ප්තැ)
-
-ප්ති)
-
-ප්තී)
-
-ප්තු)
-
-ප්තූ)
-
-ප්තෙ)
-
-ප්තෝ)
-
-ප්ථා)
-
-	ප්ද)
-
-	ප්න)
-
-ප්නා)
-
-ප්නි)
-
-	ප්ප)
-
-ප්පං)
-
-ප්ප්‍ර)
-
-ප්පා*
-
-ප්පැ*
-
-ප්පි*
-
-ප්පී*
-
-ප්පු*
-
-ප්පූ*
-
-ප්පෙ*
-
-ප්පේ*
-
-ප්පො*
-
-ප්පෝ*
-
-	ප්ඵ*
-
-ප්ඵා*
-
-ප්ඵු*
-
-	ප්බ*
-
-	ප්ම*
-
-ප්මි*
-
-	ප්ය*
-
-ප්යා*
-
-ප්යූ*
-
-	ප්ර*
-
-ප්රං*
-
-ප්ර්*
-
-ප්ර්කා*
-
-ප්ර්ච*
-
-ප්ර්ති*
-
-ප්ර්ථ*
-
-ප්ර්දේ*
-
-ප්ර්ධා*
-
-ප්ර්මා*
-
-ප්ර්හා*
-
-ප්රා*
-
-ප්රාා*
-
-ප්රාි*
-
-ප්රැ*
-
-ප්රි*
-
-ප්රී*
-
-ප්රු*
-
-ප්රූ*
-
-ප්රෙ*
-
-ප්රේ*
-
-ප්රො*
-
-ප්රෝ*
-
-	ප්ල*
-
-ප්ලා*
-
-ප්ලැ*
-
-ප්ලෑ*
-
-ප්ලි*
-
-ප්ලී*
-
-ප්ලු*
-
-ප්ලූ*
-
-ප්ලෙ*
-
-ප්ලේ*
-
-ප්ලො*
-
-ප්ලෝ*
-
-	ප්ව*
-
-ප්වා*
-
-ප්වී*
-
-	ප්ෂ*
-
-	ප්ස*
-
-ප්ස්*
-
-ප්සා*
-
-ප්සි*
-
-ප්සී*
-
-ප්සු*
-
-ප්සූ*
-
-ප්සේ*
-
-ප්සො*
-
-	ප්හ*
-
-ප්්‍ර*
-
-	ප්ා*
-
-	ප්ි*
-
-ප්‍ය*
-
-ප්‍යා*
-
-ප්‍යු*
-
-ප්‍යෙ*
-
-ප්‍ර*
-
-ප්‍රං*
-
-ප්‍රා*
-
-ප්‍රාෙ*
-
-ප්‍රැ*
-
-ප්‍රෑ*
-
-ප්‍රි*
-
-ප්‍රී*
-
-ප්‍රෘ*
-
-ප්‍රෙ*
-
-ප්‍රෙෙ*
-
-ප්‍රේ*
-
-ප්‍රො*
-
-ප්‍රෝ*
-
-ප්‍රෞ*
-
-ප්‍ර‌*
-
-පා*
-
-	පාං*
-
-	පාඃ*
-
-පැ*
-
-පෑ*
-
-පි*
-
-	පිං*
-
-	පිි*
-
-පී*
-
-පු*
-
-	පුං*
-
-පූ*
-
-පෘ*
-
-පෙ*
-
-	පෙ‌*
-
-පේ*
-
-පෛ*
-
-පො*
-
-	පොං*
-
-පෝ*
-
-පෞ*
-
-පෟ*
-
-පෲ*
-
-ප‌*
-
-ඵ*
-
-ඵං*
-
-ඵ්*
-
-	ඵ්ක*
-
-ඵ්කා*
-
-	ඵ්ජ*
-
-	ඵ්ම*
-
-ඵ්වා*
-
-ඵා*
-
-ඵි*
-
-ඵු*
-
-ඵෙ*
-
-ඵෛ*
-
-ඵො+
-
-බ+
-
-බං+
-
-බ්+
-
-	බ්අ+
-
-	බ්ග+
-
-බ්ගැ+
-
-බ්ගෙ+
-
-බ්ගේ+
-
-	බ්ජ+
-
-බ්ජෙ+
-
-	බ්ට+
-
-බ්ටි+
-
-	බ්ද+
-
-බ්දා+
-
-බ්දි+
-
-බ්දු+
-
-	බ්ධ+
-
-බ්ධි+
-
-	බ්න+
-
-බ්න්+
-
-බ්නි+
-
-බ්නී+
-
-බ්නු+
-
-	බ්බ+
-
-බ්බං+
-
-බ්බා+
-
-බ්බැ+
-
-බ්බෑ+
-
-බ්බි+
-
-බ්බු+
-
-බ්බෙ+
-
-බ්බේ+
-
-බ්බො+
-
-	බ්භ+
-
-බ්භා+
-
-බ්භු+
-
-	බ්ම+
-
-බ්මැ+
-
-	බ්ය+
-
-බ්යි+
-
-	බ්ර+
-
-බ්රා+
-
-බ්රැ+
-
-බ්රි+
-
-බ්රි්තා+
-
-බ්රී+
-
-බ්රු+
-
-බ්රූ+
-
-බ්රේ+
-
-බ්රො+
-
-බ්රෝ+
-
-	බ්ල+
-
-බ්ල්+
-
-බ්ලා+
-
-බ්ලැ+
-
-බ්ලි+
-
-බ්ලී+
-
-බ්ලු+
-
-බ්ලූ+
-
-බ්ලෙ+
-
-බ්ලේ+
-
-බ්ලො+
-
-බ්ලෝ+
-
-	බ්ව+
-
-බ්වි+
-
-බ්වී+
-
-බ්වේ+
-
-	බ්ස+
-
-බ්ස්+
- 
-බ්ස්ක්‍යු+
-
-බ්ස්ගේ+
-
-බ්ස්ට+
-
-බ්ස්බ+
-
-බ්සා+
-
-බ්සි+
-
-	බ්හ+
-
-බ්හි+
-
-බ්‍ය+
-
-බ්‍යං+
-
-බ්‍යා+
-
-බ්‍යු+
-
-බ්‍ර+
-
-බ්‍රා+
-
-බ්‍රැ+
-
-බ්‍රෑ+
-
-බ්‍රි+
-
-බ්‍රී+
-
-බ්‍රෘ+
-
-බ්‍රෙ+
-
-බ්‍රේ+
-
-බ්‍රො+
-
-බ්‍රෝ+
-
-බා+
-
-	බාෙ+
-
-බැ+
-
-	බැං+
-
-බෑ+
-
-බි+
-
-	බිං+
-
-බි්‍ර+
-
-බී+
-
-බු+
-
-බූ+
-
-බෘ+
-
-බෙ+
-
-	බෙං+
-
-	බෙි+
-
-බේ+
-
-බො+
-
-	බොං+
-
-	බො‌+
-
-බෝ+
-
-	බෝං+
-
-බෞ+
-
-බෟ+
-
-බෲ+
-
-භ+
-
-භං+
-
-භඃ+
-
-	භ්ද+
-
-භ්භ්‍යා+
-
-	භ්ය+
-
-භ්යා+
-
-	භ්ර+
-
-	භ්ා+
-
-භ්‍ය+
-
-භ්‍යා+
-
-භ්‍යු,
-
-භ්‍ර,
-
-භ්‍රා,
-
-භ්‍රෑ,
-
-භා,
-
-	භාං,
-
-	භාඃ,
-
-භැ,
-
-භි,
-
-	භිං,
-
-	භිඃ,
-
-භී,
-
-භු,
-
-	භුං,
-
-භූ,
-
-භෘ,
-
-	භෘං,
-
-භෙ,
-
-භේ,
-
-භෛ,
-
-භො,
-
-භෝ,
-
-භෞ,
-
-භෟ,
-
-ම,
-
-මං,
-
-මඃ,
-
-ම්,
-
-	ම්ං,
-
-	ම්අ,
-
-	ම්ඊ,
-
-	ම්එ,
-
-	ම්ක,
-
-ම්කා,
-
-ම්කි,
-
-ම්කෙ,
-
-ම්කො,
-
-	ම්ග,
-
-ම්ගැ,
-
-ම්ගෙ,
-
-ම්ගේ,
-
-ම්ගො,
-
-	ම්ච,
-
-ම්චා,
-
-	ම්ජ,
-
-	ම්ට,
-
-ම්ට්,
-
-ම්ට්රෝ,
-
-ම්ට්‍රෝ,
-
-ම්ටා,
-
-	ම්ඩ,
-
-ම්ඩා,
-
-ම්ඩෝ,
-
-	ම්ණ,
-
-ම්ණි,
-
-	ම්ත,
-
-ම්ත්ත,
-
-ම්තා,
-
-ම්තැ,
-
-ම්ති,
-
-ම්තු,
-
-ම්තො,
-
-	ම්ද,
-
-ම්දා,
-
-ම්දැ,
-
-ම්දි,
-
-ම්දී,
-
-ම්දු,
-
-ම්දෙ,
-
-ම්දො,
-
-	ම්න,
-
-ම්න්,
-
-ම්න්තු,
-
-ම්නා,
-
-ම්නැ,
-
-ම්නි,
-
-ම්නෙ,
-
-ම්නො,
-
-	ම්ප,
-
-ම්ප්,
-
-ම්ප්ට,
-
-ම්ප්ර,
-
-ම්ප්රා,
-
-ම්ප්රේ,
-
-ම්ප්ලි,
-
-ම්ප්ලෙ,
-
-ම්ප්ලේ,
-
-ම්ප්ෂ,
-
-ම්ප්ස,
-
-ම්ප්‍ර,
-
-ම්ප්‍රා,
-
-ම්ප්‍රි,
-
-ම්ප්‍රේ,
-
-ම්පා,
-
-ම්පැ,
-
-ම්පි,
-
-ම්පී,
-
-ම්පු,
-
-ම්පූ,
-
-ම්පෙ,
-
-ම්පේ,
-
-ම්පො,
-
-ම්පෝ,
-
-	ම්ඵ,
-
-	ම්බ,
-
-ම්බ්,
-
-ම්බ්ලි,
-
-ම්බ්ලේ,
-
-ම්බ්ස්,
-
-ම්බ්‍ර,
-
-ම්බ්‍රි,
-
-ම්බ්‍රො,
-
-ම්බ්‍රෝ,
-
-ම්බා,
-
-ම්බැ,
-
-ම්බි,
-
-ම්බී,
-
-ම්බු,
-
-ම්බූ,
-
-ම්බෙ,
-
-ම්බේ,
-
-ම්බො,
-
-ම්බෝ,
-
-	ම්භ,
-
-ම්භ්,
-
-ම්භා,
-
-ම්භි,
-
-ම්භී,
-
-ම්භු-
-
-ම්භූ-
-
-ම්භෝ-
-
-	ම්ම-
-
-ම්මං-
-
-ම්ම්-
-
-ම්ම්ත-
-
-ම්මා-
-
-ම්මැ-
-
-ම්මි-
-
-ම්මී-
-
-ම්මු-
-
-ම්මූ-
-
-ම්මෙ-
-
-ම්මේ-
-
-ම්මො-
-
-ම්මෝ-
-
-	ම්ය-
-
-ම්යා-
-
-ම්යි-
-
-ම්යු-
-
-ම්යෙ-
-
-	ම්ර-
-
-ම්රා-
-
-ම්රි-
-
-ම්රු-
-
-ම්රො-
-
-	ම්ල-
-
-ම්ලා-
-
-ම්ලි-
-
-ම්ලී-
-
-ම්ලු-
-
-ම්ලෙ-
-
-ම්ලේ-
-
-ම්ලො-
-
-	ම්ව-
-
-ම්වා-
-
-ම්වැ-
-
-ම්වි-
-
-ම්වී-
-
-ම්වු-
-
-ම්වූ-
-
-ම්වෙ-
-
-ම්වේ-
-
-	ම්ෂ-
-
-	ම්ස-
-
-ම්ස්-
-
-ම්ස්ගේ-
-
-ම්ස්චි-
-
-ම්ස්ට-
- 
-ම්ස්ට්‍රෝ-
-#
-ම්ස්ට්‍රෝං-
-
-ම්ස්බ-
-
-ම්සා-
-
-ම්සැ-
-
-ම්සි-
-
-ම්සු-
-
-ම්සේ-
-
-ම්සො-
-
-ම්සෝ-
-
-ම්සෞ-
-
-	ම්හ-
-
-ම්හං-
-
-ම්හා-
-
-ම්හි-
-
-ම්හී-
-
-ම්හු-
-
-ම්හෙ-
-
-ම්හො-
-
-ම්ෆී-
-
-	ම්ි-
-
-	ම්ෙ-
-
-	ම්‌-
-
-ම්‍ක-
-
-ම්‍ප-
-
-ම්‍ප්‍ර-
-
-ම්‍පි-
-
-ම්‍බ-
-
-ම්‍භ-
-
-ම්‍ය-
-
-ම්‍යා-
-
-ම්‍යාං-
-
-ම්‍ර-
-
-ම්‍රි-
-
-ම්‍ව-
-
-ම්‍වා-
-
-ම්‍වැ-
-
-ම්‍ස-
-
-ම්‍හා-
-
-මා-
-
-	මාං-
-
-	මාඃ-
-
-මැ-
-
-	මැං-
-
-මෑ-
-
-මි-
-
-	මිං-
-
-	මිි-
-
-මී-
-
-මු-
-
-	මුං-
-
-මූ-
-
-මෘ-
-
-මෙ-
-
-	මේ-
-
-මෝ-
-
-	මෙි-
-
-මේ-
-
-මෛ-
-
-මො-
-
-	මොං-
-
-මෝ-
-
-මෞ-
-
-මෟ-
-
-ම‌-
-
-ඹ-
-
-ඹ්-
-
-ඹ්නෑ-
-
-ඹ්ලි-
-
-ඹා-
-
-ඹැ-
-
-ඹෑ-
-
-ඹි-
-
-ඹී-
-
-ඹු-
-
-ඹූ-
-
-ඹෙ-
-
-ඹේ-
-
-ඹෟ.
-
-ය.
-
-යං.
-
-යඃ.
-
-ය්.
-
-ය්ඩ්.
-
-ය්දී.
-
-	ය්න.
-
-	ය්ය.
-
-ය්යා.
-
-ය්ස්.
-
-	ය්හ.
-
-ය්හං.
-
-ය්‍ය.
-
-ය්‍යං.
-
-ය්‍යා.
-
-ය්‍යුං.
-
-ය්‍යෙ.
-
-ය්‍යො.
-
-යා.
-
-	යාං.
-
-	යාඃ.
-
-	යාා.
-
-	යාෙ.
-
-යැ.
-
-	යැං.
-
-යෑ.
-
-	යෑං.
-
-යි.
-
-	යිං.
-
-යී.
-
-යු.
-
-	යුං.
-
-	යුඃ.
-
-යූ.
-
-යෙ.
-
-	යේ.
-
-	යො.
-
-යෝ.
-
-	යෙි.
-
-	යෙේ.
-
-යේ.
-
-යෛ.
-
-යො.
-
-	යොං.
-
-	යොඃ.
-
-	යෝ.
-
-යෝ.
-
-යෞ.
-
-ය‌.
-
-ර.
-
-රං.
-
-රඃ.
-
-ර්.
-
-	ර්අ.
-
-	ර්ආ.
-
-	ර්එ.
-
-	ර්ක.
-
-ර්ක්.
-
-ර්ක්ට.
-
-ර්ක්ටි.
-
-ර්ක්ලි.
-
-ර්ක්ෂ.
-
-ර්ක්ෂා.
-
-ර්ක්ස්.
-
-ර්ක්ස්ඩෙ.
-
-ර්ක්හි.
-
-ර්ක්‍රි.
-
-ර්කා.
-
-ර්කි.
-
-ර්කී.
-
-ර්කු.
-
-ර්කෙ.
-
-ර්කේ.
-
-ර්කො.
-
-ර්කෝ.
-
-	ර්ග.
-
-ර්ග්.
-
-ර්ග්ගේ.
-
-ර්ග්හි.
-
-ර්ග්හී.
-
-ර්ග්‍ර.
-
-ර්ග්‍රී.
-
-ර්ගා.
-
-ර්ගාං.
-
-ර්ගි.
-
-ර්ගී.
-
-ර්ගු.
-
-ර්ගෙ.
-
-ර්ගේ.
-
-ර්ගො.
-
-ර්ගෝ.
-
-	ර්ඝ.
-
-ර්ඝා.
-
-ර්ඞ්.
-
-	ර්ච.
-
-ර්ච්.
-
-ර්ච්ඡේ.
-
-ර්චි.
-
-ර්චු.
-
-	ර්ඡ.
-
-	ර්ජ.
-
-ර්ජ්.
-
-ර්ජ්ගේ.
-
-ර්ජ්ට.
-
-ර්ජා.
-
-ර්ජි.
-
-ර්ජී.
-
-ර්ජු.
-
-ර්ජෙ.
-
-	ර්ට.
-
-ර්ට්.
-
-ර්ට්ගේ.
-
-ර්ට්න්.
-
-ර්ට්රි.
-
-ර්ට්ල.
-
-ර්ට්ලි.
-
-ර්ට්ස.
-
-ර්ට්ස්.
-
-ර්ට්හි.
-
-ර්ට්‍ර.
-
-ර්ටා.
-
-ර්ටි.
-
-ර්ටී.
-
-ර්ටු.
-
-ර්ටූ.
-
-ර්ටෙ.
-
-ර්ටේ.
-
-ර්ටො/
-
-ර්ටෝ/
-
-	ර්ඩ/
-
-ර්ඩ්/
-
-ර්ඩ්ගේ/
-
-ර්ඩ්න/
-
-ර්ඩ්න්/
-
-ර්ඩ්ල්/
-
-ර්ඩ්ස්/
-
-ර්ඩ්ස්ව/
-
-ර්ඩෑ/
-
-ර්ඩි/
-
-ර්ඩී/
-
-ර්ඩේ/
-
-ර්ඩො/
-
-ර්ඩෝ/
-
-	ර්ණ/
-
-ර්ණං/
-
-ර්ණ්‍ය/
-
-ර්ණා/
-
-ර්ණි/
-
-ර්ණී/
-
-	ර්ත/
-
-ර්ත්/
-
-ර්ත්ගේ/
-
-ර්ත්‍ය/
-
-ර්ත්‍යු/
-
-ර්තා/
-
-ර්ති/
-
-ර්තී/
-
-ර්තු/
-
-ර්තෘ/
-
-ර්තෙ/
-
-ර්තේ/
-
-ර්තො/
-
-ර්තෝ/
-
-	ර්ථ/
-
-ර්ථඃ/
-
-ර්ථ්‍ය/
-
-ර්ථා/
-
-ර්ථි/
-
-ර්ථී/
-
-ර්ථෙ/
-
-	ර්ද/
-
-ර්ද්ධ/
-
-ර්ද්ධි/
-
-ර්ද්ධෙ/
-
-ර්ද්‍ර/
-
-ර්දා/
-
-ර්දි/
-
-ර්දී/
-
-ර්දු/
-
-ර්දෘ/
-
-ර්දෙ/
-
-ර්දේ/
-
-ර්දො/
-
-ර්දෝ/
-
-	ර්ධ/
-
-ර්ධං/
-
-ර්ධ්‍රැ/
-
-ර්ධා/
-
-ර්ධි/
-
-ර්ධෙ/
-
-	ර්න/
-
-ර්න්/
-
-ර්න්ගේ/
-
-ර්න්ට්/
-
-ර්න්ස්/
-
-ර්න්ස්ට්/
-
-ර්න්හ/
-
-ර්නා/
-
-ර්නැ/
-
-ර්නි/
-
-ර්නිං/
-
-ර්නී/
-
-ර්නු/
-
-ර්නූ/
-
-ර්නෙ/
-
-ර්නේ/
-
-ර්නො/
-
-ර්නෝ/
-
-	ර්ප/
-
-ර්ප්/
-
-ර්පා/
-
-ර්පාං/
-
-ර්පි/
-
-ර්පී/
-
-ර්පු/
-
-ර්පූ/
-
-ර්පෙ/
-
-ර්පො/
-
-	ර්බ/
-
-ර්බ්/
-
-ර්බ්ස්/
-
-ර්බා/
-
-ර්බි/
-
-ර්බු/
-
-ර්බූ/
-
-ර්බෙ/
-
-ර්බො/
-
-ර්බෝ/
-
-	ර්භ/
-
-ර්භා/
-
-ර්භි/
-
-ර්භී/
-
-ර්භූ/
-
-ර්භෝ/
-
-	ර්ම/
-
-ර්මං/
-
-ර්ම්/
-
-ර්ම්ක/
-
-ර්ම්භ/
-
-ර්මා/
-
-ර්මාං/
-
-ර්මැ/
-
-ර්මැං/
-
-ර්මෑ/
-
-ර්මි/
-
-ර්මිං/
-
-ර්මී/
-
-ර්මු/
-
-ර්මෙ/
-
-ර්මේ/
-
-ර්මො/
-
-ර්මෝ/
-
-	ර්ය/
-
-ර්යං/
-
-ර්ය්‍ය/
-
-ර්ය්‍යා0
-
-ර්ය්‍යු0
-
-ර්යා0
-
-ර්යාං0
-
-ර්යු0
-
-ර්යෙ0
-
-ර්යේ0
-
-ර්යො0
-
-ර්යෝ0
-
-	ර්ර0
-
-ර්රා0
-
-ර්රි0
-
-ර්රේ0
-
-	ර්ල0
-
-ර්ල්0
-
-ර්ල්ඩ්0
-
-ර්ල්ව0
-
-ර්ල්ස්0
-
-ර්ල්ස්ට0
-
-ර්ලා0
-
-ර්ලෑ0
-
-ර්ලි0
-
-ර්ලිං0
-
-ර්ලී0
-
-ර්ලෙ0
-
-ර්ලේ0
-
-ර්ලො0
-
-ර්ලෝ0
-
-	ර්ව0
-
-ර්වං0
-
-ර්ව්0
-
-ර්ව්‍යා0
-
-ර්වා0
-
-ර්වාං0
-
-ර්වි0
-
-ර්වී0
-
-ර්වු0
-
-ර්වෘ0
-
-ර්වෙ0
-
-ර්වේ0
-
-ර්වෛ0
-
-ර්වො0
-
-ර්වෝ0
-
-	ර්ශ0
-
-ර්ශ්ව0
-
-ර්ශ්වි0
-
-ර්ශ්වී0
-
-ර්ශා0
-
-ර්ශි0
-
-ර්ශී0
-
-ර්ශු0
-
-	ර්ෂ0
-
-ර්ෂ්0
-
-ර්ෂ්‍යා0
-
-ර්ෂා0
-
-ර්ෂි0
-
-ර්ෂී0
-
-ර්ෂෙ0
-
-	ර්ස0
-
-ර්ස්0
-
-ර්ස්කි0
-
-ර්ස්ට0
-
-ර්ස්ට්0
-
-ර්ස්බ0
-
-ර්ස්මි0
-
-ර්සා0
-
-ර්සි0
-
-ර්සී0
-
-ර්සු0
-
-ර්සෙ0
-
-ර්සේ0
-
-ර්සො0
-
-ර්සෝ0
-
-	ර්හ0
-
-ර්හා0
-
-ර්හි0
-
-ර්හී0
-
-ර්හේ0
-
-	ර්ෆ0
-
-ර්ෆ්0
-
-ර්ෆැ0
-
-ර්ෆි0
-
-ර්ෆෙ0
-
-ර්ෆො0
-
-ර්්‍ය0
-
-ර්්‍යා0
-
-	ර්ි0
-
-	ර්‌0
-
-ර්‍ක0
-
-ර්‍ග0
-
-ර්‍ණ0
-
-ර්‍ත0
-
-ර්‍ථ0
-
-ර්‍ධ0
-
-ර්‍ම0
-
-ර්‍මා0
-
-ර්‍ය0
-
-ර්‍ය්‍ය0
-
-ර්‍යා0
-
-ර්‍ර0
-
-ර්‍ව0
-
-ර්‍වා0
-
-ර්‍ෂ0
-
-රා0
-
-	රාං0
-
-	රාඃ0
-
-	රා්0
-
-	රාා0
-
-	රාි0
-
-රැ0
-
-	රැු0
-
-රෑ0
-
-රි0
-
-	රිං0
-
-	රි්0
-
-	රිා0
-
-	රිි0
-
-	රිෙ0
-
-රී0
-
-	රී්0
-
-	රීා0
-
-	රීි0
-
-	රීෙ0
-
-රු0
-
-	රුං0
-
-	රුඃ0
-
-	රු‌0
-
-රූ0
-
-රෙ1
-
-	රො1
-
-රේ1
-
-රෛ1
-
-	රෛඃ1
-
-රො1
-
-	රොඃ1
-
-රෝ1
-
-රෞ1
-
-රෟ1
-
-ර‌1
-
-ල1
-
-ලං1
-
-ලඃ1
-
-ල්1
-
-	ල්අ1
-
-	ල්ආ1
-
-	ල්ඇ1
-
-	ල්ඔ1
-
-	ල්ක1
-
-ල්ක්1
-
-ල්ක්‍රි1
-
-ල්කා1
-
-ල්කැ1
-
-ල්කි1
-
-ල්කී1
-
-ල්කු1
-
-ල්කෙ1
-
-ල්කේ1
-
-ල්කො1
-
-ල්කෝ1
-
-	ල්ඛ1
-
-	ල්ග1
-
-ල්ග්‍රි1
-
-ල්ග්‍රේ1
-
-ල්ගා1
-
-ල්ගි1
-
-ල්ගී1
-
-ල්ගු1
-
-ල්ගෙ1
-
-ල්ගේ1
-
-ල්ගො1
-
-ල්ගෝ1
-
-ල්ඞ්1
-
-	ල්ච1
-
-ල්ච්1
-
-ල්චි1
-
-	ල්ජ1
-
-ල්ජ්1
-
-ල්ජි1
-
-ල්ජී1
-
-ල්ජු1
-
-	ල්ට1
-
-ල්ට්1
-
-ල්ට්ගේ1
-
-ල්ට්ව1
-
-ල්ට්ස්1
-
-ල්ට්ස්මා1
-
-ල්ට්ස්හ1
-
-ල්ට්‍රා1
-
-ල්ටා1
-
-ල්ටි1
-
-ල්ටී1
-
-ල්ටෙ1
-
-ල්ටො1
-
-ල්ටෝ1
-
-	ල්ඩ1
-
-ල්ඩ්1
-
-ල්ඩ්ගේ1
-
-ල්ඩ්ට1
-
-ල්ඩ්න්1
-
-ල්ඩ්රි1
-
-ල්ඩ්වි1
-
-ල්ඩ්ස්1
-
-ල්ඩ්ස්මි1
-
-ල්ඩ්‍ර1
-
-ල්ඩ්‍රි1
-
-ල්ඩා1
-
-ල්ඩි1
-
-ල්ඩී1
-
-ල්ඩෙ1
-
-ල්ඩෝ1
-
-	ල්ත1
-
-ල්ත්1
-
-ල්තා1
-
-ල්තැ1
-
-ල්ති1
-
-ල්තු1
-
-ල්තෙ1
-
-ල්තො1
-
-	ල්ද1
-
-ල්දා1
-
-ල්දි1
-
-ල්දී1
-
-ල්දු1
-
-ල්දූ1
-
-ල්දෙ1
-
-ල්දේ1
-
-ල්දො1
-
-	ල්න1
-
-ල්නා1
-
-ල්නෑ1
-
-ල්නි1
-
-ල්නේ1
-
-	ල්ප1
-
-ල්ප්1
-
-ල්ප්ස්1
-
-ල්ප්‍ර1
-
-ල්පා1
-
-ල්පැ1
-
-ල්පි1
-
-ල්පී1
-
-ල්පු1
-
-ල්පෙ1
-
-ල්පේ1
-
-ල්පො1
-
-	ල්ඵ1
-
-ල්ඵි1
-
-	ල්බ1
-
-ල්බ්‍රෙ1
-
-ල්බ්‍රේ1
-
-ල්බා1
-
-ල්බැ1
-
-ල්බි1
-
-ල්බු1
-
-ල්බෘ1
-
-ල්බෙ1
-
-ල්බේ1
-
-ල්බො2
-
-ල්බෝ2
-
-ල්බෲ2
-
-ල්භා2
-
-	ල්ම2
-
-ල්ම්2
-
-ල්ම්ස්2
-
-ල්ම්ෆෙ2
-
-ල්මා2
-
-ල්මැ2
-
-ල්මි2
-
-ල්මී2
-
-ල්මු2
-
-ල්මෙ2
-
-ල්මේ2
-
-ල්මො2
-
-ල්මෝ2
-
-	ල්ය2
-
-ල්ය්2
-
-ල්යා2
-
-ල්යි2
-
-ල්යු2
-
-ල්යො2
-
-	ල්ර2
-
-ල්ර්2
-
-ල්රි2
-
-ල්රු2
-
-ල්රූ2
-
-ල්රො2
-
-	ල්ල2
-
-ල්ලං2
-
-ල්ල්2
-
-ල්ලා2
-
-ල්ලැ2
-
-ල්ලෑ2
-
-ල්ලි2
-
-ල්ලී2
-
-ල්ලු2
-
-ල්ලූ2
-
-ල්ලෙ2
-
-ල්ලේ2
-
-ල්ලො2
-
-ල්ලෝ2
-
-	ල්ව2
-
-ල්වා2
-
-ල්වැ2
-
-ල්වි2
-
-ල්වී2
-
-ල්වු2
-
-ල්වූ2
-
-ල්වෙ2
-
-ල්වේ2
-
-ල්ශෙ2
-
-	ල්ෂ2
-
-ල්ෂ්2
-
-ල්ෂා2
-
-ල්ෂි2
-
-ල්ෂෙ2
-
-	ල්ස2
-
-ල්ස්2
-
-ල්ස්කි2
-
-ල්ස්ගේ2
-
-ල්ස්ට2
-
-ල්ස්ටෝ2
-
-ල්ස්පා2
-
-ල්ස්බ2
-
-ල්ස්ලි2
-
-ල්ස්හි2
-
-ල්ස්‌2
-
-ල්සා2
-
-ල්සි2
-
-ල්සිං2
-
-ල්සී2
-
-ල්සෙ2
-
-ල්සෝ2
-
-	ල්හ2
-
-ල්හා2
-
-ල්හි2
-
-ල්හී2
-
-ල්හු2
-
-ල්හෙ2
-
-ල්හො2
-
-	ල්ෆ2
-
-ල්ෆ්2
-
-ල්ෆ්‍ර2
-
-ල්ෆා2
-
-ල්ෆි2
-
-ල්ෆේ2
-
-ල්ෆො2
-
-ල්ෆෝ2
-
-ල්‍ට2
-
-ල්‍ය2
-
-ල්‍යා2
-
-ල්‍ල2
-
-ල්‍ෆ2
-
-ලා2
-
-	ලාං2
-
-	ලාඃ2
-
-ලා්ක2
-
-ලැ2
-
-	ලැං2
-
-	ලැෙ2
-
-	ලැ‌2
-
-ලෑ2
-
-ලි2
-
-	ලිං2
-
-ලී2
-
-ලු2
-
-	ලුං2
-
-ලූ2
-
-ලෙ2
-
-	ලො2
-
-ලේ2
-
-ලෛ2
-
-ලො2
-
-	ලොං2
-
-ලෝ2
-
-	ලෝං2
-
-ලෞ2
-
-ලෟ2
-
-ව2
-
-වං2
-
-වඃ2
-
-ව්2
-
-	ව්ක2
-
-ව්කා2
-
-ව්කි2
-
-ව්කු2
-
-	ව්ග3
-
-ව්ග්‍රේ3
-
-ව්ගි3
-
-ව්ගෙ3
-
-ව්ගේ3
-
-	ව්ච3
-
-ව්චා3
-
-	ව්ජ3
-
-	ව්ට3
-
-ව්ටෝ3
-
-ව්ඩ්3
-
-	ව්ත3
-
-ව්ත්3
-
-ව්තා3
-
-ව්ති3
-
-ව්තු3
-
-ව්තෝ3
-
-	ව්ද3
-
-ව්ද්‍යා3
-
-ව්දා3
-
-ව්දි3
-
-ව්දී3
-
-ව්දු3
-
-ව්දූ3
-
-ව්දෙ3
-
-ව්දේ3
-
-	ව්ධ3
-
-ව්ධා3
-
-	ව්න3
-
-ව්න්3
-
-ව්න්ගේ3
-
-ව්නා3
-
-ව්නි3
-
-ව්නී3
-
-ව්නු3
-
-ව්නේ3
-
-	ව්ප3
-
-ව්පා3
-
-ව්පි3
-
-ව්පු3
-
-	ව්බ3
-
-ව්බි3
-
-	ව්ම3
-
-ව්ම්3
-
-ව්මැ3
-
-ව්මි3
-
-ව්මු3
-
-ව්මේ3
-
-	ව්ය3
-
-ව්ය්3
-
-ව්ය්ව3
-
-ව්යා3
-
-ව්යාා3
-
-ව්යාු3
-
-ව්යාෙ3
-
-ව්යි3
-
-ව්යු3
-
-ව්යෙ3
-
-ව්යේ3
-
-ව්යො3
-
-ව්යෝ3
-
-	ව්ර3
-
-ව්රා3
-
-ව්රැ3
-
-ව්රි3
-
-ව්රු3
-
-ව්රෙ3
-
-ව්රෝ3
-
-	ව්ල3
-
-ව්ල්3
-
-ව්ලා3
-
-ව්ලැ3
-
-ව්ලි3
-
-ව්ලී3
-
-ව්ලෙ3
-
-ව්ලො3
-
-ව්ලෝ3
-
-	ව්ව3
-
-ව්ව්ධ3
-
-ව්වා3
-
-ව්වැ3
-
-ව්වි3
-
-ව්වෙ3
-
-ව්වේ3
-
-ව්වො3
-
-ව්වෝ3
-
-	ව්ශ3
-
-ව්ශ්වා3
-
-ව්ශා3
-
-ව්ශි3
-
-ව්ශේ3
-
-	ව්ෂ3
-
-	ව්ස3
-
-ව්ස්3
-
-ව්ස්ක්3
-
-ව්ස්කා3
-
-ව්ස්කි3
-
-ව්සා3
-
-ව්සැ3
-
-ව්සි3
-
-ව්සු3
-
-	ව්හ3
-
-ව්හං3
-
-ව්හා3
-
-ව්හි3
-
-ව්හී3
-
-ව්හු3
-
-ව්හෙ3
-
-ව්හො3
-
-	ව්ෆ3
-
-	ව්ි3
-
-ව්‍ච3
-
-ව්‍ද3
-
-ව්‍ය3
-
-ව්‍යං3
-
-ව්‍ය්‍ය3
-
-ව්‍යා3
-
-ව්‍යාං3
-
-ව්‍යු3
-
-ව්‍යූ3
-
-ව්‍යෙ3
-
-ව්‍යෛ3
-
-ව්‍යො3
-
-ව්‍ර3
-
-ව්‍රා3
-
-වා3
-
-	වාං3
-
-	වාඃ3
-
-වැ4
-
-	වැං4
-
-වෑ4
-
-	වෑං4
-
-වි4
-
-	විං4
-
-වි්‍යා4
-
-වි්‍යු4
-
-	විි4
-
-	විෙ4
-
-	වි‌4
-
-වී4
-
-වු4
-
-	වුං4
-
-වූ4
-
-වෘ4
-
-වෙ4
-
-	වේ4
-
-	වෙි4
-
-	වෙෙ4
-
-වේ4
-
-වෛ4
-
-වො4
-
-වෝ4
-
-වෞ4
-
-වෟ4
-
-වෲ4
-
-ශ4
-
-ශං4
-
-ශඃ4
-
-ශ්4
-
-	ශ්ක4
-
-ශ්ක්‍රා4
-
-ශ්ක්‍රි4
-
-ශ්කා4
-
-ශ්ගේ4
-
-	ශ්ච4
-
-ශ්චා4
-
-ශ්චි4
-
-ශ්චී4
-
-	ශ්ට4
-
-ශ්ටා4
-
-ශ්ටි4
-
-	ශ්ඨ4
-
-ශ්ඨා4
-
-ශ්ඨි4
-
-	ශ්ණ4
-
-ශ්ණා4
-
-ශ්ණු4
-
-ශ්ථා4
-
-	ශ්න4
-
-ශ්නා4
-
-ශ්නෝ4
-
-	ශ්ප4
-
-ශ්ප්‍ර4
-
-ශ්පා4
-
-	ශ්ඵ4
-
-	ශ්ම4
-
-ශ්මා4
-
-ශ්මි4
-
-ශ්මී4
-
-	ශ්ය4
-
-ශ්ය්4
-
-ශ්යා4
-
-ශ්යැ4
-
-ශ්යි4
-
-ශ්යී4
-
-ශ්යු4
-
-ශ්යෙ4
-
-ශ්යේ4
-
-	ශ්ර4
-
-ශ්රා4
-
-ශ්රි4
-
-ශ්රී4
-
-ශ්රී්4
-
-ශ්රීා4
-
-ශ්රීි4
-
-ශ්රීේ4
-
-ශ්රෙ4
-
-ශ්රේ4
-
-ශ්රෝ4
-
-	ශ්ල4
-
-ශ්ලී4
-
-ශ්ලෙ4
-
-ශ්ලේ4
-
-ශ්ලො4
-
-ශ්ලෝ4
-
-	ශ්ව4
-
-ශ්වා4
-
-ශ්වි4
-
-ශ්වී4
-
-ශ්වෙ4
-
-ශ්වේ4
-
-ශ්වෛ4
-
-	ශ්ශ4
-
-ශ්ශං4
-
-ශ්ශා4
-
-ශ්ශි4
-
-ශ්ශී4
-
-ශ්ශු4
-
-	ශ්ෂ4
-
-ශ්ෂ්ඨ4
-
-ශ්‍ය4
-
-ශ්‍ය්‍ය4
-
-ශ්‍යා4
-
-ශ්‍යෙ4
-
-ශ්‍ර4
-
-ශ්‍රා4
-
-ශ්‍රැ4
-
-ශ්‍රි4
-
-ශ්‍රී4
-
-ශ්‍රු4
-
-ශ්‍රෙ4
-
-ශ්‍රේ4
-
-ශ්‍රො4
-
-ශ්‍රෝ4
-
-ශ්‍රෞ4
-
-ශා4
-
-	ශාං4
-
-	ශාඃ4
-
-ශැ4
-
-ශි4
-
-	ශිං4
-
-ශි්‍ර4
-
-ශී4
-
-	ශීං4
-
-ශී්‍ර4
-
-ශු4
-
-ශූ5
-
-ශෘ5
-
-	ශෘං5
-
-ශෙ5
-
-	ශෙෙ5
-
-ශේ5
-
-ශේ්‍ර5
-
-ශෛ5
-
-ශො5
-
-ශෝ5
-
-ශෞ5
-
-	ශෲං5
-
-ශ‌5
-
-ෂ5
-
-ෂං5
-
-ෂඃ5
-
-ෂ්5
-
-	ෂ්අ5
-
-	ෂ්ක5
-
-ෂ්ක්‍ර5
-
-ෂ්ක්‍රි5
-
-ෂ්ක්‍රී5
-
-ෂ්කා5
-
-ෂ්කි5
-
-ෂ්ගේ5
-
-	ෂ්ච5
-
-ෂ්චි5
-
-	ෂ්ට5
-
-ෂ්ටං5
-
-ෂ්ට්5
-
-ෂ්ට්‍ය5
-
-ෂ්ට්‍ර5
-
-ෂ්ට්‍රා5
-
-ෂ්ටා5
-
-ෂ්ටාං5
-
-ෂ්ටි5
-
-ෂ්ටී5
-
-ෂ්ටු5
-
-ෂ්ටෙ5
-
-ෂ්ටො5
-
-	ෂ්ඨ5
-
-ෂ්ඨා5
-
-ෂ්ඨාං5
-
-ෂ්ඨි5
-
-ෂ්ඨී5
-
-ෂ්ඨෙ5
-
-	ෂ්ඪ5
-
-	ෂ්ණ5
-
-ෂ්ණා5
-
-ෂ්ණි5
-
-ෂ්ණී5
-
-ෂ්ණු5
-
-ෂ්ණෙ5
-
-	ෂ්ත5
-
-ෂ්ත්ර5
-
-ෂ්ත්‍ර5
-
-ෂ්ථා5
-
-	ෂ්ද5
-
-	ෂ්න5
-
-ෂ්නා5
-
-ෂ්නි5
-
-ෂ්නු5
-
-	ෂ්ප5
-
-ෂ්ප්‍ර5
-
-ෂ්පා5
-
-ෂ්පි5
-
-ෂ්පී5
-
-	ෂ්ඵ5
-
-	ෂ්බ5
-
-	ෂ්ම5
-
-ෂ්මා5
-
-ෂ්මි5
-
-ෂ්මී5
-
-ෂ්මෙ5
-
-	ෂ්ය5
-
-ෂ්යා5
-
-ෂ්යි5
-
-ෂ්යේ5
-
-ෂ්රූ5
-
-ෂ්ලි5
-
-ෂ්ලේ5
-
-	ෂ්ව5
-
-ෂ්වා5
-
-ෂ්වි5
-
-	ෂ්ශ5
-
-ෂ්ශා5
-
-ෂ්‍ය5
-
-ෂ්‍යා5
-
-ෂ්‍යෙ5
-
-ෂ්‍රි5
-
-ෂා5
-
-	ෂාං5
-
-	ෂාඃ5
-
-ෂැ5
-
-	ෂැං5
-
-ෂෑ5
-
-ෂි5
-
-	ෂිං5
-
-ෂී5
-
-ෂු5
-
-ෂූ5
-
-ෂෘ5
-
-ෂෙ5
-
-ෂේ5
-
-ෂො5
-
-ෂෝ5
-
-ෂෟ5
-
-ස5
-
-සං5
-
-සඃ5
-
-ස්5
-
-	ස්ං5
-
-	ස්අ5
-
-	ස්ඇ5
-
-	ස්එ5
-
-	ස්ක5
-
-ස්ක්5
-
-ස්ක්ටො5
-
-ස්ක්රී5
-
-ස්ක්ව5
-
-ස්ක්හො5
-
-ස්ක්‍රි5
-
-ස්ක්‍රී5
-
-ස්කා5
-
-ස්කැ5
-
-ස්කෑ5
-
-ස්කි5
-
-ස්කී5
-
-ස්කු6
-
-ස්කූ6
-
-ස්කෘ6
-
-ස්කෙ6
-
-ස්කේ6
-
-ස්කො6
-
-ස්කෝ6
-
-ස්කෟ6
-
-	ස්ඛ6
-
-ස්ඛා6
-
-	ස්ග6
-
-ස්ගි6
-
-ස්ගු6
-
-ස්ගෙ6
-
-ස්ගේ6
-
-ස්ගො6
-
-ස්ගෝ6
-
-	ස්ච6
-
-ස්ච්6
-
-ස්චි6
-
-ස්චෙ6
-
-ස්ජි6
-
-	ස්ට6
-
-ස්ට්6
-
-ස්ට්ගේ6
-
-ස්ට්ම6
-
-ස්ට්මි6
-
-ස්ට්රි6
-
-ස්ට්රී6
-
-ස්ට්රේ6
- 
-ස්ට්රේ්ලි6
-
-ස්ට්ල6
-
-ස්ට්ල්6
-
-ස්ට්ලි6
-
-ස්ට්ව6
-
-ස්ට්වා6
-
-ස්ට්හි6
-
-ස්ට්‍ර6
-
-ස්ට්‍රා6
-
-ස්ට්‍රැ6
-
-ස්ට්‍රි6
-
-ස්ට්‍රී6
-
-ස්ට්‍රෙ6
-
-ස්ට්‍රේ6
-
-ස්ට්‍රො6
-
-ස්ට්‍රෝ6
-
-ස්ටා6
-
-ස්ටැ6
-
-ස්ටෑ6
-
-ස්ටි6
-
-ස්ටිං6
-
-ස්ටී6
-
-ස්ටු6
-
-ස්ටූ6
-
-ස්ටෘ6
-
-ස්ටෙ6
-
-ස්ටේ6
-
-ස්ටේ්‍ර6
-
-ස්ටො6
-
-ස්ටෝ6
-
-ස්ටෲ6
-
-	ස්ඨ6
-
-ස්ඨා6
-
-	ස්ඩ6
-
-ස්ඩ්6
-
-ස්ඩා6
-
-	ස්ත6
-
-ස්තං6
-
-ස්ත්ර6
-
-ස්ත්රි6
-
-ස්ත්රී6
-
-ස්ත්‍ය6
-
-ස්ත්‍ර6
-
-ස්ත්‍රා6
-
-ස්ත්‍රි6
-
-ස්ත්‍රී6
-
-ස්ත්‍රෙ6
-
-ස්ත්‍රො6
-
-ස්ත්‍රෝ6
-
-ස්තා6
-
-ස්තැ6
-
-ස්ති6
-
-ස්තී6
-
-ස්තු6
-
-ස්තූ6
-
-ස්තෘ6
-
-ස්තෙ6
-
-ස්තො6
-
-ස්තෝ6
-
-ස්තෲ6
-
-	ස්ථ6
-
-ස්ථඃ6
-
-ස්ථා6
-
-ස්ථි6
-
-ස්ථී6
-
-ස්ථු6
-
-ස්ථූ6
-
-ස්ථෙ6
-
-	ස්ද6
-
-ස්දා6
-
-ස්දි6
-
-ස්දෙ6
-
-	ස්න6
-
-ස්න්6
-
-ස්නා6
-
-ස්නැ6
-
-ස්නි6
-
-ස්නු6
-
-ස්නෙ6
-
-ස්නේ6
-
-ස්නො6
-
-ස්නෝ6
-
-	ස්ප6
-
-ස්ප්‍ර6
-
-ස්ප්‍රි6
-
-ස්ප්‍රී6
-
-ස්ප්‍රේ6
-
-ස්පා6
-
-ස්පැ6
-
-ස්පෑ6
-
-ස්පි6
-
-ස්පී6
-
-ස්පු6
-
-ස්පෘ6
-
-ස්පෙ6
-
-ස්පේ6
-
-ස්පො6
-
-ස්පෝ6
-
-	ස්ඵ7
-
-ස්ඵු7
-
-ස්ඵෝ7
-
-	ස්බ7
-
-ස්බැ7
-
-ස්බෑ7
-
-ස්බි7
-
-ස්බී7
-
-ස්බු7
-
-ස්බෙ7
-
-ස්බේ7
-
-ස්බෝ7
-
-ස්භා7
-
-	ස්ම7
-
-ස්මං7
-
-ස්ම්7
-
-ස්මා7
-
-ස්මැ7
-
-ස්මි7
-
-ස්මිං7
-
-ස්මී7
-
-ස්මු7
-
-ස්මූ7
-
-ස්මෘ7
-
-ස්මෙ7
-
-ස්මේ7
-
-ස්මො7
-
-ස්මෝ7
-
-	ස්ය7
-
-ස්යා7
-
-ස්යි7
-
-ස්යු7
-
-ස්යො7
-
-	ස්ර7
-
-ස්ර්7
-
-ස්රා7
-
-ස්රි7
-
-ස්රී7
-
-ස්රු7
-
-ස්රෝ7
-
-	ස්ල7
-
-ස්ල්7
-
-ස්ලා7
-
-ස්ලැ7
-
-ස්ලෑ7
-
-ස්ලි7
-
-ස්ලී7
-
-ස්ලෙ7
-
-ස්ලේ7
-
-ස්ලො7
-
-ස්ලෝ7
-
-	ස්ව7
-
-ස්වං7
-
-ස්වා7
-
-ස්වැ7
-
-ස්වි7
-
-ස්වී7
-
-ස්වු7
-
-ස්වූ7
-
-ස්වෙ7
-
-ස්වේ7
-
-ස්වෛ7
-
-ස්වො7
-
-ස්වෝ7
-
-ස්ශ්‍ර7
-
-ස්ෂු7
-
-	ස්ස7
-
-ස්සං7
-
-ස්ස්‍රා7
-
-ස්සා7
-
-ස්සැ7
-
-ස්සි7
-
-ස්සිං7
-
-ස්සී7
-
-ස්සු7
-
-ස්සූ7
-
-ස්සෙ7
-
-ස්සේ7
-
-ස්සො7
-
-ස්සෝ7
-
-	ස්හ7
-
-ස්හා7
-
-ස්හැ7
-
-ස්හි7
-
-ස්හී7
-
-ස්හු7
-
-	ස්ෆ7
-
-ස්ෆි7
-
-ස්ෆෙ7
-
-ස්ෆේ7
-
-	ස්ෙ7
-
-	ස්‌7
-
-ස්‍ට්‍රේ7
-
-ස්‍ථා7
-
-ස්‍ය7
-
-ස්‍යා7
-
-ස්‍යාඃ7
-
-ස්‍යු7
-
-ස්‍යුඃ7
-
-ස්‍යෝ7
-
-ස්‍ර7
-
-ස්‍රා7
-
-ස්‍රැ7
-
-ස්‍රි7
-
-ස්‍රො7
-
-ස්‍රෝ7
-
-ස්‍ව7
-
-සා7
-
-	සාං7
-
-සැ7
-
-	සැං7
-
-සෑ7
-
-	සෑං7
-
-සි7
-
-	සිං7
-
-	සිි7
-
-සී7
-
-	සීං7
-
-සු7
-
-	සුං7
-
-සූ7
-
-සෘ7
-
-	සෘං7
-
-සෙ7
-
-	සෙං7
-
-	සේ7
-
-	සො7
-
-සේ7
-
-සෛ8
-
-	සෛඃ8
-
-සො8
-
-	සොං8
-
-සෝ8
-
-	සෝං8
-
-සෞ8
-
-සෟ8
-
-ස‌8
-
-හ8
-
-හං8
-
-හඃ8
-
-හ්8
-
-	හ්ක8
-
-හ්ගෙ8
-
-හ්ගේ8
-
-	හ්ට8
-
-හ්තු8
-
-හ්දි8
-
-	හ්න8
-
-හ්න්8
-
-හ්නි8
-
-හ්භා8
-
-	හ්ම8
-
-හ්ම්ම8
-
-හ්මා8
-
-හ්මි8
-
-හ්මී8
-
-හ්මු8
-
-හ්යා8
-
-හ්යු8
-
-	හ්ර8
-
-හ්ර්8
-
-හ්රා8
-
-හ්රි8
-
-	හ්ල8
-
-හ්ලා8
-
-හ්ලි8
-
-හ්ලේ8
-
-	හ්ව8
-
-හ්වා8
-
-හ්සා8
-
-හ්‍ය8
-
-හ්‍යා8
-
-හ්‍යු8
-
-හ්‍ර8
-
-හ්‍රි8
-
-හා8
-
-	හාං8
-
-	හා්8
-
-හැ8
-
-	හැං8
-
-හෑ8
-
-හි8
-
-	හිං8
-
-	හිඃ8
-
-	හිි8
-
-හී8
-
-හු8
-
-	හුං8
-
-	හුඃ8
-
-හූ8
-
-හෘ8
-
-හෙ8
-
-	හො8
-
-	හෙි8
-
-හේ8
-
-හෛ8
-
-හො8
-
-	හොං8
-
-	හෝ8
-
-හෝ8
-
-හෞ8
-
-ළ8
-
-ළං8
-
-ළ්8
-
-	ළ්ය8
-
-	ළ්හ8
-
-ළ්‍ය8
-
-ළ්‍යා8
-
-ළා8
-
-ළැ8
-
-ළෑ8
-
-ළි8
-
-	ළිං8
-
-	ළිි8
-
-ළී8
-
-ළු8
-
-	ළුැ8
-
-	ළුෑ8
-
-ළූ8
-
-ළෙ8
-
-ළේ8
-
-ළො8
-
-ළෝ8
-
-ෆ8
-
-ෆ්8
-
-	ෆ්ග8
-
-ෆ්ගේ8
-
-	ෆ්ඝ8
-
-	ෆ්ට8
-
-ෆ්ට්8
-
-ෆ්ට්ඉ8
-
-ෆ්ට්ගේ8
-
-ෆ්ට්වෙ8
-
-ෆ්ටා8
-
-ෆ්තා8
-
-ෆ්නි8
-
-ෆ්බා8
-
-	ෆ්ම8
-
-ෆ්යි8
-
-	ෆ්ර8
-
-ෆ්රා8
-
-ෆ්රැ8
-
-ෆ්රෑ8
-
-ෆ්රි8
-
-ෆ්රී8
-
-ෆ්රු8
-
-ෆ්රෙ8
-
-ෆ්රෝ8
-
-	ෆ්ල8
-
-ෆ්ලැ8
-
-ෆ්ලෑ8
-
-ෆ්ලි8
-
-ෆ්ලු8
-
-ෆ්ලූ8
-
-ෆ්ලෙ8
-
-ෆ්ලේ8
-
-ෆ්ලො9
-
-ෆ්ලෝ9
-
-ෆ්ස්9
-
-ෆ්සා9
-
-ෆ්සී9
-
-ෆ්ෆෙ9
-
-ෆ්‍ර9
-
-ෆ්‍රා9
-
-ෆ්‍රැ9
-
-ෆ්‍රෑ9
-
-ෆ්‍රි9
-
-ෆ්‍රී9
-
-ෆ්‍රෙ9
-
-ෆ්‍රේ9
-
-ෆ්‍රො9
-
-ෆා9
-
-ෆැ9
-
-ෆෑ9
-
-ෆි9
-
-ෆී9
-
-ෆු9
-
-ෆූ9
-
-ෆෙ9
-
-ෆේ9
-
-ෆො9
-
-ෆෝ9
-
-ෆෲ9
-
-ෙ9
-
-෴9
-
-་9
-
-᛬9
-
-៰9
-
-ᵒ9
-
-Ḍ9
-
-ḍ9
-
-Ḥ9
-
-ḥ9
-
-Ḽ9
-
-Ṁ9
-
-ṁ9
-
-ṅ9
-
-Ṇ9
-
-ṇ9
-
-Ṛ9
-
-ṛ9
-
-Ṣ9
-
-ṣ9
-
-Ṭ9
-
-ṭ9
-
-ṱ9
-
-ẓ9
-
-ẞ9
-
-Ạ9
-
-ạ9
-
-Ả9
-
-ả9
-
-Ấ9
-
-ấ9
-
-Ầ9
-
-ầ9
-
-Ẩ9
-
-ẩ9
-
-Ẫ9
-
-ẫ9
-
-Ậ9
-
-ậ9
-
-Ắ9
-
-ắ9
-
-Ằ9
-
-ằ9
-
-Ẳ9
-
-ẳ9
-
-Ẵ9
-
-ẵ9
-
-Ặ9
-
-ặ9
-
-Ẹ9
-
-ẹ9
-
-Ẻ9
-
-ẻ9
-
-Ẽ9
-
-ẽ9
-
-Ế9
-
-ế9
-
-Ề9
-
-ề9
-
-Ể9
-
-ể9
-
-Ễ9
-
-ễ9
-
-Ệ9
-
-ệ9
-
-Ỉ9
-
-ỉ9
-
-Ị9
-
-ị9
-
-Ọ9
-
-ọ9
-
-Ỏ9
-
-ỏ9
-
-Ố9
-
-ố9
-
-Ồ9
-
-ồ9
-
-Ổ9
-
-ổ9
-
-Ỗ9
-
-ỗ9
-
-Ộ9
-
-ộ9
-
-Ớ9
-
-ớ9
-
-Ờ9
-
-ờ9
-
-Ở9
-
-ở9
-
-Ỡ9
-
-ỡ9
-
-Ợ9
-
-ợ9
-
-Ụ9
-
-ụ9
-
-Ủ9
-
-ủ9
-
-Ứ9
-
-ứ9
-
-Ừ9
-
-ừ9
-
-Ử:
-
-ử:
-
-Ữ:
-
-ữ:
-
-Ự:
-
-ự:
-
-Ỳ:
-
-ỳ:
-
-Ỵ:
-
-ỵ:
-
-Ỷ:
-
-ỷ:
-
-Ỹ:
-
-ỹ:
-
-​:
-
-‌:
-
-‍:
-
-‍ಯ:
-
-‍්:
-
-‍්ගේ:
-
-	‍්ත:
-
-‍්නේ:
-
-	‍්ම:
-
-	‍්ර:
-
-‍්ලේ:
-
-	‍්ව:
-
-	‍්ෂ:
-
-‍්ෂේ:
-
-‍්‍ය:
-
-‍්‍යා:
-
-‍්‍ර:
-
-‍්‍රං:
-
-‍්‍රා:
-
-‍්‍රාං:
-
-‍්‍රැ:
-
-‍්‍රෑ:
-
-‍්‍රි:
-
-‍්‍රී:
-
-‍්‍ෂ:
-
-‍ා:
-
-‍ැ:
-
-‍ි:
-
-‍ී:
-
-‍ු:
-
-‍ෙ:
-
-‍ේ:
-
-‍ෛ:
-
-‍ො:
-
-‎:
-
-‐:
-
-‑:
-
-‒:
-
-–:
-
-—:
-
-―:
-
-‖:
-
-‘:
-
-’:
-
-‚:
-
-‛:
-
-“:
-
-”:
-
-„:
-
-†:
-
-‡:
-
-•:
-
-‣:
-
-…:
-
-‰:
-
-′:
-
-″:
-
-‹:
-
-›:
-
-‿:
-
-⁄:
-
-⁰:
-
-⁴:
-
-⁵:
-
-⁹:
-
-₁:
-
-₂:
-
-₃:
-
-₄:
-
-₤:
-
-₦:
-
-₧:
-
-₩:
-
-₪:
-
-₫:
-
-€:
-
-₹:
-
-₺:
-
-℃:
-
-№:
-
-℗:
-
-™:
-
-⅓:
-
-Ⅰ:
-
-Ⅱ:
-
-Ⅲ:
-
-Ⅵ:
-
-Ⅹ:
-
-←:
-
-↑:
-
-→:
-
-↓:
-
-↔:
-
-↦:
-
-↳:
-
-↺:
-
-⇌:
-
-⇐:
-
-⇒:
-
-⇓:
-
-⇔:
-
-∀:
-
-∂:
-
-∃:
-
-∅:
-
-∆:
-
-∇:
-
-∈:
-
-∉:
-
-∏:
-
-∑:
-
-−:
-
-∘:
-
-∙:
-
-√;
-
-∝;
-
-∞;
-
-∧;
-
-∨;
-
-∩;
-
-∪;
-
-∫;
-
-∴;
-
-≈;
-
-≠;
-
-≡;
-
-≤;
-
-≥;
-
-≪;
-
-≫;
-
-⊂;
-
-⊃;
-
-⊆;
-
-⊕;
-
-⊞;
-
-⊥;
-
-⋅;
-
-⋆;
-
-⌁;
-
-⏭;
-
-⑆;
-
-⑇;
-
-⑈;
-
-⑉;
-
-①;
-
-②;
-
-③;
-
-④;
-
-⑤;
-
-⑥;
-
-⑦;
-
-⑧;
-
-⑨;
-
-⑩;
-
-⑪;
-
-⑫;
-
-⑬;
-
-⑭;
-
-⑮;
-
-⑯;
-
-⑰;
-
-⑱;
-
-⑲;
-
-⑳;
-
-Ⓐ;
-
-Ⓑ;
-
-Ⓒ;
-
-Ⓡ;
-
-ⓐ;
-
-ⓑ;
-
-─;
-
-│;
-
-┈;
-
-┌;
-
-└;
-
-├;
-
-┬;
-
-┴;
-
-╰;
-
-▂;
-
-█;
-
-▉;
-
-░;
-
-■;
-
-□;
-
-▪;
-
-▬;
-
-▲;
-
-▴;
-
-▶;
-
-▷;
-
-▸;
-
-►;
-
-▼;
-
-▾;
-
-◄;
-
-◆;
-
-◇;
-
-◉;
-
-◊;
-
-○;
-
-◎;
-
-●;
-
-◦;
-
-☀;
-
-★;
-
-☆;
-
-☉;
-
-☎;
-
-☏;
-
-☐;
-
-☑;
-
-☒;
-
-☛;
-
-☜;
-
-☞;
-
-☢;
-
-☸;
-
-☹;
-
-☺;
-
-♀;
-
-♂;
-
-♠;
-
-♡;
-
-♢;
-
-♣;
-
-♥;
-
-♦;
-
-♪;
-
-♫;
-
-♬;
-
-♭;
-
-♯;
-
-⚫;
-
-⛤;
-
-✅;
-
-✈;
-
-✉;
-
-✍;
-
-✎;
-
-✓;
-
-✔;
-
-✗<
-
-✡<
-
-✦<
-
-✨<
-
-✩<
-
-✪<
-
-✯<
-
-✰<
-
-✱<
-
-✶<
-
-✿<
-
-❀<
-
-❖<
-
-❗<
-
-❘<
-
-❜<
-
-❝<
-
-❞<
-
-❤<
-
-➔<
-
-➖<
-
-➜<
-
-➝<
-
-➡<
-
-➤<
-
-⟨<
-
-⟩<
-
-⟫<
-
-⠀<
-
-⭑<
-
-Ɑ<
-
-、<
-
-。<
-
-〈<
-
-〉<
-
-《<
-
-》<
-
-「<
-
-」<
-
-『<
-
-』<
-
-【<
-
-】<
-
-〜<
-
-・<
-
-ー<
-
-ꞌ<
-
-ﬁ<
-
-﴾<
-
-﴿<
-
-，<
-
-：<
-
-｢<
-
-｣<
-
-￡<
-
-￥<
-
-�<<
\ No newline at end of file
@@ -1,3566 +0,0 @@
-
-
- 
-
- ം
-
- ാ
-
- െ
-
- ൈ
-
- ്
-
-!
-
-"
-
-"ം
-
-"ഃ	
-
-"ാ
-
-
-"ി
-
-"ീ
-
-"ു
-
-"ൂ
-
-"ൃ
-
-"െ
-
-"േ
-
-"ൈ
-
-"്
-
-#
-
-$
-
-%
-
-&
-
-'
-
-'ം
-
-'ാ
-
-'ി
-
-'ീ
-
-'ു
-
-'ൂ
-
-'െ
-
-'േ 
-
-'ൈ!
-
-'്"
-
-'്യ#
-
-'്വ$
-
-'ൗ%
-
-(&
-
-)'
-
-)ം(
-
-*)
-
-+*
-
-,+
-
--,
-
--ം-
-
--ാ.
-
-./
-
-/0
-
-01
-
-12
-
-23
-
-34
-
-45
-
-56
-
-67
-
-78
-
-89
-
-9:
-
-:;
-
-;<
-
-<=
-
-=>
-
->?
-
-?@
-
-@A
-
-AB
-
-BC
-
-CD
-
-DE
-
-EF
-
-FG
-
-GH
-
-HI
-
-IJ
-
-JK
-
-KL
-
-LM
-
-MN
-
-NO
-
-OP
-
-O̟Q
-
-PR
-
-QS
-
-RT
-
-SU
-
-TV
-
-UW
-
-VX
-
-WY
-
-XZ
-
-Y[
-
-Z\
-
-[]
-
-\^
-
-]_
-
-^`
-
-_a
-
-`b
-
-ac
-
-a̸d
-
-be
-
-cf
-
-dg
-
-eh
-
-e̟i
-
-e̱j
-
-fk
-
-gl
-
-hm
-
-in
-
-i̇o
-
-i̟p
-
-jq
-
-kr
-
-ls
-
-mt
-
-m̃u
-
-nv
-
-ow
-
-o̟x
-
-py
-
-qz
-
-r{
-
-s|
-
-s̟}
-
-t~
-
-t̃
-
-u
-
-u̟
-
-u̸
-
-v
-
-w
-
-x
-
-y
-
-z
-
-{
-
-|
-
-}
-
-~
-
- 
-
-¡
-
-¢
-
-£
-
-¤
-
-¥
-
-¦
-
-§
-
-¨
-
-©
-
-ª
-
-«
-
-¬
-
-®
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˚
-
-˜
-
-˝
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-М
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-і
-
-ա
-
-ի
-
-ն
-
-ր
-
-،
-
-ا
-
-ل
-
-क
-
-त
-
-य
-
-र
-
-ा
-
-ि
-
-ी
-
-।
-
-॥
-
-०
-
-০
-
-க
-
-ப
-
-ா
-
-ം
-
-ഃ
-
-അ
-
-	അ്ല
-
-ആ
-
-ഇ
-
-ഈ
-
-ഉ
-
-ഊ
-
-ഋ
-
-ഌ
-
-എ
-
-ഏ
-
-ഐ
-
-ഒ
-
-ഓ
-
-ഔ
-
-ക
-
-കു
-
-കൂ
-
-കൃ
-
-കെ
-
-കേ
-
-കൈ
-
-	ക്ക
-
-ക്കു
-
-ക്കൂ
-
-ക്കൃ
-
-ക്കെ
-
-ക്കേ
-
-ക്കൈ
-
-ക്ക്യൂ
-
-ക്ക്ര
-
-ക്ക്ല
-
-ക്ക്വു
-
-	ക്ട
-
-ക്ടു
-
-ക്ടെ
-
-ക്ടേ
-
-ക്ട്ര
-
-ക്ട്രു
-
-ക്ട്രേ
-
-	ക്ണ
-
-	ക്ത
-
-ക്തു
-
-ക്തൂ
-
-ക്തൃ
-
-ക്തേ
-
-ക്ത്യു
-
-ക്ത്ര
-
-	ക്ന
-
-ക്നെ
-
-ക്നേ
-
-	ക്മ
-
-ക്മെ
-
-ക്മേ
-
-ക്യു
-
-ക്യൂ
-
-ക്യേ
-
-	ക്ര
-
-ക്രു
-
-ക്രൂ
-
-ക്രെ
-
-ക്രേ
-
-ക്രൈ
-
-ക്റ്റ
-
-ക്റ്റു
-
-ക്റ്റെ
-
-ക്റ്റേ
-
-	ക്ല
-
-ക്ലൂ
-
-ക്ലെ
-
-ക്ലേ
-
-ക്ലൈ
-
-ക്വെ
-
-ക്വേ
-
-	ക്ഷ
-
-ക്ഷു
-
-ക്ഷെ
-
-ക്ഷേ
-
-ക്ഷ്മ
-
-ക്ഷ്യേ
-
-	ക്സ
-
-ക്സു
-
-ക്സെ
-
-ക്സേ
-
-ക്സൈ
-
-ക്സ്ല
-
-ക്സ്വെ
-
-ഖ
-
-ഖു
-
-ഖൂ
-
-ഖെ
-
-ഖേ
-
-ഖൈ
-
-	ഖ്ല
-
-ഗ
-
-ഗു
-
-ഗൂ
-
-ഗൃ
-
-ഗെ
-
-ഗേ
-
-ഗൈ
-
-	ഗ്ഗ
-
-ഗ്ഗു
-
-ഗ്ഗെ
-
-ഗ്ഗേ
-
-ഗ്ഗ്ല
-
-	ഗ്ദ
-
-	ഗ്ന
-
-ഗ്നു
-
-ഗ്നൂ
-
-ഗ്നെ
-
-ഗ്നേ
-
-ഗ്നൈ
-
-	ഗ്മ
-
-ഗ്മെ
-
-ഗ്യു
-
-ഗ്യൂ
-
-ഗ്യേ
-
-	ഗ്ര
-
-ഗ്രൂ
-
-ഗ്രെ
-
-ഗ്രേ
-
-ഗ്രൈ
-
-	ഗ്ല
-
-ഗ്ലു
-
-ഗ്ലൂ
-
-ഗ്ലെ
-
-ഗ്ലേ
-
-ഗ്ലൈ
-
-ഗ്വെ
-
-ഗ്വേ
-
-ഘ
-
-ഘു
-
-ഘൂ
-
-ഘൃ
-
-ഘെ
-
-ഘേ
-
-	ഘ്ന
-
-	ഘ്ര
-
-ങ
-
-ങു
-
-ങൂ
-
-ങെ
-
-ങേ
-
-	ങ്ക
-
-ങ്കു
-
-ങ്കൂ
-
-ങ്കൃ
-
-ങ്കെ
-
-ങ്കേ
-
-ങ്കൈ
-
-ങ്ക്യൂ
-
-ങ്ക്രേ
-
-ങ്ക്ല
-
-ങ്ക്വേ
-
-	ങ്ങ
-
-ങ്ങു
-
-ങ്ങൂ
-
-ങ്ങെ
-
-ങ്ങേ
-
-	ങ്ല
-
-ങ്വേ
-
-ച
-
-ചു
-
-ചൂ
-
-ചെ
-
-ചേ
-
-ചൈ
-
-	ച്ച
-
-ച്ചു
-
-ച്ചൂ
-
-ച്ചെ
-
-ച്ചേ
-
-	ച്ഛ
-
-ച്ഛേ
-
-ച്യു
-
-ച്യൂ
-
-ഛ
-
-ഛു
-
-ഛൂ
-
-ഛെ
-
-ഛേ
-
-ജ
-
-ജു
-
-ജൂ
-
-ജെ
-
-ജേ
-
-ജൈ
-
-	ജ്ജ
-
-ജ്ജു
-
-ജ്ജേ
-
-	ജ്ഞ
-
-ജ്ഞേ
-
-ജ്യു
-
-ജ്യൂ
-
-ജ്യേ
-
-	ജ്ര
-
-	ജ്ല
-
-ഝ
-
-ഝൂ
-
-ഝെ
-
-ഝേ
-
-ഞ
-
-ഞു
-
-ഞെ
-
-ഞേ
-
-	ഞ്ച
-
-ഞ്ചു
-
-ഞ്ചൂ
-
-ഞ്ചെ
-
-ഞ്ചേ
-
-ഞ്ചൈ
-
-	ഞ്ഛ
-
-	ഞ്ജ
-
-ഞ്ജു
-
-	ഞ്ഞ
-
-ഞ്ഞു
-
-ഞ്ഞൂ
-
-ഞ്ഞെ
-
-ഞ്ഞേ
-
-ട
-
-ടു
-
-ടൂ
-
-ടെ
-
-ടേ
-
-ടൈ
-
-	ട്ട
-
-ട്ടു
-
-ട്ടൂ
-
-ട്ടെ
-
-ട്ടേ
-
-ട്ടൈ
-
-ട്ട്യൂ
-
-ട്ട്യേ
-
-ട്ട്ല
-
-ട്ട്ലു
-
-ട്ട്വൈ
-
-ട്യു
-
-ട്യൂ
-
-ട്യേ
-
-	ട്ര
-
-ട്രു
-
-ട്രൂ
-
-ട്രെ
-
-ട്രേ
-
-ട്രൈ
-
-	ട്ല
-
-ട്വെ
-
-ഠ
-
-ഠു
-
-ഠൂ
-
-ഠെ
-
-ഠേ
-
-ഠൈ
-
-ഠ്യേ
-
-ഡ
-
-ഡു
-
-ഡൂ
-
-ഡെ
-
-ഡേ
-
-ഡൈ
-
-	ഡ്ഡ
-
-ഡ്ഡു
-
-	ഡ്ഢ
-
-	ഡ്മ
-
-ഡ്യു
-
-ഡ്യൂ
-
-	ഡ്ര
-
-ഡ്രൂ
-
-ഡ്രെ
-
-ഡ്രേ
-
-ഡ്രൈ
-
-	ഡ്ല
-
-ഡ്ലെ
-
-ഡ്ലൈ
-
-ഡ്വു
-
-ഡ്വെ
-
-ഡ്വേ
-
-ഡ്വൈ
-
-ഢ
-
-ഢെ
-
-ഢേ
-
-ണ
-
-ണു
-
-ണൂ
-
-ണെ
-
-ണേ
-
-ണൈ
-
-	ണ്ട
-
-ണ്ടു
-
-ണ്ടൂ
-
-ണ്ടെ
-
-ണ്ടേ
-
-ണ്ടൈ
-
-ണ്ട്ര
-
-ണ്ട്രേ
-
-ണ്ട്ല
-
-	ണ്ഠ
-
-ണ്ഠേ
-
-	ണ്ഡ
-
-ണ്ഡു
-
-ണ്ഡൂ
-
-ണ്ഡെ
-
-ണ്ഡേ
-
-ണ്ഡ്ര
-
-	ണ്ഢ
-
-	ണ്ണ
-
-ണ്ണു
-
-ണ്ണൂ
-
-ണ്ണെ
-
-ണ്ണേ
-
-	ണ്മ
-
-ണ്മു
-
-ണ്മെ
-
-ണ്രേ
-
-ത
-
-തു
-
-തൂ
-
-തൃ
-
-തെ
-
-തേ
-
-തൈ
-
-	ത്ത
-
-ത്തു
-
-ത്തൂ
-
-ത്തൃ
-
-ത്തെ
-
-ത്തേ
-
-ത്തൈ
-
-ത്ത്വേ
-
-	ത്ഥ
-
-ത്ഥേ
-
-	ത്ന
-
-ത്നെ
-
-	ത്ഭ
-
-ത്ഭു
-
-	ത്മ
-
-ത്മേ
-
-ത്യു
-
-ത്യൂ
-
-ത്യെ
-
-ത്യേ
-
-	ത്ര
-
-ത്രു
-
-ത്രൂ
-
-ത്രെ
-
-ത്രേ
-
-ത്രൈ
-
-	ത്ല
-
-ത്ലെ
-
-ത്വേ
-
-	ത്സ
-
-ത്സു
-
-ത്സെ
-
-ത്സേ
-
-ഥ
-
-ഥു
-
-ഥൂ
-
-ഥെ
-
-ഥേ
-
-ഥൈ
-
-	ഥ്ര
-
-ദ
-
-ദു
-
-ദൂ
-
-ദൃ
-
-ദെ
-
-ദേ
-
-ദൈ
-
-	ദ്ദ
-
-ദ്ദു
-
-ദ്ദൂ
-
-ദ്ദെ
-
-ദ്ദേ
-
-ദ്ദ്യേ
-
-	ദ്ധ
-
-ദ്ധേ
-
-ദ്ധ്യേ
-
-ദ്യു
-
-ദ്യേ
-
-	ദ്ര
-
-ദ്രു
-
-ദ്രെ
-
-ദ്രേ
-
-	ദ്ല
-
-ദ്വൃ
-
-ദ്വേ
-
-ദ്വൈ
-
-ധ
-
-ധു
-
-ധൂ
-
-ധൃ
-
-ധെ
-
-ധേ
-
-ധൈ
-
-ധ്യേ
-
-	ധ്ര
-
-ധ്രു
-
-ന
-
-നു
-
-നൂ
-
-നൃ
-
-നെ
-
-നേ
-
-നൈ
-
-	ന്ത
-
-ന്തു
-
-ന്തൂ
-
-ന്തെ
-
-ന്തേ
-
-ന്ത്യേ
-
-ന്ത്ര
-
-ന്ത്രേ
-
-	ന്ഥ
-
-	ന്ദ
-
-ന്ദു
-
-ന്ദൂ
-
-ന്ദെ
-
-ന്ദേ
-
-ന്ദ്ര
-
-ന്ദ്രെ
-
-ന്ദ്രേ
-
-	ന്ധ
-
-ന്ധു
-
-ന്ധൂ
-
-ന്ധ്ര
-
-	ന്ന
-
-ന്നു
-
-ന്നൂ
-
-ന്നെ
-
-ന്നേ
-
-ന്നൈ
-
-ന്ന്യേ
-
-	ന്മ
-
-ന്മു
-
-ന്മൂ
-
-ന്മെ
-
-ന്മേ
-
-ന്യു
-
-ന്യൂ
-
-ന്യേ
-
-	ന്ര
-
-	ന്റ
-
-ന്റു
-
-ന്റൂ
-
-ന്റെ
-
-ന്റേ
-
-ന്റൈ
-
-ന്റ്ര
-
-	ന്ല
-
-ന്വേ
-
-പ
-
-പു
-
-പൂ
-
-പൃ
-
-പെ
-
-പേ
-
-പൈ
-
-	പ്ട
-
-പ്ടെ
-
-പ്ടേ
-
-പ്ട്യൂ
-
-	പ്ത
-
-പ്തു
-
-	പ്ന
-
-പ്നേ
-
-	പ്പ
-
-പ്പു
-
-പ്പൂ
-
-പ്പെ
-
-പ്പേ
-
-പ്പൈ
-
-പ്പ്ര
-
-പ്പ്ലേ
-
-	പ്ഫ
-
-പ്യു
-
-പ്യൂ
-
-പ്യേ
-
-	പ്ര
-
-പ്രു
-
-പ്രൂ
-
-പ്രെ
-
-പ്രേ
-
-പ്രൈ
-
-പ്റ്റ
-
-പ്റ്റു
-
-പ്റ്റെ
-
-പ്റ്റേ
-
-പ്റ്റൈ
-
-പ്റ്റ്യൂ
-
-	പ്ല
-
-പ്ലൂ
-
-പ്ലെ
-
-പ്ലേ
-
-പ്ലൈ
-
-	പ്സ
-
-പ്സു
-
-പ്സെ
-
-പ്സേ
-
-ഫ
-
-ഫു
-
-ഫൂ
-
-ഫെ
-
-ഫേ
-
-ഫൈ
-
-	ഫ്ക
-
-	ഫ്ട
-
-ഫ്ടു
-
-	ഫ്ത
-
-	ഫ്ന
-
-	ഫ്മ
-
-ഫ്യു
-
-ഫ്യൂ
-
-	ഫ്ര
-
-ഫ്രൂ
-
-ഫ്രെ
-
-ഫ്രേ
-
-ഫ്രൈ
-
-ഫ്റ്റ
-
-ഫ്റ്റു
-
-ഫ്റ്റ്വെ
-
-ഫ്റ്റ്വേ
-
-	ഫ്ല
-
-ഫ്ലു
-
-ഫ്ലൂ
-
-ഫ്ലെ
-
-ഫ്ലേ
-
-ഫ്ലൈ
-
-	ഫ്സ
-
-ഫ്സെ
-
-ബ
-
-ബു
-
-ബൂ
-
-ബൃ
-
-ബെ
-
-ബേ
-
-ബൈ
-
-	ബ്ഗ
-
-	ബ്ജ
-
-	ബ്ദ
-
-ബ്ദു
-
-ബ്ദേ
-
-	ബ്ധ
-
-	ബ്ന
-
-ബ്നു
-
-	ബ്ബ
-
-ബ്ബു
-
-ബ്ബൂ
-
-ബ്ബേ
-
-ബ്യു
-
-ബ്യൂ
-
-	ബ്ര
-
-ബ്രു
-
-ബ്രൂ
-
-ബ്രെ
-
-ബ്രേ
-
-ബ്രൈ
-
-	ബ്ല
-
-ബ്ലു
-
-ബ്ലൂ
-
-ബ്ലെ
-
-ബ്ലേ
-
-ബ്ലൈ
-
-ബ്ല്യു
-
-ബ്ല്യൂ
-
-ബ്വെ
-
-ബ്വേ
-
-ഭ
-
-ഭു
-
-ഭൂ
-
-ഭൃ
-
-ഭെ
-
-ഭേ
-
-ഭൈ
-
-ഭ്യു
-
-ഭ്യൂ
-
-	ഭ്ര
-
-ഭ്രു
-
-ഭ്രൂ
-
-മ
-
-മു
-
-മൂ
-
-മൃ
-
-മെ
-
-മേ
-
-മൈ
-
-	മ്ന
-
-മ്നേ
-
-	മ്പ
-
-മ്പു
-
-മ്പൂ
-
-മ്പെ
-
-മ്പേ
-
-മ്പൈ
-
-മ്പ്യു
-
-മ്പ്യൂ
-
-മ്പ്ര
-
-മ്പ്ല
-
-മ്പ്ലേ
-
-	മ്മ
-
-മ്മു
-
-മ്മൂ
-
-മ്മെ
-
-മ്മേ
-
-മ്മ്യു
-
-മ്മ്യൂ
-
-മ്യു
-
-മ്യൂ
-
-മ്യേ
-
-	മ്ര
-
-മ്രേ
-
-	മ്ല
-
-യ
-
-യു
-
-യൂ
-
-യെ
-
-യേ
-
-യൈ
-
-	യ്ക
-
-യ്കു
-
-യ്കെ
-
-യ്കേ
-
-യ്ക്ക
-
-യ്ക്കു
-
-യ്ക്കൂ
-
-യ്ക്കെ
-
-യ്ക്കേ
-
-	യ്ച
-
-യ്ചു
-
-	യ്ത
-
-യ്തു
-
-യ്തെ
-
-യ്തേ
-
-	യ്ന
-
-യ്നു
-
-യ്നെ
-
-യ്നേ
-
-	യ്പ
-
-യ്പു
-
-യ്പൂ
-
-യ്പേ
-
-	യ്മ
-
-യ്മു
-
-യ്മെ
-
-യ്മേ
-
-	യ്യ
-
-യ്യു
-
-യ്യൂ
-
-യ്യെ
-
-യ്യേ
-
-	യ്ര
-
-	യ്ല
-
-യ്ലേ
-
-യ്വു
-
-യ്വേ
-
-ര
-
-രു
-
-രൂ
-
-രൃ
-
-രെ
-
-രേ
-
-രൈ
-
-ര്യു
-
-ര്യേ
-
-	ര്ര
-
-	ര്ല	
-
-റ	
-
-റു	
-
-റൂ	
-
-റെ	
-
-റേ	
-
-റൈ	
-
-	റ്റ	
-
-റ്റു	
-
-റ്റൂ	
-
-റ്റെ	
-
-റ്റേ	
-
-റ്റൈ	
-
-റ്റ്യു	
-
-റ്റ്യൂ	
-
-റ്റ്ര	
-
-റ്റ്രേ	
-
-റ്റ്ല	
-
-റ്റ്ലെ	
-
-റ്റ്ലേ	
-
-ല	
-
-ലു	
-
-ലൂ	
-
-ലെ	
-
-ലേ	
-
-ലൈ	
-
-ല്ക്ക	
-
-ല്ക്കു	
-
-ല്ക്കൂ	
-
-ല്ക്കേ	
-
-	ല്പ	
-
-ല്പു	
-
-ല്പെ	
-
-ല്പേ	
-
-ല്പ്ര	
-
-ല്പ്രേ	
-
-	ല്മ	
-
-ല്യു	
-
-ല്യൂ	
-
-ല്യേ	
-
-	ല്ല	
-
-ല്ലു	
-
-ല്ലൂ	
-
-ല്ലെ	
-
-ല്ലേ	
-
-ല്ലൈ	
-
-ല്ല്ല	
-
-ല്വേ	
-
-ള	
-
-ളു	
-
-ളൂ	
-
-ളെ	
-
-ളേ	
-
-ളൈ	
-
-ള്യു	
-
-ള്യേ	
-
-	ള്ല	
-
-	ള്ള	
-
-ള്ളു	
-
-ള്ളൂ	
-
-ള്ളെ	
-
-ള്ളേ	
-
-ള്ളൈ	
-
-ഴ	
-
-ഴു	
-
-ഴൂ	
-
-ഴെ	
-
-ഴേ	
-
-ഴൈ	
-
-	ഴ്ക	
-
-ഴ്കേ	
-
-	ഴ്ച	
-
-ഴ്ത്ത	
-
-ഴ്ത്തു	
-
-ഴ്ന്ന	
-
-ഴ്ന്നു	
-
-	ഴ്പ	
-
-ഴ്പെ	
-
-	ഴ്മ	
-
-ഴ്മേ	
-
-	ഴ്വ	
-
-	ഴ്സ	
-
-ഴ്സു	
-
-ഴ്സെ	
-
-ഴ്സേ	
-
-വ	
-
-വു	
-
-വൂ	
-
-വൃ	
-
-വെ	
-
-വേ	
-
-വൈ	
-
-വ്യു	
-
-വ്യൂ	
-
-വ്യേ	
-
-	വ്ര	
-
-	വ്ല	
-
-വ്ലെ	
-
-വ്ലേ	
-
-	വ്വ	
-
-വ്വൂ	
-
-വ്വെ	
-
-വ്വേ	
-
-ശ	
-
-ശു	
-
-ശൂ	
-
-ശൃ	
-
-ശെ	
-
-ശേ	
-
-ശൈ	
-
-	ശ്ച	
-
-	ശ്ഛ	
-
-	ശ്ന	
-
-ശ്നേ	
-
-	ശ്മ	
-
-ശ്യൂ	
-
-	ശ്ര	
-
-ശ്രു	
-
-ശ്രൂ	
-
-ശ്രെ	
-
-ശ്രേ	
-
-	ശ്ല	
-
-ശ്ലേ	
-
-ശ്വേ	
-
-	ശ്ശ	
-
-ശ്ശു	
-
-ശ്ശൂ	
-
-ശ്ശെ	
-
-ശ്ശേ
-
-
-ഷ
-
-
-ഷു
-
-
-ഷൂ
-
-
-ഷെ
-
-
-ഷേ
-
-
-ഷൈ
-
-
-	ഷ്ട
-
-
-ഷ്ടു
-
-
-ഷ്ടേ
-
-
-ഷ്ട്ര
-
-
-	ഷ്ണ
-
-
-ഷ്ണു
-
-
-ഷ്ണേ
-
-
-ഷ്യു
-
-
-ഷ്യൂ
-
-
-ഷ്യേ
-
-
-	ഷ്ര
-
-
-ഷ്രേ
-
-
-	ഷ്ല
-
-
-സ
-
-
-സു
-
-
-സൂ
-
-
-സൃ
-
-
-സെ
-
-
-സേ
-
-
-സൈ
-
-
-	സ്ക
-
-
-സ്കു
-
-
-സ്കൂ
-
-
-സ്കൃ
-
-
-സ്കെ
-
-
-സ്കേ
-
-
-സ്കൈ
-
-
-സ്ക്യു
-
-
-സ്ക്യൂ
-
-
-സ്ക്ര
-
-
-സ്ക്രൂ
-
-
-സ്ക്രേ
-
-
-സ്ക്രൈ
-
-
-സ്ക്ല
-
-
-	സ്ഖ
-
-
-	സ്ട
-
-
-സ്ടെ
-
-
-സ്ടേ
-
-
-സ്ട്ര
-
-
-സ്ട്രു
-
-
-സ്ട്രെ
-
-
-സ്ട്രേ
-
-
-സ്ട്രൈ
-
-
-	സ്ത
-
-
-സ്തു
-
-
-സ്തൂ
-
-
-സ്തൃ
-
-
-സ്തെ
-
-
-സ്തേ
-
-
-സ്തൈ
-
-
-സ്ത്ര
-
-
-സ്ത്രേ
-
-
-സ്ത്രൈ
-
-
-	സ്ഥ
-
-
-സ്ഥൂ
-
-
-	സ്ന
-
-
-സ്നു
-
-
-സ്നെ
-
-
-സ്നേ
-
-
-	സ്പ
-
-
-സ്പു
-
-
-സ്പൂ
-
-
-സ്പൃ
-
-
-സ്പെ
-
-
-സ്പേ
-
-
-സ്പൈ
-
-
-സ്പ്യൂ
-
-
-സ്പ്ര
-
-
-സ്പ്രൂ
-
-
-സ്പ്രെ
-
-
-സ്പ്രേ
-
-
-സ്പ്ല
-
-
-സ്പ്ലേ
-
-
-	സ്ഫ
-
-
-സ്ഫു
-
-
-സ്ഫെ
-
-
-സ്ഫേ
-
-
-	സ്മ
-
-
-സ്മൂ
-
-
-സ്മൃ
-
-
-സ്മെ
-
-
-സ്മേ
-
-
-സ്മൈ
-
-
-സ്യു
-
-
-സ്യൂ
-
-
-സ്യേ
-
-
-	സ്ര
-
-
-സ്രു
-
-
-സ്രേ
-
-
-സ്റ്റ
-
-
-സ്റ്റു
-
-
-സ്റ്റൂ
-
-
-സ്റ്റെ
-
-
-സ്റ്റേ
-
-
-സ്റ്റൈ
-
-
-സ്റ്റ്യൂ
-
-
-സ്റ്റ്ര
-
-
-സ്റ്റ്രേ
-
-
-സ്റ്റ്ല
-
-
-സ്റ്റ്വു
-
-
-	സ്ല
-
-
-സ്ലെ
-
-
-സ്ലേ
-
-
-സ്ലൈ
-
-
-സ്വൂ
-
-
-സ്വെ
-
-
-സ്വേ
-
-
-സ്വൈ
-
-
-	സ്സ
-
-
-സ്സു
-
-
-സ്സൂ
-
-
-സ്സെ
-
-
-സ്സേ
-
-
-സ്സൈ
-
-
-സ്സ്വേ
-
-
-ഹ
-
-
-ഹു
-
-
-ഹൂ
-
-
-ഹൃ
-
-
-ഹെ
-
-
-ഹേ
-
-
-ഹൈ
-
-	ഹ്ന
-
-	ഹ്മ
-
-ഹ്മൂ
-
-ഹ്മെ
-
-ഹ്മേ
-
-ഹ്യു
-
-ഹ്യൂ
-
-	ഹ്ര
-
-ഹ്രു
-
-ഹ്രേ
-
-	ഹ്ല
-
-ഹ്ലു
-
-ാ
-
-ാു
-
-ി
-
-ീ
-
-ൂ
-
-്
-
-്യ
-
-്യ്ര
-
-്വ
-
-്െ
-
-ൗ
-
-ൠ
-
-ൡ
-
-൦
-
-൧
-
-൨
-
-൩
-
-൪
-
-൫
-
-൬
-
-൭
-
-൮
-
-൯
-
-ൺ
-
-ൻ
-
-ൻെ
-
-ർ
-
-ൽ
-
-ൾ
-
-ൿ
-
-៰
-
-ᵒ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ṁ
-
-ṁ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-‌
-
-‍
-
-‐
-
-‑
-
-‒
-
-–
-
-—
-
-―
-
-‘
-
-’
-
-‚
-
-“
-
-”
-
-„
-
-†
-
-‡
-
-•
-
-‣
-
-…
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-⁄
-
-⁰
-
-⁹
-
-₁
-
-₂
-
-₤
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-№
-
-℗
-
-™
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↳
-
-⇒
-
-⇓
-
-∈
-
-−
-
-∙
-
-√
-
-∞
-
-∩
-
-≈
-
-≡
-
-≤
-
-≥
-
-≫
-
-⋅
-
-⋆
-
-⌁
-
-⏭
-
-Ⓐ
-
-Ⓒ
-
-Ⓔ
-
-Ⓖ
-
-Ⓛ
-
-Ⓜ
-
-Ⓝ
-
-Ⓞ
-
-Ⓡ
-
-ⓖ
-
-ⓝ
-
-─
-
-│
-
-└
-
-├
-
-▅
-
-▇
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▾
-
-◄
-
-◆
-
-◇
-
-◊
-
-○
-
-●
-
-☀
-
-★
-
-☆
-
-☎
-
-☐
-
-☛
-
-☞
-
-☪
-
-☹
-
-☺
-
-☻
-
-♂
-
-♔
-
-♠
-
-♡
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-⚫
-
-✅
-
-✈
-
-✉
-
-✓
-
-✔
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➖
-
-➜
-
-➡
-
-➤
-
-⟫
-
-⠀
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-》
-
-【
-
-】
-
-・
-
-ꞌ
-
-ﬁ
-
-，
-
-：
-
-￡
-
-￥
-
-�
\ No newline at end of file
@@ -1,1760 +0,0 @@
-
-
- 
-
-!
-
-"
-
-#
-
-$
-
-%
-
-&
-
-'
-
-'ி
-
-'ீ	
-
-'ு
-
-
-'ு்
-
-'ூ
-
-'்
-
-(
-
-)
-
-*
-
-+
-
-,
-
--
-
-.
-
-/
-
-0
-
-1
-
-2
-
-3
-
-4
-
-5
-
-6
-
-7
-
-8
-
-9
-
-: 
-
-;!
-
-<"
-
-=#
-
->$
-
-?%
-
-@&
-
-A'
-
-B(
-
-C)
-
-D*
-
-E+
-
-F,
-
-G-
-
-H.
-
-I/
-
-J0
-
-K1
-
-L2
-
-M3
-
-N4
-
-O5
-
-O̟6
-
-P7
-
-Q8
-
-R9
-
-S:
-
-T;
-
-U<
-
-V=
-
-W>
-
-X?
-
-Y@
-
-ZA
-
-[B
-
-\C
-
-]D
-
-^E
-
-_F
-
-`G
-
-aH
-
-a̸I
-
-bJ
-
-cK
-
-dL
-
-eM
-
-e̟N
-
-e̱O
-
-fP
-
-gQ
-
-hR
-
-iS
-
-i̇T
-
-i̟U
-
-jV
-
-kW
-
-lX
-
-mY
-
-m̃Z
-
-n[
-
-o\
-
-o̟]
-
-p^
-
-q_
-
-r`
-
-sa
-
-s̟b
-
-tc
-
-t̃d
-
-ue
-
-u̟f
-
-u̸g
-
-vh
-
-wi
-
-xj
-
-yk
-
-zl
-
-{m
-
-|n
-
-}o
-
-~p
-
- q
-
-¡r
-
-¢s
-
-£t
-
-¤u
-
-¥v
-
-¦w
-
-§x
-
-¨y
-
-©z
-
-ª{
-
-«|
-
-¬}
-
-®~
-
-¯
-
-°
-
-±
-
-²
-
-³
-
-´
-
-µ
-
-¶
-
-·
-
-¸
-
-¹
-
-º
-
-»
-
-¼
-
-½
-
-¾
-
-¿
-
-À
-
-Á
-
-Â
-
-Ã
-
-Ä
-
-Å
-
-Æ
-
-Ç
-
-È
-
-É
-
-Ê
-
-Ë
-
-Ì
-
-Í
-
-Î
-
-Ï
-
-Ð
-
-Ñ
-
-Ò
-
-Ó
-
-Ô
-
-Õ
-
-Ö
-
-×
-
-Ø
-
-Ù
-
-Ú
-
-Û
-
-Ü
-
-Ý
-
-Þ
-
-ß
-
-à
-
-á
-
-â
-
-ã
-
-ä
-
-å
-
-æ
-
-ç
-
-è
-	
-è̟
-
-é
-	
-é̟
-
-ê
-
-ë
-
-ì
-
-í
-
-î
-
-ï
-
-ð
-
-ñ
-
-ò
-	
-ò̟
-
-ó
-	
-ó̟
-
-ô
-
-õ
-
-ö
-
-÷
-
-ø
-
-ù
-
-ú
-
-û
-
-ü
-
-ý
-
-þ
-
-ÿ
-
-Ā
-
-ā
-
-Ă
-
-ă
-
-Ą
-
-ą
-
-Ć
-
-ć
-
-Ĉ
-
-ĉ
-
-Ċ
-
-ċ
-
-Č
-
-č
-
-Ď
-
-ď
-
-Đ
-
-đ
-
-Ē
-
-ē
-
-Ĕ
-
-ĕ
-
-Ė
-
-ė
-
-Ę
-
-ę
-
-Ě
-
-ě
-
-Ĝ
-
-ĝ
-
-Ğ
-
-ğ
-
-Ġ
-
-ġ
-
-Ģ
-
-ģ
-
-Ĥ
-
-ĥ
-
-Ħ
-
-ħ
-
-Ĩ
-
-ĩ
-
-Ī
-
-ī
-
-Ĭ
-
-ĭ
-
-Į
-
-į
-
-İ
-
-ı
-
-Ĵ
-
-ĵ
-
-Ķ
-
-ķ
-
-Ĺ
-
-ĺ
-
-Ļ
-
-ļ
-
-Ľ
-
-ľ
-
-Ŀ
-
-ŀ
-
-Ł
-
-ł
-
-Ń
-
-ń
-
-Ņ
-
-ņ
-
-Ň
-
-ň
-
-ŉ
-
-Ŋ
-
-ŋ
-
-Ō
-
-ō
-
-Ŏ
-
-ŏ
-
-Ő
-
-ő
-
-Œ
-
-œ
-
-Ŕ
-
-ŕ
-
-Ř
-
-ř
-
-Ś
-
-ś
-
-Ŝ
-
-ŝ
-
-Ş
-
-ş
-
-Š
-
-š
-
-Ţ
-
-ţ
-
-Ť
-
-ť
-
-Ũ
-
-ũ
-
-Ū
-
-ū
-
-Ŭ
-
-ŭ
-
-Ů
-
-ů
-
-Ű
-
-ű
-
-Ų
-
-ų
-
-Ŵ
-
-ŵ
-
-Ŷ
-
-ŷ
-
-Ÿ
-
-Ź
-
-ź
-
-Ż
-
-ż
-
-Ž
-
-ž
-
-ſ
-
-Ɔ
-
-Ɖ
-
-Ɗ
-
-Ə
-
-Ɛ
-
-Ƒ
-
-ƒ
-
-Ɩ
-
-Ơ
-
-ơ
-
-Ư
-
-ư
-
-ǎ
-
-ǝ
-
-ǹ
-
-Ș
-
-ș
-
-Ț
-
-ț
-
-ȧ
-
-Ʌ
-
-ɑ
-
-ɓ
-
-ɔ
-	
-ɔ̃
-
-ɖ
-
-ɗ
-
-ə
-	
-ə̀
-
-ɛ
-	
-ɛ̃
-
-ɣ
-
-ɩ
-
-ɲ
-
-ʊ
-
-ʻ
-
-ʼ
-
-ˆ
-
-ˇ
-
-˘
-
-˚
-
-˜
-
-˝
-
-Α
-
-Μ
-
-Ο
-
-Σ
-
-ά
-
-έ
-
-ί
-
-α
-
-ε
-
-η
-
-ι
-
-κ
-
-λ
-
-μ
-
-ν
-
-ο
-
-π
-
-ρ
-
-σ
-
-τ
-
-υ
-
-Є
-
-А
-
-В
-
-Д
-
-Е
-
-И
-
-Л
-
-Н
-
-О
-
-П
-
-Р
-
-С
-
-Т
-
-Я
-
-а
-
-б
-
-в
-
-г
-
-д
-
-е
-
-ж
-
-з
-
-и
-
-й
-
-к
-
-л
-
-м
-
-н
-
-о
-
-п
-
-р
-
-с
-
-т
-
-у
-
-ч
-
-ш
-
-ы
-
-ь
-
-я
-
-ա
-
-ा
-
-०
-
-০
-
-ஃ
-
-அ
-
-ஆ
-
-இ
-
-ஈ
-
-உ
-
-ஊ
-
-எ
-
-ஏ
-
-ஐ
-
-ஒ
-
-ஓ
-
-ஔ
-
-க
-
-கி
-
-	கி்
-
-கீ
-
-கு
-
-	கு்
-
-கூ
-
-க்
-
-	க்ஷ
-
-க்ஷி
-
-க்ஷு
-
-க்ஷ்
-
-ங
-
-ஙி
-
-ஙீ
-
-ஙு
-
-ஙூ
-
-ங்
-
-ச
-
-சி
-
-	சி்
-
-சீ
-
-சு
-
-சூ
-
-ச்
-
-ஜ
-
-ஜி
-
-ஜீ
-
-ஜு
-
-ஜூ
-
-ஜ்
-
-ஞ
-
-ஞி
-
-ஞீ
-
-ஞு
-
-ஞூ
-
-ஞ்
-
-ட
-
-டி
-
-டீ
-
-டு
-
-	டு்
-
-டூ
-
-ட்
-
-ண
-
-ணி
-
-ணீ
-
-ணு
-
-ணூ
-
-ண்
-
-த
-
-தி
-
-	தி்
-
-தீ
-
-து
-
-	து்
-
-தூ
-
-த்
-
-ந
-
-நி
-
-நீ
-
-	நீ்
-
-நு
-
-நூ
-
-ந்
-
-ன
-
-னி
-
-	னி்
-
-னீ
-
-னு
-
-னூ
-
-ன்
-
-ப
-
-பி
-
-	பி்
-
-பீ
-
-பு
-
-பூ
-
-ப்
-
-ம
-
-மி
-
-	மி்
-
-மீ
-
-மு
-
-மூ
-
-ம்
-
-ய
-
-யி
-
-	யி்
-
-யீ
-
-யு
-
-யூ
-
-ய்
-
-ர
-
-ரி
-
-	ரி்
-
-ரீ
-
-ரு
-
-	ரு்
-
-ரூ
-
-ர்
-
-ற
-
-றி
-
-	றி்
-
-றீ
-
-று
-
-றூ
-
-ற்
-
-ல
-
-லி
-
-லீ
-
-லு
-
-லூ
-
-ல்
-
-ள
-
-ளி
-
-	ளி்
-
-ளீ
-
-ளு
-
-ளூ
-
-ள்
-
-ழ
-
-ழி
-
-	ழி்
-
-ழீ
-
-ழு
-
-ழூ
-
-ழ்
-
-வ
-
-வி
-
-	வி்
-
-வீ
-
-வு
-
-வூ
-
-வ்
-
-ஶ
-
-ஷ
-
-ஷி
-
-ஷீ
-
-ஷு
-
-ஷூ
-
-ஷ்
-
-ஸ
-
-ஸி
-
-ஸீ
-
-ஸு
-
-ஸூ
-
-ஸ்
-
-ஹ
-
-ஹி
-
-ஹீ
-
-ஹு
-
-ஹூ
-
-ஹ்
-
-ா
-
-ா்
-
-ி
-
-ீ
-
-ு
-
-ூ
-
-ெ
-
-ே
-
-ை
-
-ொ
-
-ோ
-
-ௌ
-
-்
-
-ௐ
-
-ௗ
-
-௦
-
-௧
-
-௨
-
-௩
-
-௪
-
-௫
-
-௬
-
-௭
-
-௮
-
-௯
-
-៰
-
-ᵒ
-
-ḍ
-
-Ḥ
-
-ḥ
-
-Ṁ
-
-ṁ
-
-Ṇ
-
-ṇ
-
-Ṛ
-
-ṛ
-
-Ṣ
-
-ṣ
-
-Ṭ
-
-ṭ
-
-ẞ
-
-Ạ
-
-ạ
-
-Ả
-
-ả
-
-Ấ
-
-ấ
-
-Ầ
-
-ầ
-
-Ẩ
-
-ẩ
-
-Ẫ
-
-ẫ
-
-Ậ
-
-ậ
-
-Ắ
-
-ắ
-
-Ằ
-
-ằ
-
-Ẳ
-
-ẳ
-
-Ẵ
-
-ẵ
-
-Ặ
-
-ặ
-
-Ẹ
-
-ẹ
-
-Ẻ
-
-ẻ
-
-Ẽ
-
-ẽ
-
-Ế
-
-ế
-
-Ề
-
-ề
-
-Ể
-
-ể
-
-Ễ
-
-ễ
-
-Ệ
-
-ệ
-
-Ỉ
-
-ỉ
-
-Ị
-
-ị
-
-Ọ
-
-ọ
-
-Ỏ
-
-ỏ
-
-Ố
-
-ố
-
-Ồ
-
-ồ
-
-Ổ
-
-ổ
-
-Ỗ
-
-ỗ
-
-Ộ
-
-ộ
-
-Ớ
-
-ớ
-
-Ờ
-
-ờ
-
-Ở
-
-ở
-
-Ỡ
-
-ỡ
-
-Ợ
-
-ợ
-
-Ụ
-
-ụ
-
-Ủ
-
-ủ
-
-Ứ
-
-ứ
-
-Ừ
-
-ừ
-
-Ử
-
-ử
-
-Ữ
-
-ữ
-
-Ự
-
-ự
-
-Ỳ
-
-ỳ
-
-ỵ
-
-Ỷ
-
-ỷ
-
-Ỹ
-
-ỹ
-
-‍
-
-‐
-
-‑
-
-‒
-
-–
-
-—
-
-―
-
-‘
-
-’
-
-‚
-
-“
-
-”
-
-„
-
-†
-
-‡
-
-•
-
-‣
-
-…
-
-‰
-
-′
-
-″
-
-‹
-
-›
-
-⁄
-
-⁰
-
-⁹
-
-₁
-
-₂
-
-₤
-
-₪
-
-₫
-
-€
-
-₹
-
-₺
-
-℃
-
-№
-
-℗
-
-™
-
-←
-
-↑
-
-→
-
-↓
-
-↔
-
-↳
-
-⇒
-
-⇓
-
-−
-
-∙
-
-√
-
-∞
-
-≈
-
-≤
-
-≥
-
-≫
-
-⋅
-
-⋆
-
-⌁
-
-⏭
-
-Ⓒ
-
-Ⓡ
-
-─
-
-│
-
-■
-
-□
-
-▪
-
-▬
-
-▲
-
-▴
-
-▶
-
-▷
-
-▸
-
-►
-
-▼
-
-▾
-
-◄
-
-◆
-
-◇
-
-◊
-
-○
-
-●
-
-☀
-
-★
-
-☆
-
-☎
-
-☐
-
-☛
-
-☞
-
-☯
-
-☹
-
-☺
-
-♂
-
-♠
-
-♡
-
-♣
-
-♥
-
-♦
-
-♪
-
-♫
-
-♬
-
-⚫
-
-✅
-
-✈
-
-✓
-
-✔
-
-✡
-
-✦
-
-✨
-
-✩
-
-✪
-
-✯
-
-✰
-
-✶
-
-✿
-
-❀
-
-❖
-
-❗
-
-❘
-
-❜
-
-❝
-
-❞
-
-❤
-
-➖
-
-➜
-
-➡
-
-➤
-
-⟫
-
-⠀
-
-⭑
-
-Ɑ
-
-、
-
-。
-
-》
-
-【
-
-】
-
-・
-
-ꞌ
-
-ﬁ
-
-，
-
-：
-
-￡
-
-￥
-
-�
\ No newline at end of file
@@ -0,0 +1,289 @@
+"""
+複数アカウントのセッションプール
+==============================
+
+機能：
+- 認証情報ファイル (JSON) から複数アカウントを読み込み、アカウント毎に専用のブラウザプロファイル
+  （永続コンテキスト）でセッションを管理
+- ジョブ毎にセッションを貸し出し (lease)、空いていて制限に掛かっていないアカウントを順に使う
+- アカウント毎のペース配分
+  - 一定時間あたりのリクエスト数の上限（超えたら時間枠が変わるまで貸し出さない）
+  - 同じアカウントを連続で貸し出す最小間隔
+  - 429 (Too Many Requests) を受けたアカウントは一定時間休ませ、他のアカウントへ切り替え
+- プールの稼働率とアカウント毎のリクエスト数を stats() / format_stats() で取得可能
+
+認証情報ファイルは accounts.example.json を accounts.json にコピーして編集してください:
+    [
+        {"name": "main", "email": "a@example.com", "password": "...", "username": "account_a"},
+        {"name": "sub",  "email": "b@example.com", "password": "...", "username": "account_b"}
+    ]
+accounts.json（平文のパスワード）と .pw-profiles/（アカウント毎のセッション Cookie）は
+.gitignore 済みです。コミットしないでください。
+
+ファイルを指定しない場合は .env の TWITTER_EMAIL / TWITTER_PASSWORD / TWITTER_ID の1アカウントで動作します。
+"""
+
+import asyncio
+import email.utils
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+
+from browser_session import launch_session_context, session_page, ensure_logged_in, SESSION_PROFILE_DIR
+from stage_metrics import count
+
+# 認証情報ファイルの既定パス
+ACCOUNTS_FILE = os.getenv("TWITTER_ACCOUNTS_FILE", "accounts.json")
+# アカウント毎のプロファイルを置くディレクトリ
+ACCOUNT_PROFILE_ROOT = ".pw-profiles"
+# リクエスト数を数える時間枠（秒）と、その間の上限
+ACCOUNT_REQUEST_WINDOW = 15 * 60
+ACCOUNT_REQUEST_BUDGET = 450
+# 429 を受けた場合に休ませる時間（秒）。x-rate-limit-reset ヘッダーがあればそちらを優先
+ACCOUNT_THROTTLE_COOLDOWN = 5 * 60
+# 同じアカウントを連続で貸し出す最小間隔（秒）
+ACCOUNT_MIN_LEASE_INTERVAL = 2.0
+# 1アカウントを同時に貸し出せる数（貸し出し毎に同じコンテキスト内の別ページを使う）
+ACCOUNT_MAX_CONCURRENT_LEASES = 4
+# 空きアカウントを待つときの確認間隔（秒）
+_LEASE_POLL_INTERVAL = 0.5
+
+
+def load_accounts(path=ACCOUNTS_FILE, default_profile_dir=SESSION_PROFILE_DIR):
+    """
+    認証情報ファイルを読み込む
+
+    パラメータ:
+        path: 認証情報ファイルのパス
+        default_profile_dir: ファイルがない場合に .env のアカウントで使うプロファイル
+
+    戻り値:
+        アカウント情報 (dict) のリスト。ファイルがない場合は .env の1アカウント
+    """
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            accounts = json.load(f)
+        if not isinstance(accounts, list) or not accounts:
+            raise ValueError(f"認証情報ファイルの形式が不正です (アカウントのリストが必要): {path}")
+        for index, account in enumerate(accounts):
+            if not account.get("email") or not account.get("password"):
+                raise ValueError(f"{index + 1}件目のアカウントに email / password がありません: {path}")
+            account.setdefault("name", account.get("username") or f"account{index + 1}")
+        print(f"👥 認証情報ファイルから {len(accounts)} アカウントを読み込みました: {path}")
+        return accounts
+    return [{
+        'name': "default",
+        'email': os.getenv("TWITTER_EMAIL"),
+        'password': os.getenv("TWITTER_PASSWORD"),
+        'username': os.getenv("TWITTER_ID"),
+        'profile_dir': default_profile_dir,
+    }]
+
+
+def _rate_limit_reset_seconds(headers):
+    """x-rate-limit-reset (epoch 秒) または retry-after から待ち時間を求める"""
+    reset = headers.get("x-rate-limit-reset")
+    if reset and reset.isdigit():
+        return max(0.0, int(reset) - time.time())
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+class AccountSession:
+    """1アカウント分のセッション（ブラウザコンテキストとペース配分の状態）"""
+
+    def __init__(self, account):
+        self.account = account
+        self.name = account['name']
+        self.profile_dir = account.get('profile_dir') or os.path.join(ACCOUNT_PROFILE_ROOT, self.name)
+        self.context = None
+        self.logged_in = False
+        self._idle_pages = []
+        self.active_leases = 0
+        self.total_leases = 0
+        self.requests = 0
+        self.throttled_count = 0
+        self.throttled_until = 0.0
+        self.busy_seconds = 0.0
+        self._window_started = time.monotonic()
+        self._window_requests = 0
+        self._last_lease = 0.0
+        self._open_lock = asyncio.Lock()
+
+    def credentials(self):
+        return {
+            'email': self.account.get('email'),
+            'password': self.account.get('password'),
+            'username': self.account.get('username'),
+        }
+
+    def available_in(self, now):
+        """貸し出し可能になるまでの秒数（0 ならすぐに貸し出せる）"""
+        if now - self._window_started >= ACCOUNT_REQUEST_WINDOW:
+            self._window_started = now
+            self._window_requests = 0
+        waits = [self.throttled_until - now, self._last_lease + ACCOUNT_MIN_LEASE_INTERVAL - now]
+        if self._window_requests >= ACCOUNT_REQUEST_BUDGET:
+            waits.append(self._window_started + ACCOUNT_REQUEST_WINDOW - now)
+        return max(0.0, *waits)
+
+    def on_response(self, response):
+        """X の API 通信を数え、429 を受けたら一定時間休ませる"""
+        if "/i/api/" not in response.url:
+            return
+        self.requests += 1
+        self._window_requests += 1
+        count("api_requests")
+        if response.status == 429:
+            count("rate_limited")
+            cooldown = _rate_limit_reset_seconds(response.headers) or ACCOUNT_THROTTLE_COOLDOWN
+            self.throttled_until = max(self.throttled_until, time.monotonic() + cooldown)
+            self.throttled_count += 1
+            print(f"⏳ アカウント {self.name} がレート制限を受けました。{cooldown:.0f}秒間は他のアカウントを使います")
+
+    def stats(self):
+        now = time.monotonic()
+        return {
+            'name': self.name,
+            'requests': self.requests,
+            'window_requests': self._window_requests,
+            'leases': self.total_leases,
+            'active_leases': self.active_leases,
+            'throttled': self.throttled_count,
+            'throttled_for': max(0.0, self.throttled_until - now),
+            'busy_seconds': self.busy_seconds,
+            'logged_in': self.logged_in,
+        }
+
+
+class SessionPool:
+    """
+    アカウント毎のセッションを貸し出すプール
+
+    パラメータ:
+        playwright: async_playwright() のインスタンス
+        accounts: load_accounts() の戻り値
+        login: login(page, email=..., password=..., username=...) でログインする async 関数
+        headless: ヘッドレスで起動するか
+        context_options: launch_persistent_context に渡す追加オプション
+        on_context: コンテキスト起動直後に on_context(context) で呼ばれる async 関数（通信制限の適用など）
+    """
+
+    def __init__(self, playwright, accounts, login, headless=False, context_options=None, on_context=None):
+        self.playwright = playwright
+        self.sessions = [AccountSession(account) for account in accounts]
+        self.login = login
+        self.headless = headless
+        self.context_options = context_options or {}
+        self.on_context = on_context
+        self._started = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def lease(self):
+        """
+        セッションを1つ借りる（空くまで待つ）
+
+        貸し出し毎に専用のページを渡すため、同じアカウントを同時に借りてもページは衝突しない。
+
+        使い方:
+            async with pool.lease() as (session, page):
+                await search_videos(page, ...)
+        """
+        session = await self._acquire()
+        started = time.monotonic()
+        page = None
+        try:
+            page = session._idle_pages.pop() if session._idle_pages else await session.context.new_page()
+            yield session, page
+        finally:
+            session.busy_seconds += time.monotonic() - started
+            session.active_leases -= 1
+            if page is not None and not page.is_closed():
+                session._idle_pages.append(page)
+
+    async def close(self):
+        """全セッションのブラウザを閉じる（プロファイルへ Cookie が書き出される）"""
+        for session in self.sessions:
+            if session.context is not None:
+                try:
+                    await session.context.close()
+                except Exception as e:
+                    print(f"⚠️ アカウント {session.name} のブラウザ終了中にエラー: {e}")
+                session.context = None
+                session._idle_pages = []
+
+    def stats(self):
+        """プールの稼働率とアカウント毎の統計"""
+        elapsed = time.monotonic() - self._started
+        busy = sum(session.busy_seconds for session in self.sessions)
+        return {
+            'accounts': len(self.sessions),
+            'utilisation': busy / (elapsed * len(self.sessions)) if elapsed > 0 and self.sessions else 0.0,
+            'requests': sum(session.requests for session in self.sessions),
+            'sessions': [session.stats() for session in self.sessions],
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        lines = [f"アカウント{s['accounts']}件, 稼働率 {s['utilisation'] * 100:.0f}%, APIリクエスト {s['requests']}件"]
+        for a in s['sessions']:
+            lines.append(f"  - {a['name']}: リクエスト{a['requests']}件, 貸し出し{a['leases']}回, "
+                         f"レート制限{a['throttled']}回, 稼働{a['busy_seconds']:.0f}秒")
+        return "\n".join(lines)
+
+    async def _acquire(self):
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                candidates = [s for s in self.sessions
+                              if s.active_leases < ACCOUNT_MAX_CONCURRENT_LEASES and s.available_in(now) == 0]
+                if candidates:
+                    # 空いているアカウントの中で、直近のリクエストが少ないものを優先する
+                    session = min(candidates, key=lambda s: (s.active_leases, s._window_requests, s.total_leases))
+                    session.active_leases += 1
+                    session.total_leases += 1
+                    session._last_lease = now
+                else:
+                    session = None
+                    waits = [s.available_in(now) for s in self.sessions]
+                    wait = max(_LEASE_POLL_INTERVAL, min(waits))
+            if session is None:
+                await asyncio.sleep(min(wait, 30.0))
+                continue
+            try:
+                await self._open(session)
+            except Exception:
+                session.active_leases -= 1
+                raise
+            if session.logged_in:
+                return session
+            # ログインできないアカウントは長めに休ませて他を使う
+            session.active_leases -= 1
+            session.throttled_until = time.monotonic() + ACCOUNT_THROTTLE_COOLDOWN
+            if all(not s.logged_in and s.context is not None for s in self.sessions):
+                raise RuntimeError("ログインできるアカウントがありません")
+
+    async def _open(self, session):
+        """セッションのブラウザを起動し、必要ならログインする"""
+        async with session._open_lock:
+            if session.context is None:
+                session.context = await launch_session_context(
+                    self.playwright, session.profile_dir, headless=self.headless, **self.context_options)
+                session.context.on("response", session.on_response)
+                if self.on_context:
+                    await self.on_context(session.context)
+                session._idle_pages = [await session_page(session.context)]
+            if not session.logged_in:
+                print(f"👤 アカウント {session.name} のセッションを確認します")
+                credentials = session.credentials()
+                page = session._idle_pages[0] if session._idle_pages else await session.context.new_page()
+                session.logged_in = await ensure_logged_in(page, lambda page: self.login(page, **credentials))
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'; // Import NextRequest
-import { spawn } from 'child_process';
-import path from 'path';
+
+// 常駐スクレイピングサービス (scrape_daemon.py) のURL
+const SCRAPE_DAEMON_URL = process.env.SCRAPE_DAEMON_URL || 'http://127.0.0.1:8765';
 
 export async function POST(request: NextRequest) { // Add request parameter
   console.log('Scraping API endpoint called');
@@ -22,50 +23,50 @@ export async function POST(request: NextRequest) { // Add request parameter
     return NextResponse.json({ success: false, message: '検索キーワードが必要です。' }, { status: 400 });
   }
 
-  // Pythonスクリプトのパスをプロジェクトルートからの相対パスで指定
-  // process.cwd() はプロジェクトのルートディレクトリを指す想定
-  const scriptPath = path.join(process.cwd(), 'twitter_video_search.py');
-  const args: string[] = [scriptPath, query]; // Add query as positional argument
-
-  if (limit !== undefined && !isNaN(limit)) {
-    args.push('--limit', String(limit)); // Add limit as option if provided
-  }
-  // Add other necessary arguments like --save if needed by default
-  args.push('--save'); // Assuming we always want to save results
-
-  console.log(`Attempting to execute script: python ${args.join(' ')}`);
-
-  return new Promise((resolve) => {
-    // Set PYTHONIOENCODING to utf-8 for the spawned process
-    const pythonProcess = spawn('python', args, {
-      env: { ...process.env, PYTHONIOENCODING: 'utf-8' },
-    });
-
-    let stdout = '';
-    let stderr = '';
-
-    pythonProcess.stdout.on('data', (data) => {
-      console.log(`stdout: ${data}`);
-      stdout += data.toString();
-    });
-
-    pythonProcess.stderr.on('data', (data) => {
-      console.error(`stderr: ${data}`);
-      stderr += data.toString();
-    });
-
-    pythonProcess.on('close', (code) => {
-      console.log(`Python script exited with code ${code}`); // 終了コードログ
-      if (code === 0) {
-        resolve(NextResponse.json({ success: true, message: 'スクレイピングが正常に開始されました。', output: stdout }));
-      } else {
-        resolve(NextResponse.json({ success: false, message: `スクレイピングの開始に失敗しました。エラーコード: ${code}`, error: stderr }, { status: 500 }));
-      }
+  // ジョブを登録するだけで、スクレイピングの完了は待たない
+  try {
+    const response = await fetch(`${SCRAPE_DAEMON_URL}/jobs`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ query, limit: limit !== undefined && !isNaN(limit) ? limit : undefined }),
     });
+    const data = await response.json();
+    if (!response.ok) {
+      console.error('Scrape daemon rejected the job:', data);
+      return NextResponse.json({ success: false, message: data.error || 'ジョブの登録に失敗しました。' }, { status: response.status });
+    }
+    console.log(`Scrape job queued: ${data.job_id}`);
+    return NextResponse.json({
+      success: true,
+      message: `スクレイピングジョブを受け付けました。(ジョブID: ${data.job_id})`,
+      jobId: data.job_id,
+      status: data.status,
+      output: '',
+    }, { status: 202 });
+  } catch (err) {
+    console.error('Failed to reach scrape daemon.', err);
+    return NextResponse.json({
+      success: false,
+      message: 'スクレイピングサービスに接続できません。python scrape_daemon.py が起動しているか確認してください。',
+      error: err instanceof Error ? err.message : String(err),
+    }, { status: 503 });
+  }
+}
 
-    pythonProcess.on('error', (err) => {
-      console.error('Failed to start subprocess.', err); // プロセス開始エラーログ
-      resolve(NextResponse.json({ success: false, message: 'スクレイピングプロセスの開始に失敗しました。', error: err.message }, { status: 500 }));
-    });
-  });
+// ジョブの状態と結果を取得する (/api/scrape?jobId=...)
+export async function GET(request: NextRequest) {
+  const jobId = request.nextUrl.searchParams.get('jobId');
+  const target = jobId ? `${SCRAPE_DAEMON_URL}/jobs/${encodeURIComponent(jobId)}` : `${SCRAPE_DAEMON_URL}/jobs`;
+  try {
+    const response = await fetch(target, { cache: 'no-store' });
+    const data = await response.json();
+    return NextResponse.json({ success: response.ok, ...data }, { status: response.status });
+  } catch (err) {
+    console.error('Failed to reach scrape daemon.', err);
+    return NextResponse.json({
+      success: false,
+      message: 'スクレイピングサービスに接続できません。',
+      error: err instanceof Error ? err.message : String(err),
+    }, { status: 503 });
+  }
 }
@@ -8,6 +8,8 @@
  * 3. ソート（いいね数、トレンド、最新）
  * 4. ページネーション処理
  * 5. メタデータの提供（合計数、ページ数など）
+ * 6. ランキング集計ジョブ (ranking_job.py) が作成した TweetRanking からの順位の範囲読み出し
+ *    （未作成の場合は Tweet テーブルを直接並べ替える）
  * 
  * 用途：
  * - フロントエンドへのツイートデータの提供
@@ -19,6 +21,47 @@
 import { NextResponse } from 'next/server';
 import { getDbConnection } from '../../../db';
 
+// ranking_job.py が作成するランキングの期間と並び順
+const RANKING_PERIODS = ['day', 'week', 'month', 'all'];
+const RANKING_SORTS = ['likes', 'total', 'trending', 'latest'];
+
+// 公開中のバージョンのランキングから順位の範囲を読み出す（ランキング未作成の場合は null）
+async function fetchRankedTweets(pool: any, sort: string, period: string, offset: number, limit: number) {
+  const rankingSort = sort === 'combined' ? 'total' : (RANKING_SORTS.includes(sort) ? sort : 'likes');
+  const rankingPeriod = RANKING_PERIODS.includes(period) ? period : 'all';
+  try {
+    const result = await pool.request()
+      .input('period', rankingPeriod)
+      .input('sort', rankingSort)
+      .input('offset', offset)
+      .input('limit', limit)
+      .query(`
+        DECLARE @version INT = (SELECT version FROM [xranking].[dbo].[TweetRankingVersion] WHERE id = 1);
+        SELECT COUNT(*) AS total
+        FROM [xranking].[dbo].[TweetRanking]
+        WHERE version = @version AND period = @period AND sort = @sort;
+        SELECT
+          t.[id], t.[tweetId], t.[content], t.[videoUrl], t.[likes], t.[retweets], t.[views],
+          t.[timestamp], t.[authorName], t.[authorUsername], t.[authorProfileImageUrl],
+          t.[originalUrl], t.[createdAt], t.[updatedAt], r.[rank], r.[score]
+        FROM [xranking].[dbo].[TweetRanking] r
+        JOIN [xranking].[dbo].[Tweet] t ON t.tweetId = r.tweetId
+        WHERE r.version = @version AND r.period = @period AND r.sort = @sort
+          AND r.rank > @offset AND r.rank <= @offset + @limit
+        ORDER BY r.rank;
+      `);
+    const total = result.recordsets[0][0].total;
+    if (!total) {
+      return null;
+    }
+    return { tweets: result.recordsets[1], total };
+  } catch (err) {
+    // ランキング用のテーブルがまだない場合など
+    console.warn('[API] Ranking table unavailable, falling back to live query:', err);
+    return null;
+  }
+}
+
 export async function GET(request: Request) {
   const url = new URL(request.url);
   const sort = url.searchParams.get('sort') || 'likes';
@@ -28,6 +71,29 @@ export async function GET(request: Request) {
 
   try {
     const pool = await getDbConnection();
+
+    // ページネーションのオフセット計算
+    const offset = (page - 1) * limit;
+
+    // 集計済みのランキングがあれば、順位の範囲を読み出すだけで済ませる
+    const ranked = await fetchRankedTweets(pool, sort, period, offset, limit);
+    if (ranked) {
+      const tweets = ranked.tweets.map((tweet: any) => ({
+        ...tweet,
+        timestamp: new Date(tweet.timestamp).toISOString(),
+        createdAt: new Date(tweet.createdAt).toISOString(),
+        updatedAt: new Date(tweet.updatedAt).toISOString()
+      }));
+      return NextResponse.json({
+        tweets,
+        meta: {
+          page,
+          limit,
+          total: ranked.total,
+          pageCount: Math.ceil(ranked.total / limit)
+        }
+      });
+    }
     
     // 期間の条件を構築
     let dateCondition = '';
@@ -67,9 +133,6 @@ export async function GET(request: Request) {
       orderBy = 'ORDER BY likes DESC';
     }
 
-    // ページネーションのオフセット計算
-    const offset = (page - 1) * limit;
-
     console.log('[API] Fetching tweets with video URLs...');
     
     // 簡素化したクエリでまずは全件カウント
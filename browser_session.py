@@ -0,0 +1,120 @@
+"""
+ブラウザセッションの永続化モジュール
+==================================
+
+機能：
+- Playwright の永続コンテキスト（ブラウザプロファイル）で起動し、Cookie とディスクキャッシュを次回以降も再利用
+  （X の JS バンドルを毎回ダウンロードし直さずに済む）
+- ログイン済みかどうかを安価に確認し、セッションが切れている場合だけログイン処理を実行
+  1. プロファイルに auth_token Cookie がなければ即座に「未ログイン」と判定（通信なし）
+  2. Cookie があればホーム画面を開き、ログイン後にだけ表示される要素を短時間待つ
+
+注意：
+- 同じプロファイルは同時に1つのブラウザからしか開けないため、並行して動かすスクリプトは
+  別のプロファイルディレクトリを指定すること
+"""
+
+import os
+import urllib.parse
+
+from nav_guard import open_page
+from stage_metrics import timed
+
+# 既定のプロファイルディレクトリ
+SESSION_PROFILE_DIR = os.getenv("PW_PROFILE_DIR", ".pw-chrome")
+# アクセス先の X のベースURL（負荷試験ではモックサーバー mock_x_server.py の URL を指定する）
+X_BASE_URL = os.getenv("X_BASE_URL", "https://x.com").rstrip("/")
+# 本物の X のホスト名（保存するツイートURLはこれらのまま）
+X_HOSTS = ("x.com", "www.x.com", "twitter.com", "www.twitter.com", "mobile.twitter.com")
+# ログイン確認に開くページ
+SESSION_PROBE_URL = f"{X_BASE_URL}/home"
+# ログイン確認で要素を待つ上限（ミリ秒）
+SESSION_PROBE_TIMEOUT = 15000
+# ログイン済みの場合にだけ表示される要素
+LOGGED_IN_SELECTOR = ", ".join([
+    "a[data-testid='AppTabBar_Home_Link']",
+    "a[aria-label='Home']",
+    "div[aria-label='Home timeline']",
+    "div[data-testid='SideNav_AccountSwitcher_Button']",
+])
+# ログインセッションの Cookie 名
+AUTH_COOKIE_NAME = "auth_token"
+# Cookie を確認するドメイン
+AUTH_COOKIE_URLS = list(dict.fromkeys([X_BASE_URL, "https://x.com", "https://twitter.com"]))
+
+
+def x_url(url):
+    """
+    X のURLまたはパスを、実際にアクセスする X_BASE_URL 上のURLに変換する
+
+    例: X_BASE_URL=http://127.0.0.1:8780 のとき
+        "/i/flow/login"                         -> "http://127.0.0.1:8780/i/flow/login"
+        "https://twitter.com/user/status/123"   -> "http://127.0.0.1:8780/user/status/123"
+    既定 (https://x.com) では絶対URLはそのまま返す
+    """
+    if url.startswith("/"):
+        return X_BASE_URL + url
+    if X_BASE_URL == "https://x.com":
+        return url
+    parsed = urllib.parse.urlsplit(url)
+    if parsed.hostname not in X_HOSTS:
+        return url
+    base = urllib.parse.urlsplit(X_BASE_URL)
+    return urllib.parse.urlunsplit((base.scheme, base.netloc, parsed.path, parsed.query, parsed.fragment))
+
+
+def has_auth_cookie(cookies):
+    """Cookie 一覧にログインセッションの Cookie が含まれるか"""
+    return any(cookie.get("name") == AUTH_COOKIE_NAME and cookie.get("value") for cookie in cookies)
+
+
+async def launch_session_context(playwright, profile_dir=SESSION_PROFILE_DIR, headless=False, **options):
+    """
+    プロファイルディレクトリを使う永続コンテキストで Chromium を起動する
+
+    戻り値:
+        BrowserContext (閉じるときは context.close())
+    """
+    os.makedirs(profile_dir, exist_ok=True)
+    context = await playwright.chromium.launch_persistent_context(profile_dir, headless=headless, **options)
+    print(f"🌐 ブラウザプロファイルを使用: {os.path.abspath(profile_dir)}")
+    return context
+
+
+async def session_page(context):
+    """コンテキストの既存ページ（起動時に開かれるタブ）を返す。なければ新規作成"""
+    return context.pages[0] if context.pages else await context.new_page()
+
+
+async def is_logged_in(page):
+    """セッションが有効か（ログイン済みか）を確認する"""
+    if not has_auth_cookie(await page.context.cookies(AUTH_COOKIE_URLS)):
+        print("ℹ️ 保存済みのログインセッションがありません")
+        return False
+    try:
+        await open_page(page, SESSION_PROBE_URL, LOGGED_IN_SELECTOR, "probe")
+    except Exception as e:
+        print(f"ℹ️ 保存済みのログインセッションが無効です: {e}")
+        return False
+    return True
+
+
+async def ensure_logged_in(page, login):
+    """
+    セッションが切れている場合だけログインする
+
+    パラメータ:
+        page: Playwrightのページオブジェクト
+        login: login(page) でログインし、成功時に True を返す async 関数
+
+    戻り値:
+        ログイン済みなら True
+    """
+    if await is_logged_in(page):
+        print("✅ 保存済みのセッションでログイン済みです（ログイン処理を省略）")
+        return True
+    with timed("login") as timer:
+        logged_in = await login(page)
+        if not logged_in:
+            timer.fail()
+    return logged_in
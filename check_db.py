@@ -1,31 +1,12 @@
-import pyodbc
-import sys
-import os
-from dotenv import load_dotenv
+from db_pool import connect, describe_connection
 
 def main():
-    # 環境変数を読み込む
-    load_dotenv()
-    
-    # データベース接続情報を取得
-    server = os.getenv("SQL_SERVER")
-    database = os.getenv("SQL_DATABASE")
-    user = os.getenv("SQL_USER")
-    password = os.getenv("SQL_PASSWORD")
-    
     # 接続情報を表示
-    print(f"接続先: SERVER={server}, DATABASE={database}, USER={user}")
+    print(f"接続先: {describe_connection(prefer_sql_env=True)}")
     
     # データベース接続
     try:
-        conn = pyodbc.connect(
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-            f"SERVER={server};"
-            f"DATABASE={database};"
-            f"UID={user};"
-            f"PWD={password};"
-            f"TrustServerCertificate=yes;"
-        )
+        conn = connect(prefer_sql_env=True)
         
         cursor = conn.cursor()
         
@@ -1,30 +1,11 @@
-import os
 import pyodbc
-from dotenv import load_dotenv
-
-# .env ファイルから環境変数を読み込む
-load_dotenv()
+from db_pool import connect, describe_connection
 
 def clear_all_tweets():
     """データベース内のツイートを全て削除する関数"""
     try:
-        # 環境変数から設定を取得
-        server = os.getenv('SQL_SERVER', 'localhost\\SQLEXPRESS')
-        database = os.getenv('SQL_DATABASE', 'xranking')
-        username = os.getenv('SQL_USER', 'sa')
-        password = os.getenv('SQL_PASSWORD', '')
-        
-        print(f"接続情報: サーバー={server}, データベース={database}, ユーザー={username}")
-        
-        # 接続文字列の表示（パスワードはマスク）
-        conn_str = f"DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={'*' * len(password) if password else ''};TrustServerCertificate=yes;"
-        print(f"接続文字列: {conn_str}")
-        
-        # 実際の接続文字列（パスワードを含む）
-        real_conn_str = f"DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};TrustServerCertificate=yes;"
-        
-        # 接続
-        conn = pyodbc.connect(real_conn_str)
+        # 接続（従来どおり SQL_* 変数を DATABASE_URL より優先する）
+        conn = connect(prefer_sql_env=True)
         print("✅ データベース接続成功！")
         
         cursor = conn.cursor()
@@ -60,7 +41,8 @@ def clear_all_tweets():
             print("データベース接続を閉じました")
 
 if __name__ == "__main__":
-    # ユーザーに確認
+    # 削除する接続先を表示してからユーザーに確認（パスワードはマスク）
+    print(f"接続先: {describe_connection(prefer_sql_env=True)}")
     confirm = input("データベース内のツイートを全て削除します。この操作は元に戻せません。続行しますか？ (y/n): ")
     if confirm.lower() == 'y':
         clear_all_tweets()
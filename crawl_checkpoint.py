@@ -0,0 +1,189 @@
+"""
+検索クロールのチェックポイント
+============================
+
+機能：
+- キーワード毎のクロールの進捗（GraphQL の下方向カーソル、最後に取得したツイートID、件数、日時）を JSON に保存
+- 異常終了や再起動の後は、保存したカーソルを最初の SearchTimeline リクエストに差し込み、
+  取得済みの範囲をスクロールし直さずに続きから再開
+- 保存キュー（ライトビハインド）に積んだだけでまだDBに書かれていないツイートを飛ばさないよう、
+  カーソルは「そこまでのツイートが全て保存処理を終えた」時点のものだけを記録する
+
+チェックポイントは CHECKPOINT_DIR にキーワード毎のファイルとして保存されます。
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import time
+import urllib.parse
+
+# チェックポイントの保存先
+CHECKPOINT_DIR = ".crawl_checkpoints"
+# チェックポイントを書き出す最小間隔（秒）
+CHECKPOINT_SAVE_INTERVAL = 5.0
+
+# カーソルを差し込む検索結果の GraphQL リクエスト
+_SEARCH_TIMELINE_PATTERN = "**/SearchTimeline*"
+
+
+def _checkpoint_path(keyword):
+    """キーワードからファイル名を作る（記号を除いた名前 + 衝突防止のハッシュ）"""
+    digest = hashlib.sha1(keyword.encode("utf-8")).hexdigest()[:10]
+    slug = re.sub(r"[^\w\-]+", "_", keyword, flags=re.UNICODE).strip("_")[:40] or "keyword"
+    return os.path.join(CHECKPOINT_DIR, f"{slug}-{digest}.json")
+
+
+def _now():
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+class CrawlCheckpoint:
+    """
+    1キーワード分のクロールの進捗
+
+    使い方:
+        checkpoint = CrawlCheckpoint.open(keyword, resume=True)
+        if checkpoint.cursor:
+            await checkpoint.install_resume(page)   # page.goto より前
+        ...
+        checkpoint.track(capture.drained_cursor, enqueued_total, last_tweet_id)
+        checkpoint.flush_safe(written_total)
+        ...
+        checkpoint.finish(stop_reason, completed, written_total)
+    """
+
+    def __init__(self, keyword, path=None):
+        self.keyword = keyword
+        self.path = path or _checkpoint_path(keyword)
+        self.cursor = None
+        self.last_tweet_id = None
+        self.collected = 0
+        self.runs = 0
+        self.started_at = _now()
+        self.updated_at = None
+        self.completed = False
+        self.stop_reason = None
+        self.resumed_from = None
+        # (この時点までに保存キューへ積んだ件数, その時点のカーソル, 最後のツイートID)
+        self._pending = []
+        self._last_saved = 0.0
+        self._route = None
+
+    @classmethod
+    def open(cls, keyword, resume=False):
+        """
+        チェックポイントを開く
+
+        resume=True で未完了のチェックポイントがあれば読み込み、それ以外は新しく開始する。
+        """
+        checkpoint = cls(keyword)
+        if resume and os.path.exists(checkpoint.path):
+            try:
+                with open(checkpoint.path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ チェックポイントの読み込みに失敗しました。最初から開始します: {e}")
+                data = None
+            if data and not data.get("completed") and data.get("cursor"):
+                checkpoint.cursor = data["cursor"]
+                checkpoint.resumed_from = data["cursor"]
+                checkpoint.last_tweet_id = data.get("last_tweet_id")
+                checkpoint.collected = data.get("collected", 0)
+                checkpoint.runs = data.get("runs", 0)
+                checkpoint.started_at = data.get("started_at") or checkpoint.started_at
+                print(f"♻️ チェックポイントから再開します: '{keyword}' (取得済み {checkpoint.collected}件, "
+                      f"最終更新 {data.get('updated_at')})")
+            elif data and data.get("completed"):
+                print(f"ℹ️ '{keyword}' の前回のクロールは完了しています。最初から開始します")
+        checkpoint.runs += 1
+        return checkpoint
+
+    async def install_resume(self, page):
+        """最初の SearchTimeline リクエストに保存したカーソルを差し込む（page.goto より前に呼ぶ）"""
+        cursor = self.cursor
+
+        async def handler(route):
+            request = route.request
+            await self.remove_resume(page)
+            try:
+                if request.method == "POST" and request.post_data:
+                    body = json.loads(request.post_data)
+                    body.setdefault("variables", {})["cursor"] = cursor
+                    await route.continue_(post_data=json.dumps(body))
+                else:
+                    parsed = urllib.parse.urlparse(request.url)
+                    query = urllib.parse.parse_qs(parsed.query)
+                    variables = json.loads(query.get("variables", ["{}"])[0])
+                    variables["cursor"] = cursor
+                    query["variables"] = [json.dumps(variables, separators=(",", ":"))]
+                    url = parsed._replace(query=urllib.parse.urlencode(query, doseq=True)).geturl()
+                    await route.continue_(url=url)
+                print("♻️ 保存したカーソルで検索結果の続きを要求しました")
+            except Exception as e:
+                print(f"⚠️ カーソルの差し込みに失敗しました。最初から取得します: {e}")
+                await route.continue_()
+
+        self._route = (_SEARCH_TIMELINE_PATTERN, handler)
+        await page.route(*self._route)
+
+    async def remove_resume(self, page):
+        """カーソルの差し込みが未使用のまま残っていれば解除する（ページを使い回すため）"""
+        if self._route:
+            pattern, handler = self._route
+            self._route = None
+            try:
+                await page.unroute(pattern, handler)
+            except Exception:
+                pass
+
+    def track(self, cursor, enqueued_total, last_tweet_id=None):
+        """保存キューへ積んだ累計件数と、その時点のカーソルを記録する"""
+        if cursor:
+            self._pending.append((enqueued_total, cursor, last_tweet_id))
+
+    def flush_safe(self, written_total, force=False):
+        """
+        保存処理を終えた件数 (written_total) までのカーソルを確定し、一定間隔でファイルに書き出す
+        """
+        safe = None
+        while self._pending and self._pending[0][0] <= written_total:
+            safe = self._pending.pop(0)
+        if safe:
+            _, self.cursor, tweet_id = safe
+            if tweet_id:
+                self.last_tweet_id = tweet_id
+        if force or time.monotonic() - self._last_saved >= CHECKPOINT_SAVE_INTERVAL:
+            self.save()
+
+    def finish(self, stop_reason, completed, written_total):
+        """クロール終了時に書き出す（completed=True の場合は次回は最初から）"""
+        self.stop_reason = stop_reason
+        self.completed = completed
+        self.flush_safe(written_total, force=True)
+
+    def save(self):
+        """チェックポイントをファイルへ書き出す（一時ファイル経由で置き換え）"""
+        self.updated_at = _now()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            'keyword': self.keyword,
+            'cursor': self.cursor,
+            'last_tweet_id': self.last_tweet_id,
+            'collected': self.collected,
+            'runs': self.runs,
+            'started_at': self.started_at,
+            'updated_at': self.updated_at,
+            'completed': self.completed,
+            'stop_reason': self.stop_reason,
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._last_saved = time.monotonic()
+        except OSError as e:
+            print(f"⚠️ チェックポイントの保存に失敗: {e}")
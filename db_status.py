@@ -1,33 +1,16 @@
 """
 データベースの状態を確認するスクリプト
 """
-import os
 import pyodbc
-from dotenv import load_dotenv
-
-# .env ファイルの読み込み
-load_dotenv()
+from db_pool import connect, describe_connection
 
 def check_db_status():
     """データベースの状態を確認"""
     try:
-        # 環境変数から設定を取得
-        server = os.getenv('SQL_SERVER', 'localhost')
-        database = os.getenv('SQL_DATABASE', 'xranking')
-        username = os.getenv('SQL_USER', 'sa')
-        password = os.getenv('SQL_PASSWORD', '')
-        
-        print(f"接続情報: サーバー={server}, データベース={database}, ユーザー={username}")
+        print(f"接続情報: {describe_connection(prefer_sql_env=True)}")
         
         # 接続
-        conn = pyodbc.connect(
-            "DRIVER={ODBC Driver 17 for SQL Server};"
-            f"SERVER={server};"
-            f"DATABASE={database};"
-            f"UID={username};"
-            f"PWD={password};"
-            "TrustServerCertificate=yes;"
-        )
+        conn = connect(prefer_sql_env=True)
         print("✅ データベース接続成功！")
         
         cursor = conn.cursor()
@@ -0,0 +1,175 @@
+"""
+タイムラインDOMの差分収集モジュール
+==================================
+
+機能：
+- ページ内に MutationObserver を注入し、新しく挿入されたツイート要素 (article) だけをキューに積む
+- Python 側はキューをまとめて取り出すだけで済むため、スクロール毎のコストは新規ツイート数に比例
+- X はタイムラインを仮想化しており、画面外に出た要素はDOMから削除されるが、
+  キューが要素への参照を保持するため取りこぼしが発生しない
+- 動画の src がまだ設定されていないツイートは待機リストに回し、src が付いた時点（または待機回数の上限）で取り出す
+- ツイートカードの内容（メトリクス、ユーザー情報、本文、URL、動画）は1回の page.evaluate でまとめてJSON化する
+
+注意：
+- page.goto でページが切り替わるとキューは破棄されるため、遷移後に再度 install_tweet_observer を呼ぶこと
+"""
+
+TWEET_SELECTOR = 'article[data-testid="tweet"]'
+
+# 動画の src 設定を待つ最大回数（取り出し呼び出しの回数。超えたら src なしのまま取り出す）
+VIDEO_SRC_MAX_WAITS = 5
+
+# ページ内に差分収集用のオブザーバーを設置するスクリプト (二重設置はしない)
+_INSTALL_OBSERVER_JS = """
+([selector, maxWaits]) => {
+    if (window.__xrHarvest) {
+        return window.__xrHarvest.queue.length;
+    }
+    const state = { queue: [], queued: 0, seen: new WeakSet(), waiting: [], waits: new WeakMap() };
+    // <video> はあるが src がまだ付いていない（遅延読み込み中の）ツイート
+    const videoPending = (article) => {
+        const video = article.querySelector('video');
+        if (!video) return false;
+        const source = video.querySelector('source');
+        return !(video.getAttribute('src') || (source && source.getAttribute('src')));
+    };
+    const waitDone = (article) => !article.isConnected || !videoPending(article);
+    const enqueue = (article) => {
+        if (state.seen.has(article)) return;
+        state.seen.add(article);
+        state.queue.push(article);
+        state.queued++;
+    };
+    const scan = (node) => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+        if (node.matches(selector)) enqueue(node);
+        node.querySelectorAll(selector).forEach(enqueue);
+    };
+    state.observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            mutation.addedNodes.forEach(scan);
+        }
+    });
+    state.observer.observe(document.body, { childList: true, subtree: true });
+    state.drain = (max) => {
+        const ready = [];
+        const waiting = [];
+        for (const article of state.waiting) {
+            const waits = (state.waits.get(article) || 0) + 1;
+            state.waits.set(article, waits);
+            if (waitDone(article) || waits >= maxWaits) ready.push(article);
+            else waiting.push(article);
+        }
+        for (const article of state.queue.splice(0, max > 0 ? max : state.queue.length)) {
+            if (article.isConnected && videoPending(article)) waiting.push(article);
+            else ready.push(article);
+        }
+        state.waiting = waiting;
+        return ready;
+    };
+    // 取り出せるツイートがあるか（待機中のツイートは src が付いたものだけ数える）
+    state.ready = () => state.queue.length > 0 || state.waiting.some(waitDone);
+    scan(document.body);
+    window.__xrHarvest = state;
+    return state.queue.length;
+}
+"""
+
+# ツイートカード1件をJSON化する関数（ページ内で実行）
+# メトリクスは丸め表記のテキストに加えて、正確な値を含む aria-label も返す
+_EXTRACT_CARD_FN = """
+(article) => {
+    const query = (selector) => article.querySelector(selector);
+    const attr = (selector, name) => {
+        const el = query(selector);
+        return el ? el.getAttribute(name) : null;
+    };
+    const text = (selector) => {
+        const el = query(selector);
+        return el ? el.textContent : null;
+    };
+    // 投稿日時のリンクがツイート本体のURL (/user/status/123)
+    const timeLink = query('a[href*="/status/"] time');
+    let statusHref = timeLink ? timeLink.closest('a').getAttribute('href') : null;
+    if (!statusHref) {
+        const links = Array.from(article.querySelectorAll('a[href*="/status/"]'));
+        const match = links.map((a) => a.getAttribute('href')).find((href) => /\/status\/\d+$/.test(href));
+        statusHref = match || null;
+    }
+    const video = query('video');
+    return {
+        status_href: statusHref,
+        posted_at: attr('time', 'datetime'),
+        likes_label: attr('[data-testid="like"], [data-testid="unlike"]', 'aria-label'),
+        likes_text: text('[data-testid="like"] span span, [data-testid="unlike"] span span'),
+        retweets_label: attr('[data-testid="retweet"], [data-testid="unretweet"]', 'aria-label'),
+        retweets_text: text('[data-testid="retweet"] span span, [data-testid="unretweet"] span span'),
+        views_label: attr('a[href*="/analytics"]', 'aria-label'),
+        views_text: text('a[href*="/analytics"]'),
+        username_href: attr('div[data-testid="User-Name"] a[href^="/"]', 'href'),
+        display_name: text('div[data-testid="User-Name"] a span'),
+        profile_image_url: attr('img[src*="profile_images"]', 'src'),
+        tweet_text: text('div[data-testid="tweetText"]'),
+        video_src: video ? (video.getAttribute('src') || attr('video source', 'src')) : null,
+        video_poster: video ? video.getAttribute('poster') : null,
+    };
+}
+"""
+
+# キューから取り出したツイートを、その場でまとめてJSON化する
+_DRAIN_CARDS_JS = f"""
+(max) => {{
+    if (!window.__xrHarvest) return [];
+    const extractCard = {_EXTRACT_CARD_FN};
+    return window.__xrHarvest.drain(max).map(extractCard);
+}}
+"""
+
+# 表示中の全ツイートを1回の呼び出しでJSON化する
+_EXTRACT_PAGE_CARDS_JS = f"(articles) => articles.map({_EXTRACT_CARD_FN})"
+
+_PENDING_JS = "() => window.__xrHarvest ? window.__xrHarvest.queue.length + window.__xrHarvest.waiting.length : 0"
+
+# 取り出せるツイートが届いたかを判定する式 (page.wait_for_function 用)
+HARVEST_READY_JS = "() => !!window.__xrHarvest && window.__xrHarvest.ready()"
+
+
+async def install_tweet_observer(page):
+    """
+    ツイート要素の差分収集を開始する
+
+    設置時点で既に表示されているツイートもキューに入る。
+
+    戻り値:
+        キューに入っているツイート数
+    """
+    return await page.evaluate(_INSTALL_OBSERVER_JS, [TWEET_SELECTOR, VIDEO_SRC_MAX_WAITS])
+
+
+async def pending_tweet_count(page):
+    """キューに溜まっている未処理のツイート数を返す（動画の src 待ちを含む）"""
+    return await page.evaluate(_PENDING_JS)
+
+
+async def drain_tweet_cards(page, max_items=0):
+    """
+    キューから新規ツイートを取り出し、内容を1回の呼び出しでまとめて取得する
+
+    パラメータ:
+        page: Playwrightのページオブジェクト
+        max_items: 取り出す最大件数 (0 の場合は全件)
+
+    戻り値:
+        カード情報 (dict) のリスト。数値化は呼び出し側で行う
+    """
+    return await page.evaluate(_DRAIN_CARDS_JS, max_items)
+
+
+async def extract_page_cards(page):
+    """ページに表示中の全ツイートの内容を1回の呼び出しで取得する（表示順）"""
+    return await page.eval_on_selector_all(TWEET_SELECTOR, _EXTRACT_PAGE_CARDS_JS)
+
+
+async def extract_card(tweet):
+    """ツイート要素 (ElementHandle) 1件の内容を1回の呼び出しで取得する"""
+    return await tweet.evaluate(_EXTRACT_CARD_FN)
@@ -0,0 +1,360 @@
+"""
+抽出処理のオフラインベンチマーク
+==============================
+
+機能：
+- 保存済みの X のページ (HTML) をローカルのブラウザに読み込み、ツイートカードを複製して数千件にする
+  （スクリプトは取り除き、通信は全て遮断するため、ネットワークにもログインにも依存しない）
+- 以下の抽出処理を同じカードに対して実行し、結果を比較する
+  - per_card:  要素毎に extract_tweet_metrics + extract_user_info（従来方式。1件あたり2回の呼び出し）
+  - page_cards: extract_page_cards で全件を1回の呼び出しで取得し、Python 側で数値化
+  - observer:  install_tweet_observer + drain_tweet_cards（検索時の差分収集）
+  - convert_metric: 表示テキストの数値化のみ、1件ずつ（ブラウザを使わない）
+  - parse_metrics: 同じ表示テキストを metric_parser.parse_metrics で一括変換
+  - graphql:   保存済みの GraphQL レスポンス (JSON) の解析（--json を指定した場合）
+- 件数/秒、1件あたりの p50 / p95 レイテンシ、ブラウザとの通信 (IPC) 回数を表示し、JSON に保存
+- 以前の結果ファイルを --compare で指定すると、件数/秒の変化を表示
+
+使用方法：
+- python extractor_bench.py [--cards 2000] [--repeat 3] [--fixture ページ.html ...] [--json SearchTimeline.json ...]
+- python extractor_bench.py --compare bench_results/extractor-20261017-120000.json
+"""
+
+import argparse
+import asyncio
+import datetime
+import glob
+import json
+import os
+import platform
+import re
+import subprocess
+import time
+
+from playwright.async_api import async_playwright
+
+from dom_harvest import (TWEET_SELECTOR, install_tweet_observer, drain_tweet_cards, extract_page_cards)
+from twitter_video_search import (extract_tweet_metrics, extract_user_info, convert_metric, card_metrics,
+                                  card_user_info, cards_to_video_data)
+from metric_parser import parse_metrics
+from x_graphql import parse_timeline_response
+
+# 既定のフィクスチャ（リポジトリに保存済みのページ）
+BENCH_FIXTURES = ["*.html", os.path.join("html", "*.html")]
+# 複製後のカード数
+BENCH_CARDS = 2000
+# 各ベンチマークの繰り返し回数
+BENCH_REPEAT = 3
+# 結果の保存先
+BENCH_RESULTS_DIR = "bench_results"
+
+_SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+
+# 読み込んだページのツイートカードを count 件になるまで複製する
+_REPLICATE_CARDS_JS = """
+([selector, count]) => {
+    const originals = Array.from(document.querySelectorAll(selector));
+    if (!originals.length) return 0;
+    const container = originals[0].parentElement;
+    let total = originals.length;
+    while (total < count) {
+        const clone = originals[total % originals.length].cloneNode(true);
+        container.appendChild(clone);
+        total++;
+    }
+    return document.querySelectorAll(selector).length;
+}
+"""
+
+
+class IpcCounter:
+    """ブラウザとの通信回数を数えるため、page / ElementHandle の呼び出しを中継する"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def wrap(self, target):
+        return _Counted(target, self)
+
+
+class _Counted:
+    _METHODS = {"evaluate", "eval_on_selector_all", "eval_on_selector", "query_selector_all",
+                "query_selector", "get_attribute", "inner_text", "text_content"}
+
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name not in self._METHODS:
+            return attr
+
+        async def counted(*args, **kwargs):
+            self._counter.calls += 1
+            return await attr(*args, **kwargs)
+        return counted
+
+
+def percentile(values, q):
+    """値のリストの q パーセンタイル（線形補間）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(name, cards, seconds, per_card_seconds, ipc_calls, note=""):
+    """1つのベンチマーク結果を dict にまとめる"""
+    return {
+        'name': name,
+        'cards': cards,
+        'seconds': seconds,
+        'cards_per_sec': cards / seconds if seconds > 0 else 0.0,
+        'p50_ms': percentile(per_card_seconds, 50) * 1000,
+        'p95_ms': percentile(per_card_seconds, 95) * 1000,
+        'ipc_calls': ipc_calls,
+        'ipc_per_card': ipc_calls / cards if cards else 0.0,
+        'note': note,
+    }
+
+
+def load_fixture(path):
+    """保存済みページを読み込み、スクリプトを取り除く"""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return _SCRIPT_RE.sub("", f.read())
+
+
+async def prepare_page(context, html, cards):
+    """フィクスチャを読み込み、カードを cards 件に複製したページを返す"""
+    page = await context.new_page()
+    await page.set_content(html, wait_until="domcontentloaded")
+    total = await page.evaluate(_REPLICATE_CARDS_JS, [TWEET_SELECTOR, cards])
+    return page, total
+
+
+async def bench_per_card(page, repeat):
+    """要素毎に extract_tweet_metrics + extract_user_info を呼ぶ（従来方式）"""
+    counter = IpcCounter()
+    latencies = []
+    cards = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        counted_page = counter.wrap(page)
+        handles = await counted_page.query_selector_all(TWEET_SELECTOR)
+        for handle in handles:
+            tweet = counter.wrap(handle)
+            t0 = time.perf_counter()
+            await extract_tweet_metrics(tweet)
+            await extract_user_info(tweet)
+            latencies.append(time.perf_counter() - t0)
+        cards += len(handles)
+        for handle in handles:
+            await handle.dispose()
+    return summarize("per_card", cards, time.perf_counter() - started, latencies, counter.calls)
+
+
+async def bench_page_cards(page, repeat):
+    """extract_page_cards で1回の呼び出しで全件を取得し、Python 側で数値化する"""
+    counter = IpcCounter()
+    latencies = []
+    cards = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        batch = await extract_page_cards(counter.wrap(page))
+        for card in batch:
+            card_metrics(card)
+            card_user_info(card)
+        # まとめて取得するため、1件あたりは呼び出し全体の時間を件数で割った値
+        latencies.extend([(time.perf_counter() - t0) / max(1, len(batch))] * len(batch))
+        cards += len(batch)
+    return summarize("page_cards", cards, time.perf_counter() - started, latencies, counter.calls,
+                     "1件あたりのレイテンシは1回の取得時間の按分")
+
+
+async def bench_observer(page, repeat, chunk=100):
+    """差分収集のキューから chunk 件ずつ取り出して保存用の形式に変換する（検索時と同じ経路）"""
+    counter = IpcCounter()
+    latencies = []
+    cards = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        counted_page = counter.wrap(page)
+        # 前回の設置を外し、全件をキューに積み直す
+        await counted_page.evaluate("() => { if (window.__xrHarvest) { window.__xrHarvest.observer.disconnect(); "
+                                    "delete window.__xrHarvest; } }")
+        await install_tweet_observer(counted_page)
+        while True:
+            t0 = time.perf_counter()
+            batch = await drain_tweet_cards(counted_page, chunk)
+            if not batch:
+                break
+            cards_to_video_data(batch)
+            latencies.extend([(time.perf_counter() - t0) / len(batch)] * len(batch))
+            cards += len(batch)
+    return summarize("observer", cards, time.perf_counter() - started, latencies, counter.calls,
+                     f"{chunk}件ずつ取り出し。1件あたりのレイテンシは取り出し時間の按分")
+
+
+async def collect_metric_texts(page):
+    """ページ上のカウンターの表示テキストを集める（convert_metric の入力）"""
+    cards = await extract_page_cards(page)
+    texts = [card.get(f'{name}_text') for card in cards for name in ('likes', 'retweets', 'views')]
+    return [text for text in texts if text]
+
+
+# 実際の表示に加えて混ぜる入力（丸め表記・各言語の表記・空文字・解析できない値）
+METRIC_TEXT_SAMPLES = ["", "0", "12", "1,234", "9.8K", "12K", "1.2M", "3M", "1.5B", "1.2万", "3億", "１２３",
+                       "3.4만", "1,5 mil", "2,3 Mio.", "12 345", "1,2 тыс.", "abc"]
+
+
+def metric_corpus(texts):
+    return texts + METRIC_TEXT_SAMPLES
+
+
+def bench_convert_metric(texts, repeat):
+    """convert_metric のみ（ブラウザを使わない）"""
+    corpus = metric_corpus(texts)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            t0 = time.perf_counter()
+            convert_metric(text)
+            latencies.append(time.perf_counter() - t0)
+    return summarize("convert_metric", len(corpus) * repeat, time.perf_counter() - started, latencies, 0,
+                     "件数は変換した文字列の数")
+
+
+def bench_parse_metrics(texts, repeat):
+    """parse_metrics で同じ文字列を一括変換する（ブラウザを使わない）"""
+    corpus = metric_corpus(texts)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        parse_metrics(corpus)
+        latencies.extend([(time.perf_counter() - t0) / len(corpus)] * len(corpus))
+    return summarize("parse_metrics", len(corpus) * repeat, time.perf_counter() - started, latencies, 0,
+                     "件数は変換した文字列の数。1件あたりのレイテンシは1回の呼び出しの按分")
+
+
+def bench_graphql(paths, repeat):
+    """保存済みの GraphQL レスポンスの解析"""
+    payloads = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            payloads.append(json.load(f))
+    latencies = []
+    records = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            t0 = time.perf_counter()
+            parsed, _ = parse_timeline_response(payload)
+            if parsed:
+                latencies.extend([(time.perf_counter() - t0) / len(parsed)] * len(parsed))
+            records += len(parsed)
+    return summarize("graphql", records, time.perf_counter() - started, latencies, 0,
+                     "件数は解析したツイート数。1件あたりのレイテンシはレスポンス毎の按分")
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, previous=None):
+    before = {(r['name'], r.get('fixture')): r for r in (previous or {}).get('results', [])}
+    print(f"\n{'ベンチマーク':<16}{'件数':>8}{'件/秒':>12}{'p50(ms)':>10}{'p95(ms)':>10}{'IPC/件':>9}")
+    for r in results:
+        line = (f"{r['name']:<16}{r['cards']:>8}{r['cards_per_sec']:>12.1f}{r['p50_ms']:>10.3f}"
+                f"{r['p95_ms']:>10.3f}{r['ipc_per_card']:>9.3f}")
+        old = before.get((r['name'], r.get('fixture')))
+        if old and old['cards_per_sec']:
+            line += f"  ({(r['cards_per_sec'] / old['cards_per_sec'] - 1) * 100:+.1f}% vs {previous.get('revision')})"
+        print(line)
+
+
+async def run(args):
+    fixtures = args.fixture or sorted({p for pattern in BENCH_FIXTURES for p in glob.glob(pattern)})
+    if not fixtures:
+        print("❌ フィクスチャ (.html) が見つかりません")
+        return None
+    results = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context(java_script_enabled=True)
+            # 保存済みページが参照する画像・CSS などは読み込まない
+            await context.route("**/*", lambda route: route.abort())
+            texts = []
+            for path in fixtures:
+                page, total = await prepare_page(context, load_fixture(path), args.cards)
+                print(f"📄 {os.path.basename(path)}: カード {total}件")
+                if not total:
+                    await page.close()
+                    continue
+                for bench in (bench_per_card, bench_page_cards, bench_observer):
+                    result = await bench(page, args.repeat)
+                    result['fixture'] = os.path.basename(path)
+                    results.append(result)
+                texts.extend(await collect_metric_texts(page))
+                await page.close()
+        finally:
+            await browser.close()
+
+    results.append(bench_convert_metric(texts, args.repeat * 100))
+    results.append(bench_parse_metrics(texts, args.repeat * 100))
+    if args.json:
+        results.append(bench_graphql(args.json, args.repeat * 100))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="抽出処理のオフラインベンチマーク")
+    parser.add_argument("--fixture", nargs="*", help="保存済みの X のページ (.html)")
+    parser.add_argument("--json", nargs="*", help="保存済みの GraphQL レスポンス (.json)")
+    parser.add_argument("--cards", type=int, default=BENCH_CARDS, help="複製後のカード数")
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEAT, help="繰り返し回数")
+    parser.add_argument("--output", help="結果の保存先 (既定: bench_results/extractor-日時.json)")
+    parser.add_argument("--compare", help="比較する以前の結果ファイル")
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+
+    results = asyncio.run(run(args))
+    if results is None:
+        return
+
+    report = {
+        'revision': git_revision(),
+        'created_at': datetime.datetime.now().isoformat(timespec="seconds"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cards': args.cards,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    print_results(results, previous)
+
+    output = args.output or os.path.join(
+        BENCH_RESULTS_DIR, f"extractor-{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 結果を保存しました: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+保存済みツイートのインデックス
+============================
+
+機能：
+- Tweet テーブルに保存済みのツイートIDを起動時に一度だけ読み込み、メモリ上で高速に判定する
+- ID は 64bit 整数のソート済み配列 (array('q')) に保持（1件8バイト。数百万件でも数十MB）
+  判定は二分探索、実行中に追加したIDは小さな set に入れ、一定件数で配列へマージする
+- 読み込み時刻を記録し、長時間動かすプロセスでは前回以降に追加された分だけを読み足す
+
+インデックスは「保存済みかもしれない」の判定ではなく正確な判定ですが、他のプロセスが
+ツイートを削除した場合などは古くなります。呼び出し側は、保存済みと判定したツイートの
+更新が0件だった場合に通常の保存へ戻してください。
+
+使い方:
+    index = await load_known_index(conn)
+    if tweet_id in index: ...
+    index.add(tweet_id)
+"""
+
+import array
+import asyncio
+import bisect
+import datetime
+import heapq
+import threading
+import time
+
+# この件数を超えたら追加分の set をソート済み配列へマージする
+KNOWN_INDEX_MERGE_THRESHOLD = 50_000
+# この秒数が経過したら、前回以降に追加されたツイートIDを読み足す
+KNOWN_INDEX_REFRESH_SECONDS = 600
+# 読み込み時に1回で取得する行数
+KNOWN_INDEX_FETCH_SIZE = 50_000
+
+# 数値のツイートIDを昇順で取得する（並べ替えはDB側で行い、Python 側のメモリを一定に保つ）
+SQL_SELECT_KNOWN_IDS = """
+    SELECT id FROM (
+        SELECT TRY_CAST(tweetId AS BIGINT) AS id, createdAt FROM Tweet
+    ) t
+    WHERE id IS NOT NULL {where}
+    ORDER BY id
+"""
+
+
+def _to_id(tweet_id):
+    """ツイートIDを整数にする（数値でなければ None）"""
+    try:
+        return int(tweet_id)
+    except (TypeError, ValueError):
+        return None
+
+
+class KnownTweetIndex:
+    """保存済みツイートIDの集合（ソート済み int64 配列 + 追加分の set）"""
+
+    def __init__(self, ids=None):
+        self._ids = ids if ids is not None else array.array('q')
+        self._recent = set()
+        # 保存処理はスレッドで実行されるため、追加・削除・マージは排他する
+        self._lock = threading.Lock()
+        self.loaded_at = None
+        self.load_seconds = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._ids) + len(self._recent)
+
+    def __contains__(self, tweet_id):
+        value = _to_id(tweet_id)
+        if value is None:
+            return False
+        found = value in self._recent
+        if not found:
+            position = bisect.bisect_left(self._ids, value)
+            found = position < len(self._ids) and self._ids[position] == value
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+    def add(self, tweet_id):
+        """保存したツイートIDを追加する"""
+        value = _to_id(tweet_id)
+        if value is None:
+            return
+        with self._lock:
+            self._recent.add(value)
+            if len(self._recent) >= KNOWN_INDEX_MERGE_THRESHOLD:
+                self._merge()
+
+    def discard(self, tweet_id):
+        """保存されていなかったツイートIDを取り除く"""
+        value = _to_id(tweet_id)
+        if value is None:
+            return
+        with self._lock:
+            self._recent.discard(value)
+            position = bisect.bisect_left(self._ids, value)
+            if position < len(self._ids) and self._ids[position] == value:
+                self._ids.pop(position)
+
+    def _merge(self):
+        """追加分の set をソート済み配列へマージする（_lock を取得した状態で呼ぶ）"""
+        merged = array.array('q')
+        previous = None
+        for value in heapq.merge(self._ids, sorted(self._recent)):
+            if value != previous:
+                merged.append(value)
+                previous = value
+        self._ids = merged
+        self._recent.clear()
+
+    def load(self, conn):
+        """Tweet テーブルから全てのツイートIDを読み込む（同期）"""
+        started = time.monotonic()
+        loaded_at = datetime.datetime.now()
+        ids = array.array('q')
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SQL_SELECT_KNOWN_IDS.format(where=""))
+            while True:
+                rows = cursor.fetchmany(KNOWN_INDEX_FETCH_SIZE)
+                if not rows:
+                    break
+                ids.extend(row[0] for row in rows)
+        finally:
+            cursor.close()
+        with self._lock:
+            self._ids = ids
+            self._recent.clear()
+        self.loaded_at = loaded_at
+        self.load_seconds = time.monotonic() - started
+
+    def refresh(self, conn):
+        """前回の読み込み以降に追加されたツイートIDを読み足す（同期）"""
+        since = self.loaded_at - datetime.timedelta(minutes=1)
+        loaded_at = datetime.datetime.now()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SQL_SELECT_KNOWN_IDS.format(where="AND createdAt >= ?"), since)
+            for row in cursor.fetchall():
+                self.add(row[0])
+        finally:
+            cursor.close()
+        self.loaded_at = loaded_at
+
+    def stats(self):
+        return {
+            'size': len(self),
+            'bytes': self._ids.itemsize * len(self._ids),
+            'recent': len(self._recent),
+            'loaded_at': self.loaded_at.isoformat(timespec="seconds") if self.loaded_at else None,
+            'load_seconds': self.load_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        return (f"{s['size']}件 ({s['bytes'] / 1_000_000:.1f}MB, 読み込み {s['load_seconds']:.1f}秒), "
+                f"保存済み {s['hits']}件 / 新規 {s['misses']}件")
+
+
+_index = None
+_index_lock = None
+
+
+async def load_known_index(conn):
+    """
+    プロセス共通のインデックスを返す
+
+    初回はDBから全件を読み込み、以降は KNOWN_INDEX_REFRESH_SECONDS ごとに追加分だけを読み足す。
+    読み込みに失敗した場合は空のインデックスを返す（全件が新規扱いになり、通常の保存で処理される）。
+    """
+    global _index, _index_lock
+    if _index_lock is None:
+        _index_lock = asyncio.Lock()
+    async with _index_lock:
+        try:
+            if _index is None:
+                index = KnownTweetIndex()
+                await asyncio.to_thread(index.load, conn)
+                _index = index
+                print(f"📇 保存済みツイートのインデックスを読み込みました: {index.format_stats()}")
+            elif (datetime.datetime.now() - _index.loaded_at).total_seconds() >= KNOWN_INDEX_REFRESH_SECONDS:
+                await asyncio.to_thread(_index.refresh, conn)
+        except Exception as e:
+            print(f"⚠️ 保存済みツイートのインデックスを読み込めませんでした: {e}")
+            if _index is None:
+                return KnownTweetIndex()
+    return _index
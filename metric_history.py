@@ -0,0 +1,268 @@
+"""
+メトリクス履歴（追記専用）
+========================
+
+機能：
+- 検索・メトリクス再取得でツイートを保存するたびに、その時点のいいね・RT・閲覧数を
+  TweetMetricSnapshot テーブルへ追記する（Tweet テーブルの保存と同じトランザクションで一括挿入）
+- 古いスナップショットを間引く保持ジョブ：
+  - HISTORY_HOURLY_AFTER_DAYS 日より古い生データ → 1時間ごとの1行
+  - HISTORY_DAILY_AFTER_DAYS 日より古い1時間データ → 1日ごとの1行
+- 直近のスナップショットからツイート毎の伸び（1時間あたりの増加量）を計算
+
+テーブルは数千万行でも軽く保てるよう、ツイートID (BIGINT)・観測時刻・3つのカウンター・解像度だけを持ち、
+(tweetId, observedAt) の順のクラスター化主キーで、1ツイートの推移を連続した範囲として読み出せます。
+
+使用方法：
+- 間引きの実行: python metric_history.py --rollup [--hourly-after-days 7] [--daily-after-days 90]
+- 行数の確認:   python metric_history.py --stats
+"""
+
+import argparse
+import datetime
+
+import pyodbc
+
+from db_pool import connect, describe_connection, require_schema, SchemaMissingError
+
+# 生データを1時間単位に間引くまでの日数
+HISTORY_HOURLY_AFTER_DAYS = 7
+# 1時間単位のデータを1日単位に間引くまでの日数
+HISTORY_DAILY_AFTER_DAYS = 90
+# 間引きを1回のトランザクションで処理する期間（日）
+HISTORY_ROLLUP_CHUNK_DAYS = 1
+# 伸びを求めるのに必要な最初と最後の観測の間隔（秒）。短い間隔の差を1時間あたりに換算すると過大になるため
+HISTORY_MIN_GROWTH_SPAN = 3600
+
+# スナップショットの解像度
+RESOLUTION_RAW = 0
+RESOLUTION_HOURLY = 1
+RESOLUTION_DAILY = 2
+
+# 履歴のテーブル（作成は prisma/migrations で行う。主キーは IGNORE_DUP_KEY のため、
+# 同じツイート・同じ時刻の重複は捨てられ、追記の失敗で Tweet の保存を巻き戻さない）
+HISTORY_SCHEMA = {
+    "TweetMetricSnapshot": ("tweetId", "observedAt", "resolution", "likes", "retweets", "views"),
+}
+
+SQL_INSERT_SNAPSHOT = """
+    INSERT INTO TweetMetricSnapshot (tweetId, observedAt, resolution, likes, retweets, views)
+    VALUES (?, ?, 0, ?, ?, ?)
+"""
+
+# 期間内の細かいスナップショットを粗い解像度の1行にまとめ、元の行を削除する
+# カウンターは基本的に増え続けるため、各区間の最大値を代表値にする
+SQL_ROLLUP = """
+    INSERT INTO TweetMetricSnapshot (tweetId, observedAt, resolution, likes, retweets, views)
+    SELECT tweetId, DATEADD({unit}, DATEDIFF({unit}, 0, observedAt), 0), ?,
+           MAX(likes), MAX(retweets), MAX(views)
+    FROM TweetMetricSnapshot
+    WHERE resolution = ? AND observedAt >= ? AND observedAt < ?
+    GROUP BY tweetId, DATEADD({unit}, DATEDIFF({unit}, 0, observedAt), 0);
+
+    DELETE FROM TweetMetricSnapshot
+    WHERE resolution = ? AND observedAt >= ? AND observedAt < ?;
+"""
+
+# 期間内に min_span 秒以上の間隔を空けて観測したツイートの増加量と観測間隔（秒）
+SQL_GROWTH_SINCE = """
+    SELECT tweetId,
+           MAX(likes) - MIN(likes), MAX(retweets) - MIN(retweets), MAX(views) - MIN(views),
+           DATEDIFF(second, MIN(observedAt), MAX(observedAt))
+    FROM TweetMetricSnapshot
+    WHERE observedAt >= ?
+    GROUP BY tweetId
+    HAVING COUNT(*) >= 2 AND DATEDIFF(second, MIN(observedAt), MAX(observedAt)) >= ?
+"""
+
+SQL_OLDEST = "SELECT MIN(observedAt) FROM TweetMetricSnapshot WHERE resolution = ? AND observedAt < ?"
+
+SQL_COUNT_BY_RESOLUTION = """
+    SELECT resolution, COUNT_BIG(*), MIN(observedAt), MAX(observedAt)
+    FROM TweetMetricSnapshot GROUP BY resolution ORDER BY resolution
+"""
+
+_RESOLUTION_NAMES = {RESOLUTION_RAW: "生データ", RESOLUTION_HOURLY: "1時間", RESOLUTION_DAILY: "1日"}
+
+# None: 未確認, True: 利用可能, False: テーブルがない（マイグレーション未適用）
+_history_ready = None
+
+
+def history_available(conn):
+    """
+    履歴テーブルがあるか確認する（プロセス内で1回だけ確認する）
+
+    ない場合は False を返し、以降の保存では履歴の追記を行わない。
+    """
+    global _history_ready
+    if _history_ready is not None:
+        return _history_ready
+    try:
+        require_schema(conn, HISTORY_SCHEMA)
+        _history_ready = True
+    except (SchemaMissingError, pyodbc.Error) as ex:
+        print(f"⚠️ メトリクス履歴テーブルを利用できません。履歴の記録を停止します: {ex}")
+        _history_ready = False
+    return _history_ready
+
+
+def snapshot_rows(stage_rows, observed_at=None):
+    """
+    保存する行 (tweetId, likes, retweets, views) からスナップショットの行を作る
+
+    ツイートIDが数値でないもの、カウンターが1つも取れていないものは除く。
+    """
+    observed_at = (observed_at or datetime.datetime.now()).replace(microsecond=0)
+    rows = []
+    for tweet_id, likes, retweets, views in stage_rows:
+        if likes is None and retweets is None and views is None:
+            continue
+        try:
+            rows.append((int(tweet_id), observed_at, likes, retweets, views))
+        except (TypeError, ValueError):
+            continue
+    return rows
+
+
+def append_snapshots(cursor, stage_rows):
+    """
+    スナップショットを一括で追記する
+
+    Tweet テーブルの保存と同じカーソル・トランザクションで呼び、コミットは呼び出し側で行う。
+    事前に history_available が True を返していること。
+    """
+    rows = snapshot_rows(stage_rows)
+    if rows:
+        cursor.fast_executemany = True
+        cursor.executemany(SQL_INSERT_SNAPSHOT, rows)
+    return len(rows)
+
+
+def fetch_growth(conn, hours=24, now=None, min_span=HISTORY_MIN_GROWTH_SPAN):
+    """
+    直近 hours 時間のスナップショットから、ツイート毎の1時間あたりの増加量を求める
+
+    最初と最後の観測の間隔が min_span 秒未満のツイートは含めない（続けて再取得しただけの
+    小さな差が、1時間あたりに換算して大きな伸びに見えるのを防ぐ）
+
+    戻り値:
+        {tweetId (str): {'likes': いいね/時, 'retweets': RT/時, 'views': 閲覧/時}}
+    """
+    if not history_available(conn):
+        return {}
+    since = (now or datetime.datetime.now()) - datetime.timedelta(hours=hours)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SQL_GROWTH_SINCE, since, max(1, int(min_span)))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    growth = {}
+    for tweet_id, likes, retweets, views, seconds in rows:
+        if not seconds:
+            continue
+        per_hour = 3600 / seconds
+        growth[str(tweet_id)] = {
+            'likes': (likes or 0) * per_hour,
+            'retweets': (retweets or 0) * per_hour,
+            'views': (views or 0) * per_hour,
+        }
+    return growth
+
+
+def _rollup_level(conn, source, target, unit, cutoff):
+    """source 解像度の cutoff より古い行を target 解像度へまとめる。まとめた元の行数を返す"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SQL_OLDEST, source, cutoff)
+        oldest = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    if oldest is None:
+        return 0
+
+    removed = 0
+    start = oldest.replace(hour=0, minute=0, second=0, microsecond=0)
+    step = datetime.timedelta(days=HISTORY_ROLLUP_CHUNK_DAYS)
+    while start < cutoff:
+        end = min(start + step, cutoff)
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SQL_ROLLUP.format(unit=unit), target, source, start, end, source, start, end)
+            # INSERT の後の DELETE の件数を取得する
+            while cursor.nextset():
+                if cursor.rowcount is not None and cursor.rowcount >= 0:
+                    removed += cursor.rowcount
+            conn.commit()
+        except pyodbc.Error:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        start = end
+    return removed
+
+
+def rollup_history(conn, hourly_after_days=HISTORY_HOURLY_AFTER_DAYS, daily_after_days=HISTORY_DAILY_AFTER_DAYS,
+                   now=None):
+    """
+    古いスナップショットを間引く
+
+    戻り値:
+        {'hourly': 1時間単位にまとめた生データの行数, 'daily': 1日単位にまとめた1時間データの行数}
+    """
+    if not history_available(conn):
+        return {'hourly': 0, 'daily': 0}
+    now = now or datetime.datetime.now()
+    # 区間の途中で切らないよう、境界は時・日の区切りに揃える
+    hourly_cutoff = (now - datetime.timedelta(days=hourly_after_days)).replace(minute=0, second=0, microsecond=0)
+    daily_cutoff = (now - datetime.timedelta(days=daily_after_days)).replace(hour=0, minute=0, second=0,
+                                                                            microsecond=0)
+    hourly = _rollup_level(conn, RESOLUTION_RAW, RESOLUTION_HOURLY, "hour", hourly_cutoff)
+    print(f"🗜 {hourly_cutoff:%Y-%m-%d %H:%M} より前の生データ {hourly}行を1時間単位にまとめました")
+    daily = _rollup_level(conn, RESOLUTION_HOURLY, RESOLUTION_DAILY, "day", daily_cutoff)
+    print(f"🗜 {daily_cutoff:%Y-%m-%d} より前の1時間データ {daily}行を1日単位にまとめました")
+    return {'hourly': hourly, 'daily': daily}
+
+
+def history_stats(conn):
+    """解像度毎の行数と期間"""
+    if not history_available(conn):
+        return []
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SQL_COUNT_BY_RESOLUTION)
+        return [{'resolution': _RESOLUTION_NAMES.get(resolution, resolution), 'rows': count,
+                 'oldest': oldest, 'newest': newest}
+                for resolution, count, oldest, newest in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="メトリクス履歴の管理")
+    parser.add_argument("--rollup", action="store_true", help="古いスナップショットを間引く")
+    parser.add_argument("--hourly-after-days", type=int, default=HISTORY_HOURLY_AFTER_DAYS,
+                        help="生データを1時間単位にまとめるまでの日数")
+    parser.add_argument("--daily-after-days", type=int, default=HISTORY_DAILY_AFTER_DAYS,
+                        help="1時間単位のデータを1日単位にまとめるまでの日数")
+    parser.add_argument("--stats", action="store_true", help="解像度毎の行数を表示")
+    args = parser.parse_args()
+    if not (args.rollup or args.stats):
+        parser.print_help()
+        return
+
+    print(f"🔌 接続先: {describe_connection()}")
+    conn = connect()
+    try:
+        if args.rollup:
+            rollup_history(conn, args.hourly_after_days, args.daily_after_days)
+        if args.stats or args.rollup:
+            for row in history_stats(conn):
+                print(f"  - {row['resolution']}: {row['rows']}行 ({row['oldest']} 〜 {row['newest']})")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
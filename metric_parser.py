@@ -0,0 +1,233 @@
+"""
+メトリクス表示の数値化（全ロケール対応・一括変換）
+==============================================
+
+機能：
+- X のカウンター表示（いいね・RT・閲覧数）を数値に変換する。X の表示言語ごとの書式に対応
+  - 英語などの略記:   "1.2K", "3.4M", "1.5B"
+  - 日本語・中国語:   "1.2万", "3億", "5千", "2.1萬", "4亿"
+  - 韓国語:           "1.2천", "3.4만", "2억"
+  - スペイン語/ポルトガル語: "1,5 mil", "2,3 M", "1,2 mil M", "4 mi", "1 bi"
+  - ドイツ語など:     "1,2 Mio.", "3 Mrd.", "12.345", "5 Tsd."
+  - フランス語:       "1,2 k", "12 345"（狭いスペースの桁区切り）, "1 Md"
+  - ロシア語・アラビア語・ヒンディー語・インドネシア語など: "1,2 тыс.", "3 млн", "٣٫٤ مليون", "1.2 लाख", "5 rb"
+- 全角数字・アラビア数字などの Unicode 数字、全角記号、前後や途中の空白を正規化してから解析する
+- 桁区切りと小数点の判別: 両方あれば後ろが小数点、1つだけなら直後がちょうど3桁のとき桁区切り
+  （"1,000K" は 1,000,000。アラビア語の小数点 "٫" は常に小数点）
+- 結果は DB の INT 列に収まるよう METRIC_MAX (2^31-1) で頭打ちにする
+- parse_metrics は文字列の配列を1回の呼び出しで NumPy の int64 配列に変換し、解析できなかった値を報告する
+  （同じ表示は1回だけ解析し、数値化と単位の掛け算は配列演算でまとめて行う）
+
+空文字・None は 0（X はカウンターが 0 のとき数字を表示しない）、解析できない値は 0 とし failed に記録します。
+
+単位 "B" はトルコ語では千 (bin)、"M" はインドネシア語では十億 (miliar) を表すため、
+それらの表示言語では環境変数 X_LOCALE (例: tr, id) を設定してください。
+
+使い方:
+    parse_metric("1.2万")                    # → 12000 (解析できない場合は None)
+    result = parse_metrics(["1.2K", "3億", "??"])
+    result.values                            # → array([1200, 300000000, 0])
+    result.failed                            # → array([False, False, True])
+    result.unparsed                          # → ['??']
+"""
+
+import os
+import re
+import sys
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    print("numpy モジュールが見つかりません。インストールを試みます...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy"])
+    import numpy as np
+
+from stage_metrics import count
+
+# 表示言語（単位の解釈が他の言語と異なる場合だけ使う）
+X_LOCALE = os.getenv("X_LOCALE", "").lower().split("-")[0]
+
+# 単位と倍率（小文字、末尾の "." は除いた形で照合する）
+METRIC_UNITS = {
+    # 千
+    "k": 10**3, "千": 10**3, "천": 10**3, "mil": 10**3, "tsd": 10**3, "тыс": 10**3, "mila": 10**3,
+    "ألف": 10**3, "हज़ार": 10**3, "हजार": 10**3, "rb": 10**3, "ribu": 10**3, "bin": 10**3, "n": 10**3,
+    # 万
+    "万": 10**4, "萬": 10**4, "만": 10**4,
+    # 十万
+    "लाख": 10**5, "lakh": 10**5,
+    # 百万
+    "m": 10**6, "mn": 10**6, "mio": 10**6, "mi": 10**6, "mln": 10**6, "млн": 10**6, "مليون": 10**6,
+    "jt": 10**6, "juta": 10**6, "tr": 10**6,
+    # 千万
+    "करोड़": 10**7, "cr": 10**7,
+    # 億
+    "億": 10**8, "亿": 10**8, "억": 10**8,
+    # 十億
+    "b": 10**9, "bn": 10**9, "mrd": 10**9, "md": 10**9, "bi": 10**9, "mld": 10**9, "млрд": 10**9,
+    "مليار": 10**9, "mil m": 10**9, "mr": 10**9,
+}
+# 数値の上限（Tweet / #TweetStage のカウンターは INT 列）
+METRIC_MAX = 2**31 - 1
+
+# 表示言語ごとに解釈が異なる単位
+METRIC_LOCALE_UNITS = {
+    "tr": {"b": 10**3},
+    "id": {"m": 10**9},
+}
+
+# 桁区切り・小数点になりうる文字（アラビア語の区切り文字、アポストロフィ、各種スペースを含む）
+_GROUPING_SPACES = "\u0020\u00a0\u2007\u2009\u202f"
+_NUMBER_PATTERN = re.compile(r"\d(?:[\d.,'’٫٬" + _GROUPING_SPACES + r"]*\d)?")
+_UNIT_STRIP = " .\t" + _GROUPING_SPACES
+
+ParsedMetrics = namedtuple("ParsedMetrics", ["values", "failed", "unparsed"])
+
+# 既に警告した解析できない表示（同じ値で何度も表示しない）
+_reported = set()
+
+
+def _units():
+    """照合用の単位表（表示と同じく NFKC で正規化する。ヒンディー語の一部の文字は分解される）"""
+    units = dict(METRIC_UNITS)
+    units.update(METRIC_LOCALE_UNITS.get(X_LOCALE, {}))
+    return {unicodedata.normalize("NFKC", unit).lower(): multiplier for unit, multiplier in units.items()}
+
+
+_UNITS = _units()
+
+
+def _normalize(text):
+    """
+    全角文字などを NFKC で正規化し、Unicode の数字を ASCII の数字に置き換える
+    （右から左の表示用の制御文字など、見えない書式文字は取り除く）
+    """
+    text = unicodedata.normalize("NFKC", text).strip()
+    if not text.isascii():
+        text = "".join(str(unicodedata.decimal(c)) if c.isdecimal() else c
+                       for c in text if unicodedata.category(c) != "Cf").strip()
+    return text
+
+
+def _split_number(number):
+    """
+    数字部分を float() で読める文字列にする
+
+    桁区切りと小数点の判別:
+    - "." と "," の両方があれば後ろにある方が小数点
+    - 片方だけで2回以上現れれば桁区切り
+    - 1回だけなら、直後がちょうど3桁のときは桁区切り（"1,234", "1,000K"）、それ以外は小数点（"1.2K", "1,5 mil"）
+    - アラビア語の小数点 "٫" は常に小数点
+    """
+    explicit_decimal = "٫" in number
+    number = number.replace("٫", ".").replace("٬", ",").replace("'", "").replace("’", "")
+    for space in _GROUPING_SPACES:
+        number = number.replace(space, "")
+    separators = [c for c in number if c in ".,"]
+    if not separators:
+        return number
+    if "." in separators and "," in separators:
+        decimal = number[max(number.rfind("."), number.rfind(",")):][0]
+    elif len(separators) > 1:
+        decimal = None
+    else:
+        separator = separators[0]
+        fraction = number.rsplit(separator, 1)[1]
+        decimal = separator if explicit_decimal or len(fraction) != 3 else None
+    grouping = {".", ","} - {decimal}
+    for separator in grouping:
+        number = number.replace(separator, "")
+    if decimal == ",":
+        number = number.replace(",", ".")
+    return number
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text):
+    """
+    表示を (数字部分の文字列, 倍率) に分解する
+
+    戻り値:
+        ("1.2", 10000) など。空の表示は ("0", 1)、解析できない場合は None
+    """
+    text = _normalize(text)
+    if not text:
+        return "0", 1
+    match = _NUMBER_PATTERN.search(text)
+    if not match or text[:match.start()].strip(_UNIT_STRIP + "+~≈"):
+        return None
+    unit = " ".join(text[match.end():].strip(_UNIT_STRIP).lower().split())
+    unit = unit.rstrip(".")
+    if unit and unit not in _UNITS:
+        return None
+    return _split_number(match.group(0)), _UNITS.get(unit, 1)
+
+
+def parse_metric(text):
+    """
+    1つの表示を数値に変換する
+
+    戻り値:
+        int (METRIC_MAX で頭打ち)。空の表示は 0、解析できない場合は None
+    """
+    if text is None:
+        return 0
+    token = _tokenize(str(text))
+    if token is None:
+        return None
+    number, multiplier = token
+    try:
+        return min(int(round(float(number) * multiplier)), METRIC_MAX)
+    except ValueError:
+        return None
+
+
+def parse_metrics(texts):
+    """
+    表示の配列をまとめて数値に変換する
+
+    同じ表示は1回だけ分解し、数字部分の変換と倍率の掛け算は NumPy でまとめて行う。
+
+    戻り値:
+        ParsedMetrics(values: int64 配列, failed: bool 配列, unparsed: 解析できなかった表示のリスト)
+        values は METRIC_MAX で頭打ち。解析できなかった要素の values は 0
+    """
+    keys = ["" if text is None else str(text) for text in texts]
+    if not keys:
+        return ParsedMetrics(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool), [])
+    unique, inverse = np.unique(np.array(keys, dtype=str), return_inverse=True)
+    numbers = []
+    multipliers = np.ones(len(unique), dtype=np.float64)
+    failed = np.zeros(len(unique), dtype=bool)
+    for i, text in enumerate(unique):
+        token = _tokenize(str(text))
+        if token is None:
+            numbers.append("0")
+            failed[i] = True
+        else:
+            numbers.append(token[0])
+            multipliers[i] = token[1]
+    try:
+        parsed = np.array(numbers, dtype=str).astype(np.float64)
+    except ValueError:
+        # float にならない値を含む場合だけ1件ずつ変換する
+        parsed = np.zeros(len(numbers), dtype=np.float64)
+        for i, number in enumerate(numbers):
+            try:
+                parsed[i] = float(number)
+            except ValueError:
+                failed[i] = True
+    values = np.where(failed, 0, np.minimum(np.rint(parsed * multipliers), METRIC_MAX)).astype(np.int64)
+
+    unparsed = [str(text) for text in unique[failed]]
+    if unparsed:
+        count("metric_parse_failures", int(failed[inverse].sum()))
+        new = [text for text in unparsed if text not in _reported]
+        if new:
+            _reported.update(new)
+            print(f"⚠️ メトリクスの表示を数値化できませんでした: {new[:10]}")
+    return ParsedMetrics(values[inverse], failed[inverse], unparsed)
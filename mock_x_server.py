@@ -0,0 +1,439 @@
+"""
+ローカルのモック X サーバー（負荷試験用）
+======================================
+
+機能：
+- 本物のサイトにアクセスせず、アカウントも消費せずにスクレイパーを端から端まで動かすための代替サーバー
+  - /i/flow/login            ログイン画面（メールアドレス → パスワード、auth_token Cookie を発行）
+  - /home                    ログイン後のホーム（ログイン確認に使う要素を表示）
+  - /search?q=...            検索結果（SearchTimeline の GraphQL を呼び、下までスクロールすると続きを読み込む）
+  - /<user>/status/<id>      ツイート詳細（TweetDetail の GraphQL、リプライボタンと投稿欄）
+  - /i/api/graphql/.../SearchTimeline, TweetDetail, CreateTweet
+  - /stats                   リクエスト数・429 の件数・投稿されたリプライなどの統計 (JSON)
+- ツイートはIDから決定的に生成し、いいね・RT・閲覧数は時間とともに増える（再取得で伸びを観測できる）
+- 応答の遅延 (--latency-ms, --jitter-ms)、429 の発生率 (--rate-limit)、検索結果の件数 (--results) を設定可能
+
+スクレイパー側は環境変数 X_BASE_URL をこのサーバーに向けて起動します（browser_session.X_BASE_URL）。
+
+このサーバーのツイートは偽物です。本番の DB に書き込まないよう、X_BASE_URL が https://x.com 以外のとき
+db_pool は負荷試験用の MOCK_DATABASE_URL にだけ接続します。未設定、または DATABASE_URL と同じ場合は
+接続を拒否し、検索は保存せずに終了します。
+
+使用方法：
+- python mock_x_server.py [--port 8780] [--results 1000] [--latency-ms 150] [--jitter-ms 100] [--rate-limit 0.02]
+- X_BASE_URL=http://127.0.0.1:8780 MOCK_DATABASE_URL="sqlserver://localhost:1433;database=xranking_load;..."
+  python twitter_video_search.py "テスト" --limit 500 --headless
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import time
+import urllib.parse
+import zlib
+
+# 待ち受けアドレス
+MOCK_HOST = "127.0.0.1"
+MOCK_PORT = 8780
+# 1つの検索キーワードで返すツイートの総数
+MOCK_RESULTS = 1000
+# 1回の SearchTimeline で返す件数
+MOCK_PAGE_SIZE = 20
+# 動画付きツイートの割合
+MOCK_VIDEO_RATIO = 0.8
+# ログイン Cookie
+MOCK_AUTH_COOKIE = "auth_token"
+# 429 を返したときに通知するリセットまでの秒数
+MOCK_RATE_LIMIT_RESET = 60
+
+_STATUS_TEXT = {200: "OK", 302: "Found", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests"}
+
+# モックのツイートIDの範囲（実在のIDと混ざらないよう十分大きい値から始める）
+_ID_BASE = 9_000_000_000_000_000_000
+_STARTED = time.time()
+
+# 全ページ共通のツイート表示処理（GraphQL の tweet_results.result を X と同じ構造の article に描画する）
+_RENDER_JS = r"""
+const short = (n) => n >= 1e6 ? (n / 1e6).toFixed(1) + 'M' : n >= 1e3 ? (n / 1e3).toFixed(1) + 'K' : String(n);
+const esc = (s) => String(s).replace(/[&<>"]/g, (c) => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+function renderTweet(result) {
+    const legacy = result.legacy;
+    const user = result.core.user_results.result;
+    const name = user.legacy.screen_name;
+    const id = result.rest_id;
+    const media = ((legacy.extended_entities || {}).media || [])[0];
+    const views = Number(result.views.count);
+    const article = document.createElement('article');
+    article.setAttribute('data-testid', 'tweet');
+    article.style.minHeight = '320px';
+    article.innerHTML = `
+        <img src="${esc(user.legacy.profile_image_url_https)}" width="40" height="40">
+        <div data-testid="User-Name"><a href="/${esc(name)}"><span>${esc(user.legacy.name)}</span></a></div>
+        <a href="/${esc(name)}/status/${id}"><time datetime="${new Date(legacy.created_at).toISOString()}">now</time></a>
+        <div data-testid="tweetText">${esc(legacy.full_text)}</div>
+        ${media ? `<video src="${esc(media.video_info.variants[0].url)}" poster="${esc(media.media_url_https)}" preload="none"></video>` : ''}
+        <div role="group">
+            <button data-testid="reply" aria-label="Reply">Reply</button>
+            <button data-testid="retweet" aria-label="${legacy.retweet_count} reposts. Repost"><span><span>${short(legacy.retweet_count)}</span></span></button>
+            <button data-testid="like" aria-label="${legacy.favorite_count} Likes. Like"><span><span>${short(legacy.favorite_count)}</span></span></button>
+            <a href="/${esc(name)}/status/${id}/analytics" aria-label="${views} views. View post analytics">${short(views)}</a>
+        </div>`;
+    return article;
+}
+function collectTweets(node, out) {
+    if (Array.isArray(node)) { node.forEach((n) => collectTweets(n, out)); return out; }
+    if (!node || typeof node !== 'object') return out;
+    if (node.cursorType === 'Bottom') out.cursor = node.value;
+    for (const [key, value] of Object.entries(node)) {
+        if (key === 'tweet_results') out.tweets.push(value.result);
+        else collectTweets(value, out);
+    }
+    return out;
+}
+"""
+
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title} / X</title></head>
+<body>
+<nav><a data-testid="AppTabBar_Home_Link" aria-label="Home" href="/home">Home</a></nav>
+<main data-testid="primaryColumn">{body}</main>
+<div data-testid="sidebarColumn"></div>
+<script>{render_js}</script>
+<script>{script}</script>
+</body></html>"""
+
+_LOGIN_BODY = """
+<div id="step-user"><input autocomplete="username" name="text"></div>
+<div id="step-password" style="display:none"><input name="password" type="password"></div>
+"""
+
+_LOGIN_JS = """
+const user = document.querySelector("input[autocomplete='username']");
+const password = document.querySelector("input[name='password']");
+user.addEventListener('keydown', (e) => {
+    if (e.key !== 'Enter') return;
+    document.getElementById('step-user').style.display = 'none';
+    document.getElementById('step-password').style.display = '';
+    password.focus();
+});
+password.addEventListener('keydown', async (e) => {
+    if (e.key !== 'Enter') return;
+    const res = await fetch('/i/api/1.1/onboarding/task.json', {method: 'POST', body: JSON.stringify({user: user.value})});
+    if (res.ok) location.href = '/home';
+});
+"""
+
+_SEARCH_JS = """
+const timeline = document.getElementById('timeline');
+const query = new URLSearchParams(location.search).get('q') || '';
+let cursor = null, loading = false, finished = false;
+async function loadMore() {
+    if (loading || finished) return;
+    loading = true;
+    const variables = {rawQuery: query, count: %(page_size)d, product: 'Media'};
+    if (cursor) variables.cursor = cursor;
+    try {
+        const res = await fetch('/i/api/graphql/mockSearch/SearchTimeline?variables=' + encodeURIComponent(JSON.stringify(variables)));
+        if (res.ok) {
+            const out = collectTweets(await res.json(), {tweets: [], cursor: null});
+            out.tweets.forEach((t) => timeline.appendChild(renderTweet(t)));
+            if (!out.cursor || !out.tweets.length) finished = true;
+            cursor = out.cursor;
+        }
+    } finally {
+        loading = false;
+    }
+}
+window.addEventListener('scroll', () => {
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 1500) loadMore();
+});
+loadMore();
+"""
+
+_DETAIL_JS = """
+const focal = '%(tweet_id)s';
+(async () => {
+    const variables = {focalTweetId: focal, with_rux_injections: false};
+    const res = await fetch('/i/api/graphql/mockDetail/TweetDetail?variables=' + encodeURIComponent(JSON.stringify(variables)));
+    if (!res.ok) return;
+    const out = collectTweets(await res.json(), {tweets: [], cursor: null});
+    const article = renderTweet(out.tweets[0]);
+    document.getElementById('timeline').appendChild(article);
+    article.querySelector('[data-testid="reply"]').addEventListener('click', () => {
+        document.getElementById('composer').style.display = '';
+        document.querySelector('[data-testid="tweetTextarea_0"]').focus();
+    });
+})();
+document.querySelector('[data-testid="tweetButton"]').addEventListener('click', async () => {
+    const text = document.querySelector('[data-testid="tweetTextarea_0"]').innerText;
+    const variables = {tweet_text: text, reply: {in_reply_to_tweet_id: focal}};
+    await fetch('/i/api/graphql/mockCreate/CreateTweet', {method: 'POST', body: JSON.stringify({variables})});
+    document.getElementById('composer').style.display = 'none';
+});
+"""
+
+_DETAIL_BODY = """
+<section id="timeline"></section>
+<div id="composer" role="dialog" style="display:none">
+    <div data-testid="tweetTextarea_0" contenteditable="true" role="textbox"></div>
+    <div data-testid="tweetButton" role="button">Reply</div>
+</div>
+"""
+
+
+def _tweet_id(query, index):
+    """検索キーワードと順番からツイートIDを作る（同じキーワードなら毎回同じID）"""
+    return str(_ID_BASE + (zlib.crc32(query.encode("utf-8")) % 1_000_000) * 1_000_000 + index)
+
+
+def tweet_result(tweet_id, base_url, video_ratio=MOCK_VIDEO_RATIO):
+    """ツイートIDから GraphQL の tweet_results.result を決定的に生成する"""
+    rng = random.Random(int(tweet_id))
+    user_id = str(rng.randrange(10**9, 10**10))
+    screen_name = f"mock_user_{user_id[-5:]}"
+    # 投稿は起動の0〜30日前。メトリクスは投稿からの経過時間に比例して増える
+    posted = _STARTED - rng.uniform(0, 30 * 24 * 3600)
+    hours = max(0.0, (time.time() - posted) / 3600)
+    likes_per_hour = rng.uniform(0.1, 200)
+    likes = int(likes_per_hour * hours)
+    legacy = {
+        'full_text': f"モックのツイート {tweet_id} #{rng.randrange(1000)}",
+        'favorite_count': likes,
+        'retweet_count': int(likes * rng.uniform(0.05, 0.3)),
+        'created_at': datetime.datetime.fromtimestamp(posted, datetime.timezone.utc).strftime(
+            "%a %b %d %H:%M:%S +0000 %Y"),
+    }
+    if rng.random() < video_ratio:
+        legacy['extended_entities'] = {'media': [{
+            'type': "video",
+            'media_url_https': f"{base_url}/media/thumb/{tweet_id}.jpg",
+            'video_info': {'variants': [
+                {'content_type': "video/mp4", 'bitrate': 2176000, 'url': f"{base_url}/media/vid/{tweet_id}/1280x720.mp4"},
+                {'content_type': "video/mp4", 'bitrate': 832000, 'url': f"{base_url}/media/vid/{tweet_id}/640x360.mp4"},
+                {'content_type': "application/x-mpegURL", 'url': f"{base_url}/media/vid/{tweet_id}/pl.m3u8"},
+            ]},
+        }]}
+    return {
+        '__typename': "Tweet",
+        'rest_id': tweet_id,
+        'core': {'user_results': {'result': {
+            'rest_id': user_id,
+            'legacy': {
+                'screen_name': screen_name,
+                'name': f"モックユーザー {user_id[-5:]}",
+                'profile_image_url_https': f"{base_url}/profile_images/{user_id}/normal.jpg",
+            },
+        }}},
+        'legacy': legacy,
+        'views': {'count': str(int(likes * rng.uniform(20, 80)))},
+    }
+
+
+def _entry(result):
+    return {'entryId': f"tweet-{result['rest_id']}",
+            'content': {'itemContent': {'tweet_results': {'result': result}}}}
+
+
+class MockXServer:
+    """
+    モック X サーバー
+
+    パラメータ:
+        results: 1つの検索キーワードで返すツイートの総数
+        page_size: 1回の SearchTimeline で返す件数
+        latency_ms / jitter_ms: API 応答の遅延（基本値 + 0〜jitter のランダム）
+        rate_limit: API リクエストが 429 になる確率 (0〜1)
+    """
+
+    def __init__(self, base_url, results=MOCK_RESULTS, page_size=MOCK_PAGE_SIZE, latency_ms=0, jitter_ms=0,
+                 rate_limit=0.0, video_ratio=MOCK_VIDEO_RATIO):
+        self.base_url = base_url
+        self.results = results
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.video_ratio = video_ratio
+        self.counts = {}
+        self.rate_limited = 0
+        self.replies = []
+        self.started = time.monotonic()
+
+    # --- HTTP ---
+    async def handle_connection(self, reader, writer):
+        try:
+            status, headers, body = await self._handle_request(reader)
+        except Exception as e:
+            status, headers, body = 400, {}, json.dumps({'error': str(e)}).encode("utf-8")
+        head = f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+        headers.setdefault("Content-Type", "application/json; charset=utf-8")
+        headers["Content-Length"] = str(len(body))
+        headers["Connection"] = "close"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+        writer.write(head.encode("latin-1") + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        method, target, _ = request_line.split(" ")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        body = await reader.readexactly(length) if length else b""
+        parsed = urllib.parse.urlparse(target)
+        query = urllib.parse.parse_qs(parsed.query)
+        cookies = dict(part.strip().split("=", 1) for part in headers.get("cookie", "").split(";") if "=" in part)
+        return await self._route(method, parsed.path, query, cookies, body)
+
+    def _count(self, name):
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    async def _api_delay(self):
+        """API 応答の遅延と 429 の注入。429 にする場合はそのレスポンスを返す"""
+        delay = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if self.rate_limit and random.random() < self.rate_limit:
+            self.rate_limited += 1
+            reset = int(time.time()) + MOCK_RATE_LIMIT_RESET
+            return 429, {"x-rate-limit-remaining": "0", "x-rate-limit-reset": str(reset)}, \
+                json.dumps({'errors': [{'message': "Rate limit exceeded", 'code': 88}]}).encode("utf-8")
+        return None
+
+    @staticmethod
+    def _html(title, body, script, status=200, headers=None):
+        page = _PAGE_TEMPLATE.format(title=title, body=body, render_js=_RENDER_JS, script=script)
+        return status, {"Content-Type": "text/html; charset=utf-8", **(headers or {})}, page.encode("utf-8")
+
+    @staticmethod
+    def _json(payload, status=200, headers=None):
+        return status, dict(headers or {}), json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    async def _route(self, method, path, query, cookies, body):
+        logged_in = bool(cookies.get(MOCK_AUTH_COOKIE))
+        if path == "/stats":
+            return self._json(self.stats())
+        if path == "/i/flow/login":
+            self._count("login_page")
+            return self._html("ログイン", _LOGIN_BODY, _LOGIN_JS)
+        if path == "/i/api/1.1/onboarding/task.json":
+            self._count("login")
+            token = f"mock{random.getrandbits(64):016x}"
+            return self._json({'status': "success"}, headers={
+                "Set-Cookie": f"{MOCK_AUTH_COOKIE}={token}; Path=/; Max-Age=2592000; HttpOnly; SameSite=Lax"})
+        if path == "/home":
+            self._count("home")
+            if not logged_in:
+                return 302, {"Location": "/i/flow/login"}, b""
+            return self._html("ホーム", '<div aria-label="Home timeline"></div>', "")
+        if path == "/search":
+            self._count("search_page")
+            if not logged_in:
+                return 302, {"Location": "/i/flow/login"}, b""
+            return self._html("検索", '<section id="timeline"></section>',
+                              _SEARCH_JS % {'page_size': self.page_size})
+        if path.startswith("/i/api/graphql/"):
+            operation = path.rstrip("/").rsplit("/", 1)[-1]
+            self._count(operation)
+            if not logged_in:
+                return self._json({'errors': [{'message': "Could not authenticate you", 'code': 32}]}, 403)
+            limited = await self._api_delay()
+            if limited:
+                return limited
+            variables = json.loads((query.get("variables") or ["{}"])[0])
+            if operation == "SearchTimeline":
+                return self._json(self.search_timeline(variables))
+            if operation == "TweetDetail":
+                return self._json(self.tweet_detail(variables.get("focalTweetId", "")))
+            if operation == "CreateTweet":
+                return self._json(self.create_tweet(json.loads(body or b"{}").get("variables") or {}))
+            return self._json({'errors': [{'message': f"Unknown operation {operation}"}]}, 404)
+        parts = path.strip("/").split("/")
+        if len(parts) == 3 and parts[1] == "status" and parts[2].isdigit():
+            self._count("detail_page")
+            if not logged_in:
+                return 302, {"Location": "/i/flow/login"}, b""
+            return self._html("ツイート", _DETAIL_BODY, _DETAIL_JS % {'tweet_id': parts[2]})
+        self._count("not_found")
+        return 404, {"Content-Type": "text/plain"}, b"not found"
+
+    # --- GraphQL ---
+    def search_timeline(self, variables):
+        query = variables.get("rawQuery", "")
+        offset = int(variables.get("cursor", "").removeprefix("scroll:") or 0) if variables.get("cursor") else 0
+        count = min(int(variables.get("count") or self.page_size), self.page_size)
+        end = min(offset + count, self.results)
+        entries = [_entry(tweet_result(_tweet_id(query, i), self.base_url, self.video_ratio))
+                   for i in range(offset, end)]
+        if end < self.results:
+            entries.append({'entryId': f"cursor-bottom-{end}",
+                            'content': {'cursorType': "Bottom", 'value': f"scroll:{end}"}})
+        return {'data': {'search_by_raw_query': {'search_timeline': {'timeline': {
+            'instructions': [{'type': "TimelineAddEntries", 'entries': entries}]}}}}}
+
+    def tweet_detail(self, tweet_id):
+        if not tweet_id.isdigit():
+            return {'errors': [{'message': "Invalid tweet id"}]}
+        return {'data': {'threaded_conversation_with_injections_v2': {
+            'instructions': [{'type': "TimelineAddEntries", 'entries': [
+                _entry(tweet_result(tweet_id, self.base_url, self.video_ratio))]}]}}}
+
+    def create_tweet(self, variables):
+        reply_to = (variables.get("reply") or {}).get("in_reply_to_tweet_id")
+        self.replies.append({'in_reply_to': reply_to, 'text': variables.get("tweet_text", ""),
+                             'at': datetime.datetime.now().isoformat(timespec="seconds")})
+        new_id = str(_ID_BASE - len(self.replies))
+        return {'data': {'create_tweet': {'tweet_results': {'result': {'rest_id': new_id}}}}}
+
+    def stats(self):
+        elapsed = time.monotonic() - self.started
+        return {
+            'uptime': elapsed,
+            'requests': dict(self.counts),
+            'requests_per_minute': sum(self.counts.values()) / elapsed * 60 if elapsed else 0.0,
+            'rate_limited': self.rate_limited,
+            'replies': len(self.replies),
+            'recent_replies': self.replies[-10:],
+        }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="ローカルのモック X サーバー（負荷試験用）")
+    parser.add_argument("--host", default=MOCK_HOST, help="待ち受けアドレス")
+    parser.add_argument("--port", type=int, default=MOCK_PORT, help="待ち受けポート")
+    parser.add_argument("--results", type=int, default=MOCK_RESULTS, help="1つの検索キーワードで返すツイートの総数")
+    parser.add_argument("--page-size", type=int, default=MOCK_PAGE_SIZE, help="1回の SearchTimeline で返す件数")
+    parser.add_argument("--latency-ms", type=float, default=0, help="API 応答の遅延（ミリ秒）")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="遅延に加えるランダムな揺らぎ（ミリ秒）")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="API リクエストが 429 になる確率 (0〜1)")
+    parser.add_argument("--video-ratio", type=float, default=MOCK_VIDEO_RATIO, help="動画付きツイートの割合")
+    args = parser.parse_args()
+
+    base_url = f"http://{args.host}:{args.port}"
+    server = MockXServer(base_url, args.results, args.page_size, args.latency_ms, args.jitter_ms,
+                         args.rate_limit, args.video_ratio)
+    listener = await asyncio.start_server(server.handle_connection, args.host, args.port, backlog=1024)
+    print(f"🧪 モック X サーバーを起動しました: {base_url}")
+    print(f"   スクレイパーは X_BASE_URL={base_url} と負荷試験用の MOCK_DATABASE_URL を設定して起動してください。"
+          f"統計: {base_url}/stats")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 モック X サーバーを停止しました")
@@ -0,0 +1,206 @@
+"""
+ページ遷移の時間予算とサーキットブレーカー
+========================================
+
+機能：
+- ページ遷移は networkidle ではなく、目的の要素（ツイート本体など）か GraphQL のレスポンスが
+  届いた時点で完了とする（X は常時接続を張り続けるため networkidle には滅多に到達せず、
+  毎回タイムアウトまで待たされていた）
+- 操作の種類ごとに「遷移 + 要素待ち」を合わせた時間の予算（秒）を持つ
+  search: 検索ページ, tweet: ツイートページ, login: ログイン画面, probe: ログイン確認
+  環境変数 NAV_BUDGET_<種類> (例: NAV_BUDGET_TWEET=10) または CLI の --nav-budget tweet=10 で変更可能
+- サーキットブレーカー: 失敗が threshold 件続いたらサイト全体の問題（障害・レート制限・セッション切れ）と
+  みなしてワーカーを一時停止し、残りの全ツイートでタイムアウトまで待つことを避ける
+  - 停止時間は成功を挟まずに開くたびに倍になる（上限 max_cooldown）
+  - 再開後は1件失敗しただけで再び開く。1件でも成功すれば通常に戻る
+  - max_trips 回目に開いた時点で CircuitOpenError とし、残りの処理を打ち切る（0 の場合は停止と再開を続ける）
+
+使い方:
+    tweet_elem = await open_page(page, url, '[data-testid="tweet"]', "tweet")
+
+    breaker = CircuitBreaker("メトリクス更新")
+    await breaker.wait_ready()       # 開いている間は待つ
+    breaker.record_success() / breaker.record_failure(error)
+"""
+
+import asyncio
+import os
+import time
+
+from stage_metrics import timed, count
+
+# 操作の種類ごとの時間予算（秒）。遷移と目的の要素が表示されるまでの合計
+NAV_BUDGETS = {
+    "search": 45.0,
+    "tweet": 15.0,
+    "login": 60.0,
+    "probe": 20.0,
+}
+for _operation in NAV_BUDGETS:
+    _value = os.getenv(f"NAV_BUDGET_{_operation.upper()}")
+    if _value:
+        NAV_BUDGETS[_operation] = float(_value)
+
+# この件数だけ連続で失敗したらブレーカーを開く
+BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", "8"))
+# ブレーカーが開いたときの最初の停止時間（秒）
+BREAKER_COOLDOWN = float(os.getenv("BREAKER_COOLDOWN", "60"))
+# 停止時間の上限（秒）
+BREAKER_MAX_COOLDOWN = 900.0
+# 1回限りの実行で、成功を挟まずにこの回数開いたら打ち切る
+BREAKER_MAX_TRIPS = 3
+
+
+class NavigationTimeout(TimeoutError):
+    """時間予算内に目的の要素が表示されなかった"""
+
+
+class CircuitOpenError(Exception):
+    """ブレーカーが max_trips 回開いても回復しなかった"""
+
+
+def set_nav_budgets(specs):
+    """
+    "種類=秒" の指定（CLI の --nav-budget）で時間予算を変更する
+
+    例外:
+        ValueError: 書式または種類が不正な場合
+    """
+    for spec in specs or []:
+        operation, _, seconds = spec.partition("=")
+        operation = operation.strip().lower()
+        if operation not in NAV_BUDGETS or not seconds:
+            raise ValueError(f"不正な時間予算の指定です: {spec} (種類: {', '.join(NAV_BUDGETS)})")
+        NAV_BUDGETS[operation] = float(seconds)
+
+
+def budget_ms(operation):
+    """操作の種類の時間予算（ミリ秒、Playwright の timeout 用）"""
+    return NAV_BUDGETS[operation] * 1000
+
+
+async def open_page(page, url, ready_selector, operation, ready_event=None):
+    """
+    url を開き、ready_selector の要素が表示された時点で完了とする
+
+    遷移はレスポンスを受け取った時点 (commit) で終え、残りの予算で要素を待つ。
+    ready_event (GraphQLCapture.new_records など) を渡した場合は、要素より先にそれが
+    セットされても完了とする。
+
+    戻り値:
+        表示された要素。ready_event で完了した場合は None
+
+    例外:
+        NavigationTimeout (予算切れ)、または Playwright の例外
+    """
+    deadline = time.monotonic() + NAV_BUDGETS[operation]
+
+    def remaining_ms():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise NavigationTimeout(f"{operation} の時間予算 ({NAV_BUDGETS[operation]:.0f}秒) を超えました: {url}")
+        return remaining * 1000
+
+    with timed("navigation"):
+        await page.goto(url, wait_until="commit", timeout=remaining_ms())
+    with timed("selector_wait"):
+        if ready_event is None:
+            return await page.wait_for_selector(ready_selector, timeout=remaining_ms())
+        selector_task = asyncio.ensure_future(page.wait_for_selector(ready_selector, timeout=remaining_ms()))
+        event_task = asyncio.ensure_future(ready_event.wait())
+        done, pending = await asyncio.wait({selector_task, event_task}, timeout=remaining_ms() / 1000,
+                                           return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if event_task in done:
+            return None
+        if selector_task in done:
+            return selector_task.result()
+        raise NavigationTimeout(f"{operation} の時間予算 ({NAV_BUDGETS[operation]:.0f}秒) を超えました: {url}")
+
+
+class CircuitBreaker:
+    """
+    連続した失敗でワーカーを一時停止するサーキットブレーカー
+
+    パラメータ:
+        name: 表示用の名前
+        threshold: この件数だけ連続で失敗したら開く
+        cooldown: 最初の停止時間（秒）。成功を挟まずに開くたびに倍になる
+        max_cooldown: 停止時間の上限（秒）
+        max_trips: 成功を挟まずにこの回数開いたら CircuitOpenError (0: 打ち切らない)
+    """
+
+    def __init__(self, name, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN,
+                 max_cooldown=BREAKER_MAX_COOLDOWN, max_trips=0):
+        self.name = name
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.paused_seconds = 0.0
+        self.last_error = None
+        self._streak_trips = 0
+        self._open_until = 0.0
+
+    @property
+    def is_open(self):
+        return time.monotonic() < self._open_until
+
+    @property
+    def exhausted(self):
+        return bool(self.max_trips) and self._streak_trips >= self.max_trips
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self._streak_trips = 0
+
+    def record_failure(self, error=None):
+        self.consecutive_failures += 1
+        if error is not None:
+            self.last_error = str(error).splitlines()[0][:200] if str(error) else type(error).__name__
+        if self.consecutive_failures >= self.threshold and not self.is_open and not self.exhausted:
+            self._trip()
+
+    def _trip(self):
+        self.trips += 1
+        self._streak_trips += 1
+        count("breaker_trips")
+        if self.exhausted:
+            print(f"🛑 {self.name}: 失敗が続き回復しないため、残りの処理を打ち切ります (最後のエラー: {self.last_error})")
+            return
+        pause = min(self.cooldown * 2 ** (self._streak_trips - 1), self.max_cooldown)
+        self._open_until = time.monotonic() + pause
+        self.paused_seconds += pause
+        # 再開後は1件失敗しただけで再び開く
+        self.consecutive_failures = self.threshold - 1
+        print(f"🛑 {self.name}: {self.threshold}件連続で失敗したため {pause:.0f}秒間停止します "
+              f"(最後のエラー: {self.last_error})")
+
+    async def wait_ready(self):
+        """ブレーカーが開いている間は待つ。打ち切りの場合は CircuitOpenError"""
+        if self.exhausted:
+            raise CircuitOpenError(f"{self.name}: 失敗が続いたため打ち切りました ({self.last_error})")
+        wait = self._open_until - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+            if self.exhausted:
+                raise CircuitOpenError(f"{self.name}: 失敗が続いたため打ち切りました ({self.last_error})")
+
+    def stats(self):
+        return {
+            'trips': self.trips,
+            'paused_seconds': self.paused_seconds,
+            'consecutive_failures': self.consecutive_failures,
+            'open': self.is_open,
+            'exhausted': self.exhausted,
+            'last_error': self.last_error,
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        state = "打ち切り" if s['exhausted'] else "停止中" if s['open'] else "正常"
+        return f"{state}, 停止 {s['trips']}回 (合計 {s['paused_seconds']:.0f}秒), 連続失敗 {s['consecutive_failures']}件"
@@ -0,0 +1,37 @@
+BEGIN TRY
+
+BEGIN TRAN;
+
+-- CreateTable
+CREATE TABLE [dbo].[Tweet] (
+    [id] NVARCHAR(1000) NOT NULL,
+    [tweetId] NVARCHAR(1000),
+    [content] NVARCHAR(1000),
+    [videoUrl] NVARCHAR(1000),
+    [originalUrl] NVARCHAR(1000),
+    [likes] INT NOT NULL CONSTRAINT [Tweet_likes_df] DEFAULT 0,
+    [retweets] INT NOT NULL CONSTRAINT [Tweet_retweets_df] DEFAULT 0,
+    [views] INT NOT NULL CONSTRAINT [Tweet_views_df] DEFAULT 0,
+    [timestamp] DATETIME2 NOT NULL CONSTRAINT [Tweet_timestamp_df] DEFAULT CURRENT_TIMESTAMP,
+    [authorId] NVARCHAR(1000),
+    [authorName] NVARCHAR(1000),
+    [authorUsername] NVARCHAR(1000),
+    [authorProfileImageUrl] NVARCHAR(1000),
+    [createdAt] DATETIME2 NOT NULL CONSTRAINT [Tweet_createdAt_df] DEFAULT CURRENT_TIMESTAMP,
+    [updatedAt] DATETIME2 NOT NULL,
+    CONSTRAINT [Tweet_pkey] PRIMARY KEY CLUSTERED ([id]),
+    CONSTRAINT [Tweet_tweetId_key] UNIQUE NONCLUSTERED ([tweetId])
+);
+
+COMMIT TRAN;
+
+END TRY
+BEGIN CATCH
+
+IF @@TRANCOUNT > 0
+BEGIN
+    ROLLBACK TRAN;
+END;
+THROW
+
+END CATCH
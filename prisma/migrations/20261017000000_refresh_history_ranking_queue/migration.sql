@@ -0,0 +1,115 @@
+-- 再取得スケジュール (refresh_scheduler.py)・メトリクス履歴 (metric_history.py)・
+-- ランキング (ranking_job.py)・再取得ジョブキュー (refresh_queue.py) のテーブルとカラム。
+-- 以前は各スクリプトが実行時に作成していたため、既にあるものは作成せず、制約名だけ Prisma の命名に揃える。
+
+BEGIN TRY
+
+BEGIN TRAN;
+
+-- AlterTable
+IF COL_LENGTH('dbo.Tweet', 'nextRefreshAt') IS NULL
+    ALTER TABLE [dbo].[Tweet] ADD [nextRefreshAt] DATETIME2;
+IF COL_LENGTH('dbo.Tweet', 'engagementVelocity') IS NULL
+    ALTER TABLE [dbo].[Tweet] ADD [engagementVelocity] FLOAT(53) NOT NULL CONSTRAINT [Tweet_engagementVelocity_df] DEFAULT 0;
+IF OBJECT_ID('dbo.DF_Tweet_engagementVelocity', 'D') IS NOT NULL
+    EXEC sp_rename 'dbo.DF_Tweet_engagementVelocity', 'Tweet_engagementVelocity_df', 'OBJECT';
+
+-- CreateIndex
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'Tweet_nextRefreshAt_idx' AND object_id = OBJECT_ID('dbo.Tweet'))
+    CREATE NONCLUSTERED INDEX [Tweet_nextRefreshAt_idx] ON [dbo].[Tweet]([nextRefreshAt]);
+
+-- CreateTable
+-- 同じツイート・同じ時刻の重複は捨てる (IGNORE_DUP_KEY)。追記の失敗で Tweet の保存を巻き戻さないため
+IF OBJECT_ID('dbo.TweetMetricSnapshot') IS NULL
+    CREATE TABLE [dbo].[TweetMetricSnapshot] (
+        [tweetId] BIGINT NOT NULL,
+        [observedAt] DATETIME2(0) NOT NULL,
+        [resolution] TINYINT NOT NULL CONSTRAINT [TweetMetricSnapshot_resolution_df] DEFAULT 0,
+        [likes] INT,
+        [retweets] INT,
+        [views] INT,
+        CONSTRAINT [TweetMetricSnapshot_pkey] PRIMARY KEY CLUSTERED ([tweetId],[observedAt],[resolution])
+            WITH (IGNORE_DUP_KEY = ON)
+    );
+IF OBJECT_ID('dbo.DF_TweetMetricSnapshot_resolution', 'D') IS NOT NULL
+    EXEC sp_rename 'dbo.DF_TweetMetricSnapshot_resolution', 'TweetMetricSnapshot_resolution_df', 'OBJECT';
+
+-- CreateIndex
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'TweetMetricSnapshot_resolution_observedAt_idx'
+               AND object_id = OBJECT_ID('dbo.TweetMetricSnapshot'))
+    CREATE NONCLUSTERED INDEX [TweetMetricSnapshot_resolution_observedAt_idx]
+        ON [dbo].[TweetMetricSnapshot]([resolution], [observedAt]);
+
+-- CreateTable
+IF OBJECT_ID('dbo.TweetRanking') IS NULL
+    CREATE TABLE [dbo].[TweetRanking] (
+        [version] INT NOT NULL,
+        [period] VARCHAR(8) NOT NULL,
+        [sort] VARCHAR(8) NOT NULL,
+        [rank] INT NOT NULL,
+        [tweetId] NVARCHAR(64) NOT NULL,
+        [score] FLOAT(53) NOT NULL,
+        CONSTRAINT [TweetRanking_pkey] PRIMARY KEY CLUSTERED ([version],[period],[sort],[rank])
+    );
+
+-- CreateTable
+IF OBJECT_ID('dbo.TweetRankingVersion') IS NULL
+    CREATE TABLE [dbo].[TweetRankingVersion] (
+        [id] INT NOT NULL,
+        [version] INT NOT NULL,
+        [nextVersion] INT NOT NULL CONSTRAINT [TweetRankingVersion_nextVersion_df] DEFAULT 0,
+        [computedAt] DATETIME2 NOT NULL,
+        CONSTRAINT [TweetRankingVersion_pkey] PRIMARY KEY CLUSTERED ([id])
+    );
+IF COL_LENGTH('dbo.TweetRankingVersion', 'nextVersion') IS NULL
+BEGIN
+    ALTER TABLE [dbo].[TweetRankingVersion] ADD [nextVersion] INT NOT NULL CONSTRAINT [TweetRankingVersion_nextVersion_df] DEFAULT 0;
+    EXEC('UPDATE [dbo].[TweetRankingVersion] SET [nextVersion] = [version]');
+END;
+
+-- 公開中のバージョンを指す1行
+EXEC('IF NOT EXISTS (SELECT 1 FROM [dbo].[TweetRankingVersion] WHERE [id] = 1)
+          INSERT INTO [dbo].[TweetRankingVersion] ([id], [version], [nextVersion], [computedAt])
+          VALUES (1, 0, 0, CURRENT_TIMESTAMP)');
+
+-- CreateTable
+IF OBJECT_ID('dbo.RefreshTask') IS NULL
+    CREATE TABLE [dbo].[RefreshTask] (
+        [tweetId] NVARCHAR(64) NOT NULL,
+        [url] NVARCHAR(1000) NOT NULL,
+        [kind] VARCHAR(16) NOT NULL,
+        [priority] FLOAT(53) NOT NULL,
+        [likes] INT,
+        [retweets] INT,
+        [postedAt] DATETIME2,
+        [lastUpdatedAt] DATETIME2,
+        [velocity] FLOAT(53),
+        [rank] INT,
+        [leaseOwner] NVARCHAR(100),
+        [leaseExpiresAt] DATETIME2,
+        [attempts] INT NOT NULL CONSTRAINT [RefreshTask_attempts_df] DEFAULT 0,
+        [enqueuedAt] DATETIME2 NOT NULL CONSTRAINT [RefreshTask_enqueuedAt_df] DEFAULT CURRENT_TIMESTAMP,
+        CONSTRAINT [RefreshTask_pkey] PRIMARY KEY CLUSTERED ([tweetId])
+    );
+IF OBJECT_ID('dbo.DF_RefreshTask_attempts', 'D') IS NOT NULL
+    EXEC sp_rename 'dbo.DF_RefreshTask_attempts', 'RefreshTask_attempts_df', 'OBJECT';
+IF OBJECT_ID('dbo.DF_RefreshTask_enqueuedAt', 'D') IS NOT NULL
+    EXEC sp_rename 'dbo.DF_RefreshTask_enqueuedAt', 'RefreshTask_enqueuedAt_df', 'OBJECT';
+
+-- CreateIndex
+-- 貸し出しの判定に使う leaseExpiresAt を含める (Prisma のスキーマでは表せないため手で追加)
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'RefreshTask_priority_idx' AND object_id = OBJECT_ID('dbo.RefreshTask'))
+    CREATE NONCLUSTERED INDEX [RefreshTask_priority_idx] ON [dbo].[RefreshTask]([priority] DESC) INCLUDE ([leaseExpiresAt]);
+
+COMMIT TRAN;
+
+END TRY
+BEGIN CATCH
+
+IF @@TRANCOUNT > 0
+BEGIN
+    ROLLBACK TRAN;
+END;
+THROW
+
+END CATCH
@@ -0,0 +1,280 @@
+"""
+ランキング集計ジョブ
+==================
+
+機能：
+- 期間（day / week / month / all）× 並び順（likes / total / trending / latest）のランキングを
+  Tweet テーブルからまとめて計算し、TweetRanking テーブルへ書き出す
+- スコアの計算と並べ替えは NumPy の配列演算で一括して行う（全組み合わせで1回の読み込み）
+  - likes:    いいね数
+  - total:    いいね数 + リツイート数 + 閲覧数
+  - trending: 直近 RANKING_TRENDING_HOURS 時間のメトリクス履歴から求めた伸び（いいね+RT/時）。
+              履歴のないツイート、観測の間隔が RANKING_TRENDING_MIN_SPAN 秒未満のツイートは
+              伸びを比べられないため trending には載せない
+  - latest:   投稿日時
+- 投稿日時が不明 (NULL) のツイートは期間別 (day / week / month) と latest のランキングに載せない
+- 新しいランキングは新しいバージョン番号で書き込み、最後にバージョンの参照先 (TweetRankingVersion) を
+  1行だけ更新して切り替える。読み出し側は書き込み途中のランキングを見ることがない
+- バージョン番号は書き込み前に TweetRankingVersion.nextVersion を1つ進めて予約する。複数のジョブが
+  同時に動いても番号は重ならず、ジョブは自分が予約したバージョンの書きかけしか削除しない
+- 公開中より古いバージョンは1世代だけ残して削除する（切り替え直前に読み始めたクエリのため）
+
+Next.js の /api/tweets と reply_bot はランキングをこのテーブルから (period, sort, rank) の範囲で読み出します。
+
+使用方法：
+- 1回実行:   python ranking_job.py [--depth 5000]
+- 定期実行:  python ranking_job.py --every 10   (10分ごと)
+"""
+
+import argparse
+import datetime
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("numpy モジュールが見つかりません。インストールを試みます...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy"])
+    import numpy as np
+
+import pyodbc
+
+from db_pool import connect, describe_connection, require_schema, SchemaMissingError
+from metric_history import fetch_growth
+
+# 期間とその長さ（None は全期間）
+RANKING_PERIODS = {
+    "day": datetime.timedelta(days=1),
+    "week": datetime.timedelta(days=7),
+    "month": datetime.timedelta(days=30),
+    "all": None,
+}
+# 並び順
+RANKING_SORTS = ("likes", "total", "trending", "latest")
+# 1つのランキングに保存する最大順位（ページ送りで読める範囲）
+RANKING_DEPTH = 5000
+# trending に使うメトリクス履歴の期間（時間）
+RANKING_TRENDING_HOURS = 24
+# trending に載せるのに必要な履歴の観測間隔（最初と最後の観測の差、秒）
+RANKING_TRENDING_MIN_SPAN = 3600
+
+# ランキングのテーブル（作成と TweetRankingVersion の1行目の登録は prisma/migrations で行う）
+RANKING_SCHEMA = {
+    "TweetRanking": ("version", "period", "sort", "rank", "tweetId", "score"),
+    "TweetRankingVersion": ("id", "version", "nextVersion", "computedAt"),
+}
+
+SQL_SELECT_TWEETS = """
+    SELECT tweetId, ISNULL(likes, 0), ISNULL(retweets, 0), ISNULL(views, 0), [timestamp]
+    FROM Tweet
+    WHERE tweetId IS NOT NULL
+"""
+
+# 書き込むバージョン番号を予約する（1文の UPDATE なので同時に動くジョブ同士でも番号は重ならない）
+SQL_RESERVE_VERSION = """
+    UPDATE TweetRankingVersion
+    SET nextVersion = CASE WHEN nextVersion > version THEN nextVersion ELSE version END + 1
+    OUTPUT inserted.nextVersion
+    WHERE id = 1
+"""
+
+SQL_INSERT_RANKING = "INSERT INTO TweetRanking (version, period, sort, rank, tweetId, score) VALUES (?, ?, ?, ?, ?, ?)"
+
+# 公開中のバージョンより新しい場合だけ切り替え、切り替え前のバージョンを返す（古ければ0行）
+SQL_SWAP_VERSION = """
+    UPDATE TweetRankingVersion SET version = ?, computedAt = SYSDATETIME()
+    OUTPUT deleted.version
+    WHERE id = 1 AND version < ?
+"""
+
+SQL_DELETE_VERSION = "DELETE FROM TweetRanking WHERE version = ?"
+
+# 公開中の1つ前より古いバージョン（もう公開されることのないもの）を削除する
+SQL_DELETE_OLD = "DELETE FROM TweetRanking WHERE version < ?"
+
+
+def require_ranking_schema(conn):
+    """ランキング用のテーブルがあることを確認する（なければ SchemaMissingError）"""
+    require_schema(conn, RANKING_SCHEMA)
+
+
+def load_tweets(conn, now=None):
+    """
+    ランキングの計算に使う列を NumPy 配列として読み込む
+
+    戻り値:
+        dict (tweet_ids, likes, retweets, views, posted (UNIX秒), velocity (いいね+RT/時))
+        投稿日時が不明な場合の posted と、履歴がない場合の velocity は NaN
+    """
+    now = now or datetime.datetime.now()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SQL_SELECT_TWEETS)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    growth = fetch_growth(conn, RANKING_TRENDING_HOURS, now, RANKING_TRENDING_MIN_SPAN)
+    count = len(rows)
+    tweet_ids = np.empty(count, dtype=object)
+    columns = np.zeros((5, count), dtype=np.float64)
+    for i, (tweet_id, likes, retweets, views, posted_at) in enumerate(rows):
+        tweet_ids[i] = tweet_id
+        recent = growth.get(tweet_id)
+        columns[:, i] = (
+            likes, retweets, views,
+            posted_at.timestamp() if posted_at else np.nan,
+            # 増加が 0 と測れたものは 0 のまま。履歴がなければ NaN
+            recent['likes'] + recent['retweets'] if recent else np.nan,
+        )
+    return {
+        'tweet_ids': tweet_ids,
+        'likes': columns[0],
+        'retweets': columns[1],
+        'views': columns[2],
+        'posted': columns[3],
+        'velocity': columns[4],
+    }
+
+
+def score_tweets(data, sort):
+    """並び順 sort のスコアを配列で返す（大きいほど上位。NaN のツイートはランキングに載せない）"""
+    if sort == "likes":
+        return data['likes']
+    if sort == "total":
+        return data['likes'] + data['retweets'] + data['views']
+    if sort == "latest":
+        return data['posted']
+    if sort == "trending":
+        return data['velocity']
+    raise ValueError(f"不明な並び順: {sort}")
+
+
+def compute_rankings(data, now=None, depth=RANKING_DEPTH):
+    """
+    全ての期間×並び順のランキングを計算する
+
+    戻り値:
+        {(period, sort): (tweetId の配列, スコアの配列)}  上位 depth 件、順位の順
+    """
+    now_ts = (now or datetime.datetime.now()).timestamp()
+    rankings = {}
+    for sort in RANKING_SORTS:
+        scores = score_tweets(data, sort)
+        for period, span in RANKING_PERIODS.items():
+            ranked = ~np.isnan(scores)
+            if span is not None:
+                # 投稿日時が不明 (NaN) のツイートは比較が偽になり、期間別のランキングから外れる
+                ranked &= data['posted'] >= now_ts - span.total_seconds()
+            indices = np.flatnonzero(ranked)
+            period_scores = scores[indices]
+            if depth and len(indices) > depth:
+                # 上位 depth 件だけを選んでから並べ替える
+                top = np.argpartition(-period_scores, depth - 1)[:depth]
+                indices, period_scores = indices[top], period_scores[top]
+            order = np.argsort(-period_scores, kind="stable")
+            rankings[(period, sort)] = (data['tweet_ids'][indices[order]], period_scores[order])
+    return rankings
+
+
+def publish_rankings(conn, rankings):
+    """
+    ランキングを新しいバージョンとして書き込み、参照先を切り替える
+
+    戻り値:
+        新しいバージョン番号。より新しいバージョンが先に公開されていて破棄した場合は None
+    """
+    require_ranking_schema(conn)
+    cursor = conn.cursor()
+    try:
+        # 書き込む前に番号を予約してコミットする（他のジョブはこの番号を使わない）
+        cursor.execute(SQL_RESERVE_VERSION)
+        reserved = cursor.fetchone()
+        if reserved is None:
+            raise SchemaMissingError("TweetRankingVersion に id = 1 の行がありません "
+                                     "(npx prisma migrate deploy でマイグレーションを適用してください)")
+        version = reserved[0]
+        conn.commit()
+        rows = []
+        for (period, sort), (tweet_ids, scores) in rankings.items():
+            rows.extend((version, period, sort, rank, tweet_id, float(score))
+                        for rank, (tweet_id, score) in enumerate(zip(tweet_ids, scores), start=1))
+        if rows:
+            cursor.fast_executemany = True
+            cursor.executemany(SQL_INSERT_RANKING, rows)
+        conn.commit()
+
+        # 参照先の切り替えは1行の更新だけ（より新しいバージョンが公開済みなら自分のバージョンを捨てる）
+        cursor.execute(SQL_SWAP_VERSION, version, version)
+        swapped = cursor.fetchone()
+        conn.commit()
+        if swapped is None:
+            print(f"⚠️ 他のジョブがより新しいバージョンを公開済みのため、バージョン {version} は破棄します")
+            cursor.execute(SQL_DELETE_VERSION, version)
+            conn.commit()
+            return None
+
+        # 切り替え直前に読み始めたクエリのため、1つ前のバージョンは残す
+        # （書き込み中の他のジョブのバージョンは公開中より新しいため削除しない）
+        cursor.execute(SQL_DELETE_OLD, swapped[0])
+        conn.commit()
+        print(f"📊 ランキング バージョン {version} を公開しました ({len(rows)}行)")
+        return version
+    except pyodbc.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def run_ranking_job(conn, depth=RANKING_DEPTH):
+    """ランキングを計算して公開する。処理時間などの統計を返す"""
+    started = time.monotonic()
+    now = datetime.datetime.now()
+    data = load_tweets(conn, now)
+    loaded = time.monotonic()
+    rankings = compute_rankings(data, now, depth)
+    computed = time.monotonic()
+    version = publish_rankings(conn, rankings)
+    finished = time.monotonic()
+    stats = {
+        'version': version,
+        'tweets': len(data['tweet_ids']),
+        'rankings': len(rankings),
+        'load_seconds': loaded - started,
+        'compute_seconds': computed - loaded,
+        'publish_seconds': finished - computed,
+    }
+    print(f"✅ {stats['tweets']}件のツイートから {stats['rankings']}種類のランキングを作成しました "
+          f"(読み込み {stats['load_seconds']:.1f}秒, 計算 {stats['compute_seconds']:.2f}秒, "
+          f"書き込み {stats['publish_seconds']:.1f}秒)")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ランキング集計ジョブ")
+    parser.add_argument("--depth", type=int, default=RANKING_DEPTH, help="1つのランキングに保存する最大順位")
+    parser.add_argument("--every", type=float, default=0, help="指定した分ごとに繰り返し実行する")
+    args = parser.parse_args()
+
+    print(f"🔌 接続先: {describe_connection()}")
+    while True:
+        conn = connect()
+        try:
+            run_ranking_job(conn, args.depth)
+        except (pyodbc.Error, SchemaMissingError) as ex:
+            print(f"❌ ランキングの作成に失敗しました: {ex}")
+        finally:
+            conn.close()
+        if not args.every:
+            break
+        time.sleep(args.every * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n👋 ランキング集計ジョブを停止しました")
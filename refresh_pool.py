@@ -0,0 +1,163 @@
+"""
+ツイート再訪問用のワーカープール
+==============================
+
+機能：
+- 共有キューからツイートを取り出し、複数のページで並列に訪問する
+- 同時に開くページ数 (concurrency) を上限として制御
+- ワーカー毎にエラーを分離（1件の失敗やページのクラッシュで他のワーカーは止まらない）
+- 処理件数・成功/失敗件数・スループット（件/分）を定期的に表示
+- サーキットブレーカー (nav_guard.CircuitBreaker) を渡すと、失敗が続いたときに全ワーカーを一時停止し、
+  打ち切りになった場合は残りのアイテムを処理せずに終了する
+
+ページはログイン済みのブラウザコンテキストから作成するため、Cookie は全ワーカーで共有されます。
+複数アカウントのセッションプール (account_pool.SessionPool) を渡した場合は、
+ワーカーが一定件数ごとにアカウントを借り直します。
+
+使い方:
+    pool = RefreshWorkerPool(page.context, concurrency=4)
+    stats = await pool.run(tweets, visit, on_result)
+"""
+
+import asyncio
+import time
+
+from nav_guard import CircuitOpenError
+
+# 同時に開くページ数の既定値
+REFRESH_CONCURRENCY = 4
+# この件数ごとに進捗（スループット）を表示する
+REFRESH_PROGRESS_EVERY = 25
+# セッションプール使用時、1回の貸し出しで処理する件数
+REFRESH_ITEMS_PER_LEASE = 20
+
+
+class RefreshWorkerPool:
+    """
+    ツイートを並列に訪問するワーカープール
+
+    パラメータ:
+        context: ページを作成するブラウザコンテキスト（ログイン済み）
+        concurrency: 同時に開くページ数の上限
+        progress_every: この件数ごとに進捗を表示する
+        lease: 指定した場合は context の代わりに SessionPool.lease を使い、
+               items_per_lease 件ごとにアカウントのページを借り直す
+        breaker: nav_guard.CircuitBreaker。各アイテムの前に開いていないか確認し、結果を記録する
+    """
+
+    def __init__(self, context=None, concurrency=REFRESH_CONCURRENCY, progress_every=REFRESH_PROGRESS_EVERY,
+                 lease=None, items_per_lease=REFRESH_ITEMS_PER_LEASE, breaker=None):
+        self.context = context
+        self.lease = lease
+        self.items_per_lease = items_per_lease
+        self.breaker = breaker
+        self.aborted = False
+        self.concurrency = max(1, concurrency)
+        self.progress_every = progress_every
+        self.processed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._started = None
+
+    async def run(self, items, visit, on_result):
+        """
+        全アイテムを処理する
+
+        パラメータ:
+            items: 訪問対象のリスト
+            visit: visit(page, item) でレコード (dict) を返す async 関数。取得できない場合は None
+            on_result: 取得したレコードを受け取る async 関数（保存キューへの投入など）
+
+        戻り値:
+            処理統計の dict
+        """
+        queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+
+        workers = min(self.concurrency, queue.qsize())
+        self._started = time.monotonic()
+        print(f"🚀 {len(items)}件を {workers} ワーカーで処理します")
+        if workers:
+            await asyncio.gather(*(self._worker(n, queue, visit, on_result) for n in range(1, workers + 1)))
+
+        stats = self.stats()
+        stats['remaining'] = queue.qsize()
+        print(f"🏁 処理完了: {stats['processed']}件 (成功 {stats['succeeded']}件, 失敗 {stats['failed']}件), "
+              f"{stats['elapsed']:.1f}秒, {stats['per_minute']:.1f}件/分")
+        if self.aborted:
+            print(f"⚠️ ブレーカーにより打ち切ったため {stats['remaining']}件は未処理です")
+        return stats
+
+    def stats(self):
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        return {
+            'processed': self.processed,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'elapsed': elapsed,
+            'per_minute': self.processed / elapsed * 60 if elapsed > 0 else 0.0,
+            'concurrency': self.concurrency,
+            'aborted': self.aborted,
+        }
+
+    async def _worker(self, number, queue, visit, on_result):
+        while not queue.empty() and not self.aborted:
+            if self.lease:
+                # アカウントを一定件数ごとに借り直し、レート制限中のアカウントから離れる
+                async with self.lease() as (_, page):
+                    await self._process(number, queue, visit, on_result, page, self.items_per_lease)
+                continue
+            page = await self.context.new_page()
+            try:
+                await self._process(number, queue, visit, on_result, page, 0)
+            finally:
+                if not page.is_closed():
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+
+    async def _process(self, number, queue, visit, on_result, page, limit):
+        """page で最大 limit 件 (0 の場合は無制限) を処理する。ページが閉じられたら戻る"""
+        handled = 0
+        while not limit or handled < limit:
+            if self.breaker:
+                try:
+                    # 失敗が続いている間は全ワーカーが待つ
+                    await self.breaker.wait_ready()
+                except CircuitOpenError:
+                    self.aborted = True
+                    return
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            handled += 1
+            try:
+                record = await visit(page, item)
+                if record:
+                    await on_result(record)
+                    self.succeeded += 1
+                    if self.breaker:
+                        self.breaker.record_success()
+                else:
+                    self.failed += 1
+                    if self.breaker:
+                        self.breaker.record_failure("ツイートを取得できませんでした")
+            except Exception as e:
+                self.failed += 1
+                if self.breaker:
+                    self.breaker.record_failure(e)
+                print(f"  ❌ ワーカー{number}: 処理中にエラー ({item}): {e}")
+            self.processed += 1
+            if self.progress_every and self.processed % self.progress_every == 0:
+                self._print_progress(queue.qsize())
+            if page.is_closed():
+                # クラッシュ等で閉じたページは作り直す
+                return
+
+    def _print_progress(self, remaining):
+        s = self.stats()
+        print(f"📈 進捗: {s['processed']}件処理 (成功 {s['succeeded']}, 失敗 {s['failed']}, 残り {remaining}), "
+              f"{s['per_minute']:.1f}件/分")
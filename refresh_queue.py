@@ -0,0 +1,202 @@
+"""
+再取得ジョブキュー（複数マシンでの分散実行用）
+==========================================
+
+機能：
+- 再取得するツイートをタスクとして RefreshTask テーブルに登録する
+  （RefreshScheduler で期限が来たツイートを優先度順に選び、確保したものだけを登録）
+- ワーカーは UPDLOCK, READPAST でタスクを借りる。他のワーカーが借りている行は待たずに読み飛ばすため、
+  マシンを増やした分だけ並列に処理できる
+- 借りたタスクには期限 (leaseExpiresAt) があり、処理中はハートビートで延長する。
+  異常終了したワーカーのタスクは期限切れ後に他のワーカーが借り直す
+- 完了したタスクは削除し、失敗したタスクは一定時間後に再試行（上限回数を超えたら破棄）
+
+テーブル:
+    RefreshTask (tweetId, url, kind, priority, 選択時点のメトリクス, leaseOwner, leaseExpiresAt, attempts)
+    kind: "metrics" (メトリクスのみ) / "full" (全データ)
+
+使い方:
+    queue = RefreshTaskQueue(conn)
+    queue.enqueue_due(budget=500)
+    tasks = queue.lease(50)
+    ... 処理しながら queue.heartbeat() ...
+    queue.complete([...]); queue.release([...])
+"""
+
+import os
+import socket
+import uuid
+
+import pyodbc
+
+from db_pool import require_schema
+from refresh_scheduler import RefreshScheduler, REFRESH_BUDGET
+
+# タスクの貸し出し期限（秒）。この間にハートビートがなければ他のワーカーが借り直す
+REFRESH_LEASE_SECONDS = 300
+# 1回に借りるタスク数
+REFRESH_LEASE_BATCH = 50
+# タスクの最大試行回数
+REFRESH_MAX_ATTEMPTS = 3
+# 失敗したタスクを再び貸し出すまでの待ち時間（秒）
+REFRESH_FAILED_DELAY = 600
+
+# タスクのテーブル（作成は prisma/migrations で行う）
+TASK_SCHEMA = {
+    "RefreshTask": ("tweetId", "url", "kind", "priority", "leaseOwner", "leaseExpiresAt", "attempts"),
+}
+
+# 既に登録済み（前回のワーカーが異常終了したなど）のツイートは登録しない
+SQL_ENQUEUE = """
+    INSERT INTO RefreshTask (tweetId, url, kind, priority, likes, retweets, postedAt, lastUpdatedAt, velocity, rank)
+    SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    WHERE NOT EXISTS (SELECT 1 FROM RefreshTask WHERE tweetId = ?)
+"""
+
+# 期限切れ（または未貸し出し）のタスクを優先度順に借りる。他のワーカーがロック中の行は読み飛ばす
+SQL_LEASE = """
+    WITH next AS (
+        SELECT TOP (?) *
+        FROM RefreshTask WITH (UPDLOCK, READPAST, ROWLOCK)
+        WHERE (leaseExpiresAt IS NULL OR leaseExpiresAt < SYSDATETIME()) AND attempts < ?
+        ORDER BY priority DESC
+    )
+    UPDATE next SET
+        leaseOwner = ?,
+        leaseExpiresAt = DATEADD(second, ?, SYSDATETIME()),
+        attempts = attempts + 1
+    OUTPUT inserted.tweetId, inserted.url, inserted.kind, inserted.likes, inserted.retweets,
+           inserted.postedAt, inserted.lastUpdatedAt, inserted.velocity, inserted.rank, inserted.attempts;
+"""
+
+SQL_HEARTBEAT = """
+    UPDATE RefreshTask SET leaseExpiresAt = DATEADD(second, ?, SYSDATETIME())
+    WHERE leaseOwner = ? AND leaseExpiresAt >= SYSDATETIME()
+"""
+
+SQL_COMPLETE = "DELETE FROM RefreshTask WHERE tweetId = ? AND leaseOwner = ?"
+
+# 失敗したタスクは貸し出しを解除し、待ち時間の後に再び借りられるようにする
+SQL_RELEASE = """
+    UPDATE RefreshTask SET leaseOwner = NULL, leaseExpiresAt = DATEADD(second, ?, SYSDATETIME())
+    WHERE tweetId = ? AND leaseOwner = ?
+"""
+
+SQL_DROP_EXHAUSTED = "DELETE FROM RefreshTask WHERE attempts >= ? AND (leaseExpiresAt IS NULL OR leaseExpiresAt < SYSDATETIME())"
+
+SQL_QUEUE_STATS = """
+    SELECT
+        COUNT(*),
+        SUM(CASE WHEN leaseOwner IS NOT NULL AND leaseExpiresAt >= SYSDATETIME() THEN 1 ELSE 0 END),
+        SUM(CASE WHEN leaseOwner IS NOT NULL AND leaseExpiresAt < SYSDATETIME() THEN 1 ELSE 0 END)
+    FROM RefreshTask
+"""
+
+
+def default_owner():
+    """ワーカーの識別子（ホスト名 + プロセスID + 乱数）"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class RefreshTaskQueue:
+    """
+    RefreshTask テーブルを使ったジョブキュー
+
+    パラメータ:
+        conn: pyodbc の接続（このキュー専用。保存処理とは別の接続を使うこと）
+        owner: ワーカーの識別子
+        lease_seconds: 貸し出し期限（秒）
+    """
+
+    def __init__(self, conn, owner=None, lease_seconds=REFRESH_LEASE_SECONDS):
+        self.conn = conn
+        self.owner = owner or default_owner()
+        self.lease_seconds = lease_seconds
+        self._ready = False
+
+    def _execute(self, sql, *params, many=None, fetch=False):
+        """1つの文を実行してコミットする"""
+        self.require_table()
+        cursor = self.conn.cursor()
+        try:
+            if many is not None:
+                cursor.fast_executemany = True
+                cursor.executemany(sql, many)
+                rows = None
+            else:
+                cursor.execute(sql, *params)
+                rows = cursor.fetchall() if fetch else cursor.rowcount
+            self.conn.commit()
+            return rows
+        except pyodbc.Error:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def require_table(self):
+        """RefreshTask テーブルがあることを確認する（なければ SchemaMissingError）"""
+        if self._ready:
+            return
+        require_schema(self.conn, TASK_SCHEMA)
+        self._ready = True
+
+    def enqueue_due(self, budget=REFRESH_BUDGET, kind="metrics"):
+        """期限が来たツイートを優先度順に選んでタスクとして登録し、登録した件数を返す"""
+        self.require_table()
+        scheduler = RefreshScheduler(self.conn, budget)
+        tweets = scheduler.select()
+        selected = scheduler.selected()
+        rows = []
+        # 選択は優先度順なので、順位をそのまま優先度にする（先頭ほど大きい）
+        for position, (tweet_id, url) in enumerate(tweets):
+            info = selected[tweet_id]
+            rows.append((tweet_id, url, kind, float(len(tweets) - position), info['likes'], info['retweets'],
+                         info['posted_at'], info['updated_at'], info['velocity'], info['rank'], tweet_id))
+        if rows:
+            self._execute(SQL_ENQUEUE, many=rows)
+            print(f"📥 再取得タスクを{len(rows)}件登録しました ({kind})")
+        return len(rows)
+
+    def lease(self, batch=REFRESH_LEASE_BATCH):
+        """
+        タスクを借りる
+
+        戻り値:
+            [{'tweet_id', 'url', 'kind', 'attempts', 'info'}, ...]  info は RefreshScheduler.adopt に渡す値
+        """
+        self._execute(SQL_DROP_EXHAUSTED, REFRESH_MAX_ATTEMPTS)
+        rows = self._execute(SQL_LEASE, batch, REFRESH_MAX_ATTEMPTS, self.owner, self.lease_seconds, fetch=True)
+        return [{
+            'tweet_id': tweet_id,
+            'url': url,
+            'kind': kind,
+            'attempts': attempts,
+            'info': {
+                'likes': likes or 0,
+                'retweets': retweets or 0,
+                'posted_at': posted_at,
+                'updated_at': updated_at,
+                'velocity': velocity or 0.0,
+                'rank': rank,
+            },
+        } for tweet_id, url, kind, likes, retweets, posted_at, updated_at, velocity, rank, attempts in rows]
+
+    def heartbeat(self):
+        """借りている全タスクの期限を延長し、延長した件数を返す"""
+        return self._execute(SQL_HEARTBEAT, self.lease_seconds, self.owner)
+
+    def complete(self, tweet_ids):
+        """完了したタスクを削除する"""
+        if tweet_ids:
+            self._execute(SQL_COMPLETE, many=[(tweet_id, self.owner) for tweet_id in tweet_ids])
+
+    def release(self, tweet_ids, delay=REFRESH_FAILED_DELAY):
+        """失敗したタスクを返却し、delay 秒後に再び借りられるようにする"""
+        if tweet_ids:
+            self._execute(SQL_RELEASE, many=[(delay, tweet_id, self.owner) for tweet_id in tweet_ids])
+
+    def stats(self):
+        """キューの件数 (total, leased, expired)"""
+        total, leased, expired = self._execute(SQL_QUEUE_STATS, fetch=True)[0]
+        return {'total': total or 0, 'leased': leased or 0, 'expired': expired or 0}
@@ -0,0 +1,267 @@
+"""
+メトリクス再取得スケジューラー
+============================
+
+機能：
+- 再取得の優先度を、投稿からの経過時間・最終更新からの経過時間・直近の伸び（いいね+RT/時）・
+  現在の順位（いいね数順）から計算
+  順位は ranking_job が公開中の全期間・いいね順ランキング (TweetRanking) から読む。
+  その上位 RANKING_DEPTH 件に入らないツイート（ランキング未作成の場合は全て）は順位なしとして扱う
+- 1回の実行で訪問する件数（予算）を決め、優先度の高いツイートから順に選ぶ
+- 再取得後に次回の予定時刻 (nextRefreshAt) と伸び (engagementVelocity) を書き戻すため、
+  次回以降は期限が来たツイートだけを読み込めば良い
+- 選んだ時点で予定時刻を REFRESH_RETRY_MINUTES 分先に進めて確保するため、メトリクス更新・全データ更新・
+  他のマシンが同時に動いても同じツイートを重複して選ばない（異常終了した場合はその時刻に再び期限が来る）
+
+伸びている新しいツイートは数十分おき、古く動きのないツイートは数週間おきに再取得されます。
+
+使い方:
+    scheduler = RefreshScheduler(conn, budget=500)
+    tweets = scheduler.select()              # [(tweetId, originalUrl), ...] 優先度順
+    ...訪問して scheduler.record_result(tweet_id, metrics) ...
+    scheduler.commit()                       # 次回予定時刻と伸びを保存
+"""
+
+import datetime
+import math
+
+import pyodbc
+
+from db_pool import require_schema
+
+# 1回の実行で再取得する件数の既定値
+REFRESH_BUDGET = 500
+# 「上位」とみなす順位（この順位以内は再取得間隔を短くする）
+REFRESH_TOP_RANK = 100
+# 「伸びている」とみなす伸び（いいね+RT/時）
+REFRESH_HOT_VELOCITY = 50.0
+# 再取得に失敗したツイートの再試行までの間隔（分）
+REFRESH_RETRY_MINUTES = 60
+# 次回予定時刻の下限・上限（分）
+REFRESH_INTERVAL_MIN = 20
+REFRESH_INTERVAL_MAX = 14 * 24 * 60
+
+# 投稿からの経過時間（時間）ごとの基本の再取得間隔（分）
+_BASE_INTERVALS = (
+    (6, 30),
+    (24, 2 * 60),
+    (7 * 24, 12 * 60),
+    (30 * 24, 3 * 24 * 60),
+)
+_BASE_INTERVAL_OLD = 14 * 24 * 60
+
+# スケジュールに使うカラムとランキングのテーブル（作成は prisma/migrations で行う）
+SCHEDULE_SCHEMA = {
+    "Tweet": ("nextRefreshAt", "engagementVelocity"),
+    "TweetRanking": ("version", "tweetId", "rank"),
+    "TweetRankingVersion": ("version",),
+}
+
+# 期限が来た（または一度もスケジュールされていない）ツイートを取得する。順位は毎回 Tweet 全体を
+# 並べ替えず、ranking_job が保存した公開中のランキングから引く
+SQL_SELECT_DUE = """
+SELECT t.tweetId, t.originalUrl, t.likes, t.retweets, t.[timestamp], t.updatedAt, t.engagementVelocity, r.[rank]
+FROM Tweet t
+LEFT JOIN TweetRankingVersion v ON v.id = 1
+LEFT JOIN TweetRanking r
+    ON r.version = v.version AND r.period = 'all' AND r.sort = 'likes' AND r.tweetId = t.tweetId
+WHERE t.tweetId IS NOT NULL AND t.originalUrl IS NOT NULL
+  AND (t.nextRefreshAt IS NULL OR t.nextRefreshAt <= ?)
+"""
+
+# 選んだツイートの予定時刻を先に進めて確保する。同時に動く他のプロセス（別のマシンを含む）が
+# 同じツイートを選ばないよう、まだ期限切れのままのものだけを更新し、確保できたIDを返す
+SQL_CREATE_CLAIM = """
+    IF OBJECT_ID('tempdb..#RefreshClaim') IS NOT NULL DROP TABLE #RefreshClaim;
+    CREATE TABLE #RefreshClaim (tweetId NVARCHAR(64) NOT NULL PRIMARY KEY);
+"""
+
+SQL_CLAIM = """
+    UPDATE t SET nextRefreshAt = ?
+    OUTPUT inserted.tweetId
+    FROM Tweet t
+    JOIN #RefreshClaim c ON t.tweetId = c.tweetId
+    WHERE t.nextRefreshAt IS NULL OR t.nextRefreshAt <= ?;
+"""
+
+SQL_UPDATE_SCHEDULE = "UPDATE Tweet SET nextRefreshAt = ?, engagementVelocity = ? WHERE tweetId = ?"
+
+
+def _hours_between(later, earlier):
+    if not later or not earlier:
+        return 0.0
+    return max(0.0, (later - earlier).total_seconds() / 3600)
+
+
+def refresh_priority(age_hours, stale_hours, velocity, rank):
+    """
+    再取得の優先度を計算する（大きいほど先に再取得する）
+
+    最終更新からの経過時間を基本とし、新しい・伸びている・上位のツイートほど重みを大きくする。
+    """
+    staleness = math.log1p(stale_hours)
+    freshness = 1.0 / (1.0 + age_hours / 24.0)
+    momentum = math.log1p(max(0.0, velocity or 0.0))
+    standing = 1.0 / (1.0 + (rank or 0) / REFRESH_TOP_RANK) if rank else 0.0
+    return staleness * (1.0 + 2.0 * freshness + momentum + 2.0 * standing)
+
+
+def next_refresh_interval(age_hours, velocity, rank):
+    """次回の再取得までの間隔（分）を返す"""
+    minutes = _BASE_INTERVAL_OLD
+    for max_age, interval in _BASE_INTERVALS:
+        if age_hours < max_age:
+            minutes = interval
+            break
+    if velocity >= REFRESH_HOT_VELOCITY:
+        minutes /= 4
+    elif velocity > 0:
+        minutes /= 2
+    if rank and rank <= REFRESH_TOP_RANK:
+        minutes /= 2
+    return int(min(REFRESH_INTERVAL_MAX, max(REFRESH_INTERVAL_MIN, minutes)))
+
+
+def require_schedule_schema(conn):
+    """スケジュール用のカラムとランキングのテーブルがあることを確認する（なければ SchemaMissingError）"""
+    require_schema(conn, SCHEDULE_SCHEMA)
+
+
+class RefreshScheduler:
+    """
+    再取得対象の選択と次回予定時刻の書き戻しを行う
+
+    パラメータ:
+        conn: pyodbc の接続
+        budget: 1回の実行で選ぶ最大件数
+    """
+
+    def __init__(self, conn, budget=REFRESH_BUDGET):
+        self.conn = conn
+        self.budget = budget
+        self.now = None
+        self.due_count = 0
+        self._selected = {}
+        self._results = {}
+
+    def select(self):
+        """
+        期限が来たツイートを優先度順に選ぶ
+
+        戻り値:
+            [(tweetId, originalUrl), ...] （優先度の高い順、最大 budget 件）
+        """
+        require_schedule_schema(self.conn)
+        self.now = datetime.datetime.now()
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(SQL_SELECT_DUE, self.now)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        self.due_count = len(rows)
+        scored = []
+        for tweet_id, url, likes, retweets, posted_at, updated_at, velocity, rank in rows:
+            age_hours = _hours_between(self.now, posted_at)
+            stale_hours = _hours_between(self.now, updated_at)
+            priority = refresh_priority(age_hours, stale_hours, velocity, rank)
+            scored.append((priority, tweet_id, url, {
+                'likes': likes or 0,
+                'retweets': retweets or 0,
+                'posted_at': posted_at,
+                'updated_at': updated_at,
+                'velocity': velocity or 0.0,
+                'rank': rank,
+            }))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        chosen = scored[:self.budget] if self.budget and self.budget > 0 else scored
+        claimed = self._claim([tweet_id for _, tweet_id, _, _ in chosen])
+        chosen = [item for item in chosen if item[1] in claimed]
+        self._selected = {tweet_id: info for _, tweet_id, _, info in chosen}
+        print(f"🗓 再取得対象: 期限到来 {self.due_count}件中 {len(chosen)}件を優先度順に選択 (予算 {self.budget}件)")
+        return [(tweet_id, url) for _, tweet_id, url, _ in chosen]
+
+    def _claim(self, tweet_ids):
+        """予定時刻を先に進めてツイートを確保し、確保できたIDの set を返す"""
+        if not tweet_ids:
+            return set()
+        until = self.now + datetime.timedelta(minutes=REFRESH_RETRY_MINUTES)
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(SQL_CREATE_CLAIM)
+            cursor.fast_executemany = True
+            cursor.executemany("INSERT INTO #RefreshClaim (tweetId) VALUES (?)", [(t,) for t in tweet_ids])
+            cursor.execute(SQL_CLAIM, until, self.now)
+            claimed = {row[0] for row in cursor.fetchall()}
+            cursor.execute("DROP TABLE #RefreshClaim")
+            self.conn.commit()
+        except pyodbc.Error:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        if len(claimed) < len(tweet_ids):
+            print(f"ℹ️ {len(tweet_ids) - len(claimed)}件は他のプロセスが再取得中のため除外しました")
+        return claimed
+
+    def selected(self):
+        """選んだツイートの選択時点の値 {tweetId: info}（ジョブキューへの登録に使う）"""
+        return dict(self._selected)
+
+    def adopt(self, selected):
+        """
+        他のプロセスが選んだツイートを引き継ぐ（ジョブキューから借りたタスクの結果を書き戻すため）
+
+        selected: {tweetId: info}  info は likes, retweets, posted_at, updated_at, velocity, rank
+        """
+        self.now = datetime.datetime.now()
+        self._selected = dict(selected)
+        self._results = {}
+
+    def record_result(self, tweet_id, metrics):
+        """再取得したメトリクスを記録する（次回予定時刻と伸びの計算に使用）"""
+        if tweet_id in self._selected and metrics:
+            self._results[tweet_id] = metrics
+
+    def commit(self, include_failed=True):
+        """
+        選んだツイートの次回予定時刻と伸びを保存する。失敗したツイートは一定時間後に再試行
+
+        include_failed=False の場合、失敗したツイートの予定時刻は変更しない（ジョブキュー側で再試行する場合）
+        """
+        if not self._selected:
+            return 0
+        rows = []
+        for tweet_id, info in self._selected.items():
+            metrics = self._results.get(tweet_id)
+            if metrics is None:
+                if not include_failed:
+                    continue
+                next_at = self.now + datetime.timedelta(minutes=REFRESH_RETRY_MINUTES)
+                rows.append((next_at, info['velocity'], tweet_id))
+                continue
+            elapsed = _hours_between(self.now, info['updated_at'])
+            # 取得できなかった値 (None) は前回から増加なしとみなす
+            gained = sum(metrics[name] - info[name] for name in ('likes', 'retweets')
+                         if metrics.get(name) is not None)
+            velocity = max(0.0, gained / elapsed) if elapsed > 0 else info['velocity']
+            age_hours = _hours_between(self.now, info['posted_at'])
+            minutes = next_refresh_interval(age_hours, velocity, info['rank'])
+            rows.append((self.now + datetime.timedelta(minutes=minutes), velocity, tweet_id))
+        if not rows:
+            return 0
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.fast_executemany = True
+            cursor.executemany(SQL_UPDATE_SCHEDULE, rows)
+            self.conn.commit()
+        except pyodbc.Error as ex:
+            self.conn.rollback()
+            print(f"❌ 次回予定時刻の保存に失敗: {ex}")
+            return 0
+        finally:
+            cursor.close()
+        print(f"🗓 次回予定時刻を保存: {len(rows)}件 (再取得成功 {len(self._results)}件)")
+        return len(rows)
@@ -22,11 +22,15 @@ import argparse
 import pyodbc
 from playwright.sync_api import sync_playwright, TimeoutError, Error as PlaywrightError # Use sync_api
 from dotenv import load_dotenv
-from urllib.parse import urlparse, parse_qs, unquote_plus
+from db_pool import get_pool, release_connection, describe_connection
+from browser_session import (has_auth_cookie, AUTH_COOKIE_URLS, SESSION_PROBE_URL, SESSION_PROBE_TIMEOUT,
+                             LOGGED_IN_SELECTOR, x_url)
 
 # --- 設定 ---
 RANKING_LIMIT = 20  # リプライ対象のランキング上限
 REPLY_DELAY_SECONDS = 60 # 各リプライ間の待機時間（秒） - スパム判定回避のため長めに設定
+# ログインセッションとキャッシュを保存するプロファイル（スクレイパーと同時に動かせるよう別ディレクトリ）
+REPLY_PROFILE_DIR = os.getenv("REPLY_PROFILE_DIR", ".pw-chrome-reply")
 
 # --- 環境変数読み込み ---
 load_dotenv()
@@ -47,65 +51,57 @@ def log_warning(message):
 
 # --- データベース接続 ---
 def connect_db():
-    """データベースに接続する (pyodbc, ODBC接続文字列)"""
+    """データベース接続を共通プールから借りる (返却は release_connection)"""
     if not DATABASE_URL:
         log_error("環境変数 DATABASE_URL が設定されていません。")
         return None
 
-    connection_string = ""
     try:
-        # URL形式を解析してODBC接続文字列を作成
-        from urllib.parse import urlparse, parse_qs, unquote_plus
-
-        # Add debug print before parsing
-        print(f"[DEBUG] String being parsed by urlparse: '{DATABASE_URL}'")
-
-        parsed_url = urlparse(DATABASE_URL)
-        query_params = parse_qs(parsed_url.query)
-
-        server = parsed_url.hostname
-        port = parsed_url.port if parsed_url.port else 1433
-        database = parsed_url.path.lstrip('/')
-        username = unquote_plus(parsed_url.username) if parsed_url.username else None
-        password = unquote_plus(parsed_url.password) if parsed_url.password else None
-        driver = "{ODBC Driver 17 for SQL Server}" # 必要に応じて調整
-        trust_cert = query_params.get('trustServerCertificate', ['false'])[0].lower() == 'true'
-
-        if not all([server, database, username, password]):
-            log_error("DATABASE_URL の解析に失敗。情報不足。")
-            return None
-
-        connection_string = (
-            f"DRIVER={driver};"
-            f"SERVER={server},{port};"
-            f"DATABASE={database};"
-            f"UID={username};"
-            f"PWD={password};"
-        )
-        if trust_cert:
-            connection_string += "TrustServerCertificate=yes;"
-
-        log_info(f"生成されたODBC接続文字列 (パスワード伏字): DRIVER=...;SERVER={server},{port};DATABASE={database};UID={username};PWD=***;")
-        log_info("ODBC接続文字列でデータベース接続試行中...")
-        conn = pyodbc.connect(connection_string, autocommit=False) # 自動コミットはFalse推奨
+        log_info(f"データベース接続試行中... ({describe_connection()})")
+        conn = get_pool().acquire()
         log_info("データベース接続成功")
         return conn
     except pyodbc.Error as ex:
         sqlstate = ex.args[0]
         log_error(f"データベース接続エラー (pyodbc): {sqlstate} - {ex}")
-        log_error(f"試行した接続文字列: {connection_string}") # エラー時に接続文字列もログ出力
         return None
     except Exception as e:
         log_error(f"データベース接続中に予期せぬエラー: {e}")
-        log_error(f"試行した接続文字列: {connection_string}")
         return None
 
 # --- ランキングデータ取得 ---
+# ranking_job.py が作成した総合ランキング (全期間, いいね+RT+閲覧数) から上位を読み出す
+SQL_SELECT_RANKED = """
+    SELECT TOP (?) t.originalUrl, r.rank
+    FROM TweetRanking r
+    JOIN TweetRankingVersion v ON v.id = 1 AND r.version = v.version
+    JOIN Tweet t ON t.tweetId = r.tweetId
+    WHERE r.period = 'all' AND r.sort = 'total'
+      AND t.originalUrl IS NOT NULL AND t.originalUrl != ''
+    ORDER BY r.rank ASC;
+"""
+
+def fetch_ranked_tweets(conn, limit=RANKING_LIMIT):
+    """集計済みのランキングから上位のツイートを取得する（ランキング未作成の場合は空のリスト）"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SQL_SELECT_RANKED, (limit,))
+        return [{"url": row.originalUrl, "rank": row.rank} for row in cursor.fetchall()]
+    except pyodbc.Error as ex:
+        log_warning(f"集計済みランキングを読み出せません。直接集計します: {ex}")
+        conn.rollback()
+        return []
+    finally:
+        cursor.close()
+
 def fetch_top_tweets(conn, limit=RANKING_LIMIT):
     """データベースから閲覧数上位のツイートを取得する"""
     log_info(f"閲覧数上位{limit}件のツイートを取得中...")
+    tweets = fetch_ranked_tweets(conn, limit)
+    if tweets:
+        log_info(f"集計済みランキングから{len(tweets)}件のツイートを取得しました。")
+        return tweets
     cursor = conn.cursor()
-    tweets = []
     try:
         # いいね数(likes), リツイート数(retweets), 閲覧数(views) の合計値でランキング
         log_info("いいね数+リツイート数+閲覧数の合計でランキングデータを取得中...")
@@ -137,13 +133,26 @@ def fetch_top_tweets(conn, limit=RANKING_LIMIT):
         cursor.close()
     return tweets
 
+# --- ログインセッション確認 (Sync version) ---
+def is_logged_in(page):
+    """保存済みのセッションが有効か確認する (Cookie がなければ通信せずに False)"""
+    if not has_auth_cookie(page.context.cookies(AUTH_COOKIE_URLS)):
+        return False
+    try:
+        page.goto(SESSION_PROBE_URL, timeout=60000, wait_until="domcontentloaded")
+        page.wait_for_selector(LOGGED_IN_SELECTOR, timeout=SESSION_PROBE_TIMEOUT)
+        return True
+    except (TimeoutError, PlaywrightError) as e:
+        log_info(f"保存済みのセッションが無効です: {e}")
+        return False
+
 # --- Twitterログイン (Sync version) ---
 def login_to_twitter(page): # Remove async
     """X（旧Twitter）にログインする"""
     log_info("ログインページを開きます...")
     try:
-        page.goto("https://x.com/i/flow/login", timeout=120000) # Remove await
-        page.wait_for_load_state("networkidle", timeout=60000) # Remove await
+        # networkidle は常時接続のため滅多に到達しない。入力欄の表示を待つ (次の wait_for_selector)
+        page.goto(x_url("/i/flow/login"), timeout=120000, wait_until="commit")
     except (TimeoutError, PlaywrightError) as e:
         log_error(f"ログインページの読み込みに失敗: {e}")
         return False
@@ -234,7 +243,7 @@ def reply_to_tweet(page, tweet_url, rank, app_url, test_mode=False): # Remove as
     try:
         # ツイートページに移動 (wait_until を変更)
         log_info(f"  ページ移動: {tweet_url}")
-        page.goto(tweet_url, timeout=60000, wait_until="domcontentloaded") # Change wait_until
+        page.goto(x_url(tweet_url), timeout=60000, wait_until="domcontentloaded") # Change wait_until
         log_info("  ページDOM読み込み完了。ツイート本体を待機中...")
 
         # ツイート本体が表示されるのを待つ
@@ -325,7 +334,7 @@ def main(app_url, test_mode): # Remove async
         return # DB接続失敗時は終了
 
     top_tweets = fetch_top_tweets(conn)
-    conn.close() # DBからデータ取得後は接続を閉じる
+    release_connection(conn) # DBからデータ取得後は接続を返却する
 
     if not top_tweets:
         log_info("リプライ対象のツイートが見つかりませんでした。処理を終了します。")
@@ -333,22 +342,25 @@ def main(app_url, test_mode): # Remove async
 
     log_info(f"リプライ対象ツイート数: {len(top_tweets)}")
 
-    playwright = None # Keep track for stopping later
-    browser = None
     try:
         # Use sync_playwright context manager
         with sync_playwright() as p:
-            playwright = p # Assign to outer scope variable if needed for stopping, though context manager handles it
-            # headfulモードで起動 (headless=False)
-            browser = p.chromium.launch(headless=False) # Use p instead of await playwright
-            context = browser.new_context( # Use browser instead of await browser
+            # headfulモードで起動 (headless=False)。プロファイルを再利用して Cookie とキャッシュを引き継ぐ
+            os.makedirs(REPLY_PROFILE_DIR, exist_ok=True)
+            context = p.chromium.launch_persistent_context(
+                REPLY_PROFILE_DIR,
+                headless=False,
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36'
             )
-            page = context.new_page() # Use context instead of await context
-            log_info("ブラウザを起動しました。")
+            page = context.pages[0] if context.pages else context.new_page()
+            log_info(f"ブラウザを起動しました。(プロファイル: {REPLY_PROFILE_DIR})")
 
-            if not login_to_twitter(page): # Remove await
+            # 保存済みのセッションが有効ならログインを省略する
+            if is_logged_in(page):
+                log_info("保存済みのセッションでログイン済みです。ログイン処理を省略します。")
+            elif not login_to_twitter(page): # Remove await
                 log_error("ログインに失敗したため、処理を中断します。")
+                context.close()
                 return # ログイン失敗時は終了
 
             success_count = 0
@@ -366,6 +378,7 @@ def main(app_url, test_mode): # Remove async
                 time.sleep(REPLY_DELAY_SECONDS) # Use time.sleep
 
             log_info(f"処理完了 - 成功: {success_count}件, 失敗: {fail_count}件")
+            context.close() # プロファイルへ Cookie を書き出す
 
     # Context manager handles browser closing automatically
     # No need for explicit browser.close() or playwright.stop() in finally
@@ -0,0 +1,150 @@
+"""
+スクレイピング用の通信制限（リソースポリシー）
+============================================
+
+機能：
+- スクレイパーが必要とするのは本文・カウンター・URLだけなので、重いリソースの読み込みを止める
+  - media: 動画のセグメント (video.twimg.com)
+  - image: サムネイル・プロフィール画像などの画像 (pbs.twimg.com ほか)
+  - font: Webフォント
+  - analytics: 行動ログ・広告計測の送信
+- 動画の自動再生を無効化（起動オプションと、再生を止めるページ内スクリプト）
+- 止めたリクエスト数と、種類毎の平均サイズから推定した削減バイト数を記録
+
+制限は context.route に URL パターン（グロブ）を登録して行います。全リクエストを Python で
+判定する方式と違い、パターンに一致しない通信（JS・GraphQL など）は Python を経由しません。
+画像やフォントのURL自体は DOM に残るため、URL の取得には影響しません。
+
+ポリシー:
+    full: 制限なし（従来の動作、既定）
+    lean: 動画・画像・フォント・計測を止め、自動再生を無効化（--resource-policy lean で指定）
+          動画のプレイヤーが src を設定しなくなるため、動画URLを通信 (video_info.variants) から得る
+          GraphQL 方式 (capture_mode "graphql") でだけ使える。画面要素から読む dom 方式では使えない
+"""
+
+# 既定のポリシー
+RESOURCE_POLICY = "full"
+
+# ポリシー毎に止めるリソースの種類
+RESOURCE_POLICIES = {
+    "full": (),
+    "lean": ("media", "image", "font", "analytics"),
+}
+
+# 種類毎の URL パターン
+_BLOCK_PATTERNS = {
+    "media": [
+        "https://video.twimg.com/**",
+        "**/*.{mp4,m4s,m3u8,ts,webm}",
+    ],
+    "image": [
+        "https://pbs.twimg.com/**",
+        "https://abs.twimg.com/emoji/**",
+        "https://abs.twimg.com/sticky/**",
+        "**/*.{png,jpg,jpeg,gif,webp,avif,svg,ico}",
+    ],
+    "font": [
+        "**/*.{woff,woff2,ttf,otf}",
+    ],
+    "analytics": [
+        "**/i/api/1.1/jot/**",
+        "**/1.1/jot/**",
+        "**/client_event.json*",
+        "https://www.google-analytics.com/**",
+        "https://www.googletagmanager.com/**",
+        "https://*.doubleclick.net/**",
+        "https://ads-api.x.com/**",
+        "https://ads-twitter.com/**",
+        "https://static.ads-twitter.com/**",
+    ],
+}
+
+# 削減バイト数の推定に使う、種類毎の1リクエストあたりの平均サイズ
+_ESTIMATED_BYTES = {
+    "media": 400_000,
+    "image": 35_000,
+    "font": 40_000,
+    "analytics": 2_000,
+}
+
+# 自動再生を止める Chromium の起動オプション
+_AUTOPLAY_ARGS = ["--autoplay-policy=user-gesture-required"]
+
+# ページ内の動画を再生させないスクリプト（サイト側が play() を呼んでも再生しない）
+_DISABLE_AUTOPLAY_JS = """
+(() => {
+    const noop = function () { return Promise.resolve(); };
+    HTMLMediaElement.prototype.play = noop;
+    Object.defineProperty(HTMLMediaElement.prototype, 'autoplay', { get: () => false, set: () => {} });
+    Object.defineProperty(HTMLMediaElement.prototype, 'preload', { get: () => 'none', set: () => {} });
+})();
+"""
+
+
+class ResourcePolicy:
+    """
+    ブラウザコンテキストに通信制限を適用する
+
+    使い方:
+        policy = ResourcePolicy("lean")
+        context = await launch_session_context(p, profile_dir, args=policy.launch_args())
+        await policy.apply(context)
+        ...
+        print(policy.format_stats())
+    """
+
+    def __init__(self, name=RESOURCE_POLICY):
+        if name not in RESOURCE_POLICIES:
+            raise ValueError(f"不明なリソースポリシー: {name} (選択肢: {', '.join(RESOURCE_POLICIES)})")
+        self.name = name
+        self.categories = RESOURCE_POLICIES[name]
+        self.blocked = {category: 0 for category in self.categories}
+
+    @property
+    def blocks_media(self):
+        """動画を止めるか（画面要素から動画URLを読む dom 方式とは併用できない）"""
+        return "media" in self.categories
+
+    def launch_args(self):
+        """ブラウザ起動時に追加するオプション"""
+        return list(_AUTOPLAY_ARGS) if "media" in self.categories else []
+
+    async def apply(self, context):
+        """コンテキストに通信制限と自動再生の無効化を登録する"""
+        if not self.categories:
+            return
+        for category in self.categories:
+            handler = self._make_handler(category)
+            for pattern in _BLOCK_PATTERNS[category]:
+                await context.route(pattern, handler)
+        if "media" in self.categories:
+            await context.add_init_script(_DISABLE_AUTOPLAY_JS)
+        print(f"🪶 リソースポリシー '{self.name}' を適用: {', '.join(self.categories)} の読み込みを停止")
+
+    def stats(self):
+        """止めたリクエスト数と推定削減バイト数"""
+        estimated = sum(count * _ESTIMATED_BYTES[category] for category, count in self.blocked.items())
+        return {
+            'policy': self.name,
+            'blocked': dict(self.blocked),
+            'blocked_total': sum(self.blocked.values()),
+            'estimated_bytes_saved': estimated,
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        if not self.categories:
+            return f"ポリシー '{self.name}' (制限なし)"
+        detail = ", ".join(f"{category} {count}件" for category, count in s['blocked'].items())
+        return (f"ポリシー '{self.name}': {s['blocked_total']}件のリクエストを停止 ({detail}), "
+                f"推定 {s['estimated_bytes_saved'] / 1_000_000:.1f}MB 削減")
+
+    def _make_handler(self, category):
+        async def handler(route):
+            # GraphQL などの API はパターンに一致しても止めない
+            if "/graphql/" in route.request.url:
+                await route.continue_()
+                return
+            self.blocked[category] += 1
+            await route.abort("blockedbyclient")
+        return handler
@@ -0,0 +1,281 @@
+"""
+スクレイピングジョブ常駐サービス
+==============================
+
+機能：
+- ログイン済みのブラウザを起動したまま常駐し、検索ジョブをキューで受け付ける
+  （API リクエスト毎に Python の起動・Chromium の起動・ログインを繰り返さない）
+- ローカルの HTTP API でジョブを登録すると、その場でジョブIDを返す
+- ジョブの状態 (queued / running / done / failed) と結果（新規動画数・ツイートURLなど）を取得可能
+- 同時実行数の上限までジョブを並列に実行（ジョブ毎に専用のページ、アカウントが複数あれば別コンテキスト）
+  同時実行数はジョブ毎に DB 接続を1本使うため DB_POOL_SIZE (既定 4) を上限とする
+
+API:
+    POST /jobs          {"query": "...", "limit": 10, "capture_mode": "graphql"}  → 202 {"job_id": ...}
+    GET  /jobs/<job_id> ジョブの状態と結果
+    GET  /jobs          最近のジョブ一覧
+    GET  /health        稼働状況（キューの長さ、セッションプールの統計）
+    GET  /metrics       処理段階ごとの計測値 (Prometheus 形式, stage_metrics)
+
+使用方法：
+- python scrape_daemon.py [--host 127.0.0.1] [--port 8765] [--concurrency 2] [--headless]
+
+Next.js の /api/scrape はこのサービスへジョブを登録するだけで、完了を待ちません。
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import uuid
+from collections import OrderedDict
+
+from playwright.async_api import async_playwright
+
+from twitter_video_search import (search_videos, login_to_twitter, autosave_data, temp_video_data,
+                                  CAPTURE_MODE, HEADLESS)
+from account_pool import SessionPool, load_accounts, ACCOUNTS_FILE
+from browser_session import SESSION_PROFILE_DIR
+from resource_policy import ResourcePolicy, RESOURCE_POLICY, RESOURCE_POLICIES
+from db_pool import DB_POOL_SIZE
+from stage_metrics import METRICS
+
+# 待ち受けアドレス（外部に公開しないこと）
+DAEMON_HOST = os.getenv("SCRAPE_DAEMON_HOST", "127.0.0.1")
+DAEMON_PORT = int(os.getenv("SCRAPE_DAEMON_PORT", "8765"))
+# 同時に実行するジョブ数の上限
+DAEMON_CONCURRENCY = int(os.getenv("SCRAPE_DAEMON_CONCURRENCY", "2"))
+# 保持するジョブ履歴の件数
+DAEMON_MAX_JOBS = 500
+# 1ジョブあたりの取得件数の上限
+DAEMON_MAX_LIMIT = 1000
+# リクエストボディの上限（バイト）
+_MAX_BODY = 64 * 1024
+
+_STATUS_TEXT = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+                405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def _now():
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+class ScrapeDaemon:
+    """
+    検索ジョブを受け付けて実行する常駐サービス
+
+    パラメータ:
+        session_pool: ログイン済みのセッションを貸し出す SessionPool
+        concurrency: 同時に実行するジョブ数
+    """
+
+    def __init__(self, session_pool, concurrency=DAEMON_CONCURRENCY, resource_policy=None):
+        self.session_pool = session_pool
+        # 動画を止めるポリシーでは、画面要素から動画URLを読む dom 方式のジョブを受け付けない
+        self.dom_allowed = not (resource_policy and resource_policy.blocks_media)
+        if concurrency > DB_POOL_SIZE:
+            # ジョブ1件につき DB 接続を1本使うため、接続プールの大きさを超えて同時に実行しない
+            print(f"⚠️ 同時実行数を接続プールの大きさ (DB_POOL_SIZE={DB_POOL_SIZE}) に制限します")
+            concurrency = DB_POOL_SIZE
+        self.concurrency = max(1, concurrency)
+        self.jobs = OrderedDict()
+        self.queue = asyncio.Queue()
+        self.running = 0
+        self._workers = []
+
+    def submit(self, query, limit=10, capture_mode=CAPTURE_MODE):
+        """ジョブを登録してジョブ情報を返す"""
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'status': "queued",
+            'query': query,
+            'limit': limit,
+            'capture_mode': capture_mode,
+            'created_at': _now(),
+            'started_at': None,
+            'finished_at': None,
+            'account': None,
+            'result': None,
+            'error': None,
+        }
+        self.jobs[job['job_id']] = job
+        while len(self.jobs) > DAEMON_MAX_JOBS:
+            self.jobs.popitem(last=False)
+        self.queue.put_nowait(job)
+        print(f"📥 ジョブを受け付けました: {job['job_id']} ('{query}', {limit}件)")
+        return job
+
+    def start_workers(self):
+        self._workers = [asyncio.create_task(self._worker(n)) for n in range(1, self.concurrency + 1)]
+
+    async def stop_workers(self):
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def _worker(self, number):
+        while True:
+            job = await self.queue.get()
+            self.running += 1
+            job['status'] = "running"
+            job['started_at'] = _now()
+            try:
+                async with self.session_pool.lease() as (session, page):
+                    job['account'] = session.name
+                    print(f"▶️ ワーカー{number}: ジョブ {job['job_id']} を開始 (アカウント {session.name})")
+                    job['result'] = await search_videos(page, job['query'], job['limit'], job['capture_mode'])
+                job['status'] = "done"
+            except Exception as e:
+                job['status'] = "failed"
+                job['error'] = str(e)
+                print(f"❌ ワーカー{number}: ジョブ {job['job_id']} が失敗: {e}")
+            finally:
+                job['finished_at'] = _now()
+                self.running -= 1
+                self.queue.task_done()
+            if temp_video_data:
+                # 保存に失敗したレコードはジョブ毎に再保存を試みる
+                await autosave_data()
+
+    # --- HTTP ---
+    async def handle_connection(self, reader, writer):
+        try:
+            status, payload = await self._handle_request(reader)
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+        if isinstance(payload, str):
+            # /metrics はテキスト形式で返す
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        head = (f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n")
+        writer.write(head.encode("ascii") + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split(" ")
+        if len(parts) != 3:
+            return 400, {'error': "不正なリクエストです"}
+        method, target, _ = parts
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        if length > _MAX_BODY:
+            return 413, {'error': "リクエストボディが大きすぎます"}
+        body = await reader.readexactly(length) if length else b""
+        path = target.split("?", 1)[0].rstrip("/") or "/"
+        return self._route(method, path, body)
+
+    def _route(self, method, path, body):
+        if path == "/metrics":
+            return 200, METRICS.render_prometheus()
+        if path == "/health":
+            return 200, {
+                'status': "ok",
+                'queued': self.queue.qsize(),
+                'running': self.running,
+                'concurrency': self.concurrency,
+                'sessions': self.session_pool.stats(),
+            }
+        if path == "/jobs":
+            if method == "GET":
+                return 200, {'jobs': [self._summary(job) for job in reversed(self.jobs.values())]}
+            if method != "POST":
+                return 405, {'error': "POST または GET を使用してください"}
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {'error': "JSON の解析に失敗しました"}
+            query = (data.get("query") or "").strip()
+            if not query:
+                return 400, {'error': "検索キーワード (query) が必要です"}
+            try:
+                limit = int(data.get("limit") or 10)
+            except (TypeError, ValueError):
+                return 400, {'error': "limit は数値で指定してください"}
+            limit = max(1, min(limit, DAEMON_MAX_LIMIT))
+            capture_mode = data.get("capture_mode") or CAPTURE_MODE
+            if capture_mode not in ("graphql", "dom"):
+                return 400, {'error': "capture_mode は graphql または dom を指定してください"}
+            if capture_mode == "dom" and not self.dom_allowed:
+                return 400, {'error': "動画を止めるリソースポリシーで起動しているため dom 方式は使えません"}
+            job = self.submit(query, limit, capture_mode)
+            return 202, {'job_id': job['job_id'], 'status': job['status'], 'position': self.queue.qsize()}
+        if path.startswith("/jobs/"):
+            if method != "GET":
+                return 405, {'error': "GET を使用してください"}
+            job = self.jobs.get(path[len("/jobs/"):])
+            if not job:
+                return 404, {'error': "ジョブが見つかりません"}
+            return 200, job
+        return 404, {'error': "見つかりません"}
+
+    @staticmethod
+    def _summary(job):
+        result = job['result'] or {}
+        return {key: job[key] for key in ('job_id', 'status', 'query', 'limit', 'created_at', 'finished_at')} | {
+            'new_videos': result.get('new_videos'),
+        }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="スクレイピングジョブ常駐サービス")
+    parser.add_argument("--host", default=DAEMON_HOST, help="待ち受けアドレス")
+    parser.add_argument("--port", type=int, default=DAEMON_PORT, help="待ち受けポート")
+    parser.add_argument("--concurrency", type=int, default=DAEMON_CONCURRENCY,
+                        help="同時に実行するジョブ数 (上限は DB_POOL_SIZE)")
+    parser.add_argument("--accounts", default=ACCOUNTS_FILE, help="複数アカウントの認証情報ファイル (JSON)")
+    parser.add_argument("--profile-dir", default=SESSION_PROFILE_DIR, help="ブラウザプロファイルのディレクトリ")
+    parser.add_argument("--resource-policy", choices=list(RESOURCE_POLICIES), default=RESOURCE_POLICY,
+                        help="通信制限 (full: 制限なし, lean: 動画・画像・フォント・計測を止める。graphql 方式のみ)")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=HEADLESS,
+                        help="ブラウザをヘッドレスで起動する")
+    args = parser.parse_args()
+
+    async with async_playwright() as p:
+        resource_policy = ResourcePolicy(args.resource_policy)
+        session_pool = SessionPool(p, load_accounts(args.accounts, args.profile_dir), login_to_twitter,
+                                   headless=args.headless,
+                                   context_options={'args': resource_policy.launch_args()},
+                                   on_context=resource_policy.apply)
+        daemon = ScrapeDaemon(session_pool, args.concurrency, resource_policy)
+        try:
+            # 起動時にログインまで済ませ、最初のジョブから待たずに実行できるようにする
+            async with session_pool.lease():
+                pass
+            daemon.start_workers()
+            server = await asyncio.start_server(daemon.handle_connection, args.host, args.port)
+            print(f"🚀 スクレイピングサービスを起動しました: http://{args.host}:{args.port} "
+                  f"(同時実行 {daemon.concurrency})")
+            async with server:
+                await server.serve_forever()
+        finally:
+            await daemon.stop_workers()
+            if temp_video_data:
+                await autosave_data()
+            print(f"ℹ️ セッションプール: {session_pool.format_stats()}")
+            print(f"ℹ️ 通信制限: {resource_policy.format_stats()}")
+            print(f"💾 計測結果を保存しました: {METRICS.write_summary('daemon')}")
+            await session_pool.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n👋 スクレイピングサービスを停止しました")
@@ -0,0 +1,129 @@
+"""
+目標件数駆動の適応スクロールエンジン
+==================================
+
+機能：
+- 目標件数の新規動画を取得した時点、または新規0件のスクロールが一定回数続いた時点（フィードの終端）で停止
+- 固定時間の sleep ではなく、新しいカードが届くまで待機（上限あり）
+- 1秒あたりの新規カード数が増える方向へスクロール量とビューポートの高さを自動調整
+
+スクロール量はビューポート高さの倍数で表し、取得効率が改善している間は大きく、
+悪化したら小さくします（山登り法）。スクロール量が上限に達しても改善が続く場合は
+ビューポートを高くして、1回の描画で読み込まれるカード数を増やします。
+"""
+
+import asyncio
+import time
+
+# スクロール量（ビューポート高さの倍数）
+SCROLL_STEP_INITIAL = 1.0
+SCROLL_STEP_MIN = 0.5
+SCROLL_STEP_MAX = 3.0
+# ビューポートの高さ（px）
+SCROLL_VIEWPORT_INITIAL = 1600
+SCROLL_VIEWPORT_MAX = 4000
+# ビューポート未設定時の幅（px）
+SCROLL_VIEWPORT_WIDTH = 1280
+# 新しいカードが届いてから描画が落ち着くまでの待機（秒）
+SCROLL_SETTLE = 0.2
+
+
+class AdaptiveScroller:
+    """
+    検索結果ページをスクロールしながら収集関数を呼び出す
+
+    パラメータ:
+        page: Playwrightのページオブジェクト
+        target: 目標とする新規動画数
+        max_scrolls: スクロール回数の上限
+        max_idle_scrolls: 新規0件のスクロールがこの回数続いたら終了
+        wait_timeout: 1回のスクロールで新しいカードを待つ上限（秒）
+    """
+
+    def __init__(self, page, target, max_scrolls, max_idle_scrolls, wait_timeout):
+        self.page = page
+        self.target = target
+        self.max_scrolls = max_scrolls
+        self.max_idle_scrolls = max_idle_scrolls
+        self.wait_timeout = wait_timeout
+        self.step = SCROLL_STEP_INITIAL
+        self.viewport_height = SCROLL_VIEWPORT_INITIAL
+        self.collected = 0
+        self.scrolls = 0
+        self.idle_scrolls = 0
+        self.stop_reason = None
+        self._last_rate = 0.0
+
+    async def run(self, harvest, wait_for_new):
+        """
+        スクロールと収集を繰り返す
+
+        パラメータ:
+            harvest: 新しく届いたカードを処理し、新規動画数を返す async 関数
+            wait_for_new: timeout 秒まで新しいカードの到着を待ち、届いたら True を返す async 関数
+
+        戻り値:
+            取得した新規動画数
+        """
+        started = time.monotonic()
+        await self._apply_viewport()
+        self.collected += await harvest()
+
+        while True:
+            if self.collected >= self.target:
+                self.stop_reason = "目標件数に到達"
+                break
+            if self.scrolls >= self.max_scrolls:
+                self.stop_reason = "スクロール回数の上限"
+                break
+            if self.idle_scrolls >= self.max_idle_scrolls:
+                self.stop_reason = f"新規なしが{self.idle_scrolls}回連続（フィード終端）"
+                break
+
+            step_started = time.monotonic()
+            await self.page.evaluate("(step) => window.scrollBy(0, window.innerHeight * step)", self.step)
+            self.scrolls += 1
+
+            arrived = await wait_for_new(self.wait_timeout)
+            if arrived:
+                await asyncio.sleep(SCROLL_SETTLE)
+            new_count = await harvest()
+            self.collected += new_count
+            elapsed = time.monotonic() - step_started
+
+            if new_count:
+                self.idle_scrolls = 0
+            else:
+                self.idle_scrolls += 1
+            await self._adapt(new_count, elapsed)
+            print(f"🔄 スクロール {self.scrolls}: 新規{new_count}件 ({elapsed:.1f}秒, "
+                  f"累計 {self.collected}/{self.target}, スクロール量 x{self.step:.2f}, 高さ {self.viewport_height}px)")
+
+        total = time.monotonic() - started
+        rate = self.collected / total * 60 if total > 0 else 0
+        print(f"🏁 スクロール終了: {self.stop_reason} (スクロール{self.scrolls}回, {total:.1f}秒, {rate:.1f}件/分)")
+        return self.collected
+
+    async def _adapt(self, new_count, elapsed):
+        """取得効率（新規件数/秒）に応じてスクロール量とビューポートを調整する"""
+        rate = new_count / elapsed if elapsed > 0 else 0.0
+        if new_count == 0:
+            # 何も届かなかった場合はスクロール量を小さくして、読み込みトリガーを踏み直す
+            self.step = max(SCROLL_STEP_MIN, self.step * 0.75)
+        elif rate >= self._last_rate:
+            if self.step < SCROLL_STEP_MAX:
+                self.step = min(SCROLL_STEP_MAX, self.step * 1.25)
+            elif self.viewport_height < SCROLL_VIEWPORT_MAX:
+                self.viewport_height = min(SCROLL_VIEWPORT_MAX, int(self.viewport_height * 1.25))
+                await self._apply_viewport()
+        else:
+            self.step = max(SCROLL_STEP_MIN, self.step * 0.8)
+        self._last_rate = rate
+
+    async def _apply_viewport(self):
+        width = (self.page.viewport_size or {}).get("width") or SCROLL_VIEWPORT_WIDTH
+        try:
+            await self.page.set_viewport_size({"width": width, "height": self.viewport_height})
+        except Exception as e:
+            # 永続コンテキストなどでビューポートが固定されている場合
+            print(f"  ⚠️ ビューポートの変更に失敗: {e}")
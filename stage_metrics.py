@@ -0,0 +1,279 @@
+"""
+処理段階ごとの計測（Prometheus 形式で出力）
+========================================
+
+機能：
+- ページ遷移・要素待ち・ページ内での抽出・変換・DB書き込み・コミット・ログインなど、
+  主要な処理段階 (stage) の所要時間をヒストグラムに記録する
+- 段階ごとにエラー数とタイムアウト数を数える（タイムアウトは TimeoutError 系の例外で判定）
+- 件数などの任意のカウンター (count)
+- 常駐するモード向けに、ローカルの /metrics で Prometheus のテキスト形式を返す
+- CLI の実行終了時に、段階ごとの回数・合計・平均・p50/p95・エラー数を JSON に書き出す
+
+計測値はプロセス内で1つ (METRICS) にまとめられ、スレッド（asyncio.to_thread の保存処理）からも記録できます。
+遅い夜の原因が X の応答・要素待ちのタイムアウト・SQL Server のどれかを切り分けるためのものです。
+
+使い方:
+    with timed("navigation"):
+        await page.goto(url)
+
+    with timed("login") as timer:
+        if not await login(page):
+            timer.fail()        # 例外を投げずに失敗した場合
+
+    count("tweets_harvested", len(items))
+"""
+
+import asyncio
+import bisect
+import datetime
+import json
+import os
+import threading
+import time
+
+# メトリクス名の接頭辞
+METRICS_PREFIX = "xranking"
+# ヒストグラムのバケット（秒）
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# /metrics の待ち受けアドレスとポート（0 の場合は起動しない）
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+# 実行終了時の JSON を書き出すディレクトリ
+METRICS_DIR = "run_metrics"
+
+# 段階の説明（/metrics の HELP と要約の表示順に使う。ここにない段階も記録できる）
+STAGES = {
+    "navigation": "ページ遷移 (page.goto)",
+    "selector_wait": "要素の表示待ち (wait_for_selector)",
+    "extract": "ページ内での抽出 (ブラウザへの問い合わせ)",
+    "convert": "抽出結果・GraphQL の変換と正規化",
+    "db_write": "DB への書き込み (ステージング投入と MERGE/UPDATE)",
+    "db_commit": "DB のコミット",
+    "login": "ログイン",
+}
+
+
+def _is_timeout(exc):
+    """asyncio / 組み込み / Playwright のタイムアウト例外か"""
+    return isinstance(exc, (asyncio.TimeoutError, TimeoutError)) or type(exc).__name__ == "TimeoutError"
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "total", "max", "errors", "timeouts")
+
+    def __init__(self):
+        self.buckets = [0] * (len(STAGE_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.timeouts = 0
+
+    def observe(self, seconds):
+        self.buckets[bisect.bisect_left(STAGE_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """バケットから分位点を推定する（バケット内は線形補間）"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                lower = STAGE_BUCKETS[i - 1] if i else 0.0
+                upper = STAGE_BUCKETS[i] if i < len(STAGE_BUCKETS) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+
+class _Timer:
+    """timed() が返す計測用のコンテキストマネージャ"""
+
+    __slots__ = ("metrics", "stage", "started", "failed")
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+        self.failed = False
+
+    def fail(self):
+        """例外を投げずに失敗した処理をエラーとして数える"""
+        self.failed = True
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        outcome = "ok"
+        if exc is not None:
+            outcome = "timeout" if _is_timeout(exc) else "error"
+        elif self.failed:
+            outcome = "error"
+        self.metrics.observe(self.stage, time.perf_counter() - self.started, outcome)
+        return False
+
+
+class StageMetrics:
+    """段階ごとのヒストグラムとカウンター"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._counters = {}
+        self.started = time.time()
+
+    def timed(self, stage):
+        return _Timer(self, stage)
+
+    def observe(self, stage, seconds, outcome="ok"):
+        """所要時間を記録する。outcome は "ok" / "error" / "timeout" """
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = _Histogram()
+            histogram.observe(seconds)
+            if outcome == "error":
+                histogram.errors += 1
+            elif outcome == "timeout":
+                histogram.timeouts += 1
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+            self.started = time.time()
+
+    def _ordered_stages(self):
+        known = [stage for stage in STAGES if stage in self._stages]
+        return known + sorted(stage for stage in self._stages if stage not in STAGES)
+
+    def render_prometheus(self):
+        """Prometheus のテキスト形式 (text/plain; version=0.0.4)"""
+        name = f"{METRICS_PREFIX}_stage_seconds"
+        lines = [f"# HELP {name} 処理段階の所要時間", f"# TYPE {name} histogram"]
+        errors = [f"# HELP {METRICS_PREFIX}_stage_errors_total 処理段階のエラー数",
+                  f"# TYPE {METRICS_PREFIX}_stage_errors_total counter"]
+        timeouts = [f"# HELP {METRICS_PREFIX}_stage_timeouts_total 処理段階のタイムアウト数",
+                    f"# TYPE {METRICS_PREFIX}_stage_timeouts_total counter"]
+        events = [f"# HELP {METRICS_PREFIX}_events_total 件数のカウンター",
+                  f"# TYPE {METRICS_PREFIX}_events_total counter"]
+        with self._lock:
+            for stage in self._ordered_stages():
+                histogram = self._stages[stage]
+                cumulative = 0
+                for bound, n in zip(STAGE_BUCKETS, histogram.buckets):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+                errors.append(f'{METRICS_PREFIX}_stage_errors_total{{stage="{stage}"}} {histogram.errors}')
+                timeouts.append(f'{METRICS_PREFIX}_stage_timeouts_total{{stage="{stage}"}} {histogram.timeouts}')
+            for event, value in sorted(self._counters.items()):
+                events.append(f'{METRICS_PREFIX}_events_total{{event="{event}"}} {value}')
+        uptime = [f"# TYPE {METRICS_PREFIX}_uptime_seconds gauge",
+                  f"{METRICS_PREFIX}_uptime_seconds {time.time() - self.started:.1f}"]
+        return "\n".join(lines + errors + timeouts + events + uptime) + "\n"
+
+    def summary(self):
+        """段階ごとの要約 (dict)"""
+        with self._lock:
+            stages = {}
+            for stage in self._ordered_stages():
+                histogram = self._stages[stage]
+                stages[stage] = {
+                    'count': histogram.count,
+                    'total_seconds': round(histogram.total, 3),
+                    'mean_seconds': round(histogram.total / histogram.count, 4) if histogram.count else None,
+                    'p50_seconds': histogram.quantile(0.5),
+                    'p95_seconds': histogram.quantile(0.95),
+                    'max_seconds': round(histogram.max, 4),
+                    'errors': histogram.errors,
+                    'timeouts': histogram.timeouts,
+                }
+            return {
+                'started_at': datetime.datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+                'elapsed_seconds': round(time.time() - self.started, 1),
+                'stages': stages,
+                'counters': dict(self._counters),
+            }
+
+    def format_summary(self):
+        """要約を表形式の文字列にする"""
+        summary = self.summary()
+        lines = [f"{'段階':<14}{'回数':>8}{'合計(秒)':>10}{'p50(秒)':>10}{'p95(秒)':>10}{'エラー':>7}{'タイムアウト':>8}"]
+        for stage, s in summary['stages'].items():
+            lines.append(f"{stage:<14}{s['count']:>8}{s['total_seconds']:>10.1f}{s['p50_seconds'] or 0:>10.3f}"
+                         f"{s['p95_seconds'] or 0:>10.3f}{s['errors']:>7}{s['timeouts']:>8}")
+        if summary['counters']:
+            lines.append(", ".join(f"{name}={value}" for name, value in sorted(summary['counters'].items())))
+        return "\n".join(lines)
+
+    def write_summary(self, label, directory=METRICS_DIR):
+        """要約を JSON に書き出し、そのパスを返す"""
+        os.makedirs(directory, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(directory, f"{stamp}-{label}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'label': label, **self.summary()}, f, ensure_ascii=False, indent=2)
+        return path
+
+
+# プロセス全体で共有する計測値
+METRICS = StageMetrics()
+
+
+def timed(stage):
+    """stage の所要時間を計測するコンテキストマネージャ（例外はエラー/タイムアウトとして数えて再送出）"""
+    return METRICS.timed(stage)
+
+
+def count(name, amount=1):
+    """カウンター name を amount 増やす"""
+    METRICS.count(name, amount)
+
+
+async def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT):
+    """
+    /metrics を返すローカルの HTTP サーバーを起動する
+
+    戻り値:
+        asyncio.Server (停止するときは server.close())
+    """
+
+    async def handle(reader, writer):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        path = request_line.split(" ")[1].split("?", 1)[0] if request_line.count(" ") == 2 else ""
+        if path == "/metrics":
+            status, content_type, body = "200 OK", "text/plain; version=0.0.4; charset=utf-8", METRICS.render_prometheus()
+        elif path == "/metrics.json":
+            status, content_type, body = "200 OK", "application/json; charset=utf-8", json.dumps(
+                METRICS.summary(), ensure_ascii=False)
+        else:
+            status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", "not found\n"
+        data = body.encode("utf-8")
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(data)}\r\n"
+                     f"Connection: close\r\n\r\n".encode("ascii") + data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    print(f"📈 メトリクスを公開しました: http://{host}:{port}/metrics")
+    return server
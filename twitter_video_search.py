@@ -11,9 +11,15 @@ Twitter動画検索・保存スクリプト
 
 使用方法：
 - 基本検索: python twitter_video_search.py "検索キーワード" --limit 10 --save
-- 指標更新: python twitter_video_search.py --refresh-metrics
+- 指標更新: python twitter_video_search.py --refresh-metrics [--concurrency 4] [--refresh-budget 500]
 - URL更新: python twitter_video_search.py --update-urls
 - 全データ更新: python twitter_video_search.py --update-all
+- 取得方式指定: python twitter_video_search.py "検索キーワード" --capture-mode dom
+- 複数アカウント: python twitter_video_search.py --refresh-metrics --accounts accounts.json
+- 複数キーワード: python twitter_video_search.py --keywords-file keywords.txt --search-concurrency 3 --limit 50
+- 通信制限・ヘッドレス: python twitter_video_search.py "検索キーワード" --resource-policy lean --headless
+- 分散再取得ワーカー: python twitter_video_search.py --queue-worker [--queue-kind metrics] [--lease-batch 50]
+- 中断したクロールの再開: python twitter_video_search.py "検索キーワード" --limit 5000 --resume
 
 前提条件：
 - Playwright (自動インストール)
@@ -30,6 +36,8 @@ Twitter動画検索・保存スクリプト
 - 2023/12: 初期バージョン
 - 2024/06: 動画URL取得ロジックを改善、新メタデータ対応
 - 2024/06: aiosqlite導入による非同期データベース操作に対応
+- 2026/10: GraphQL 通信の傍受による検索結果取得 (--capture-mode graphql) に対応
+- 2026/10: ブラウザプロファイルを再利用し、セッションが有効な間はログインを省略 (--profile-dir)
 
 作者: XRANKING開発チーム
 """
@@ -46,6 +54,7 @@ import asyncio
 import uuid
 import argparse
 import urllib.parse
+import re
 try:
     from playwright.async_api import async_playwright, TimeoutError
 except ImportError:
@@ -61,6 +70,25 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-dotenv"])
     from dotenv import load_dotenv
 
+from x_graphql import GraphQLCapture
+from dom_harvest import (install_tweet_observer, drain_tweet_cards, extract_card, extract_page_cards,
+                         HARVEST_READY_JS)
+from scroll_engine import AdaptiveScroller
+from write_behind import WriteBehindQueue, WRITE_BATCH_SIZE, WRITE_FLUSH_INTERVAL
+from db_pool import acquire_connection_async, release_connection, describe_connection, is_disconnect_error, DB_POOL_SIZE
+from refresh_pool import RefreshWorkerPool, REFRESH_CONCURRENCY
+from refresh_scheduler import RefreshScheduler, REFRESH_BUDGET
+from refresh_queue import RefreshTaskQueue, REFRESH_LEASE_BATCH
+from browser_session import SESSION_PROFILE_DIR, x_url
+from account_pool import SessionPool, load_accounts, ACCOUNTS_FILE
+from resource_policy import ResourcePolicy, RESOURCE_POLICY, RESOURCE_POLICIES
+from crawl_checkpoint import CrawlCheckpoint
+from known_tweets import load_known_index
+from metric_history import history_available, append_snapshots
+from stage_metrics import METRICS, timed, count, start_metrics_server, METRICS_HOST, METRICS_PORT
+from metric_parser import parse_metric, parse_metrics, METRIC_MAX
+from nav_guard import open_page, budget_ms, set_nav_budgets, CircuitBreaker, CircuitOpenError, BREAKER_MAX_TRIPS
+
 # .env ファイルを読み込む
 load_dotenv()
 
@@ -95,176 +123,335 @@ SEARCH_KEYWORDS = [
     "",
     
 ]
-# スクロール回数（取得動画数の調整用）
+# スクロール回数の上限（通常は取得件数またはフィード終端で先に停止する）
 SCROLL_COUNT = 5000 # 値を 10 から 50 に増やしました
-# スクロール間隔（秒）
-SCROLL_INTERVAL = 2 # 値を 1 から 2 に増やしました
+# 1回のスクロールで新しいツイートを待つ上限（秒）。届き次第すぐ次へ進む
+SCROLL_WAIT_TIMEOUT = 8
+# 新規動画0件のスクロールがこの回数続いたらフィード終端とみなして終了
+MAX_IDLE_SCROLLS = 5
+# 検索結果の取得方式 ("graphql": 通信の傍受, "dom": 画面要素の読み取り)
+CAPTURE_MODE = "graphql"
+# ブラウザをヘッドレスで起動するか
+HEADLESS = False
 
 # --- SQL Server 接続 ---
-def connect_to_sql_server():
-    """SQL Server データベースに接続する"""
-    # --- .env ファイルのパスを明示的に指定して強制的に再読み込み ---
-    dotenv_path = '.env'
-    load_dotenv(dotenv_path=dotenv_path, override=True)
-    print(f"ℹ️ .env ファイルを再読み込み: {dotenv_path}") # デバッグ出力追加
-    # -------------------------------------------------------
-    conn_str_getenv = os.getenv("DATABASE_URL")
-    conn_str_environ = os.environ.get("DATABASE_URL")
-    print(f"[Python Script] DATABASE_URL from os.getenv: {conn_str_getenv}") # Log the URL
-    print(f"[Python Script] DATABASE_URL from os.environ.get: {conn_str_environ}") # Log the URL
-    conn_str = conn_str_getenv
-
-    if not conn_str:
-        print("❌ [Python Script] DATABASE_URL is not set in environment variables.")
-        return None
+async def connect_to_sql_server():
+    """
+    SQL Server の接続を共通プールから借りる（空きを待つ間もイベントループを止めない）
 
-    print(f"[Python Script] Attempting to connect with URL: {conn_str}") # Log before connect
+    接続文字列の解析・再接続・死活確認は db_pool で行う。
+    使い終わった接続は close() せず release_connection() で返却すること。
+    """
+    conn = await acquire_connection_async()
+    if conn:
+        debug_log(f"SQL Server 接続を取得: {describe_connection()}")
+    return conn
+
+# --- データ一括保存 (SQL Server 用) ---
+# 1回の MERGE で処理する最大件数
+UPSERT_BATCH_SIZE = 200
+# メトリクス更新・全データ更新で、この件数が溜まるごとに保存する
+REFRESH_FLUSH_SIZE = 50
+# ステージング表の文字列カラム長（fast_executemany の効率のため MAX は使わない）
+STAGE_TEXT_LENGTH = 4000
+
+SQL_CREATE_STAGE = f"""
+    IF OBJECT_ID('tempdb..#TweetStage') IS NOT NULL DROP TABLE #TweetStage;
+    CREATE TABLE #TweetStage (
+        tweetId NVARCHAR(64) NOT NULL PRIMARY KEY,
+        videoUrl NVARCHAR({STAGE_TEXT_LENGTH}) NULL,
+        originalUrl NVARCHAR({STAGE_TEXT_LENGTH}) NULL,
+        content NVARCHAR({STAGE_TEXT_LENGTH}) NULL,
+        likes INT NULL,
+        retweets INT NULL,
+        views INT NULL,
+        timestamp DATETIME2 NULL,
+        authorId NVARCHAR(64) NULL,
+        authorName NVARCHAR({STAGE_TEXT_LENGTH}) NULL,
+        authorUsername NVARCHAR({STAGE_TEXT_LENGTH}) NULL,
+        authorProfileImageUrl NVARCHAR({STAGE_TEXT_LENGTH}) NULL,
+        thumbnailUrl NVARCHAR({STAGE_TEXT_LENGTH}) NULL
+    );
+"""
+
+SQL_INSERT_STAGE = """
+    INSERT INTO #TweetStage (
+        tweetId, videoUrl, originalUrl, content, likes, retweets, views,
+        timestamp, authorId, authorName, authorUsername, authorProfileImageUrl, thumbnailUrl
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# NULL の項目は既存の値を残す（メトリクスのみの更新にも使える）
+# HOLDLOCK で同時実行時の「存在確認→挿入」の競合を防ぐ
+SQL_MERGE_STAGE = """
+    MERGE Tweet WITH (HOLDLOCK) AS t
+    USING #TweetStage AS s
+        ON t.tweetId = s.tweetId
+    WHEN MATCHED THEN UPDATE SET
+        videoUrl = COALESCE(s.videoUrl, t.videoUrl),
+        content = COALESCE(s.content, t.content),
+        likes = COALESCE(s.likes, t.likes),
+        retweets = COALESCE(s.retweets, t.retweets),
+        views = COALESCE(s.views, t.views),
+        timestamp = COALESCE(s.timestamp, t.timestamp),
+        authorId = COALESCE(s.authorId, t.authorId),
+        authorName = COALESCE(s.authorName, t.authorName),
+        authorUsername = COALESCE(s.authorUsername, t.authorUsername),
+        authorProfileImageUrl = COALESCE(s.authorProfileImageUrl, t.authorProfileImageUrl),
+        thumbnailUrl = COALESCE(s.thumbnailUrl, t.thumbnailUrl),
+        updatedAt = GETDATE()
+    WHEN NOT MATCHED BY TARGET THEN INSERT (
+        id, tweetId, videoUrl, originalUrl, content, likes, retweets, views,
+        timestamp, authorId, authorName, authorUsername, authorProfileImageUrl,
+        thumbnailUrl, createdAt, updatedAt
+    ) VALUES (
+        LOWER(CONVERT(NVARCHAR(36), NEWID())), s.tweetId, s.videoUrl, s.originalUrl, s.content,
+        COALESCE(s.likes, 0), COALESCE(s.retweets, 0), COALESCE(s.views, 0),
+        COALESCE(s.timestamp, GETDATE()), s.authorId, s.authorName, s.authorUsername,
+        s.authorProfileImageUrl, s.thumbnailUrl, GETDATE(), GETDATE()
+    )
+    OUTPUT $action;
+"""
+
+# 保存済みツイートのメトリクスだけを更新する（MERGE より軽い経路）
+SQL_CREATE_METRIC_STAGE = """
+    IF OBJECT_ID('tempdb..#MetricStage') IS NOT NULL DROP TABLE #MetricStage;
+    CREATE TABLE #MetricStage (
+        tweetId NVARCHAR(64) NOT NULL PRIMARY KEY,
+        likes INT NULL,
+        retweets INT NULL,
+        views INT NULL
+    );
+"""
+
+SQL_INSERT_METRIC_STAGE = "INSERT INTO #MetricStage (tweetId, likes, retweets, views) VALUES (?, ?, ?, ?)"
+
+SQL_UPDATE_METRICS = """
+    UPDATE t SET
+        likes = COALESCE(s.likes, t.likes),
+        retweets = COALESCE(s.retweets, t.retweets),
+        views = COALESCE(s.views, t.views),
+        updatedAt = GETDATE()
+    OUTPUT inserted.tweetId
+    FROM Tweet t
+    JOIN #MetricStage s ON t.tweetId = s.tweetId;
+"""
 
-    try:
-        drivers = pyodbc.drivers()
-        print(f"ℹ️ 利用可能な ODBC ドライバー: {drivers}") # デバッグ出力追加
-    except Exception as e:
-        print(f"⚠️ pyodbc.drivers() の実行中にエラー: {e}") # エラーハンドリング追加
 
-    if not conn_str:
-        print("❌ 環境変数 DATABASE_URL が設定されていません。")
+def tweet_id_of(video_data):
+    """レコードからツイートIDを取得する（tweet_id がなければ URL の末尾）"""
+    return str(video_data.get('tweet_id') or video_data['tweet_url'].rstrip('/').split('/')[-1])
+
+
+def _stage_text(value):
+    """空文字は「不明」として NULL にし、ステージング表の長さに切り詰める"""
+    if not value:
         return None
+    return str(value)[:STAGE_TEXT_LENGTH]
+
+
+def _stage_metric(metrics, name):
+    """カウンターを INT 列に入る値にする（GraphQL の閲覧数などが上限を超えても行ごと失敗させない）"""
+    value = metrics.get(name)
+    return min(int(value), METRIC_MAX) if value is not None else None
+
+
+def _stage_row(video_data):
+    """レコードをステージング表の1行に変換する"""
+    metrics = video_data.get('metrics') or {}
+    metric = lambda name: _stage_metric(metrics, name)
+    return (
+        tweet_id_of(video_data),
+        _stage_text(video_data.get('video_url')),
+        _stage_text(video_data.get('tweet_url')),
+        _stage_text(video_data.get('tweet_text')),
+        metric('likes'),
+        metric('retweets'),
+        metric('views'),
+        video_data.get('posted_at'),
+        _stage_text(video_data.get('author_id')),
+        _stage_text(video_data.get('display_name')),
+        _stage_text(video_data.get('username')),
+        _stage_text(video_data.get('profile_image_url')),
+        _stage_text(video_data.get('thumbnail_url')),
+    )
+
+
+def _merge_batch(conn, rows):
+    """ステージング表に一括投入して MERGE し、(挿入数, 更新数) を返す（1回のコミット）"""
+    history = history_available(conn)
+    cursor = conn.cursor()
     try:
-        # --- 接続文字列を ODBC 形式に変換 ---
-        driver_name = "ODBC Driver 17 for SQL Server" # 利用可能なドライバーから選択
-        odbc_conn_str = conn_str # デフォルトは元の文字列
+        with timed("db_write"):
+            cursor.execute(SQL_CREATE_STAGE)
+            cursor.fast_executemany = True
+            cursor.executemany(SQL_INSERT_STAGE, rows)
+            cursor.execute(SQL_MERGE_STAGE)
+            actions = [row[0] for row in cursor.fetchall()]
+            cursor.execute("DROP TABLE #TweetStage")
+            if history:
+                # 観測したメトリクスを履歴に追記する（同じトランザクション）
+                append_snapshots(cursor, [(row[0], row[4], row[5], row[6]) for row in rows])
+        with timed("db_commit"):
+            conn.commit()
+        return actions.count('INSERT'), actions.count('UPDATE')
+    except pyodbc.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
 
-        if conn_str.startswith("sqlserver://"):
-            try:
-                parsed_url = urllib.parse.urlparse(conn_str)
-                server = f"{parsed_url.hostname},{parsed_url.port}" if parsed_url.port else parsed_url.hostname
-                database = parsed_url.path.lstrip('/') if parsed_url.path else None # データベース名がない場合も考慮
-                uid = parsed_url.username
-                pwd = parsed_url.password
-                query_params = urllib.parse.parse_qs(parsed_url.query)
-                trust_cert_param = query_params.get('trustServerCertificate', ['false'])[0].lower()
-                trust_cert = 'yes' if trust_cert_param == 'true' else 'no'
-
-                # 必須パラメータをチェック
-                if not server or not uid or not pwd:
-                     raise ValueError("接続URLに必要な情報 (Server, Uid, Pwd) が不足しています。")
-
-                odbc_parts = [
-                    f"Driver={{{driver_name}}}",
-                    f"Server={server}",
-                    f"Uid={uid}",
-                    f"Pwd={pwd}",
-                    f"TrustServerCertificate={trust_cert}",
-                ]
-                # データベース名があれば追加
-                if database:
-                    odbc_parts.append(f"Database={database}")
-
-                odbc_conn_str = ";".join(odbc_parts) + ";" # 末尾にセミコロンを追加
-                print(f"ℹ️ 生成された ODBC 接続文字列: {odbc_conn_str}")
-            except Exception as parse_ex:
-                print(f"⚠️ 接続URLの解析に失敗しました: {parse_ex}。元の接続文字列を使用します。")
-                odbc_conn_str = conn_str # 解析失敗時は元の文字列に戻す
-        else:
-             print(f"ℹ️ URL形式でないため、元の接続文字列を使用します: {conn_str}")
 
+def upsert_tweets_sync(conn, records):
+    """
+    レコードをまとめて Tweet テーブルに保存する（同期版）
 
-        # ---------------------------------
-        conn = pyodbc.connect(odbc_conn_str) # 変換後の接続文字列を使用
-        print("✅ SQL Server 接続成功")
-        return conn
-    except pyodbc.Error as ex:
-        sqlstate = ex.args[0]
-        print(f"❌ SQL Server 接続エラー: {sqlstate} - {ex}")
-        # エラーメッセージに試行した接続文字列を含める
-        print(f"  (試行した接続文字列: {odbc_conn_str})")
-        return None
+    UPSERT_BATCH_SIZE 件ごとに1回の MERGE とコミットを行う。
+    バッチがデータのエラーになった場合は半分に分割して再試行し、失敗したレコードだけを特定する。
+    接続断・タイムアウト (SQLSTATE 08xxx / HYT00) は分割しても直らないため、そのまま例外を送出する。
 
-# --- データ挿入 (SQL Server 用) ---
-async def insert_video_data_sql_server(conn, video_data):
-    """動画データを SQL Server に挿入または更新する"""
-    tweet_id_str = video_data['tweet_url'].split('/')[-1]
-    original_url = video_data['tweet_url']
-    video_url = video_data.get('video_url')
-    content = video_data.get('tweet_text', '')
-    likes = int(video_data['metrics'].get('likes', 0))
-    retweets = int(video_data['metrics'].get('retweets', 0))
-    views = int(video_data['metrics'].get('views', 0))
-    # timestamp はツイート日時だが、現状取得できないため現在時刻
-    timestamp = datetime.datetime.now()
-    # authorId は現状取得できないため None
-    author_id = None
-    author_name = video_data.get('display_name', '')
-    author_username = video_data.get('username', '')
-    author_profile_image_url = video_data.get('profile_image_url', '')
-    # thumbnailUrl は現状取得できないため None
-    thumbnail_url = None
-    created_at = datetime.datetime.now()
-    updated_at = datetime.datetime.now()
-
-    sql_check = "SELECT COUNT(*) FROM Tweet WHERE tweetId = ?"
-    sql_insert = """
-        INSERT INTO Tweet (
-            id, tweetId, videoUrl, originalUrl, content, likes, retweets, views,
-            timestamp, authorId, authorName, authorUsername, authorProfileImageUrl,
-            thumbnailUrl, createdAt, updatedAt
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """ # id と VALUES の ? を追加
-    sql_update = """
-        UPDATE Tweet SET
-            videoUrl = ?, content = ?, likes = ?, retweets = ?, views = ?,
-            timestamp = ?, authorName = ?, authorUsername = ?, authorProfileImageUrl = ?,
-            updatedAt = ?
-        WHERE tweetId = ?
+    戻り値:
+        {'inserted': 挿入数, 'updated': 更新数, 'failed': 失敗数, 'failed_records': 失敗したレコード}
     """
+    result = {'inserted': 0, 'updated': 0, 'failed': 0, 'failed_records': []}
 
-    def db_operation():
-        cursor = conn.cursor()
+    # 同じツイートがバッチ内に複数あると MERGE がエラーになるため、後のものを優先して1件にまとめる
+    latest = {}
+    for video_data in records:
+        latest[tweet_id_of(video_data)] = video_data
+    unique_records = list(latest.values())
+
+    def save(batch):
         try:
-            # 既存チェック
-            cursor.execute(sql_check, (tweet_id_str,))
-            exists = cursor.fetchone()[0] > 0
-
-            if exists:
-                # --- 更新前のデータを取得 (オプション、デバッグ用) ---
-                # cursor.execute("SELECT likes, retweets, views FROM Tweet WHERE tweetId = ?", (tweet_id_str,))
-                # old_metrics = cursor.fetchone()
-                # if old_metrics:
-                #     print(f"  📊 更新前メトリクス: Likes={old_metrics[0]}, Retweets={old_metrics[1]}, Views={old_metrics[2]}")
-                # ------------------------------------
-                print(f"🔄 データ更新中: {tweet_id_str} (Likes: {likes}, Retweets: {retweets}, Views: {views})") # 更新する値をログに追加
-                cursor.execute(sql_update, (
-                    video_url, content, likes, retweets, views, timestamp,
-                    author_name, author_username, author_profile_image_url,
-                    updated_at, tweet_id_str
-                ))
-            else:
-                print(f"📝 データ挿入中: {tweet_id_str}")
-                # --- UUID を生成 ---
-                new_id = str(uuid.uuid4())
-                # -----------------
-                cursor.execute(sql_insert, (
-                    new_id, # 生成した ID を追加
-                    tweet_id_str, video_url, original_url, content, likes, retweets, views,
-                    timestamp, author_id, author_name, author_username, author_profile_image_url,
-                    thumbnail_url, created_at, updated_at
-                ))
-            conn.commit()
-            print(f"✅ データを保存しました: {original_url}")
-            return True
+            inserted, updated = _merge_batch(conn, [_stage_row(r) for r in batch])
+            result['inserted'] += inserted
+            result['updated'] += updated
         except pyodbc.Error as ex:
+            if is_disconnect_error(ex):
+                raise
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                save(batch[:middle])
+                save(batch[middle:])
+                return
             sqlstate = ex.args[0]
-            print(f"❌ SQL Server データ保存エラー ({tweet_id_str}): {sqlstate} - {ex}")
-            conn.rollback() # エラー時はロールバック
-            return False
-        finally:
-            cursor.close()
+            print(f"❌ SQL Server データ保存エラー ({tweet_id_of(batch[0])}): {sqlstate} - {ex}")
+            result['failed'] += 1
+            result['failed_records'].append(batch[0])
+
+    for start in range(0, len(unique_records), UPSERT_BATCH_SIZE):
+        save(unique_records[start:start + UPSERT_BATCH_SIZE])
+    return result
+
+
+def update_metrics_sync(conn, records):
+    """
+    保存済みツイートのメトリクス（いいね・RT・閲覧数）だけを一括更新する（同期版）
+
+    戻り値:
+        (更新数, 行が見つからなかったレコードのリスト)
+    """
+    latest = {}
+    for video_data in records:
+        latest[tweet_id_of(video_data)] = video_data
+    rows = []
+    for tweet_id, video_data in latest.items():
+        metrics = video_data.get('metrics') or {}
+        rows.append((tweet_id, *(_stage_metric(metrics, name) for name in ('likes', 'retweets', 'views'))))
+    history = history_available(conn)
+    cursor = conn.cursor()
+    try:
+        with timed("db_write"):
+            cursor.execute(SQL_CREATE_METRIC_STAGE)
+            cursor.fast_executemany = True
+            cursor.executemany(SQL_INSERT_METRIC_STAGE, rows)
+            cursor.execute(SQL_UPDATE_METRICS)
+            updated = {row[0] for row in cursor.fetchall()}
+            cursor.execute("DROP TABLE #MetricStage")
+            if history:
+                append_snapshots(cursor, [row for row in rows if row[0] in updated])
+        with timed("db_commit"):
+            conn.commit()
+    except pyodbc.Error:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    missing = [video_data for tweet_id, video_data in latest.items() if tweet_id not in updated]
+    return len(updated), missing
 
-    # 同期処理を非同期で実行
-    return await asyncio.to_thread(db_operation)
 
+def save_search_batch_sync(conn, records, known_index):
+    """
+    検索結果をまとめて保存する（同期版）
 
-async def login_to_twitter(page):
+    インデックスで保存済みと判定したツイートはメトリクスだけを更新し、それ以外 (と、更新対象の行が
+    見つからなかったもの) は upsert_tweets_sync で保存する。保存したツイートIDはインデックスへ追加する。
+    """
+    known = [r for r in records if tweet_id_of(r) in known_index]
+    fresh = [r for r in records if tweet_id_of(r) not in known_index]
+    metrics_updated = 0
+    if known:
+        try:
+            metrics_updated, missing = update_metrics_sync(conn, known)
+        except pyodbc.Error as ex:
+            if is_disconnect_error(ex):
+                raise
+            print(f"⚠️ メトリクスのみの更新に失敗したため通常の保存で再試行します: {ex}")
+            missing = known
+        for video_data in missing:
+            # 他のプロセスで削除されたなど、インデックスが古かったツイート
+            known_index.discard(tweet_id_of(video_data))
+        fresh.extend(missing)
+    result = upsert_tweets_sync(conn, fresh)
+    failed_ids = {tweet_id_of(r) for r in result['failed_records']}
+    for video_data in fresh:
+        tweet_id = tweet_id_of(video_data)
+        if tweet_id not in failed_ids:
+            known_index.add(tweet_id)
+    result['metrics_updated'] = metrics_updated
+    return result
+
+
+async def save_search_batch(conn, records, known_index):
+    """検索結果をまとめて保存する（保存済みツイートはメトリクスのみ更新）"""
+    if not records:
+        return {'inserted': 0, 'updated': 0, 'metrics_updated': 0, 'failed': 0, 'failed_records': []}
+    result = await asyncio.to_thread(save_search_batch_sync, conn, records, known_index)
+    count("records_saved", result['inserted'] + result['updated'] + result['metrics_updated'])
+    count("records_failed", result['failed'])
+    print(f"💾 一括保存: 挿入 {result['inserted']}件, 更新 {result['updated']}件, "
+          f"メトリクスのみ更新 {result['metrics_updated']}件, 失敗 {result['failed']}件")
+    return result
+
+
+async def upsert_tweets_sql_server(conn, records):
+    """
+    レコードをまとめて Tweet テーブルに保存する
+
+    検索結果・メトリクス更新・全データ更新のすべての保存処理はこの関数を通す。
+    レコードの None / 空の項目は既存の値を保持するため、メトリクスだけのレコードも渡せる。
+    """
+    if not records:
+        return {'inserted': 0, 'updated': 0, 'failed': 0, 'failed_records': []}
+    result = await asyncio.to_thread(upsert_tweets_sync, conn, records)
+    count("records_saved", result['inserted'] + result['updated'])
+    count("records_failed", result['failed'])
+    print(f"💾 一括保存: 挿入 {result['inserted']}件, 更新 {result['updated']}件, 失敗 {result['failed']}件")
+    return result
+
+
+# --- データ挿入 (SQL Server 用) ---
+async def insert_video_data_sql_server(conn, video_data):
+    """動画データを SQL Server に挿入または更新する（1件用。内部では一括保存を使用）"""
+    result = await upsert_tweets_sql_server(conn, [video_data])
+    if result['failed']:
+        return False
+    print(f"✅ データを保存しました: {video_data['tweet_url']}")
+    return True
+
+
+async def login_to_twitter(page, email=None, password=None, username=None):
     """
     X（旧Twitter）にログインする
     
@@ -282,32 +469,34 @@ async def login_to_twitter(page):
     
     パラメータ:
         page: Playwrightのページオブジェクト
+        email: メールアドレス（省略時は TWITTER_EMAIL）
+        password: パスワード（省略時は TWITTER_PASSWORD）
+        username: ユーザー名確認画面で入力するID（省略時は TWITTER_ID）
     
     戻り値:
         ログイン成功時はTrue、失敗時はFalse
     """
+    email = email or TWITTER_EMAIL
+    password = password or TWITTER_PASSWORD
+    username = username or os.getenv("TWITTER_ID")
     print("🔑 ログインページを開きます...")
+    input_selector = "input[autocomplete='username']"
     try:
-        await page.goto("https://x.com/i/flow/login", timeout=120000)
-        await page.wait_for_load_state("networkidle")  # ページの完全な読み込みを待つ
+        # メールアドレス入力フィールドが表示されたら読み込み完了とする
+        await open_page(page, x_url("/i/flow/login"), input_selector, "login")
     except Exception as e:
         print(f"❌ ログインページの読み込みに失敗しました: {e}")
         return False
 
     try:
-        # メールアドレス入力フィールドを待機
         print("✍️ メールアドレスを入力します...")
         
-        # セレクターを見つけるためにより長く待機
-        input_selector = "input[autocomplete='username']"
-        await page.wait_for_selector(input_selector, timeout=30000)
-        
         # 値を設定してEnterキーを押す
-        if TWITTER_EMAIL:
-            await page.type(input_selector, TWITTER_EMAIL)
-            time.sleep(1)
+        if email:
+            await page.type(input_selector, email)
+            await asyncio.sleep(1)
             await page.press(input_selector, "Enter")
-            time.sleep(3)
+            await asyncio.sleep(3)
         else:
             print("⚠️ TWITTER_EMAIL が設定されていません")
             return False
@@ -316,12 +505,11 @@ async def login_to_twitter(page):
         try:
             username_selector = "input[data-testid='ocfEnterTextTextInput']"
             if await page.is_visible(username_selector, timeout=5000):
-                TWITTER_ID = os.getenv("TWITTER_ID")
-                if TWITTER_ID:
+                if username:
                     print("✍️ ユーザー名を入力します...")
-                    await page.type(username_selector, TWITTER_ID)
+                    await page.type(username_selector, username)
                     await page.press(username_selector, "Enter")
-                    time.sleep(2)
+                    await asyncio.sleep(2)
                 else:
                     print("⚠️ TWITTER_ID が設定されていません")
         except Exception as e:
@@ -331,11 +519,11 @@ async def login_to_twitter(page):
         print("🔒 パスワードを入力します...")
         password_selector = "input[name='password']"
         await page.wait_for_selector(password_selector, timeout=10000)
-        if TWITTER_PASSWORD:
-            await page.type(password_selector, TWITTER_PASSWORD)
-            time.sleep(1)
+        if password:
+            await page.type(password_selector, password)
+            await asyncio.sleep(1)
             await page.press(password_selector, "Enter")
-            time.sleep(5)
+            await asyncio.sleep(5)
         else:
             print("⚠️ TWITTER_PASSWORD が設定されていません")
             return False
@@ -371,6 +559,9 @@ async def login_to_twitter(page):
         print(f"❌ ログイン処理中にエラーが発生しました: {e}")
         return False
 
+# ツイート本体の表示後に動画要素を待つ上限（秒）
+VIDEO_ELEMENT_WAIT = 3
+
 async def extract_video_url_from_tweet(page, tweet_url):
     """ツイートから動画URLを抽出する"""
     try:
@@ -378,14 +569,13 @@ async def extract_video_url_from_tweet(page, tweet_url):
         current_url = page.url
         video_urls = []
         
-        # ツイートページに移動
+        # ツイートページに移動（ツイート本体が表示された時点で読み込み完了とする）
         print(f"  🌐 {tweet_url} に移動中...")
-        await page.goto(tweet_url, timeout=60000)  # タイムアウトを60秒に延長
-        await page.wait_for_load_state("networkidle", timeout=30000)  # タイムアウトを30秒に延長
+        tweet_elem = await open_page(page, x_url(tweet_url), 'article[data-testid="tweet"]', "tweet")
         
-        # ツイート内容を取得
+        # ツイート本体の表示後は、各項目を待たずに読み取る
         try:
-            content_elem = await page.wait_for_selector('div[data-testid="tweetText"]', timeout=10000)
+            content_elem = await tweet_elem.query_selector('div[data-testid="tweetText"]')
             if content_elem:
                 content = await content_elem.text_content()
                 content = content.strip()
@@ -396,7 +586,7 @@ async def extract_video_url_from_tweet(page, tweet_url):
             
         # ユーザー情報を取得
         try:
-            username_elem = await page.wait_for_selector('div[data-testid="User-Name"] a[href^="/"]', timeout=10000)
+            username_elem = await tweet_elem.query_selector('div[data-testid="User-Name"] a[href^="/"]')
             if username_elem:
                 author_username = await username_elem.get_attribute("href")
                 author_username = author_username.replace("/", "")
@@ -407,7 +597,7 @@ async def extract_video_url_from_tweet(page, tweet_url):
             
         # プロフィール画像URLの取得
         try:
-            avatar_elem = await page.wait_for_selector('img[data-testid="tweetPhoto"], img[src*="profile_images"]', timeout=10000)
+            avatar_elem = await tweet_elem.query_selector('img[data-testid="tweetPhoto"], img[src*="profile_images"]')
             if avatar_elem:
                 author_profile_image_url = await avatar_elem.get_attribute("src")
                 print(f"  📝 プロフィール画像URL: {author_profile_image_url}")
@@ -417,7 +607,9 @@ async def extract_video_url_from_tweet(page, tweet_url):
             
         # 動画URLの取得
         try:
-            video_elem = await page.wait_for_selector('video', timeout=10000)
+            # 動画プレーヤーはツイート本体より後に組み立てられるため、短時間だけ待つ
+            video_elem = await page.wait_for_selector('article[data-testid="tweet"] video',
+                                                      timeout=VIDEO_ELEMENT_WAIT * 1000)
             if video_elem:
                 video_url = await video_elem.get_attribute("src")
                 if video_url:
@@ -430,7 +622,7 @@ async def extract_video_url_from_tweet(page, tweet_url):
             
         # 元のページに戻る
         print(f"  🔙 元のページ {current_url} に戻ります")
-        await page.goto(current_url, timeout=30000)
+        await page.goto(current_url, timeout=budget_ms("tweet"), wait_until="commit")
         
         return None
         
@@ -438,313 +630,552 @@ async def extract_video_url_from_tweet(page, tweet_url):
         print(f"  ❌ 動画URL抽出中にエラーが発生: {str(e)}")
         try:
             # エラーが発生しても元のページに戻る
-            await page.goto(current_url, timeout=30000)
+            await page.goto(current_url, timeout=budget_ms("tweet"), wait_until="commit")
         except:
             pass
         return None
 
-async def search_videos(page, keyword, limit=10):
-    """指定されたキーワードでTwitterを検索し、動画付きツイートを取得する"""
-    print(f"🔍 キーワード '{keyword}' で検索中...")
-    search_url = f"https://twitter.com/search?q={urllib.parse.quote(keyword)}&src=typed_query&f=video"
-    await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
+# ツイート詳細ページで TweetDetail のレスポンスを待つ上限（秒）
+DETAIL_GRAPHQL_WAIT = 3
+
+async def extract_full_tweet_record(page, tweet_id, tweet_url, capture=None):
+    """
+    ツイートページを1回だけ読み込み、メトリクス・動画URL・投稿者情報・本文をまとめて取得する
+
+    capture (operations に TweetDetail を含む GraphQLCapture) が page に登録されていれば、
+    通信から正確な値と mp4 の動画URLを取得し、取得できない場合は画面要素から読み取る。
+
+    戻り値:
+        保存用のレコード (dict)。ツイートが表示されない場合は None
+    """
+    if capture:
+        capture.reset()  # 前のツイートの取り残しを捨てる
+    deadline = time.monotonic() + budget_ms("tweet") / 1000
+    # ツイート本体か TweetDetail のレスポンスのどちらかが届いた時点で読み込み完了とする
+    tweet_elem = await open_page(page, x_url(tweet_url), '[data-testid="tweet"]', "tweet",
+                                 ready_event=capture.new_records if capture else None)
+
+    if capture:
+        if not capture.new_records.is_set():
+            try:
+                await asyncio.wait_for(capture.new_records.wait(), DETAIL_GRAPHQL_WAIT)
+            except asyncio.TimeoutError:
+                pass
+        for record in capture.drain():
+            if record['tweet_id'] == tweet_id:
+                debug_log(f"GraphQLから取得: {tweet_url}")
+                return {**record, 'tweet_url': tweet_url}
+
+    if tweet_elem is None:
+        # レスポンスが先に届いたが対象のツイートを含まなかった場合は、残りの予算でツイート本体の表示を待つ
+        try:
+            with timed("selector_wait"):
+                await page.wait_for_selector('[data-testid="tweet"]',
+                                             timeout=max((deadline - time.monotonic()) * 1000, 1))
+        except TimeoutError:
+            return None
+
+    with timed("extract"):
+        cards = await extract_page_cards(page)
+    if not cards:
+        return None
+    # 詳細ページには返信なども並ぶため、URLが一致するカードを優先する
+    card = next((c for c in cards if (c.get('status_href') or '').endswith(f"/status/{tweet_id}")), cards[0])
+    with timed("convert"):
+        record = card_to_video_data(card) or {'metrics': card_metrics(card), **card_user_info(card)}
+    record['tweet_id'] = tweet_id
+    record['tweet_url'] = tweet_url
+    if not record.get('video_url'):
+        record['video_url'] = card.get('video_src')
+    return record
+
+async def search_videos(page, keyword, limit=10, capture_mode=CAPTURE_MODE, max_idle_scrolls=MAX_IDLE_SCROLLS,
+                        write_batch_size=WRITE_BATCH_SIZE, write_flush_interval=WRITE_FLUSH_INTERVAL, seen_ids=None,
+                        resume=False):
+    """
+    指定されたキーワードでTwitterを検索し、動画付きツイートを取得する
+
+    limit 件の新規動画を取得するか、新規0件のスクロールが max_idle_scrolls 回続くまでスクロールする。
+    保存はライトビハインドキュー経由で行い、DBの遅延でスクロールが止まらないようにする
+    (write_batch_size 件または write_flush_interval 秒ごとにまとめて保存)。
+
+    capture_mode:
+        "graphql" - 検索ページの GraphQL 通信 (SearchTimeline) を傍受して取得（正確なメトリクス・全動画バリアント）
+        "dom"     - 画面上のツイート要素から読み取る（従来方式）
 
-    # 検索結果の読み込みを待つ
-    await page.wait_for_selector('[data-testid="tweet"]', timeout=30000)
+    seen_ids:
+        処理済みツイートID (int) の set。複数キーワードで共有すると、別のキーワードで取得済みのツイートを重複して数えない
+
+    resume:
+        True の場合、前回のチェックポイント (crawl_checkpoint) のカーソルから続きを取得する。
+        進捗は resume の指定に関わらず GraphQL 方式ではキーワード毎に保存される
+
+    戻り値:
+        実行結果の dict (keyword, new_videos, known, processed, saved, failed, stop_reason, elapsed, tweet_urls)
+        known は保存済み（インデックスに登録済み）のため、メトリクスだけを更新した件数
+    """
+    print(f"🔍 キーワード '{keyword}' で検索中... (取得方式: {capture_mode})")
+    started = time.monotonic()
+    result = {
+        'keyword': keyword,
+        'new_videos': 0,
+        'known': 0,
+        'processed': 0,
+        'saved': 0,
+        'failed': 0,
+        'stop_reason': None,
+        'elapsed': 0.0,
+        'tweet_urls': [],
+    }
+    search_url = x_url(f"https://twitter.com/search?q={urllib.parse.quote(keyword)}&src=typed_query&f=video")
+
+    # GraphQL の傍受は最初のレスポンスを逃さないよう goto より前に登録する
+    capture = None
+    checkpoint = None
+    if capture_mode == "graphql":
+        capture = GraphQLCapture()
+        capture.attach(page)
+        checkpoint = CrawlCheckpoint.open(keyword, resume=resume)
+        if checkpoint.cursor:
+            await checkpoint.install_resume(page)
+    elif resume:
+        print("ℹ️ DOM方式ではチェックポイントからの再開に対応していません。最初から取得します")
+
+    # 検索結果の読み込みを待つ（GraphQL 方式では SearchTimeline のレスポンスが届いた時点で完了）
+    await open_page(page, search_url, '[data-testid="tweet"]', "search",
+                    ready_event=capture.new_records if capture else None)
+
+    # DOM方式では新しく挿入されたツイート要素だけをページ内で収集する
+    if not capture:
+        initial_count = await install_tweet_observer(page)
+        debug_log(f"ツイート差分収集を開始 (初期表示: {initial_count}件)")
 
     # --- SQL Server 接続 ---
-    conn = connect_to_sql_server()
+    conn = await connect_to_sql_server()
     if not conn:
         print("❌ SQL Server 接続に失敗しました。")
-        return
+        if capture:
+            capture.detach(page)
+            await checkpoint.remove_resume(page)
+        result['stop_reason'] = "SQL Server 接続に失敗"
+        return result
+
+    # 保存済みツイートのインデックス（プロセス内で1回だけ読み込む）
+    known_index = await load_known_index(conn)
+    processed_ids = seen_ids if seen_ids is not None else set()
+    # 動画URLが見つからなかったツイート（処理件数の重複計上を防ぐため）
+    no_video_ids = set()
+    processed_count = 0
+    video_count = 0
+    known_count = 0
+    writer = WriteBehindQueue(lambda batch: save_search_batch(conn, batch, known_index),
+                              batch_size=write_batch_size, flush_interval=write_flush_interval)
+    await writer.start()
+
+    def written_total():
+        """保存処理を終えた件数（保存失敗で自動保存に回したものを含む）"""
+        stats = writer.stats()
+        return stats['rows_written'] + stats['failed_records']
+
+    def accept_video(video_data):
+        """未処理の動画付きツイートなら True を返す"""
+        nonlocal processed_count, known_count
+        tweet_url = video_data['tweet_url']
+        tweet_id = tweet_id_of(video_data)
+        key = int(tweet_id) if tweet_id.isdigit() else tweet_id
+        if key in processed_ids:
+            return False
+        if not video_data.get('video_url'):
+            # 動画の読み込み前に取り出された可能性があるため処理済みにはせず、再度届いたときに判定し直す
+            if key not in no_video_ids:
+                no_video_ids.add(key)
+                processed_count += 1
+                print(f"  ℹ️ 動画URLが見つからないためスキップ: {tweet_url}")
+            return False
+        processed_ids.add(key)
+        if key not in no_video_ids:
+            processed_count += 1
+        if tweet_id in known_index:
+            # 保存済みのツイートは保存時にメトリクスだけを更新する
+            known_count += 1
+            debug_log(f"保存済みのツイート (メトリクスのみ更新): {tweet_url}")
+            return True
+        print(f"🔄 ツイート処理中: {tweet_url}")
+        print(f"  📊 メトリクス: {video_data['metrics']}")
+        print(f"  👤 ユーザー情報: {video_data.get('username')}")
+        return True
 
-    try:
-        # スクロールとデータ収集
-        processed_urls = set()
-        for _ in range(min(SCROLL_COUNT, limit // 20)):
-            try:
-                # ページをスクロール
-                print("🔄 ページをスクロール中...")
-                await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                await asyncio.sleep(SCROLL_INTERVAL)
-                
-                # 動画付きツイートを取得
-                tweets = await page.query_selector_all('[data-testid="tweet"]')
-                print(f"🔍 {len(tweets)}件のツイートを検出しました。")
-                for tweet in tweets:
-                    tweet_url = "N/A" # エラーログ用
-                    try:
-                        # ツイートURLを取得 (より具体的なセレクタ)
-                        tweet_url_elem = await tweet.query_selector('a[href*="/status/"]')
-                        if not tweet_url_elem:
-                            print("  ⚠️ ツイートURL要素が見つかりませんでした")
-                            continue
-
-                        tweet_url_path = await tweet_url_elem.get_attribute("href")
-                        # status を含まないリンク (例: /shiba_program) はスキップ
-                        if "/status/" not in tweet_url_path:
-                            # print(f"  ℹ️ status を含まないリンクはスキップ: {tweet_url_path}")
-                            continue
-                        tweet_url = "https://twitter.com" + tweet_url_path
-
-                        if tweet_url in processed_urls:
-                            # print(f"  ℹ️ 既に処理済みのツイート: {tweet_url}") # ログ削減
-                            continue
-                        processed_urls.add(tweet_url)
-                        print(f"🔄 ツイート処理中: {tweet_url}")
-
-                        # --- 動画URLを検索結果ページから直接取得試行 ---
-                        video_url = None
-                        try:
-                            # ツイートコンテナ内の video 要素を探す
-                            video_elem = await tweet.query_selector('video')
-                            if video_elem:
-                                video_url = await video_elem.get_attribute("src")
-                                if video_url:
-                                     print(f"  ✅ 動画URLを直接取得: {video_url}")
-                                else:
-                                     # srcがない場合、他の属性 (例: poster) も確認できるかもしれない
-                                     poster_url = await video_elem.get_attribute("poster")
-                                     if poster_url:
-                                         print(f"  ⚠️ video要素にsrcはないがposterあり: {poster_url}")
-                                     else:
-                                         print(f"  ⚠️ video要素にsrcもposterもありません: {tweet_url}")
-                            # else:
-                                # print(f"  ℹ️ video要素が直接見つかりません: {tweet_url}")
-                                # ここで他の抽出方法を試すことも可能 (例: data-* 属性、埋め込みJSON)
-                        except Exception as video_e:
-                            print(f"  ⚠️ 動画URLの直接取得中にエラー: {video_e}")
-
-                        if not video_url:
-                            print(f"  ❌ 動画URLが見つかりませんでした (スキップ): {tweet_url}")
-                            continue # 動画URLがなければ保存しない
-
-                        # メトリクスを取得 (検索結果ページの要素から)
-                        metrics = await extract_tweet_metrics(tweet)
-                        print(f"  📊 メトリクス: {metrics}")
-
-                        # ユーザー情報を取得 (検索結果ページの要素から)
-                        user_info = await extract_user_info(tweet)
-                        print(f"  👤 ユーザー情報: {user_info.get('username')}")
-
-                        # データを保存用に準備
-                        video_data = {
-                            'tweet_url': tweet_url,
-                            'video_url': video_url,
-                            'metrics': metrics,
-                            **user_info
-                        }
-
-                        # --- SQL Server に保存 ---
-                        await insert_video_data_sql_server(conn, video_data)
-
-                        # 上限チェック
-                        if len(processed_urls) >= limit:
-                            print(f"🏁 取得上限 ({limit}件) に達しました。")
-                            break # 内側ループを抜ける
-
-                    except Exception as e:
-                        print(f"❌ ツイート処理中の予期せぬエラー ({tweet_url}): {e}")
-                        # このツイートの処理はスキップして次に進む
-                        continue
-
-                # 上限チェック (外側ループ用)
-                if len(processed_urls) >= limit:
-                    break # スクロールループも抜ける
-                    
-            except Exception as e:
-                print(f"⚠️ スクロール中のエラー: {e}")
+    async def harvest():
+        """新しく届いたツイートを処理し、新規動画数を返す"""
+        nonlocal video_count
+        if capture:
+            # GraphQL レスポンスから取得したレコード
+            items = capture.drain()
+        else:
+            # 前回以降に挿入されたツイートを、内容ごと1回の呼び出しで取り出す
+            with timed("extract"):
+                cards = await drain_tweet_cards(page)
+            with timed("convert"):
+                items = cards_to_video_data(cards)
+        count("tweets_harvested", len(items))
+        new_videos = 0
+        truncated = False
+        last_tweet_id = None
+        for video_data in items:
+            if not video_data:
+                # status を含まないカード (広告など) はスキップ
+                continue
+            if video_count >= limit:
+                truncated = True
+                break
+            last_tweet_id = video_data.get('tweet_id') or last_tweet_id
+            if accept_video(video_data):
+                # --- 保存キューに積む（満杯のときだけ待たされる） ---
+                await writer.put(video_data)
+                result['tweet_urls'].append(video_data['tweet_url'])
+                new_videos += 1
+                video_count += 1
+        if checkpoint:
+            checkpoint.collected += new_videos
+            if not truncated:
+                # 取り出したツイートを全て保存キューに積めた場合だけ、取り出した時点のカーソルを再開位置の候補にする
+                # （保存キューへの put で待つ間に bottom_cursor は未取り出しのレコードの先へ進みうる）
+                checkpoint.track(capture.drained_cursor, video_count, last_tweet_id)
+            checkpoint.flush_safe(written_total())
+        return new_videos
+
+    async def wait_for_new(timeout):
+        """新しいツイートが届くまで待つ（固定時間の sleep の代わり）"""
+        try:
+            if capture:
+                await asyncio.wait_for(capture.new_records.wait(), timeout)
+            else:
+                await page.wait_for_function(HARVEST_READY_JS, timeout=timeout * 1000)
+            return True
+        except (asyncio.TimeoutError, TimeoutError):
+            return False
 
+    scroller = AdaptiveScroller(page, target=limit, max_scrolls=SCROLL_COUNT,
+                                max_idle_scrolls=max_idle_scrolls, wait_timeout=SCROLL_WAIT_TIMEOUT)
+    try:
+        await scroller.run(harvest, wait_for_new)
+    except Exception as e:
+        print(f"⚠️ スクロール中のエラー: {e}")
+        scroller.stop_reason = f"エラー: {e}"
     finally:
-        if conn:
-            conn.close()
-            print("ℹ️ SQL Server 接続を閉じました")
+        if capture:
+            capture.detach(page)
+            await checkpoint.remove_resume(page)
+            print(f"ℹ️ GraphQL傍受: レスポンス{capture.response_count}件, ツイート{capture.record_count}件, エラー{capture.error_count}件")
+        # キューに残ったレコードを書き切ってから接続を返却する
+        await writer.close()
+        print(f"ℹ️ 保存キュー: {writer.format_stats()}")
+        if writer.failed_records:
+            # 保存できなかったレコードは終了時の自動保存で再試行する（結果の件数・URLには含めない）
+            temp_video_data.extend(writer.failed_records)
+            failed_urls = {record['tweet_url'] for record in writer.failed_records}
+            result['tweet_urls'] = [url for url in result['tweet_urls'] if url not in failed_urls]
+        release_connection(conn)
+        print("ℹ️ SQL Server 接続を返却しました")
+        if checkpoint:
+            # フィードの終端まで取得した場合だけ完了とし、次回は最初から取得する
+            completed = bool(scroller.stop_reason and "フィード終端" in scroller.stop_reason)
+            checkpoint.finish(scroller.stop_reason, completed, written_total())
+            print(f"💾 チェックポイントを保存しました: {checkpoint.path} (累計 {checkpoint.collected}件)")
+
+    print(f"✅ {processed_count}件のツイートを処理しました（新規動画: {video_count}件, うち保存済み: {known_count}件）")
+    print(f"ℹ️ 保存済みインデックス: {known_index.format_stats()}")
+    writer_stats = writer.stats()
+    if writer_stats['failed_records']:
+        print(f"⚠️ うち{writer_stats['failed_records']}件は保存に失敗したため、新規動画の件数に含めません（自動保存で再試行します）")
+    result.update({
+        'new_videos': video_count - writer_stats['failed_records'],
+        'known': known_count,
+        'processed': processed_count,
+        'saved': writer_stats['rows_written'],
+        'failed': writer_stats['failed_records'],
+        'stop_reason': scroller.stop_reason,
+        'elapsed': time.monotonic() - started,
+    })
+    return result
+
+# 複数キーワードを同時に検索する数
+SEARCH_CONCURRENCY = 3
+
+def load_keywords(path):
+    """キーワードファイル（1行1キーワード、# 以降はコメント）を読み込む"""
+    keywords = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            keyword = line.split("#", 1)[0].strip()
+            if keyword:
+                keywords.append(keyword)
+    return keywords
+
+async def search_keywords(session_pool, keywords, limit=10, concurrency=SEARCH_CONCURRENCY, **search_options):
+    """
+    複数キーワードを同時に検索する
+
+    キーワード毎にセッションプールからページを借り、同時実行数を concurrency までに制限する。
+    処理済みツイートの set は全キーワードで共有し、同じツイートを重複して保存しない。
+
+    パラメータ:
+        session_pool: SessionPool
+        keywords: 検索キーワードのリスト
+        limit: キーワード毎の新規動画の目標件数
+        concurrency: 同時に検索するキーワード数
+        search_options: search_videos に渡す追加の引数
 
-    print(f"✅ {len(processed_urls)}件のツイートを処理しました")
+    戻り値:
+        キーワード毎の search_videos の結果のリスト（キーワードの順）
+    """
+    keywords = list(dict.fromkeys(keywords))  # 重複を除き順序は保持
+    if concurrency > DB_POOL_SIZE:
+        # 検索1件につき DB 接続を1本使うため、接続プールの大きさを超えて同時に検索しない
+        print(f"⚠️ 同時検索数を接続プールの大きさ (DB_POOL_SIZE={DB_POOL_SIZE}) に制限します")
+        concurrency = DB_POOL_SIZE
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    seen_ids = set()
+    started = time.monotonic()
+    print(f"🗂 {len(keywords)}件のキーワードを最大{concurrency}件ずつ同時に検索します")
+
+    async def run(keyword):
+        async with semaphore:
+            try:
+                async with session_pool.lease() as (session, page):
+                    print(f"👤 '{keyword}' をアカウント {session.name} で検索します")
+                    return await search_videos(page, keyword, limit, seen_ids=seen_ids, **search_options)
+            except Exception as e:
+                print(f"❌ キーワード '{keyword}' の検索中にエラー: {e}")
+                return {'keyword': keyword, 'new_videos': 0, 'known': 0, 'processed': 0, 'saved': 0, 'failed': 0,
+                        'stop_reason': f"エラー: {e}", 'elapsed': 0.0, 'tweet_urls': []}
+
+    results = await asyncio.gather(*(run(keyword) for keyword in keywords))
+
+    elapsed = time.monotonic() - started
+    print("\n📋 キーワード別の結果:")
+    for result in results:
+        print(f"  - {result['keyword']}: 新規動画 {result['new_videos']}件 (うち保存済み {result['known']}件, "
+              f"処理 {result['processed']}件, "
+              f"保存 {result['saved']}件, 失敗 {result['failed']}件, {result['elapsed']:.0f}秒) "
+              f"[{result['stop_reason']}]")
+    total = sum(result['new_videos'] for result in results)
+    print(f"✅ 合計 新規動画 {total}件 / {len(keywords)}キーワード ({elapsed:.0f}秒)")
+    return results
 
 async def extract_user_info(tweet):
     """ツイートからユーザー情報を抽出する"""
     try:
-        username = ''
-        display_name = ''
-        profile_image_url = ''
-        tweet_text = ''
-        
-        # ユーザー名を取得
-        username_elem = await tweet.query_selector('div[data-testid="User-Name"] a[href^="/"]')
-        if username_elem:
-            username = (await username_elem.get_attribute("href")).replace("/", "")
-            
-        # 表示名を取得
-        display_name_elem = await tweet.query_selector('div[data-testid="User-Name"] a span')
-        if display_name_elem:
-            display_name = await display_name_elem.text_content()
-            
-        # プロフィール画像を取得
-        avatar_elem = await tweet.query_selector('img[data-testid="tweetPhoto"], img[src*="profile_images"]')
-        if avatar_elem:
-            profile_image_url = await avatar_elem.get_attribute("src")
-            
-        # ツイート内容を取得
-        content_elem = await tweet.query_selector('div[data-testid="tweetText"]')
-        if content_elem:
-            tweet_text = await content_elem.text_content()
-            
-        return {
-            'username': username,
-            'display_name': display_name,
-            'profile_image_url': profile_image_url,
-            'tweet_text': tweet_text
-        }
+        card = await extract_card(tweet)
+        return card_user_info(card)
     except Exception as e:
         print(f"⚠️ ユーザー情報の取得に失敗: {e}")
         return {}
 
 async def extract_tweet_metrics(tweet):
     """ツイートからメトリクス（いいね数、リツイート数、閲覧数）を抽出する"""
-    metrics = {
-        'likes': 0,
-        'retweets': 0,
-        'views': 0
-    }
-    
     try:
-        # いいね数を取得
-        like_elem = await tweet.query_selector('[data-testid="like"] span span')
-        if like_elem:
-            likes_text = await like_elem.text_content()
-            metrics['likes'] = convert_metric(likes_text)
-        
-        # リツイート数を取得
-        retweet_elem = await tweet.query_selector('[data-testid="retweet"] span span')
-        if retweet_elem:
-            retweet_text = await retweet_elem.text_content()
-            metrics['retweets'] = convert_metric(retweet_text)
-        
-        # 閲覧数を取得
-        view_elem = await tweet.query_selector('a[href*="/analytics"]')
-        if view_elem:
-            view_text = await view_elem.text_content()
-            metrics['views'] = convert_metric(view_text)
-        
-        return metrics
+        card = await extract_card(tweet)
+        return card_metrics(card)
     except Exception as e:
         print(f"⚠️ メトリクス抽出中にエラー: {e}")
-        return metrics
+        return {'likes': 0, 'retweets': 0, 'views': 0}
+
+def parse_count_label(label):
+    """
+    aria-label から正確な数値を取り出す
+
+    例: "7688 Likes. Like" → 7688, "1,234 件のいいね" → 1234, "20499 views. View post analytics" → 20499
+    数値が含まれない場合は None
+    """
+    if not label:
+        return None
+    match = re.search(r"\d(?:[\d,.\s\u00a0\u202f]*\d)?", label)
+    if not match:
+        return None
+    digits = re.sub(r"\D", "", match.group(0))
+    return int(digits) if digits else None
+
+METRIC_NAMES = ('likes', 'retweets', 'views')
+
+def cards_metrics(cards):
+    """
+    複数のカードのメトリクスをまとめて取得する
+
+    aria-label の正確な値を優先し、なければ表示テキストを変換する。
+    表示テキストはバッチ全体で1回の parse_metrics にまとめて数値化する。
+    解析できなかった値は None とする（保存時は COALESCE で既存の値が残る）。
+    """
+    results = [{} for _ in cards]
+    pending = []
+    texts = []
+    for metrics, card in zip(results, cards):
+        for name in METRIC_NAMES:
+            exact = parse_count_label(card.get(f'{name}_label'))
+            if exact is not None:
+                metrics[name] = exact
+            else:
+                metrics[name] = None  # 辞書のキーの順序を保つための仮の値
+                pending.append((metrics, name))
+                texts.append(card.get(f'{name}_text'))
+    if texts:
+        parsed = parse_metrics(texts)
+        for (metrics, name), value, failed in zip(pending, parsed.values.tolist(), parsed.failed.tolist()):
+            metrics[name] = None if failed else value
+    return results
+
+def card_metrics(card):
+    """カード情報からメトリクスを取得する（aria-label の正確な値を優先し、なければ表示テキストを変換）"""
+    return cards_metrics([card])[0]
+
+def card_user_info(card):
+    """カード情報からユーザー情報とツイート内容を取得する"""
+    return {
+        'username': (card.get('username_href') or '').replace("/", ""),
+        'display_name': card.get('display_name') or '',
+        'profile_image_url': card.get('profile_image_url') or '',
+        'tweet_text': card.get('tweet_text') or '',
+    }
+
+def card_to_video_data(card, metrics=None):
+    """
+    drain_tweet_cards / extract_card のカード情報を保存用の形式に変換する
+
+    metrics を省略した場合はこのカードだけでメトリクスを数値化する（複数なら cards_to_video_data を使う）
+
+    戻り値:
+        insert_video_data_sql_server が受け取れる dict。ツイートURLがない場合は None
+    """
+    status_href = card.get('status_href')
+    if not status_href or "/status/" not in status_href:
+        return None
+    posted_at = None
+    if card.get('posted_at'):
+        try:
+            posted_at = datetime.datetime.fromisoformat(card['posted_at'].replace("Z", "+00:00"))
+            posted_at = posted_at.astimezone().replace(tzinfo=None)
+        except ValueError:
+            posted_at = None
+    return {
+        'tweet_url': "https://twitter.com" + status_href,
+        'video_url': card.get('video_src'),
+        'metrics': metrics if metrics is not None else card_metrics(card),
+        'posted_at': posted_at,
+        **card_user_info(card),
+    }
+
+def cards_to_video_data(cards):
+    """複数のカードを保存用の形式に変換する（メトリクスは1回の呼び出しでまとめて数値化）"""
+    return [card_to_video_data(card, metrics) for card, metrics in zip(cards, cards_metrics(cards))]
 
 def convert_metric(value):
-    """メトリクスの文字列を数値に変換する"""
-    if not value:
-        return 0
-    
-    try:
-        value = str(value).strip().replace(',', '')
-        if 'K' in value:
-            return int(float(value.replace('K', '')) * 1000)
-        elif 'M' in value:
-            return int(float(value.replace('M', '')) * 1000000)
-        return int(value) if value.isdigit() else 0
-    except (ValueError, AttributeError):
-        return 0
-
-async def setup_browser():
+    """
+    メトリクスの文字列を数値に変換する（"1.2K", "1.2万" など。詳細は metric_parser）
+
+    解析できない場合は None（0 として保存すると既存の値を消してしまうため）
+    """
+    return parse_metric(value)
+
+async def setup_browser(headless=HEADLESS, resource_policy=None):
     """
     ブラウザをセットアップする
     
     ブラウザを起動し、必要な設定を行います。
     
+    パラメータ:
+        headless: ヘッドレスで起動するか
+        resource_policy: ResourcePolicy。起動オプション（自動再生の無効化）を反映する。
+                         通信制限はコンテキスト作成後に resource_policy.apply(context) で適用すること
+    
     戻り値:
         Playwrightのブラウザオブジェクト
     """
     try:
         playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=False)
+        browser = await playwright.chromium.launch(
+            headless=headless, args=resource_policy.launch_args() if resource_policy else None)
         return browser
     except Exception as e:
         print(f"❌ ブラウザセットアップ中にエラーが発生: {e}")
         return None
 
-async def refresh_tweet_metrics(page):
+async def fetch_tweet_metrics(page, tweet_id, tweet_url):
+    """ツイートページを開いてメトリクスだけを読み取る（取得できなければ None）"""
+    # ツイートページに移動し、ツイート要素が表示されたらすぐ読み取る
+    tweet_elem = await open_page(page, x_url(tweet_url), '[data-testid="tweet"]', "tweet")
+    if not tweet_elem:
+        print(f"  ❌ ツイート要素が見つかりません: {tweet_url}")
+        return None
+    with timed("extract"):
+        metrics = await extract_tweet_metrics(tweet_elem)
+    debug_log(f"メトリクスを取得: {tweet_url} {metrics}")
+    return {'tweet_id': tweet_id, 'tweet_url': tweet_url, 'metrics': metrics}
+
+
+async def refresh_tweet_metrics(page, concurrency=REFRESH_CONCURRENCY, budget=REFRESH_BUDGET, session_pool=None):
     """
     ツイートのメトリクスを SQL Server で更新する
+
+    再取得の期限が来たツイートから優先度の高い順に budget 件を選び、複数のページで並列に訪問する。
+    取得したメトリクスは保存キューでまとめて保存する。
+
+    パラメータ:
+        page: ログイン済みのページ（同じブラウザコンテキストでワーカー用のページを開く）
+        concurrency: 同時に開くページ数
+        budget: 1回の実行で再取得する最大件数 (0 の場合は期限が来た全件)
+        session_pool: 複数アカウントの SessionPool。指定した場合は page の代わりにアカウントを借りて訪問する
     """
     print("🔄 SQL Server のツイートメトリクスを更新中...")
-    conn = connect_to_sql_server()
+    conn = await connect_to_sql_server()
     if not conn:
         print("❌ SQL Server 接続に失敗しました。")
         return
 
-    updated_count = 0
-    total_tweets = 0
-
-    def db_fetch_tweets():
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT tweetId, originalUrl FROM Tweet")
-            return cursor.fetchall()
-        except pyodbc.Error as ex:
-            print(f"❌ SQL Server データ取得エラー: {ex}")
-            return []
-        finally:
-            cursor.close()
+    scheduler = RefreshScheduler(conn, budget)
 
-    def db_update_metrics(tweet_id, metrics):
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                UPDATE Tweet
-                SET likes = ?, retweets = ?, views = ?, updatedAt = GETDATE()
-                WHERE tweetId = ?
-            """, (metrics['likes'], metrics['retweets'], metrics['views'], tweet_id))
-            conn.commit()
-            return True
-        except pyodbc.Error as ex:
-            print(f"❌ SQL Server メトリクス更新エラー ({tweet_id}): {ex}")
-            conn.rollback()
-            return False
-        finally:
-            cursor.close()
+    async def visit(worker_page, tweet):
+        tweet_id, tweet_url = tweet
+        record = await fetch_tweet_metrics(worker_page, tweet_id, tweet_url)
+        if record:
+            scheduler.record_result(tweet_id, record['metrics'])
+        return record
 
+    # データベースへはまとめて保存する
+    writer = WriteBehindQueue(lambda batch: upsert_tweets_sql_server(conn, batch), batch_size=REFRESH_FLUSH_SIZE)
+    await writer.start()
     try:
-        # データを取得 (同期処理を非同期で実行)
-        tweets = await asyncio.to_thread(db_fetch_tweets)
-        total_tweets = len(tweets)
-
-        for tweet_id, tweet_url in tweets:
-            try:
-                # ツイートページに移動
-                await page.goto(tweet_url, timeout=30000)
-                await page.wait_for_load_state("networkidle", timeout=10000)
-
-                # メトリクスを取得
-                tweet_elem = await page.query_selector('[data-testid="tweet"]')
-                if tweet_elem:
-                    metrics = await extract_tweet_metrics(tweet_elem)
-
-                    # データベースを更新 (同期処理を非同期で実行)
-                    if await asyncio.to_thread(db_update_metrics, tweet_id, metrics):
-                        print(f"  ✅ メトリクスを更新: {tweet_url}")
-                        updated_count += 1
-                else:
-                    print(f"  ❌ ツイート要素が見つかりません: {tweet_url}")
-            except Exception as e:
-                print(f"  ❌ メトリクス更新中にエラー ({tweet_url}): {e}")
-
-        print(f"✅ 合計 {updated_count}/{total_tweets} のツイートメトリクスを更新しました")
+        # 再取得対象を優先度順に選ぶ (同期処理を非同期で実行)
+        tweets = await asyncio.to_thread(scheduler.select)
+        # 失敗が続いたら全ワーカーを止め、回復しなければ残りを打ち切る（次回の実行で再び選ばれる）
+        breaker = CircuitBreaker("メトリクス更新", max_trips=BREAKER_MAX_TRIPS)
+        if session_pool:
+            pool = RefreshWorkerPool(concurrency=concurrency, lease=session_pool.lease, breaker=breaker)
+        else:
+            pool = RefreshWorkerPool(page.context, concurrency, breaker=breaker)
+        await pool.run(tweets, visit, writer.put)
+        print(f"ℹ️ ブレーカー: {breaker.format_stats()}")
     except Exception as e:
         print(f"❌ メトリクス更新処理中にエラー: {e}")
     finally:
-        if conn:
-            conn.close()
-            print("ℹ️ SQL Server 接続を閉じました")
+        await writer.close()
+        print(f"ℹ️ 保存キュー: {writer.format_stats()}")
+        print(f"✅ 合計 {writer.stats()['rows_written']} のツイートメトリクスを更新しました")
+        try:
+            await asyncio.to_thread(scheduler.commit)
+        except pyodbc.Error as ex:
+            print(f"❌ 再取得スケジュールの保存に失敗: {ex}")
+        release_connection(conn)
+        print("ℹ️ SQL Server 接続を返却しました")
 
 
-async def update_all_tweet_data(page):
+async def update_all_tweet_data(page, budget=REFRESH_BUDGET):
     """
-    すべてのツイートデータを SQL Server で更新する
+    ツイートデータを SQL Server で更新する
+
+    再取得の期限が来たツイートから優先度の高い順に budget 件 (0 の場合は全件) を更新する。
     """
     print("🔄 SQL Server の全ツイートデータを更新中...")
-    conn = connect_to_sql_server()
+    conn = await connect_to_sql_server()
     if not conn:
         print("❌ SQL Server 接続に失敗しました。")
         return
@@ -753,96 +1184,186 @@ async def update_all_tweet_data(page):
     error_count = 0
     total_tweets = 0
 
-    def db_fetch_tweets():
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT tweetId, originalUrl FROM Tweet")
-            return cursor.fetchall()
-        except pyodbc.Error as ex:
-            print(f"❌ SQL Server データ取得エラー: {ex}")
-            return []
-        finally:
-            cursor.close()
+    scheduler = RefreshScheduler(conn, budget)
 
-    def db_update_all(tweet_id, metrics, video_url, user_info):
-        cursor = conn.cursor()
-        try:
-            cursor.execute("""
-                UPDATE Tweet
-                SET likes = ?, retweets = ?, views = ?,
-                    videoUrl = COALESCE(?, videoUrl),
-                    authorName = COALESCE(?, authorName),
-                    authorUsername = COALESCE(?, authorUsername),
-                    authorProfileImageUrl = COALESCE(?, authorProfileImageUrl),
-                    content = COALESCE(?, content), -- content も更新対象に追加
-                    updatedAt = GETDATE()
-                WHERE tweetId = ?
-            """, (
-                metrics['likes'], metrics['retweets'], metrics['views'],
-                video_url,
-                user_info.get('display_name'), user_info.get('username'),
-                user_info.get('profile_image_url'),
-                user_info.get('tweet_text'), # content を追加
-                tweet_id
-            ))
-            conn.commit()
-            return True
-        except pyodbc.Error as ex:
-            print(f"❌ SQL Server 全データ更新エラー ({tweet_id}): {ex}")
-            conn.rollback()
-            return False
-        finally:
-            cursor.close()
+    pending = []
+
+    async def flush():
+        """溜まったレコードをまとめて保存する"""
+        nonlocal updated_count, error_count
+        if not pending:
+            return
+        result = await upsert_tweets_sql_server(conn, pending)
+        updated_count += result['updated'] + result['inserted']
+        error_count += result['failed']
+        pending.clear()
 
     try:
-        # データを取得 (同期処理を非同期で実行)
-        tweets = await asyncio.to_thread(db_fetch_tweets)
+        # 更新対象を優先度順に選ぶ (同期処理を非同期で実行)
+        tweets = await asyncio.to_thread(scheduler.select)
         total_tweets = len(tweets)
 
-        for tweet_id, tweet_url in tweets:
-            try:
-                # ツイートページに移動
-                await page.goto(tweet_url, timeout=30000)
-                await page.wait_for_load_state("networkidle", timeout=10000)
-
-                # メトリクスとビデオURLを更新
-                tweet_elem = await page.query_selector('[data-testid="tweet"]')
-                if tweet_elem:
-                    # メトリクスを取得
-                    metrics = await extract_tweet_metrics(tweet_elem)
-
-                    # ビデオURLを取得 (元のページに戻る処理を含む extract_video_url_from_tweet を使用)
-                    # 注意: この関数は内部で page.goto を使うため、ループ内で使うと非効率になる可能性がある
-                    # 本来はツイートページ上で必要な情報をまとめて取得する方が効率的
-                    video_url = await extract_video_url_from_tweet(page, tweet_url)
-
-                    # ユーザー情報を取得 (ツイート要素から取得)
-                    user_info = await extract_user_info(tweet_elem)
-
-                    # データベースを更新 (同期処理を非同期で実行)
-                    if await asyncio.to_thread(db_update_all, tweet_id, metrics, video_url, user_info):
-                        print(f"  ✅ データを更新: {tweet_url}")
-                        updated_count += 1
-                else:
-                    print(f"  ❌ ツイート要素が見つかりません: {tweet_url}")
+        # ツイートページ1回の読み込みで全項目を取得する
+        capture = GraphQLCapture(operations=("TweetDetail",))
+        capture.attach(page)
+        breaker = CircuitBreaker("全データ更新", max_trips=BREAKER_MAX_TRIPS)
+        try:
+            for tweet_id, tweet_url in tweets:
+                try:
+                    await breaker.wait_ready()
+                except CircuitOpenError as e:
+                    print(f"⚠️ {e}")
+                    break
+                try:
+                    record = await extract_full_tweet_record(page, tweet_id, tweet_url, capture)
+                    if record:
+                        breaker.record_success()
+                        # データベースへはまとめて保存する (取得できなかった項目は既存の値を保持)
+                        pending.append(record)
+                        scheduler.record_result(tweet_id, record['metrics'])
+                        print(f"  ✅ データを取得: {tweet_url}")
+                        if len(pending) >= REFRESH_FLUSH_SIZE:
+                            await flush()
+                    else:
+                        print(f"  ❌ ツイート要素が見つかりません: {tweet_url}")
+                        breaker.record_failure("ツイート要素が見つかりません")
+                        error_count += 1
+                except Exception as e:
+                    print(f"  ❌ データ更新中にエラー ({tweet_url}): {e}")
+                    breaker.record_failure(e)
                     error_count += 1
-            except Exception as e:
-                print(f"  ❌ データ更新中にエラー ({tweet_url}): {e}")
-                error_count += 1
+        finally:
+            capture.detach(page)
+            print(f"ℹ️ ブレーカー: {breaker.format_stats()}")
 
+        await flush()
+        await asyncio.to_thread(scheduler.commit)
         print(f"✅ 合計 {updated_count}/{total_tweets} のツイートを更新しました（エラー: {error_count}件）")
     except Exception as e:
         print(f"❌ データ更新処理中にエラー: {e}")
     finally:
-        if conn:
-            conn.close()
-            print("ℹ️ SQL Server 接続を閉じました")
+        release_connection(conn)
+        print("ℹ️ SQL Server 接続を返却しました")
+
+
+# ジョブキューが空のときに再確認するまでの間隔（秒）
+QUEUE_IDLE_SECONDS = 30
+
+
+async def _process_refresh_tasks(conn, queue, session_pool, tasks, concurrency, breaker=None):
+    """
+    借りたタスクを並列に処理し、完了・失敗をキューに反映する
+
+    breaker (CircuitBreaker) が開いている間はワーカーが待ち、打ち切られた残りのタスクは返却する。
+    """
+    scheduler = RefreshScheduler(conn)
+    scheduler.adopt({task['tweet_id']: task['info'] for task in tasks})
+    kinds = {task['tweet_id']: task['kind'] for task in tasks}
+    fetched = set()
+
+    async def visit(worker_page, item):
+        tweet_id, tweet_url = item
+        if kinds[tweet_id] == "full":
+            capture = GraphQLCapture(operations=("TweetDetail",))
+            capture.attach(worker_page)
+            try:
+                record = await extract_full_tweet_record(worker_page, tweet_id, tweet_url, capture)
+            finally:
+                capture.detach(worker_page)
+        else:
+            record = await fetch_tweet_metrics(worker_page, tweet_id, tweet_url)
+        if record:
+            scheduler.record_result(tweet_id, record['metrics'])
+            fetched.add(tweet_id)
+        return record
+
+    # 借りている間はタスクの期限を延長し続ける（止めるときは実行中の延長が終わるのを待つ）
+    stop = asyncio.Event()
+
+    async def heartbeat():
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), queue.lease_seconds / 3)
+            except asyncio.TimeoutError:
+                try:
+                    await asyncio.to_thread(queue.heartbeat)
+                except Exception as ex:
+                    print(f"⚠️ タスクの期限の延長に失敗: {ex}")
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    writer = WriteBehindQueue(lambda batch: upsert_tweets_sql_server(conn, batch), batch_size=REFRESH_FLUSH_SIZE)
+    await writer.start()
+    try:
+        pool = RefreshWorkerPool(concurrency=concurrency, lease=session_pool.lease, breaker=breaker)
+        stats = await pool.run([(task['tweet_id'], task['url']) for task in tasks], visit, writer.put)
+    finally:
+        await writer.close()
+        stop.set()
+        await heartbeat_task
+
+    # 保存まで終えたものだけを完了にし、それ以外は時間をおいて再試行する
+    unsaved = {tweet_id_of(record) for record in writer.failed_records}
+    done = [tweet_id for tweet_id in fetched if tweet_id not in unsaved]
+    retry = [task['tweet_id'] for task in tasks if task['tweet_id'] not in done]
+    await asyncio.to_thread(queue.complete, done)
+    await asyncio.to_thread(queue.release, retry)
+    await asyncio.to_thread(scheduler.commit, False)
+    print(f"📦 タスク {len(tasks)}件: 完了 {len(done)}件, 再試行 {len(retry)}件 ({writer.format_stats()})")
+    return stats
+
+
+async def run_refresh_queue_worker(session_pool, concurrency=REFRESH_CONCURRENCY, batch_size=REFRESH_LEASE_BATCH,
+                                   budget=REFRESH_BUDGET, kind="metrics", max_batches=0):
+    """
+    再取得ジョブキュー (refresh_queue) のワーカーとして動き続ける
+
+    キューからタスクを batch_size 件ずつ借りて並列に訪問し、保存してから完了にする。
+    キューが空の場合は期限が来たツイートを kind のタスクとして登録してから借りる
+    （選んだツイートは確保されるため、複数のマシンが同時に登録しても重複しない）。
+    max_batches 回借りたら終了する (0 の場合は停止されるまで続ける)。
+    """
+    queue_conn = await connect_to_sql_server()
+    conn = await connect_to_sql_server()
+    if not queue_conn or not conn:
+        print("❌ SQL Server 接続に失敗しました。")
+        for c in (queue_conn, conn):
+            if c:
+                release_connection(c)
+        return
+
+    # 期限の延長などキューの操作は、保存処理と別の接続で行う
+    queue = RefreshTaskQueue(queue_conn)
+    # 常駐するワーカーは打ち切らず、失敗が続く間は停止時間を延ばしながら待つ
+    breaker = CircuitBreaker("再取得ワーカー")
+    print(f"👷 再取得ワーカーを開始します: {queue.owner} (同時 {concurrency}ページ, {batch_size}件ずつ)")
+    batches = 0
+    processed = 0
+    started = time.monotonic()
+    try:
+        while not max_batches or batches < max_batches:
+            tasks = await asyncio.to_thread(queue.lease, batch_size)
+            if not tasks:
+                if await asyncio.to_thread(queue.enqueue_due, budget, kind):
+                    continue
+                print(f"💤 再取得タスクがありません。{QUEUE_IDLE_SECONDS}秒後に再確認します")
+                await asyncio.sleep(QUEUE_IDLE_SECONDS)
+                continue
+            batches += 1
+            stats = await _process_refresh_tasks(conn, queue, session_pool, tasks, concurrency, breaker)
+            processed += stats['processed']
+            elapsed = time.monotonic() - started
+            print(f"📈 ワーカー累計: {processed}件 ({processed / elapsed * 60:.1f}件/分), "
+                  f"キュー: {await asyncio.to_thread(queue.stats)}, ブレーカー: {breaker.format_stats()}")
+    finally:
+        release_connection(conn)
+        release_connection(queue_conn)
+        print("ℹ️ SQL Server 接続を返却しました")
 
 
 async def test_database_connection():
     """SQL Server データベース接続テスト"""
     print("🧪 SQL Server 接続テスト実行中...")
-    conn = connect_to_sql_server()
+    conn = await connect_to_sql_server()
     if not conn:
         print("❌ SQL Server 接続失敗")
         return False
@@ -918,8 +1439,8 @@ async def test_database_connection():
         return False
     finally:
         cursor.close()
-        conn.close()
-        print("ℹ️ SQL Server 接続を閉じました")
+        release_connection(conn)
+        print("ℹ️ SQL Server 接続を返却しました")
 
 
 async def autosave_data():
@@ -927,7 +1448,7 @@ async def autosave_data():
     if not temp_video_data:
         return
 
-    conn = connect_to_sql_server()
+    conn = await connect_to_sql_server()
     if not conn:
         print("❌ SQL Server 接続に失敗しました (自動保存)。")
         # 接続失敗時はデータを失わないようにクリアしない
@@ -935,14 +1456,9 @@ async def autosave_data():
 
     try:
         print(f"🔄 {len(temp_video_data)}件のデータを SQL Server に自動保存します...")
-        saved_count = 0
-        failed_data = []
-        for video_data in temp_video_data:
-            # insert_video_data_sql_server は非同期なので await する
-            if await insert_video_data_sql_server(conn, video_data):
-                saved_count += 1
-            else:
-                failed_data.append(video_data) # 失敗したデータを保持
+        result = await upsert_tweets_sql_server(conn, list(temp_video_data))
+        failed_data = result['failed_records']
+        saved_count = result['inserted'] + result['updated']
 
         print(f"✅ {saved_count}/{len(temp_video_data)}件のデータを保存しました")
         # 成功したデータのみクリアし、失敗したデータは残す
@@ -954,9 +1470,8 @@ async def autosave_data():
         print(f"❌ 自動保存中にエラー: {e}")
         # エラー時もデータはクリアしない
     finally:
-        if conn:
-            conn.close()
-            print("ℹ️ SQL Server 接続を閉じました (自動保存)")
+        release_connection(conn)
+        print("ℹ️ SQL Server 接続を返却しました (自動保存)")
 
 
 # 終了時に一時データを保存するための設定
@@ -986,12 +1501,56 @@ async def main():
     """メイン関数"""
     parser = argparse.ArgumentParser(description="Twitter動画検索・保存ツール")
     parser.add_argument("query", nargs="?", help="検索キーワード")
+    parser.add_argument("--keywords", nargs="*", default=None,
+                        help="複数キーワードを同時に検索 (値を省略すると SEARCH_KEYWORDS を使用)")
+    parser.add_argument("--keywords-file", help="検索キーワードのファイル (1行1キーワード)")
+    parser.add_argument("--search-concurrency", type=int, default=SEARCH_CONCURRENCY,
+                        help="複数キーワード検索で同時に検索する数 (上限は DB_POOL_SIZE)")
     parser.add_argument("--limit", type=int, default=10, help="取得する動画の最大数")
     parser.add_argument("--save", action="store_true", help="結果をデータベースに保存")
     parser.add_argument("--refresh-metrics", action="store_true", help="保存済みツイートのメトリクスを更新")
     parser.add_argument("--update-all", action="store_true", help="保存済みツイートの全データを更新")
+    parser.add_argument("--concurrency", type=int, default=REFRESH_CONCURRENCY,
+                        help="メトリクス更新で同時に開くページ数")
+    parser.add_argument("--refresh-budget", type=int, default=REFRESH_BUDGET,
+                        help="メトリクス更新・全データ更新で1回に再取得する最大件数 (0 で期限が来た全件)")
+    parser.add_argument("--queue-worker", action="store_true",
+                        help="再取得ジョブキューのワーカーとして動作 (複数マシンで分散実行)")
+    parser.add_argument("--queue-kind", choices=["metrics", "full"], default="metrics",
+                        help="キューが空のときに登録するタスクの種類")
+    parser.add_argument("--lease-batch", type=int, default=REFRESH_LEASE_BATCH, help="1回に借りるタスク数")
+    parser.add_argument("--max-batches", type=int, default=0, help="この回数だけ借りたら終了 (0: 無制限)")
     parser.add_argument("--test", action="store_true", help="データベース接続テストを実行")
+    parser.add_argument("--max-idle-scrolls", type=int, default=MAX_IDLE_SCROLLS,
+                        help="新規動画0件のスクロールがこの回数続いたら検索を終了")
+    parser.add_argument("--write-batch-size", type=int, default=WRITE_BATCH_SIZE,
+                        help="検索結果を何件ずつまとめてデータベースに保存するか")
+    parser.add_argument("--write-flush-interval", type=float, default=WRITE_FLUSH_INTERVAL,
+                        help="保存待ちのレコードを最長何秒でデータベースに書き込むか")
+    parser.add_argument("--profile-dir", default=SESSION_PROFILE_DIR,
+                        help="ログインセッションとキャッシュを保存するブラウザプロファイルのディレクトリ")
+    parser.add_argument("--accounts", default=ACCOUNTS_FILE,
+                        help="複数アカウントの認証情報ファイル (JSON)。ファイルがなければ .env の1アカウントを使用")
+    parser.add_argument("--resource-policy", choices=list(RESOURCE_POLICIES), default=RESOURCE_POLICY,
+                        help="通信制限 (full: 制限なし, lean: 動画・画像・フォント・計測を止める。graphql 方式のみ)")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=HEADLESS,
+                        help="ブラウザをヘッドレスで起動する")
+    parser.add_argument("--capture-mode", choices=["graphql", "dom"], default=CAPTURE_MODE,
+                        help="検索結果の取得方式 (graphql: 通信の傍受, dom: 画面要素の読み取り)")
+    parser.add_argument("--resume", action="store_true",
+                        help="前回中断したクロールをチェックポイントのカーソルから再開する")
+    parser.add_argument("--nav-budget", action="append", metavar="種類=秒",
+                        help="ページ遷移の時間予算を変更 (種類: search, tweet, login, probe。例: --nav-budget tweet=10)")
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT,
+                        help="処理段階の計測値を http://127.0.0.1:<port>/metrics で公開する (0: 公開しない)")
     args = parser.parse_args()
+    try:
+        set_nav_budgets(args.nav_budget)
+    except ValueError as e:
+        parser.error(str(e))
+    if ResourcePolicy(args.resource_policy).blocks_media and args.capture_mode == "dom":
+        # dom 方式は動画のプレイヤーが設定する src から動画URLを読むため、動画を止めると全件スキップされる
+        parser.error(f"--resource-policy {args.resource_policy} は --capture-mode graphql でのみ使えます")
     
     # 自動保存を設定
     register_autosave()
@@ -1000,36 +1559,77 @@ async def main():
     if args.test:
         return await test_database_connection()
     
+    # 複数キーワード検索の対象
+    keywords = []
+    if args.keywords_file:
+        keywords.extend(load_keywords(args.keywords_file))
+    if args.keywords is not None:
+        keywords.extend(args.keywords or [keyword for keyword in SEARCH_KEYWORDS if keyword.strip()])
+    
     # 操作の種類をチェック
-    if not (args.query or args.refresh_metrics or args.update_all):
+    if not (args.query or keywords or args.refresh_metrics or args.update_all or args.queue_worker):
         parser.print_help()
         return
+
+    # 実行終了時に書き出す計測値の名前
+    if args.queue_worker:
+        run_label = "queue-worker"
+    elif args.refresh_metrics:
+        run_label = "refresh-metrics"
+    elif keywords:
+        run_label = "keywords"
+    elif args.update_all:
+        run_label = "update-all"
+    else:
+        run_label = "search"
+    metrics_server = await start_metrics_server(METRICS_HOST, args.metrics_port) if args.metrics_port else None
     
     try:
         # ブラウザを起動
         print("🌐 ブラウザを起動中...")
         async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            page = await browser.new_page()
-            print("🌐 ブラウザが起動しました")
-            
-            # ログイン
-            if not await login_to_twitter(page):
-                print("❌ ログインに失敗しました")
-                return
-            
-            # 実行する操作を決定
-            if args.refresh_metrics:
-                await refresh_tweet_metrics(page)
-            elif args.update_all:
-                await update_all_tweet_data(page)
-            elif args.query:
-                await search_videos(page, args.query, args.limit)
-                
-                # 自動保存が設定されていない場合は、終了前に明示的に保存
-                if args.save:
-                    await autosave_data()
-            
+            # アカウント毎のプロファイルを再利用し、Cookie とキャッシュを前回から引き継ぐ
+            resource_policy = ResourcePolicy(args.resource_policy)
+            session_pool = SessionPool(p, load_accounts(args.accounts, args.profile_dir), login_to_twitter,
+                                       headless=args.headless,
+                                       context_options={'args': resource_policy.launch_args()},
+                                       on_context=resource_policy.apply)
+            try:
+                # 実行する操作を決定
+                if args.queue_worker:
+                    await run_refresh_queue_worker(session_pool, args.concurrency, args.lease_batch,
+                                                   args.refresh_budget, args.queue_kind, args.max_batches)
+                elif args.refresh_metrics:
+                    # ワーカー毎にアカウントを借りる
+                    await refresh_tweet_metrics(None, args.concurrency, args.refresh_budget, session_pool)
+                elif keywords:
+                    # キーワード毎にページを借りて同時に検索する
+                    await search_keywords(session_pool, keywords, args.limit, args.search_concurrency,
+                                          capture_mode=args.capture_mode, max_idle_scrolls=args.max_idle_scrolls,
+                                          write_batch_size=args.write_batch_size,
+                                          write_flush_interval=args.write_flush_interval, resume=args.resume)
+                    if args.save:
+                        await autosave_data()
+                else:
+                    # ジョブ1件につき1アカウントを借りる (保存済みのセッションが有効ならログインは省略)
+                    async with session_pool.lease() as (session, page):
+                        print(f"👤 アカウント {session.name} で実行します")
+                        if args.update_all:
+                            await update_all_tweet_data(page, args.refresh_budget)
+                        elif args.query:
+                            await search_videos(page, args.query, args.limit, args.capture_mode,
+                                                args.max_idle_scrolls, args.write_batch_size,
+                                                args.write_flush_interval, resume=args.resume)
+
+                    # 自動保存が設定されていない場合は、終了前に明示的に保存
+                    if args.query and args.save:
+                        await autosave_data()
+            finally:
+                print(f"ℹ️ セッションプール: {session_pool.format_stats()}")
+                print(f"ℹ️ 通信制限: {resource_policy.format_stats()}")
+                # プロファイルへ Cookie とキャッシュを書き出してから終了する
+                await session_pool.close()
+
             print("\n✨ 処理が完了しました")
             
     except Exception as e:
@@ -1038,6 +1638,11 @@ async def main():
         if temp_video_data:
             print("⚠️ エラーが発生しましたが、収集したデータの保存を試みます...")
             await autosave_data()
+    finally:
+        if metrics_server:
+            metrics_server.close()
+        print(f"⏱️ 処理段階ごとの計測:\n{METRICS.format_summary()}")
+        print(f"💾 計測結果を保存しました: {METRICS.write_summary(run_label)}")
 
 if __name__ == "__main__":
     # Python 3.8以上でWindowsの場合、asyncioのイベントループポリシーを設定
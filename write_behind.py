@@ -0,0 +1,173 @@
+"""
+ライトビハインド型の保存キュー
+==============================
+
+機能：
+- スクレイピング処理とDB書き込みを切り離す有界の asyncio キュー
+- 専用の書き込みタスクが、件数 (batch_size) または経過時間 (flush_interval) でまとめて保存
+- キューが満杯のときだけ put が待たされる（バックプレッシャー）
+- close() でキューに残ったレコードを全て書き込んでから終了
+- キューの深さ、保存1回あたりの件数・所要時間などの統計を stats() で取得可能
+
+使い方:
+    writer = WriteBehindQueue(lambda batch: upsert_tweets_sql_server(conn, batch))
+    await writer.start()
+    await writer.put(record)
+    ...
+    await writer.close()
+"""
+
+import asyncio
+import time
+
+# 1回の保存でまとめる最大件数
+WRITE_BATCH_SIZE = 100
+# 最初のレコードが届いてから保存するまでの最大待ち時間（秒）
+WRITE_FLUSH_INTERVAL = 2.0
+# キューの最大長（これを超えるとスクレイピング側が待たされる）
+WRITE_QUEUE_MAXSIZE = 1000
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """
+    レコードをキューに積み、バックグラウンドでまとめて保存する
+
+    パラメータ:
+        write_batch: レコードのリストを受け取って保存する async 関数。
+                     戻り値が dict で 'failed_records' を含む場合は失敗レコードとして記録する
+        batch_size: 1回の保存でまとめる最大件数
+        flush_interval: 最初のレコードが届いてから保存するまでの最大待ち時間（秒）
+        max_queue: キューの最大長
+    """
+
+    def __init__(self, write_batch, batch_size=WRITE_BATCH_SIZE,
+                 flush_interval=WRITE_FLUSH_INTERVAL, max_queue=WRITE_QUEUE_MAXSIZE):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.failed_records = []
+        self._queue = asyncio.Queue(maxsize=max_queue)
+        self._task = None
+        self._closed = False
+        # 統計
+        self._max_depth = 0
+        self._flushes = 0
+        self._rows_written = 0
+        self._flush_seconds_total = 0.0
+        self._flush_seconds_max = 0.0
+        self._last_flush_seconds = 0.0
+        self._last_flush_rows = 0
+        self._backpressure_waits = 0
+        self._backpressure_seconds = 0.0
+        self._errors = 0
+
+    async def start(self):
+        """書き込みタスクを開始する"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def put(self, record):
+        """レコードをキューに積む（キューが満杯の場合のみ空くまで待つ）"""
+        if self._closed:
+            raise RuntimeError("保存キューは既に閉じられています")
+        if self._task is not None and self._task.done():
+            # 書き込みタスクが異常終了している場合は、溜め込まずにエラーにする
+            raise RuntimeError(f"保存タスクが停止しています: {self._task.exception()!r}")
+        if self._queue.full():
+            self._backpressure_waits += 1
+            started = time.monotonic()
+            await self._queue.put(record)
+            self._backpressure_seconds += time.monotonic() - started
+        else:
+            self._queue.put_nowait(record)
+        self._max_depth = max(self._max_depth, self._queue.qsize())
+
+    async def close(self):
+        """キューに残ったレコードを全て保存してから書き込みタスクを終了する"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is None:
+            # start 前に積まれたレコードも保存する
+            self._task = asyncio.create_task(self._run())
+        if not self._task.done():
+            await self._queue.put(_STOP)
+        try:
+            await self._task
+        except Exception as e:
+            print(f"❌ 保存タスクがエラーで終了しました: {e}")
+        # 異常終了などで書き込まれなかったレコードは失敗扱いにして呼び出し側へ返す
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                self.failed_records.append(item)
+
+    def stats(self):
+        """キューと保存処理の統計を返す"""
+        return {
+            'queue_depth': self._queue.qsize(),
+            'max_queue_depth': self._max_depth,
+            'flushes': self._flushes,
+            'rows_written': self._rows_written,
+            'rows_per_flush': (self._rows_written / self._flushes) if self._flushes else 0.0,
+            'last_flush_rows': self._last_flush_rows,
+            'last_flush_seconds': self._last_flush_seconds,
+            'avg_flush_seconds': (self._flush_seconds_total / self._flushes) if self._flushes else 0.0,
+            'max_flush_seconds': self._flush_seconds_max,
+            'backpressure_waits': self._backpressure_waits,
+            'backpressure_seconds': self._backpressure_seconds,
+            'errors': self._errors,
+            'failed_records': len(self.failed_records),
+        }
+
+    def format_stats(self):
+        """統計をログ出力用の文字列にする"""
+        s = self.stats()
+        return (f"保存{s['flushes']}回, {s['rows_written']}件 (平均 {s['rows_per_flush']:.1f}件/回), "
+                f"保存時間 平均{s['avg_flush_seconds']:.2f}秒/最大{s['max_flush_seconds']:.2f}秒, "
+                f"キュー最大{s['max_queue_depth']}件, 待機{s['backpressure_waits']}回 "
+                f"({s['backpressure_seconds']:.1f}秒), 失敗{s['failed_records']}件")
+
+    async def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if not batch else max(0.0, deadline - time.monotonic())
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is _STOP:
+                await self._flush(batch)
+                return
+            if item is not None:
+                batch.append(item)
+                if len(batch) == 1:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                await self._flush(batch)
+                batch = []
+
+    async def _flush(self, batch):
+        if not batch:
+            return
+        started = time.monotonic()
+        try:
+            result = await self.write_batch(batch)
+            failed = result.get('failed_records', []) if isinstance(result, dict) else []
+        except Exception as e:
+            print(f"❌ まとめて保存中にエラー ({len(batch)}件): {e}")
+            self._errors += 1
+            failed = list(batch)
+        elapsed = time.monotonic() - started
+        self.failed_records.extend(failed)
+        self._flushes += 1
+        self._rows_written += len(batch) - len(failed)
+        self._last_flush_rows = len(batch)
+        self._last_flush_seconds = elapsed
+        self._flush_seconds_total += elapsed
+        self._flush_seconds_max = max(self._flush_seconds_max, elapsed)
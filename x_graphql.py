@@ -0,0 +1,274 @@
+"""
+X(旧Twitter) GraphQLレスポンス解析モジュール
+==========================================
+
+機能：
+- 検索ページ/ツイート詳細ページが発行する GraphQL 通信 (SearchTimeline / TweetDetail) を Playwright で傍受
+- レスポンスJSONからツイートを抽出し、DB保存用のレコード形式に変換
+- いいね・リツイート・閲覧数は丸め表記("1.2K")ではなく正確な値を取得
+- 投稿者情報、投稿日時、全ての動画バリアントも取得
+
+DOMを1件ずつ読む方式と違い、ブラウザへの問い合わせが発生しないため高速です。
+"""
+
+import asyncio
+import datetime
+import urllib.parse
+
+from stage_metrics import timed, count
+
+# 傍受対象の GraphQL オペレーション
+CAPTURE_OPERATIONS = ("SearchTimeline", "TweetDetail")
+
+# ツイートURLのベース (既存データと合わせて twitter.com を使用)
+TWEET_URL_BASE = "https://twitter.com"
+
+# created_at の書式 (例: "Wed Oct 10 20:19:24 +0000 2018")
+CREATED_AT_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+
+def graphql_operation_name(url):
+    """GraphQL のURLからオペレーション名を取得する (例: .../graphql/xxxx/SearchTimeline?... → SearchTimeline)"""
+    path = urllib.parse.urlparse(url).path
+    if "/graphql/" not in path:
+        return None
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _to_int(value):
+    """
+    数値文字列/数値を int に変換する
+
+    値がない・変換できない場合は None（0 として保存すると既存の値を消してしまうため。
+    数値が必要な呼び出し側で `or 0` とする）
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_created_at(value):
+    """created_at をローカル時刻の naive datetime に変換する（DBの既存データと揃える）"""
+    if not value:
+        return None
+    try:
+        posted = datetime.datetime.strptime(value, CREATED_AT_FORMAT)
+        return posted.astimezone().replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _unwrap_tweet(result):
+    """TweetWithVisibilityResults などのラッパーを外して Tweet 本体を返す"""
+    if not isinstance(result, dict):
+        return None
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet")
+    if not isinstance(result, dict) or not result.get("rest_id") or not result.get("legacy"):
+        return None
+    return result
+
+
+def _extract_user(tweet):
+    """ツイートの投稿者情報を取得する（新旧両方のレスポンス形式に対応）"""
+    user = (((tweet.get("core") or {}).get("user_results") or {}).get("result")) or {}
+    legacy = user.get("legacy") or {}
+    core = user.get("core") or {}
+    avatar = user.get("avatar") or {}
+    return {
+        'author_id': user.get("rest_id"),
+        'username': core.get("screen_name") or legacy.get("screen_name") or '',
+        'display_name': core.get("name") or legacy.get("name") or '',
+        'profile_image_url': avatar.get("image_url") or legacy.get("profile_image_url_https") or '',
+    }
+
+
+def _extract_videos(legacy):
+    """動画メディアと全バリアントを取得する"""
+    media_list = (legacy.get("extended_entities") or {}).get("media") or []
+    variants = []
+    thumbnail_url = None
+    for media in media_list:
+        if media.get("type") not in ("video", "animated_gif"):
+            continue
+        if thumbnail_url is None:
+            thumbnail_url = media.get("media_url_https")
+        for variant in (media.get("video_info") or {}).get("variants") or []:
+            if variant.get("url"):
+                variants.append({
+                    'url': variant["url"],
+                    'content_type': variant.get("content_type"),
+                    'bitrate': variant.get("bitrate"),
+                })
+    return variants, thumbnail_url
+
+
+def best_video_url(variants):
+    """バリアントの中から最高ビットレートの mp4 を選ぶ（mp4 がなければ先頭のURL）"""
+    mp4_variants = [v for v in variants if v.get('content_type') == "video/mp4"]
+    if mp4_variants:
+        return max(mp4_variants, key=lambda v: v.get('bitrate') or 0)['url']
+    return variants[0]['url'] if variants else None
+
+
+def parse_tweet_result(result):
+    """
+    GraphQL の tweet_results.result を DB保存用のレコードに変換する
+
+    戻り値:
+        insert_video_data_sql_server が受け取れる形式の dict。解析できない場合は None
+    """
+    tweet = _unwrap_tweet(result)
+    if tweet is None:
+        return None
+
+    legacy = tweet["legacy"]
+    tweet_id = tweet["rest_id"]
+    user = _extract_user(tweet)
+    variants, thumbnail_url = _extract_videos(legacy)
+
+    # 長文ツイートは note_tweet に全文が入っている
+    note = ((tweet.get("note_tweet") or {}).get("note_tweet_results") or {}).get("result") or {}
+    tweet_text = note.get("text") or legacy.get("full_text") or ''
+
+    screen_name = user['username'] or "i/web"
+    return {
+        'tweet_id': tweet_id,
+        'tweet_url': f"{TWEET_URL_BASE}/{screen_name}/status/{tweet_id}",
+        'video_url': best_video_url(variants),
+        'video_variants': variants,
+        'thumbnail_url': thumbnail_url,
+        'metrics': {
+            'likes': _to_int(legacy.get("favorite_count")),
+            'retweets': _to_int(legacy.get("retweet_count")),
+            'views': _to_int((tweet.get("views") or {}).get("count")),
+        },
+        'posted_at': _parse_created_at(legacy.get("created_at")),
+        'tweet_text': tweet_text,
+        **user,
+    }
+
+
+def parse_timeline_response(payload):
+    """
+    SearchTimeline / TweetDetail のレスポンスJSONを解析する
+
+    タイムラインの構造はオペレーションやA/Bテストで頻繁に変わるため、
+    固定パスではなく JSON 全体から tweet_results とカーソルを探索します。
+    ツイート本体の内部（引用ツイート等）には潜りません。
+
+    戻り値:
+        (レコードのリスト, 下方向カーソル文字列 or None)
+    """
+    records = []
+    bottom_cursor = None
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        if node.get("cursorType") == "Bottom" and node.get("value"):
+            bottom_cursor = node["value"]
+        for key, value in reversed(list(node.items())):
+            if key == "tweet_results":
+                record = parse_tweet_result((value or {}).get("result"))
+                if record:
+                    records.append(record)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return records, bottom_cursor
+
+
+class GraphQLCapture:
+    """
+    ページの GraphQL レスポンスを傍受してツイートレコードを蓄積する
+
+    使い方:
+        capture = GraphQLCapture()
+        capture.attach(page)          # page.goto より前に登録する
+        ...スクロール...
+        records = capture.drain()     # 新しく取得したレコードを取り出す
+        capture.detach(page)
+    """
+
+    def __init__(self, operations=CAPTURE_OPERATIONS):
+        self.operations = tuple(operations)
+        self.bottom_cursor = None
+        # 最後に drain() した時点のカーソル（取り出したレコードまでの続きを指す）
+        self.drained_cursor = None
+        self.response_count = 0
+        self.error_count = 0
+        self.record_count = 0
+        self._pending = []
+        self._seen_ids = set()
+        self.new_records = asyncio.Event()
+
+    def attach(self, page):
+        """レスポンスの傍受を開始する"""
+        page.on("response", self._on_response)
+
+    def detach(self, page):
+        """レスポンスの傍受を終了する"""
+        try:
+            page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+    def drain(self):
+        """
+        未取り出しのレコードを全て返す（同じツイートは一度だけ返される）
+
+        同時にその時点のカーソルを drained_cursor に控える。bottom_cursor はその後に届いた
+        レスポンスで先へ進むため、取り出したレコードの再開位置には drained_cursor を使うこと。
+        """
+        records, self._pending = self._pending, []
+        self.drained_cursor = self.bottom_cursor
+        self.new_records.clear()
+        return records
+
+    def reset(self):
+        """蓄積したレコードと取得済みIDを破棄する（ページ毎に独立して取得する場合に使用）"""
+        self._pending = []
+        self.drained_cursor = None
+        self._seen_ids.clear()
+        self.new_records.clear()
+
+    def add_payload(self, payload):
+        """レスポンスJSONを解析してレコードを蓄積する。追加件数を返す"""
+        records, cursor = parse_timeline_response(payload)
+        if cursor:
+            self.bottom_cursor = cursor
+        added = 0
+        for record in records:
+            if record['tweet_id'] in self._seen_ids:
+                continue
+            self._seen_ids.add(record['tweet_id'])
+            self._pending.append(record)
+            added += 1
+        if added:
+            self.record_count += added
+            self.new_records.set()
+        return added
+
+    async def _on_response(self, response):
+        if graphql_operation_name(response.url) not in self.operations:
+            return
+        try:
+            if not response.ok:
+                print(f"  ⚠️ GraphQLレスポンスエラー ({response.status}): {response.url[:120]}")
+                self.error_count += 1
+                count(f"graphql_http_{response.status}")
+                return
+            payload = await response.json()
+        except Exception as e:
+            # ページ遷移でレスポンス本文が破棄された場合など
+            print(f"  ⚠️ GraphQLレスポンスの読み取りに失敗: {e}")
+            self.error_count += 1
+            return
+        self.response_count += 1
+        with timed("convert"):
+            self.add_payload(payload)